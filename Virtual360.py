@@ -1,21 +1,35 @@
 import streamlit as st
 import pandas as pd
+import abc
 import io
+import csv
+import base64
+import tempfile
 import hashlib
+import functools
+import contextlib
+import gzip
 import sqlite3
 import json
 import os
 import smtplib
 import secrets
 import string
+import threading
+import queue
+import re
+import random
+import time
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from email.mime.image import MIMEImage
 from datetime import datetime
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
 from reportlab.lib.styles import getSampleStyleSheet
 import streamlit.components.v1 as components
+from streamlit.logger import get_logger
 
 # ─────────────────────────────────────────────
 # CONFIG
@@ -46,12 +60,32 @@ div[data-testid="stDialog"] .stButton button {
 """, unsafe_allow_html=True)
 
 # ─────────────────────────────────────────────
-# BRANDING — base64 encoded logos
+# BRANDING — logo assets
 # ─────────────────────────────────────────────
-LOGO_FULL_B64 = "iVBORw0KGgoAAAANSUhEUgAAA6YAAADrCAYAAAB6rIvEAAABCGlDQ1BJQ0MgUHJvZmlsZQAAeJxjYGA8wQAELAYMDLl5JUVB7k4KEZFRCuwPGBiBEAwSk4sLGHADoKpv1yBqL+viUYcLcKakFicD6Q9ArFIEtBxopAiQLZIOYWuA2EkQtg2IXV5SUAJkB4DYRSFBzkB2CpCtkY7ETkJiJxcUgdT3ANk2uTmlyQh3M/Ck5oUGA2kOIJZhKGYIYnBncAL5H6IkfxEDg8VXBgbmCQixpJkMDNtbGRgkbiHEVBYwMPC3MDBsO48QQ4RJQWJRIliIBYiZ0tIYGD4tZ2DgjWRgEL7AwMAVDQsIHG5TALvNnSEfCNMZchhSgSKeDHkMyQx6QJYRgwGDIYMZAKbWPz9HbOBQAAEAAElEQVR4nOydd9xlRX3/3zOn3vKU7SwLS5EmiBQFBWxBE00CNkRFsQFKEmOvsWJJjAWURI1dFCMq8WcXNZoYxYYFRGmClAW2P/W2U2d+f5wz5zn37n3K9mfZ+9nX3XufU2fmzJmZz7cKpZRmgC5ovXiaRAixt4uwU5ivLXekfuVr7uvtM8Dc2N3v4s72n709Vuzv/X++9t8d48++iv2prjuDvfFOD57N3sHeHr/3Nvr1u/K2nW2fhYzPs/X9hbwTu7Ksu+Oae7t/mfvvTBvvDdh7uwADDDDAAAMMMMAAAwwwwAAD7BrMRTwXKymFATEdYIABBhjgAYrFPPkOMMAAAyw2zKdlW2zY1VrJfa3+24t9oV4DYrqbsS90gt2J/b3+A+wcFnv/Wezle6Bjvvbf26ZUAwwwwACLFXO5Re0LY2e/Mm6Pq9e+Xv/txb6yXpF7uwADDDDAAAMMMMAAAwwwwN7BA4GI7UwdHgj1nwv7CimFXaAx3dsPc19q7AF2PQbBTQYYYIABBtgfsdiDw+1t7O316b6GuYIRLXbMpz1d6DX21fr3w3w+pov1/RiY8g4wwAADDPCAxMDUd4ABBhhg4djXfCwHPqbbh32hXgNT3gEGGGCAAQYYYIABBtiPoLWeldjtC0K7ucq+kPLv6/V/oGKHNKZ78oHtbunFfJ1yX5Au7G8oPxOl1DbbBhhggAEWGxY6Ru3K+bVsmtZ73cGYufexs3m89zZ2ZVkG/XHPo9zme6P957rnbGa1C+lzi6Uv7Wj5dyf2hfsvelPe3Z2HZzY768XSsQeYG/tqnqYBBhhggAEGGGCAAfYOBuvHxYlFT0z7YVd3mNkkygPsmxgMKAMMMMAAAwywcxisiQbY3zBYP+597HPEdHd2mn7a00En3bcweF4DDDDAAAMMMMAAexe7ez22s9cfrPcXJ/ap4Ed7otMMOua+i8GzG2CAAQYYYIABBhhgezBYPy4eLHqN6e7OwzPQku7b2FfzNA0wwAAD7G3sivlzgAH2Fgbz+wA7g8H6cXFi0RPTfhj4mA4wFwaLpQEGGGCAAQbYOcy3JhrMtQM80DDo03sf+yQxHWCABxbmGgjLCwOVH65KuyWzWeQLc6pQ2XHl84pzy2XQO/A9Ux6NRGjQfaojytUolUMji+PFLGsgQXe5u0qhs/PNfWe7Rnc9y1dim/O357s/FNkzUbMdkEPOlEczRzforVT5uvuUN8YAAwwwwAADDDDArFgQMZ0r1+fekC7s6jxvO4OytlVr3ZVXU0o5a/uY46WUKKVQSmFZVnG82QZ0bU/TtDhWSkmapsV9zDXNc+ndb65rylcu21zH9baVlN2LYVNWc83ytfeGFnpf0nyLHnZjSj6z2bAthSDNv5N8nwScHoJpTiuTV5VfuJeYAljlk7b/W6TZ9QHTVQT0KZMq3bNETCWonFzJLoKqZniaLpVb6Hy7QuTndZcqv+9srLGLIIv8emqhte37vS1Uz3fp9jOVysqSzrS/ENsWO/tbIIqCq55nCwNyuuNYjNLx3jLtzPw7X57AAXYv5npGC+l78z2j3W2KvSffj0Havt2LB0pb7u567OpxcbHxp30BA43pTsIQQcheGNu2u/YppboInemIhry1222q1WpBUKMownVdpJQFAVRKkSRJcQ1zD0MeDSk09yzfu1zGclkNDCG1bbsgt0qpoqzmGuWyR1GE1hrbtguCbMra2x4DzIc5VWX5ISI/RJCREENEJBrZ9/TicF3e0HNPkWv2Zlf9zY1CPSm72JqGmWsXh8mubTNlmk3bm28XvdpHUyk582f5e5uy5SjUsn1uZu5VSAUW/r1t05XruK2WeqZUYr6nPsAAAwwwwAADDLBfQSil5hUP7E3Gvy+QmzIRK5fXEDxzTJmkmm2O46C1Jo7jQjNaJoMG/a6ttcayyhovFrx/rrqUSbBlWaRpSpIkWJbVRbzN8b1aVbNt4Dw+H3q1X4Z0lsw7+6G0W/W8HrLvSRlZEkbz2GPau+NPSCJU1r8MQVO5drd8XVEQNYHsd7OcRGZforyp69rFNYWew0i2e4+htLLvGXl77ygxZ9v23x5IDeiZuvbTmM6gj0l3dpUdL8AA+wQWs8R9b99/d2BXW2TtTo3pAx3ztdH+3j7bgwfiu7ovYMCfurGQd3ava0wXY8NtL/qZuxqCFsdxQfD6kcQwDAuCavYbciqlJEkSwjAkDMNCuymlRGtNmqbceeedKKVI07RLK2pMfg05rVQqDA0NMTIywtDQEL7vFxrPMAyJ4xjHcfB9H8dxivJFUYRt23ie11XHNE1J07Q4tkxCe019B5gdeW/JNZwKUDMEVYjMl7H3+HxDP1JkKEu3h6PRLkpjNFuQ2/m8IOeGzMxve8qj8yurkjbY3Dnt8SeVMKdfqJ65fFFW3UfXOOP5aqFLZ6Rd39v6aoq8LaTOyr+93xT3nf+7F9l1khnhhDAacYPZ3iMjvBgsygYYYID9F3t7/TggxgMMsOux14npvg7jJ2p+l7WdhpAChdbRmN0aUmgI39TUFBs3biyI4MTEBPfddx833XQTW7ZsYcOGDUxPTyOEwLKswrz3vvvuK0hoGWZbmqbFOa7rUqlUcF230M4efPDBDA8Pc+ihh3L88cdz7LHHsnr1aiqVSmHia+oXRRFCCBzHKbaXzY3LJsBm296eOBYztDB6PFXWkxY+lOhMmydyDjKjlaTgJDKLAFRStYni//nFA9ZO69sKUqlzMmzINWnp2kaLamcGrKWyC2Yxai2bIOckUIvsKuVdVulaSpgymOsZQZAskWUwFHfGKFojEMgd+EYLlNDIvt/dRLZv44mUQv8rymRT0CWkKLaV2kcMyOkAAwwwwAADDPDAwV435d3XiYshX0aLaWDqFYYhjuN0aRE7nQ6bN29mamqKDRs2cM8993Ddddfxu9/9jrGxsYL4pWla+J8awmfbNpVKheHhYWq1GgcffHCXKXGZGBrSnCQJcRwThiFRFBXfaZoyNTVVPEfjL2o0pL7vc9hhh/HIRz6S008/nZGREbTWRFFUkO5yvQwJNtuMhneA/siIltEo6oynoPJgPzJXF2oQsoheayieiQxrQW6iO0s7m807yF/mEwgXdzXaQ5GiRUYf1TYmpwKJXZBooef1rs2aQMzUWZW2C8BNt72GFt3f5maGlPYS27nKsJB0CXMdoUt13fZkhRZZQCtzre7nKGb8X43oQnfvzu8yZxkH2LcxMOXds9iTprwDjdvcWOz9a196fou9LR+oGIzf3VjIOzMgpjuJcrCfcnRcQwar1SpBELB582Y2btzI3XffzfXXX88vfvELbrvtNtI0ZdmyZRx++OEceOCBpGlKo9GgVquxevVqjj/+eIaHhxkeHkYIUZj0VioVarUa7XZ7m2i4vQTV/O6335gNR1HExMQE99xzD7fffjv33nsv09PTxHGM7/ssX76cI444guOOO46jjz6aNWvWFPf3fb8g5mWt6YCYzo2ZeLAzJq0CnRPTXDeoC7VipjVEkOaaVktLHHOogehp77leLwGUiFHfMs4xiAgtc62uMQ1WGXcSpUIZK+Iue2RTqLJPbR+n0jLB1D3EVGSkUqalU0XP9zY37r28ApXuOK8T9Gnfng3d9s3dkKBkiSiLHt1xV2Tjbq2p7vvXAA9EDBY2exb7EjHd2fZf7MRqsfevxd5+ZSz2tnygYjB+d2NATPcADAFL07TwI1VK0Wq1aLfbfPe73+XGG2/kuuuuY8OGDQwNDbF27VpWrFhBpVJh5cqVuK7LihUrOOiggxgeHiZNU6IoAjLtqrl+WatZTjHTGxUXZkyJDVHsJYhmm9HMSinxPA/P8wozXTNx3nbbbfziF7/guuuu4+6772Z4eJjHPvaxPPaxj+WMM85geHiYarVaEPKyCfO+NHDveYhCI1lwHA1gyKLOf+f8D0iFzLcKLMBJ7R7uVTKgFRQpXHqfgs5vmu1OKYcJKn9nGr9tt5PnLBXGxraPz6oWYLqdQOdBl1ROhk1ZrSL/6Qx6iLLIGsCkTjHll1qDKjPz3ki9vUIRUZQLcs6qTLqb/vVHWLPWH9RMjpttkN+7GF7L580glTOmvkL0I5o9dcvrobf5NcADFYOFzZ7FgJguHiz2/rXY26+Mxd6WD1QMxu9u7BJiupA8WjsTdW5vo5wixZi+lk1RLcui0+lQqVSKoD+2bRNFUeGnaT7T09PccsstXHvttVx33XXce++9SClZtmwZa9asYdWqVSxdupTR0VFqtRqu66K16AomZIIYmXL003b2ppzp9/d8+8y2ckCm8nYDy7LQWjMyMkIYhtx1112MjY1x++238+Mf/5hWq8HTnvY0jjrqKP7mb/6GJUuWFNrTTqdDtVolDMPClzYIgiLQ00CjmmnIlII01VgSpCUyoqRTSJOMqdgWCEGiU2KtUVKQG/HiYaNUprW3rdzfV2cfS0KSZodqld3HkEWdK2Ptsqmv0UyW/ja6TJMKtfwtNLhOft1c+ag0OE52jziGJIF6La+OVvieJFUBcdTG9yto7ZJqkIiMxGpNHIfYUiBMBGidszalSKIE6dhIy8kuWgSMylWqOtNCi9z8WSmwTHqlUlUhK689yxBlXgHVy5FnUYga9PqStlop9bqF0BAE4HnmeYPjZWUK44zfyjxQsu1kbRuEEb6bBRfrn990FhPhAR7Q2FuL4X1hPt9eLHZisbfbfKF5VPflNeDOYjETjzIWU1n2Fyz28aWM3dE/ysK33raYSzC33xNTkwalV+Noyp4kSVeKlDTNtD1ljeC9997L//3f/3HNNddw++23U6/XWbNmDSMjI5xyyin4vo/neYXZrPlkuUDd4jrlVCu9Ws6FkM3Z9s91fm9u1d7zHMchDENqtRqO49DpdHDdrMybNm3i/vvv5X/+53+44YYbOProoznmmGN4ylOewkMe8hB836fValGr1bra0UQALrf3/ookibqiIKM1pCpjKVJkJEZlGtJUiJl4PmSkptmCoJMSxzGQBaianG4yPT1NFEVUalWUovAxVlqUIkRLXNvtMhntl+fWbO/9CFK06hAEAbbl43s14kgQdGKktPEcF2kpUDFRNIkQHc44/WQOWDWCICaIA6rOUB5lVyEQJePmXBtq7mXbJc1sZj6s0SQiReVltoRTnJ0ASQzSzi4Vx9BspwRBhNIaW9q5Zt/exo/WDFtCdP/u3Q/dhFEbB2DzGxgehvFxhe/MtLFS0Gy28V0PgcKWAsexGB4SuHZG5rXSuK7xKdWl+6j8dzlH7AD7EwbEdNdhsc8/e7vNd6Z99nbZ9xQGxHSA2bDYx5de7Oo+ssPENE3TnWq5fZ2YQnc5TeRcY+ZqfrdaLYQQeJ6HlJJGo8FvfvMbvve973HPPfcwPT3NwQcfzLHHHssBBxxQpF0ZHx/Htu2ClJYX+kopfL+6DWEsa0tNtN3ZyKchr9tLTBd6vpSSIAiKqL6mPYxfqevatFotJicnuf766/nBD36AlJIHPehBPO95z+OUU04pSGkYhriuixCCdrtdRAfebyESUhWgVILWAml52NIBbGIFcQKWY3xLIU5hbBI2bp5gfHKKMBRsnUzZuHmCDRs2MDk5SafTIQjjwvQ7M9XWRdCrRKsiH60QWXIV0WM6Wx4sgiDo2lb2qUakaNWkVvNoNDoE7ZTR0eVIbdNqtLGEJgxaSCKicIKHHn8473nPm1m9qkYQNqh7FWSmK0WiSFVKEoeFJl/oTNupUk2SpghhkSqJEBJpC2INqQWhhmYHwkAThjGNRovxiSkajSaddkicClqtNmNjE0xOTBPGCZawERY4TrfJeT8hTfG4+oxnwpJdZJ1ce43OLB+azSa1Wo00iul0OsVgnKYplk7R7SkmxjZw+iNO5TnnPZNDDh4qNNVRmOK6FkbHq03e2TJJ1vuzxcH+iQEx3XVY7AvHvd3mO9I+e7vMexoDYjrAbFjs40svBsR0EcHUoV95oygqfDkN0fzxj3/Mtddey/XXX8/o6CiHHnooRxxxBKOjowWZLOf5LPtrGm2V+TuO0x3WjsLsxHKhWtO5zjfExuy3bRutdRGAKSOW2XGGtAZBwH333ccXv/hFNm7cyIMf/GDe/OY3c/DBBxcmvcZE2rT9fguRABGgUVhoHGIsdJ4iRgFbp2DrWMSmLZOMjU9z/4Yt3H7Hn7nr7nWMT7dxKitptMNME6iSjLyRIjVoKXAtFy0FQmlilQlFzLPXOsUqqfn6PYvytt79mhhNgEQhcJDSJokUcRjhWjb1WoU0bKHiJo999MM455wncdqphyIEeDKvtdJYQhSumiYHqcgT3oRJCtrCdma8bjXQ7sDmScVYR3HfpjH+/Oc/c88997JlyxiN6SaNdocoTPK2lMSJIggiwiDOLYOzNtbEXfXvJaSzDpxC9GhLu4mpRhXaTNe1aTUaLF26lCRJGBvbwrIly9FRE9HewnFHHcpFF76Iv37iwzPdcQKOBVFUIqZiJkjSTBAoWaTLGWD/wYCY7jrsbR/PfR39Fpv7GwbEdIDZsK+ub3dVX5mPmM563v5OTI0/Z/lvo81UShVmq+12m29/+9t8+ctfZsOGDRx++OGccsopLF26tPCXDMMQrTWu6xYkzhA8Y7oLFD6YGbnzu3xJy5qbfqa2/YjlfOa68xHR3r/Lxxhtp/F9LZvgOo5DmsYkSUK1WsX3fTqdDkNDQzQaDe6//36uuuoq7r//fi6++GKe9axnFalmBqa8mQYsJSFRKamWSMtHk2kAx6dgogl/+vNGbvj9zfzmt39g8+ZxNBZS2Bk5EdCOE7QNruvjujZS2iiVoJKEVGviMERYFlbPu1j4S/cE41moT5GBbdtMTTUYGhrCkYLJiQlGh+rUKi733vUnRod8nviER3PeM8/mIcfUQYObawQzY2JIkyzQV+YLKnO/S0WiBJ4niMl8ZYMYwgi2jGmuv+H3/PzXN3L7ujEaQUKr1SIM4lyI5OTm+TZhEOXvVyZgkbkJb1b/GCEjNGlXnfppS+dqn7S0TRREP3PilTJLGSU12I4kDiM8z8FxPMbW38nxhy/jtS97MY977MnoNPP5de3cUFcwYx9srHrztEFGxz0gpvsfBsR012FATHcO5fbbX9tiQEwHmA2LfX27u33EB8R0B1EuYxRFCCG6fP42b97Md7/7XX76059y1113sXbtWh75yEfiui5RFBUmqo7jUK/XgSySrmVZDA0N0W63u4hvOWJtRvZEFzE1ZVoIKZ1Ny7lQbWkvCe2337ZtHMcp0t/Ytl2Qbp0vvC3LKtogiiK01tTrddI083285ppr+MIXvsBpp53G29/+dtauXUuSJLmP7Yz/7v4GLcjMUUUWnTdQMD4Jt925metv/jN/vmsjt91xL80gJY4UtlPJBSUyNzlPEJ4m1UnxfNI4QQiRm+vK4v3UWqPTGY2p0Pm7q43urTvmrNBZ3k+dpn23Z3/baCVxXJ8o7JDGAdWKhdQRadTAtRTPP+8cnn/e4xmu5OGa0iyW09T4JEuXDne3hxbEiSLWAmlLhISOzkyY12+CX/76j/zsl9ezbv0mmq2AZiuiFUks28NxvG1M5pUC13ZQaHSqtkllFCcdXFsASebLSu7CKkTXd+bmObPffCut0VoUAZCkLplEC4XQilQl+I6L69qsv/9+RkeH8TyPDRs2cMpDj+SNrzyf0048CEEWKGm4amEJiMIYiS5MjbuIKTP3tBb5xDfArseAmC4cu7ut9sU22VOYy1TvgYQBMd1/sa/37521eJjv+B0mpkmSzNmy8914XyemRmNqNJqGNK5fv5477riDL3zhC9x3331Uq1WOPvpoli1bVgSaGR4eRmvN0NBQEb0XoFrN/EbLOT7Nghl6zQQlUth9CeNc5r3zmeKWt811fm9U3l5tkdGYlu9T1EcnpGlcaEht22Z4eJhms4lSilqtVuRInZqa4sorr+S3v/0tF198MRdeeGHfNDb7EzSiMCQda8Jtt2/lZ7/5I7+78XbuWj9GI9D49VGE7SGlTRQlBEFAmsY40sJzbZIw88mUXc9ZI/PEI0kaFX1PxQmgiuO1VgidonWaEVVB17dCY0srM1lVumt7dpyk3dF4nodKOlSrAilDNtx3O8ccsYZ/uPj5/PUTTqYismi1Dpr29BS1obphuaRxhOVVgCwIsZYSrCx40VQIN922mRtvuZNf/+4Wbr3jfsYbIcKuIi2XMIypVXxUGpMkisRoXnN/aNu2aDebaKkRSqN1OiMYEgqdKmQe+623/pLMVFenqmt7uR20AFWk08lJbSl4U+a7q0jj7ClbQjI0XGdsbIwDDljJ29/8Ss54+FJ0lOC5Npm+WKOSCMeWmTmziU2XRxkmTxCj8htaeXCkAfYfDIjpwjEgpnse5TbZ1xfuC8GAmO6/2Nf794CYLlKYMhrSqLXmT3/6E5///Of54he/yDHHHMOhhx7K6Ogovu8XvpVLly6l0WhQrVZJkkxLZUx4jabRROI15KtfShops+PRea6I/FsKGyE1UtiZ9gULIXXXd3b+/D6mc+03xLSf+aKph/GxFUIUpNxxHKSVnR8E7Tz1jS78Rx3Hod1uF8GiTG7W//7v/+Yzn/kMJ5xwAh/5yEdYtWrVbnqyewt5Oxoig86D1igUEgy50Fn20C3T8LsbN/G/P/051//xVsanArRdBaeClj6RIkt7kl/XsfKgWGlMHIR4lg0qzdOaKGT+bNM0JUniTHNqUmqqTItnBgulVH5lMwRkWuxyMKTsvchyp5YDH2UejxLbrRC229RqNklngk5jE49+5PFc8KJn8IiHHYGlQegEX0rQKgs5K3MylyRgV0FaRJEmSDR+TRJpuO6GTfz457/h2l/dwObxNp1I4FSGQVaItUAhEUojkgAp0q5+q1QKSqFUgm1LLHtGyKKSOKuD0JAqbGkX2uPiCZbehdl8bGd+G8GKCUyU+YOaPqCSCFsKJJpa1WX9/es45qjDueTtb+bE46qgwcu1oTqNcS0LQYpKU2xZDgzWTUy7e9u+PTkOsH0YENOFY0BMZ6CF+W8GuyMP8p4lpqrPtoUIuwtbmOwvvU3TLBgDYrr/4oFGTGH7+sluI6Y7a8q70BvtTXQvWnPTxZKmzpioRlHEpz71Kb7+9a9z8MEH43kep556KocffjgHH3xwEUXW9320zvJ02rZNHGcRNxuNBlNTUzQaDTqdDkmSEIZhYfLr+36Xma4hfCZ1hwlekwUUskjTGMtyEEIX2zP/OUGa6kybmZsd9yOgvX/Pta/8d/l6vcR3tuNm2x6GIaOjo0xNTVGr1Vi1ahXf+c53+OxnP8vU1BSXXvZ+HvvYxxb5TW3LJkkTbCsz8dWzTJy5sWXug7czmK3P9l633wSYpf7Inp9CpxBFCtexESLLVWm5EKRtpKVJEISxhed4KODXv+/wpW//hD/+6W7uu289tutTHx4mVZI41ViOk2k6kduQImm0dIkJCZRrQMmCGpkydxPNckRdhVYSS/v5MWkeyCgBnWT7tcaxfYIgwnYqCGMVIDWWa5GkEXGSMFzz0a0GrYkNPP+cv+GlL34Oo8NQ9bP0L2Gc4Fg+UoKKYqSOwUnyth/Kwz9BM4Qbb53kuz/6Ob+8/hYmmhExLqmwQVs5McsHOJ0ilEKgZuorjB+3nkmjImYETqAQaqb+QgOpKrTNsO0YNtOW/YipRIVZgDMlFIoEYUGKEdA4SA1CpbgkRK0xjnnQAbz+Nf/AIx52SCnzj+5aSgk932KrXMZ9e2LcG3ggaXR2tvzzCZb3RR/C3fVMF2P99azz17Yo51w27ghWLqMrtvdcbtaWFLr8tZegcqFvuRUyIb/5e2Zk3VaEJyCPCUDP1vIdSntE+Qpmz9wkeDGNL4ux/y5GLKZntrexu31QZ8MDnpgKIYiizMTPBDIygXyMf6OJFnvJJZfwq1/9iksuuYRHPOIRQHfOTXMuzGgakyTZxiRVKUWSJIWP5caNG1m/fj1jY2M0m82ue5scqr2mskZDafw5YSZgjTnf8zySdKbj9COOCzH1ne3vfuf3+z3Xd71eZ+PGjSxduhQhBFu3buWQQw5hbGyMD3/4w/zP//6Qd73rXTzrWc/CkhZxEhPHMdVKlSAM8Dxv9meL2OvEFCFIE0PinO7TFGArIh2DsIiwSYANW+Gb37qW//vFH7lzc5sYt0jhopQijmOklNnzTZKsNLNo7kTSQ5wKcmbMS2fIGqgeYmojVTUjuiKLsCuIEIaYKoHQFo5bJUqyd8FyJEoooiQEEePY4OiYcHKMl7/4+Zz31CfgErF8iUsat1BK4fgV0DbTjSbDQ3UQCc2prdRHlhNhEwN/Xpdw9de+x/d/fB2B8rD8JWyd6mB7Q2gxk7NTkoBKETpBkxYkrnhH8kBGvQsOs10W2lGTcDSLYDzzOEXf8/o9A6ElnuOTRjGhirKLWzM6CCkEaRTikFJzYdhTvPfd/8TDT1jN5JYxVq5Ygt5RMf0AO4wBMe0+f0BMF4bFWP++xFRohBZo851v3pXEVIncfmOfIabZPt3zV1Z+EzWhdI3iDqWtRWXLWwfE9IGGxfTMFjN2Z3/aL4ipQdkMFbJgRyawT7vdxrKsIoBREATEcUy9Xmfz5s1MTk7iui4jIyN4nleYNRqNpyGaZqI3xNUEXDH3C8OQqakp1q1bx7p16wiCoLiO67o4jlMsCHoJrCEuSZJgWVZBTLeHWPYeM5sfa/nv2fYt5NvA1Mv4rLquS5qmfPGqL/Dxj3+cl73sZbzmNa/J8sfmWtNy8KdZn+9O994dJ6ZamClRopKsLLYAlSQoHWC7Dq1OB78+SqggBH59wwRXfunr/OG2O2kEikQM4VSGimdbNvVWasbstrhnr+Y0Vd37+hDTbJ85rkROkQjlZCROxGgdI0ScawklWoGFg8JGmfycaBQxQqa4DuioTRxM8fpX/z3nnH0KLlC3wdZkKmMpgJTW9AS10SWAYLIZUq/XSIC2hh/9dB1f/q9vcMuf7sHyRgm1QxAJqkNLCSKFFrJYQFg6yfxic4K6Tbvk9Z/pF93bi3YzC5KSRlQI0UVS+123d7tjuUXQNGlZxCqP9is0qBhbpgz7Eku3ufQ9b+eRJx2ISMG1IOiE+L67Tb8aYM+g993aFzEgpttifyKm/aEQWqKF+c62FqSzxD6lGRPnqdps+/cuMYXtM+VVpXqoXGPa55xym3X1/5m5oHzsXOR0MY0v+07/3btYTM9sMWJP9KMHPDE10V+llAXJK2sdDVEyE/SWLVv44Q9/yJ133snSpUtJ05Tbb7+dO++8kyRJqNfrXSa5xud0xYoVHHfccZx00kkcdthhVCoV0jTtui9sqxrfsGED69at45577qHT6RRpV0zZLcvqIrvlHKhaa4S0u643F4Gci5gu1Lx3e8ipqa/neUW0Xt/384iyipGREYTUfOc73+Gd73wnF154Ie9657vQaBqNBsNDw7Oa8pp2lNthytQfO0dMwyTGsf0sSmsEjp0fK+L80h7NAPDgK1+/nU98/v8xHSYI3yXFwqsMk6pMq2+08ybXqzFv7q1z12+lCjLVl5hqSuas5jstai61zP9WuXYwzc+30EpgS48gCHFsD2lBHLZxHIG0NO2pLSwfdnn537+Qpz3lpKKZKhLSIKXiWlkzxu3MkVJIYu2QCslUAJYPl3/iJ/z4Z79m3X0b8WpDWFYd6WbBjRqtsPClBnJ/2AShFOh4mwnE1D8rh9nXn1gak14ToKi4x3YS0yKtlFNFCCsnqRrbUuikhWslJPEEH/3gezj9YYcQdGCoAmmo8F2J0fMOsHuwLxKr7cGAmG6L/ZmYitkse5jRkmpA6J40YfssMTUoatbzbaCYyQVd6tOInjrk7iJlt5H8fCFEiZTm9xgQ0wccFtMz21ns7DPf2eBIO4oHPDE1ZdJaF76eRpsZx1lwmC9/+cv84he/QClVkMRKpdKl4fN9n0qlgmVZxHFMFEV5SgqF7/t5Ts9sUT86Osqhhx7KmjVrOPnkkznuuONYunQpQEFW4zgmDEOq1WoeQCjgnnvu4dZbb2XLli1UKhWWLVtWaFNN8CAhROHrqpRC0z+lTLn+s5FTmDuvae/+uY7rPcZ8m/MNkXYcB9d1SZIs9+TwSJ16vc61117LW9/6Vp71rGfxute9jmqlSrPVpFqtbnMfcz3YHcR0vtehpKEUWQAjgYXWYANCKNAKVESYCGy3QpDC+y7/H771o99AZZROKoidTFgShwFOSeBgiA7MXueuwSInWDJv324CNaMlFZS1phk5zUIIKVBppv3Nz0u1gDwVjNQSS2S5UYVOEcSkaQehY6p2zMsvfDbnn3dGlns0gYqdWVf7AkSsISe7iBhsn6nIBhfWT8K/XPYNfvjz6xhZuoo41cRxiutViaKEKFQMDw8Th5kZviQL3CQzD86szCXNbxF8qMekV/a0V9k0VyjdZyHX/XfZJ7W33bUALIFKNWBDIkFrLKmwidDpFLbs8NZ/+kfOfuIpqLx90gRUrKn4Yp8npvON+Xt7kt9bE+uewoCYbov9iZjORUT7wggqtcy5m9zhoD+LAaKn8Bq6uakZYYURQJbcOACRB5SbuYAhmQNiur9iMT2zncWuJKZ7sv884Ilps9nEdd0uX8Xp6WnWrVvHxo0bueaaa/jVr37FypUrmZ6eJk1TDjnkEDZv3lwQKBNpN47jwqfU+IYav89yUCWts8BESZIwMjLC6tWrOe644zjttNM4/vjjs2ApJRNfA2NSvGnTJu6++242bNhQEGLXdYv8jGVT4R3VmM527HymwP1+z/WdJAmVSqXQ/vq+z9TUFEmScOCBB9JqN4iiiOXLl3PXXXfxd3/3dzzjGc/gNa95DRW/QqrSbe4Ji4eYaiySNMG1bEARxQFKgeNVUcBd9yZ87NNf5Vc33EMrraH9EZRbYaLVwPddks4UtkgLgYnxMRVCLMjHdG5impkfaT1DwGb8TQEdI4lBp2gkWpNRVW1hNKY6hYrj0m5O4loC39Ns2bCOQw89kIue93Re8IyH02rE1IYdNBAmKb5tYWkFaYJlSVQUIaRNR7skLvz8xhaXf/K/uP6Wu1lywMFsnWjgeR71+jBBu0OSKDzbIY4CLCELUopQWT3JUtygsqBgWb3S7rYpRcalN+hTqX2k7l7clYMdZYfPTUy1EGghSWOFhYWNJA6m0UmT4WrK373kPF703CeQJAqbBM92MxqdgMiUyMzf5x642BuLgMU4T+0oBsR0W+xPxHQ+FBZaJcsZoyHM5q8yEduW5C72Ovclpl0HkEVKB6BMTvPjNZSJpTF97tYoG0HxwJR3f8BiemY7i935zHenK8wDnpgac1tD5K677jq+9KUv8dvf/pY0TanVatRqNTqdTkEAp6enu/xGje8fUPg9muBG5rqzPaBms8mKFSsYGxtjy5YtnHjiiTz96U/n1FNPZcWKFYU/YS/xmpqaYuPGjfz5z3/uIipSysIU1rIshEk3w/yEcS6Nae8x/a63PYTUfJtox8YkOY5jarVa0c71oSqtVovR0VGWLFnC9ddfzyte8Qr+6q/+ire+9a1dKXeEEEU0Xp2TjZ0npjuHTCiR4LhWrjVMsWyfFLhnPbz7Xz/GfVuaTLQ07tAyJjuaILUYGl1Fp9Wg5sUkYaNIOVTuT2Vtv8G2AXiKv7p9KHsmU2PeK0rXEKRIFaKzzKRoLTJ/Ui0zSXqWqBOpUlTcxiKk6mhWLqvz5Cf/JRedfwZ2Ap6dTfVhDI4DcRKj4jbVipvdJXXQlkUIXP3du/j4lV9l/WSIM7yc6Y6mVh8hiiKCTouq5+NZFkkcg0qxhC5IKcwQb62z3KS9bSS02oacZtu728fstxBF22RtQvffPcS0WNTpjJhGKrdoiBWeJbFVSqc5xiFrlnLmY07i9a9+FioFR2rQMa60aTXb1Gt1giDB8232ZWK6L0/ii3G+2l4MiOm22J+I6XxReYuhrrRtJuq3zMnptjDHix5b3V4NrZ6DlO0JCE3GsIUpT/5t/tbdQZ+MSa9x2ZhJ4ZZB5sf3unQAWZo+nV9j5ow5y7eYxsfF2H8XIxbTM9tZ7I5n3k9BtMvv8UAnpsZv89577+XLX/4y3/ve95iammJ0dJR6vV6Y+FYqFcIwJEkSqtVqYVJpzCsNaTDBh4QQXea7ZZgJ3fhXdjod0jSlWq3S6XS47777WLt2LWeffTbnnHMOo6OjRTAg47MKmanxpk2buPPOO9m0aROe5xV5U7XWmUZ3juBH/Ux65zLlLR832/UWQkh7Na5Gm2zMVWHGtFdaWbRkE2zq0EMP5brrruONb3wjxx57LJ/5zGcKYiql7CKmwF71ccmk0Lm5qoBWnBBpD9uV/O6mNh/5+Be5e8MEjSDBrtbRjkcQa5SuoNIqWiXYtLGtaJt3x2jHDVE12H5iKigHPBJ6xpxVaI3UIVqnaGxSBDrXlJKnqBFpgi0S6p5gcuw+hirw8pdexHnnnAIpVC2V5d1MJFJa2QJBKCAmjDtgVUmFy3QHvvbdW/j0f36TzY2I2tLlTIUJ0qkTJ2BJcKSAJAWdYAmJLUEl8QwpNW1j6qo0lti2Pbq0niUtge6J4AsU5/cj7r3pZbYhpkhSBI5jEYcdbB1jpRE2Hc55yl/xxtc+qwh0pFWKLUUxXmidjR/7+iRo3u0dxe6eM3p9+vf0/Xc3BsR0W+wvxFQjULMQy/yAjJiKmXmySJ5S0prORrMEmVVH+Q6Lj5iWSXbWGDo35VUiS+dWWPX2Q0/xe9cTsnSyKPjvwvvXYhrfF1v/XaxYTM9sZ/GAJaaLvTOXNaLG7LbdblOtVgmCAN/3+e53v8tHP/pRbrrpJg4++GCWL19OGIZ9o772/t2v4ed6GP0CspTJmjHzNWbBtVqNZz/72Tz5yU9mdHS0Kz2N8YmVUnLjjTdy//33F4Q0DMMseFOqqVarCCGKCL/GP9YEz5lPazrXvvlIb6/GtXxs77bZvpVSOI6DZVmEYUi9XucPf/gD73znO3nwgx/MZz7zKYIgyuvmEQQRrusiMwfCWZ/FroBZnJWfn/mt0hgpII1CLL9KhKSZwi9vGOPDn/wqf753C1ZtmFSCkjlZ0g4oD9IqQoPIU7TMhn79qffv7m0lokZ3KpTenJwChUhjbEuQpIIo0UjLQUqbNM1MfB2RQtIgam5l6bDDq152Iec8+RSSEHwHLEJsKdGxzgIVWQJIQUIjjJBejUYKn73yV3zmi98iUnUqw0tpBE1cv0KKi0YgyMi0VFlKmCw1zAwhVWJGS5mWF1ml4E9lc9uuXKClXKa90XqN+bP5baL1mjcjjsNMUKQy03wrT12TETJJnCgcx8K1U9JgAt+KecFzz+HiC/8GW2VRmi3ds6ARSW5eJuY1BVssEELQaDSK30ZI162R7+6P/bT+s33PBmNpobUuhIXmd3Z+/i7mghytMz/2Wq1WjIvlMpWFXDATYM6U0wgHzbhrtmmtu4Lnmess9kXMfOVb7PP7jmBXPpPF3D4awdhUm5HRKq12Zq2SpBkZC6KIatUlyaPFozLBXGY5ojIXEKGwbDvPNV5jYqKJ59qMjPhMTbVZMlJFa4jjBMfO35kiZ7RAKwXCmrOMuxcKoeKMMUqLJAFp2WgBk5MhW8cmqNeHUEgsSmsbOTMuRYnKswTYNJttXMvG911arQ6Oa6HTFKUTLAQjI3VsC5TSOI4gihMcZ+fqvysES/DAFbztDSz2Mb2MB+rzfcAQU0Myp6amGBkZKXw4v/jFL/L+97+fKIo46aST2LRpE2macsABBxRBhvpd02BnianZViZi5UVWEASMjY1x9NFHc8EFF/CEJzwBO58sTNnMNcfGxrj++uuLPJe2baORxd+GkJbzthrt7lyk0/ye7Zi5CGc/U+Dy/vk0qmaBZ3wp0zRlaGgI3/e56667eM973sNBBx3EBz7wASoVj2aznQehEpnfnrV7+2cUZSS4IKOlwERaJUgdguUxOR1jD1f53S0hb3r3vzMd22inRqASUpmAyIPxpAKpHKTyMn8WbTSC/bFTxLSkOZ05t5ukWRJUnCBsB7QkjjMhjySh056i6ivi9jg1L+HNr/9HnvC4E0mDkGXDHnGc4DqSifEtLF+6LLfnDcF1aYcKWfHYGsK/f+r7fPP7vyJIfBx/BC2tQkBT+EiTEcwswJEqZZzLQ/xrSZKTuVTrIoWMVGmR8iCrvdEGQ5cuYJY0Mr1mv93ResG2ZWaunUSZ+bzoFmapROPagiQcB93gwuc/gxe/6Cm4IgtEbBdlMeXQOTEtCSoWMTE1Y+v4+Dhf/OIXueOOO3Bdl0qlQhzHKNXtA92r0e9nhl7e1utnv71wnBlTf8dx8H2farVauGUMDQ1Rq9VYunQpy5YtY2RkpAhiJ4QoYg+YOAHlKNhlwWC53EaYZgjsYsaAmO4cFnP7aASXXf5x/t/Xv8UBB64m1RCFCVoKPK/CdKMB5O4YGjQ5Ic1YKqB6LMQyQfk5T3sqz3nOU2i3Emo1OwsgpyCKAnzPB6EIOh38SoW9m4dZIUQ2/igtiBOF7fh0Qs1VX7yaj3/yM6hUQr42tETm9mQLiRAaLQVawMjICGNbJ6hVfSzLotlsksYRo6PDRGEHyxJs3byJT3/6k5zw0ONwXYgihevJXC6+4/1td5Kgxdx3FzMGxHTv4wFBTI2Wsd1u47outm0TBAGf//zn+djHPobv+9Tr9YKoKaWKXJqzmaL1SvrL2B5i2k9i30vMbNtm06ZNTE1Ncfrpp3PxxRfzsIc9rO9iaXx8nPXr13PHHXcwOjpKGCXFwszc3/xttBrl+85HHhdCTLdXMzrbPsjMlavVauGHaki5iYS8ZcsW3vGOdzAyMsLll1/O8PBwoSG3LLELNKa9z797oVxefGYkP79vcW5IEGikV+VHP9/Me//tSsZDi8koprpkhI4OskTnZGZBdiqwNFhJZi6rtEAt8B3r1++MWes2eTt7jpfMlofTptVo4ro+vu/TbrdRSYDvSSzRIe5sZaQuefVLX8STnvBwajZYQBJ18NwKscrIrUUCpJBqUjw6SrC5CR+/8kd860e/YLyTsnTVGqammsRhwvKRFagkzTSzJjowM+bRhlhqYVKqiIyY6iwub+ZdrLYlpiUNaHa9bfO8drdpz/PPNQJSz+SBTZIEx8rTQ8VJ3nYalaaMViq0GxM4TsCFL3oGz33WExn2M0IahwEVx+9etwhAxPsMMS1rEt/+9rdz0003FeQuE4gt/Fr9+t98xLTfuNltbTFDKo0m17gPpGlaWNF4nsfIyAjLly9n1apVrFixgnq9ztKlS1m1alURNd0I+crXMOTUCBPLGtfFvogZENOdw2JuH43gpz+/gZe94tXce996HM+nHYSMLBll6/gk9fpwQRylzixmMk+LtAiGZNZOnU4Hz3Npt5s89jGP4n3v+1cefPQawkDj+1ns2iia0ZxGYQfXdfeyKa8CnRDFAa5XzVxCbIfb/nQ/z3n+C7n99nsYGlqCwEIIC5lrTWV5LLEtms1pHMdDq2xtWKtVECgmJsawBFQ8l9Me8TD+42MfZemSTAttWRDFMa7rsNiI6WLus/sCFvuYXsYD9VkLpdS+8xT6oEwcjHYrDEOuvPJKPv3pT1OpVBgZyYOrBAG1Wg0hREF++pGl+bA9xLQcudegTHqDIMC27WKht3XrVqrVKmeffTbPfOYzWbNmDUJkwZbKBHXdunXceeedtNpBYQZrSGjZ5KyI3juP1nQhpLT3uN7tveeY+vfWu/ydpimVSoUgCIrfJjKtlJIlS5Zwxx138PrXv56hoSE+/elPs2bN6kxbasvdTkxNWY1GN8t5C0mSYjmSMAmRts+vfruFS97zcTY3HUR1FOVKWipE2ClKKEQqsTRIJXFUlvYkI1k2irnNgWbrb8a0dWeIqUopzFYlAkukkAaotI1UDQ5YWeGiF57L0590CgJIw5C656DTGKUFwnazO6oYSwqmWxF+rcrmabj8Ez/g6z/4FVSHkZUKsdYkUYwjHWxlEwUhniPy4Eaz1DF7Cpm/EDPEtKhXP2IKdEegLPmWzkNMzYJN5JqFJM6Is+/mY0wQ5kIfiYo7eGmMIwIuuODZPO/8M/EtSNIEmxTfcnIb5NLYIgCRloipxWImpiZNled5vPOd7+Tuu+/u8sG3+lgszPb+z+bmsDOwbbeLmJZNdJMkYWhoqHCdiOO4KyaAEII1a9awevVqDjvsMNasWcPKlSsZHR3tiuJuIrGXx9/ZUjoNsPexL/rF7gh0blfy8+tu4WUvfyXTzRZepUqrHeH4FaLY9HVR+NhLcqsUM0zaVkFOLaFpt5tIoXjSk/6KV73yHznqiANIs6kP1840p0JohNCEQYDrbWtxtucw40qQKIGQFmPjHV588T/y2+v/SHVoFK2sfPyViDwKUjlCfayzcczzPNI4ZGRkhI3r11OvVfB8i06zwckPO4ErPvtRKh4FUY9jjePufFTSXU2CHsj9fU9hMRHT/fV57vPEFCgWToaIXXXVVVx++eXU63VGRkaYnJzEtm2q1WpufpZpIc2Cw2ChnWBHNablfcZXql6vEwRBUaY4jmk0GkUQpKc//emce+65LF++vCB9tm0X59/4h5vYunUrQRBQr9fxPK8I4mSCq8xHPvvtm0/zuVCtaa92uPcYYypo6p6maUG0AVqtFkuWLOG3v/0tH/jABzj99NN505vexOjoMGmqsXZ6TT+bGe3MhY0/oVmEJ0mmRcNxiS244aYtvOs9n2CqKYhFnUBZxDLF8iVJbuqItkBl2lKpFZI486rU8xPTXnQRTNGzENO9x/WY9urua4RhxOjoCGEQEAZN6r6LihuoaJIlI4KXXnQe55z1SCxApzG+ZZFEEY7johVgSYIkC2LVDCL8isd9Y/CxT32fH177e9qJizeyjDAN6UQdqr4LShMFGXETOs0i6fa8el2RFPMQ/oZYdr1jRbocU69tfUuzduk5z/iVzjQOoAtianxNjcmb0JnvIUrnftugogZ+PMGLX3Qez3vuE/E96HRShipWFvG4iMSR1aHrGRZlW7ykFLL31Pjqv+td7+LOO++kUqkUZq7GlNccW/6eDTtqytvPFDiOZ/w9y2m8TBmCICgsMYy/apqmxVhjBJlJkuB5HitXruToo4/m4Q9/OMccc0xRPqM9NfeAGf/UARYX9hdiihbECSDha1//Ee+/9IOMT00RK4FbGWJ6uoFX8UHPxK43AjczT3TC7D12HIdWY5qh4SpR0EalIU958t/y9re/mRXLPFrNmGrNwRYQRiG+awK37eXgRyJz6VFaEiVwybv+lc99/iqGlixHSp/MINBEmc/Gd1GOtSAFjufSbDapVXwkilaryZLRYTasX8epDz+Jyy57H4esXYnrQRwqIMX3nGI82BnsL9r9fQkDYrr3sbgdZBYAo3WDLFDGjTfeyKc//eki+MXY2BjDw8M4jkMYhkRRVJhleZ5HHMfFteZzJN8RlE2FewcxpRStVqvQqhqN78qVK2k2m0xOTvKxj32MP/zhD5x//vk87nGPI45jwjDE8zza7TYPechDuO+++1i3bh2tVquQfpal+6ZOs5HO+dBLLmfbV/57ruPKvx3HodVqFaa7nU6n0HZApqFMkoTHP/7xALztbW9j5cqVvPa1r86iKfvuguqwozBlLZNS25bYtksE/OH2Nu+87DOMtWIQPkqkqCSkUqsQdiIcKXOSJZBK5lpOgdJ24Tu5PRlvdvWg6fgunSgkTSM8zyGJmrSnN/OQY9Zy7tOewNPOOpUoShhybTQpAoHjuASNAL9eLfpsDLgVj3sn4ZNX/oD/+t5PGFpyMJ5fI4xSEBYVt0IUhqg0xrFspC1IY5AmoBCgze9ym4iSaa0GWeKe3VlHe6DlNhrS2ZA9Z5GpBLTJ6SeLOySxQloC13PzdzCgZiec/5yn8Myn/yU1D6II6r6FTrOxKFUhlunrIs2uj8yEFNoq6rYzpmC7GyZInEGn0ykCqpU1lDD3ODEb5juu1xWhF7bd7f9dzvVsSKTWmjAMu7SqhqwGQYAQAt/30Vpz7733smHDBu644w4OPfRQjjzySI488kgOOOCAzIQxnz+MgHAxLWIG2M8gwHWgE8Azznk8W7du5d8/8jGUUkS5dVgU5S4WOTEzljOZi4NE2j6uXyGKQqTtkSoL262SRPCD//4fDli9mte+9u+p1R2iUGF7MrfIkgihdt5gaScbIE1ACEkcw2c+8wU+e8V/svrAtXQiTRApbDtLWYbIxhCpdRHZH0BImzDI3ukwjui02hx04CrW338vDz72WN757ndzxJErydOp43lZsLow7GDZAvD6FWyPYa7x0yhFBhhgsWK2/vmA0JgKkUWMFELwyle+kptuuokjjjiC9evXs2rVKrZs2YIQoivVismvOVvwirle+O3RmPZGqCyb8ZpcpMYPqlKpoLVmcnKS6elpkiQhCIIinc1jHvMYLr74Yh760IeyefNmVq5cidKZUmdsbIw777yT8fHxwqfKLMRMfRZqhjufdnSh2tL5jgGo14cZHx8vNA+WZRW+vybVThRlgWdGRkb4yU9+wvvf/35e8IIX8OpXv3w3mPIazKTRMX5laZrlYfV9lyRR/Oam+3jfZ77PvWMRY1vWU6l66FRRrQwRBhohbNA2ykQOFapIaq6w+pqW9qLcVn39nUX/7Znp1rZ9UZb6oxIgLEkQtHGEwnMkMmlz0Mo65z7tLznvqSdhA0ka4gmFJ21IFGkMluVlpMoJaXVCUmeYLU247BPf4xs/+AXLDjiURjvGcSoEnRCtFJaVaZ3dikWchkxPTjHkD+VtLbuIqSm5MbsSKGSaZkfpTOKfp1ntIrGi12e8MOlVs7TfTP7SrF1UKSIwJHGIZQlUnOWqdSybRqPB0qVLOP3kI3n3689FdxosGR1CKZC5nKHRbDE0VEETMdPHZOZTqq1yBWc1Y14MiOO4SF/1wQ9+kN/85jeFeWxGSkta6T5j5kJ9SGdDP5PZ8u801du8I1rrgjz2yxFdju7r+z5RFBWWGtl7nmlUtc7SfZ1wwgmcdtppHH744dTrdWDGVLhs8jvA4sB+ozFFIBLAgomJCMtzueyDH+Wqr3wV4fi02iG27RaaTa01hmEJpVFCEsQgLJskiaj4ThbkLQkZGq4Sdhq4juStb3k9zzr3bIQErTSOnQnwtE6xxF7UbWiRjf8pfP2bP+at73gHcWoxPtngkMOO4L71G/H8GVNjKQSgZ3JjA1GSYjkeri2J4xDf9Qg7TVxH8OWv/CfHHbuKKADbAssm1xi38F03S1m3k64YO0sc+/Xv+dYMA8yNxdRmD+zxa/a23uc1psbHdGhoiM9//vP8/Oc/50EPehCbNm1iyZIlbNmyhZGREYIgoNVqUavVCt9Oz/N2eycs5/HsiuhaMu/1fZ80Tdm0aRPT09MA1Go1RkZGEEKwYsUK7rvvPq655hoOPvhgtm7dyqc+9SmGhoZ47evewIEHHsiKFVnEyVtvvZV169YRx3ERKKgfFtLh98RLMTk5ied5uK5Lu90u2qbZbBamMiYqbhRFnHXWWUxPT/PBD36Q5cuX8vznPXen7m8sLUVuatkdQVWhVWb6J6QHlkDrTFN6w8338InPf53f37QF5Y5SqQ8jpUaLmFa7ScWpk8RZdNmsHVXJfFSju0w7dZHYu3RzKGVgW0g/zZKNl66bS8hVoZXLyGjZHDaMOlQqNp6waU1sYvWyCs85568558nHI4E4jqg5FgILjUZYDpaUmSJRQCfU2JVh1m2Cf/v41Vzzkz/g1VfQCBISLKJ2m3q1ThorkigAS2R5fXXI6JJh4kAjtaGB/Sb4bvJjHpouHlSZ4fW00bzaUonQdn59lWk1rRSlNVrn2lnXw5YWcdKGRKHSAE8mnHrCkbzqpecitGbJklp2fF6KNIWheo0ZrWsvWab8aBc1jMVCq9UqCJ8ZtzKN4Zw663lJwnzEdTapv9k2m2DRlLFssVJ2pzDfrVariNBryGgR8Tw//yc/+Ql//OMfOf3003nEIx7BqlWr8Dyv0LIOMMDegMiF0gJYMuqiJbzyFf9AFMb819e/hSM0Kk3QWqCFyr6NgE5pNALbdlBoXMfKXKGkRLoO7XaAlA5BJ+LDH/kUy5cs54lPOg2NccGJcWxnVmMPIzicC1rsuExO51rQVMFPfnoj733fpUw3QoaGR1mxYhUbNmxgdHQJcVIy2yVLl2PKrAV4ef76VEh812F8Ygsrl4/y+c99mqOPWkUS5Tm2HYjCAOFYeK5Hu9OiWqkuYluXAQbYd7HoNabGNLXfosZoITudDuvXr+e8885jZGSkON6yrIKYzUayehdGvcctVKI/137P85iYmGBkZIQwDAszMGMW5roumzdvJo5jTjzxRB72sIdx2GGHsXbt2i4tr8kjuHz5cq6//nr+4z/+g4mJCZ7+9Kfzd3/3dwwPD9Nut0mShJ/+9Kc4jsPQ0BDNZrP4tiyr8LX1PI84UX39S3u1o+W2Wag2tbc957rWbLAsqwiEZPxwXdflW9/6Fm9/+9v5/JVX8JjHPIZKpYIUkmarSb2WazXS+X3ANJo4SfFshzQEnaY4njGzzNO8CE0zjLG9ISLgV9dv5KOfuIrb/rwB4Y+SCBtZzLAKWeSmlDMawDxQUfG7IGEzhLhrIjdmqLqPaWv5MD1DzKSW2/gyWhKCqI3tSISdBf0SVubTG0UBSqX4lsJTMUN2youf+xTOf+ap6EQjCbDsrB5xAo7tIFJQcYjtSoJIE3gu90/CpR+6mh/8zy9YsvJQIu3QCFJq9RGSpBxtNwWSol2FBpHaUGqL3rdJCFHkYzUmaOUAR1qrmXYqEW7Z9dr2eUeVRmgbEXu4rk0jHMOtgPBSmp0pbMtHpQKR2AxV6oggJulM4cuAvzrzFF75j+exZAh8a0aruy2xNoRXzTxTc0yXCffiDaRjBEK2bXPppZdyww03FMI9KWWp7v3faTPOme2G7BmfcjnP+zlbm8wQzG2jns92fHl8MhrT+VzElFKZqXoePGnt2rU8+tGP5mEPexhLly4lDONCwGkEaVLKwt1iQFwH2J0wwX+UkmgF0oLNWyM+9/kv8u8f+Ri1+iipEqRa0Gg18av1TNDUabN0dFnxbkqSTMiUX88ECnKETRQFHHf0kbzv/e/m+ONXZ8K3JMxzeEq0FlkgO88DIVBpmr3XPbEQgILYQjanzeSg1uWvmXFFZPlShbSJ4xjbcVAz0yI33byZv/+7V7DuvnupD43Q6mQKh04YUakNEccxQRDMBGzLrRzSOCGMA1y/SpyE+I6NVjGOUHzyE//B6acdRZqAYxWiYcrzSGFpo3dOtzNXYMMyZhvXFuOc8UBCv4CRZczX/gsd//fX57vPakyNGZkxvwK6pPZKKSqVCh//+MeJ47gwjXVdd4cWBdtrBjSfHb/v+4yNjbF27Vq2bt0KUPi7+r5PHMds2LCB008/nWc/+9kcdthhLFmyBNd1iwiSZnFkNL2VSoW1a9dy8skn87WvfY3PfvazfO973+M1r3kNZ511FkEQcOaZZ/KrX/2KDRs2cPjhhxemv51Oh06nw+joKOPj4/iV2na30Y5gR/zPgGLiNL5imSmtz0knncTLX/5yXvjCF/LVr36VR53xKDSaeq3O5NQkoyOj2JadmdvMAjPNJCrFUQ62Q2azo0EHAcJW4DmAwPV8xtuadZsDPvSxL3DnunHs6lJSlU2iRgMqhF0ikWrm7iVSmv1porKW2kjPmLIWZGaBQXJmJngzYUq0yII0VSoVlE5IkzTrc2lCu93GElB1wSFBB9NcfPGFPPNvj6c9HbNkWKBUitYpSQyeWydMMs2u63kEQQtZqbFhAt79/q/y8+tuYGjZauJEgQUjQ8O02gGWk72/WmQErTDN1f3qpLatpe5WLGbpY3TXOd3t1Iu5BUdxHOL7Lp7nkegOcacDUuLXqugYkkgwNTXJ8moNTcxjTz+ZN77qPFwBVSdzSZ37XtsKC+Yu7wMLRgBmBIAm6NBCBVO9Gs5erafWMz6j/bSvZTJsyGk5gFEch3Pe3wRHklLieR533303Gzdu5P777+fMM89k7dpDabfbhbDPBIYywfh2NjjKAAPMDoXSmdm551bQQtLuxKxc7vL0p53N5OQkX/zPq4lSQbVeZ9myZWwZH6M+NIJfrdFoNHBtC+PhL7YJcm+DcKj4Hr//w6289jVv4j//85OMjti4nkecdNBK4Lp+QUoBVJIQhyFetTqrq42ZI813T/SN4lccRTiuy9TUFMMjIwRBgrRtLAkbt7T4wKUf5J777kdKmygXREvbQgeaOOyQaEV9qAo68w8nj/gvNFQqFcIkQgiFFJnFzGWXvp8TTziKNMz8d7N5asblRmNI9q55r2dbPy4Wi7YBZrA7fHbn8xHeX7HoNabGx683HYDZB3DPPfdw9tlnMzIyUpjt1uv1QiM523W3Z/tsmM2ntIwwDBkdHaXVaiGEKDSgxn/yOc95Ds985jNZvXp14c9ozjPSerPwCsNsIWWCGwVBwG9/+1ve/OY38+tf/5oLLriASy+9FN/3EUJw880386c//YkVK1bQbrep1+tFezqOU/g/LlRjuhD/1PL2nQ2OYtrDaE4N0bJtm06nw3vf9x5+/vOfc8UVV/CIRzyiCKQTRiGe681JTAFSYxIoJDpJcw2KQEUR0vNJUgW2pBHA+rGEl776rWzY0sQfWkE7VNjOjI+ZEKJESmd8VDMNaff2GYI6iymi6N9vi+sbItzn9VVSIZUsJNKFFrEUZEsIQb1qI9MGcWsLr33li3naWQ/BSqFigQPoNCaNQpxKVkelNVq4pEA7gMkA/vlDX+V7P/41jusztGQ5U9MdtOVkQTW8GlEpuFhGTJMsXUHeIlqVtIhzoL/kUpHlHe3jSzsrIc235+0mUpC2TaoTsBRRGoHMIu+2my2GPA9Hp+iwwdl/+Rhe/bKn4AsYqgCpLjQWuwKLcSLaWY1pGIZFKiwz9kkpC3/6rv7RB/NFTddadLlGlP1HgSKCuRHy9V5jPt4opcyEOJZFvV4nTVNarRa+77NixQqe8YxnctJJJxUaUhOp17iYDDSmA+w+ZOlSUpUFN1JKIi0LKSBO4f71Dd721nfw42t/QaVaJ9HQaHZwqxXiOItIrRIzVmYfbd5nLTKLEiWo+h5R2EElHc58whlc+oF/ZqhuY9uQ5BZtSimiKMLPgxEmuXbTEFNjIWQ0pgUhLTSkZj4sj9uKJNVYVmYBl+aeEamGVjPh/Zf+G5/97JcR0svGmDRFShvLyXKhO75HFGYa0k6Qrb2qnp+Z7sZZXA/LFbi2Rbs5zTsueQvPf86TMo1wnBFT5iGmuzI8wM5q1wbY9Zhvfb87nsX+9Hxn6/OLXpxbDmZhfIHMdvP9+c9/vjBbNcfCjpHPskR+R8rae504jqnVakxOTnaZFrfbbWzb5vzzz+dFL3oRq1evpt1uF8E3JiYmClMw13WLuvu+X5BOc+0zzjiDK664gle+8pVcffXVnH322dx2221EUcSxxx7L0UcfzdjYWEHaDTnp55/Vj5D2ttmOvDg7er5Jbm/IvGVZRU5a13X5p3/6J0488URe85rXcOutt9Jqt0jSBM/1sgl7Hug0xRbZAjtKOyRpCDJFeg5aQIIkSmHrFLz8lW9ny5YW9aHlBJ2IWsUDnXb5C/d+zCK591Pcn7nPn+9T6BOFQskEJSO0SEitCC0TtA1BHOfrA0EcxniuS73iE0yPY8dN3vCKF/OMsx4CkOcLhXaQIqWD41WJ2x1U3EEKQTOMiYGWgvddfjXX/Pe1VGsjVGojTE40cHyP4eHhPHBXO6tf/kFl6VYy88tZhendz6e3vRYwMQghELOm4CkNeUIhPUWgpkh0hLBcXFnDSisQSTxhIZMAHU/yt098JG95w1PIOLpGp3SlShmgP4aGhgohkglsliQJU1NTTE5OFiays32MhUe73abVatFsNmk0GsXHjAVBEJAkCUKIwtzfkFKgCAhn/NnNuDIfkiShWq3ieR5BEBQa4DRNuffee/nGN77BzTffXJBSc09j4THAALsPmVDPkk4eeE0iJUSxJo1h7cFDvO71r+aoIw+l3ZrCQmM7gnarxchwnbATZMSw5Hoi8g/kVi4WtDpt4jShOlTnmu//gPd/4IMIC+JYZ+STkhVbybUpmU/oVJDSXuQkWeR5w0UmR4zTGWL4mSuu5D+/+BU8v0ptaCgTMEsBUhDEEcK2Cncuk43BBDfTOsV1baSlkWnK5PhmXvfaV3LO0zNSqlNK9SjP1b0l3LUYaEkXP/qtjXf19QfYRzSmZSiligWIZVnccsstPPe5z2XFihVdkV2TJCmCCs12re2572zoZ2pW3mfbdqE1MIso2878JZ761Kdy8cUXFya9hoSWYXIIqtwEZWZw1QU5NdrTrVu38tWvfpU3vOENjIyM8M///M+cf/75BEHAhg0b+P3vf8+yZctwHAfP85iamsL1Kl3azX6az4X4jc6nMd0ZYmvqKYQoFoVBEADgepkP23vf+15uueUWrrrqKo468ihSlRZEds5ra4EQoFWIIsWSAo1Noi06kcSyYboDL3/Fh/j9LXexZNkq2lFEIjSO5xLlPpRFEKUeQtSrQe26N1ZBzrYJFKFl/+3l62iJRGaBgESCkilaJNk988VGEgt8p4JOJCoKsS2BIzQ6DbHSaV78nCfy4hc9Bg1EClwJSkFVgqUBrVBBC1lxaQUxslJnawf+/RM/5HNXfZMlyw9CS4cgCpGOi5A2Wkgcz6fTDrEcO29nU+csR+hCJc393qvuRlTbHAvb5mvtPRal0TImFW1SrXDsOkJ56FgiNDgyxbdDmpPrOOuvT+etb3xepk22wUEh89XSfAE+tgeLcVLaWY2pOS5NU84880yOPPLI4n2WUoKYPw+oEfCkaZZLtqwBveuuu5iammJsbIxGo5FpQ/KounEcU61Wu4Qb5Ryn2ba5l5dmLjH1Mvf2PI9qtcr0dJOVK1fyile8gtWrV3f5lhqiOsAAuwvm/TTrhnY7wPU8LEvQ6ihcT/LTn/2el7381YRRSqotbNcjTqHdCvCdCmiJJsmEmyLr6zJ3tXAsm3ajmQlzLEDHREGTf3nPOzj//LOJE41O4pKmNIuhYZXeM9hWY1qUv3DVmIkbYEgpZHNkqmG6mfmJCguu/q8fcskl76TdSfDcGqnOxhev4pMkijh/P5vtFhUvWwNadk5S2y0sW1L1K0SdNu32BOeecw6XfeAtqDTz3IlC8DxIE5WniVMgTAmznNpm1LB2w+p5trluMc4P+wv2hJBxf3y++6yPadn8yixGysGQfvnLXxbmU0aDaNt2ljC5Vps3+FEv5tIUzlfG8nd5n4GR3k9NTXHWWWdx/vnnF6TTcZzCvNe27SLHXqUyE+7cRKc1uVeNCY1pm+XLl3PxxRfzoAc9iPPPP5/nP//5/OxnP+OjH/0oBx98MM1mk+npabTWjI+PMzw8nPkEzlLP+aRD2/MilZ9jP5O6+c4z7VrOWWvaa3h4mJe//OW8613v4qKLLuJrX/saQ0NDuI47pymvmRRVkgV9sCyLFEUnDnGcOrYHjTa85g3/wS13bGD5ikMYm5rG9lx836LZbiDt3IdypsTb3GMmKm7Pop2UjGju4IAkFDpjoWhSVP4xxlPoLMWNdG3CMMCRkooj2bLxHg46YBnPOfcZXHz+SbSnU2rDVhYoKdZUnNzcSivSTgenUgMkTsVjMoKPf/a/+fRV36A+eiDa9tEqi/pYqw/TCjpMTk6wZOkyPN8iUUkR6Efo3qBE82N7JoSZdy9rk20vtm1eU0WKdCxQkihM8K0qDoLW1DipbPKXZz6SN77qeVQEaNnGQiCRpInKUzHsf5PJ9sCMa0mSsGbNGk488USElEWAlPnar3ec6LU6eNSjHlX8VkrRbDZZv349d911Fxs3buSGG27Yxry3PKbMJ5c1JBcorFWM2eLU1BSO47FlyxauuOIKLrroIpYuXVqUe0BKB9gTMHOhEIJq1QcyDaPnSOJY8ZhHncB7/uWdvOKVr8X1qkxOTuB6VSqeV/jICyFzaWE5injWzx3fo+pXaLUbSCTV+ij/+r7LOfTQQznjUceD7dLphFQqHo7jEUXBTN+fY/yeIaWQTRDZ3K7z+dKQ2CBKGBqqooCf/fxm/v3D/8HUdIf68FKiMEWRxRRJ0bTzbAuO56KajUyopRM8u0IYdlA6xXccms1pmtPj/O1fP4G3v+0NRCH4blYeI8vO3DR2LyHp57e4PWvVgVXGnkGvpeauvu5s+/b157uj5V/0pry94f7LEu8gCPj1r3/NAQccUPhgGg2dCR40G7maz5/SHDMfhJjJldercTQk0vf9Is8qwCGHHMKznvUsli1bVtTLaAQrlQpSyiKQBmQBgMx+yBZ7ZjIyGkSjGdRa86hHPYqf/OQnPOxhD+PKK6/kiU98ItPT0xx//PFYlsX09HQRgGlHtJcLbRtTnu5gJdv+nu9+xs/UmPSatrAsC9u2mZ6eZs2aNbznPe9BCMGLXvSizEwwmduUKC8IUgik5QIWQShQokoKbJ2GD3/8O9zwh9uIUkGQpFiuR6I0qQIpsnQZWqd5lFdyO6DsY0xYhU6RWiG1QqgUoczfRSEQ2nzy9UEpWJBAFduFVnkONrOi6KP10ZJM5mRjWx5BkGQpR6WGpMFhB4/ytCc/hgvPPwkJLBkW6ESThJq6kxlyhUELKVOcmkeUKMIUWhF87NM/4bNf/DZDSw/AqdfpxCla2Cig0WjiexWWLVtGEHTodNpZnUiLvHFZkSUy/yzMXHmu5ye7PjP9UvR8eo5HghZIu4LSNkmSIpTGEaDjDqO+xWknH8ubXvMCdBzjkFCRGqEiwqCF7Th02nMHzhlgZpw1+ZiN9rF3HJjtYzSfSZJ0+YlallWYBhtXB8dxWL58OSeccAJPfepTeclLXsLHPvYx3va2t3HWWWdx0EEHFT6ixm9/Phita61WK8hoGIbF2COlpF6vc/PNN3P11VfT6XQYGxsr6j7AALsbxr0lE6AolEpoNCexbXA9Sargr554Bu/513cxNT3O0HAt9+mcPYe3EsatI0Xagq0T47RbAV6lQqokzWbM69/4Vm67bR0AbsUjVpkYOMlTrAVBQC+16xmNM+h+P7OjolTheS4KuOW29bzv/Zdx3/qt1OpL6QQxjudjWQ5S2ll6NmHleVlVl8uTiiPSOMJzbLRK0GnII059GG943atYNuJQ9SGJU7Qm850NQ6S1Z97f7TUP3d3mpAPsOszGM+Z6hoPnuw8Q09kWplNTU9x///3cfPPNRdRaoPAnqNVqxSJoezCbKet8n36kVAiRp+WICv/SMAz527/9W4466qhswMxJl23bhamalFk6jyRJirqZRO4mqqUx5wUKsmnKa9s2hxxyCNdccw0PfehD+b//+z9OOeUUfvzjH/PIRz6SNWvW0Ol0ChPgfm2wkG3bg7n8BOc7z5g5G0Jell4Zc91NmzYxNDTE5ZdfzubNm3nBC15QmPvOD0EaK5S2sR0f15Y0Q/jWd3/OZz9/FUOjS5GuQ6PdQtqZaU+r1cJ13dILpLYhUgXJZFsibswIxTY+qv19Uvv5oqLSGZIqDDHOCCnaAm1lgSOShOGqh4qn0eEET/vbR/OSF52eGR3rGEGMbwvqrsDWYCmo+i4pilaYoF2bqQT+7RP/y+e/cg2Wvwzp+rQ6AZZ0CKKYWnUErUShkZcWVKpeQa4RWZCNGRNe2dUuc5HShQoxinZfcF+1UalNEgokFp5toeImcWcrxx97MP/0+gtZUoWVQw5CdYjCNra08f0aSRBTqVZ3afCLByI6nU4xnpn31yDNXTLm+pjzbNvueveNFnQm7YsshHXlCO5JknDQQQfx1Kc+lde//vW89rWv5eyzz2bFihWMj4/PW34TcC4IAqSU+L6PZVmFSW85HcVvfvMbvvGNb7BsWZaGY1+Xdg+w+JHmSxzP8xBCE4RtpIThoTpx0kHoBMcCFPz1k57A297yZtqNSXxXotIoy+spFIYSWj2uKL7v0263WbJkCUuWL6Mx3SIIEyzLZd29m3jbJe9i85aprCxpFjopExo5+L6/HTXRM+4rSLLZwkZYmdBz81ibSy/7EL/6zfVoIUm1xHFm1kSdPChkbaiOlLJYD1m2QAiNkGQB94SiNT3BypXLef3rXsXRRx2Sp7/R+H4WkV+lKbZTSndTlmuWfi/6xfMAuxz7O2HcU5AL1kzsJRiTEBPN0eSzHB4e5je/+Q2tVqvQpJWDWpioiOac3k8/YjkbuZzr07tAMigvqk0wjImJCR7xiEdw7rnnEgTBNvlZyxpfoFiIlZ+RqVPZbFhrXQR+MkTNdV2WLVvGt7/9bf7iL/6C+++/n6c85SlceeWVPOQhD2HlypW0Wq3ivkb7Gsdx0Y5xKXjBbBqOHZHudJmz9ul/vfcwfcBoXMqLTylsBBa+V2XL5jGqlTqf+uRn2LRxC+c+41kEnQitBFGYkCYakf9LkzwIT5yAEAjsbIJSmRz561//Of/+4Y8zNDLMxPQEqYhwK4IobhMlHVzXLgQfsjSVShSoBFSCUnluOJUWms+yRrVIf5SfJ4ucl5oiVq3Kk4KbyIBlTarUuJ4kSaP8XXHRCejEwrWq2NrBUhLShNb0FmpewrPP/Ste+LzHUJGQJE1SHQOSOAogTUErZO5nFMYKy/NpKPjQx3/AFVd/l1hUcL06KtHYeQ5JE2DCaJGSJMESkjgM0GmSNWqq0GlOGFLVRR7K9Zrr0xVIyWyfpc8Y2LaNEKIQ5riuW5hiaiUgcXFEDQcb0gCZNjjjkUfz9re8iMPXgG+DJMaRFhWvkhF+JbGdSr6Wm3t5Mte4uhDp6d6GeUbbI+EtPwMT7AiYEagphbVAM9fZnmu/8vRr6/L8Yds2xx13HM95znO46KKLOOeccxgZGaHT6RRaWDPmmbGtd84whNREiU/TtIicXqvV+O///m++9a1vdc0l5lrG0sP8vSfRr5+Vx+9+bTnX/rmuO8Ceg8xjApjgR67ronIrHmkJpMjyebs21Cvwguc/gze+4bU0pscYqnlEcRtLCNBpYZHgWpkrlOM4xEmEX/EIog5BFGJ7LtJxUdrCdSpc+7Nf86/vu4woBceRRJFG2m6ujy33iW7t7IzA1rjSmPfDIo7TPHaDoBMmKOB977+Mb377GkZHluI6HiqFVAuiJMEuBYdMopg0TvBdD5Qm6gQMVWtEQQfPd9BJyIrlS3jta17JYx51Iq6d8U7HFqCzKOtSAqY/z9KtdxUp3Z71tznOKDDK8VNgcb6Lc1k/LWR9Pd8158POaCwXsn9Hrj8fetfXCy3DQrEY+0kvFr3Qp2zKWyZkURSxbt06PM8rFp878qBmO3ah15iP1JrFmG3bHHPMMZx77rlUKhV83y9Sv+xODA0N8dWvfpWLL76Y6elpXvGKV/CpT32KI444guXLl9PpdAqS0G63Wbp0KePj43Q6HWq17c9xWiaw8x2zI9fthfFhk1IyOjpa5BC87LLLuOeee3je856Xb3OwbUkYxsUkLgQI1yFsdYBs6tTAl798LZdf/hF8v0qlUqFa85CWohNMo1SMX3GQFoRRJyONqlvbaVBOhNJ3YEahSxrTmR3d2teZfd3na61oNht4notEEHciKl6dulcnDRLidgBRwPIRH5E2+Mu/eAQXvOAJ+DYk6RQ1W+BIh6lGA8exwVIk7QYASSKwnQqNBD74H9/lmz+6Fu2NYFVqKC2QysaTbpfGUGtd1FfqmfoLzEJEl8j3nsnjGQQBQmRBs5RSBQmpVqtUvAqe8FGdBCtNsVSHIw5byj+/44UsHc7KbqGROpfm61wTXXLNH7iYzo+9KfQ0Y6yJymvKcvTRR3POOedw/vnnc8IJJxQCT2NFYgjofDAuEZZlMTk5yejoKN/5zne48cYbi2PKfvGwsDFyV2M2cl9GP0FteRFszu2dYxezYPsBj+IRbjueCg1KpVhCgyLLR+3As575dF79qpcxNbmVZUvqxEkLx7GQaCqeT6vVYeWylbTb7Z4BrvseGonrVfn2t3/AJz/1RRTguBkZbgUhAkH3EnNGM2vKrpRCuhZhEGTBBOMUabvYtsN0O8T3bD5w2ce45vs/olqtkyhNFCUI2+rKXVwWVpvfRmgq0ERxgNQJUiguuvAFPP3pf0nQSUqBl3SpjL1tu7s9TWdH+d0y75xxY+h1RSi3QZfgd5FiPmup2QRj27PGX4hF1lzn7G3MltWht58vhrLuSix6YmpgGt5E5G00Gvz+97/H9/0iUq2ZUGfrxAshr3O9BP0+ZULa77cZOMfGxjjqqKN45CMfuaAFz66C4zjUajXe8Y538KpXvYqJiQle9rKXccUVV/CQhzyE0dFRICOw7XabTqfDkiVLZtVk9v7uT6DYZl+/83vvMdvvudDpZKQyjmPGx8epVCqMjY1x+OGHc9lll3Hrrbfypje9iTjO2tzzTHj7XCiqFF6lgrQzqfO965q851/+laGhIaampmg0pomiAEuozFdSpmiVkEQRTm7Sl6VC0flHFZ+MqKo8b6fKTVnT4jNTvzwSoc78HIXS3RpUoYrrz/iiZqa7liNJ0xgQOJaLihRhs42VakarLr4Imd56D895xpN42cV/w4gPNjF1SyBIiSJFfWhpVgYdYdddtIYwtgk1fPYLv+Dqb/wvG8abWFWPRCdZhEMkKk4z4pnXUZDVWyidSZ+1BCWKOglVeuYl/9vy/tk+UtP1Ka43qwY1a3vLkqg8QnMWBTZ7XnEc0pieQsYxy6tV4uY4xx2xho/+26vx7SxPqZW3SSbWl5DaoJzM+UqDXtzz/qJCv3d5Zpzt9Qfens/cMBpyc3/j+2Y0qCeccALPf/7zOfXUU7vSeRkt6HwLGSklzWaz0Ni0220ajQbf/OY3C1Jszisvovck5qpDOdJxr/WPWdgbAtBLRB+IC6J9Ddv4cOrujyWtTGgZBXhO9sYsX+pywQufxzlPP5tGYyuOrUBlwYs2b97I0NAQrVaHqlfNbyLo77MgSRNBksK/vvdSvvnt/8NklbYsp+u4bUqdv7qWne0zJMpxsjysYQK1qsd3vnctn//CVxjbOsnQ8FKiMC5M+40VXa8gVwiBVbiOKKamJlg6Mkyn3eKl//ASXnzhC3AtqFRtei2R+oYlKOogt2nfvYF+liPm3ewVLC0mzLXenu2zJ8eZhRLXPYl+wsJejrK95V0sdZsLi6vn9kFvZzYLh4mJCf70pz/heV4hOZpPe7knPwZGEp+mKccee2yhRdVaF36juxNaz+RSveyyy3jTm96EZVm88Y1v5KMf/SgnnZRpC7Zs2VLkUk2SpEhvY65Rvt5cv2cjtPMRztmu23vt3v3G36tarWJZFs1mk+HhYaanpzn66KN5wxvewDe+8Q3e+973kiQq15Zm5yaJypJ2WxBGOVmVir848zHEUZulwzVsS6DTGJTGkTa2JUjTmDBqYTtyG9/PMvr5mJaPk7lp71xtNud20iJdTraIdIiDEKkUNUegwilsNc3Tz3oMF73gTJbWIYkSslASKRYWFddDJRCnKUiXTpCgpE3qwmf/85d85gtfI9IeK1YeSJKmM7k70zx4k0rRJAidoPOATpaaIY/9o/Cq0mdh2J6BVJcYowkOZlIGmPdRKYUtFZYKSFpbOPXEI3n/P/89S6sw7EMUtpCkM4sP47vLzGJwoC2dH7ONAzPYvY0ohCBJkmIss20b3/eLcVFrzerVq7nwwgs5+eSTizRjrVar0LDONTYZFxJzXhAELF++nNtuu41f/vKXQCYcNIH4TJn6XWt3Ya4FYZl49nN16QcjqV8M0vr5NCLzffY2drr8QncJ5Eo2KoBAlwIHCgAFnXbMklGHN7zulZx80rE0G1txHUESdahXqqRxgk4VUtp0533ODHTL47btVkiUjWP7vOnNb+fan92IAqQlc5I61/udlT2KA7yKnwdOgk6QBSD605838cHLP8LkRIPlK1ajddYnM6FRCCiUTroIqcnlKqXMCHkSMTpcp9mY4sUXvZAXX3gBFR9arQBbbFOabb73dg/pR9C01n0FSuXjt8dqcE9gR8uyJ9/ZxdRevehVlsG280e/8s/Vboth/JsNi56Y9jaekQJNTEwU/qXl42aTLizks7OEth+UUoRhyMknn8wpp5wCUJgV7gkIMRNAJIoiLrnkEl796lfTbrd529vexpe/fDUnnHACw8PDbNq0qUix0xu8Y7ZO3Es6e7/77e/d14+0LmQgMvtNgIahoaGC9Nu2zf33388ZZ5zBW97yFr7+9a/zz//8z0iZBWlotwMsW2I5klYrxM4VYYcdOsy73/16/vqJjyMKmwxVfKSSiFSiYgFJlttNoIijNqhcW2oi8aqErqi8eltNqtCacpCj7Hidf/JzjZ+QieZrtKw92sFOJ/OdUUoRdFr4rk3VE8TROCrawl885jhe9vdnsXIYoiBiyJVYSCzqqMhGKIiCBNuu0IokoRhiKoYrvvwLPvmFr9IKoT68NNP+JCkVxyHqtIGsH2sSJEmWn7TsQ1uEdcw/Rf0U6Blt8nyfEg3su63/ftP5s0WPtEBIXQQTE0LjujZDdQ8Rb+GkYw/gnW+9gAOWQRKBBdQ9jzDMg2fpHpM0kW8yK70B5sSsgps9tBAwwePK5TBjotaaKIoQQnDeeedx2mmnMTk5WQSjm2+cSpKEer1OFEVEUcTw8DBjY2OMjIzwrW99i8nJyWJ+KAdq2lOYb57q1ZT2fpIkKd6bbQnATD1216JxTwmQ9xZ2Tfl7hXyyiHwexyloietkwSGlANcWCA2rDxjhzW96LSeeeCzT01uRQlOr+kidBT0K2p1tNYQ95DQIEiy7QpxaBJ2Yd73zPfzpT+uxZGY6DHML8DQprmsXwuIoyY6fmNC8/70f4o7b76FSHabTjmhMN/H9ahaBOOzgu3YR4d4SuvgIrfN4BgmuJUnjiKc+5Sxe+vcvoVoRtBodhms+Ks2iGJcFjRqJFnLmO/9siz3jjjLbe1V+/uaYsv/7YiEds71n5TLP9em9Tj+CtjvKu1jGh7naycwlvVais823i6VPLAT7DDE1k6AJZrF58+auHJ/9yGg/SfBcn/I1tpfYmjL0vjjGd/Pxj388BxxwQLFvIakKdgXSNC1SrLiui5SSV73qVVxwwQVEUcRFF13ED3/4Qx7+8JOBLNpxrVYrIlz2w1zSl34ktHf7fNKb7bm+CYbUarVot9vUajWmpqYIgoA1a9YwPT3NX/3VX3Heeefxla98hS996SsAhbY6ijXVugcSkjQzvatUNG964wU86lGn0pycoj3VwcbHwiYKEqSWuYlo3FdzUPxW3YvabUn3thqHhUj2i8FKa1KtcLxMY6OTFN8WNKa24hLwpCc8gpe+5JksGQIbxbAPQiegLUgcJB5poKhVbeIUpGshPPjc1T/jI5+5inYiGV66jDiOidoRvu2CAhUnOI5NnAQIErKIS/FMkKd5zZ0Uvaa324MFSf/ETFTWckRsy8rGhXa7zcT4Bk48fi2vfeXzWbsKSKHqQprm6XUsG0p+UlqUPlKhd7D8+yP2lNS7F2W3CaVUEdU8jmPCMMS2bVzXZXp6muHhYZ75zGfykIc8pCs9jSl/+dtASkm73S7Gc7M4NJHC//jHPxaR103d9+SCp1dga+4920Knt34mp3bZnLefBqf3fruy/HN9BsS0T6owkw4LietWCHJ3F5WkpGmM50q0ikniiJNPPJY3vfG1HHTgSqKwRRQG2NJCJ70ClJKVS05OlQBpOXTaMbblkSjJvffexyWXvJNGQ7GQ+GaZK4xGA7ECz82K/sEP/Tv/8+Of47hVXKdCFCVImcUSieMQz3MK6x2zbgNjmh6TpjFCa6Iw5BGnPpw3v/EN1KoeKlEMD1WAGCtPB2PGdPO7/L27MV//7veOlZ9/P2JSvu5ixGx1Wej6ele+u/18OPck5nvmsz3f2cbh+cq/WPtELxY9MTUwgRhMjs9169YVearMC1pOJ9CPZC6EjG7vxNDr29r72yxwHvzgB6O13mbBsyfarRypWAjByMgI73vf+3j84x9Pmqa88IUv5Ac/+CEnnHACQgimpqYK0j/boqMf0ZyNQM12/myErd+5s6FSqdFuBwwPjyKERRjGLF26HNt22bBhE47jcfPNt/L0pz+DF73oQt7//kv51a9+jWUJgiBB62y6DaImlpWQMEWcTpKkmne941U8/OSTqPlV0hCkriBSKzcJTjJNXOEvaj495dYZWdumTVRvW81cw8QzFH32Gx9LA9/3CTqZxsfzHKKwzZIhj8ef+Qhe+PynsWalhVYtLNqotJU51qaS9pgJyKLRiaLdhvEGXPHl6/nkf36LUHpY9RqduEUStan7FSwt0JHCtT1SFRLE7czclST/zv1FtTHhFeiygL2LqOf17ZMGZyGDbbGv18fURPAtBnYARRyHCJFpyuI481N68DFH8vJ/fB4HrrKRgGdBGsbYCNJUY9keWlkoLVBk5VWkKGK0zj4DLG6UNX4mWrlt24XGVIgsx+rw8DDj4+OsWLGCCy64gKGhoSIF2Vzjm5SSIAiKazcaDUZHR2m1WlSrVa699toidUUZhqzubswm+DIE2hBPM0f0LnbKOWTnCrixu+az7Vm478hnb2PXlL9XQFbO7ZylgFG5gEaKbMxMVYxtQ5yGPObRj+DVr34VK1YsL8zYbdvGFr2mvHmsBD0jVKxWa8RxguN4JLGm3Yq46Y+38d73vpeJiVafGmeTgSgmBo1CkaqUKE6Ybmn+31e/x+c+95+4ro9KBUI4VKt1XNcvhD6uY5PEEUKDRBRCUJ0moLLIwp7ncsIJx/PWt76V4WEfzwPXlYAiDsPMckeovERFVId5HE3y8rO7nRAylAmJeWeNosG8m+X3s192iMXU/7f3nv0CWm3PNebTyJa1zHubpPZDeaw2z748Fpfnt4VqyhdL3ebCoiemZaJppN/tdpuNGzfOKznaGWnMQqUyvUS09xOGIY7jMDIyUgRpsixrh3Ks7giEEHQ6nUKibwIGLFu2jA9/+MOcccYZNJtNLrjgAm699VZOP/10ADZu3DhrnlOD2Tp3vwXcfOdsD8rXCIIgD9bQKhaS7XabMAxZsmQJSZKwZs0axsbGeOITn8gZZ5zBe97zHm666TZ838Z2BVPTDXzXQ+sEF8mQ42OJhJoLb3zdyznuwYcRdSZRcQPH0QgS0jjO0qDkEFrngYDSIsiRme60MW/tQ55EQUbJjtfkgX3S7NMzCfa2n9QWreY0Nc/Ct2PScCuPPe04Ljj/KRx9sIeOQ2pSolSEbTlZmTVUl1okISAtUkeSWPCFL/0vH/7Y52i0Y1y/TrvdLg12inajmaUk8B2arSkqVRcTsAnMYJIHciJFdJmrlxdRqousF5rT7f0GrNTBSi0sJXMynF1fiUyir4WDVhaWsKm4HsQh8fQWHnzYSl75d8/loccsYdmIh0pi2s0Gvpfl2kyitEvzAEaK3rtcGWhN58JcBCYbX3fvBFmO2m7SBIVhWAg5oyjC932UUixduhSAkZERnvWsZxU5eXvL3Yvh4eEizYznecVYFIYhN910E81ms1TfDCbdzO5Gv0VWeUHWarVoNptMT08zOTnJxMQEY2NjbNmyhc2bNzM2Nsb4+DjT09O0222iKCrKbrTAe6r8/T7lqME78tnb2DXllz3f2VilBESdGKeSzYtRFGHZdpYuLU2xhMSRgigKOfcZf82LXvBcms1JhoYrKBXlQfXUzLULbSyQJ4QJw4B6PZsrPM/Ddjymm02++rVv8t8//HF2thZorJnylVKeJXmQhyBS+J7Nz37+Ky55x7ux3SpaSQQOcZSSxNm7K6VEWoIgaGPb9oyprTTrOI1jge9LalWbt7359aw9aCm+B5bI5LKN5hSu52dxFfIy9bZgOaL+7oRJNDfbR0iJkBYai1hZhIlFJ9K0Q0UrSJluRTQ7imZH0Q4hiCVxbJGmMhOoatnnI4pP2QpowWXejnP6afXL9YsTNccHUiVJlSRJBUrluXILMpkUafhEjyhBI9AIlLbm/Jjrp8pCaTvfnrVTVsb+gfbmDn4125og9/vu+sz9/KNYE0aKMFIE4cwnjDRhpElSSZRKklR2lV8jQcieusx8oHvsnr0uoud7z1gT2IvBnGUuFLkeSz4taZpy6623MjIygudVusghgG1bsxLLbSfShS8szfV6F1pG+m00pIZ8GnOxM888k6GhoWIRZCJC7imYYB/lXHwAa9as4d8u/yCXXHIJ3//+93nKk8/iu9/9Lo98xCn89re/pd1qUK1Wabdb1Ov1fEGTFikSHMcpghtoPZNXtfxdbqdy+/UzPZkNvfvK17HyScr3s4AIZpvWEEVBbmrXLLRnz372M7niiit417veweWXX86qVStyMmlhaw90FvShKi1SDUccJnnzGy/gTW//V+68ewOWPcR0s41dqaBVRmBsy0LphGq1ShQFBJ2AWr1KnMSQB50QQuRK0rzsSLRIEWShEjMiqyGvqxkoPNej0WjhehVSrRBSYFkOnU6HSqVC0A4Z9n1E3ECnDc5+4sP5hwufykErMu1mzbZB6yyfqQKkRFtZ7takahFZMNmCT17xPa784n+RCI/hkTqNZouKXyHVAoQk0imiYhHrmDgJcSsuURRhC2OSbhYdmixcbRbhUPdO74Y8akCkRX0pwtx2f2fcJX9He/4W2sJTWZAubUV4dZuOahMlMbZbIQpTdKxx/QqeFKTNBq5u8qgTDuXFL3wijzq5jp2Xx7Es3GptJjqk56K0Kq1ORP7krPzb9N+5ly+9grJ9DWUtWi+ybb1EcwZKqXxhJUmVIklTZNmFQYj89N1HbnqJcFnYprXGcTwgE95Vq1W01vh+lYc+9EQOO+xBbNy4kSjKgsd1Oh183yeO4yJokCG7xicVZoIdWZaF4zj87ne/46CDDiq0q8bSZ3vKXzbdKs+JRmBr5sByappsLLRotVq0Wq3CUqfT6bB582bGx8cJgqDwJY2iqNDEGKm867o4joPnedRqteJTqVRwHIdKxWPFihUMDw+jVHaOaeMoinBdtyAUpo3KZs9CzO3SYuZRx3G65s1Wq0WlUulr4tYLMy+bQFUmABpQtJ0pUxiGSCmL+83nciOELoQSvYLcOI6LtYD5OwzDwifZzfNv9qK3zxpBgMlIYHyjgyDAk14xMkGP8EyA4zv5OCZwfQ8jK/TcCkplOU491ydVcMGFz6UVhHzwQ/9OtboE17OIkhTfr9JqNUjTlCUjw4RhSKvVYnh4hDg1putZ35TCwrErWJbLBy79CKvXrOWM047HAuI4wfOy1DCe75LEKa5TpRkk+J7H9b+/i7e86V20W4rlK5cytnUKr1JBqdykUdgolaDJrB8UmlhLPMcn6DTxXRvXseg0JqlV67zzkrfziIc/qBiqdU6ma/VhFGDZmd1wJlDOuG35uz9yIWX+V5pqbFsWG1RpjIvCENfzsm12NlYoLZBSEEVxFllYZ7nVzXIwTmB6OqIdRAhhZYK0IKbRaDA2Mc7ExCTNZqMQEGXrYqt4/z3PY3R4hOXLlzMyMpzlOndtahWParVCteLgONn6SOfPRIgsJocUkMZRYbavcuFdkiSZQEMIEqVJlca28gILs17pJW7Z9lTFKJ1g2W6WQV5INNBsxtTqDlFqdV8nf3+lmVoUuC60O5qKK7Fs6HRCKhUHgQaVgJSkUYTlZmN5EMZI20HkwhnLgiSB6amENHf9Gh8fZ/369bQ6zSwlYKWO51VwXZ96vc7ypSMMj0AQQsWDTjuiWnPzdUseLwQQws77QSb0SeIY27EATRxFOLmWP0k1UtrY9kzfSfJ3MUoyBUu7HdDpdAiCgCjKtKCN6WYhPAzDbJzJeJAsxmfbcRgdyZ750FAN183cU/yKR823sqCeOp9uNYRhjC0Fvm9n604hIE2zZH5KARLbsVCpRuQ5fbUZUITOlpHCrMEWvv7ph9nW/XuOHe0gyoTTSHrjOC6CTVQqtb4azn7b+hGi+dDvnPJCzZDl3vtANulVKhUOP/xwRkZGtjl/TxDU+STaxx57LJdccgntdpsf/ehHPPOZz+T73/8+J554IrfccgutVquQiBrTN+PLGccxLFCzbMqyI+2/kO2zHWdSNoyOjrJp0yaq1SrnnnsuV199NW9+85v54IcuZXRklDgKcF2XNIkyH0MJlpVNOEcdMcKb3vgPvONfLuX2uzbgenUqrst0K6Dm1bFtm2Yzot2YziYHJ/PJiqIApI3RCwkNuliIqeylFgqpJaCLXJ8Cism0MTWN5bg4joUrXBqtDmmaUqvVCNpNXMditOYxsWkjZ/31o3jpS57LsiFIOiFV3wGtUZ0A6dVBQhi20VJguw7Kgo3T8LFPfpfv/eAHSNfHkx7tdhvX9rNUL1qgjCAAQCY9uUuND2a5/RdGNIQuH6kW9G20y0JkA2gUBFSrNUKtssWTSMAmXyy5eK7P5NYxVg4PYblw0IolvPofns/JDx0FlQU62jG6uOiNTRYFduSd35NIkqQgXmWh3bJly3jSk57EJz/5SWCGZBjzV6DQus4GQyY2bNhAq9WiVqsV5KVMOOaCub6Z9xzHKchMEGRjllmUltHpdJienmb9+vVs2LCBu+66i40bNxZR1w0B7ZdLu99cagiWZVmF2a+UkgMPPIBVq1axevVqlixZwpIlSwqi6rounU6nSO8BWX8ot6XjzE38TB1vuukmJiYmuix+xsfH5yWOlmURBEERtT0MQ1auXMnatWuLukRRVJBQE3vACP7mmz/LRNxockzbmDobYm4Euj/60Y9YsWJFbgLuFO0yW/3r9ToTExOMjIwQhiEbN27koQ99KA960IPmDaLY3w9+pq84jkcWTV1g2YJnn3cOnSDgs1dciWV5ILIo9Lbt4rqSTicgTVOGhoYzSyzHQZRIhVaKRAnCMEXrkH99zwf4yEcv57C1o7iekwmRPY+o08byKsQpOJ7N3esmePVr3sjGTWMccODBbFg/xtDICEncHYtAa901YFuWxXSzQcW1CYI2Q1UHv+Lwypf/PX/7xMeW8pRmwlDDn1TeBlap2c28tj1pYGxbkqaaODTPeKY/up5HHEUIK3MVSVKN1iCsXLggwBbQ7GjG7h9jbGKSjRs3c9uf7uC22+5g08YtdDohSZq9M0EQ0ApC4jjsEqxYllOQSUfauK5DrVLF8x1qtQpDQzVWrljGgWtWcdBBB3Lw2gNZc8BqRkZrDA1l/V2pnHBYdkZaU5Ay65u2M9PglswEs0pnwiyv16pOQ7GAESmWtLAQREmEUiAsD0tK/nznOtZv3MTIklG0yPWSRcNLhMrWFU5ehjSJsCxBGLU5dO2BHHTQKuIkxBICCaSJQpFguzaO56CBRgsmJxvcs+4+/njjzdx5551MTk4TtjuMj4+zdWIrWiuQEkvYuF6FZUuWc9hhh3H00Uey9qAD8CsWZ5xxIpVaZnWQxDHSAimyfINGEGFZLpDzk0hjWy6O6xPHKZZt4VrZCiaModGMaDSadMKQLWPjTExMcO+6+7n77ru5//4NjI+P0253MkEUuXAijEtCtHy80ZokzfpdrVZj6dJRRkeGqNWq1Ot16vUqaw48gGOPPYYHHXE4w7UqlYpDpeoggDiFNAip1HywnEyPWhpP01RjS1F6pt2rsd25Alr0xLSfFL6c8Nv4lc5mxjsbdtYEqSzJ7pVwGomsmYTXrl1b7DeLC2CPmfOW0VveKIo49thj+fCHP8w73/lOvvSlL3HOOefwf//3fxx99NH85je/odls5trACMdxqFarTE9PMzo6Shglc2pJy/c128pl2F7NQe/vhWB4eJgtW7YUvmUrV67kSU96El/5yle47NIP8ea3/FPhHzY0VMvPyiSFGhtpw4kPPZhXv+plvPtfLmXdxq04joPv2HQ6LbxqDazcnFtKkjRGRBGW5cwoBEtTZF6LzNy1tDXjpXJGOgV4lWxBtXXrVmq1GkO1Oq2gA2mIZyscGTG+dT3nPv0sLnz+WaxcCg75giOO0CpGehbIhDhOcP0qKTA22cYfsbniim/xzW9fw5bNY6w+6GDCSKMU+I5LqxPiuH5RYpEXUhqpoc5TEKBK5h19ctaV6rMN5gkg1PukhehusdQKiKUmSUJUCrXhUYRt0Qky/6Ok02LJkE2nvZ4j167g9a95MUcfPVwICvaIo9A+jB31R5nvnMVCWI1m0ZAIs+CzLItTTz2V73znO2zcuLE4Jo5jKpXKnHECeuv15z//mfHxcWq1Wpcgs6w9nAuGNBlXBePTakyQgcKstdVqsWnTJv7whz9www03FIHgjGbUEMyy5tWUp9c1xpSxbDLbW+fx8a3cdtttuK5LtVpl1apVHHnkkRxzzDGsXr2akZGRYh40RNAErHNdl/m6lhEYTE1N8YlPfIJWq1W4bhgN92ztbs431j1KKTqdDoceeihPfvKTOe2007pSt5XbY6H+v73CCWM2XoYQAtu22bJlC//xH//B/fffX/g8e95MAMd+/ckEbtNaU6/X2bBhA6Ojo6xdu7bQGu8MJIJWEFKtVNEKDlo9wgtf9Hw2bdnKf139NYZGlhHHEWEQUa1WUUgSlVKVDo6TkpTMugGUkKQ6gSRBIbjjzjt5wxv+iY9cfhmrVlSwLI84SbAcH0t6RBE0m5p3XPLP3Pj7P7Js+QFs3bqVoeE6URQipUWKRhbWGZLMN1SCFsRJyIrly2hMj+N7NkGnwbOe+TTOf865WHma0t4a50/FtPpOtV/2Tglc3ynencz3U2XrDc8lijVxAlZOWlMN9927mcmpKa6/8Q/cetuf+OONN3Hf/RsIgog4TogjTZyYyKtZn9Iyt5/N1bqFhZ5IsIRZ/2Y+tLmiK9Oq+xa1ik+l6lGv11i6bJiVy1cwMlrnzDMfx1FHHcHBaw7AsUBi5Zr0FMfKUurNuBqBsFKEzHLNus789CEMs0BVju2RJ8ij0Yj4+te/zpev/n8IaecR7o1rk3ksmVbQsbKYEL7roHVKuzPFy/7x77jgwhdQr1RAp6Spwq0OoYGpRoRfcZmYCvn6N77Dj3/8E+5Zdy/r79tUrF9tORPYU5GCtBBakqSaO26/h1//5nocV+I6gsMPXc073/kWTj7xWATZmGm7TtFtpGWhtMr7QUZujeGbUiAdiyCCqak26zdu4q677uKW2/7E7X/6Mxs3bmZ8okkc6UJTasZGKY3W2gRoKo/NZk5WeL4kTDpMTje5f8MmdB74S0qJ69qsPmAVlYqHtGDl8mU8+tGP5i/OfBxr16xBkzBSrRJ0EqRIcX2HMMjG+WrNxXJk9/pIlO3fdq9gftETU5hZxJgB0EgjTSCL2fKuzUaSurH9quZeclW+V9nEy5TzgAMOKCbmMjGdz4dzd6FX49tqtTj00EN597vfTZIkfO973+NpT3saX/va1zjjjDP48Y9/TBiGDA0NMTExQb1eZ3R0lGaz2UVcDGYz1e1nyru9i95+BHW2b4BqtcrExERhNtVoNHBdl8MPP5wLLriAj370o/z7v32Ef3zp3zM0NJSlXCkFfrIdmGrF+DWHRz/yQbzyFf/Av37gQ2zatIXq8DKkZRNF2aLP+LMl7YQwDKlUKl0LRyjRNJEbYOk0NzGCbNI1bEln5r5pZmpRqXpYtiAMmiRBFiXYcRRxe4wn//Xj+fuLzmLJEIRt8Kq5xNO2M3MXoQjDFq43RCfWWI6gUq3y7x/9Gp+78mqkN8TK1QcSJ5pEKWzLm1lwKVGSZOZ1ESpzExKqh0yXa9jvrz7Pc579ZWxjUqoT3LqgE02gtY2wHKJQozspURBiSY3vJIi0zVGHL+Vtb3wpDz7Sx9YQxwrXpPzbfZakD1j0e58XYt2wrUBv58jpzpJbo7kzBLFMyGq1Go95zGP48pe/XMw7vaa085XHdV02bNjA1q1bOfjggwtzTDNvzYeyhtZoC30/G3PNnCKlpNPp8Mc//pFrr72WP//5z4RhWJBpIUSX9q/so2lIaj/fzX71Ks+z2e/s2GazSbPZZGxsjLvvvpvf/va3jIyM8KhHPYoHP/jBjIyMEARBEWgJFmbKC5nZ7gknnMBTnvIUvvnNbxZjq23bs7p5GBjNpzG3rVarrF+/nl/+8pccfvjhrFixouvZR1FUaE7DMCyEAbPBnGvaq+xuZJ6R4zi0222++tWvcscdd+Qm0JVCg2ueST+YiNH1ep3777+fSqXC2WefzQknnIBt2/NqTOeDUuA5LgKwJUw0QtasrvPSf3gJ9957L9f/7kaw7Mz0Nski4xaacN9DhyGmyWcEGg6IzIMuTiJu+P0fed/7L+XNb3oDQzWHNFFUqg7TjQ6OV+F97/8Q//3D/2XlAavRwiKNAhKVC0R6/RNNnq6cqKo0odOexrEgDFv85V88jn959xtJw+yQ3tFB5FrT/vm1d6T9VPGOmfczC6yWTSudIEVYFo6d5Upfv34Lv//DH/nRj/6Xm2++mQ2bNtLuhERBjJAWru0hLBvbkdiOJIoydyApy+tcDTLrd57pnqq0hmAmfsXw8AhCZERzbHyaDes3keoEx7ZwHIuf/PRaHnXG6Zx44okcfshajjn6aJYvqSAsizjKNMKiNE5psijKiVZYC3h3i3dd5ybfdhZ0bmpqirvvvpuDDj58xt1H5HOJNi4eiiiNSZIIlUpQEVNTTaTl4bhZNnaVWghh0Q6zvjzdCPjBj67lW9/+Hr/45a9IEuiEMUIJXC+zrgzDqLB0UGiElNjSwbYEws7G/iiOiKKY6377O9qdEGFlQhwpXSBjnQpNFEc5CXSzrIEa4ixBAZ0Ifv2b33Hrn+7gN7/7Lbfddhtj4xOZ4EIr0lQgUhsp3Hx+cXGdmbRmSmVWe44jEXS71GitUUKTqAQpHCwnuwZCo5MYIbOx/7Y//Zlq1UeguUXdxu+u/wPf/PZ3eNhJJ3PccQ/mqWf/DbawkHZmrmu7FiI24/vMU+83TW+PZcFsmG3+3ieIqUF5UjQDQDmMfe+xZeyohnQhJqPlBYZZwJgIWmvXrmXNmjUYH889ETCiX3lnax/LsqjVaoyNjXHggQfyvve9D8dx+NznPsdFF13ElVdeyeMe9zh++ctfMj4+zsjICFNTUyxdunSbBWe/TtZPszzXIrYX/QjsQrWnxg/HLALNd6fToVarMTo6ynOf/wLe+973sOqAFTz3vGdnvkX5gs/JJYK+l5viKHjS4x9CEL6E973/g0xMb2Vo5EDCSIFKicMAjYvrOcSRIInTIihDUR/TTqW2ULn2sStUvZZZOH4NzdY0w8NDqDQmCFvUKy5p0qbdmuKJZz6Ml7/k2SwbgjiA4UpmniQkaJ0gpCKKOrhejSBN0bZDK4L//OJP+MSnvkIsHIa8GqnK/E1s1ydVWW7Han2YoJNQ+FWY55FrTRV6ZlFSPAY1UwfKPgi6tLf8kOYnFkW/6nnWSsbEJARph6HaSpLIod2IqHhVhrwalgyIO2OsWuXzulc9nwcf5eOTzeGeI1FpMq+PxAAz6CcAWigv3JNj3vbAEE0jTCwHiRNCcNppp3HVVVcVC1BDhsqkzqDf+GdZFp1Oh4mJCYAu/8aFzAVlSxRDROJifMoEm7/+9a/52c9+xl133UW73S60osZntJ+A1ghQjYS+954G5bmt31wiBIUptPFHazQaTE1NIaXk3nvv5dRTT+WUU07hkEMOKRaqCyF9Bo7j4Lou55xzDq7rFoKCfm3fazVVrVZzzWwWkbtWqzE+Ps7NN9/MVVddxYte9CJGRkYK/2FDuowP7XwoW0eV+45Z+Bohwpe+9CX+53/+hxUrVhRm1Jmfabdgt996o1qtFr6pZ599Nn/xF3+x04TUII0THM+l0wnxKx7DdY9UwdFHHsAbXv9KXvf6N3HP3fdRGa6QxBAGIdVqnXacQpwLL6VAi9wPTQiENGsBTRrEVDyX//f1b7Nq1Spe9o8vxvcdNm+eZtmKYb713V9xxRVXMTy8pPCrzMzTNUqoGV9FyOadrNUzgqk1I0NVpibGsWzNUUccxgcvey8yj9Ek83OAjPTskhbrhm1nRNCY5QuZCWnTrHlwfAsF3L+xzX999Wtcc833uffee5mebhAnSWb1IBxcz8m0zVlQYezcusC3vTzTavk9TIt504wPBS0VVvYMAJRFlGR5u6WUWE6Fmu3x/9k773jJijLvf6tO6njD3IkMwzAMiATJQVHRFUVBQUXXVdaMmHMOKwZ0TairuOZ1TeiKLvoaEBUVVERAUBQEBAEJw4Q7N3U8qer9o06dPt3TN5CEcX3upz7dt8Ppc6rqVD2/J/yeVKQ4GIA7OdnknHPO5etf/zZ77bkHJ//L0zj2Mcewyy7LKflmyzVgK8FxBY4UCAQ6iZGeyBKP5t9DHcdBk5IkqSEv0k4O5JYvX2nIenDNNVkdQ2ksyZZWAiF9wkgR+D710eX4pTphBDEYA4CCRjvl5z+/kK99/RtcdfWfiGNNnGqEcPD8MoFXyvRyjSADgp4kSSJSrTLyI41QZuJI6SG0wA/KlKs1AOJYG/Ba8JaWHBM2rDG5oq1mzPapWa78/Z+46DeXcOEvfs1co8Vcy/CcBGUf1y1DkpCkMZUgyPtPZwCwZ4DISFIFBnDSYyYWssd5QZZjbMPulRKoVBElCavWrCNJI9IoREpQWvKna67nmj9dT71e5cc/PJ83vfH1bNy4lqnZNhMTFbxA0g1N3rjjCshKAGZXnT3eMxEH88n9HpgOghirSBQ9fsVQkuLmeU+A02Hgyyomg5tgcbNIkoROp8Ouu+7K2NhYn0IAPUv4PRVSvJTPDVOcbJ7rxMQEAKtXr+a0005DKcUXv/hFnvWsZ3H22Wfz4Ac/mMsuuyyvh9putymXyyTpcJKjYWG9wzymd/b6hnlFh71uH9M0ZXR0lM2bNzM+Pk6pVGJubo5qtUqj0WCXXXbhta99Pe9+x2mUy2VOetIT0SoxVkKdorUicF26kcbJrEpPOv4IZrf/K5/5wlls3b4V6VYZHR0lSRLCdge/XMpDsMRAce7++Ww8Rja31GwwIsuI0ebtzHrfbjVI4g4To3XCTgMVxzz2nx7Ca1/2LCZqJnzXDwo5kwK0Mjktjl8mxUFkhAXf/u5lfOSjn0V4dcbGRumEXbQWOJ5RSpTSCOkSd0OENgQCUmU5IDpT/mxurNbZxjkwbvn1LmmYF5Rhc9zOnyjtkogYHNCkZvMql4haM0ThFOt3HeHNb3oBB+63Gh2HdNKIkVKVZqPJSH0EfQ8peH/vstB9N+x+L372rkZH/C1kMJx2MI9zxYoVrFy5kq1bt+YlZgZDYOcTuydIKZmamgLIU0+G7SHDZPAz1rgZxzGtVovvfve73HDDDdx+++05+Cp6QYvfgV75HEueUsz9HPZ7w9JN+r2m/b9jvbM2bWJ2dpYLLriAG264gSOPPJLDDz+ciYmJPJdzsSlhCT663S6e53HssceitebHP/6xidgpgMdBb679fqPRyMOwt27dSqlUolQqcd111/H973+fpz/96ZTL5ZyQyJILLXWPsnu59ZpprfvCrs877zwuuOACli9fju/71Go1ZmdnqVQqdLtR37GGGQlsjuzxxx/Psccem4//PVNuyPAolPwAgWGuTVNAwIOP2I/XvuYVvPffP8im27dQH5vIr9GRHlI4aKnyOdBvcAGtFdWRUbZv28r4WI3PfO6/WblyNc961gnUR0e46eYZPnTGx/FLVRIlENLLoxWE6yEsA47e0ThigFlK3GlS8qFSLvPRj3yQ0TrEEfgOpErjFIbQBsdYJfvur0YKEERxF98rmQgnbeqxug54WV7hN791Pmed9T9cculv0VowOj6B79dxfHvfCNysP0Vg2WdTkgQcT6KVQqXZ2Yp+rgWV9jzVuQ6sRM7H4ghJqhLS1ABnx5FIxwNMHXSFRDoujiu58cbb+OjHPsn/+38/4PGPP46TnnwCq1fXkIDjuHQ7HUplH0fqvjVzIYlj473zPUM0FSaabjdiamqKxlyL5aXlCByjJ2UDo2Wv3JznBwS+T7M5RzcKCcOQ2zdtJkmgmo31H/5wE1/68lf5wQ9+gFLglypEScTY+ARRlACSJIU0smGyEqUESSc2HmAhcBAmZNoVaK3QSpGiSVJFlKS0OyBEkq0N2VAAs7OzVEdHSRO47Le/53Of/SI33Hgrc7NdtmzdTqU6CtKjWp1AS42QmlQphCMJyh5CuH1l9Gyqop1fQjh5xFr/2mCAa6pkDkqNNunh+i6uFEgJjbkGruegtYNSAteRuH4VncR0Q8Ull/2eZzzzeTzm2EfxohecwrKJCq2OolR2MBROw+8SUbwN7wW53wPTYWIH0VqGix7TxSzYxWMs9beG/XZx47c3aVERseFQNgdkEJTdF/lVwzZbW9fRegu01qxbt46PfexjdDodzjnnHF7wghfwiU98gkMPPZRf/epXOStjo9HAzUIP5gOjVgbfn8+Tu9j5Dx53MalWq0xOTjIyMpKXPxkfH6fRaLBs2TKm5xqsW7eOU045hbe85S2sWDbOUUcdRdJpE1QrCAFKJTjCUN4LoJvC85/1BGabDf7nWz9l21QHdIzve3S7XdIozDZWQGV9Yy/ThtwI6zk1i5DGQed/ZkHQArqtBuOjNVIZ4yGIOw1k2uHohz+Y17/qhaxfBUmo8JDECQgXEDA9vZ3x8VHCJMFxy2xvdqnVXL75nUt5/xmfJKhPgCzRDWNSba3UDlEcm/wGIeh2OvheCSl74Nmes0DkS5Ys+EGV9ZTacc8u3F7/jqrUwsrVvPezNhur6wekQhLGCXGYUhGC9uw2uo2tbNx9nFe/9FkcdfAaHCAhoez5dDpzjNbHSBLFPaLb/R1LcZ27s99b7P37Yg0clGLta+vxswDFhuYdddRRnHPOOX3rHMwf+VG8rjRNCYKALVu25J64otd0KWKV9ZmZGcbGxnAch5tuuolzzz2Xa665JiMRMgRDYRjmIM4ax6wHz+6ZrutSKpXy0NXBPW2+sSum09jnSiU7eFWVUhnLZJtKpUKaptx4443ceuut/OUvf+H4449nw4YNmdd0x1SQwfEpHsfzPE488UTiOOacc87ZwTg8CExtXmu9XkcIwczMTP65MAy54IILWLVqFUcffXTOGmzzYO33FxK7z1uAbI0DYJTWyy67jHPOOYeRkZE8lWd2djavF2qvf74+T5KEWq3Gwx/+cB71qEflxwiCICdDuTviui5pApZkNY5THC/LM0w0T37io7ntttv44pfOYnqqiedXSOIE1zHG11ilCAFaZuUvlMgXf5WkNFttVqxeQ2tuliiMePe/v58NG/fi8EMfyAfP+Bh/uubPjI6tQumEarVOszlHbXSMO+64neXLl5tQZ0FekqwY4SKBsNukVitzxofexz577UYcQcnPQGhqVPVinI4J5RWZgfVudV0udo5oNJ0oJQhcUuCvt85w+rvfx+9+fyV3bN1OpTbGSH2cKElptOfwSybKIFYpYaTROs7vT+G4OFKiUpNfaPdeywKrdOY5E/36ZO8eNveA63soZaoGaK3RQpIokZWxAyF80lQRlEp4jqTZnOPSy//ATX+9hfPO+zGvee3LOOLwQ6hWJaVq2SDhTHSRFWcecV0XTe87aaLwPB/P86lWayTKpCyZActKyQlbTE6yedtWxkdG0Ro8v0QUx8zMzqE0bJtM+e73f8SXvngWV199NfXaCPV6nTg14catToxSJnLM9od0HFOZIAEtJb4fkKiUNE4JwzjzRpqSQ1I4eF5gGG5LIEWBqExrkjhmZHQUBczOzvHXv97Kj37yc2bnOqxcuRtjE2vodGM0DqSGOClNY5Dgew6uKwnbnQzHCBy3Z7RUSmX3k0LnrFwMjLXCdX2gR6Zq9hVNnDkPHK+E5xs26ziOUZnHGsc1591oU00FX/7y/3D1Vdfw+je8mn96xMEAdKKYkt8PEXs5wIsO/d2SnUItG/SCDjIE2ufF/+2jtSQVW9HCdGea/f1hG7Q9p8GC5XbRGrRM35lw1ntLLJC2oVi2z6Ioolqt8slPfpJHPOIRfPWrX+Vtb3sbSimOOOIIut0umzdvzsOU7owsBvTnU5DuTF8VP9tqtfJN3CpjcWzKP0xPT+N7AVEY8+hHH8uRRzyE5z33FK655hqCSoWkG2aU6eA6Gl9mikd217zqJc/g+Mc+irF6iempbSRRB98zlirSXojcfMqe1ilSm7BYmwtqLKLGZypIGa1X2D65mTTuUq24dJqTHHXkQbz+VS9m15WgulDxJUJpfE+RphFR2GJ8fJRuGiPdCjGSWq3C1775Cz7y8c/RjhTtMCFWihRBEATEcZoxYBqyEaucmxPthdn0bfILlCFf6vgudfyH9qOWRKFGUAJloH3gK1Bz7LlhGa9/9fM45uj1hN0ISWTquSYxtXKNKEpw5N+qWt3fnwy7N+/senZfr3/QA302B9HyFgB5yZQHP/jBfcbGO2NUs17J7du302g08t9Z6vdtHqLjOExMTJCmKT/5yU/48pe/zOWXX54Da3sNUkoqlQqe5+X5knZfsmDVkgDNzc3lYaXWk1osNj8InosWffv54r1aJCS03uUkMfn21WqVIAi49NJL+dznPsdFF12Ue00XkjiODelOBqztOT32sY/lKU95Sr432+ssPrf/a23KQzQajZy4qtlsUqvV8H2fb33rW1x55ZX53mDHZimM+YNGZnt+7XabK6+8kq9//euMj4/nOb/2euwY2X4u9mOx/5VSHHjggZx44omUy+Wc5TiKonvAsCMRwpTTiMIYnRqFWWiFJ8GRGq3gFS97Lo8//nEkSYROYjzPwXGNJ7fHki4yj5yDk3k+tTSK/eT2KXBcRseWEyfw7tPfzzve9VHO/+mFLJ9YTTeKSJUgChMSBXNzcyxfvjw7vs5+o7j/GEIerRVSKN512lt4zDEPIfDBd7OPaLu+FOawNqQC/blxd6cPszBuZepRplrgekbhv+AXv+Plr3gNP/rxT9m2vUGtPk6qHLZPzxF2Uxy3BNolTgVS+DhegHR90JI00aZZz5lQJjw6a4Z4MEXpBCnM/yo1ZdyiuEuSRoAxQoVhaABJajypSVbpJFGSREkcGaC0QxxrulGK71UZGZ2g3Um59Le/48UvfSVnf/McWu0sWiqrR7ugcS0HL5nDSJt6oFrbvHJjcDGOAnaY/8W2cuVKpOdmqRUyi3xIabS6XPrbyznzzM9ww19uYWL5GoJyjUari8AjKFdJU0MiJERPN9fKGKRiZQxQ7XY78+pKgrKJpLARE2ma5ozdUQpJavoujmNktsZ1wy4aWDYxwsGHHsa+++7Hrus2IN0Sc402wg0QeGhcHMfDL5VNaoEwRiDfL2UkmWYMokgRxylpqtEqqzeqyCvmQf86HIZhDkilFPk677ouruNnEQ7mmOZYkjhSxIlGSI9SpY7SkpHRFVz9p+t49Wtexyc//VViBY7rLVpM857IMx0m93utzHryrPXaxvJbb6QFgcPAqbU+DX5m8Png94cda/DzduMt1iIrElpUKhWCIMjBm833CYIgv5a7urEsZtkeJvOFNhfDyuz/Nl9ofHycz33uc5xwwgmceeaZvPKVr8T3fY488si82LoN67U3g81psp7jYedcXIgWk2Ebd/F49nnxsfibuTVTm7xJ2xdRFBEEQV5nr9Fo8OIXv5ijjz6apz/96Vx/7bW4vt+z1GZFnONOGxeFKXkNr3/tyTzuMUdTrzioqIVUCWG7hedKVByZUBGtjadU6Yw8oHc93W63Z+DIQo/SNDYg14UobFHyJCNVl22bb+XIww7knae9mhXLTNhVyYe4HYKOQScIGeEHkpTUkBghSIEfnn817zr9P5iajaiPrSBME7xKBkKzXCHXdUljk+TiOS46NRug0GTnn/auIy2OSZo3oVKkVnkrFlMf1orfna+BKQUjJXm9WsM86KAiHxIPFaaUfUF7bhMTY5q3vPFUHnX0WhygHrjGH63BlT46NbT6BbLBf8g8MmiNL75efG0hI0zxnrffvTvr3z0pRS9icQ3UWuc1L+16aAGiZXAdvE7bV4PrKcC2bdtoNpv5Gllk57XeuaLRs1dEvldSptPpcO6553LOOedw00035YDHgmn7WWs9t15B6JWbsWui9ZoCuYJj9yjrNe52e3X1LBla0YNoz91ejwVa9nds/wRBkK+/5XKZ22+/ne9///tcccUVCCFoNptAL6/XHtuCetuPRWLBSqXCk570JI466iiEMCXMxsfH8/OuVqu02+08VLuYA2vH24YzB0HAWWedxe9//3tKpVIf025xHO05FZ8nSZJfn93fwzDkiiuu4Ktf/Wpm9Ivz2rYW7Ha73XysrH5jrw+MgaTVanHYYYfxpCc9Ka9/bkms7Ny8+zeAab6flX3RKRLDGO84GleaZf/d73wdJz35RBAJrhRMbdtKUHKyvbSLKyRSm7qVQprwW8dxSLSiVKqgNLS7MVL4XH/DzZz9zW8TxYowTnMdKs5qpFvjuA09TZIYpU1pISkh6rYp+S5T27dw2r+9mcc99hg81yjJUkKqErRShh9IZG2ASyBL21tUiuNt/7fzE0BKF62FqTGpwZHwqU99hZe9/JX89orf4ZVruF6JKNEgXZMuA+A4KCGQ0ukjRMtZwV3DOJwmEagUR4BEE4dduu0WpAnlwCdwHZIoJAm7OAICz0VixtGR9IFa6fRyy83cgyRJDXiTBjwpXNAO0vGp1sbodhVvfNNpfPjD/0GjmWRmAUkUmYIhdm3PoklzT3vWSWaKFdZJz/PQCpJY9enpfZF2KJRQaKFIVEyUhKSkpCg6cYfaaI1NWzZz2mnvZGpqBr9UIVGYnFLHoxtH6MQY/XWSILVhddZJgtAprhBmXiuTR4lKEWi0SgywT2JMeLp5v9Pp4Dj2+lRuULP6rwA6XcWaNWvYY489abc7mBQuSRwZnhHXdUFLVGJqt4sMpKMdhPIQykNqf4fnUvs4lJA6gNRFxRJSF1eUCLwKJT/Ad10T0acSUApHGn01icNc1/WCMsLxUEhcv0ScGnKlODF5v1pIPL/C5PYZPvu5/+bMMz9HkigEZm5HUYKtq4sQAwnc97zslKG8UFwYdqwjCsNDZod74PoXmmFgqRiGWlQ2is/txllUvga9toOW9vuDx2Ax2X333TnjjDOYnJzkC1/4Ao7j8M53vpMnPOEJnHfeeYyO6Ty8zCoYSinq9TpTU1NDreJ3RyEdpvQO+3+xvrXvb5vcyqpVq5ibnkEIzSmnvpDx8XFe8pKX8bnPfYYNe+6JjhM6UUilUqFWKaOBbtjBDSo4wJve8Bxmp7bys5//Ar8yQr1WzvJODFObKvxm8dKlNgaMOI4NFbxwSNKISslYMRuz0ywfq9NVKVvvuIUD99nI6ae9mZFSFq6kII00XikgiZq4ZQ8pBO2wgx/U6Srjvf3pz6/jZa94M+t234ft002arZBlK5azbdtWqrWR/n5BITJmP3OODorhIWP2egZ7unhf3F3RWueKn/W+WPKXKEnwvQqBG9BubcOtwvgyn3ed9koeeuhKk2vkayRJVhfNQWgXff+3x/1D7kfi+34OdKxYZWqxdaao0FoPyKCHzR7LGuHs/xak2HSL7373u5x77rmUy2WWLVuWE/ZYD2bxvIoK3yD/ggWTQog8xDQIAqrVak4WZK9tdnaWVqvFzMwM7XYbrXWfMTcIPKSUOQi0wMkqbRYYWhBXKpVwXZfNmzdz9tln4/sl9t9//xy82bSSpXhTAU466SS2bt3KLbfcwqZNm6hWDfOmZbIdZBceFFuKa/fdd+fzn/88L3jBCzjooIP6GI8Hc4rtGBXzdrXuhfD+4Q9/4Ctf+YrhYBiSo1tcHy1RYq1Wo9Fo9JXHOfLIIzn++ONZvnx5H0mVBW1LJY9aUIYs071ASlOf2nUErXbCv7/3HbRaHX76s1+ybGIU1xG4rkdH90oJuULma7WUEiE1SpgQ3JwQD43Q0tSCzEQVz0PbMhXGY7VsbIyZmSlazVnKfoDvSbZPbuG1r3kFT33Kk1g2ViIMU5RKqJQDc9/olIwB8O51T0HnK96TVhqNFrV61YQVx/Dud36Qc779PdphzNj4CjqhPQ8bnSPya9SofPyTJMH3XfzAOjcUvmtCeFUSE0YGJAWOAaNhN2Jueg4hhCHtKvvESUyn1UAps2akUlEOfLpRaPILXRetErqxMZBUq1WiTrcH2rOoKIVLFmBLUKpRrVb59Ge/wC233MKHPvR+atUAzw/yXTTVMWnaI8XxsrqnKk2RrgOFUN7+4cj0DGHDrVVmLciqZApNN+wQ+CWcbF6Vy2V+85vf8Jcbb+DW22+jWluZeXF7RiRjF1HIAtjX2rjRRWao0DpBpykqMfeSTnXmpTRrj0TT7SY4DtSrFdwC8I6iCN8z6U86S2Qq+ZJSAMuWjRHHEa6XUK2WiZUhJEriLExZKnSa4nqSshfQaUa4wsF1bD1ggSpEn7Q7HVPD3vfx3Kwkk1IkoYkmSNIoxxrG6KWIYzNvPc+h3W4xMjZKGMZ0sprQYMoJKiRB4JOmCY3GLLV6mYmJVdx2+y2c8+3vsssuq3nKk0/AD0pZWHxh70oNX7Zw7h1daqcFpkDfpjufIrwYMB22bs2nbMwHeizotMDULmbFvBO7OQ8e7/7gNVhM9txzT77zne/wpCc9iU984hO4rsuHP/xhDjnkEP50zXV9lv6xsTE6nQ7NZnNei+4guF9IFhuLonI4bHwW8rACfWUU7Mbz9JOfgVKKU1/8Ej7xiU/wwH32oexIEIJOt0WpVKYU+CQaKi6UXHjHv72esNPiot9cjldz8F2fuUaDoFJHIA3wxMw3IYTxJkKhTqDC9x1c6RJ2mqBSRmse3dYUKm6zz8Z1/McZ72XZqEvZN0t6HKWUPYe0E+JWS0BKGMcEQZUuAikF3/3hFbzr3R9mbGwXbrl1M2MTqwhch+np7dRqFXIW3fy8+u8ZgcossGbMeqz09noKNc76rJ7Za6p//NTAdBeLgMQ0TQi7Kg8591yPcskQlKhGFyJjHa8GkHan+fcPnM6hB0zgAIGvkKQZs6ODUFnNtOyUdC8d6h/yN5adwShnJQgCxsfHC6GFSyf/sOui9UIOrn2DUR3F51bCMOSb3/wmv/jFL/Lj2FJUNuTMRvEUw5Kt56/o9bOeuX322YcDDzyQffbZJ/eelsvlPAfWig1nm52dZXJyks2bN/PXv/6V6667jptvvhnXlXnpE/tb1nvaKwjv5L9tyfaUUtx2222cc8457LrrrtTrdYAdfnsxr+D4+DjPe97zOPPMM/OIGOhF2iwmSZKwfPlyNm3aRLlc5nOf+xyveMUr2H333fv2bwuwLVDtRQSJ3KsbxzHXXnstX/rSl3LP8bDzL+5FZt033tFSqYQQxkNz0EEHcdxxx7Fu3br8PK1Safv5nmDmHZ4q1jNMpmmKdFxqFZcwgo9+5P286tVv5Je/+DWdbodSZQSJQCUxqTZrtNQKpRN8r7SDMUbgmFw5nTkyhcgJVkSGGiy4AIHjeczNTBP4LikpUqTMNbbz3Oc+lxed+lwmxkqZU1RRCrzsnE2/F5b6HS9yiTlyFjhCf76xrS1ZKldBQzeEj338k/zPN/6XZqtLpT5Gt2tIH0wOpQ1rtT2sQEMShozWq2it6XRaRJExGGlMxJHjCmrVgFKpjuMKKqUqExPjLF++kmq1zMjICN1uly1btnDLLbcwNzeHxuSOzzVbTE9NUa7WKQVlU4JHaUq+uf9mp6YolcqIQi3xvFKLMHnGnSgCFVGu1PnBD39CpTbC29/2Zur1MqXAzBRHOghEFjpLXx9JdlwntQatB416RVBqz8esHXES4ToeURIhpcONN/+Vq/50dR5FIIWDKwTSevJM3DJSCMJOOx87a0yz92qSJlQqWZgwCimMJ1eqGMeBUuAwNT1JksZ0Q43rQOBKBL6JGlOaRMUI6SKkIIph1aqVjI5VSZVmanobtVodlMJ3Xfys/mm706bbDIkRqESTCoHjuHiea6Isyz6+X8mNB77vUi6X8bN8zziO+0J4JycnmZ6eJU1N9J1EZMYdh2q1TBR1abc71Go1tDZ1diu1ERqNBqIkidMEv1RGOj7tboSUPptu38oX//ssNu6+kSMO3xfHEcSJwgt8yDza9yZ2ud8D04UA5yAwHfbZYQCo+Fyp4QrSYoCo+L8FR8VcVPvbxTAd+93FwPT9SSyRxvLly/mf//kfTjnlFD7/+c9TKpV43/vex/TMHFu2bMmZDmdmZnLSDWvNh+Ee7TsjSzUWDIYSLuZhtWQSUprntmj5U57yFK677jqe+5znc9bXvsLGjRtJk5hyqYxGk2SKSqoFYVuxekLy76f/G695/dv4/R+vRXhlykEZpWM0LkIJlLBeloz2kMz6pVUezhR1WkhSfE9C0iFuz7Dv3nvwsY+8n4lRj1oZ0BB2ulQrJVDg+B4ohXYkiXYRGIbFH/70ct79njMQbg0IGBuvobVmZnaK0dE6sUpRqd0EZGb7k2idmsUNmXlQDXmTNug1A3cDFrRC396Zeb3YPPB9v6/Wn12M4zhGpzEumgBB2dec8dEPcvD+tWxRS3ByInfRI83Q9Iiodh5stFPLsHtzZ1j7oOexHx8f54477sgBwZ0Jo5wPmEJP2Y2iKGd2tb9h++rSSy/lvPPOQ2vNrrvuyuTkJO12O09DsOUXimRGRS+sDbGt1Wrsu+++HHzwwey22255juVg2HExn9NxnBywrl69mv33398wY95+O7fffjvnnXcut956K3EcMzo6ShRFubfUGmctGLVhrUmSUK1WKZVKXHPNNXz3u9/lX//1XwH6woWXMkeiKGLVqlWceuqpfPrTn2br1q25Z2WwVM4wKXoswzDEdV3+8z//k7e85S3ssssued8UPdm2j2xosB23a6+9lk9/+tM54dWgMXqYMdWeg30tTVP23XdfTjrpJHbbbbf8nKwH2Y4n9Ora3nVRIGTGVDuwGGqZ1TY1YxHHvZqZ73/fu3jjG9/KeT86H9fxkdLt7aM5sFQ4jmDQYd0DqMZIqYtlyIoAVQNIhFKQmrrZY6N1br/trzzpxCfwute8nNWryrRbIaWyT5CBUkvGVYxQW1gW/8zgeFljshQujjSe0h/96AI++/kv0g0TJlauodkKka5HkvZ0QUsgWKyh6gcus7PTxHFIvValXCvRaswSBB57bNid/fffj/3324cDDjiA1SuWE/h+RsYjcV1IEuPJi2MI4wiVwkxjjmuv/TN/uuY6zjvvPLZs3cb09KSpR+ubiC/X9aktH6fV7BTu/cK9ktXb0UoQlGqgIkZGl3H2N7/NXnvtzUtfejLtDnheSuCa7zmOGTfDv6Nxc8ZsycL0rTvyV5jnjtEpp2eRZQeBJI5DyuWAarWO5wbMNiKkSMGTWTiuRugE1xF4nqTkBSRpRJJExGGHGBDZ/Ch5Gh3HJGGI63r4boAmptNu4TgC14Fl46MsGx0xKVZRiHBL5t7PdDnPkXS7Ea7n4wgYXzZKY26KIBhhzeplWX6nIomaNDsx6BTPE4wtq1GrVBgZGWH5imXsuWEP9thrT/ZYvzsTKyeoV6pIT+I7vnl0XetEJkpSVKYHzc402LJlCzfccCN/uu5arv/zX7j19tuZmZ4jikJjCHJcAs/NDYJJIkiibrZfZOuLZ1KkkihifGIVnpPyp2uu5+vf+BZr1ryCdbuOowtjmNnkMk/0Pe81vd8D06IUF/aFgOmwUNvBY/SOtaOFetjn55OiVbd4TtaqOjo62ndeRSC7M0ipVEJrkwu5evVqvvKVr3DSSSfxoQ99iD333JPnn3IKWmuuvvpqdt9991yxKPbzfNd7Z/thoc/O5zWdD7Dm56YUcTfJ2R/Hx8bYtm0b9WqN17729bzjHe/gda99A2d9/WvGYpUar0an06Ze8/GEJnBTHCSrlru87/TTeMvb380vf30563bfi9lWBEKhtQF+in6FS3ouIsrqfSUxYbfN6EiVsie5Y9NtHHrQ/rz/vW9nvGZAqQN02h0qVWO5AgGeJIxSdCLxghqRgh+efzln/ufnaTQjlq+qsW2qQX10Ga1Wi7GROs1Gk1KljNaFMN0sVwQyi7bIeCQ06EKBZ23HTkAxK7/PCJSz8fZrJkL1L2J6kUQfrcH33ZyYpKfAS6oVHydqIaI2H/jgezlk/xpCmULxJpQrUwa0DaUaOPY/PKb/kEXEgrx6vZ6DDLvmL9VjJYTIw/Xs8YrHt+8XAYd9fvPNN3PuuedSrVYB2LJlC9VqlTAMc6+pvTeswpzn7GXALE1TNmzYwLHHHsshhxwC9MriFM+juL/addyesyVGskR5e+yxB+vWrWPFigkuuOACrrjiChqNhik0rxRRFO3Ar2DDbG1uZ6vVYnR0lMsuu4yjjjqKPffc0+RDeV7udV1sf7Cgbvfdd+fkk0/mP//zP/sYiBf7vvU+z83NUalUcjD/3//935x88sl57VUbim29o3bs7ePNN9/MWWed1eclLnqsbb8OGmZ83yMMQ+r1OjMzM6xfv56nPOUp7Lbbbn0hw3YcbekYG753d72mgx5Fa8DL10VhchF91+Sj+RJWLS/zjn97A83ZGX73h+sRUuAHPkJmoA0NQqPThMFUKbTI9w4DRbMQ9IxUp3dixmurbWUDHbNt6x086pEP401vfB1r1lRQCZQrAUIr0II0SUh1koVYQpT0z/G+CxZ9DwtKUbe096sQAinM/vT7313Phz70UdLUoT4yQqsZGrutdjNvpDTnSC+Y10YadVpd6vUqSnnEYQfplzjk4AdxzDGP5DGPfhTrdltDrWy+k6agYvJ8xySBSsY/WfKhqnykhBUrlrNh/XIe+U9H8a8nP5XLLr+CH//oZ/z28iuYmZkjJSWOOjRmZ6hW6xgDtPFmK2HHXAMS16/geg7btk6zYtk45coon/jPT3PIoYfz4CP3AuWQqhidZlUypMiAqTIMuMWu18VmGJwlQ6IWBblhRKcK3/UQWuK7lixM4rllZmdnmVi2mm63SxKFuK6D57qkShNHHdqtkGq5xNjYCGvWrGH16tVMTEwwMjJiojx8hzTuMjMzw/bJGSYnp9g6OUWz2aTZbDI3M0mqUuKoi+8LpG9z8mNT2khKUGSeWKNP7LrLSpaNj9BsdZmd2Uy73aVWq1GvVRgdGWfD+t047LBDOOzQg1m3bhdKZYlf8qnXamZcsymaJClRElIp+b0uySZwSYPQLiBZuaLMXnut5GEPexBKPZEtm+f47RVX8IPv/4gLf3kRk1NTVGtjVEolWq05XMfDc1w6rSb10THa3S5B4NFtt0mShNH6CHEc0pprU62McN4Pf8qxxzyaXXc5Kq9VbEi37M20tMihOys7FTAdlGLMfxGszifDPGnzeUwHP7+QWMuo3SzsJhLHMatXr85DcIrnd2et7veVWAXGKhnLli3js5/9LCeddBKvfOUrqVTrPP3pT8tDvHbffXfK5TLNZjPPhZkvZPmugPPFwOliwHQQoFoFwp5jq9VibGwMoaFWq3H66e/l7W9/Gx/5yH/wspe9JPMeONRrdZOLoxWlIKthqyTr11V5x2lv5Q1vfgd/vPZGyrVlmKya7CYWJp9Ca9BSEHVTqtUq3U4LoVKWjY/QmJ4kcRQPOewgXv/ql7Fuda1Hga9SatUASAmj0NCdx+AHHikmm+NnF1zFxz/+eW6+dSvLVq5hamaaarVOqz1HUApot9vU63Xa7bYBxHmmBAWgajynwr4jIEVjyzrbOqt9qUH3gsfUklSBUdgtqViz2SQMG6wZdXjLa1/DgfuOo2LLypjiSYckifGc3hJnw5R6HlPrUf2H3FuykGHKvHcfnNSdEDuXS6VSvsZbMDDfulaUIiFRsbxHL5TTgB2b11kEGp1Ohx/96EfccccdOVFbryRAjyzIgj3rKQTDRm7DP0888USOPvpoyuUyYRjmDOw2fNRe52D0g9Y6J+sZDF22hte9996bVatWMTo6ys9//vM8j9QCZZsvap/bcGUbnTIyMsbMzAwXXngh69ev79sTi8RP80mRtOqBD3wgL33pS/n85z+fEzYtxqxriXZMTVGjRCql+POf/8x3vvMdnvGMZ7B69eq+PN1iiSHf99m6dSuf/exnmZycpFqt5kbOHUARO66NlnW50Wiw9957c+yxx7L77rvn4+v7fr4HWyIuq1/8LaIOojDEDwK6HfMoJUSJZuOGXXjjm17HG974Lm6/fZJWq2UMCWhkppfZ0hXFENZ+MeGb5v1e5A5YEG/GNwo7hN059t5rD972lrew1wN2IY01aBNmrJQ28T1SYhVljR7a/3dWiuRHRVAKkCrYdEeTj5/5Sf549bWs3XU3otjUvhwdnWByaoqgXMmPJVGmXI1Os6vUjNZrdLtt4iRkw4Z1POmJJ3LiCcexxx7LkdlvqJSccNBzHeytKAXEYYxwJK40r6sUUwbNldTK4MoaJz7hETz6UY/g5xf8mm9+83/5zSW/JdUJK1dN0Gx0EFlotU3PMWzNMrteyfRsg+UrVhN2O2gk26dmec/p7+Pzn/8ka1eXkDgkaRZhIR1cF6JQsRBoGeYoKIaQ2//DbkStNkKz2QYkQVCm3W7iuJJSqcLk5Faq5QrVcolOu8ns1DaWjdU46sGHc8jBD2L3dbuyYuVydt11V1atWkW5bNJ5lDI8jo5I8X2HNIHp2Q5zcy1mZme56o9/5De/uYit2zYhbYlVAWAiFnRq7g0pjdFcaMMZMjpSpV4NSJII1wt46EMOY7/99uPggw9k44b1rF65kmVjPhKIYo0XCBQJWsWEUYjUEuEKAtfDc31U2kVLYXK3sx7SwuT/CgFpqg0nZZriuD5rdxlhzS6P5ID99+eEEx7P/3zzW/zk/J8TdrrU6qO02128QFAuB8RhF88xxHEiM2jGcUoca1zXA+ExtX0bV19zPQ97+FHUa0ZlUkohHdlXMvCelp0WmNoForhJDAOnw8BofxgNQz877LVhG4G1aBY3USFEvjEvX748P85guFTRs3h/FWvxtectpWTfffflq1/9KscddxwvfOEL2bBhAw996EP52c9+xi233MLatWupVqu0Wq38OEtR4obJQl7VQaV32PgO+7/4Whh1qNfrtJqmxmAcJjTmWrmS53o+r3r1a3nb297G8uXLefFLXkQn7FIKSnTDNr5Ikb6PFOAIidKwYbdR3vve9/DyV76B7TMd0hzBZR7OApwzCp5RWgMHPEcQeJIHPXAvXvLC53HQg3bBFcZSGich5bJHmoQ4rovvu8RxhOeVaYUaLQS/uOjPnPmJL7Jp0xy1+nJa7ZBEpXhlB1zF3OwM1eoopCacx4BPUz1ViCzHFJOzU7Smaw2IbL4Km8OQ1VKj4C3N+zb79kAd0yIRAoAc4sksiuO46CQlVQoVJwhf0240aTebrFtd46UvejKP+ae97GkitAk/E2DKwejMKCBU7xzysbj3LH7/kIXl/r7uWbFhuFbRtl5EWDow9TxvB2/ZoJJbBD6WBOiSSy7h0ksvpVwuMzU1xcTEBBMTE2zfvr3vPCxYsWVams0maZqyevVqHve4x3HQQQcxOjoK0BdOXK1Wh15DkQl9UDEv9ovneXQ6hg33+OOPRwjBJZdcQhiGlEolOp1O/jv2d+2xS6USlUolBzRXXHEFhxxyCAcffHC+V9r+XkisN1cIQwZ0wAEH8JznPIf/+q//ykHdQmK9jjkZTBQRhiEjIyNceeWVrFy5koc//OHstttuO0RlpWnK5ORWvvjFLzI7O9v3W9bjPEi+NKyv6/U6o6OjHHfccey3336EYZiz/lvSKGvwtkDbgtW7DU6FtlQz9oW+WoW+HxB2Tdkh6ZgSF15W5/TII/bnmc98Jmef/f+47jrDNWGWU0O6J4TupVNYoiNt62fafuy9b0iRNDZk0Mw5MwfWrl3LW97yFvZ/0J4GsOkY3zfM8SYP1kFImZPkRHFM4Adm7y3InXUFFCMcivMxiiJm5zqc9dWz+dGPfsru6/ek3QlpNJuU6yOkaUqlUiPVauB4hvXYllqbnWlQKvkc86ijefazn8XDH/YgHAfiEJI4pFwJ8BwQjoCMSEgphVCmzrkfuNZiDcLUo3WARKUkCZQDh06oCUqC448/io0bN3LWWV/nhz88j9tuv5V6bRxTMdP6ci1kBoThlCiVKjTbXSqlgDjUjE+s4trr/sL73v9B/v3db2BsJMDzHJKkP3pKKxCDt+/Asm8BndUxVOYtzc9DGw+sVoI4SinJEq40xEvVchnf8em2WzSjDrusWcXBj34EDz7yMB5y5OHs9YB1+G5v6imVeZ3R+J7AcUxOqVYatKRSchkbWc4eeyznsIM38oTjH8P2qS3svfceoDVJHKHSlKBUQkiJHwSgjXczTsAvOYyM1Fi1ehlHHHEojz3+8Rx60MHU61UqZfJKgHYO+k7GyC41EoeyX85Iwsw56YwkTGiBwDDvWi3L6GiaVEcEvgd4RFFMsxHjegHrd1/Obrs/jFWrVpEmmt9c8luE1LgZzbYflGi223iBTxh1qVfquK5LY6ZJuRIwUh1lemYbQVDmyiuv4pa/3sYD99kVKcn4UnTmbLl3nGv3f5fdIjJYx2y+2qVLacO+u9hxB98rUr4rpXILtmUb3NmkSFxhlYo4jjnssMP48Y9/zOjoKP/8z//Mn//8Z4455hiq1Sq33XYbYRju4BGez2u5kMwHKhcDoYO/M9/vlUolU880y2VUSuVWbxtCteuuu/K85z2PT33yM/zgBz/E90p0wy6loIL0SqRZEXDXgbCbEnjwwD1qvPO0NyFp4+oQiSnnIrU5FyUk4DI6OsbU1BT1SplqJWDT7TfzwAes5+UveS4Pf/AeeAApeB6USwFx1MVxvQwpujhemUakcXzBhRddzX+c+Wn+fMNf8YIKWjg4jke1WmVuepo0NbldaWoKPQuVMh9n/g6vClv+RaNtGZhsgYQdS2cMHimvEV14NAQYpmxMXsNVmMR6IxKRkTBIHKqlAI+ENJxhr92X8+Ln/TMnPeFwsxGHpsyNK6DbjQzDnrZGgB4jpMlp2vnuw51ZhhkHdxYZTL+4s2VuFooWKb5uDZlWJicn+fnPf55Hc0xMTBDHMVu3bsWWO7Hra1FxtjmeExMTPOQhD+FhD3sYo6OjeW6njd4ZrEFabPb4tgRY0QhcNARLaWqmTk5OMjo6yhOf+ETWrVtHo9HoO8ckSeh0TC5bsdSCJRSq1WrMzc3x61//Ou+bbre7pDqiFqC5rpv31YMe9CCe/exn57npC4n15LZardyIUK1WSZKEer3OeeedxzXXXEM7C3Wze3gURbTbbc4++2xuuOEGms0ma9euzYn/RkdH+wyz0A9KiyC3Xq/zxCc+kf322y8vP1M0dltSJFvSx/b9Ugm47pIUwGkQ+Hi+SxIZUGpwUILW8MIXPJHDDj2QWjUwLL0iC3FXIlt/JegszjGn5bVl03ZkLB4UlSSUfI+Xv/QlHPWQI0FBnBhQGichQvYIw8IozO8rKWXOLFtsYqAtJrkOo2zet/m33YmZnJrj+z84D+n6zDVaKDRBucz4+Dhbtm0zl5qlkwxXtBWBLzjppCfwpje+hkc+4kGkMUShphTASC3AFaCVQqkk2x8FQmgDwl3LOmyKkyZxSJoZq1wp8ByBShTlwJxD1FU8cO9VvPlNr+YFpzyblRPjCJJ8Xx8mcWTuoZLv0+l08H2fbidEuB7f/s73uPIP1zLT6OZsDgbQZnqjtC8Url4UqhQITKxWzlos+g3V2hhiOp1OHuURxV3KvodEMbN9K625bWxYv4rnPvtfOOMD7+aDH3wPpzz/JPbfbx2+B0msSROD26UA1wXPzUKIFaYmrwQ/kNRrnokI6GqSBJZNVNl77z2warstZQTk/dztdnA9B9eTxFHCPnvvzrvfdRrveue/cfyxD2PliirlEujUeLPTrFlrkOO4OMKkJomsDww6d5E4uK6Pm9UFzvN3VU+vcRwHldW09X2Xer1KqeSSxppOO+Www/bibW99HQcc8EC2bL6NciUARzI1M0OlUssMh2WSxBjkarUaADMzM/heCSFdrr76am666a/Y5VQIQao1yb2IZ+73wNRu1q7r9pEIOU5Goez7OK6L47r5cyEl0nFwPS9/b1iTjoN0vL7muP6izfWCXnN9hDATyPMCHMczk8n1SVOdW1HtRmLBnQ1BGibzKQx3BtANO+Zd/V4xfMmym2mtOeigg/jOt/8X33N4xtOfxp+vu4bHPPpR7LJmFbffdoupo6VTkjikXqsQdtumvmdqksC1MnlLxWb7p9jm64fiZ4qhYsXvDLuW4v9JrCgFlV5YnANh3M0fE5Uw25jhxCedwOOOfyxf+cpXuPbaaykFJTqdEPBQytT+AkW94qAjRdmFo4/YnU+c8Q58mjjJHLWyQ9RpI5SDxiOKIIoS6rUqaRIyueUWjjhkb05768s5/KCNuJjFVCedrIZogueXAEk3TEhxme1KhO/wvR9fwQc/eibX3fAXKvUK0pUo27+JxvfKkNg6fJqEECVNrS9LxmAAswnZTYUyjRSFWUk1qSm9QoJQEULFaB3TV3N0aMsqRKuBx6wFvkOahLiexiu5xGlMiiZONVq5COWhI0XVcYkbW1g7Cm95xb/wzCcfbPoITdl3s9xSTSkwG4xJAVE5wQaQWSBNG8YYeG/KPXUv35+k6EEqSh4hAsjM0mufF9v9XWx4rc13tHtQMSR30BhWfO66LmEY7hDJY9crq/gWjw/wxz/+kS1btuQkQjZfcRC0eJ6XE9QVP7PXXntxzDHH5IpUkZESepEwFmjPlwpTBNDFqB8L1LXWLF++PM95PeGEE1izZk1OymTJhWzIsDVYFj2xYRjmAHfTpk2Lgq7iuRbJ0WxebRAEHHjggZx88skopfIQaPtd64EserCL/Wz7xXJEfPOb3+T888/vC7VuNBr87//+L3/4w1UI4VCp1JidbRAEZYKgTLPZplSqZEylLnGc4ro+juORphrfLxFFCSMjI5x00knsv//+dLvd/LptuZriOPi+n8+TpeTfLtRvvbFWeYipbf1fAhWbF13PodvuoHWK60pUkpCm8Na3vIoTT3gs1YoLaYKHi0glDgFS+0i8rDk4Ahw0rszqjJrZmF+jqfJtSr8olVCuBJz+nnfwxCc+nqBkvFwSnddszAJ5TOhu4JswTTSu4+VgWPS1glFU9zyXYIGSyJu5fEHYbYMQeG7GqtpW1Eer/Pinv+DaG/5KUKnhlHxwTBjm1NQkI6M1Q8SEIIpiXMdHpcbQKl2PoFSi021ywvHH8OJTns7+e6/B1VAtQdkzwCmJTTSTGSsHw2QrzAVn/5uUG/Oa4/pIx8s/JxF4rgkz9QTUShJHwVgVnvHUx/OylzwHrRI81yUJoyz0WRJGMb7nkSYxviuRJOg0wndNlIZ0HWItcIIaZ/7nF6nXKrS7GuFKENk9nhEhocCRJlRbCYVwINEKJSVC+qSZiaLo2ZZaIrW518IwxPFctFRoYiQxUiaUnBSZtjjikAfyzre9ine9/VU89CEPYmxUGnbdrEqPGwikURIMn4UgA/bm0fad1jojhYJSSeC6me6lsugxbep+SsdDKRCORGmFX/JQOkGIFNc1RoQD9n8gY6PlnGjYGiYMwaY5L40JJTYZUSIrD28eNTL/P0nJm3mv991UgRIeSrgo4djK8AB4nqBWMTfYxj135dQXPpdddllFO2yb0O9SlUYnMkA3tcRumlhFxoPuOihtuA62bNnC5Zdfjps551WscIWbEWTeO3K/B6bDwnKLwGPQoznMg3lnPKQLfXaY53S+1+15/r3LYYcdxhe/+EW2bNnC0572NG677Tb23XffvI6pzU+dnp4mSRLa7XZO1jEsB2QhD+kwD+gwsDns9cV+Y773hNDUajXuuOMOnvrUp7LffvvxqU99ijvu2EK5XKbd6uCVTPC9jhOajVkCH6JOh8CFBx+xH29/6+soeTC9bQvVsk+9WiHsGGUy6nYMq13aYf999+T1r3kpe6xfQ+ABKoKkgxu4oBKQkqgbE0WKoFRh+0wbrwTf+cFlfOGLZ3H7ps345VKmfEWoJOnR8lvrdX5hdkPesYRR3/99a4/ChCKpvA2+N1wyAgz704V30jQGDINjGHZoNGZJVYxfCjLvjkalCbWyh05arF5W4R1vfRVHH743OlY4uedVL6lg+j/kH3JnpcghYGUp+Y/2c9bzV9wbiuDAGteEEHn+9KZNm3bwuA2Tbrebn4f1LqxevZojjjgiL8GykAwaBpdiKBw0GkIPWK9bt44jjzxyh/QWK8PAkfV2Tk1Ncd111+XAcKlS/Kw1ZFcqFY444gge//jH02q1cmbbTqeTlwgbtg8MywH1fZ8LL7yQH//4x8ZrE0X86Ec/4te//nWfF3lYjq4NJ67VanQ6HVqtFpVKJffIPu5xj2OPPfbIyZ6K371fSArSE0ShMbCXyuXc+21I6aBag9NOexMjI3VmZ2czkqzA1I7WDsOI5/I9IffMDt5LRquvVAzTv+tKwjDJAX6apnh+Vsx72NczyfccC7r7XHv2zd4+pqzDyorW+EWeAg04kuv+vIlf/PJiAwSFk9Urzwwdsn8emXEVOYGY0inT09Pst98+/OvJT+EBe+0OWhN2O6RJgkpjk4rizLe+2AigHR+HiVYpUhioHYUdup0OK5aP8i///GSOf9xjstJxNVqtVm70yEPFC8DKDpb1cCocrrn2Rq6+ZitByZxrnIQmPU5nBo28n3tRVsW+1qKnRSjIjQdWgqCcpSfMoVRCrVZhavsWOu0GDzvqCN512ps45piHEvgC11HITOFROspznPsHfPCxr6eGtDurwyuEzhq2sYN73s5XSy4JJkPKNscx428ee4RXg80cuEccprWpxaqVQqUpcRRS8iVHHHYQJzzhcQSuye33/VJuLJzvOhQZuZyUNBoNWq04A9h2P7v3DPs7FTCFfpBiNzVrDS624mv2+eCjfb6UNnj8we8PHrdoXf17l0MOOYTvfve7dDodTjjhBIQQPPShDyUMQ7Zt25bdCD6jo6MEgSHfKZVK+UI4DFzO51maD6Temc/b14synyIQhiY8qFQq0Ww2eeQjH8mee+7Jpz/9aW699XYq1SpxFIEUJFpRq9cJu10Twq2g7MPxj3s4r3j5S/E9ATom7DYpewKHmLIviLoN1qye4NWvfAkHH7gH1ZIkiSNjYnNddByDNNbMOAHPd5lrR4yNVfjJT3/Pl7/8VX7zm0sRwiEISsRxitaD3g8DHIXqp6s3/bKj5zS/x7KNaaG+6+9H6z0d/MzwEFrHcehGYVb6ILuPpPGght1ZkqTBWF3SbU9SCRTvPO1NPOTIvSn5pqj1P+T+IUudHzubWOOnZbi1bankMzYvreghLDK5F/cyK9dccw033HDDvJEfxe9ZUpxiSOs+++zDPvvsk69dxc8Prpvz7WtLbTZCxZQeMEy8Rx55JJVKJff4LeSRhR6xUqPR4Kqrrsq9hUuZR4N9Z4mWwJDXPfrRj+Yxj3kMaZoa1vXx8TyPtBgqPN9YRlFEtVpl8+bN/PKXv+Syyy7jxz/+MRdeeCFRFPUZpAc9y0VDuv09C1CDIOCYY47h8MMPzxmXi9+5V8N0+6SXzzdUXJND57ouaEiVzkIAHbrdiE5HoRV84AMf4frrb2DDhg2Zlzwm0Qla96d5KEzZNK0ctBIL/zYwOTnFl7/8ZS6++DIc6RIEDlGU4HoBYTfMQW8OBoqGygL4yCOJ70wcL9n8ysM3zf7lOvC7K67k17++GN8P8ugDrdhhjpt73eTKKp3gusYz5QcuT3jCEzj88MPyNcHev8XfviekGIlhIy4AVqwY49RTXsAD9tqYqRoZ4aEEpdId8qMpGLe11qAlW7Zs5dxzz0NnBvBiOaPBcxguC+vINk+9XC7jui7tTpNqtczjH38cb/u3t3LwwQfl0ZQ26g3oS3W4d2UwWLzYrGS6TyFdSUvThI1AI0GQ5s1Gm6k0LrSoryVpiIPCyaMeTM15KUxzJHiOBK1YMVHnsY95NJVyCZmmlFyHuLtQqoO5Bjuft27dyvbt28070niLxf9lj6mVYggRkIeV2rjv+UDpQq/dGWC6FJBq82qKzLx/72LDtI488ki+9KUvsW3bNp7znOcgpeQRj3gEN910E9u3bydJErrdLnEcUy6X8/5ZDGDek634GwtJ8X3P82g0GnmelOM4HH744SxbtoxvnH02N950M57vE4eJseDSUyrSNKUbagIfnvKkY3jFS09FEKHiJmVf44sQqbusXlbj5S95AQ97yJ44AhP6k4XFGF4IE//RaoVUagFhCn7J51cX/5GPfOQ/uOZPf2ZsbBn12ihxlOa5WzlhidI9sxyYwBmt0dhkh/n7Zb6+6wHX+UNTFx+TFMczCq3ChqoFgELFEa6TUC3B1q1/YeVynze88UUcfviuBC6E3STLGfr7AUE7u9yvPD33oCilaDabQxTO/rIvCz0frGdZBKbQC61NkoQ//vGP3HbbbTk/weAxi2I9kzadYWRkhP322y8vJbNYxJBV6O5qK4pNW1mxYgUrVqyYF5AWX7Nzxp7Pli1b+srcLCY2n9D2r133bAH6er3OSSedxEEHHZTntdo9eqFjWrHnMDY2xuzsLN/5znf40Y9+RBRFrF69el7Abf+3a3EURVmBezOOD3nIQ3j4wx+ehxlbciir5ywVmA/zQC9kBFhcMk9RIa7XkAsJ4jRFK7PizjVaeIFPUJJ84IxP8clPfxY/KDM5td2Eeqph90emsOt+L0/fr+fXLNEKXM/jqquv4SP/8XE2bd5iQkaz2MygVLvzV1dIde29KHtvDoiQ2rqm8jmmFFx//fXMzc1lhiGXvMbjkB+wxhvjAXMIow577bWBR/3TI9C6VxfVzsl7cg21893eIzbUP01Tms0uBx60nmc841+YnZumXCkhpM6/kyRJgcG+H5DasQuCgB+edx633GJAi9m/AWE87YOSe7DnnZ/Fa5d9Dowkjel0OjzmMY/hDW94AwcdtBciCx2255L/jpifNPOelYUAKfQM8gpE0muYJqTOmwloNvmiSiekKkY65M1xRV8zaXEpqTJxvlrrAlQ0yqPjOMRhhNCw++67Uy1XcB2BUCbFbrH1w/bhHXdsYXJyMs+3zctC3Yu9utPIICi1ORcWLBaB4d21BA/ziA4DuXZjtBurZdMrbpZ/z2KVn3a7zZFHHsn3v/99/vCHP3DqqadSqVR45jOfyaZNm9i0aVPOMtjtdvvq3MHCnk27sA8DN4vloC4FoA4+Fn/bjqctID81NcXc3ByHHHIInufx1a98jds33YHn+yRRSrvVygpLK4TUlAOTL+J58Mx/fTzPeOqJeDLGIQTVZFnN5aUvfBbHHbMvTua1LPtOBhoxi44ToBR4fkCjbVJMLvntn3jnu/+dG/7yV0qlCrXqCJ1OlyRROI6XK6sDF5Qf13pIe/1gFk+h0qxphCooKFr1wmVVL2y2F9qbkUtkYFXoFFHwxPaayhsYZVY4Et8rEUcpSZhkuT8J1ZIgDrczPiZ4xcufyWMf9UCSyNQprZRcVPr3B4J2Nllo8/97Aantdpvt27f3KdrFkjFWhq1dNqfR87w8j7HoWSse0wKqLVu20G63dwBP8wF/GznUbDbxPI9arUaSJJTL5RxADobo2tfvimF20Ehrr8H+ru/7bNy4cQfyoWHKqPX22jDmMAxpNpt3anxsHmuRGMien9aGcOnpT386hxxyCJOTk7nuUMw7LT4WzzcIAlqtVr7Hb9u2jTRNGRsbo9Fo9I3N4HVaL6rjOHmIdrfb5cgjj+TYY4/NGYGBfJ8pir2ee1WGIbWCZyeKOgRZrTIpHBwPogRSbRLOvnXOT/j0Zz7PyOgyqvUR2p2QTmRYjaMkzD1DJm/OEiK5oA0vg6UayHMlC4+G3MVjZGSMq6/+E5/65GfotGNcx+TX5V0uivucGmiDcbvZK8MA6nyizI9Jaa556+QsN9x0M5VyDUcWmZFNDqlVq4UQ+I5r9lGd4koBKiXqtDnqIQ9m3bq1OE4vcgF6pGRwz3jNrWGlaISyUsmKoB732EdTr5Vozs3iO6bmqnD669Hb6zPjY/UlQSmocNVVf+LGG280+b5ZpGASxyak1vZ9kech6y+5hO1BCFPhwvf9/J5du3YXNuwxTqdjgsqKnuai5/SuGWbujMiBnOXe64OihUILnTdEalrGRI1Sue5kdSlHCFSS5E2naX/LxsHoZKLQMkeEFpAZPLSGZeOjLBsbMUR4cchItZLX183Pe0jNdykl27dvp91u5/fcvd23OyUwhR6Z0GKhvPOByju7+Q7+zuBx7cb1f81japWPSqWC53nst99+nH322Vx11VW8613vQinFySefzE9/+lMmJyeBHpgtWonnA473pvfU/k5RBkFqp9PJSy3Mzs7mz6enpznkkEPwfZ8vf+mrbNs6iet5VCp1dOa98Bw3Z3/zXagEcMpznsGjjj4SR7dZMVbhOc94Mk994pGGxEeD1KkhZMg9AF6WMwHSB68Mf7jqVt7z7x/k+htvZaQ+jueWaLc7dLsRvl8CLTOvqztwzbaOmspb8boX8noOe47acawGZbFxSJIERxpCgXa7i0RQ8UtEnTlmp7ZQLSte98pTeMKxh9DphIyUja3dFWbh/ofc9zLfuP+9yMzMTM6Ga4FEMVVjoeu3itWyZcsYGRnpIzyyUjQidTqdPER00CM5eGx7fKvYep7HHnvswYoVK/oIgez+NOz5Yjmmi7U4jgnDkG63C5ADxNWrVzM3N7fguUOvXIt9PUkSNm3a1KesLyTWS2sjp+yxin3c7XZZsWIF//zP/8whhxzC9PQ0zWYzNywXZRCkWkOC9Uj7vp97srvd7lADp/2+HXs7bxqNBoceeihPeMITKJVKueJv9YXBY/xtQhHzM84e+oGd77sgFN1uhHShG5mSJPWRgB+ffymnn/4B/KBKnMDUzByrdllLN4wyAqMhhnkt8xBeqTNWGubfh2dmZhHSpVyp8c3//X98+zvfoxMaYpp2JyZXppcgRYiag9NcBR4E5wNjqgSOa5ynN954EzfccAN+KTClM3Qv7NF+R6uCx0mYNBrHcdDELFs2xjHH/BP1ushI+vo5SaznbymOjcX21yJJVtGIpLXGEaYszbrdxnnUo/6JmdmpnGE2DDs4ngF7CkFKdkxBxpxrrjVJEsIw5LZNm9BAmn2m777KnxZKKhaHWwxep8jH1Bj1esSbQmimp6fpdiEIIEnoM7YVS/rc+46hpRy/n2V48D2ldHYUB6RESA8hnfwxf124aGEiDfJHJXAcD8fxkK6DdMxnES42IkErka2xUApKrFm7LmdKN2Mxn6fXiO13m1duh9VxnP/bobzDkLm96YQQfR7T+UDjfCB1KQB1EJQulp9qX/+/kmNaq9WI45hut5uHtjzgAQ/gm9/8Jr///e/50Ic+RBRFnHrqqXz0ox9ly5YtrFy5kpmZmXzRHAYW5wOrwx4X+85CHtFhzwc/E8cxrVYrrxeotWZsbMx4Tg87lKmZab75rXOYnWsQRiFCukRhCCjjQZVmmXA0jI3Ai055Fo98+BGc/M8n8KxnPA4XSCONiru4UjO1fRLHdVFpitJZJTgHZubg1ltbvPaNb+Xa629mfNlKlDb1wxQSx+udn7XYWxG65z3us/BpY83NE/Uzj6jNFbXezTw3NaP635HC0SgyOTtv/sNqeLNvZ4x4KlGgIPB942lVCatXjvKck5/ME098JKAZKXt0wwZpYjwJKtaIJZu9/yH3pizlXtpZZXp6mm3btvWFNi01VMzuA2vWrOkLbx38rjVk3nHHHTSbTXzfX1KOqQ1P1VpTr9fZsGED9XqdIAhyMGVJjIY9Xyr533zN8zyCIMi9fUEQ4DgOu+22G7vuuusO5zvsOuxaZUvm3HrrrfnrS+1f6Cne9vqs8lXOCHvWrl3L0572NPbZZx98398hvHiYWK9yMTXCRvxUq9UdAOWwfch6fA477DAe//jHMz4+ngNj6Bkm7HjYYw3L1bunxZLjGVFDPDuG6dNxXRQQxYo4hT9cdRtnfuIzbJ+aQzpl6mPj1GojzEzP4nkes7Oz+GW/tx/0gQ/R5yktMqVbj43OiHFKlRqeF9DtRriuxwc+8GHO/+mvmJlTVMqGVKjvegZavi8V9qsdCI4WE0f21SO99ZbbuX3T5iwyqWiEMuOpdc/rZVm8bWenacxee27gwAP2zd5XuQPDRj4AfcaauyNCiNwBUASmhoTJRHK5Ep7w+OOolX3SNEZKG15cdKzYMOwesJVakGhDUHTzzbcY1lohe7rHgqcvEWIY/OgfmHK5jJSS2dlZ2u02QRAQlHqs+67XM0q5rpvf19bofe/LoIfetsy7jERnpQFBZhmhpplKDgFa+2jtopSHSiWpcvNHx/GRMkBKDykDhPAQIgA8EB5RrIkTiONeKRqlLYOvQEjDS5IokC7sssvarHqIs6SIDLsO2/BuwBhdcO7VUN7FC4XdxzJswyhu2HaDHHy+mCesqGAs5ffn/X5hI7E3/f8lVl5r3bfsu61WK68DeuaZZ/Kud72LP/zhDzzqUY/ita99LR/72Mc49dRT2XPPPZmdnc3yRYwspIwsNp7zPb+73hy7yY6MjOA4DjMzM32eBsfRPPShD+OXF17IF/7rizzv+c8hCALKlQpxprzYAuBRqvA9yZ4blvP2t72OWtl4SaNOQhBIpHRRacKyiXEgoybX0A7BC2DT5u285g1v5i833YpwPUMjnqQEgU/JC4iihFarRSmo5GUkLHEDZBG5QqN1ljujJXYRXYoiaKy/A59RQyykLO3+khoTWJxZ9SQCFca0mlMsX1blicc9muc/+4mZktElTRNqQclY3NPhOSz/kH/IPSlCCFqtFs1mk0qlcqeBKZh7Yfny5X05htZzWgw7S9OU22+/nZmZmTz6Zil7iC0VE8cxmzZt4ne/+x3lcjnP/19oTV3s+IutCWlqIjNsnVQLCKMoyj2K8/02kJGeGQ+u9bpOTU3NC2QHpfjbtkZrkYjI5nj6vs/c3Bzr16/nuc99LmeddRbXXHPNIsyU4Pt+rsDZ4xfLkhX7aNjcKJVKNBoN9thjD5761KeyevVqwjCkXq8TRVFugLAAxuov9rzvS9GY2qCuX0G6gmY7oVx1uf6GSd7xztP57eVXUhuZoNMJiaKEKAmpVqsEjkTLrDRZDjRUlvaWUbYiBgyb2W8OjLmULjNzc4yPjhFHbZrtJqef/j7e8553c8yjDkUKEDsQzcwv/Yy7Jg9PaDk0rFcLhRRWl0vQiY/jwtzcHN1ul+pIPZunBpQKkdl5tfHN2nng+z5hmqCTiDjusnLVcmp1UxrEkaboxmCagC17dHfBqd3XrQHHHtekmxnjQDeBjRvXs2LlcqbnWrh+NSNCMtBjqPcq0x1cx0cj+cuNN9ONFLVSFlWinQWLse24rgwft0ajQVD2WbZsGUncZnr7dtI0xveh29UEgfE6W8NO0YBkUyfuPcnmtNWhgGJv5b+cgXmV1YnJZn/GemvmjNL0qulp86iBJM6K6SiRPyqdGOMNKdIxoeQSgeO4OWCXkowd2pSasam/pXKVOFFmL0uTrBTgAleozLUpFSOlk52fAsfMJynuHQh5vwemRYXZLtqe5xGGYZ6XUbT8WvbD4vO7Y81fSAHRZhXChuPYXBdrRbab7uDx/naJ2UPOd0CGKR7F1xY7zyLFPZArb0EQsHbtWj72sY/lG+wxxxxDt9vlk5/8JO9973uN1S67Sayi1m63+/KFi+HQd9bzuZQ+HuatLT63dfCKoVxa65xl0YZq/dMxj+KnP/0pn/70p3npS1/MyEgNx3WJo67JP02SLOcyMJa+MujULCC+kyIFgEY6gm4npFSumLwcTE7pVVdv5k1vfSeX/+4qVu2yFum5NOZaeG6FKFGINMnHQ+mENFIIQZ5DkG/I9vKyIlrW42jSETTYhSqPecqswMKwkBYN30pkG7LpLKCoJKj8ODZkxHp2zD2gTP2yVFMquag4xkGQRh1qvstzT34az3v2P+Gbb2YLrwNam98Q9Fb4uyBLNUz9Q3oybF0Q7NiHg4q6VeSLCtLfJgdocbHeLMtqW2R2tOu5LTdi1/IwDHMCkaV69VasWJHX9rQeOGuFtuy5vu8zOTmZrylF79l8YsNX7e9ccMEFXHDBBX3G0sHw1OLjfF5D+7wYrjwsIsWUe9rxeu1jkZBk+GecHMxawpUoiuYtNTModu+1z4uv2/6x4zUyMpLlqK3lqU99Kueeey5XX311n3eqFzIo8vW/SGY3KLZ/7ByyninLLNxsNtl77715xjOewerVq3NgYOebvS8G99GljP1SZHFjYxbW6QiU0sRxROD7PeVZgUAQJeCXXDZvCXnjm97KL37xa1asWksUpjie8VIFjiRNMxYDm9uYlUnxHBelUmrlCt1uZLwuDgihSVMTaTMyMsJcs0W322XZ+HIazVncwM3IhSBNNdXaCJu3buc9//4BVqw4gwMP3I12K6JaDUgSheeasYrCjvGeYbcyu3FlHj8ESoC7mN0nmwNeYPpkZjalHUYgMn0zBeFYL6LC1LTvhYg7EtI4QmhT3iZNBRvW72bORFjPbr8+KIRYEFTd2XlRnGfFPHetNUIKfBdWTCxjpFbljq3TjFVGSFLrbbSez+EdFccx1WqNa665ju3bp6nsMkGaJJR8L9dvlOqtqcVIj8VD1WWue7VaLXyPPF87isD1RGYM6FXoKPbhPXn/DItwEUKSpCGuY4wtSikcKfPw8CQ194/M1BXrIG62Yesdm9mybZJ2K2Fmbpbbbrudv/71ZrZvnyKKQgNWVZrdGwqr8Jj7VaGs/iYsHB4okZlF9fqlLIoOSacdcfsd2ylXazRaHYJyKdu/e+YHbRVFJdFopHRIVZyvbQCu66BUgiMd7oEuHir3e2BqZb5JZkFoUfEZ9po9xp2dsIOb9+ACogtKQfG3/yFGbHgFQKvV4sQTT+S2227j1a9+NZ/61KdodwwzWLvdzkOjqtUqcRwzMzNDrWaY95YKPhfylC70+fmeD7422FzXI4oi4jjhkY98JFdcfhmf+cznOPXUUxgbG0F6Hkkco4GSb5QPW0svTELSJCaolEjjEMd36bS7BOUy4NJsx/gVjzs2t3npK1/DbbdtZc0uuzE1N0uqMXUKhxi8jGez5wkFdvB05lbdO4HsBr2qUrODpXmY59Xkgck87F5rE2YjlKbkuyTdDipOqFZKpIS8/MXP5+R/eQiBk5EAWDr03i8vGZjOd7/fH0DRP+S+Fws6ivPBgj0hBJ1OhyuvvDIPEbPAEugDLfOJjawIgqAP3A4aXK3H1CoAS92nigDOnl9xzyrmUQ4+Dj6f773iWrhDxJAoDX2/eP0LybA8z+K13BNRR8X92ALg9evXc9xxxzEzM8OWLVtQSlEul/PQaGuUWEysV9uGSNt5YuvX7r333jzxiU9kl1126avdHUVRX/7ffSXSgThWOcAPfOOJCaMIIRyCUhUNdMKUVAle+/o3cOVV1zC2bCVJqkyYopaZ91OiROYSwnjUHMehXC4zOz1DOQiI4i5R2DF7gfSI4pRSxbD0b9myhdrIKMuXL2f75DSVSgUhQLq2VqgkVRCUKtxy6x286/R/5xNnfpDVq0aIU/BcSTc0pTUq5QpaZ9EIYDxVwp7VYttGYc8fyH9sNltsun0zOVFTvg8Nn6e5kUIItEqYGF/GoYcdggASpfClKP7c316yrBzPlUxMTCBvuhWw61P2EWHSkPpEmDqXQkoSpWh12jRaTRTLDBpfRBaPiLCedfs8wYZK9zyV9704jqDZalKrjiClQxgnuJ6tzmDur3YLbr11C3++4Ub++Mc/8vs/XMn119/A1PYZumGK43u4ro8QhmDLlBRy0DrNrtmGBvcezfxTuNJGj4o+vTQPYUeRaIVA4rgltHZIUoHr+xnoTPOxNt8bXP+zMdih/OC9KzsNMC1K0apYDH8pKhlFYDr4vcHnC8ng93cIWRzyWasc7KyhvPekN8lakh3HyQu+v+hFL+JPf/oTz3nOc/j4mf+JlJKRkZG8oHyapjQaDZYvX54nXQ+e2+Dz4v/DxvbOAtXFgKkd2263y9jYGDMz0yRJwr777cdVV13F17/+DV70olOR0sH1zOLSbrUol8uUywGddtPUFPNL+TU7+JQrVUDSChPKFY/rbpjkRS9+BXdsnqRSG2Ny+zT1sVH8oES73UZivI9aWxCWjZs2WNSevd03c0+IKF5vOmRzzDYXJzO82JdVpliLftCXzxWh+3IPnDxU2yyUSvVKTQghcJUm6TYZHalB0uYVLz+FZzz1wVRLYOuLG6oFN4v8cnpnI3YExsNkPqvnP+SekaHr4gJg5f4kRQBX9IDa5+12mz/84Q+50UzrHrHOUtfHUqnE2NhYHyi1oNYeTwiTC2a9hfZzd+Y6BoGpBbuDnyme+6ChdfC65os46u3B/evifMecT4re3uLaek/NmUGvtmWGdxyHjRs38uQnP5lvf/vb/OlPfyJJktzDO2xODxOrd1hwGsdxPoarV6/maU97GuvXr89/G4zHvVgK6L4UA0iL3lmJSjWuW8KRDgpoNBJcz+Xtb383F17wK6IExsaXE4ZxRs5XgHpaAmnGuCqZm5k183+kTqMxC1qzbtddKJVK3HzzLcZ705jF9X1KJR+lEsKwg3TAzUqJSSkRjkQ4Dp0wol6toNH86qKLefNb385/nvkf+L4gihTVsofQHmmS4LguQy235kSXRLAiEDmzbJrC9OwM1//lBhOWKUWGcq2eV9T3Ml0UB60THFeQJl2qtREOOOAAAy+UJguVus/EeHklQeCwbre1XHL5lfl9aDxt/WJ6o2cVFkKAcGg12zSbbbMGWWNdEVv2/aZmqYRVxuiRGd+EQdH3l/1Ea02sEqrVGlFqas27nk+qIYlhy+ZZfnbBr7jool/ziwt/zdbJbVQqNcqVClK6+OUxSnUvwwqQJBFpqokTnRnsjFleCJ0D1B2Bqql3KrAxwdYDarg8fN8lUSlpokkRoB1c30crSZSo3IbQG5PB0LrBfcP8zL09a3cq197gZmo34sHabAvVbbu7ZA/zHbN47IVCf+5vMqhUDL53d8WWSghD4xntdrs4jsPpp5/OAx7wAF7+8pcTRRHT09PUarWcAaxWq2X01MOt9YPPhylHw65t2OcXaov9RqkUMDk5med01et1DjzwQDZt2sRZZ30d+9NpbEKWhZRopbLFyUEnhoreL1XQylidu4kpwH3N9Zt45atey40334bCodXpMjGxnDCM8hIGvXEy4VDm/8LjgCV3ofEeJvP1o33PUr7Pd0zrobAh95Z1FEzx5zhqMlJ1kbrLi079V559sgGl7QbomKyEjsxCjh16xBg5Rl6y3Bde0iJIGNb+r8j9GaBa8FIcE+uJ3Lp1a05GJITICTWK3tL5PH72cc2aNaxatSr/rSIzbxGYJklypz2mds8p7o1FcqPBPXIQvA7b04qvD17f4Py111M818F9cKmite5j/L0n5sug59WeUxRFJEnCfvvtx9FHH83ee+8NkO9TsDSOiDiO87liU4tqtRqHHHIIz3/+81m/fn1eIs0es5h2dF9LFHUzT03BQywcpDCgNIygVHH50Bmf4Jxvf5dStUZtZBTp+XTjiKEhnoU6l+Pj45R8jySJcCTssmaCMz9+Bs/816fQbk6hldEPoihiZGQEKSUzMzNUKpW8dIrWJvTTC0pI6dKNTPjo2PgKfnL+BZz6opfmDLsKszc4niEPtCIg5+ubn4O0KIOM9aCVKR112223m9y6zGvVa0OOYr3o2VROkoRarUKqTEjkfSmW+EoAgQvr1u6aO3QWuvcEKtv3DZhxPJ8oTXrlmnBJ1Q5BWkBRN1n6fjAY9aix4a2Kv5W7eVjkpNYazynRCkMcp4TSDqmGTbdP88EPfJxnP/cFvO3f3sFPzv8Fwg1Yu+sGKpUx2t2UdjdGOD7tdpdWJyaMUxQu0vWRbgktHFLtEMYp3UjRjRLCWBPGKVECUaJIEkXYjYjjlDhKSFKFKerngHAR0qfR7Jo8VWl0J6WyvS0js9QqK+FUMBQMG5fhkaP3HnzcKYDpMIXYbugLgc7BUi5Lfe+ugtPic+BvxAp2z8m9oTjaY1oLsed5dDodxsfH+exnP8t+++3HK1/5SiYmJnKwZYkwbP8t1WO60OsLge9BS/1CYGxQDGmFYZQcGRmh0wmR0mXjng/g1xdfwhf/+yuAUdai0FxPt9s1a3qWT4VwSFOFkD4pEoTDHVsavO71b+XiSy9n2crVdLoJ5UqVuWYbKVxKJeMx1RjwmT/qwiMKlLGo2eLNVqSWZnFiPsLwbOEv1CwFesfJ2Ba1NnVPe+y9/XVQTX6NMtQAyljSS55P4HqgUiqBpN2Y5JTnPJVTnvMIRGpKwYxWwXMwNb60xNS9k+jMiptK4/XVQwg0FpL/S2DwbykL3aP3V0AK9AEEq5TZ0FuA3//+95RKpT7G1KLndBhoK/4fxzEbNmxgYmICYIcae0XPXLGvisB2oTboIR1cz4rHHebRLJ7rsGuYzyC1kCxk0Btswww0d9Z4tpDYfdkaxey42TzfOI45+uijefzjH8+aNWv68p+X8vuWXMr2tf3+xMQE69evp9PpIKWkVCoZMroMwBZzme87UXi+8cAkifFMajLHSwrNhsZ14Bv/cx7/9fkvA24WBhjQ7XYLxFE9YDa4jyRJQrvdJgo7dDsNjn/8Yznk0N054QmPZZ9992R6ejvLlo1TKgfMNWZxXUm5HNCNu0RphHRdpOvS6oSkWlCtj5BqaLQ6RImmVh/j/J//gje88V0EZZidSUBDHGnjudvBM9c7V7N1WGhmReefKkqqtNmGlMh5MHacHzuCU611BrxjPMtAkypUqu4f0aiaHNuNj48X5v0w+F4A4cKA00T3DC35OsYAI67oB5D9/TY/qC9Kb524b405fWujkMw2OzhuFY3EkZLPf+5rHP+EJ/PfX/oaN/91E9XKOJ5fJlEmT9sNSoyOLyMoV+h2u/i+j+cIw9crNI7QoBLSOCSJuniO6GuuJP+cXUt8x8N3fFzpIXEMyWWqUEnPCCBUVl9epVlalFp0Tyhe847r9L0LHXcKYArDFZ9BgDlYCmbYa3fm/UHgOuz1+crQwM7JyjufEeCuNgtErXS7XcrlMt1ul0qlwuc+9zkOOOAATj/99Nz6DKbvqtXqDkrOfM+HKV+LvbaUtlg/hWHI2NgYrVYr36zjOKZer7Pvvvty4YUXctGvLkFkylASpZQrFVQcoxQElRpgKL2zsqDcePPtvOnNb+OXF/2aNbvsRrsTs2xiOa1WB8dxGBkZodFoMDIykp1LIfRPqN4j1uswaP29617TooglfMaGudmxtTllSZLQ7jSRIuHJTzqWF53yODwBQicmp1QmIBJyejrdUyCU0DsA7flkPm/W/zWP5b0lC4HQYRtf3/y4n/T/jpZgI9u3b+eyyy4zrJqZJ60IBIufHQSkVpRS7LnnnrkSX/REWnBSBGnz5VzemWsZ9GguVC6mCGKLbb6xLL5nvX+DwHrQY7tYG1w7BhXduyPFOqdFchR7fM/zmJmZYdOmTbTb7b4c+KWUa7Gg145fkiRMTU1x+eWX873vfa8vZNeW8CmO030t5hw0Stu5aMIQhQPVmuD883/Le977foJSDaRPmiiiOCWKDZmPEkVgobDlXgBTAkYJHCEpl3xOetIJnHrKs2nMhaxaWeEDHzidvR6wge3bt+fe2iiK8ugjS4Zlx65X9sSUaQFJoiSr1uzKN7/1bf7t7R9mZMwlScDzBCq14TzZtdqm2YEQ2P4/jN/X3q9SFmuBDn5yuK5nxziODXt14HqZjihRWg0jJr5HZUn6jTDX7zsuDj2jW77tZmWE+qWnp2klkLKXP9+3fsjhF7iw/rEjYWj/91I0O5Kj/S1Fa41Wglq1juc4XHnlDZz0lOfxnveegVIurlelPjKBdHyQPnECjWabuUaLVqeT1XsVCJFdT5oYkiitcBxByfeoVsuoJEapBJXEJEmUP6axadqu6WmMTlJ0kq3r2eu1ShVHSpI4JI0jJMIUsdFAwXvd69vhY9JvTL33+3enyDG1nVXcxOz/RSA4aD0etEwPHm/w+V06J9hhY7YkF/eExfe+kGL/3hNSLpeZm5tjZGSEUqlkWO6y2lMeko997GM8//nP5wtf+AIvfOEL8X0f13Xpdrs7gPuljOMwcD2fLPTZYc+LyhlApVJienp7Xru22w3x/YAgCNhtt/VUKlX+5+xvIITgqIceQRpqUAKZWU9VCt0wolLx6SaGye0vN/6VX198GXts3Jt2V9NudahUPbQSeF7A5s2bqdUrRGGY6fbFHFPd92iAquytJgNDqnV//1oyJPuqENa6bNkM++fGsLliXjOLniWHsveF1opuGOFIl5FalYccuS/vfddLSRJwXagEmiiawfcDiFJwyv1hJpaQwfiWM1nYvjZsDfiH3HOSz7WB1waf31/733pNi/sHwMUXX8yWLVsolUp9e4xRjvtzUueT8fFx9txzz7yPrPJWBG3FMFNr5FyqLNang+HGg4/2fIqvDT6fzyBoPjfcAGhlMeOs1v1hu/e00agI+ovMtxagh2HID37wA375y18SRVG+Pw1ex3zSbrfzcE07flprJicnOf/889m4cSNr165lZGQkvy5bJub+IGma4Dq9OZckhqE3TeF3v7+JD33wI7TbEUK6VGo1ZpsNdJJQqVQIww6O1BRLZlgRyuQG2ioFK1eu4KUvfTHLJ0bwHJiZneGIIx7ES17yYj72sc9w66Y7GBkZod3p5uMghCBWxqBpPc7dbteUOvF9XFfSbM0yO9dmZGSMr33tfxiv13j1q16ER8aIKgS9lMjiOfaf73BRpErhSC8r12GidAy7biebo8Wa3doYUgeOa8G1DdU36wxoLe79ZL3FJAfOBjz3dIcBdn3M3mtY/jM3a5ZbnKapYZwVWckUrZFDljBzL4osZWk+GT4m1oBij2NeXMoY3jMyXIcQJCl87wcXcsaHPsJ11/2ZiWWriCNBmmpaTePlR5pSLpW6bwxZOjHkaJ4kDrsICb7rIlyJimO6YQSpQrgOKk7QUuBkLNLSqI853k+yvnSEk+UrZzVidIoWKbPdJkli9C/PC7LUZ4FDCd9zidIIivriPNfea0aVNP1w703enQKYzid2oy+SSBRft8+tDNs4F9t8FlNqLTAdZvHdGWQhEHrXFcneYhZHEZ7vE1imMiHpRiGloES7bUqpjI2N8tnPfpanPvWpfOlLX+IFL3hBrrjdFfC5lPEd9vpC82NQObP/W89vtxtlVl9NFIWZ0tNlfHycfffdly984Qts2bKFJ590AlE3zqyvHtKBctVQ0adpSrnk8NCjHsK/ve1NfOxjnyKNY0bqI4RRSK1eot3tUquNkKQpjiMxzG0FiKbNBiK14WQzC1rmdbQJ8gsqffbaB4FnD6BqoQydeHFf1XookYP1nHiOxPcEUTcijdqMLV/GHutX8Z53vhKhoOJCu9PAL/v4vk8ahjh+dV4KxZ3j7vqH3N/FejIGa1J2u10uueSSvuLtVmzZKEvqtpCsWrWKtWvX9tXYAwqGGt1X4swauBZSFIoy31plnxdD6oqAb77HwefDjls8/rByMfMdd5hIqfNcQmtoHnZtd1V838+9ccXSOnYsfvKTn3DppZfSarUYHx/PlfMgCGg0Gkuqc2qNGp1OJ2eh1VrTaDT46Ec/yumnn54BuTBnmbclbO5ryaO7UtPfnitQwB+v2sQHP/BhrrnuL3h+Cen7eZqK5/t0u12TI6lTQ4cjpFGWhTLpFwKkVoRRh/EV47zj7W9lv33XkWbAd3y0RjeM+ZenPZrbbt/EZz/7ecKoRbVSodnqUvZLtDohpVKJTqdDqVQy92mSIKUhimm3I3w/QKmEODW73ef++8uMjNZ48Yv+FemIbI+SfSCmEM+QPRrSF4EBixKwtT1U5lUSMgNVWuNlZewMEY3uP1YOTi1IUOhEmyixsEGjEZOmGpUKHFeg0RnYuzM72o4srXfl+1ooBA4IQ+xkowukFuhiCZuMgVdqleXyAtrk85prSDM9OOtN6WbAQoOWWf30HZ2nub5ceH3wjh+O3aV5Q8u/CbA3ZEIFHIEppZJq+MG5F/GOd7yPzZs3s8fGfdi8ZQuOA8uWr2JycgrPLxEmCUql+BhjZjfqIjSUfInnSVQaEoUdVMfMoUolYMXECiZWLKfkByBNnVKwBgN7PllKY9ZRQjgGCEMWLZeitSLVxpESRTHbJ2fZum07cdRFuosTsKmMJExLG63GjoN0L8j9HpgWLbs29MmCvmq12pfTOUjqsJi3dNj/8/3+oOSbdRaeaMMULXmFZf+zm+5Cx1roN+9tL8Pdt0z3W9aEpanOztvzXKKwQ1Aqm1hVIXCECxp8N8B1Bd0oZMWKCb78lS9yyqkv4uJLL+Hggw8lVQrfD2i1WlntqggHU4ur223n9P53R+6KJ73YZ1LKnNjCWhJNTbgUz3PodjusXbuGW25Zzv+c/XVqI1UeetRRVEolwijBd1xSZer4VUoBnU7IaDng+c96EuP1Ku9+7wdptrbjebUsUR2ELNPtxoYpNI2Q2va9Nk2bcZDZKQlbSNyeZWFxMR7QHb0aUgwSu/Q2YIXJcVAYj0dOYa7IvZvagmWV4kqBSmNaM7OMj1aJmjPstW4D//Ght7OsnPHsKqiXatmm7uL42aIpekxxdpMyR85Y6hZh91vIAHFPyP0hHO/eFAsYBkNO87V1vu9lj/ZzqVIkaYrSOgcFBpDduwQg9neKZEXFnFL7GcdxaLVaefrARRddxM0335wDEwsgi8R2FlhawGGNVL2QQ4ejjz6aMOwp2Da0056TPQdrXLVAx9a6XAz4Wm9dt9tl48aNPPKRjyQMw5x0rGggHba+LWZAXSycdSnlcuzvDcvhtwZI+16lUsnrfS5Uy3GpYvvB7sXWwDA1NcWll17K+eefD5jSW8W641EUEQQml7JWq6GUotlsMjExQaPRMGFytVrf+dvyLzaX1Pd9ms0mH/3oR3nOc57Dvvvum5eRsSHAxflk9RYLju38WkiKdajNY//nRZ9C3Z/bK4VZTRutJrXqGFECnS5s2TbDhz7yMX596eX45SoKSZoaxdcTDirRuE7mOhFOFn7roJUiiUI8R+JojVYJvpPy9re+jkMO3g+dYthzwxDPc3A9SRgpXveaZ9NqTPLlr3yddhwxOjrBzGybcqlCGiscHHSi8VzHXEOa4EiN7zp0uxH12iizc9vZZc1aJrdu4v0f/jijE8t42lOPI4k1gSeQOCRxmM/npBviBhmjcLbnCC3y0FotBAgHKQ1Xg1IaIT2WLRszHlwvQCcSoTIV2qadiAzIAmiF7wYZ23aC5wWUSi7T0zPU140TxQmBJ4aEyQ4JNS4+F5nHEo1SGZfEwEps/8tJ1sTgu6ZFSYQjAyKtuOOOLWaMpEMYa5CKtBCmrERmnEKgs/rmjiNJ4w6lsoPveRnbsAWvAkGKcByUDtEI7HKTpqnRFUwx9MLFZb9lL1pAohOE0LjCEPUIZKZzaxx595CSyMLPTf8UWIiFzmwMCSIrD5CmKdLxaHcjgrLPL355BW/9t9OJU0l9bAXbZ+fwKhWEEEw1phC+JEojgqDcu140KInvujhC0e00qJVc1u6ykl3X7cK6dWvZY48NPGi/fdh94x54Mqu3KyRCaqRwkY7xeQqpUcLWnXcAiRzQh2KVmpGWDkrD+95/Bl/+6tep1SfoJm1c4ZNbG7TurSOYnFQz5irfI5UhRjb3/70o93tgWlyYhymB1js5zGM6CAiLYY4LHXMp55RbhAfCh4s5qPesF/L+Kda137PcGZFZ4oJOY3w/oNOco1yuguMVlDFDDhL4AVEcsWLFCj56xof51Gc/w1577c3ExATbt29nbGwsz1H0PT8H+5ZYwspSQMhd9bQOhqot5Ek1r2XWLGnqt+69994sW7aMb3zjG6xZs4YNGzZQqZQy8gCBCRuKqZRNyA/a4bHHPhIpJW9629txXEUn6hJ4FaQDfhCYeahdyJLZs2CjbJ2XmSXWLLcask3YhFn1Nqr5Qu1sONtg5EHG5oZCIDLFSJn9RdO3yQoNQpoJUq9ViKOU7dtu48AHPYD3n/4WVowZeJlbTC3zrn1qTn5AimRM//Cb3heys61hdm8YDF8dXJ9t/eQ77riD8847rw90De4bVnzfz41T5XKZOI5N5EO5TLlcZuPGjX35pVYG9y0L4FauXHmnSonYPDybe37wwQfnZDvQA+HzrW1317CyuEdUDl0ri1I0GBTz0O8JsSzv5XKZJEnyCI4LL7yQX/3qV4t+346p1pp6vc7k5CRjY2MIYUhwFgPu1WqVyclJvvCFL/CKV7yCXXfdNTdqWIO2BeUWNFuAa735d1fy9Iu8vEfvvTAKqVTHSMEwgIaa//jYf/LzC3+BWyqjlOzVKs08otbgqQQkicIvlUlTjRRQLZfotluUKz5zsw2e/+xncuBB+zE+6pqv655+plRKyfdod2Ne++pXsGXLFn5y/i9ozs2wasUubNq8jVp1BNf1SJLYeKQFlEo+kqxUR6VOp9NlbHQ5t2/awrLxUVIV8u/v+xBBucQTH/9PdCOF50qEdEgShetK3CAAy1ovZBGrZX1lRKHRwuzjYRb5s3bNLmy67WqDwBgs39EvSRKhVILveUDMbKPJ7373O3Zb9yg8b6FyNlay42rr9V2qDHpUh4vImIEnt2/nt7+7giAoE4UJUjikmTdOFeaL8RYaE7gAdBqDTlBxasKvMeSFaQKeB6TOjteY1bztnSd955hnLAvrFyxGZonCd+6BNSL38jv5dZpQWdE77+wzSikQUC77/PmmTXzjf79Do9UFESCkKduntDLedUy4drlao9ls47s+YWTqtU9MLGPb5Ba6acgD9tiV44/9J0444QT2esDulLIgCqUgiqPCHtQj7MrxTObJNudr8p5FIb8bIEkFMQqlBWEKKgsjVirBzg0TXbejLpWDVK1zo5YVkZ/TvWNY3ik0u/nAhF3g5mPlvafaYM5q8fUiCB0kQ7qnCBzuvyL76NdFTnyQlfTI4FK73aJcr4HrGAp3KYiiGKRRrNApEkGlXGGffffm+c99Nldd+Xu2b93CyMgISZLQarVM+JxKaYddKpVaTn09SNgx+Nqwzwy2we8v9N4wcpBBse/ZML2xsTFGR0fZbbfd+NrXvsYdd9xBkigTmoSk5AfEofH+WqKHSsXjUY96JB/6wAeJux2ETvE9Qdht4khFHIf5ZqWhV0ZF62yPlcW9tu98ZeG1YSRCg9c3/Hp1trFbpr4Us5inCAx5URAIOq0ZZme2MDO9lYMO2IePf+zDrFpdw665Wugd2pAeLVyJvYKdYvn6u5HF5vz9UQZDdAfFlqoIwzD//De+8Q22bNmyAygYdgzr1dS6F5LqOMaL9MAHPpC1a9fmxy2y/hbXh2LEzfr166lWqzkL8GJi8tpNXt62bdtoNpv5OA2G8RafD3rB72obJE0abDaXs7hmFn/f1v20oBF63tV7otyaEIJyuUy73c49sD/96U/51a9+xeTk5JKPY4Hi2NgYSZJkoayLg0ZrOJicnOTzn/88d9xxR56fbI0SRZBqr3mpeoNd8/Pr1dbblkUuZSF9qDTbjXNHlFGiMcC63YqII80HP/gRvnn2OcRR2gMBmZKrxADNj5b4fok0NuztaZrSajcplwOmpiY5+uiH889PewobNqxCCEhTTar6HQgaTbnkMTLi8a53v5ODDjqAIPCY3L6NsZE6rVYLpdJcrxKOJEpiunFkPOE6we5Dpq8VSsGm27fwiTM/zfk/vRjXlTgSpHCNF9rijSXMr1zXzHIpK5UK+++//4BBWpi9VvSaQpsmDHOtzeMLw5CLLr7YmJAzAiehd2wFrar3WNCv7KPAQQjHPBabcLJoFLHgb0hclIZ2u8t1117fp0sPC+kXGD1PZP8niQFPa9asYWykvoOuMazO+FLD/O8PIoRAJwbEOY5HkpjZ/7OfXcD3v39uX5pAHr2pJRKJI1ySKDZpbGmKUIrRkSpT27dQrXiceMJjec+738Vzn/cc9tt/dwDm5kKSxBBtlUo+nudkzctJwHpYx8V1fXzHx3N8PMfDcxw8x8F1Ba4rCEouJc/Hd11c6SC1k807N4uKW5oO1W/MvOf6dz7ZqTS7QVKE+cDoIJAcDO9d7HPzAdHB7w2+Noy9d/Cc76s+u3da9iPWyph56igsrI7rU86YZxuNBlESIx2BV/JQup+ZMux2cYTksEMP4+EPfzi33nornWYrtxwXFaE4jnPL8nwgcpiXc7620GcG31vK8WyzionNk7EelO9973vcdNNNhhQhNQufDeMDY+GNw5Ra1eG44x7Gm978RgJf0u00CTwJaYjvQl4WBrt4mE3MriPmPAZnhSknY3JDlk70Mawf8gmQFXUWKBCJCeEhpjk3xfhYjVLgctzjHs3HP/ZhdlkTgN7JFp//47KzAdKiFJWsQeCUJElfHuKPfvQjrr76aoIgGAo8BtfyMDT55CbPvJvnpEopechDHpKnoFgvmT2G4zg7pHlIKVm9enUemrsUYGoBb7VaZXp6mptuugnXdXPP7UL72FKa67p3q81n0LXPS6VSXiN28BzvbB3U+foHel7ZK664gp/85CfMzs4yPj6+6Pc7nU4+F4rA2nqph+0Vg98fGxujWq3yl7/8ha997WtMTU316QXWCGHnRJFJ+O6K1hopenVTi8ZalMD1XWYbIZWqzyc++Rn++4tfQboeI+PLEI6bZZj1e82KIhGoxIQxkyp8RxJ2m+y2bhde8Pxns9deuyMdiOLePBdZCLFOFQ4i42SAlRNlPvTB97Nu111IoxBQ+J5A6SQnUTJhkZo4Snrh0K6g2WyayKooIQoTNm7cm9//7o98+MNnctGvf59TLERhL6+0dy8X4HZfpI4uzEGJIySjo2Ue9KD9cZ1eRJLt517uo7UWGDBj9RulNa7v8Ze/3EQKxInKIo6G3efWfDB4UhlAzR/79a1+g+18nsV+r1q7E7F56zbiOCEMQ6OHCNBKkGoTPquz89R9EyGL9lAxRz3kSCYmxoi6KUIYVuTepeyY235fl33ZUYbtb9LUnde9SBvHkUxNhfzqlxfTmGsSBAGe7+A4Fl/YZsa82+3iSRN263sCIRN02uVf/+UkXv2ql/PQhz2INWtGEAKCAEZGAlzXlCeKoqivrvOgkQ+lQTlo5ZgxUiZ6sdjA6OVSmvBbKV2c7M9zSvORJvf3zALr270lO4VuOKxD7Ka5VDB6Z99b6mY+7Fj23IZtLDuj1+HOiAWnOmuGAMBhamaWcn0Er1Qi0dCNTfinVb48V+J7DlJImo0GD3/YURx4wP7cdutf6TQbVEsBaRTmYG9qdsbEzy8RJj4zewABAABJREFUIFpZ6PX5ZPC9hY43CF5tvli73SYIAjqdDuvXr6fRaPCzn/2MbVsmSePEbNLSQ9Bj8fN9ByGgORfxnGc9gZe86AU4IiWN2pQ9gVQJhp9W59bsVGfPhQ1E2dHqaWSA4t6Wl8nqofY+n/a1wWPpLLFeqBShU4SOQacIHSJ0jOdCmrSJoybPffYzWLncJY6g7EO7280B7Y5ND7RBKW7c/5B7U+YzzuwMUvQMFr2ndr22ntJKpcIFF1yQh/BavoBhRsUiqLBsm67r4vt+DiwOPvhgHvjAB+aesSJIs3uHPVbxsVKp5CHFsLgBzHpabQ7rX/7yl2zt8AmycP+lrIvzyWIe0cWOP5931n6/2KcW0CuliKKokLt/18VG2wRBwJVXXsk555yT/2/7eCGx52M9r5s2bUJKmRsiYP4waTCAuNFo0Ol0WLlyJVdeeSVf+9rXaDabgPG4WyMCmJIyFnAtZXzmXR1zW6HugzU6Nd5NKSSOFCQJlMoBn/ncN/nCf38VP6hSqY2RxBo7PGrIPWDxSbdrSJxcKZFoSmWfoOTx0pe9kEMOPZByxZyHkynm1tZixh+0Sij7nvEoARvWj/OO097Ght13ZW5mO/V6Fc+RJKmJajA1hst4QYkoSXFdiZQm77LT6RCUKzhuwNbJGcbHVnHdtTdyxoc+zlV/vAU0dKMIIaWJ3HK93jYisuS5AZwoEKTaMsy7eB6s220tQeDRDdsYr3Rv7FMESsisQaoV0nXQUuT5xVMz02yf7uL7EssBsWOjr/XthkIMPModdsvB7w/7DRAoBb7nc8EFv8KC3CRJSJJkXkZts9+blJ6S7zE1NcmBBx6I74F0jMNiMV/M/dJbOixSK6ugoBIzCI6EO+7YzA3X38j4+ERmbFREaUKU9vpMKUgTTdkv02o3cKVAkjK5+XZOPPFYXv3qF7PXnstBQBgpY7gxWU9EsXHW9Ax2uh+LOE7e7HSVGO5J0ddMDrLJETVVD1zXQwofrZ3MyLA4BBzcK3oOqXtPD1j0rO7uxnZ3xU7gYQu+ze+ZDzAO85AOgtG7EtZb/B/oe8+es+u6OeV5sS//nkQUr2cgylIICcLU55xrdRkZG2fb5Cxf++Y5NDohjidROtu45+YQ2Q2H1tQqhoDkqKOO4oADDuCOTZvYsnkzrusShgacWuKjQWVnqUB1PiC5lPeK/y/0Pa2N1csqrXNzc9TrddrtNhs3bmR2dpZf/OIXhGGcb5ZaCRw7rwSksWZs1KfbhRec8jSe+cynoVWHZnMKISJkTjZVAI1DCIGGKU/zWcsWUrQW7kcDXoVO0CjQCb4r6LTnEDrh3972Jn5z8RWUfaOQVUoB9z/L6T9kPvl7WL8G1+pqtUq32+Wiiy7i//2//0ccxznQtNc7X9SLBStpmhKGYR4yWq1WeexjH5t7SG3kjNb94bV2/7AeM+v93G233fKcyMXEnlen06Hb7fLnP/+Zbdu25eGmd8VLemf3w7saeSSlzPvEgljbL77vL8qIuxTxfZ9qtcp1113Heeedx/bt23coobOQ1Go15ubmcq/3IYccQrfbzQ2NxT1gmJTLZcIwzPeu8fFxfvOb3/C9732P6elpPM/Lr9OOd5E9+O5K33npbLxkjxDHceCnP/stH/zgfxAnUK6O0umGaCGJEjUUlBYNl57n4SCIwwhHwOz0FP/81CfzpBMfz0jdAwVK6RyQQhYeqU35HqUTBArfc4jDlDSBhx21L6965ctYNl5nanILUdSlUgryEnJaa4KgjNYiLy1jiaoMgZVLFKa4fpmgVOPyK67kg2f8BzfetJ1qvUScApZ0bV7yvCxNBeOZSpUxYghg2egYq1cuo9ttFz5HHmqrtc6fW8+6EMZgHCeKudkml//2ikLe5BIGst9ROfxx2GfnE93DYXPNlO9/71ziRFGuVulEIZpCxEKhNq0R0y8mOkqTdDssXzaOBDxP5sdXaT9A1fb+tud7p3Jm7wsRhXQCSRSZE7/5ptuYnp7DdU2lCZuz2TN8OiZs3GIEpZEokjhk5YoxnvfspzM+aursOgKCQOL7Gc7BeDetLiVlb8/KRfcsFX1GADHQpM6MNsZY4DjgOS4SCSkkydJTJf7WBumdwmMKgzHOxrpaDJsaFtZ7V8OXFtp4h70+7DUTdhLMu/n9PSh5gFlcpCJnRMgkFaYlQLlaItLwnvd/mNe97m2ce+7PMu+e+UalXEOnEHVjECJjNdSoNObIIw5nzZpVbN++nenp6VxxtPlCi+WYzmfhH/b/fOB2vpzTYj3TQbGvu67L3NxcPhfiOGb58uXMzMyw++67c8tfb+P3V/yOVrOdH1MIF5XGJqzGM/T1lZIhFHjtK1/E0046kUoAnkgRpAacil7TpPlmopB5YrvWOv+MyL7T84T2e1CL3lOTp2QXJtX/WZWFlGj7qMyOlHlQ06SLShLarQY3/Pk6/u2tb+PcH/yEkuchMkbfYm5OLxLKFvUe8Oz+w1N6n8igAr4zrl/FtVgpRafTYXJykl//+td85StfodPpoLVhhrWssPN9v3gc2xdxHFMqlTjqqKPYY489CjULRV/+4KA30QJS66E98MADWbNmzZI8esWw4Gq1yszMDJdddhk2THa+ULD7S7NGXNuXxbzUe0K01mzZsoVvf/vbXH/99YyOjubeoKXUErVj7roue+65JyeffDIHHHBAvsfb35hPwjBkxYoVALk3fdmyZZx33nn8/Oc/Z3p6GiDPSx7Uc5Z8nfTjk1w3tcewpCg50RS0moqLL7meN7/lNFyvTKIk3U6M65aIwoQgKPWObaNT+zpHEWQlXJRKqFRKHH7EoTz/+c+mPuLhOJCkEYgErVPDiUA/+ZjQoHSKUgm+7+RZlY9/wiM45QXPZWS0RpKGaJ1SqZjz6UaJ2dMyY06SGG4GE5EUolLJ8onVNJtdVOowUl/Oj3/8U7785a+xdVuHVidBOBDHOvM6ynzP6Wn8NkdX9xmWlIKxsREe+MAH4DrZPqlVHqVkvY62tIwWghRNnJrQYyWg2e7wvR+cy+R0OGQAB32fhTYIPARk9v/+JnTedjhGcaJoCLtwzv9+l5tvvhXfL+URGLluq2Uv21WJQuar0R3ibocHPGAvdlm7JptXPU97v9iR7c1ruRPs40KIDACaDg+78Ic/XEWnHZImOlvTFa6QeNLBFa7J8hUCKVyibkglKJmoOBVx3GOPYf/9Hkij0aTki7y/0lSTpBn7sCtzYtBB3VUpsqZJU7XDeBovZgpkkWtCm/sPzHwRvRS8OxPG+7eWnQaYFsWCQXsDDfOGzgcg53tvqa14DsOObd+zwHlQdkaFbl4RRcKbxIAYofN7RWEWSgV84hNf5vs//BmOX+cd7/4AF196A1qYws6O56K1wA8C4igyrJTZRpomCcc/7jjGxsa44frr8R0TEjc5OZlb3OcDm/O1+YDmsM8tdjyYf0yt8un7Pq1Wi0qlQpqmNBoNRkZGaDQa7LJmDeef/zOuvPJKnCwvC21DgM38aTRaSKBagmoZ3vSm1/CYf3oY3e4cghhEitQmrHapclfnYf/3hveN0NqATp2yfds2PEfgO5JyUGJycpIzzjiDK377e6QYRh6yUy5J/6dkZ1rDBkNlrXS7XVqtFueeey5f/epXd8j/tPmni0kYhjiOQ71uiFpWrlzJscceCxhvUjGMNSdwESIHZcV9wwLUvfbai1WrVi2J/MeeowXSk5OTOeCxQPee8njeU634+xaIDr5+TylEU1NTfP3rX+eWW27B87y8NqmUhvNgMel0OoyPj1Ov1zn++OPZbbfdeMYznsH69euZm5tbMLoETNmZIkGWEIbNd2Jigu985ztccskl+XkU2YjvKWBuopAkWilS3TPphaFittHmjW96K7ONDq1ORLlSR7oeSJduNnf6r6hAdJexeXY7LQLPwXMEoyM13vym17Nh/QRSGHIl1wVHCqRD5nU015UmRsl2XDfLgQWtUlzH7AA6hZe99GQe+YiHUq+WmZ2eJI2j3Jhg7h+Her3K9MxUVnrHw/dKCCGZnp7B98rESpMqQX1kGZ/7ry/y8U98GtdzjWFckaUbCfo8gvk1Gm++QJhzzPDq6EiVjXtsoFwOkJneI/uMp70cT1s2MIoipGvu/zBOuOhXl3DLX28dPmgFI3MfuSCmTnp/Y8hrw76/o2gBjWbM5//ri3h+iWqtxvTsrMm5V3HPMLaDx9TMBesFfPCRh7Nx9/VmbilTZxYB0un/rZ1RpOOgM8Ij34N2O+Xaa64jioxn3q6/gxEgaaLRqXEJaJ0agz2Kww49mEpFMlavEScdHMd4NR1H4DqGJTdNU5RO8H13x7XT6TXHHRwT3Td3dWaY0DrNQnqNd3Uw4nMpUlyPc1vXvagHyMWU+KWe8L15knZQbJ0xrXVO1T7fxjfs+UKfuyubqpQy99papj1LYOM4DpVKJS/Ebq8DehT6S7GI3l0l4N4VhU66ICIgAqFIVEoWjk8YmaX0y2f9kE999kskiUtQGiNJfF75yjdz6+0hjgudboJ0BGEU5+ERAGiJ4wpcT/LkJz+RPffcg+uuuwahDDtep9PpI0+yeTnF50VZCkgtfrb4nWHe0WFK7+CxrKfCkiBZxbf42h577MHFF1/MT8//mVFI+sZNUauWUYnCOjzHaw7//u538uQTjqfVmMZzQYoUVwJpik7S3LNsiQtSrUn7rt1YqYE8F8m0FKFV3iSmuLMUGimy8J0MdKI1jhAmpDtbhF1hmJqTKKbTalOvVum02vh+iSiKEcLj1lvu4G1vPY0///lGNIJOGKMRhPY+wckVgqGW+rspd+b+uLvr484uxc1rWMrCfP04uA7ZuW4B4F3pv6FGENGf6lG894tKvq3tCQZsXHzxxXziE5/goosuwvO8vCSI9VwWo3DsMYflRAphPGczMzNUKhWe/exnMz4+3pd/aI87+H/x+uM47isTs99++6G1zsmVLHtwkdjIft+eaxRFVKtVNm/ezNlnn52Tww2uj8XrKBrfiiC6mAPar5SIvuMV+3/QmGc/a9fAhaQ4zwbHdiEpzkULAIQwucPNZpMzzzyTW265JQf9QRDk52PBIpDzVdiQXXuN1qDwpCc9iY0bN9JutxkfH+cFL3hBXpfU6iW2v63RweoD1kNrf8/W5K5UKnzrW9/ikksuIQxNrmar1QLIP1Psg8H7bf77pze+SZQxDUiJFJIwNHvz1HSDl77sVdxyyybSBBzHI001Aoc0VVSrVZI0zftLpwpH9OZw4HrEcUgl8InCFtWKxztOeytHHv4AktikoaASTLUw41W0upFS4Lo25LXXZBZ1pRSUArMvvef009hv372QDjRbDTzPIfBsHWRD1mNrD9v7WymF4/ogHKJY4ZXKCOnhemXO+to3eP8HP06UgpKGwTZOlCmJIxyQmiQ1MahhGOK5XnbMFMcRJKmiXIbHPu4Ydlm7EqVitI5RKkGicp3Uzi9bD9fet67rE8eG8fjzn/8icWK23SRNM6ei6N2fWYJoomIT8iz0/2fvvOMtKcr0/63qeNKNc2cYmBkQUBFkTSjmjGLOq7hmXV39GXcNoKJgWHPCHDCtWRZBdA0YMIuIIihgQEmT7oQbzzkdq35/VFefvmfODQMzMOzel08z96Tu6u7qqnre93mfF6UysiyhFxXt0T6FMBtCYSqQ5nSittmPNKrSFocnaY5WcOanPst1121FCKPWaplott9bjYwSXCNwpcARGq0zou4c//KUJ5vIOD2RMfu4K8DUHhXF+7183ZWM/1UHXvXZ2u9L2zLabJ4dIaGQIyhUxBW2nqptZ3XeEZpinDfOw1arBdh6xYZJ4LouSZpgHT1GBNMA+vLa9DsV+nwQNodUa7WgukKuFUkSmfxWxy2Obe5vmpk6wkov7/jUuifgacbQ4t7uZ3xxiwhPVCc5WB6sWev/fvU9azeW6ls9Vv9CrJoD2w9e9j9ovGlMuJK5makSTAnHQUqY62h8Hz716XP46Mc+zc7dcwi3wXw7Rzg15toZz3nWC7hu6zx+6JIL8AOPLDdunfm5Nq7ngTa5p3me89CHPpSjjz6ayy67DCFEqaZZ9VpBz9tcVVJcLPJZtcUAaj9I7f/uUmIg9ruD9geQF78ZHR3lkksu4cc//rFpu+eRF4skKc1E7gpwi4FhqOXx+tedzBOf8Bg6s9PEUZu4M4cgo1YLkZgJpT+H0xy7996gAWBQexc7d9uXzaVXqDwlz1O0ynAEuNLBkx4ogcohTXIELpf96c+85GWvZOvW3XiuT5zk+J6PykGj8dyAXN34chGrtu9tbwClBTBA+axWy6os5yRYyikopVy4GBA9Jo09XrvdLgHJ7Ows3/ve9zjjjDM499xzuf7665dtf6fTwXEcGo1GCTzseaVpWjxj5ljPfvazGRsbK2m0K4m4WrBuRZTSNKVer7NhwwYOO+wwhoaGiOO4zF2dnZ2l2WyWkSMLduz4Y8fAK6+8ki984QuAWUj1M4wscF5Q5oDe3GTfr9b+rIJzKWU5vlbvjf2dvT52YWMjxVbsx35uf2Op1XbfdnG/kutndQfsse15fOADH2DXrl3Mz8+XYN6O0RZI2uN1Op0S5FhhJNvuhzzkIdzpTncCKJ0Ho6OjPOEJT2DDhg00Gg3iOKbb7S5YSK+EKuy6Lt/85je59NJLF4CsJEkWgIRB4/Aez4xYOLajJa7nkaQZWkOWgxtAuwv/8erXcdHFlyAdH+l6CMcFLXu1HIvjzM3N0RpqIoQmSSNTusKRKJ3TqNeABCkyXvfaV3O/+9yZLAGviHp6jp1dlor+ytLzWLiRqgVSGBuR/OdbT+fY2x9F4AmSuIPjCHbvnOwx0vTgdR+YhXinGxMlGY7rI6TPt//ne3z4I/+F60G7m+G5AVlq2pgk5nnsdjoElRxnKVxTo9OVuBLWr1vDPe9+F7RKCHwHlaW4riTqzKOUIgxD4riLxjiARZEr6EgP1/XZtWuG31x4Md/4xreRDriew/TMLBqj3pvlOUmaFOBBF8srjeMIAyqUKp5hVTx7JkKtdF5SuIWAeq1Omppx0Av80v/sBw4XXnQZZ5/zLdJMMzQ8Ziqha13WXrUAqduNyuclSSJcV5KmCY6EI251GHe44+0ZbgWkWVrSqvNcVe7pLdi0RitDmS2GejMnSI9wqee7iFSHYYjWmsmd2wGYmZsljhWu4zM/P4/vmX1oerW2RXEf0mwFqRxSIxzjUylLbgmBIx18v0a93iLOUxzXIU014xNraDQazM3NIPrHiwPIDnhgWl0ErRTMDQKx1b/35VadJKpUYc/zqNVqCyb9/vO5pZsWxmPTGh5BYYr9ppnp6p4v+NyXvsfHPvk5/vaP69mw8QjCWhM/qBMnmixz+PNfrubUN7yZLZPz5ArmI4XrC6Ioo9lq0O10DODVksDzGRoa4t73uSdH3e42bN58HUkSlYugQfXyqhz9fm/+Yjmme7vtDd13EODzfZ9uFOF4LiNjo1x40W/44Y9+CBiaU3l+WUKaJKg8x3cg7iaMDbm84qUv5IH3vQcOCc16QJ4lRN05arWQuNsujlYdfKqRXxM5XaDGa/NUy/bnfdvCqKuh9JhoKlqRZwl5FpuIa+F1tos1zwsAh1ZrlEZzlEv+8Eee/4L/x/RMF9dziBKFloJOlBDFEY70FrS7qtbbq9e3f+3mZSTc/LbYeLXS58NGEKoAyPO8PSKIix3HAplBW5IkC2ruWa+uHYOVMiqYV1xxBWeddRaf+MQn+Na3vsUVV1xRUuuXs6GhIZIkYXp6uixRZcd9x3FKpdATTzyRO9/5zqxbt27Za1e1avTSjicAGzdu5Pjjj2d+fp7R0VE6nU5ZR7HT6ZT77s9dFUIQBAG7du3i/PPP52c/+9kCxk6e56VgjAV01bZUN6Csn2eZQXasrYJUGzW0LA0bHbRA3t4rKwJkr+H09DTnnHMOW7duBfaMmq6EamYdwEmSlMfdtWsX73vf+7j66qtJkqQ8j/5c1uq52zZZlWbXdel2uxx33HHc7W53w3XdBddda82mTZt47GMfy9jYWBkZE0KUx1wJHdc6aT73uc/xhz/8oaRfV5kF1Wuy2HpIQCkqazBMkQqjNCo3oNTxoBvBa177Zn79298hvRDheAXoMsqx5jhlFU4814Au6wiOO11c6dCem6cWOKRJh3993jN4zKMeQC2EwAOVGWZNnmXFOC1LpdnyXGzTdZEYaUuYUORIAo6gUOqd4PTTTmX9QWsIXIdOe5YNGw4mjbsLroMQwqjfCtCORkmFcI1T2wt8MqWRwuW667fxuc9/ma989Xz8wCXXIF2HTpzh+T6dqEutGBtU8WyVDpmikWvWjPDAB90Px8VQMl3odk2tdVdIsjgh8DzDIFK6vNdJkuC5NVwnZOeuGT7xqc9w4W8uI06gVm8ZUOH6OK6L5/koNI7jIoraqBrLkjB1Lqv0aLBZsQsDa67nEdZMjVELTH994aWc/LrTuPqazdQaw2QK2u22cV45vbx4U7qqiyMkrjTR6rmZaYZaNaamd/C85z2HNeNh4YgQBJ6PQC3a90sHIiubv6vMhYXsjOV/uzKzNOVB1CwFUiM8SZr2zseyK8xzbmvCVn4DhUYGzHXatFotwqCOlC4//tHP8ANJJ85oNEcxFSwEaZpXHJnm+nuuN4BCXTVNnvfuv+f7IARJlpNkijjPmO10STPzHP3hD5fxyU9+kjhJaLVaK6rDfHPZLQqYWuufPGHwAvKmyKHpP741qxpcLRPwv9NcwEEQMNeOcVxTGfPLX/kfzvjQx5iZbTM0PE6uBFO752i2hnFc4wmeOOggvvuDH/O2d7yXdgxBKMk1BDXzwNRqZnKIul1czyPqdBkdHuHEE0+kEdbYunXrHuDPRg1sVGC5aN8ggLpUBLQfxFaB7nKL9Orx7d9zc3NMTEyUBdvXrl3LxRdfzAUXXABQUmjMAswoOwqgXvNRGRy2YZg3nnoyD7zvvcnjDoEjCHyX2ZkpgsAvhYv6TaP2eH8pgFD9jjWpQQqNJiVXCSqPDbWJHK1T0Cm+Y7y5hpZmaFOz8138sE5reJzfXvR7/t//eykqx0THBdTCgDAIC4/hAT9E/Z+1lQAvC0iMJ75XoxFYUUSxCoz6N1vv07bD5m9v3ryZSy65hJ/85Cd86EMf4tOf/jT/8z//w1VXXYVSpuaolLKM0C1lcRyXEVfXdcsyJpZeG8cxd7nLXXj84x9fAkQbnVtJHU7P80qgZ88JjFrwcccdR6vVIooiWq1WGUWL47gEMHbcsYsM214rfPSBD3yAL3zhC2U+pI3kRVG0gNZqI8/9FGZDW1tYb9VadcFoo4vVaLWN1FrwaEuhbN68mW984xt84AMf4Gtf+xrXXHNNeY3tb62DYSVWpTJ3u10+/vGPc9lll9FsNksgXHWGVNtvwaxtoxCmJqbjOBx11FE89rGPZWhoqLxX1X3kec7tb3977nnPe5ZiVXY/1im6nDWbTaIoIs9zvvCFL/C73/2uvA9xHA9cbwx+7gaM8ULgSEEQuiQZpBo++NHP8t/nfBMlAqRXB+mUgG7P9YyJ0OUqNWk6ccT42Ci7du1gzZoxtm7dzIkPeQCvePnzcRzICwqvWKCqUkJleoUtVNliZfM7Kwtws4Iwar06NyU67n632/Cm09+A7wla9Rrzc9PYW2FrbFavhdFbMJHGJC9yU6UgzWF0ZIKdO6Z573s+wA9+9BsQEMcagSTPddkPDc3StKh0GgmTxeL5gjv809Hc8x53IYna1AIHR4pKlLh3n5Q2NGAhBFGUgBY0G8PUa0P87R/X84pXnsJlV/wNxxfsnO6Ys9eS+XYE2imvodZmbOl2Y+LYzI3GeWuuqxQSR7gorcmVIs9NjdJUCZAwPZ+AA7+79C+87N9fw2V/+gtDw2PUwgadjhlHTX15w9Iykd5eLVebxx6GPrOz0xx7+9vxzGc8mSyDqakZQ98uciTD0C3pvBbvDVov780a2/5u/wd3KpFEXfRSIcgV1GoOhx9+ONLp5TkL4SCpsn964lNKZcRZihf4OK7PHy67nF07U7JM0umkmC4l8D0f3wsBwwJaKVnM9Tyi2KiEayTS8XDcAMcNcJ0ajfoQQVDjp7+4mFe+6mS2bZ8s5zHrhDsQ7cCFzIX1d8x+0DAocrkYcNwfHbof/EJvQFosWnrTPFw3gWmJ1h5JkqOkoNFokgGf/tx5fPBDn2BmPmZkdIKpmXna3S5u4BeLQY10Be1um9GJtXz56//NmnUHcfKrn4/KwHch6SQ0Gz7oIm9BKMK6kYQPw5AHPuj+nHfeeezcuZNarUaz2Szzw+xCY7FIdX+UYOCpLfL9gSBvkajoYp9XXyMF3TjC832mZ2YYHRtmaGSY3/z2IoJayN2Ou2uZp+S6LmHggc4ROHiuGUIPOWiEU1/7Sl75mlO54sq/EscRzUZtQa6q1mbAHNQ2++7C/muroC5cXAtROUdhXqs8Js8jUClSmiiqLrymnhvgCYdux5TTqDcbdObnmG9HOK5kdHwdP7ngF/z7K17PGR98C3PzOc2mQ5IXwh1AdTGzajeP9Y/DvbFs6d9V6zJu27aNX/3qV0BPzVbKhVNQ/3EWmzyrY2yn02Hbtm1cf/31TE9Pl/TOTqdTluKwIM5SWG0EbTnlW5snaPPCLbDLsozp6WnucIc78MQnPhHf90vQaCPEKwEmVXBpqbYWgB588MGceOKJfOYzn2FsbAzHcZidnaVer5fjiI1i2mtcLU8VhiG1Wo2LL76Ya6+9lqc+9akcc8wxZR1PYEFkbhAYtJHExe5PNZJhz9cuZG3brNCUdRhcfvnl7Nixg263W4JooIxI9+eTLWXdbrd0AKdpyhlnnMHVV1/NxMRE6Xiwbawymqpzts1BtgAWYMOGDTzpSU9ieHi4BMr2s2purVKKBz3oQWRZxrnnnltGo7vdbil8s5RZJ4aNSH75y1+mXq9z7LHHDlyYr3TdYMFAloHwIKjBRz9xFh/92CepD40z34kJQh+R98Rxqs+0ABAmQtftRoy0hmhnCbt372bjwYewY8cOjr390bzuta+iXqRG69xEaF1HEnXbhLUaKCOGN0jR1wgIGHBq0ldlAUoNFVVphXQEthLrPe9+B04/7VROfcPpdGamGZ9YT6cdIwpVXWM2YmXmRiEwuZZxhOsWTp0cwvow2yenecub38HE2Du5852OIMsFWZbjBw55nuF7ATY0J4XRWkAaBVUpBBNrR3nu857F5u3b+cuf/05reA3tuTbg0mw2mZ7ejRe4ZJki8FxqQUgapehMk+qcPFe4bottkzM869kv5E1vfiOPfOS96XShVoN6o0mSZub66BzXcY1QpGtp7laV2GhXeF5vrhbSUI/Dml/qfTSaPh/7xNd41zvfi++HDA+vJUk1mUpwPNc4qoq83SAIyDNlnknfMYyqPKPbThgarrOjPcUrX/nv1GoF7bpRQwDdqIvr+Fh8XoJSU0WXolut2IQQpc9loVOMfcMT1mLhfqqNE4o8y3Ect8gH1YSh4IgjDy/Ad0gc5UYhWiiTVyoq+9AKPwyYn5+nXg9xpE+7PcOHPvJJTn3Di5AYcBr6heiZULiyl46wh9zIQJOEQQi4aCBJNJkC1xU4LkzP5Xz//B/wrne+j2uv20ItHGZ4eIzNW3cwPDQKKuNAXFsd8MC0atWFvZ1grA2Klt4U4E9WvOJVZa5Bbe8Hr7d8cCrRysHzvVIz7itfOZ+PfPhTzMxFNFqjdAr6VhDUEELQnpspgKMgSXPanYTh0Qk+9vFPUavV+LfnPR3fgVrDpxtl1AIzKGRpilvQyfI0Y8MhG7jf/e7HD3/w49JTHYZhOdHXarUFCfYrBZpLvR7090r+XexvgDAMC6VIv8wh8zyPVqvFT3/6U4ZbQxx99NE4jmMmieKcsjQpFlguvoSNG8Z5+1tO5+WvPJmrr9vOjqndDI+sReresGNA6EKAqioD36CoSL8tvD6KXOXkKkbnCZoUqbVR49MKtKbTmafRaBGEZlHneR5BrY5SGY7r0W53mFhzEGeffQ6tVos3nvYa5uYThpo+hT7jom1ZtZvG+vtFtR8vN3F2Oh3AqOD+7ne/49JLLy3zPl3XNYIriwAfC/D621E1++xbsGHBhQVndj92TrBzRhzHpULrUtZoNMr8Q1u3Mo5jWq0W69at4ylPeQrj4+MLxHTs92w0binTWpdRU+iJg9h23/ve9+aqq67i+9//PgcddFAJwKrOKvubal5jNec0jmOuv/563v72t3Ove92Lxz/+8QuElqrXvaogm2VZKXxiAVY/WLIibtW+YYFcmqb85S9/4dJLL+Xyyy9namqqsojuUWvtPajO767rrgjY2zqySik+97nPceWVV5bRbSuQWHVk9+fThmHI/Pw8tVoNpRRTU1McddRRPPKRj2TTpk202+0y79P2ASFEed7dbpd6vc597nMf5ubm+NGPfsTMzAz1en1F7bd5trYPpGnKmWeeyQtf+EJue9vbLsgbtte/ei/MH3rRYTLXGkcJfviTiznz058hziFPFbXGsOmjeWKAY/VHwjoENFIKHGEiob7vMrVzF7XAYd3aNbzp9DewYeMocRIT+gGKHEc6qEI0aYHZiOhi44VFkVpilUWlgE6nTa3eZH4+plYPeOyj78Nf/nISH/3YJ2nPzoAMzI+rA1GRioJQZFluotLdLtp18f2QOE2p+XXqtRZXXvE33vrWd/C+976TTYeOIF3HpJEIcBybQ23qq9u2GwGYDM91udvxd+bZz3o6J7/6VKL2PJ4TkuaKdrtNrVZDOBAnUen4cGwur4I8LxT7OwkygdNO+09+c9FDecHzn8Mhh7SQgO+ZZyRLNHGWEwYeQkCWmuY4jiy0NjRKGRXlLFMooZCOJM8hyeCqv13DO9/1Pr7zP99nZHSCTHkkqULhILVJs1HKsEEcp2hX0iEIHObm2nhBzTwrc9Ns3TrFc5/zTB7+0PsTRVCvUdSkTamFoclPxtTNNMBU3Gjoowsk2qP2Fgzw/WK91jpOIerhuDgFt3xiYrzIs00Bt3Cb2/5dCXUKk+4U1EKUAqRxGHzlq//NpsMO5YlPeARDDa+M9SeJRjgax5E4jsSKUy5l1ompNERRhuu7BD502nD91Tt53/vP4Lvf/x5zsx2GhkZQucM1V2/msMNvzdTUFHsI+x4gdosApoPC+XZhU42YDoqSWqt6dvdp21i4cKsq7i4XGd1fbbrpzHhl4sTMK5/5r3P4+JmfJYozavUhlNJG7MZxme/MGRpdLTBziDK1zeI4odEaAeAjH/0YB02s4QmPexiNALwiJGivUxLH+JZmk6Ucfbuj2bljN3//+9+ZnZ0FzHft4qr/+q808rnUe/3Asj9HbLHj9L9nX3c6HSYmJtg6uZVarUZreJhdu3bhOQ5BUON7538fheb2Rx9TRmGk4+D5BS1KKZASB5hYM8oZ738/r3ntG+j+4fJiYHP2iDfqyiRrS8z0+mFfn7UDra7UQrX7QaHyCFSMJjbf1RqtzP6lFChPkpOX0fLObKendEpGoznEXGeeeq3Fl7/8VSbWjvOylz0PgCTNCLzl6ZD7027Zz+f+NbtAWMqqVMoqvdMKw7lur6bhoH+XOjZQUfpUJXioRlmrYjhVlo3jOMuCUlhI5bUgr9lscvzxx3P/+9+fTZs2MTs7W4oU2X12u909wN9i59E/h9k229qkJ510Etdffz2Tk5OlI8t+r782qs3rtNTcLMsYGRkp6dS/+tWv+PWvf83tb397bnOb23DssccyMjLC8PDwAvEge+36r1m13VWV/G63y44dO9i8eTPXX3891157LZOTk+zYsQMwANLmtdocTCs6ZOnYNiJpRaVW4ly2YPMjH/kIl1xyCfV6nSzL2L17N61WqwR2g5yCNgfZbkopNm3axIMf/GCOPvroEkwAC4Cy7b9CiFIdvl6vc+KJJ5IkCb/85S/LmqTL5clWxaIs1V0Iwec//3le8IIXsG7dupIBNOjcFwK9PRU8fU9w0e//zGtOfj0z7ZhGa4ROnIHWtGfnaNaMQJ4s9qd6gS1AIzVlKSRQHHbYYUxu38oZ730/977H0bTn2gy1fLRKyNIEJ6yT5Qm+U0OnWVE3VbMn60UBDqrAlJrBdRXDmnG0NJsBcWrAyNOe/lSuvvZazjn320agSAsQuow6Gd0EbeYirXC9ACcpGAyexPECMqXI0pTR8TX8/Je/4p3veg9vfMMpjI3WCYOQJI6Bot/kOUa1ViGlKDCwQmlF4EpOPPHB/OLnv+ZHP/o5AlPubbbdYWJinDSNcaVDlpmxz3cCXMdHaAfpOWRKIJ06XhCye2o3X/zS1/n1ry/kjnc4mkc88kTucPtjGB+r4fsuSdJzQHiOiyMh7ua4roNwTExSSONAUJh12cUXX8pHP/4pLvzN75md6zIyuo5aY4jpqXmCIMRzgkLsyIgtaanxQt8o/8qFNWdBMzzS4vDDj+EV//4yHBecgvWaZnGxJgEpJFmmcKTcwxGxt2ltg9bzK5l39pkJgdIZUthxBG5961tz+9sfzR//9Fdq4UiBvq1DBXr9XBbjmhE6qoc1mkOjdNvznHzKqfz6l7/k+c97KkcevpGxsSF83y38+TZNrADGC6zktwF2jDYvawVl/5JLr+XLX/oa55z3TaZn5qg3WgS+ABGQ5imj4xPs2jVFliW44Z4lLQ8Eu0UA06pZ8LfYYG2/sxQ3vf/vG9UeVgZMD9zoqD3/Cq9eqJ6Hs1IYuWe6/H+UgOvDZz/3XT700TOZmp6j0RpFK4iSGNf3SRJD41Q6I88zuu05RkeHyXOX4eGDDB039HBkwFvf9k7QOU8/6ZFkBdvHcx3AQTo9qprnSHKVc9/73ptut8tf/vIXsiwr1TDtwmxQxGU5Z8Fy768EeC62j/7ParUau3btotlskmUZnU7HLHK7XYIgYGZmhgsuuICxkXEmJsYLASGFyjVKx2XurefXGB12aTRbnPr6k/nPd7yPn/7s1+ZeFN7nqilRItOybYOeBdteqS21t3p+OXkaIUVe7F+gtUJX8nxrtYD5uTa+rzA5Sw6NRo0s1yRFCQ/XC3AdgU4FH/rIJ1DAi1/0PPyi3pzUoIVEWBCtoRoiKNYlvX9LcfryG9Uz7zvDVeC5lC3Vl1cydtr8xGrZJKtU2OmYMkKwODBdqk9W919V4+2nlNpc1mq0CygFkpY7/zAMiSKTx7Nx40Ye9KAHcfzxxzM0NMT8/DxDQ0OlMwxYEFlbbty3Cz+bY9rfPq01ExMTPP/5z+ed73wns7OzjI2NMTU1Vead2qhglRZqabA2qmevS71eRwjB5ZdfzpVXXsl///d/c6tb3Ypb3/rWrFmzhjAMS0eCEILR0dEFeahJkjA7O8uuXbuYm5tjcnKSNE3L96zAkQVbzWazbJc9r1qthtaG4mvBu+0b1XtuqdNLWZZlfPWrX+XSSy+l2+0yPj4OUOZtVp2U1Xtq52frGNy2bRsjIyM84QlP4I53vGMJju05W6p2t9st9SPsta7VaqWi7mMe8xjiOOYHP/gBo6Ojy1LFrfNhdnYWIQRjY2Ps3r2bHTt28IlPfIJTTjml7Av918LQHBcmo9m6nBrDhrnm2l2c8rrT2D01ixM06XZjtHZQZIyNjJImXbQQCKUHsGcMapyfncP3DRV1x+QW3nDqa3nYQ+9ImkCr1QBS45Sp1cizzDiPNWRK4Um3pOIOTMkQC//uZ2hKIUnTGMcN8ByIUzhkfY2Xv/jfuP766/njH/+OFh5CCzR5MQ9IhM4N9HUcZmZmCLywyAnv4kkP1/dBS5I4ZmR4DV8762yGhuu84dRTkBL8ICDPi2e6cACIXENu6LxOAVIcafQeXv6yF3HdtZu57NIr8fwmw80G8/PzhWBZWDIdFJJMK8hNXVmpJblWdLsxfthA5wl//8d1XHXVVZxz7nnc8Q7Hcr/73Y+jj7oNvu8zMjTE0NAQgeuXTjDPE0zPzXD11Vdz/ZYtTE5O8pe//Z2//vWvXPbHy3EcH8cNCYMmCod2u4sWxrmfRwlaCkLfwQ18XDcky1LanTat5hCd+TZDzQZC58zNTnHE4Zt45zvfwvp1AVqZqGgaK/zABxRRHOF7Ia4rSZIMz3eLey6KTaJNZMLcX6160cZK76hSv0Xl330+W9tlUMHoNS6Uhf1UIdBZhpA+QsAd/mkT97vfPYrqEDlKuAULTRSRe6fcqS5yboOghnCMY1MJGBke45vn/Q8/+8kP+ecnPZ4nPunxHH744dQDWTg/TJ1SbS9dsfuSGl2sczLtMT3d4brrtnDRxX/gB+f/hAt/8zvm58w6sjU0Rjvq4gdh6fRK0ghH+mZNTlaepS7ugxI9J5EWLLg/5pL1O5j2fdj1RgPTmyqiYBf1djFhRRmqbeiffFayeOpfONyQ86nmxAyiPFlKl/3XAqabH6yKnpPHehuFyRE0PAlT58uu6zudnHrdASFI0xicABnA5776S/7zPR9mrj3PmjXrmJ2dpVavm4R/nRN4DipLAI0Uima9QRIZ92d7PiEMWiYnQUiiuM2HP/4poqTLc5/5JARGtEEWj4cB/5CrDIlDrnIe8OAHIT2Xyy+/nOHhYZrNpllQxDENzzPCQsViIk1j0oooR74Mx6S/D1XpZoO88P22XEQ1yxI8z0FnuQFgWpLFGVK45Jmm1Rym3ZnjrP/+Bo957KPYtHETWkGaK+NhI8PxNY6ryJUki3OOPXodJ//HSyHL+e3v/4gfNEjy3CTvN+p04xSltIlWqaznqdYLqb0AwqqcFvRfrTIjn54rcp3iiUIpV8uiDxWDcnHaeZZR8w3dypECJSRx3AWkEdbITT/MtYNwA+Juwhe/dBaeF/D//t/TkUCuIY0S6jW7WDArmG63Q1hrmKFRyGKIFAsG1uIs7FKt8GrqXiqJcFgVWFrcLMCxCo1JkpTPF4BeoshsL4cPhHBwXdM3ksSM28bJsvD71d8ttd9B9OKq8Jltu6VJ2lwsO4dUo2j9EbWq+I8QgnbbqG3e7W534/73vz/HHHNMmSZgKZtVUGyjbP2gdymQXU07qB7b5s0feeSRvPjFL+Yzn/kMW7ZsYWJigrm5OYIgoNPpIIQoKcTV+aU/T9NQ9RyCIChL1Gzbto3NmzeX16dKe7b3vn9+63fG2mtmlY5tOyx1187bltFi7r9Xlg+q1nnuL4VjFW+hV17HHuM73/kOP//5z5mfn6fVatHtdnFdl0ajUbbVij3leU6j0SDP81L8aWhoiK1bt7JhwwYe9ahHccc73nGP86tGS207qurPlo4rhKDRaPDwhz8cKSXf/e53y/tkKcdZlpXiSBb823xUIYzwkj3/HTt28P73v5+XvOQl5XHtffA8D60yUCnClZALlDbKulkBGHZPw0tf/nq2T3aIE0kgBHWvRhyl6DwDNyHNYsJ6QJ4qdJ4jpTlXiTClzKRRjpcqZWrnNCe/+j94wXMfR9w1FE6tDRgOwjpag3S8wtepcX0PrdTAOtRCS4xeQfUZtqJIBoIIIdBKl+NErjS1wHz34IOGeNfbT+NZz3kZWyenUEoQ1mt0uzGO5xHFiiAI0XlO4NYNAEoTPAeEjkmTQn3Z98hyxejYBJ/69OepN5u87pSXGAEilRfrtgwpHcgVuC55lOL4XlneRuqYo47cwBtf/yre/rb3cfHv/0ijMUYc5zSaLZI4AweENJFaiUa4gjxN0Ug8t3cttJAIJ8CRAUJoLrrkSn712z+iMzPehqFPq9ViaGioHHuiKGJ+fp65uTm6XePsVcJc17o/XFy7nno5aDxXolD4daNKnOY5jnDJUog7CocargzQWYe677J92zZue9ThvOPtp3HsMYeQJCmh74IWeL5lNggCv1bcyxzP6wHQXJkSJqmGJFNIzzV1HLTJQVZ2fWEDOsIpnODC5KzqDJ1leI5LGsVICcv4rFZkui/htfeyYIgBrhcQxymBW+QXO4InPPpBfPu8s9m6Yx7h1UEX9ZoT8wyZ+UDiFKBSaEUamzI8CE2cpdSbLWbbEZ/6zFf5/Be/wZo1a9iwYQO3utWhHH744axbt5aJibW4rom4t9vzpcL5rh07uH7bNi674ko2b9nGtm07SeIUKV0kLrXWMLgOuhCxynNBrVFn9+5pwqBGa6TBzp07CQKvmG8pHAa2V5tr4DkeWsVGPyFNC3aDUdx23B422Nd2wEdMq97NKtCzN8gO1Pa7S0WulotqrcTDvVQ7+4HKzQ88b6wVeTV+wPR0l5GRGlluKJa1WkAKfOErP+U/3/EBtHQZG1/Lrt1TjI2NEUVdXNcxIGbhLksTWqK0wPN8Ou1ZfF8yNLKGbdsn+dpZ51Cv1znpSY9ACIhiRT1w8TzBlq3Xc/D6g2m3u9QaTQSC+93vfkRRxBVXXAH0VJFLQQ0hisVJUTtPWgGW5R0Xg/pR//3u/3yx9xbrk4vtL8+N0JHv+5z3zW/zsIc9jMMPPww/kKb2VVFGRekMR/p4vkQq+KdjDubVr3oZJ5/yRq7fupM8TWgNjzG5azeOF+B4Jr+v3zvY12rz3KFAG4qUUBpRFEx3dIawwLRw5w04877XVbqLBEfieQHttllkj42vY8fOnZz9jfNoNId41jMfg1IQ1AK6UUItdJmZ3s3wUItavYYu9lPuVVSOsgdArdgCVsCqLWbVHMZ+xWq7aO+3vXHu2f1Ux3nojfvLjaEWHNjfWKaE/X1VjKhKm6w6nIxitAF2Npe70+mUbbvzne/M8ccfzxFHHMH4+DhCiFJ1tayluJ+sSif9p3/6J17wghfwpS99iT/84Q+sX7++FIOzToO4zOk3uaE2wme3qoCPBXn2Ptq/q+JA1etZVR631i8E1H/vbTkb6wCw+cD2XlXpw9W+ZGudWjXfubm5ssSBbcf555/P97//febm5hgZGSmdCDbH1N7jbrdbAl4bvQ2CgEajwfT0NAcffDAPechDuMtd7lK2y353uRxhe/2BEhSvW7eOe9/bMHkuuOAC1q5dW+Yz12o12u02zWazYAz08qAH2V//+lc++9nP8rSnPY2RkZFS5EprjbCr8ywHJyRLVZlaIxS88fR38scr/kamBEE4ROAZNXxXFqXVMhORTuKszPWu0pUlplSM7wqyLOHZz3waT/uXJ5OlBSg1bFyWcuwtM73Si6b1m2VqVddspgY2wOhIA9d1eeMbTuHl/34Ks7PzBIGHV0SlJsbWMLlrZ0/8rNiXIfaIcvzvRCmh5zM3HzEyspbPff5LNJp1nvecp9FqmN9mmUJqhRsETO/YyciaNaAgiSK8uksjCNBo7nbX2/OWN7+BN7/lXXzr2+ezYePhtNsdhOMROIFRBY47ZKrIi/ckDgKd52U5EvM8+MVzAiKvYRReHazi7Xw3Z3pu54Jnz5yWixt4eKFAShPFc6VXPoOmlFPau7+OZGZ2itbQENJzSKKEmh8yPjpOHEfMz8wyPjbCX/9yOfe/3z1442mncI+7355caXxXIcixUdDePavcV6HIi+RKXawNBEVfl9pEuEswJNFCGUCNLJhcEqWMojFQ1IDtiVoqhdGz2G8mC6ejLMemLEsInIAjj9jEvz7vGZz65vfgez5plqMUDLWGkdKl3e6SZwqd9+ZJ33dNhFWbe5HmOc3WKFlm2CSTO+fYuv2P/OrC3y9IQbBOqyzrBVSyLGOu00X6Ia4XEAR1Gi0XpTQ6y1DapAXMt+cYHmnQbreJ04h169bR7cZs3bqZ4bFRVJr12J1UMJAwT0yWpaBz42CqjPvmHuy/oOQtBphWzQJTK9tvL1h14hyUn7JcdGul9LTl2msn8X4hi315nH1juqxdZkkMpiZTD6gEgaGgjIzWzBThgINLDnz1a9/nAx/8NJOTkwwNDZVKkHZCz7LM5BksMPvaRlzMoGyEAQoVTi255urr+fjHziRwXZ74uIcS+C5xnBP4koPXb2BudprW0AhJkuL5Pr4jufc9744jNJdffjnrDzoEqaEbG29PrnvKir2FZYqQK38ElgORi313qfeWel2lKNp6oN/5znd48pOfzJo1Y2ayUSmOcJCFEkCWZeSZix8K7nSHDXzg/e/mBS98CZu3TpIkXVrNGmmWU6/X2L17N8364Dw7aSMGlTaZLQeVI8kLUFj91uLWH4mtTmJpGpfKp1GSIVyP6zdv48wzP0MtDDnpyQ8ljiEoFnHDI2PkWVIq//VgqVyIg5fANBrZv+5ZtQFW7YvVyJCNkPWXfBmUQrGUVXOYqsB0KSpv1WzOahWcVttXq9UW1Na0wKMaTa2CMRtZGxoaYnx8nDvd6U4cc8wx3OpWtyon7argz0oEbm6M2SioTWE46qij+Nd//VfOP/98fvzjH+O6blk+xkZC7djb6XQYHx8v64tWAWK/A6D6HrBgXq1a//2oRi+r36/ez2q+qKXGVr9fZUBZaq8d9+x9ajQaJaVWa80vfvELvv/977N79+5Sydc6IaqUaBst7Ylt5eW5Wurvgx/8YO52t7stcFpYh+Zy99cCfRultkD28MMP5xGPeAQ7d+7kuuuuW9DvvILFEwTBHqwva9Vr+dvf/hatNS960Yv67p8GHHA9kkTh+WZe7nThYx//DN/8znfoRCm1sIVwHTppgkoznOJ+mwCgKSsUeE4Z/TVjvHFEBqFP3J3hvve+By9/xYsYGfXwHMgSk9uo9/MAuhB4iQVlmJrNgIc8+K687GX/xvvf9yG0SsmVIgxDZuemaYS14voK8uJaiepcAfheDeE4+KGkHXdAKd73vo8yPraGp//LY+gkObWgZkrWCRiZWEPS7eKHNfyaT5oluIUTI0oURx9zKG94w2sZWzPBN875FsND48RpSpLmCEeauUqC6xjKp6lx6hQOXnuOmjSNDTvI8w1AFcYHYUvjGDVzuSByX2XupWmOUhk679V6tmDVHkdIyUEHHUQURSRJTOj7aDJ27NyGg2Z0pMWOndt48lOewIv+7bkcf/xRqAyyLKIeBuQqRQq7fqquI+2fsgDVRuzJHBccpzfeWMq54TPJgrVl1qIGKUmU0uQCMm2C1kmuSFLIREqj5u1HeMSCMQh6jjbf93nsYx/LdVtn+eJX/5v5uTkOXr+BXTunieOUkZExUyYmrJHnhhWSZjm2jIy5YsYxAiClg+M6eEEPt5j73cMyWWacjUJC4Af49Sa5dnCL8otplJDnmak56wqEFqxfO0GctOnOz/GSl7+CMKjz4Y98nDVr1hYUd7eIrlsnki4d9lpoPMcrItcZDhW1YCjW9vvn6i+7Kr+5AdSg49vOYSfaKn226mnf24jpjbXqIq4aVViKwnXzmwXPhZiOthx5jVXH8zwzgHTizNAUPDjrGz/ljA9/mr9d9Q+OPuaf2Lx5c1lvb+fOnbRazRUdXUpbrF6gVE6WpzSbIzhSsfn6bbz//R9heGiEBz/weNJcEQgHpTStoZHCm+SQFFGF0ZFR7nvv++D7Pn+89E+MjI6W+Wx2UW09zlmW7RWderFI+FJOjv7Pl4vmD9qXbaMVi5mbm+Pcc8/l0Y9+tBFXyFKcwNYyg3rNI8vNqySD29x2lHe/+6286KWvYOu2nTRaI0ihmdo1yVBraIHzBHrTivGaKUOC1TkUgBSVG08nqhhkVzY+7Pk1+4ZCq56QS55rmo0hHASbt2znox/7JI1Gg0c94t7mvKQZ0B3XpRt1CcOQcjwVypQOWCBOXzU72R148ugHqlUjZjZHpeqY6Qc0VVuOkgt7Ut37f9MPdvqtSnGsfteOv0mSlGDEbnahVo2+WXppEAQccsgh3OEOd+Coo45i48aNZVQrjuNS28DOQcvlQO4Lm5ubK8thtdttNmzYwOMf/3hGR0f50Y9+VAq/2ZxIW4al0WgwMzMD9CipPXp1b37qH3eqYlJVwD9oTOt3AA+KdFeZTdZp4BUK61Ywqho5rB7LRoWqDrqLLrqIc845h8nJSUZGRkiShLm5OYAF4709F+tAsVFTu3ZwHIcHPvCB3PWudyUIAtrtNvV6vaxPuxJzHKe83mX9y8SAgY0bN/KkJz2JM888k+3bt5fR+KpoVb/irj1v+7elXP/qV7/CcRye+9znlorMYBwDs7PztIaa5MBsBz515mf48Mc/gevXGB4ZQwiHNMlIswwpBV4h3GSo25DnCsdxyTIzLxqQCgKHLOlwxOGHcsrJr2BstGZy25TCcc08YNYK+/cZqDqbqvdWOmaue+Yznkhnfp73feADtIbG0AJmpqYZGZvAKeuAFte47JYmfpcrQ1eMkhjHrRH4dWand/Lu93yQMAx50hMeyux8zFCzRpTEhL6HXw/Kcjie4xbA3kcKQ4O93VEH86r/eCkbN27gi1/8Cp1uFyFdwnoLrR2iJCaNI7PWUgIhnHJsqjp0pJRIt3CmZZq0ss51HB/X60XPgVI4B0yE2KjIDmYc5nmOTjXttqkI4DsSimhqPXRA5yjV5fn/+kye8bSTuPWRa4giTT0UuG6NLEuMwvAy9944zA04NQCneN+0pAiMmHKAEnrVW4S5byaXUplIIKCFBOEgHPD9m0a4p5r/Xq21PDzc4IUvegFxkvPlL3+VyW1bGB4aN8GZyIhntdvz5djlSL+o8dtLjfDDkDTP0ZkmyjKEMorKrpTgmBxkpQwo1I65JonKcTUIV6KznCg27B5XOtRCH08KsjwhjhO2bZ0kqPm84PnP45WveBHfOu9HxN2IvJEx1GyRpnHRL2SRvifQjkAq4w0ROscRAiUEll2otMDRbgFg9w+OOeAjptX8n34vbv97KwENS0VNbwiVt38x1R8xXWyRdWCYzSmliJSKSj8r6BU6RUhJlEX4QUgOfPeHf+Dd7/8411y3k4MP2cTWye1GGl0I5ubmChpURhCEpEWR6j2XlL1ISRB6dObbKKUYHmqRRjHtuMPY8Fp27pjmlFNOZfhD7+f4ux3NXDuhFrgoclNXDAgCM0BlWUKr1eD4ux5H3O5y1T/+juuMlYtJG0Uwg76L47ik2fKS3HDDgene/t3/bxzHDA0NMTs7i5SSVqvF1Vdfzc9+9jNOPPFEGrUaoGjPdag16sXkVqTDeDDfhrvc+VDe9IbX8qpXn0KUdghrTRzpkyYxspxcrBhB/5mogspr6CGQI7VCFDTf5Xq0WkbT3dz/kHa7jdaCodYwcRwzH8eMjaxj27Yp3vHO9zA+Ps7d73Y72l2F72rSLKJRq6ExOSpgqFnCZppa3tAe1hdVXc0vXdLsAqlaL886dqqLxRvqfKsuxAdRepfbn41CVSN/VTBlwZrdX5oaoRYLTKxq7bp16zj44IM57LDDOPLII1m/fn0JcoAyx9bupxq52Z+WJAmNRqM8p0ajQZZltFotHve4x3HEEUfwi1/8gt/85jds374d3/dLcKWUKoWG7DWqRottBNECVXtu1UVyf0SvH3hWP6/eQ/vdKhi29UbzPKfT6dDtdlFKFYqvvehr9V7Z31pBqSuuuIKvfOUrTE5O0mg0mJubW+C8cxynjHoHgal7XVUqtkyrsbEx7njHO3LPe96zBMU2/9RGnruFAN1SppQqI8L2etjIaZZl3Pa2t+WEE07gvPPOK6PeURQxPDxclgbrt+r1s3Nqq9Xi5z//OWEYctJJJxUR5IwsB79mQOnMnOaz//UVPvnpz6EUuG6RW2tS+XClg+s55GiyIopeD2rEiSLTSdF2ie86xHEXKVIajYCXvuxFHH30JjqdmFbdI47bBL4pVba/lzRVB4ntkyXlW4DnmjnrOc8+iSuuvIzvff9HtIZGCX3PgD8k6AI8L0jdEGgBmda0Z2YZGmoSd+fJc83o+Dquvv5a3vXeDzI+sZb73/dOtOOcWhAwOz9Hq1nDDVwUGRITqa/XPVwXXFcSJbBp0yiv/I/nctxd78iZn/48P/jBD0mzLqOj4ybvEE1Yq6GSgrIqWLBmNLRVp4z4mvPvRfTz3JTC6V932nMTWoCWpRMkyw3otH3Td4wo0XCtwezcDGmSE3ouSRohtOL4ux/Hox/1CJ7ypEcRBoYtbvJzzXU3OcJFe0QV8C90CdtXeZ6jisipEIaCa5lrGo2ytXSL3FgLqFVmaqI7ArTTiwjnmgqV/Kazarkx13MYHZY89znPxPdcvvzlrzC5fTNDw6PUwobJvfZM38ssnbpIUTBOB5f5ToR0HRzp4DqBSa2SgNIoclQOuVIorXGkREhp9DSUxtGSIPDIRGoq2gBp1KUddxAyxw8khxwywVOfdhLPfuZzGBmGJO7iuw5JNyrOpbghaFSxpkMKlDZ5p4oUIXuBNq1MdHd/+2MPeGBqbVCEqZrvBCyYYAd5chfb16D3Vxwp1nrBZF0FpXaQGUTTubkj0XuaKgZwrDMRtEA4Lt04wgvq5MCPf3YZb/7Pd3Pt5t3Um6MIx6Pd3k1jfA1JkpAkCSMjI2UO8HKnmeUJItVl2Ydux5Q1cL2QTpTi+XU6nYhXvur1vPMdb+Lud799gTdM/oFVas2LfCmV5zQbDR70oAeRfz/nz3/+M41Wk+HhYaSURFFULpCiKFpQh3Ypq0aJ+t9f7PuDXq8kit8f+bEeeEsBO/jgg/nTn/6EEIIHP+CBDA23aDQaxpPsGbl6KQRaSZoNmGunPOiBx/HWt7yR15/2JtK0g8pASg+BU6Hkli0x0dIir9SEI02UVKKNc01rQ/8AlkokWrqfG49v7qSEYUieQRQlgIPv14mSHMfx2b59mre97T287nWv4h7H3xYBdBNZqMhV6PI9+SNKcDqweatgdKVWjYranESrcrqUI2+l41s14trv2e/fz2KMgmqEr79d3W4XrXVJ57UCPcPDwzQaDcbGxti4cSNHHHEEBx98MOPj4+Xio9s1EXm7f9tWm5O6ElXffWEWAHc6Her1eqnwCXDssceyfv16jj32WC688EL+8Ic/sHv37pJhYdWB+69xdZE/aEyqOgn6rX+e7N+q37NgTAhDk7bpN75vRFzWrFlTUlrtfqvRbHsvXNflqquu4rzzzmNycpLh4eESFIdhuCAPuppja8sV2f1Z6vdRRx3FIx7xiLJGqbVqdNXWNl3Kqg4K208s0LV23/vel5mZGb773e+SJEmp8mxp5oOs6rABQxkeGhrivPPOY3h4mBNOOIHhkRGywgG5c3fCjy74CR/9yMfIc2XyWttRcZ81Urp4nnlWsjRCo6kFLkHgk+cZvuuhAxfXlagsYX52iqFWjWc/6+k8+pH3I04UjXpAnncJA5c0jfA8ud9z9avPd/V6lNfFgTTOGB0JeM2rXs61117LH//0Z4aHxlAa8gyU1AudkZX2BnUPpRKC0CPqaOq1Gkkcc9C6g7nu2i285c1v58jPfJwNB4+ggbBeJ86TsoxHnmvCBbV+JWFRNiXJ4P73vQtHH3NbfnLBw/jil77Cb35zMZ4b0GwOMTc9he/XkMJFuI4RiyzWsGkWk2amrRYsmOdrT8p9PzjN8wxlawlncfG8W4cTmFxVRa5S5uanaTXrZOTE0TyH3WojJz70BB7xiIdylzvdmjwzl853Ics03cg8z27xnAx2ztm8U0VROR1HaLQwAoiBB4Hr4brSCD8W0dEy3UeYKDKYCKkQGt81+iLd+QJoZ5Abfc79alr3yljZ87XjppSmxOmhG1r82/OezaaNh/DVr5zF5ZdfyWwUkysIwxoUAF4hAIUQYMSuKg4XrBPGgD+UJtcZrcYQaZ6Qp8X4WOnHuUrJoi6ukPiuCzonSboEAWzcuJHDj9jEM5/+VO5x77sTepBlMDxUpxb61IOAdrdjBDRFQaTWGGeDCdYihMZxXQSKRBWRemECq8J6HPYTjDnggWm/R91OmNZrX5Wht9+vUhb6F0+L/b0UHW3J9lWAsB08bZsGTToHXtS0Yv2dTQBIXL/O1GzEZZf/jbe87d1cfe12wuYYwvGYnZ1h7cRBdLtdsiyn1myQqrzM+SlzcNC9XZZm6KBR1GGoaQp+z0zN0mw2adbq7NyxnbHhIaQnuO76rbzmlFP5wBnv5g7HHkGnE9OsBzg4TO+eYmR0FDQk3TZho0EtgPve797Mzk2zc+dOZmYwtfpc30gGaU2SpgQrcP1UQemgPrPUPV1phHTQd8Asunbt2sWGDRuYnp4uI0BDQ0NcfPHFNMIa97znPWkNNfF8H62zQhDAlGOQrker4dGNNSeeeG/i+DW86tWnEAQNgprxlu9ZqVqVA6DWRsRACBslNRHUomsMSh41e9hjnwtfl75dKelGEa3WMI4rmZ6ep9Ucpl5vsGPHJIHv0mqNcOllV/De953Bm05/PZs2rKfRqNOJE+q+EYXo7bjyt8BM7LoHTnVfD1w+5rtqNqe/0+mUdFat9R5lOGDPZ2I5qqsFefa3g0BUdX/9z6CtMwq9cddO+I7jUKvVaDQa1Ot1giBgdHSUTZs2sWnTJkZHR5mYmKDRaJS5izZKZ+ucVgGpNUvJtH/vT6uWJbEqnNVcyjRNmZiYYGJigsMPP5w73/nO/OMf/+Cvf/0rf/vb35ifn8fzPIIgoFarLagVmmVZWT6mfzzqBwL9Y5fd+hWNq78Bc38s0LMR3PXr13PUUUdx6KGHctBBB3HEEUcsyOGqijIBzM/P849//IOvfe1rXHLJJYyNjZXsl0ajAVAC3up973a7ZYkXy5iRUnLssaYEx9jYWJm3WlXMtVHlldShdV23dBxap41tvwX9QRBwwgknMDU1xcUXX1yW15mYmFh2/1EUMTQ0xNzcHLOzs6xbt44vfOELbN26laec9C+MrRnnmmt2cv4Pf8RHPvpJdu3eSWt4jDSOUFlMvdYgKxyMeWaEn3RuFtiuA93ONGlS1B1VOUmmiaN5JtaM8LATT+B5z30mAgh9SZR0qHmm1IznGd2GXo7h/jP7/JWiT2Kh4Fk9MG048oiNvO6UV/KaU17P7qk50kzjyFpF4K8Yi4QlkkIcdWk1PXZObmZkqEVnfgY/8OjMRYyPruGPf/wTL3rRi3n3O9/GbY/aSKcT0WrWSLII1/WMY7uQgbeOb4WD53rFvOkwOlzjUY94CMcdd2d+8YsL+dEPL+CKK64kz1PSLCXXCWQUfcbH80wpmjzPSyqvUqBUTp4tTL2xfVpKieMKhBR4rlc4lEEVgjlC2HG8s5DlQIZWCUccvokHPPC+POxhJ3C7294aPzBA1JSmU2htnCOeU6ROKFtjcxHHZLGOtJ9KmyhbRDpNf4zxXUGuNRptEsh0XixBFQphooRCI3SGVII8i1B5ikQTBGKxw+8Xsw7OkpWjQWUKL5CMjwc8+UmP4j73vAfnnnse3zz322zZPsnuqV1Ix8P3w2L8NWNKnKYkSUzg14waro2WA47rFswGiDrzKKEQSpOjcRAIR+IUKXDCgSztEscZoe9x+K0O4R7HH8eJD3sQdzv+zrQaHtOzbRpBA61B6AyVx0zv3sH6DYcwNzdD+WyIIkULgRTSRErzHHSKymKyPDIMiWJ4V0qXRRj2td1igGmVogWUtJyqN82Cw35gWt1P/9+LvbcS0AE9YGq/269ceWBb73qa2l9GDKmMNGHSCuMU/vb3rbzlP9/PZZf9lbF1G0lySZbnhPVaSY0z+TAO8/PzCKUZGhoiiqIlW1Cr1YiiDrOzswRBjdHRMbrdLrt3T9FsjTDf7SDJGBlZw3XXb+W1r3sDb37TG7nTHW9Drs0AODI6Slbk7oSNFqgMHIfRoWEe/vCH881vfpOtWwq6sXTLAu+W4rWcLQZMB0UU9pbau9xvsyxjfHycrVu30mw2y4V4o9HA8zx+/otf4fshd7rTHRgZHUZISJMYz/cJQw8QJFlMLQjQwOMe9yAc9+28/W3vZvfUFG7QROFWwFsV2Ck0OVIZMGpSVoTxaBriR5EDsrj1rk/lOmlZvgxDj263y8zMHGFQY3RknHYUEe2aptkYRumMmdmYsTXruPDCSzjt9P/k7e94M4eEIwSBX1B5Fzl45f0qOO1rITfp7HYLMws8bP3KmZmZMgo5KEe7/3lYbgysKrEOAqb9OY7VZ9C2odFo0Gq1qNVqhGFIo9Eoy0YdeeSRrFmzplQ0taDFqnXanHObg16lVlowZelvVaElG5Hc32N8f3kUK+hkX1twmuc569atY/369dz1rnfl2muv5R//+Ad///vf2b17N9u2bWNqaoq5uTk8zytZI9Xor70+1XtYXcQOAqdWPbc/qmW3RqNBGIZMTExwq1vditvc5jalU8CKFFmqrn1djYDbHM4vfvGL/OQnP2FoaKjM13RdtyyvYucfy9qx9VPtfbNR1fXr13PPe96T29zmNnS73RLA1mq10uFg6bvtdntF4NSKL9nrUqV724jq8PAwJ510ErOzs/zwhz+k0WiwefPmPVSt+x0wtVqNK6+8kuHhYer1Olu3bqXb7fLtb38bx/V5xrP+lYsvvphTXvMapmfmqDeHmEq2I6SH43js2rkNYMEayXFMroddZKdpynwQGoE9nVEPQ+5zn7tyysmvoBYUegWpwpNG3T5XOUhBnmVId/+yT+JCvNBGqapRdHNeGQJlVIW1wwPufzwvffELedazn0djaJgspZin3IJyWvxWGxVYTU5OznCzxebrt+M4Hk4Rley2Z3Cl5te/+CUv+Nfn8+Wv/BeHHLIGtCJwzdyaZSa3z1I0w9BEy3OdmSihVgS+iwwkh99qLYdteBSPfNiJXHrp5Vx40UX8/Je/ZGp6mp07djA3P4fQpoSNI0x7k84cwnUIXKOkH3gOue5R8sOaAaFKpcU1MKVXnCI6l+e5oYJmOXEagdLUmzUmijHxNkfemmOPOZrjjrszt7nt4QwPSZJEo/KMmm/OMc2yYlxUdDuGcea4LrnSy1I6VW5KF6E0SAVKkKWKqNum254jjq9FI4tzUChszqzRPNGq0CCRhhnQmdrJ7p3biDtzqPrQfqeU2vHfRkvtfGhpyEHgkaY5nufgOHDwwWO87KXP5qEPeTBfP+tsLv3j5ezYtYstm7exe2obShlno+d5IF3SuFM6tKSrEUiko4xwVZYhhcAvnHRZlpBlKTrVxHlOnsa0GnUOOmSC2972NtztuDtz93scx1G3PZJGQ5IrTRy1GRmqkWcpruvhe7B751ZqfosrL7/EsCgqeU9CmHKQjqRwfrpIMtIsptOeJc00niNMWnAVpe5jE3me99jhBxy9dCFAtBPzFVdcwQte8AIe+chH8k93uFMJfqqdxi44lrN+ysxix1+0ffToQ9CTj9+2bRvf+ta3+MQnPsbExES5wLATVVUO+ua0OMkIAo8ojozHzpF0uhH1Wp1ubMRmLv3TFk5+3Zu48PeXMTZxEFGW49WMEIKjLeWz7zysypzqjwzqvu+YTegi11GbJGuhTe6I7zkgctK4jefD7qnt3PW4O/LW/3wTxxx1KCIz7NU8NwJKKDNoSxTCMQ/Z5s3X873vns+2ye2Mr1lrAKk0A4upHapLMY5qrcPFlCn3BlguFxEdFDldCYi1n+kcJicnuc+978mJJz4ETeGJC33iOCoWTT65NsnteW7yRS789R94xatOZmo2JmwOEXe6iKLOZLfbYWRkhPn2LJ4UJa1Xog112tJ8BaD9BVHI/khpSclZEDG1f1eLWNs8IA9dqkMbc6UiTjqMDjfZNnkd9zz+OD70wfczMeGRdFJada9HqdOQJF18zy88tLqMnGrRi5ha/3kxuix6jW+s7c3zfSCOv1mxKOl2u1x99dUlTdSW07CL+EGgEpY//0FU0GqEshpJq5Y9sAszSxX1PI8wDMvN5hvauporseVoqzfW9vf97R9LLHCcnp5m8+bNXHvttWzZsoWpqamC4ZKVwK/dbi+IOlbvhXUA26iVnctsbU5LlQUD0sbHx9m0aRNr167lNre5TeksaDabJbXYsp76xX8GXbOZmRm2b9/O7OzsgrEaKOf4QXRi+6+dd/M8p9VqsW7dupKmu7/veRWw5nnOrl272LJlS5kzu5xjwzp/7H7SNCVNTepDqzXM4UcczqV/uJLLL7+SOM1pDg1RCxvguEjhLnTsYPOxe4I5eZ6D1Dii56Bp1GocdtihHHboBny/N1oLYRkmqpzfDS22jw2zD6/fcuszrTIc10VrQa6M4uuWbbu44s9/YWpmDs8L0Ah0biJwqGqpKIXrOT3HjHDwCkBvFGwFniPpRm2GmjUOO2wDE2uHULlGqcSAC8sYKnMkbfm0Shtx0Nokwojc1OW2tnXHPNsmt/OXK//MH/90BX/761/ZvGULs9NzJFlKnpscwDxVdKIuKtM4nnnW8jw3uaieLJ71GInADz0cKclzUzKkXg9ZMz7OmokJ1k5McKsjDuMud7ozt7vd7Vi/ZgzpGPDouBT5r2CIpxkLL7sw83KhR2JVXLV1WEPJuBPFNVFF/xI42PDazFzE5ut3sG3bdlReqHXrrFxv9YCpWT9YVe08j0mTLpsOPZhjbncbhoaaZX31m8d6z4FWAi0MkM4RqNxcivn5mL9e9Xd++ctf8+sLL+Laa68vWSRJkpClmiQyee+aHLcQtbJjpM2Zd12XoaFmWT5r06ZN3PrWR3Kvex/PuolxNmzYwJqxJp5vnPBK50CGKyFH4eCSKbj6H1v50+VXEbVjmkMjhurtUDr6PDfA8T086SAdCMOAPEvwfZeJ8VHGxobNmnw/2y0amD7iEY/g9sfeoQSmFvDd2PyfxXKcBlpl4LReFM/z2Lx5M9///vf55Cc/Xkr2W0GKAwGQGjMjSJaBddxOz08z1BwhycxAdckl2/j3V72ey/98NeNr15OoHO1K4jQiTzPqvmeiUcsAU7DfGQRMrSdzITAFSKIOgecR1lyETnBczc5d2zn6mNvw3ve8k9vfdhMqNTSX0HdAQBLF+EFAnhT9wvPYtm2Sc8/7Jjt37mbdQQcx3+3QbDYLzyLlQGEpfFrrBTTBXvsH296A1f739xaUVt8P/RozMzNM7d7JAx5wP+5z33sQ1kK63XlqNbsol2ht1Ozy3MwPSQIX/e5yXvEfr2Vqpm0Wm76JIDeGWuzYtpUwDI1IgVYgtMlBWABMJRp3QShyeWC6p4uzqOBmwGOp8mgmwCxPCH0P1xOoLELplCztcq973YO3/+fpHDzhk0Y5YeiQxqaeaxj4pFGE57v0ZlZZNLNcWoEAR5vW7S+7pQPTqiKhVbi1QGS5RSMsf/6L5Y5VWS/V13YeqDqNBoHb/t+vxP63AVNrVbpxHMfMzc0xNzdHt9tlx44ddDqGsTI3N0cURSXNt5qaYiNWdv++71Or1TjkkEOo1Wq0Wi3q9TphGFKv18sIdlVVdxA1e7m5tv8+9tO2+wWTBjFY7CLPRryrdOZBdXj35T23DpVqKRkbpV4JY8c6A+w1tHTCkuqsTZ6b4xTDsIY0NeDH83rDnz2MDXLY19KBtJiW3SJnLk+NkzfwTGmIXluq8ZG9nwv3tQkhUFmO47qkWQpI3GLR3IkNYHWcYqxXvXOGHtW0XH8UqrEmz25hHChNzG+DkPK08zwr+rSdz7RhGC0Apj33p0aiVTEXWkyvQRdMYHJoR4rZqWm27Zhk5/ZJZubmmZycZK7dYduWrVx73WZmZ2ZACFzXRJHtmgXMunJ4aIh169cyMb6GMPQZHh5mzcQ4hx96GAdv3EAjrJGT4zsuYSghM+crZaUmqNAm1ClU0X9659EPTLUtfVIFplSm3WKNZ/uRLc+ngCyGajq21gvvEYCsrk8FtNsZvifxA6NWK/YXl3RFpkDkLLjPypBhtRIoIXGkeRajrmK23WF+fp6ZmRm2bd3O5OQkf/vz3+nMt5mZmaHT6QCU4NNxzZgbhiEHH3wwRx55JGvXrqVeDxkfn2Dt2mG0MOt0ixUtKJUiRxSMAKVMNQ2Jj9Yu3SgH7eJ5ZtyoZmMVQ8rC/p+ZtZ/nFdUOdF4Zk/YP6faAB6bQo1RZD8KVV17J85//fB7+8Idz9DHHEsdx+VlVkr5fFXeQ3diIKcVxq0JHWmuuueYafvKTn/C5z32GZrNZ5q9UqSg3VbmBxU2QFw+9FtCJI4IgJMoztHa55NKredOb3stFv72cdes3keSKXVM7GV87RpJ1EVIj82JBMAicQiEp31N7XfgdXQGnZsATuuDOF9/I8xxPSoLQYefkdoZHmrgeTE5u4x7HH8cH3vsubnXoOAJIY4XOc8KitlWeZTiuNLOrI7n22mv5n//5LpM7d7D+kI0m4tLtFUiv1rhbLNq+LLV7LyblQSB0bwFuENSMGMhQk+uuu4aHnPAgTjjhQeR5Vi7iPc9DaTPziMqQkwM//umlvPglLzdKfbWQ+fkOmTLy9yaPzs4o5viyBKZFu3BtxmlhfQC0nDgshaqP6lm+LMSMCgVFC2R932d2ZopWq0HU7TA0XCeNuszMTvP4xz2CN7/htdRDSspZlpoFGUCWxbiF+iDC7rNXOw1WgelKrFpupfpe9V9rK6W2W6uCnUFm8xP7I6n2N/05nv103725pv9bgGn1735gPgi82yjcoJqaFqDaOdXu0yrXQi/Npv/+DKJ1W6Bot2r7Bl0fm9Ns92/vrf3ucnV0bR/pb5ttz00RMbWOlOVK7yxm9hwtZbiaa5mnWblA1ALyTKM1eJ6L6xqQWrXq6WphynXEaYTWgsDzcR2Tk5/nZsivLk8W/rZ4z7xacIz9DUwX9DFtGqZ0we7wXZSCJM/wPZdc5SbpxK5PRFV9XpXzmgGL0lB+lSjOTCKFYWQBpKlGonG8IhWlcASU9R/LCFrv/IVVMSgc71qL8mOlC+k+SVmTGw2ZgjzNyXXRf4QgT3LaUUwaxWRalc+sTSmwfSr0fBpDDZo1H8eFTidFCG3urWeanBVNdArtKkEVSJpGaF0FpuUHlQh5cecrCoNaL4yumz/M+k6jiyhiz6GiKpeqDFqI4pnUdh1m5pgwNEqwWQaOVAgHup15wlqDm0/MUCHIyz5k26HpRVBF6RA3Kyl7WeIEuu0OzVqdLOvl4kNVFV2XuMKwTixuKJxRRcUWrTXkRUBOGHq1SbWyEW9FnmfkSuI6NQMmi+uvFKiKgKTWukiZNnnZnueSq0KBXxqPVq5MioQomAD7w24ROab9i5GqF7VfkXGxHNOl9l+1vV48FFFcm6/heR5ZlpUdrT9n58CIlPbMdc3D3o0j6s2QTqrAcbnsimt453s/yEWX/JHxgzYSJYpM5axZs4Zu1EGTUa+HZHlvYbAS+p4F7gutOvsVA1Th/g0CnyjqoLowOj5GN+qQZJqx0YP4+S8v4oUveikf/9iHOGT9KK4vcYoiMmmW47kuKk2RnkOnqP/32Mc+lnPP+yZbtmxh7dq1JX3XXAu3VOu1NMXqwmkl9+6GfmclC5VBn+3cOcmmTRvYtWsXhxxyCD/68U/QWvOQhzy4mKiNS1IKSRwXxbYdlzRVuL7kAff9J977nnfy4he/mCTtEgQ1utOzCHJcx2NPfC6LkdfcIpOTXH1mFsxwK4B8djAvJjyhF6gEd7rzuL6HF/gICbNzXWq1gGZrnLPP/h+atTqnvPrlhAF0IqiHZjGmdErgB6CrJ7CQwMsKW/h/3arCMHasswv+fgXSfW12Mb/YuGxFiAZFzKrgazE70MbjG2PVsdWed385kipwt9+1ObOW/rycs7RaKshaVXjKOhHs8Wx7qu+vdJ61TkPozfe2zUKIZfufdZxUz7kfaO9vs+ddjXzatg0qF9Nv9vtVhWJ7Xd0ix1PlOVoJvLC3pMvSHM+tnGP/JReQowkDE7l1UGilUbkydFbBAi25A8H6+02a5ni+UUj1vJ6TS+ucXBk1WrfItwRKx6wogKd1nBtkKBB9ZWWiborreAhpaK7V4UJX9JSMFXPjgjrZxRGFQGtlIqwFMJNUgH8l0igcCBwHBXSjFM9xCWoOtXodSd2oomIAptBF6ZXiDC1GypW5/61GIT6Zg0p7FG7HcXCEQMjKOQmKNhbjZv8zOoC2XX5UiciLArAjIIljHEeU0evSMVygNKeUmzA/EnLh+sF1IUscdG7OSeVp0edN/vXNP3rbEGNl3sFcOyMWWbgstMmDdoVEOIK6D3W/TtzNCXyHRj1AiF5pKgsaXVNkAaWMwrQQJors+mb9lasULUwfcKRXJipppckyhZAa13VwHB9QZHmCowVohzTN8AOJpAioCVPTwEZMDcDOEMWa3ET9C7q1EntqZu5Du0UA08X+tgskO1n11zS9scIUK5k8deEJtZNytQh0t9stVR77J2pYXrFy/5vpgnlmao5qzER36RVbeNs7PsjPfvU7WqMT4LrMzk4bVVsHVJrRbNXottu4ro+hSVpKbt8CiUJVruKp7AFYGCw1b2iioOjGHcKaz9zsLF44jBeETE9PMzZco9Ec4Te/u4STnvZMzv7vrzM+FiCkjZwpPM9Beh5aKepF/b+DDjqIE044gXPP+zbbt29nw/qDybKsFBCx0QCbE7THFbuBEdGlfrsS+u5inwf1GjPzM+TkgGDdunWcc+55SOHy4BNOMB7YNMX1ZKnoKwUEvjQ5EJ2chz74OE479WTeePqbqAc+w0N1kjQ3dJ7ywHbIA4TsTU8r8pjJAd/riVBQ7BPs/Gy8z0oADtTrddpRF6nBcT063YRaENJojfOVr55Lo9Hi5S99Ls0GdGMTPU3insASZctNn9qvI+r/MhNClJExCwyq9Me96buDbCVUxqWYBcst7P83Ac+VWL9zsCrYVI0a2rlyEHC1n1Udu/2g0t4X65CtUlWrNqhkWnVuXm6OtbTXMg+wAuq01gPL3VSPs1hE3V6L/d0/LF3YAuH+67k3Ohj272rUOU0TPN9BOsUqX+eYtAgzhmpdUS0vAUiRF6fNgtnmV5rFqCZHobKihqzssVdEZRc3hw3qK1ZXIM/N+TieyTOtOQGgUFoVQKHYRyHeV56IlpXor8RUD8hLjYOw1ns+pF+ESXVP7MspItU9K65Vea3722xLmpmPcqUWPh8Fg0cpgdKaRtg7fqYpUqMEEkO9FnohIJXFfh0HcBzi2NShdIRb5gbatU2egVtEz0wcQJWfG2pzRa1b0Js39cJn2V69QeYHAVplqDwDaSLQgoI6vGA67qV1mR2nxdk4uNb3VPwwUylgzsH3lhcn239mU/JEj4lmn++ig0XdtlHZdV0C10pSGedPnmuC0C2vnHkee4481+vt0imIf1a1WGmB0jmONABYCsf0dW3o5UL4hj2Q2+tY5BE7xaIKo/5bOlK0qcSgtXkCtNZooXBkkeymTX/AcRBFNFgt4N/tWzvggam1QTQc66Xt94raCWdfiB+tYAdleywgtce2KpZWEbI/2ntz55oKDVnSJQhraAHzXfjHdVO8570f54cXXMj42kNMLS2VMbJmhKjTYb4dMdSs47suMQ5lDmHfaVQXSNb7Nig6rYuBuGd2cMrK11JKwjBkamqKer3OmvGDTOK4EqxddwhXX7uZZz7rOXz2M2cy0gyp1yCsF2pprlEJbg03SxXHQw89lEc9/BF8/ez/Ztu2bdTr9bK4eqfTKdSFvTLp3tre3quV0rX2dnFf/Y7nOczOzprIgpRE3YQNGzZx7rnnUas1uNe974kQDirXSGdhlCBLU5p1j7l2wtP+5bG4ruS0095Evdkyhel9h1xp9gCVhZADfSTePRsqEb3Elb4PCzGIkvLb+6TUk0DRaNRpt9ukqcmrataauI6pp9aomxy2T37q8/heyMte+i/UAtOD/NCIutRCf8ERddFuuYjnd9UWWj9jpVq7Tim1h4rtoN8vZTfWObfcs3Og0qP3t9nzthFFK2xjAZJ1LlSp0v0UX+ug67+G1TGkChYtUK06hKtOjRvCTlosIjpINGnQ/qMoMou8Sv3dflr6/rSqM8CmiFSjt8tFfKvXv7q+6dUnNaXPBJo8T9FK4DoKKT1czwNtqL3VKJ62oBUL8g1LxdDzJG41ylooshdnMwB/7N/1y1J9RAhhMkWKKJ0QxblojdIZSpn6rApT19vSfheoD1XK3dgFeRUkOUISJybJ1HFdXMch1wopHFzf7HtPs6yc4trvUSdcldfRsakuFWeN4zrggIMoHUuO4+AKUaoTKW2UW13HN2VWhEYoZUCq6l23MKg4nirCTybFBZRKi8MvdDrZ86hGQgffhD3f6kVNNQiMcyNXoDRKZCb6p8zxPM+GbDWIQlUYg7Z10WakgxQG0TqOUzgPNI7j3ryeEgDdB6EqQF2TE1ZUva3omCwSeqs+MwtKtbbphyaib8X9zPNuasqLIiQtBURFnVpTXMaFXCClMPvWEikDdFGz1nUlCMt4MvfZEQwYG8AIklKoTZtzMaJgEildlAaV6x4FfR/bAQ9MFxuYLPjLsmwBN7s6cK8EmC53vGUXVqKX/2qpxFbWfGZmhsnJSQ499NCSAmcndUuNu1lNKCMqk3bppj7XbZ3ida9/GxdecgVr1x8O0sOpwfTsNK6jcSUMjzTwkMzPzFMLa6QqN6psRRHhauR0j8MJscgI1++L7amdeb7D3PwMzcYQrueRJBlz7Q5pmtJsDjPfnUF4Pr/57e958Utexhc//3HSDHSWUwsdsiSlNTREpz1HrVYz+b4qZ+PGjTzsIQ/lhz/8YVnnzpYOqNZq7I+6L7e4WklUdLnPq38vR4/udrvUmzWElnS7XRq1Bp1OxMGHbOSrXzuLg9dv5FZHbEQrSBOTg6OVydHwCg9qs+6jcnjUI09kfn6ed77nvXheaGiSxQRmsGllFNKyj6y7cITSQMVRXbGCeiZ6Xyp9E6I3KJpjKubas+R5zvDoKFpJ5uY6uK6P64dEcUoQNnBdySfP/CyOK3jxC59KGIDKTCmiHpW32LfoXySsAtSlzE6MdlFfHbMGlYvpt+XAxw0Zo6v7HZTTeCCnTtyUVk1tqUY0rVNXKbXgfg4a7/odc1XHbzUiaV9X64/aY1U/t+2qRl1XYtVc172hBFepwLYdQHn+g8SP9qXZc6yC/b2xpRhjoJGuQ06OiywojmZcViorqcLmyBUgb1pSvFuA00yRJBkSUUbitNYIpzqIV651GebZq9PZJ1a953b4KKapIoYjEPgo5ZYMLsBwIKvt1UW0rppJZPbWo/ii8QMPU89bmDQTacrA2F8sYPTq6qwo+q69deT2nrE8SY0CsOOYmqiArSyglMIP3AK0ZmU0Dcxz6TmSLEvK51vKvmdBa/I06zlHtAF+ukx/y5FeQRMXAlPGzYKiMog20EoG3MLD7TnfZ7k5TgGKwDiF3MLfra2zwCbtiuKqOWbv0nFQ2gjwaG3WoLYur+d4xiFxsw3xomTx9uBo5QpoCUW5GyGtbopA5TlS5yhhIp9IgSML1kMJyRS5Nus1AI0qMnU1gmIcROAX4WRZiEaKIrKaFYJdngd5LtDaQeUC6cqS/g8Yh0GRz4sQiHJ9VIwPdrgqmW2mXyhtpVv61+77xg54YGqtOhlCbxJdLmJ6Qz3mK8mXLL64YMKsUkE7nQ4zMzNlKYv+iOm+ser5VRf2cuHn2v5pPIICU+5DOwGpFvz9+q287rS38/PfXMrI+MEoBWmWILTAlYIwDAikZG52FlcLGmGDJMkQ7sKF4b5eByZJYqic7TZaC5rNIZIkIU0ykiTD9ULa7YzhkTX84le/4VnP/n+c8YH3sG5NSJKC73lkaU693iLPMvIkxg8DpAt3uMOxpGnKBRdcwOTkJOvWrcPzvAWR+OrCaylb6QJrpftZ6nvVz4IgQOWKbtQhCGpkWUYQBKSxqeV3xoc+yH/8x7+zYcNBpcx8mme4BS3H1vjTAloNn5Oe8s9EUcRHPvZJfNcnUxrjwCwoTxXqtRaWVNRvptxLf6BV9b3WfWOarnzHAmEhNK3WMHOz8ziOVyhba/wgoN1OUaki8EJUpvjM57+MEIKXvOgkAh+SFDzX2WMxYF/biIEuphP7iGixRG3U/2NmI16wcExcjmmy0vFzENVyJftZalxfSfv+N9ty59wvJGSt3yFWBbb28/6oatWx0P++nQurQNLux1Ihl4tc2u8sVu9zMRvETLLRYbuvmyJq2p/mY69pGTlZgQ26L2Z9UxS4F3YME0UuW47nuOVcVv1tX+vIclOD0XWKBasNFrrFOKkq4lJ7OPXMPm5Oc1xKxVetIU5MPWLfM7nSKisXPgvH9OKy5MVC27JUDUbS2Gy7NE9xHRdRSf8w0TtL+x08A1rT1kNLkV/aFz11fI9CwWahA8N1caCgYhbPbJ/DTaNKKntJjS8+F9KATMftc4QU/acotoTWvXJLpZPYtltXdthn/edsKa17mFsILi5wCOVI6eI4RrRKl0BLlvoSuogY9m6ZQkrH5FcKd48Y9M1l9pYseLTKRku0tjmZxVgnBFKYXGQpQAqniP8uvP/2dwhM3WBsHzB9yHAkCmEpBZnWCDzDQZMgi0B5mmi8oAd47bhrmY5OdQzSZUvKuu8qV0hhBCS1LvJQhejRgvfTOsk90Cfu/kHZRh593zd0ziLP1CpH9ucHLgcAF/SnGwAuMnoqhaUIUpqSZsbDVavVSgpPFZxWF3w33KrRJnsyprOaQdgh6eYEoUPUhbAGCEGaxni+IM4hdzz+dPU8rzv1XVx40aVMrFtPJ4rxfUEYuqRpSs3zIVOkWlEPTAmSTIP03D0UvZYzCzxKld7C4yJ1VbjDKTu87waoVOC7AVoL4m6E1prA9w39Qfk4ToM4y6jVR/jVry/iOc95Hm9+4xs47s63AY2hJqlisC/LC2hypTjuuDvj10K++c1vsmt6irGxMZTKmeu0GRoaIuma2n4Cu4hWZd9yXZcsv3FD5GLXbCVRH601KjHHD9wAclV4VRXSFYyMDdPZ0uW/vvh5nnrSSWzctNHkEXt+obSmkY4CMhwpSRJFq+Hy7Kc/g7ib8qkzP4fvh3TjmFq9STeJURgPbK6NAmCeZkgtF7TX3OMe2LPvWSC6MPqqF/zO7MepTLAOaZzieQF2opKOQ5x2cX2PTGm6uaY1tIaZqe187NNfwAtqvPB5j6VwNpJlZuFl6qlZKUCTIWGJarI4vtTmE9kXve0Hqr2AwdILs5tjfN2XEcOV9M+9+d3efu+GMhBWet339/25Oe7/3jAuqjaI/TEoIl3dVz+4sp/102X7j79SULY3UdVB7aj+fjkF6Oox+/ez1P6Xa0f/dVhIl9zzmMvtvxo11rqApIXDUNKLvGnNsuUcPNeABm3BgwVm5bRWvU+VvrDEJdyb8eeGPB97OqlK3EPgL7zHZv1tFxv2BxhU0PunuvfKlCRwpbfI4ruSV9j/+/Ig1RBi8ezsMV/IXpRwwfxYtF/aiBl97RBFU83Cr/8y2utRfV9TRMJL4GHBNehycq4cSMi+M1QLd1ZtjegTKS2vuV2YmvZK6ZSCT1rr4vpbgFMuYitw35yh50qjAKwpgLXp42KgRslNZbq8wAtvjb1+5n89oa3i+ovK2sj20+Kb5aXHKfuDY+nmlX5pr4+w9PqK46S8lIDjG/BfvXdmPDI7U/3PkhboyjmZHPPisyqTX+/xxz61A57HNmiQq3oNbbH1fbH1562u5HuDCr9bsOy6Lo1GY4H4RNVuKI1t2WsG2FsbhA7zcxlhzXgGtTKDUJ4rHKfGX66J+Y9T3syFl1zJ8JqDSJQmqIXkeUoaRwitiq3gvBR1rKxDbbF7tXJbpGPr3rGonM/CY0njEfJCkkShkCS54o9/uoLTTjuNv/xls5Eot17g4m+dmzdcaTzMRx11FE984hPLen62rE+73cbzPMIwxOYrWQeDFD3xrf25VYtOr+T9/s8PPvggJicn+fJXvsLMzCxxkqKUxnVcHOkVOYImN1qpjCzRtFouT/+Xp/L0pz2VqNMh8Hw67TnIFb7rUa/Xy5y1pYYQXQBNLQTIYjEmRfmervSXXjRVLNzKPlCh7hWeeyXAC0IcN2C2HRHUhnGcGl8/61w+8alzURilXseFbpSRp+Z3Ube7R9+zw7ZtRy+z6oAfIldt1VZtP9lSjIB96XRYLHK9Ets3i/PK8cXg7ZZuC89HF6VO+rd+k4tsyx5tic/23E9ZBnSvrvPe3/c9j7PU+ai+bdm9M/g67s11W/x7Jd7Tps/fvKDU2kr6UOXbN+g+91t1Tdx/vfrbstJ7tzftW9m53hg7EO7ssjaIxlVVv7U12Ko5pzd0s4Cz+nqx71W/b9thNzBqovV6fcE5DPLk3ogrU1wQ6+g0nlNhcyu0ptPp0hxy6UYpwoFUgRfUSHWdv1+zk5NfeyqXXfYnJibWIYTD/HwHzwsQwgobLez4SuxJyVxo5vt7TGYFwCgpVqIaIaN3TShUAKVjPHrlZp1vsqDRUESeaySxYv26g2jPztOs1UmThJGRYQ45ZJ2p6SQxTAYJRtUsLbj0CkcYdbtDNx7Cc571DOZnp5nevZO142tIo5jZ2dmCAqZxXVmWl4mTrKRl3ZjthgDVvQGrAGNjY0xNTfGhD32IKIpwHMHs7Ly5DzmAUwLwXCs63ZSDDmrxb//2rzz2sY9E6RTPM9SbKIoKpUynkCd30MJBIcvN3j8T+e55QffsJdX+JBbQpUoHSOHdLheCC5wVRvXS1i92pIcXhPz1qms46+xz+frZP8cLIcqMuqLSDjqXhLU6WRwXj47uDe+6f7OdbsBCgv05LN8466dortqqrdoNt30NQm+srT7fq7Y3ttpfVu2WZgc8MO0HcDZXwy5GLTgcFO3cG4Cw2G9XEjm17bBtseqHrVarHBSqebD79gLlZrPUjz4gUG8GaHLCukeiQbgwF8F1W+Y49fT38qtf/pbxsXUkcUaeadZOHEQcx6RpfoOEIfon8aWoSIO+s9Rv+z8TQpCniloQsnP7DkaHR4i6bf75n5/Ihz58BmHN7QnkYf4VMgcJSmdozH2TCEI/4Na3vjVP+ecnk+c5W7dsodFoACYPMy6AjBW2StN0QZ7WTbUBe7y27w36O89zfN9nbGyMnTt38tnPfpbp6dlChViXzof5+Q4AQeAgBKQZrBkLePnLXszd73pcQXrVNGshnfk2Nb+g1pYOCPu3LPMXFGKhE2MRD+diC7/FKG92cxCgNFmSEgQ1kIJMSYbH1rBjap73f/BjfPf8P+C4Bpy6nkA4kjhKcIMaUbtdnpdAg9DVrlJpd/WZOrCGzEF9ofrZqt04q/a3G7Kt2v8e2x/3s3/cHvT6lvx8rz4fN68t1m9WweqqHch2YK2yBtggYGrFEKpRy0FA8sZGs6rAczkQ2/+34zgMDw/T6XTQWu9xHvbcbpwV/FRyyrzScrOUxxwtchKVgIR2CpsnO5x6+vv40U9/x9jYIXiez/x8GyEkaZrRaUfUG01M+uRgCks14jkYVPRKySz4ToWiK4Qoo1N75NiUcMFsJkoqbMZ4jxKaK8hyAs8jibo86xnP4F3veCONhkeukqIgcGbk40l6lFJMbnCSRibXUkLUaXPHO/4TD3voQ+i255mbnaZRD3Gkicx1Oh3iOMbzPHw/JEkybmrb28lESsn8/DxpmrJp0yb++te/cvbZZ5eR0zjJ0IDvh7TbXQRQr3nkeUau4JANI/zHK1/O+vUT1GoBaZbQaDTQSpEkCZRRUoEWTlnfStGLfmtLAR/Qj6zoQu8EJYJqvT/TjwwMXSjkYCLmXplfLl2PKE5RwkNLly2TU7z9XWfw019fZQqOFyqDUrigRSHlniPIzKYVQusyzaq6LUjcOECHzdWFxqqt2v61/Q1O9/a9VVu1vbHVPrRqtwQ7MFdYS5hV2atGTPvzTG9I3ulKIqSDNitjX92PVf9rtVrs3r2bQUqAVbXDG2u9pX1l0CkI+XES001ihPTpZrBzKuG9Z3yS83/6W4ZHDyHONVmmmFizHqVgdnaeWq2OEIIsy1dMhl+JB3Tw54MjZUv93fO4aoROkSIHlfC0f3kybz79ZaBNqrnnOSiRooVVfXNKgCSEh5Qu9VoTtEblOY1Gg/b8PMcffzyPetSj6My32bF9slQG9jyPTqdDlpmamjdFjulyEdNB7/f/bYW5ZmdnOeyww7j00ks5++yzieOUMPTJc/A9l0ajRrcbk+c5YejiOJCkitsddRjvfufbGGrV0HnG7NRuGmGNIqseEIWIle2FlaLsQvTA5UCP+eJR8cX6ULWvKaWMMrEqyh24AbmWJLlDY2ic67bt5PS3vIs/XrEV7UCag+f7zM+0QTjGeWPrgxVlioSuChJUbAE4vWlsJf2h//urtmqrtm9sKSbHSubvlT6/i/09aH+rtmo3xG6JfWdv579V+99htwhgOihiKqUsKZXL5YPubY7p3nyn//hV8aMgCNi2bVtJ462Wr7FRnhtrC6ZGoSohHpND6fsh0glJNOycijjtLe/hm9/5MY3hg4iVSxA2mZ1rM9/p4rg+E2vWUa83mZmZK0RqQC84Sl/ktJJbqCriSOX9KnJE7e8Wp+eaHEMlBEqIXt6iAC1FJUJbbEUstVX3yJM5nvC4R/LWN/0/Ol1NpzuH45jPtdAmd1E4KO0QJ4pOrMi0iyoST7US5JkmjTMajSbkirvf43ju/4D7Ih3oduZRShGGIUoLulFCrkxp7Zsjx3Rvvl9dQNVqNWZnZ1m7di2///3v+cEPfkSWQZYp4tScT60WIIr+k6QRSiU4DtzpTkfxute/lvE1oxyy4WB27dpBs9ks91+NjmphckzLPOFq5NTe7f45pYiU7tFvKtF1IQRKyMoGKrOlbyR5rpFOgB+0UMInSmFodB1/vepa3vP+D3PJpVtJU+h0oTk8jEqt+Jitm6t7vp3Kv9W2WjLCgSwIsjppr9qq7Ts70Ginq8/3qu2NrfaXVbul2S2mjmnVhOhJpWdZVr5nbTHq7EBb5Dsr8WBqrUu5ZVurrCqI4zgOO3fuJE3Tknq8Usn6lZncU4FF9OilGkk7yvDCgB27M9781vfxvR/8glprLWkROZSA6/plVG1qagYpodUcJsuTYk+qoAYv3+aVXPfyO1ouuU8DeCpnW0ayFAhwyOi0Z3jaSY/n5FNejgCCQNCoN8hVitIm4iuKgsJRomm3U3IF9bpPvWFOLU9T/KJ8TxpFeKEPec4JJzyEKIq45JJL2Dm5gzVrJ/A8jzRN91/OcJ+t1JO+2Hfb7Tb1ep0sy+h0OrRaLeI4ZmhoiB/96EcIITnhwSfguJAkGYFvIsGe7+J7Lj6STCuSWHPCA++O67yJV77qFJqNGlkSlQWzRFEXVIs+Z0t/XqmWpaouWpryLGJwZAKWeV8L/MAj6kY4foAf1IjixBQf9zySVDE732XioE386Ke/ol6v8/pXv5xNh9TJM3C8AHTSa09/NLRKQKi+1KJQ1Lr5q6nZ+zzoOtnxaNVWbdUOTKs+o/3je/X16vO9ajfEllq7wv6hpq/aqt1YO+AjpkqpUnDGUnjjOC6jptVIZpIkJWiwIkRLKe/2548uRu1dLtqVJEkJki2NVymF53ns3LmzBGK2dmmSJGVJkhtrAoeiBjMIjVI5CoUWpk6pHwZs36U57U3v4xvf/AFhYwwtPeI0RbiOyYeVJudOKYUX+DieW0Z3S2+xNIvxnvfYRkAdqgq+NsJpcwLL3MAyN9QpFVt71FxZ/t7SbW1EyqquOkCaxdRCFylyHKlIky5PfPyJnH76yxkagjzT+I4izyNyFNLx0MIjL8rb/PXvm3nVa07nn096Nr+/9C+lmLYfBuRKo9F4YWgOLCUoxaMe/giOO+44PM9jcnISz/NwXZcdu3fhBv6C/lGNaq40Irq/oqvWLJDWWuP7/gIRp9HRUb53/g/58U9/RpZpfN9lfn7eFIIH0ixFkyNFUXaonfKA+92FMz7wPkaHh8mSGJWlOI6kXq+Xz6qUkjTXRElWRsDNVjSqr/yLUfa1UcgB4BbKKGnZ/3SPeeB53oJnTrieqbPrejh+g6mZeTYedmt+/uuLefNb38VVV8+gXchyyLQAPMA1Ed0iLxoBWZKXf+/RHmBfDJ/9DrUbQlPaW1C/SoVatVVbmS33rNxYcZ/+VJXqVi0zd1OKB60KFf3vt1v6Pd3bddCq3bLsgAem1ZxMYMGAXY1O3lBBoxtT99RuVZBh37Ntn56eLsGw/d6+oPAaE6gM0jQHHOIkJlEZWkjmogThOmzfoXjD6e/m/B/8muHRjeTKJcuh0WiQpJ1FJiGnl5NpzqR3yL3kLy61aO6VozGmBvxmaGiINIoQUtNq1JmbnUZoRdye40mPfyRvOPXVBD4kUYLnaYwQlCnkDB4aFwT87e+7ectb3s33z/8pu3Z1+PCHP8OuKcitII4jmJ6aB2EcBzrXBpwKwYknPISjjz4arTUz09OkacrExARzc3PL0mz3NZX3xlJ8y9tYvF6zZg0/+MEP+N3vLqbd7tJsNo2zJU3wXdf0VyBPMho1D5XDve5xDO9999vZcMhBCJ2isoS5mWmk0HTbhvbsSYdWq7VHf12I8oShf9/IvqREj2Jbnl8Rve1EMa2hMTZv34nG4aI/XMF7z/g4128F5YKQHp0ooRtnCOGQZimdTgSA41jBrl7zK8vIAyBeumqrtmqrtmqr9r/Tll4/3nKB9aotbQc8MLVWBXRCiJJ6upjQ0WL5ov11SvdV3VMLNGzeqdYa13XLOphA+T0bAd4XlmWKWs1HaXBcH88LyXDRbp3JGcVb3/VBvn/+L0hVQK02isoFcRzTjeYZatb6pEetqQE5dOba25zTUi13DzPRMBvhsverFB6y9SkXdD2Tn2qBajViFhWg1HMknfYsw40aaXeWJzz24bz0Jf/GyLBL1G1TCyWQkakM1/GQ+CSpRguYmoZ3vOsMfvWbPxDUR9k51eE3F1/Gm9/yftIc5joaBYyMtWjPx/hhgBYCrYDCAfLoxzyS4467M91uG8cVdLvd0tlQBZl7CzZvLHAd9L2V/B7MM5WmMWHoc9ZZZ3HllVeW/db0T5PYq/IctMaV4DkQdeFud70tb3vr6YyOtKj7DlF3jrGRFo16SJ4aemy32zWTR0VV1zg9JIJK9FP2ou6lc6T4fjVS2uuAlShjJfJeNbsP3w/RQhKEDaTXQOFxwS8u4oOf+CyTu4u6vmEDPwiJE4XnetSbNSP8Zf0yi9LNVyfGVVu1VVu1VVu1/WWrIPT/nt0igKkFpTZCWs2tWAxoLqbOu5iK7w1R8l0MEFvxI8cxVNkoinBdd8HDta+AqR9I8gziKEVIj3YCGYIkh3e++2Oc++0L8Brj1JqjTM+0qdUajI+O4GhF3O1gRZKKVrF03tyA7rIXEdT+wcVEtRy0qIre9L4rhcZ3HFA5WRrRagTMzezin5/0eF57yqvZdEiLNIkJAxfQJpdXemg8NJDmZmfvfe/HOP8HP0fj47p1RsYmaHcTzvvO9/nIx75AWBfECeQaXC8ADZlVnFXmXtXqdR75yEdyt7vdjd27d5s8TM9bFjzu74gpLE0BXRrM5jiuRKNoNGqcc+7Z/OlPfyLLMsKgjqlzKnAcjyDwiLoxSkGjBiqHu9/9drzp9DcSddscvG4tc7PT6DwjzxKGW0NLUGkGl45ZrM8spYy54D1d+awoWiOlZGr3NGGtRZxrRNAgJeCrZ/8Pn/rcOcTK1GzNFbi+oZCniUa6AiFlodjbU+4d0MIl279qq7Zq/3ftxlJ9V23Vbowt1/9u7HZTn8uq/d+wAx6Y2sWt4xjwYmmyFvStFCguBUYXyzNdKr+0//vViKktIWMf3uuvv36P8wH2AaVXQ5G26QUeUQy+77JzN3zwI1/nrHN+gF8fx/HqJFmO5zvkeUqWxIw0G6g0Q2qFEhaQ7rmVJRx7raYKKJaLoFYjpzBocOntTw9Q7XU9iec7CJ3Tac/xmEc/jNe+5hWsHXNIuzlB4CGkJFc5vhcALrt2z6CAMITPfOY7fPLMzyP9On69yXS7Tao0uBLhSD7y8U/x6c+dg3YgyoyWjxYGeAlHkiuF9AJUnlOr1XjgAx/IMcccQ7fb3Wsa7f7a9ugVexFd1TpHCI0uKNBf+tKXuPzyK8lThSM9pHBJotjeTdLECGIplRFFOQ990HGc9vrXMj8zRSAleZqwds04k5PbqNfrvTYVuaNGvXkJf0YRUe/vNzZSqgUgRbm/agBVCI2QILUqNwfjIIq6McILmZrtopyA5thBnPmFr3HmZ7+DdA0BvJuYXt+Jukb1W2eVcjL2mVjNW1m1VVu1VVu1VbupbRWc/t+wAx6YDoosBkGA7/ul0NFKo52LgdR++u8NjZJagFrNPVVKcckll5SiM/v46hB3ZhGOwnHAC2C+C5/41Nf55JlfJ2isIRceuZBoRxI2QpTKmJnaTZ5mhJ5b8X7pG+ARW777LBXtWvBZnwiEtfbcPHG3Sxh4POB+9+b0U1/P6LDL9K55wtAhbnfQSiORZEqQppqxsWHSFM7+xi95z/s+hB80UdpBacHwyBiz7XlqjQadqMtcN+Jt73g355z7QzzPiK0qQLrGEeK4LirPkY5D1O0yNjbGox/9aA4/9DAmJycHOi9ualC6GFBdGpCaLc9T8jwtr7nWmq985StcddU/KvfDXItarUYY+sRRB+ko6qFDt614ypMfygtf8K+052cZGxliZmbGiC5Fi/X5Im982d4zuN8s9hmA0KZkktVzFkIQBAGZVgRhA7/eJMEFv06cSj555hf40ld+Rq7A840gUnOoXpQsLUBpUUqmmlUqtdlu6ba3To9VW7VVW7VVW7Wbwla8flzEbuqgwKrtGzvggWk//dVxHJrNJmEYkiTJkmBxJRHTG7tVo6SLteV3v/sd3W4X2FPM6cZdHEXQ8IjjOZIMZufgwx86m8/919l4wRhuMEJaRJ9SlTLfmaXZCBkbHSbpdMmTYtEtFEqazb4ut8WsvwxI+f6eBR6FEGjpLIyADTodIcr9GlqmRghNs17nfve+F+96x9sYajlEHc34WBM0BPU6QrqgXbIUPNco4Zxzzk9485veRhTnNIfGQEtmZuaI0ohGq06cdXF8Bz8IcMMabzjtzXz7O79EAfNtVQrfZGmKdBziKCKs1QAYGRnh0Y9+NBsPPmSgmvMgYazlopg3Jsd0ucgoLDJAk6PJUTojJ6+oPzp87Wtn8be//oM4MqVj0jgh6nQBRRj6eI4AndNsSLIIXvbSZ3DSk/+ZbVs206zXqNdqJX1dMoAGxOCcUi2FUXW2E0/Rn3rjQB/9V5jCtrrSZ4VWSKGRAtIkIYoipHSJoxQ3aKCEy7Wbt9MYG0fhc/LrTuOrX/9pqdKsgFylSCF67yz1LKzaqq3aqq3aqq3aPrdV2vv/PbtFANPqYttxHOr1Or7vLwoGFqPgDvrsxkZL+5V+bVurwOSaa64hy7I98mSLM6ycbZVGS+/zEuwVUaEifw4g0RIRDDOfwvs+9Dk+/V9fxvFNhLDT7uJ7AVHUoVar4TgO8522oUMLQWOotUCQaOC2rK0sV3BvTGgQUiNRuA7c595341WvfBljw+bS1GvFNcs1WkniODfCNYFDN4Vzvvlz3v2eDzDbSQjrLdqdiDRXrF1/EN1uTKfTQSCRToBfH2Ln1DztWPGG097K+T/4HbWGBAl5Bq7nkcQxQRia650kSCEZXzPKvzzj6QP7WaZVAfk0mTav97cq71JAdVAUtfr9IAiI45g0TanVm8RxTKfb5ayzzqLb7RJHCZ7vE9Zq5HlOnMSkmYmy5hkEobn7L3/Fizjpqf/M7Nw0aRqjVbZEVHFwf1kqCtlP/9XFfozDoxDUsn22+NfzPIKgRuCbts/NzuI5HmNjY7TnU+a6MLb2Vrzvg2fyxa//Eu1AokBJj1zrPpEuXTx7g/SQxCL/rtqqrdqqrdqqrdqqrdpK7IAHplob4aM8z8too1XkjaIIlaeoPEWrDK0yVJ6SZ0m52c+rW/XzrNgspXFvtixLyNIUledkaUqaJAv+RmuazSGiKOH667eYhXyuAUkQBKiiVInGRHzMlhebMjmbmnIhLDQIBFkcgchI0pyuCNiRwpve8zk+/oWzyNwAJSHVhSiQSgk9H53nOMJBej5aesiwTjdJEcLB/id1FWQurFNKsWkLAKQ2karidVkDsqhXar1c/fl+C0vSOEjHQWPUhUEicXAcB19K2rO7eeD978Zpb3wlGzc0yTJNEEDSSQpUIoxoTeARpZIcOP+Ci/j3k1/H7nYHr1YnSjOk6yBdl/m5DoFfI5B1XB1A7hKnHjIYxg1HuW7LLl73xjfzkwsuQ+WmWgyAHwR0Ox0APN+lm3bxAp81a8d50YteRBIbsBsEAd0kpd2JCGsNcmVEdZQW5JjNAkIpBI6U+51asuTnWiKUII1SfMcHLel0OrieR64zpmZ28+GPfog4jUBAN+oaISS/hiqEpRzXRN27UczYqMfJr3kFj3vMw0miOfxAonRKrlJc15xrlmsQDkmmkNIF27cLZ4soslBtn7EI0GQ7VxSdK7Vzbb8Vwinr5Gphcp5zhXEQZBkSQei5SKUgSfGlh/BGmU1CZmKfd7z3k3zvgr+BhDgDhI/SkqibAQ4IQZIkJkgrQef2uRRL/Csqr6sXv8jhrtyTQTT65cQnbuoah6u2aqu272z1eV21W7Lt7/67HG12qePuC6rtLZ3Ke2PFq26u8emAB6bWqjlwwEDhoptyW+7YtuMmSYKUkksuuYRdu6ZwXVnSeJfq2EL3Yi5RBAiII02WatygQRKnOF5IJ4WT3/gpvnjWt3DCFsLzCeo1hodbzM5N91WDkaCL5b+gjDQN3lZisrIfFv62DG/JAf/29q+1II5TWq0hdG6uWdxt02nP8PjHPZw3nfZaxkcbpGlM4BqyZVAzgCaJFUIaVdX6kOSCn1zGya99I17YJIpz2nFctK/aYnt9JVK7aO3gBy2iOGNsfB07d81w8imv5/I/XQ8aZqcNIK3VmkRRgtKKwAtIMlPnc91BE7z61a/G9zx2796N67oMDw+zZcsWcCQ5e0Ysq/TvfQ1M9xrIVqLje6omw+zsNJ/+9KeZmZkhLKLGWguCoFZE3hVz89PUah5Kg+cLXvHyF/OUJz+BHZNbadRCXNchiWJc18XzPPP7WkiS5pjyQH1dZmCkXi74zmLiSKVIUlm2aOFezLOgyudBeCGZ8MlFiHabvOH0d3LRJZMkOaQaED5hrY5WRvjJDzxAkUQpjsOqrdqqrdqqrdqqrdqq7SO7RQFTGzm1thildn9ve0P7lVJSq9W4+OKLCyVXcBwb+RUlahRaFptXbBKhNSpXhDUjyoLUOL4o1t4Nds/mvPU/P833vns+ea5pNltkmWJubo75+XlGRkaWuarLlYZZqnuYz4wIzJ77sWq9BgTLhf9Wtm6cMDQ0TKfTATSh6yBUzr2Ovysv/rfnMzEaoLKYwJNATjdqk+YJSPAbPVXWH19wKS9/xStJ0pzd09NIx8NzA9OWgeddRKyylDxNaNYbdDoRaZKxdfskr3z1a7j4D1fRGqlju1wQhkjhAhKtDKXTc1xGR4d56lOfQqc7j9SKbmeetevWkEQddJYvcFRoLYpt+fzSm2JbyiyN/i9/+Qtf+tKXypxq23ajlC1oNYeI4ggpoB7A+nV1XvCvz+GhJzyA2ZndSJUThB5J1C1/1+1GuIFf5HWaKGj5r6io8upe5LDarqr40CCPnnVILOoplEbwq92ZYs34MGma0mnHzMwmvPzlr2X79oxcQ5JBXoBn17NOF40feAzo9nth+5b+vmqrtmqrtmqrtmr7zg6kcjn/l+wWszKynUApU5uw2WyitR6Y53lTgtRBYkrVNkhpaLtXX301URQRRTE2gGYiadWcUqek/llzPIjiDlpmuKFkrqNJgU4meN8HP8uXvvLf+H7ImjUTxFFKGNaphXXSNF8ceOyZILePrbrotuCi8m/5HWg2m4Y+KiWh7zI3u5sH3veenPq613DbI8eJo4x64OEAiowwDE3eZ5oRxaAk/OSnl3LyKW+gE2XMtSPGx9bh+L4BUdWxQ/Tn74LrOEig227TbDZxXZ+wPsTfr9nC6W95O5f/eSsUeYdZZn6TZymhH5JnqbmUSnPsMbfn357/ArZuuR6VZrTn5g31XOegFwoSQc/Rst8jojfQ7PMWBAFDQ0NcdtllfP3rXy+dMlXL8owwCFGZIs/NnR1p1XnTG17Pne9wDN3OLI424FQpBY4kShIc6aKlU4pjCeGUrwXS8GUxpWb627XYa/veiiYOoRlqhVx73T9Yt24dUgS47hDzHckrX306f78mRriQIIjzDIREK/Oso4HyMujKBoNcIQeqrU68q7Zqq7Zqq7Zq//fsQJ3/bzHA1Jpd0B9yyCFFzuZgwaPFRJFWIpK0HLhdCgj3vx/HsREdmp/nt7/9La7rlgv7NE2pAlNRXd9qqwiao2WOdCSdNMevC2Y6cMZHvsZXzvouzeY4jvSZm+0ihIniaC0YHh6m24nZ37dY9MVAFwonFfmnYvC/IAvwpPFdSXt+mvve53he+e8v4bZHDuEA9UAiyVEqRRbnEuUpju+iHbjwN1fxlre9hx1Ts6Ra4AcNOt0YrQRprnq00AWqqoV6KwqhcppBDSEE3U5ErTHM7FxEa2SCX/3md7z+tLfw56smkQ4kmaYTZ0jXRVIoK0uN7zk4ruSfjj2G5zznWbQ7c+RpTOC5eI7AQSO1OVYJGm1O7jJ2k1N7K8cFiKIIz/MYHh7mZz/7Geeff765gkqR55o4zXAcH5DkKsWThoIeeIIN60Ne++p/57ZHHsrszC7qQYDjCtI0pTU8RDeOivq3ckEtXJNzbXOZ+3Kbbb8TRrF5j+slxR703QWfLxCNVgiZ02z57Nixg0ZrlCRx8YMx/njlZt7+7o9wzbbUyB25PgqJkE75/Bq8rCv54QotdOXffsDKAmr9fvcPrdqNtgN14l61VVu1VVu1VfvfaLcIYFpdMFsBpCOOOAJgSXB5Q4HnvqL32v0HQUAQBPzwhz8sc06VoqBCGttzkWreSOKY0A+JtcLzHBINn/zMN/n4Z79GSgPXqxeAVOI6HmmaMzfbRiuB53mV3fXf6pug/IUVU+pTSq22JUu6aBURR7Pc917H8cqXv4ijbtMiapsmJlGXLEtNPiaCdpzguSE58Mcr/8473n0GV1+zBddrkKQCpSVhvcX07FyZE7nwnAtAqs3mSIi6XWpBSJJkpJmmNTzGNZu3Mb5+I7++6A+87R3v5U9XbsMLBUHglgJWnuOSxwlISdzp4Loe973vfXn8Yx+DIyQzU1NmAVuRmu3vdzcWSN4Yqq5tz2IAVWtdiozlec7IyAjf/e53+cUvfkGe54UImaE2R3FE4AcIAXma0wihO59z5zts5MX/9jwO23AwU7snQeUmXzgIKsC8usC3Ylq9v60tBwRuCFBQaUrgGuC9c9cUQa1JNxaE9XF+deFlfOCDn+a6bV0EHpECjUsQ1MkTtYjwrqr8u1pi5pZu+4uRsGqrtmqrtmqrtmp7mntzN2A5MyCut3i2i89b3epW5QIfeoto+/dKbbnvLvZ5dfFuAQIsFGky7QWlMlqtBtdc8w9+9rOf8KAHPQjHMeqzqifHs/AARU1GPwjpJDmZ9Ihz+PiZZ/PJT38Nvz6OkB7dOKFe95HSpT0f02g08L06UZSgtcZ1V+B7KNVnGICQ7e+XWmSr8ntmV32iNEJWdltcJxSInFpN0lUp973PvXjlK17CrQ9rksUw1IBup0OtERj6JIIkyQmCBjnw819dwsc/9V/85neX4jg18kwRNobodCJcpVk7cRDz8/MV8G/rUQK6Byoc4RHFbdI0Zf36Q9iyZQuNZpPWyBq6cc7Q2Fq+9d0fEzbqvPIVL+awQ8fIM0jyjMD3TEQvywnq/5+9946T66zu/9+3TZ/Zql1pV71LlizZcom7ZGxTXGJjYgIEEkogyS+NFkgIIQmQkBBaKAEHG2xTDQ4hgI2Ni2xZxpaLZNmqVteuyvYyfW75/XHnPPvMaFe7csGYL8ev9a6m3Pvcp57POZ9zToKQo21wxeWXMzgwwMZHHqFcLIReftupJhgy1XwZo3JPLJOBrec7f+s/c0Lio+r3otEoIyMjOI6jaOl33HEHqVSKpUuXkkylGM6O0pBKExDgux4R26aQK5JJxCgWAq658jyGhke46bbbOdI7jG3bFIsFIlEbt1L//HrCorF5ZKn14YdgX+jw1ThS3zDGJdCq9ShZbsfeAQw8zycej+L7fliCygfTcciXKjRk2vjB/95NW1szb77hKqa1xLFtiBrVOPHxhqau3qkqChVMsM5fQbTf/xdlsvXzW6/pb+W38lv5rfxmym/395dHXhEeUxFdgW5paanxGP0qk8mcipfW8zxGR0dViZsf//jH5HJhLdFKxRvLIqrKHwZgeAjYyxc87EgUMPnqjbfz3zd9h4ILvu1QwiTixCjkK8RjSSzLolSqYNs2hmEQiUTGOs84EQCMxX0+XxkPVGlZeU9ItzpGoQ1T3riMDvdw0UVr+Mu/eCeL5qewTYhGIJfNEk9EwAvjFh07DkacsguPPbWbL37lZn5x38NE42nsWBLDiuK6kEimyeeKZLPZMY9xTWyp/A4plsV8lubmZpLxBIcPH6altY2KH1CqBPg4DI0UmDFzDv/3k7v51Kc/T9fhYSJRE8uyq5giTISEDxgGbqkEGNxwww2sW7s2rANaKuFVXAK8KgXVUImFXmqP6VTpuxO9Jkm0DMOgVCqperjf/va32bl7F5WKRzqVplgq4rsetm3ieWXiMRvDgHgsrHX6lje/mtdfexWxiEky7oSlmsplTCOooUYGqtSQNcGhULtlTXRwTJVqmYglKWTL5PN5zIhJJSiH9Ustk+FsgabmWdz4jR/y/R/8nIoX0nfzZXCDMG32CctnSrV/fyuvFPmtx/S38lv5rfxWfiu/lV+dvCK0KNM0sSyLIAiUhzSTyRCNRimVSirWFMIyMpVKhUgkQrlcfsExpidT9n3fVxReXVmR6wZBgOM41VhScByHPXv28D//8z+YphnWIATKpaofxYCKW8APKmCAG0AkHqVQhv/47Lf4+je+T9lziMQbcAkwbQMvAKtK4bXtSBWcjvVJEJycLqqLYRjUBeHpo1D3M/Ydk4lisEJvpWkZuG6ZSrlIMh7DscDEo5Af5vzzV/Oxv38/py1uo1isVB2aZeIJJ/RAmjYENqUS2A48tGErH/zgx9jy9HPEk834noXr+gTVEiF6P/i+0HZrnySM/wv/jkaj5PN5fN8nnU6Tz+cxsLBMJ6RbO3FGRgs0NLXy05/dzT/+0yc51DWCYUKxRFhnNhKlUnIBEzsaxS2VMEyT17zmNfzOuecqg0osEqVYLOK6ZRKJBMVisaYf68HUiwU8xxvn8epg1ou8n8vl1DMUi0Xlhb7tttvYsWMHo9kcsWgsnGu+i2WZ+G4Z8PFcFxOwgHe/8zre9Y634pVzWEYF2wpwK2UaMikK1TGAcD5bdlh+RmJOvYBxPakw9noNwK2tHnOChADYolwKsO0ojuNgGAGm4+EbZSzHxIrEKXs2GBm+d/svuOnmn9PTB3YUjIiBG3iU3QpS4zdfLIBhAGEcqoGhmA9h3OmJ7Xg55MWMkRSDhVxP9kLDCGOJDcMI12H1/Uqlot6vT6L16yiSCd6yQkOJMF3kPDrZGpyK6EwgOUv0Pgvr5o71ldxPPlPft/o5+EoRabv8Lc+rz9Hx5ldo3K2Mw1IK56SIfEbv1/FYIr+JIs8o/aHn5ZC/x9g7Y2eOfFafV9J/5XK55n39u/q4lUqlGlabzGV9zr6Uz62PszxD/Xrzfb9mfozXDy+l1PeHvub1PVREf28q7SsWizWflfGQ/aHeyC3zYbxYen1dyTj/qmS8c0TGS5iSMBbq5/t+TaicXONUf34rL61MdF6+IoCpNFqUg0qlQqFQwLZDJrLrupRKJaX0eJ6nxXK+MO/oyTxTU3k9m82SSCQYHR3FcRyKxSI///nP2bRpEwYGlQpYFhQKLqVyCSfiYFoWgWFhmBa5Inzms7fxw/+5C9+PEYtnMB0Hn4CyWzpZtzEhTXQCDfnUPQB1WWX9qhfQlwlX3eQCyKSTxKM2vccOY1CmXBjmilddyD9/7MO0taQIgHgUTCrYtoFphQlxfM/A9y3sCPzfTx7jY//0b2RzAYPDBaKxTLWkSG0s4lQlkBqnho9PoEqXhO+N1cK0rAij2SLT22fx4MbH+Nu/+we6jxdxolAshYeuEwu907lsHjsWDWnIiQQ33HADpy1fzsDAQA21uL+/n4aGhnHn12QK76kov/Ue0fH+ngjkymGm30f/2wjgO9/5Hl0HD1EslHCcatZdI8CMOFRKuRDgmVAs+JgGvPmGq3nX2/+QeMTADCqk4jF6j/fQ1JAhGokQcyIMDg5iUgtcTjSamM8b6MmB42MQYBNg4xsmgeERJhurEBh+WG7GipNITqNYjvCNW37EN7/9EwZGIVeBwLSwnQhBAMVimUQ8BZiUK2VsK4Lr1YOD8dbjK//wi0QiCiRYlqWUHlESBNz5vq9YDL7vq/37110cx2F4eJi9e/eye/dunnvuOUZHR18UxdX3fXVOAapPLMtS+Qnk3/V7hQBlWZO2bdcA6FeCyFzRFUF5nkqlUjXkja0jMejKdyKRiDr7Jcs5oPIL+L5fwxwSg6V+n99kEZ0oGo2qqgECLoIgwLZtgiCgUqmouShzJwiC0FBrGDVrNRqNKiMloPZp+W65HIYRxWIxLMuqYXD9qgCfrBXTNCmXy6odush6kf1L9ih5ll8VMNGNBzJWAMeOHaNcLjM4OKjGoX4uTybxeBxAGX5g7LlFR9aN09IWMZLJvBBjhOwvpmlWS/y9tKLPFX086p/9VzWvfiu/GnlFaAau66rNTSix0WiUJUuW8PTTT9dYgSTrrXh2XuhkHe/wOtmBVv+ebdu4rqsUtqamJrq6urjttttYvGg5zS0NAHi+ieUYeAS4vk+57GE6Jl/97x9y+x0/Y2CkQrqxjXzZC1PDBB6B54UexRpQNs7znkDj5QRwesIzqfcnelZT3SswtARH9Z8yoFTO4ZgR3EqBttZG+nqP8drXXMZf/H/vYH5nM17g4uBjGFAo5Yg6EcDCMqP4AXgGbHhoN5/53Fc4cOAYgeWQbmilUKhgEG5Qyis63rNyAgF03HDaoErP1J87n88zq2MGfcUCx3oGSKfiPPzoE3zsn/6Fv/3Q+1g0p5FCwSceNymVfJLpFIHnE08kcCsVorEYb33rWznc1UV//yDpTCPlcplIJEIul0PPLFuvmL1YVv2JrlM/5uPNa+Mk7wEMDAxw66238u4//mNmz+4gErEJfA/DBEcphy6RiI1pQXMG3vzG3yU7MsB3vncHTiSOXyniWI0Ersfw0DCtTc1kczni8XiYWVm1xK8+h7TlxDk3GVgNTD0W1YQg3FcCylXvZsjX9QArsCmWK2TiKSoVn97+Ab73w5+RSDu85U2vIeJAqRQQjxpEYpHwO4RrvuK52FYErabMb6TowEr2aJnfhmGQz+dJJBLK4i3KYalUGic52a+fGIZBoVDgnnvu4Re/+AWu6zJjxgxuuOEGTj/99Bd8voiC9fjjj3P48GHmzJnD3LlzaW1txTTNMAzA81RfSf9Jv8OY90LOO92j+OsOUPX2yTN5nqeeU0/gJ+d8EATKaw0oRR7C/frZZ58ll8uxaNEiZs2aBaCy48t15T66t+U3URzHUetRDEPSdwLmXdet8cIJiIlEIiQSCSqVCpVKRX1X+i0WiylWGITePNu21dm2f/9+uru7aWpqYt68eUybNu1F91iPdx3duGrbNo888gi5XI6Ojg5mzZpFa2urmkfCrtOBqLTxVyFizIMx45NhGIyMjPDwww+zd+9eKpUKK1as4PLLLycajarPTMWwV+8BLxQKRKNRlTNCB6y60Ue+KyBU95oKgE8kEr8y4079OOuGOnlf94bLa7+VV6a8IoApjE1M+R2LxTj33HPZtGnTCdQqCMHsizExXygwBRgdHSWdTlMoFIjFYqRSKbZu3co3vnkTr3711cyaNYuGxhg+MJLLkUgmMSLw3zf9iK99/TYMK0P79BnkSy6+X8EKPAh8HNuqw6F1StIEIG0qz6JeP+n+bFYTJvnav7UvGAHJRJz+vmGKQYnW5jS9x7t53avX8oH3/X8snJemVCgTixkE+FhAPBrHwKRU8fA8sGzYuq2LT/zrp9l38CixVAY/MLCdKPnCCNGIxLGaNc9rBuBP8vyBhnECw696XqtUpOr10uk0R44cobEhTb4QYDlRkpbDPfc+hG1H+PsP/RUzO9MMjlZoTDsEgOtXfa2miVupkEwm+Zu/+Rs+/vGP41ZKmGZ4EFUqFZWcSqcRjTsOEz3DJO/rm7R+j/EO8wnucNJ7ptNJhoeHufXWb/LOd76djhntOI5NpVzBiUSolIs4kQSS5ik77NLebPNnf/x2jh09yj33PsqMtnb6BvtJZxpxbJPAc0knE5RdjS5UjeeFAAIDI8xddNLSMOP1Rf3TGIZZu2qMsECpGZhVi7tFNl/EsWzmzFtMz/E93Pbd/2PajHaufu0ZJKIG2WyFVMqhUvHxAp9IxKbilbAtTpiXv2lST7XcsWMHu3fvDsF5pUJ7ezunn346yWSyxjv2SgEElUqFeDw+xgYAstmsChl5ocDPdV2eeuop7r//fkZHR9m5cyenn346V1xxBY7j1IAuHQTL+SbvC3VNDyF5JShmrusSiURqAKjQFQuFgvLCmaaplGkY8wDpoH10dJQNGzbw+OOPMzIywqFDhzj//PNZunRpzXyTe75S5uALkUKhwFNPPUU2m8XzPNLptDLgl0ol1e/iCSuXy/i+T2NjI62trbS0tIS1w6sgqFgsKgOU6FuyBvT5uWvXLu666y5GRkZoaGjgzDPPZN26dTiOo7y0L/b8rKfiBkHAL37xC+655x48z6OpqYnTTz+ddevWkU6na8CdAFU92aZc86UUvc1yb8MwyOVy7N69m61bt+J5Hm1tbarv9OebTOQzkUgE13XZuHEjIyMjJBIJ5TDRAajuQdW9znIdCV8D1B71Uoo+t8SYJIarcrms7i/vjffsv5VXnrwigKluyRFuueM4LFy4UFlCY7GYojiJd/Kl4sHXTnj/JO+FCyoWixAEHvF4lNHREUzTJJ1Ocuut32R4ZIR3v/vdJBs6yBfKJJJJih78389+yZe+ehvlwCGTSDMwMkyAQSqVpOKWccxQOQ90i/0JCvDJFOKJDmW/9hkEaJ6s6GIQ1iYN/5ZrhxTeYiFHU0MK26hw7OhhLr7gLP7ub97L7NlJTB/S8QgGPqVyGao0leHRHIlUIwA7dvfzhS9+jW3b9xJLZcgXStjRCF45zOpK4KOqsQQa7QMwT5KcacwPV42dkS/hEz5+gBUE2Ea4cZdKJRoyjQwND2IEkEo385M7f4Fjwyc/8fekMw65Atg2OFaYQ9Y0LQwjVCAbGhr48z//cz772c/jOCaDg/20t7efQIc5VWvfVIFrPSitP3gnNlCc2If6Zz3XJeI49PX18e1vf5u3/MGbaGtrIx6LU66U8QMfBx/fCzAti3TcxvahrQne9+d/ymB/nk1PbaUx00iukCOTSlOouOTzFZxoTDMcVONMVLvr2lQFquOJYYyftTd8/USmgBB9wSeeiDEykiXwTAazZRpb2ukb6uOrX/8emUwDr75gPq5nUCxBNGri++Gsi0ailCtFItVszL/JIoqc53ls3LiRbdu2EQQBrusyd+5cWlpaWLx4sYrrEq/KK0F04B0akmxFD9XB6vOVfD7PQw89RFdXF7NmzeLw4cNEo1HWrl2rAKbruioWPh6PEwSB6j+dJQS1CtorgSotiqe02bIsEokEAKlUSn1O4gFFSRZQIc8uHsBHH31Uhc08++yzZDIZOjs7SafTNdd6pcy/FypBELB161aee+45AEXpFbAPY6BMgKbjOLS1tdHe3k5TUxPJZJJ58+Yxe/ZsYrEYxWJRrQHdMy8Ggt7eXvbs2cOBAwdob29nYGCAgwcP0tvbS3t7e031hJca+D366KOUy2VaWlro7+9n27ZtrFy5kmQyWWNUEu+hbdvKiywA+qUUmb8yBjLHE4kEqVSKjo4O8vk86XS6JgxCB7EnE52iOzo6yhNPPMHevXvV3iXrSQe6+jXFi55IJMjn82qdRSIRLrnkkpccmOohRmKkknbHYjFlHNTB82/llS+/9idX/WTTN9Pp06erGBPd8iVA9qVIrnHi5B8//k5EDlBZYLZtMzIygmVZLF4yn6XL55FpTuATEE9EcIFbbruHG79+G9miQaaxmZLnU6qUSafTeL5LqVQgnUiGvH/DOikgndwTVptsZ2Lq7gRXEQtl1ZMVXk+u41Eu5alQIeb4nLlqOf/8Dx9hzuwk+VGXhpQdMh1Nk4gVxwCGRoYx7RiGAfsPD/Glr3yde9c/jBNPUfF84qkk2XyOiGGGY+4G6LTiMVBBTUmRE0UAatWXFwQYdR7XgFBxbGlpYWR4kHy+SCyaJF8s4GETiaW448c/pakpw/vf95ck42G8sO+DbVaVRssGw6eQzzN3zhze85738MUvfpFoNMro6Kg6NOoZAbrl98WQelA6FQAcBGHqoZO3QaibNkeOHOMbN9/CO9/1djo6OnCcSDgbggDLCkFJxAnXabnos3R+E3/953/G3/7DJ+g6ehTTilIqFIjGkxQLWTACDN9QoDQUM6Q/j8fFHq914xzchrhbA19RqQNT+l2lx4bAp1AcJR6PUCwUKJR9YrEkhp3kQNcQX/6vb2NXrufVa5cD4HlgW1AsuSSidrXG6wm9Si2CfmUfpnpSip6eHo4ePaoU32g0ytGjR+nu7mb+/Pk1ieCAGov3r6vo9MRoNEokElGxcvLeC5FIJMLs2bPp6uoKS1Ulk8yYMQPf94nH4wqUGoZBKpWiVCopj7TneUybNo329nZgjIL4Soq10uMZRTm3bZvDhw8Ti8XwPI/m5mZ1hurxuFC7vhsaGmhtbSWfz+O6LrFYjNmzZysQKt/T4+5+3effC5V4PK5CmyKRCKOjoyoxpHjLhMpr27YCLN3d3XR1dZFMJvF9n1mzZrFmzRoWL15MQ0ODur70v+hdwmZramqira2NSqVCLBajubmZRCJRA670+OgXQ/RrSbvmz5/P6Ogo2WyWaDTKzJkzaWhoUGCwUqkQjUaxbZuDBw9y9OhRZRw544wzXrS2TaXtuifZtm3lbIFQlygUCgqETdXbr4M6YQnosf96MiVddA+qHjag58J4OcIEjh07RldXF6lUCt/3mTNnjppT9YD6t/Lyy/Nd3684YKoD0IaGBmbNmsX+/ftVHEW9NfCFHtLPx6Okf142P4lniMViRCIROjs7efd73snatRcwMDqCaTSSL8GNN/+Yb9xyO/0jJZKZVrKFEHRnmlIYBhRzuZCm6noYgYmBPzGdURT4Ghl/Q5t0Ak0ac1p36+rvWCxGbmSU01adzmf+/eN0TrcJXMik7dDTaQAeBJ6B7wdk0k34Bhw5PsrXbryZH/34pyQzLQwMZmlum4brumQyCUazQ1h2DAOjRs03NGpxlSBT7YbqfKjJ7KplSjXG4jBMLdQ0HoswPDRAPBFa7yuuSyKVwQsMDDtCIpnmxv++mf7+fv75nz5GY8bENCCfL5NMRPBdD9MOD+tyucxpp53Gm970Jn7845+Qy+WwHecEOqQ+Fi/04D5ZfOlU6Lz6/K5/3zAMHMvANg2lmHQfPcI3vnkr73znO2me1krMjlDxKkRsB8sEr1zGciI4pke5aHLO2R38/Uf+lg/+zd/imxaFokt2ZIj29k6O9vURceLVm4eU2JoY08AAIzjpjKxfnSc8s+nq/8DQSxvhUyjlyaQbsRxIxZPkimUqnkFDQzuPP7mdG90RZk17L4sWd+C6YMfBtmw8LwiNEsF4xrF6cPrKFkmk8eSTT9bUvBWQtGfPHubOncu8efN+pd6IF0PEeyfthjEw9WJ4JOPxOOvWrQNg7969LF68mDVr1pwQUwqhkWzbtm18/etfp1wuU6lU+OAHP0hbW1uNt2u8eKtfVxEvlfwEQVii6nvf+x6FQgEIKYOrV69WfSLzTc5V8ZaYpskll1zC448/Ti6XY+HChZx11llq7MRTqu+3v+kifQhhvGkkEuGMM85QnngBK5ZlKapooVCgp6eH3t5ehoaGiEQidHd3c/ToUZYuXcqll15Ke3s7uVyORCKhwIuA33Q6reKv9+7dq+j8AmhfzIzRExke5fUzzzyTvr4+hoeHmT17Nueeey4tLS24rqvAGoR62kMPPcT69etJJpMsXbqU5cuXv+Se9XrGg3igK5WKMhjIuEWj0RO8vJPtofVZaiU8QGLS16xZo4xt+rUlPE7PGeD7vsq0rO+HL6Xo3vVyucyzzz7Lhg0b1L74p3/6p8qwIJ/Tv/tKMtL9Vsbk1x6Y1seGiBVHQN7MmTPp6uqqoSUIOIUX3+NUL35VwdSdN0bVAxf+DfEq/aWhoYHBwUHmzp3L+9//fs4480yKfpF0up3j/Vm+8tXbuPU7PyEwkzS3tjMyWiAai+O6ZdxSmVKpRDKZJBKJMTw4RCKRwvU9xlVyp+BNCkX6V6IAx7yP43dEbQzpGIV3TKE3CMBwsQKPfH6QCy44g498+L3M6rDDEq1U9XUTJGOMaRoUSz62Dd1HR/mvG7/BLd/6PpF4A54f0NLaSjaXA3y8QoVkNSmDVTeFx5jH5pR1f98wq3RgHzOQ5x+zVIrBQ+ZYpRJaW/ErxKJR4ulWfvSTuzFMhw9+8K+Y2ZEmloiQq4LTwHcxTJNINEoQeFxwwXmMjo7y4x//mCCwT/BgnorCdCpxJuPReSeLMTYmYATI9/P5PMlkklKlrCg+XV1d3HLLLbzrPe/GTKWJOBGKxWKYpTFiUsnncOJxog6UPFh70Sze91fv4R8/8SmiiSYaU40cOXKEVFMT5Ypb7Q85BI0x6nZtizllsGfInFcvaJ7YcB6k02nyhSzRSDzMjGjaxOJJhoZzTJs+hy3b9/MPn/g8H/unv2PZ4kaGs5BJgRkYNXtASHeX+fmboxCL5yWbzbJlyxbK5bLy0kgilZ07dzJ79mxmz55dQ+eVRB6/7qInjRGR53sx4hTT6TRvfOMbVX9J3KgohNIG8Thls1mSySQtLS0MDw/XxMZBbTbkX/f+FSCte3tt26anp4disagUdvGeSv/ogEEUeM/zWLVqFYsWLVIGBUDtPQJ8X2lxuC9EYrGYSlLjui4tLS0KWNYbWqSvPc9jeHiYwcFBnnnmGQ4fPszQ0BAAO3bsoL+/nwsvvJDVq1erhFS2bROPx9W/29rauPzyy7noootwHEdVJNCNOi9l38sZumzZMjo7O2uMGlCbFVzCwaS8oBgvfhX7k94eaZN4TKPRqPLsSuZpCVOT+TuZ1OsWEhsvHvLXv/71xGIxtT70cjFiXNSTYUkbZM95qUVYDYZhqOzJIyMjxGIxotEo5XJZnSf68/6/YHT6TZZf++An3forFpwgCNSmcd1116nNQ2gJOu3nZBnbpqrUT6i8GxCNpxkeLeBEYnhegFsOE6fErChe0cVwfSr5IslYnOGhIVasWMFHPvIRVpy+ikpgEpgJDvcHfOI/vsZNt/2AwLKxIxaj2SEijoHvlTCNACMwiUbjuK5PPp/HjjiU3TC9uBH4Yz9+EP54YYJRC6P6I/8ZNa95gYEXGNU4ODP0wmo/BEHNjwHaexauH1B2Pdwg3FhNyyCgAl6ebO4I6y5ZzSf++f2ctriFYrGMaYJjgC2eUhMwIFcOsOMWPYMV/v1zX+amb36XaKIJzAheAIVyeHg4lkXMiRBUfGwsgsDA134CwnjXwAhLyMiPiBnIj3hIw14xqz0i/XBCvVZ8LLNqdPBcLAIs08ENYmTLNrH0dL73P3fyoY98gkPdecoeRGIRCKDiCvjxqZSL2LbJuksv4oYb3kA+N0o0ElJFA9/H9zw814UgwPc8fM8j8P0wllgbB3ltvHJF9aVn9Pih+vk/0Y+a45i1fVv98QMDzwfDMskXC+qg9N0AE4v+3gH+60v/he8GlIplYrEEvg/lUgUnkQTDJAh8oo6PZcAb33ARH/nwXxGNGAwM9KskHW7g4cRs8qUcflDBiZhU3DImlnJGGlTr1RJgGmEmaMMIME1tJNW4m1Xjg3w3qPmpNeiYVMoethXB86r7CT6+VyHq2BQrYKbn8NiOAf75M99kTzdEU6GtpeKHNGHDDwhz9Rp4FR/XC/ANKBPgGTzvkje/KhFFUw57PR4NULTWzZs309PTg+M4ZDIZzjnnHDo7O4FwD929ezdDQ0NqT9YTIdXXO5W5K+9LnWH9fcMwVMZaASZiVZe2yufkfbH417+fzWZr7qe3SZ5dPG4CEMVzANSU2tApcJVKpaZ2o24UknbAWFZZiR2V/tW9OdKmMD9BWilg4vGScSmVSieEscgziUIr1xL6rB6HJmOuK7CAKlchiVnqvY7yHfmM1E+U55J7Sp/p9VmFbSHjEYlEmDFjBp7nEY/HGR4eVv0Qi8WUF1Cup2cqlv6U8hYQgrP6kjP684vIXKqP3dNreIrI88mzSdylPnfqQzP0OS8l7UTp16+jGw3rFW09xONkoUryXb1/9WoFok+N5yWLRCJMmzaNxYsXc8011/C7v/u7nHHGGSoBVU9PD/feey/Hjh1Tc10YYfXlRyQjN4RGCAGx9XuK9IusCymdUr+OC4WC2hPk+1KeRq6Zz+dVv5ZKJTKZjIqJFQAqa0vCCcSoKuBaQJ/0t17LVdqq196VEobSXvlbX0N6/df6OSUebLm3DrYEjMreIOMwVZF5J1RtyU4t+0UikVCxmzIHJNYWanO8CNVb2q33u65z6Hvy+EysEzPqyljqc0P6Qvpf2losFlUCq/pyZeLNrXdW6fuvfo6drH3SLtd11Z4l14Cx+Gx5Vn3fk/1J+kbfH+vrxepzXOZMNput2W+lf/Q9V+6tX0+/rl7/un7/qT9H6/ebqYRC1p8dL5b82gPTyWTp0qU0NoYlOCTLXLFYVKn2dWV8PEX9Bf14MDQ0RFNTEwMDQ0SjUWKxGKVSiZGRETLJBLYRLur+/n6WLlnORz7yUZYtX0Gl7IEB3T0Bn/y3L/GDO+7C9W2cSFwdFuVyEfxA6coqZjIQT8/Usu5O/KMtTrwT38fDqNfV6xK5OE6UaDROLBZaqPPZUQyvQuCXuOj8NXz4g3/OnJlNgEsqZmIbfugu9QEDDBMKlQAnZtB9PM/nP/8VfvLTe3CiKWwnjo9V69MKxn4IjPEdw4E5JcKxGVQ9q+qZxPt78mUhQAig5Bq0tM2iWA5IpltY/9Av+eP3/Bn79/dgmpK0x5LBUIs9mUhyzjnncPXVV9PX16fmq2zEEr+mz9t6wDkVoDnRZ8YDrqf6ff1g0RV713UZGRmh59hxvvjFL6pDoVwuE4lFKZVLFIoFwm4pY/hFHBt+7w1X8JY3XU8iboHhYprgu+G6bmlpwfd9lQBGyo2MeU9f5K1MuTfHy6rkj1G/Iyk8O8POfUf5xL99mSO9kC2BZZm4bpilt1LM47sVbNtSWZhfKaLXNdTrk+oAc2RkhGeffVYpoZ2dnZx77rmsXLlSWbuPHj3K4cOHAWrAl1wPTqyHKECyPlGJ74d19fRsoXKYi8IpiqvUWhSlKxaLkc/nOX78uLpmOp2uSZgH1JTTkHbK50ulkqLWiaIt7RgaGqKvr08putFolFKpRD6fr6GUShIZuYdcX/pYgIsklhGDay6Xw3VdGhoaakqiiVdKaG1SpkwH1QIMREmXe2ezWY4dO0Zvb69S7oQ+mM/nKRaLKtbQ931SqZS6TrFYVElRHMdRoFG85sPDw8rbJvc0jNAbJbkWJEOsrqhblhWyFfL5E/pfvKFCGS+VSkrpF8Ale6eMp+xR+hyTPhVlTFfcIaTBZrPZGiVelDC97EyxWCQejytQpMcgm6bJ8PCwAhMDAwOK4SWeX1E4Yaz+qg74xpOpKoPjAQD935OJxECfccYZrFy5UimsQ0ND3H///UrX0tuTy+VqAJmIzGMRUZZt21ZzRIwIEl85NDRUkzlWxl5X/qPRaA3lM5lMqrkoRh8Bn7ohQ57PNE3i8bia4+JB1eNmI5GImqe6Uc73fXK5XE3SLvm7r6+PIAgYGRkhCEJnSqFQUM9cKBRqxkOyHevPVz+WpyrjzZP6s7z++npNV5nrYtiQPtTBpz7uAgxPBdjA2Bkgybnk+pI/RtblwMAAhmGE+VY8j2Qyqc6LeqaJGKD0eSfX1YH3ZCJeW71Uj7Bb6s+feDyuElrqhhDP89T+K8ZD2btljy8UCmrflUoelUqFVCpFd3e3ipOWrPAyR3O5nKpNK3MXUH0ne6KsiSAIPfK9vb0cO3ZMnaN6feN8Pv+yJs/7tafyTiaxWIy1a9fy3e9+l2QyqRQSx3HU3/VyKgt8ss9GLBuvHCohhUKBcrFAS1MDpUKRodGRkAbqe8xbsIh/+vgnmNExnaGRAulMnOEcfO7zX+L/fnwnnhfQ0tJENlfAtiPYVgw74uD61Taox/A5aZznhBl/tJIumpi4tZ+p+VpwwmWCmkRLplLmMskUnmkSsy3cSo6zzzyNv//we1k0b5r4i/Dx8D2wDAdMi3I5AMPAsg3yefj8F77It7/7Q6xIinwhjxNNjtvmE59Zz0x86pYbA06gh57QfeOAVd8wqRRLDAwMkE4kKWYHSSfS7Hh2B+94x7v4zq03M29Oa9UTG94oEompDLUNDU1cffXvcvTocR5++GFmz57N0aNHawwc9V6HE5SKKSon4UcnLhcz2Xcn+jeMWUxlsxWLeLlcZtu2bdx888286U1vorW1lVKpVOPRyOdKJJJpPB/icfiLP7+WCh6f/c8baWzppKkhw/GeAaJ2jHgsFSrmfoAVsymU8mBVPf3V0kVBUD2MpZTRBHNHxvuk8dnhHxN8wAfDwDB9fN9ldKTME09u5ROf+Dyf+/RfUwkA3yYekUPXB1Mo/ga2YU41f9PLLro1XPckyFw4cOAABw4cUMr50qVLmT17Nr7v89hjj9Hf38/IyAhPP/00CxcuJJVKKRCmlwCpl+HhYfbt26eMEXPnzqW5uRnTNNm9ezfbtm1TcW6ZTIazzjqLlpYWYEzhFEVfwHN/fz+jo6McO3YMwwjjrFauXMmiRYtob29X7ZKDHmot06JMyHWDIODpp59WHmFRhmfNmsXMmTOZOXMmLS0tSmkSqiCgFB3Xdenv71dKy9y5cxXrp1Qq0dfXR0NDA/l8nu7u7holcefOnYyMjKj2ynsLFy5k2rRp6lkExIrhtru7m127djEwMEAul1OxhB0dHbS3t9PZ2cns2bNJJBI1Vnc9O34sFqsJmRHF7PDhw+zZs4ejR48yPDxMNpvFNE1SqRQzZ85k7ty5dHR00NTUpJTIgYEB9u7dq643OjqqPKb9/f1s3rxZzT9Rmpuampg/f75S6E3T5NChQ8qralkW06ZNU8q1fCaXy7F9+3a1F82YMYOZM2cCcOTIEQ4ePEh/fz+FQkHRgFOpFHPnzmXWrFlqLIvFoqoJKX0g4KRQKKi/c7kc69evZ8+ePartlmXR0tJCZ2cna9asIZVKEQQBx48f59ixY/h+GEYwd+5c1e7x1uVkMh4onchLNNH3bdtmzpw5GEaY4Ozw4cOUSiU2b97M4sWLOeuss2raI9mU+/v71dxramqqMUjVG7tkLgwODnL48GF27twJjIUKJJNJVq5cyfz585VhY/fu3Srrr+M4dHR01NSrFZDQ19fH9OnTyefzNXM2m83S09OjjC99fX1qjReLRZ566ill6BFjzMjICMuXh8nuBBQnk6Ge4vth0qj9+/czPDyMYYSZcCUr8IwZM8hkMkyfPp10Ol1DfZY268BU90o+H1Cqi1yv3rgs78lzw5jRRpIj6SBONxDqe+LAwAD33HOPil897bTTWLRoUQ3LYDwRELRr1y6lNyxevFiNk+d57NmzR4G7w4cPEwShd76/v597772XWCym+rNcLpPL5Tj77LOJx+Oq3bt27aK/v1+dOWeccUbN+xOJaZo8/fTTCizH43EWL16sAKTI0NAQXV1dRKNRurq6+J3f+Z2aOt3PPfcc27dvV8a4uXPncvbZZ5NMJpUhQE9Udvz4ce699166u7vV+RAEAfPnz1cZsyVWXMbWNE2i0egJZ7Vpmhw7dkz1c3d3t2IZyF42bdo0lixZwqxZs0gmkzWhEJPJC52b48krHpiWy2Ve+9rX8o1vfIPW1lZyuZyyUk8lxuaFve/humGdOzNiU8znaEgn6ek5RiwaJZlKcexYD3PmLeDjn/wX2tqnU3IhmYlztLfIx//l0/zvTx/AcuI0NbZWaSVRkok05XKVduNEawDFqYanjQckxqS6aejacT1Aqwcmdc9vYRIEUMhnScUilHw4/bRl/Pu//jNzZ9pUKj6m5WKb4PseruerBR0YYEUgX4R//dRnueOH/4thRjAMk6aWVrKjOjilzjv26xHUnslk6O/vIx2t0oHSaWLNzRw62IVliVWdKhg1sawIvudRLEryBZt3vvOdmKbJ/fffT2trq6KhQG3/T/T3qUrNfJpExvuc/pppjtFK5IDVEydEIhEee+wxTNPkzW9+M01NTcqbVCwWScQzVCoutmPiVQIsx+CP3no9g4ODfP+On2EEBm3NLWRzFSKxKLFoirJbJpGIMTIyQtyOUTUtMBYj/avix/oUi1nSmTiVQgHTjPHgw0/y6c9+nw+9743EI5J02qzG6npU3Aq2FcE0TCrlIOS1/xpn5hUlOggCdQjqXsV8Ps+WLVuUEjFnzhyWLFmi4tnmz59PX18ftm2zY8cODh06xKJFi2ooYaKM6SCnUqnQ09PDJz7xCUZGRliwYAHvec97KBQK3HfffWzcuJFp06bR29tLLBajpaWF1atXAygaHYSe03vvvZdnn31WKaHJZFJZiCORCE8//TSxWIyLL76Ys846ixkzZiiFWrwx4n0TL1c2m2Xr1q3cfffd7N27l9HRURobG1WW+G3btqnspKtXr2bt2rWkUimlrAwPD9PQ0IBhGDz77LN861vf4vDhwxiGwdve9jbOPfdcmpqayGazfPKTn6RcLqu2SHZegPvvv1/1o4yT7/u88Y1v5LWvfS2A8i4DPPPMM/ziF79g165dSumXLLVBEHDgwAEA2traWLp0KWvXrqWlpaXGO1AoFFTZGvEW5vN59u3bxy9/+Uu2b99OEIyVdxCabrlcZteuXRiGwezZs7n88stZtGgRnuexa9cuPvOZz5BOp1U/OY6jQN0DDzygaGylUgnXdVm6dCl//dd/rYwVQ0NDfOYzn+HIkSOYpsm8efP41Kc+pZ4NQjC5e/duvv/977Nnzx4Mw+CjH/0o06dP56677mLjxo2qL4UuKHFssViMtrY2LrjgAtasWaO8cI7j1NQEFSWzWCzy05/+lCeffJKenh7lmZe98rnnniMSifCzn/2MSy65hNe+9rWsX7+eH/3oRzQ3NzNr1ize//73P29QKs9dz2zRDS2TiXg1o9EonZ2dLFu2jGPHjimg8OCDD7JixQoFJMSz/Oijj/Ktb30LwzBoaGjgNa95DRdeeGGNQUc8967rksvl+NGPfsSGDRuUN0y8YHLNhx56iIaGBtatW8fZZ5/N7bffzj333IPrulxxxRV8+MMfVtcXg8LevXv5/Oc/z+DgIKZp8va3v50rr7wSgKNHj3Lbbbdx9OhRBQ7ES7pt2zaeffZZ9VoQBGqNf/jDH2bx4sWKQtrd3c3mzZvZtWuX8mYJW8+2bdLpNLt376ZcLtPQ0EBbWxvLli3jnHPOOaEOsfSN7DknMyY8Hx1AB6VixNLvLSJzbrykQnpb5PtdXV3ccccdKg/Mm9/8ZpXsbrL51d3dzac+9SlGR0fJ5XL827/9GytXriSdTrNjxw4+/elP09LSUhP/K8auu+66S+1jOqNq9uzZLFmyBAg9h/feey+PPvoonucpo+GcOXMm7a98Ps+NN97Io48+SiQS4VWvehUf+MAHaG5uViAyHo/T1dXFpz/9aY4cOUJDQwOnn346qVSKTZs28fOf/5yuri6am5sVLmlpaSGZTNYkbfV9n3379nHffffR3d3N4OCg0tXa2toYGRlh06ZNis68YcMGrrvuOubNm6c8+XomZ/EY79u3j40bN/LEE08oJoqELUi/HThwgG3btpFMJlm9ejVnnnkmpmlOClAn0w+fr7zigalQTaQGXFtbG77vMzg4SFNT0wvOHDZZJxtGgFcpU3FLRB0T1y1j2SZNLU3s3vUczdPa+Pgn/4VZc2eHRVQCON7n8bWv38ZP7rwfz7dobWimUChRqfjE4nGKxTJgYJlanINZBWJBndrtT9Q+SbwykedUxBtXLxaPYXDC94OaD5kmJOJRDK9Cf99RLjjnDG78r49hBCFESDhhLCF4WKaFHYkQAMVimUgsQq4MX/qvb3LTLd/GsmNkGlvo6x/GciASS4QOJkwVE/pii6p1qpIO19J5PfW843VSgFsuM62pkXKpQCwaITc6QlMmzs/vvJPW1sbwHia4FfA8FydiY1oWdmBhO1AqVYjHo7z5zW9WddYymYzaqE6Wkv1UNgDZ4E4FlE7lnroXSafK6R7UVCrFY489RiwW4/d///dJpVKKtoJhIEbVqGPQNzjItKYm/uZ976Knp4e77nyYuYtPx68UyObDOr8eAUW3QjQRJ/CrdG5JdhWYymsaNqT+CWrnkcSbTuQ5PXnJIcDwME0b03bIFUqkE9P49nd/yszOWfzRW8+n7ELUNvG9IhELIo4DmGGFIt/HCKxf+zhToEaRFUUVQkuwKNi+77Nq1SoaGxsplUqk02lOO+00tm/fTi6XY2BggK1btzJ37lxFzdKBqc4OgFApmDt3Lvl8nvPOO49oNMpPfvITtm3bBoSlA4TaJGAFUNlFs9kst9xyiwJDogCIl7JSqSgjSblc5qc//Sl3330311xzDddee60C2+Ix0D2G27Zt48iRI+zcuRPDMEgmkwRBmFFWwJ5t23R3d3PkyBEGBga4/vrrlQKvx5UKeBNaWnNzM42NjUDobRNrd1tbW03iH52uKm3T48n0vaNSqbBhwwbuu+8+RkdHSSQSNDY20tfXpwCfUI9d11Vjlc1mWbt2LbNmzVJGCVH+BeQDbNy4kTvvvBPXdUmn05RKJUXtGx0dVRlFi8UiiUSCI0eO8N3vfpePfOQjmKapymMIrUzmQnNzM9lsVj2HKPvyu6GhQSlikUiEWCzGtGnTTkgUI15Teb+lpYXR0VHa29s5cOAAmzZt4oknnlDKWKUSGpz7+vpUopUgCDh48CDDw8OUSiXOP/98pdzLeAoFr1wuc/vtt/Pggw9iGAaNjY2qVJyMtW3bykDxxBNPKGPDvHnzQqNb1aN2Mjrvqe7lOsiZCjAVeqDM09NOO43Nmzcrz09vb6/6W7xR0scCzguFgqKNC5NGaI6ijN96660899xzar0LCBwcHCSfz+M4DqlUigMHDnDPPfcQi8VobGxkyZIlBEHAzJkzlVIu80kXqZ8qmYFl7Q8PD5PL5ZS3KR6PK4NIuVxmdHRUvSdzQ0IWJO7xO9/5Dk8//TQzZ87EMAwGBweVl10vzyPGma6uLvL5PKVSiQsuuECNs76/1GeU1b2dz3fc6/+uN1jIGOvARsZMDynQPd7yW+rdSomrTCaj1unJRAwXzc3NtLW1kcvlWLBggQJP+XyegYEBNQbikRVWpLRfwhX0MD7d+JFOp2ltbSUSidDY2Kho2yfTryAMG2htbWXlypVEo1Gam5vVMwJq/2tsbKSpqYnGxkbmzZtHMpnkZz/7GT/84Q/JZDI4jsPg4KCiJY+OjgIoQybAAw88wAMPPKDmnsx50zTVPuQ4DiMjI7S2tnLo0CG+9a1v8Xu/93ssXbpU6Yy6MWHv3r187Wtfq6Gb9/f34/s+yWSSYrGI67qKlWMYBvv27aO3t5fXve51U5laNfJieU9f8cAUwsXxR3/0R3zgAx9QG74soPE6St+QX6hHNepEyI4MkUzG8QOPUrFEU1MTBw8epG3GdD77uS/SMXsOAVD2Q/35i1+5idu+/T1MO0kqFsXzDDwvIB5LUq5UKBSKNDY04+Hhyf2Diayk4iV6PlLtn/o6qCpGc7JYS49yqYjpGASex+qVi/ji5z9GOlFNOOOBZblgGHhBQBAYGKaFj40ZgaILn//Szdx0021EYxkwLbK5Ek3NrfT0DdLY2IznTdz/L7WvyZ/0Bj6+W6RQ9olGTMrFAo0NaW699WYWLWwl4kClBJEo2I6B79n4Xsi+tazw2tGoQ7FYprExw1/8xV/whS98gV27dqlYLp1uM568FDSKyUS/p+t6CpzWW+RhjEIUj8fZsGEDQRDwhje8gYaGhvAQ9sM+CC9cpqUppIHFI/CBv/oThgdyPPHULsxoA+lEI/lyEcOxqXgutmlhBebYGGl061OhOr9QKZfLOJEYgRtQqASkm6bzpa/dQiod5/prz8AHPMPCDwnG+OUKph0lYpn8OntLoTZdv/yW1wqFAlu2bKFQKGDbNh0dHSxZskQpAxDWEZw7dy5btmwBQkC3du1aBVRk3tTTyySmSz534MABent7OX78ONFolCVLlrBo0SJFHx4eHlZe+FgsxtDQED/84Q/Ztm0bkUikms08wuLFi5k9ezbxeFwpzvv372dwcJC+vj6OHTvG8ePHwxwBVQOR9INQzYrFIjt37qS/v585c+awbNkylixZokpCZbNZtm/fzqZNm2hpacE0TTZv3sySJUtYtWqVosGKQiVKlm3blMtlCoWCUpoaGhp473vfi+M4NDc3s3HjRh5//HEFflatWsX06dOVgiWK/9y5cykWi5RKJRoaGti5cyd333032WyWTCajYohuuOEGWlpaSKfTZLNZDh8+THd3t6Il79ixg3g8Tmtra40yJ4oNwC233MIjjzyC4zgkk0lyuRytra1cddVVpNNpBZJ7e3vZu3cvO3fu5OjRo4q+GYvFWLp0KR/5yEdUrNVdd93F8PCwAo9nnHGGAgIS1ynsEqGDS/9JCIQe8yegXWKyZM729fWxZcsWBgcHiUQinHfeeSxdulSB2Gw2S3d3N1u3bqWvr4/GxkYKhQKPPvooHR0dzJ07V3mQAeUFufvuu3nooYcUtbxQKNDU1MTll1/OzJkzVRv6+vp45pln2LJlC0NDQ3R2dqr9U7Lpiug6zQsJxdD35qmIrDHXdWltbWX27NkcOnSISqXC0NAQR48eZdq0aTUJeaSWrABSKUkia1uMPr29vdx6660cP36cjo4OCoUC7e3tvO51r2P69OnE43FisRg9PT3s3r2bzZs3s3//fm6//faaXAwwlpBKjznVPblCUQWUUeN1r3udigHftm0bBw8exDAM2tvbOf/881VZnEqlorygellCwzBYsWIFfX195PN55s2bx+WXX86MGTMIgoB0Ok1vby8DAwMMDQ3R3d1NT08PPT09PPHEE3R2drJ48WI1P8fzMJ7MYzrVMawfe5HxSq3Ic+l0Yn1s9ZhovYZoJBIhkUiocRDj0MlEvJxCQU2n0/T09Kh1s3z5cv7u7/6OcrlMJpPhiSeeYM+ePcqAcO211ypjiLBccrkcS5YsUcZxWTfCehBgLaydycT3fRWbKUZZ8Whns1m1dycSCUZHRzl+/Dg//vGPefDBB5WxccWKFSxYsEDF6C5atAhAMWHuvvtubr/9dqLRqNqPzzjjDDo7O6s14cNs7Hv27OGRRx7hwIEDGIZBd3c3d9xxB29/+9sVlT0ajVKpVBgdHeV//ud/1H5cqVRYtGgRCxYsUOElMueOHz/O/v37efbZZ1U5SzG2TVVeTF30FQ9MRRF53etex4MPPsgDDzxAY2OjsmroE6/eIj8Vy9PJ3jcCKOazJOMJLNPAr7g0NTXR09NDqVLh0//xWRYtW45lmXhArgif/dxN3PadO6h4NvFYHMuOU8iXCAIDz/OxbYemxvDAz+VyRBPhoWDUe0qrgDRQf9eLXgamptV1//Ih8LWyL1oioPFcOVUXkhGECWCSMYOhoeNcfP75fPbTHyOVgIgNhguW5eOWithRB8uIgmFQCWwMA/oHC/z0zl/whS/8F4lUE6YdZnoNAoNSxae1tZXBwWES1fqh9U0wOUl84CmIoTyxVQW8+i+93mkAY8lutO408bEdAyswqbgFmpsyfPHzn2H5slZMoFCAiAW+H3pNzSoYdV2PwBiL5YjFIhSLZdLpNB/60If4zGc+o7w8ugdy3EQGU3zOektr/VqYsH/q71f3ed/3ajxfeqyKUDKFNuk4Dg899BDFYpG3ve1tNeUvUqkEBgEWBgE+QanCsoXN/OWfvIOPfvw/ONg9QDTaSKHs4/kVTCdCuVQmYTtYwVi76ueEIYCqfq4YYwwEGKOJB9UPquuo+W6Mex2v4hFLJqlUXKxIFMc0yBbzxCMxPvelG0k3/hVrL1xKwo4SVlwNcN0yEcup3vTXOxlSvfIjSRwAtm/fzr59+1Ts2PLly2loaFCxV+I9W7FiBc899xzlcpm+vj6efvppLrjgAhWLJgqTngRJjwNLp9PK4tzW1sZFF13Eueeeq9aHTqEUquejjz7Kli1b6OzsZGRkhOnTp3PeeeexatUqdXDL99auXcvo6Cj33Xcf/f39XHHFFWQyGUX11RUSHRicf/75vP71r1dKkm6tXrlyJaeddhrf+ta3VN3EJ554ghUrVijvqpxdIlK7UKciNzU1cfHFF6uYxb179wJjyVwuuOACFfMmonteJNnTvffeS09PD01NTZRKJc4991yuu+46Fe8tHuwzzzyT4eFh5QGdNm2aio8688wzVVIlUfIeeeQR1ldrPwooveaaa1i3bp3qDwEGruty8cUXs3nzZrZv386sWbMUeEyn06xevVrRNtevX8/o6CiZTIZ58+bxmte8RimD4p0TBVoASrFYVPeTfhSPOKA83/Ks4n3p6elh5syZXH755eoZ5XulUomzzz6bdevWcccddyiasgDKjo6OE+hzzz77LL/4xS8wDEMptJdddhnXXHON8uaI0lcoFLj00kvZuHEjDz/8sApFEsPARPvzqYKS8WQq+o/EKOt6lO49NwxDeWB08C8UVknEJfGKrusqEF8qlfjhD3/IgQMH6OzspFQqcdppp3HttdfS2tqqwKvv+7S1tXH66adzwQUX8OCDD/Loo4/iOA5NTU3KYy3jKrHawi6wbVsZYvTzr7m5WdHd+/r6GBwc5MiRIwDMmDGDa6+9VoEz3fBTHx+7fPlytWYvvPBCpk+frvrK933mzp2rnvfpp59m48aNHDlyhOHhYTZv3kxHRwcNDQ01xr/6vydyskwmk31PWE5iDNHjJsVQqJfVEQBaX99VdJlcLqe8lVMBfnqCRwGokswHQkPPRRddpMbzyJEj7NmzR+UPOPPMM9UeIs8pIRjyfLLWxVspSdsmMgTU918ymVRnkHhx5fpyhumJoorFIk8++SSO43Deeedx4YUXMm/ePHVN8UBDuI8/9thjPPjggzQ0NBCLxYjH47zqVa9izZo16nmEtdHe3s5pp53G7bffzmOPPUZjYyN79uzhwQcf5I1vfKM6dw3D4ODBg+zfv1/lW1i3bh0XXXRRDVVevPjLli1j7dq1rF+/nuPHj7NgwQK1b08mL4Vz5BUPTOVQMAyDv/zLv1Qbliw4fQOv38yf72IfuwAqG+LI6BCxRIze3l7iyRSf+88vs2LVGQRAwQ1B6Sf+9fN8+9t3kEg2k4inMAyTQiFMShGLRcOYUiJU/Aq5XI7m5mbypWJNe084jAyfybLITi4mRoBWVkUHpbXxnKGe7lcTBnkUi8Oce9YKPvDed9PWAnbVAWvZPn6pgO1EwQ+olCo4sQS+ByO5gPseeIT3feAjNDS3Uyi6gEk0FscnoFwoAGbVY4i6vwG/8mQxOigdEwGpPngVSpUizQ0Z/v3fP8GFFyykUgpz8iTjYZvLFRfDBSdiAwGWZWBYUvgaPG+MGhOLRfjABz7AN77xDe666y6amprCexknJsDQLZoTSf18r18LpzL/x/usXqqh3rsrrwlFsFKpkEgkeOSRR+jv7+e9731vlfKUwHPLGAYEhk+l4tKQiuO6cPGFC/jTd/4Bn//KTRzr6yLTMoORYhl8g0gk9rKHGsdiiZB6H5gYjk/JD/CMANc06B/J88l//TypT/4dF541GwMDzzewI7GQmu95YNr8OoNTKVNQP/dKpZJK5pBIJIhGoyxatEixVfTSCnPmzKGtrY2enh5M0+Spp57irLPOUgCt3lgiYFPolJ7nMTg4yLRp07juuuuYP3++oro5jsPQ0BCNjY1qDe3cuZOHHnqITCbD8PAwM2bM4KqrrmLBggUUi0VFJdTLN6TTaV73utcRBIECa6J8SA1Bx3HUd2fMmMH111+vWA1Ce1PJ4DIZzj//fHbt2sWWLVsUqOzq6lJeZQHGuicwkUjUlIAR5UG3XhuGoWr56cqYXvNUgJXv+2zdupV9+/aRSqVwXZc5c+ZwzTXXqPf1DJGVSoXGxkbOOeccSqUSW7dupVAosHPnThYsWKDiOWOxGMeOHeNHP/qR8nyXy2Uuv/xyLrvsMmWcEOOUngX3nHPOYdWqVSpeTH8+2TMk8ZPQX8UzJsBDT/gh7Zfx1DNk6p4eSYwj4FeA38yZM7n66quVN1vGXgBPX18fra2trFu3juHhYQ4fPkyhUODIkSP09vYqUCXZNCVZimQVvuqqq1i7dq2K+dIp2OKNfPWrX01zczM/+clPKBQKJJPJCcOQTmXvrqfJ178+mcg9ZB8ol0MDquhcxWJR0V1lPMSDVCwWFVU5EonUeNck3njXrl00NzczOjpKR0cH11xzDe3t7TWJ/8S7BdDR0cG1114LhOwLuXelUiGbzdLQ0FDVp2LKCCDgWIxAspaTyaTydutGLskmXZ/dVeav9L8YYefMmcPs2bPVWajH4IvIepB1ddddd5HL5di9ezdr165VFGPp86l48qZqnKin7uryzW9+k2nTpqnxFKOBrBN5Tca5ubmZ008/nXnz5tUYBGGs1rCeWXyy9smaFD3BMAyVCEzP7CzJTKV9+XyeRCLBwMCA+p7EoIpTStdN5HqyF+khAZOJ53mMjo4qrCE6v+/7jI6Okkql1LknuMPzPC655BLe8IY31IQ6yV6lx5o/9dRT9PX1qcR3V155JatWrVJnguyNwghpbGzk2muvpauri/3799PS0sLu3bvp6+ujra2NYrGoaO+SVCuRSHDxxRerJF6yX4q3WcDv2rVr1bwvFAo1htOTza2JXn++xrNfS41oIu/QeKJb6ubMmcNVV13F7t27FX1HDgA9Fg7GUnPLBl9PP4Qx7rosQNks5d+SGMD1PWwnStkNmNbewd9/9J9YtnI1AaHePDBQ4l3v+ku+ftOttLXPxDcc8rkSgW9h2xEMw6JS8bAsRylqiWSMYimPiY+JjxF46sfU6LtBUC31Ij/KuubV/cjrvvajT6pqbVIsCCykAqTnBZimjQFYpgGBB4FHxIZcdoDTT5vP337o/+OMVTMIAsIYW9MFPEwjCGNgXbDsBAGQy8GXvnQz73v/R0mnp+H5NrYTw3Yi+L5QQmJjViXPBU9qdrpqnLzACOMLDb26Zl1N16n8ID7k8Tco0whwLBsTA9+t4JaL4LtEbBMCF9/PM70tw+c+969cdulKCnmIxcCJgOtBQIDjGNgRgwAPDB/DHBsf06RqXZQU3xWiUYc/+IM/4K1vfasqxSAHh3gr5G99neh0SP2n3upaT5ucbH3poLNe9OQQ9WtWFFgp5yDgJplMcvToUf7+7/+O3oGjBLhYtlWlBTtEInEqeRcD8Evw+2+8gDe8/nLi0RL5fB+xiIVXcYk6UQJvbMM3DIPA9cKKtJaB748pdqrET3X+TmSUMowAwwhUrd+xNwIwqrVOAx/8IKx6VDGwiFQPcg/wsByo+B52LMnAcIlP/uuXeGprf7gfGGBaFm6pBLapqMbi6ZO9Ssb25Ra9dp4o1a7rcujQIZ599llSqRTZbJZly5bR0dFR06eWFZZcmTFjhlJkkskkhw8fZvv27Wrv1angYmnXM1VKptt169apOC6hifm+r5Q6UZCeeeYZ1Yee53HBBReorKuWZamyJaIsi7IpmRblb3kWUXz0jJ+/8zu/o+J/5PvizRNl1jRNzjnnHJUMRcqI6WUopG8FcOlKpL7udRYCjNU+lX6TNsKYZ1AAwObNm1WsXzQa5YorrlDKn3hAZD+Q504kEpx//vkKzA4ODnL06FEAVb9x06ZNDAwMqNI106dP5/LLL1dKuH7WyjNKP+k1WnW6uHg7RXGUtugeGPGUSp/ohjDxjOhUROlHGWvxlIiieumll7J48WKCIKgp/SPj09raShAEzJo1i9NOO00pzKOjo4yMjCigY5omhw8fZu/evZimST6fV556oXnr5Wj0+FTTNFmwYAGzZs2qMXDo7dCB+FT2bpkfItIfMu5TuYZuIJG1oHtRdbqk/K3nR9Dbq9eSBHjiiScoFAp4nkehUOCaa66htbVVgRT5rm6wsqwwQ++6deuUF6u+VJS0S8ZT9EBRtGWtyTqSeSfJ3QTY6n2n7xMyFjrol+fK5XKq33VgJv3iui6rV6+moaFBxUR2dXUBqD7VvZTyzHqt5PHO2olExkSeUXRaaev27dvZsGEDGzZsYOPGjerv+++/nw0bNvDAAw/w4IMPsn79ep555hnuvPNOcrmc6nd5VukDvZboVERnr8i+L+Op021FlxAKvuwT0m8yRno5KPktfS+GOPGiT9Zv0r963Hsmk1EZbXUwLeXrpP0rV66sYXnI8+hrGcLM1fv37ycIApqampgxYwarVq1S4yXXFpE+z2QyXHnllSQSCQYHB6lUKorNIcZcYS5ICS+Zo/X9oRthBSzL2EykO07m1Jvq/JxIfi2B6amIWEokE+9b3vIWLrvsMvbv308ul1OblcQIiKU0n88r+oW++cGJnH6ZiOICHx0dDSeNZeJE45QqHqWKh2VH+LM//2suvOQSYrEoJR+efvYwv/emt7Jh42NMnz6HvoERTNMhmWmgWCmPhcfpg1znoaufAPq/X4gH0cDHDMwwAUxQzWZaU9OzGvxeCTfUfG4Uy/DwSgVyw4OcuWo5f/uhv2DVivlYQMyCRNQEXPAq4ERDj5AVwQ9gcAi+9OVbuOmmb+NEkhhWDAKLkD4ZLmAzkN96YqKxmq3jUUtfyM9YX4Ben1IkHO9hPK+CiU88HiERj1HKZ7FMl5nTW/n8Z/+VtRetwHchmYCKG/qeTcsfu6b84J9wH9mkLEsKLHukUgmuuOIK3vjGN9Lf368SlMjGJof8eAC0vn/09+uBaj2Irf85WV9Ppf9FwRK6kMQdiaL88Y//E7ue2wkYWJaDW/TwCh5OzMYyIRaFQrbC+//qTVx95aUEbo6IUSEoF/DEGu5UFSOzqswH7pRoOlNp/+QSrpPwswGB4Yc/gI+JHctw9NgIn/ns13lme56yB64BgRMFxmiIMHYABsFY/cWXW6Rt4k2QPnn88ceVFX3atGksWrRIHdLiAdRLlaxatYq5c+fS29tLqVTikUceUbUL6734OtAQJUXoVPUlSuS3fFfi3gR0tLe3097eXqOI6ErlZFK/dgCVJGWy+Ck4sXajyMkMQ/rnx9vvJnpvPBkeHubYsWNK6W1ra2PhwoUAJ6wP3SAsyVsk82h/fz8DAwNA+PzFYpHDhw8rBdW2bRYuXKgyRup04pOJPvb6M+pjOp68EMVI3/sk4ZLMXR1k1O8DAq5F2dRDheT34OCgqk9bqVRYsGABDQ0NNZRmfdz1PtJpr/XvvVB5voqiPK94WMrlMpVKhSAIlBFAAJfuNdX7U5RyuZZ4mvr6+pRhorOzU2XD1p0E9eMshiBJhPNiSr13eTyjr/66zJUgCNQ+KTWXJVOsvC/tlnkg4WZC35d76Pcf7/lPVSYCseJgkb1MqPiJREL9nUqlaGhoUP+Ox+OKwSXAaaI+rP97sjaOJydbv6cq8p16fWkq35OzuH7t6k4qubZ4bVtaWlQCu5NJT0+PmjvFYpEFCxbUGA+AGq+leIxjsRjt7e2KStzX10dvb68yZJimSWNjI9lslkKhQHd3N/fffz/ZbJYgCBQLSAypQRCQy+UUsBUjw8slv5ZU3vEW6EQim55QMmbPns373/9+ZUGQemZiwZLMVIZhqOxX491TNoREIkE+n1dWLNlII5EIw8PDeF5AT28vF154MX/0jndyzrlnMloIazI++eQe3veBv2X33oO0Tuug4oLjhBtqb/8AmUwGfE/RRQPGrG8nPnud8uYHKg6uFpzWgwm5zomKbgDI2gyqEDn8bWpveFhmSNF1HJO4YxGUXZaftoSP/N1fc9bq6ZhAuZyn7FdIxWLhVUwDXI+KZxKJwOgofPbzX+PWb/+QfNHDMwIyjWm8cjnMHBxI33uYhlFtXDVdTKCB0hc9hal0nu4dG/NIm/g0NTRQLOaIRCxy2SEC16NzxnQCv8gnPv5Rzv+dFRQLPvG4GfaFW8TDwjCDMLhUiwStab7hA6Jkh84zsXYBZDIpXv/662hububLX/4yw8PDNckKTNPEPQmA0ZUs+bf+u/7vcXvnJGsxCKoexEm+X3846pSXUr7IJz7xCd7xR+/i0rVXhFOvDF7Rw4pYYAbEogF+AB/76F9SKLr87OcP0ZBsJ6BCqSQA1MQ0wYlE8f0qDQiDQNpd38zqv+WpTpxW1ZixibL2htx37d9+lbXgj82kwML3bQr5PM/uOMAn/+0/+ciH/ozTlmUwDDuMqbVt0GoJ64rdqQCol0rqvVMQllnYsmWLsuLPnTuXZcuW1XxGDjvxXM6dO5fVq1ezd+9ebNtm//79dHd3s3TpUjUfajzfVYVAPMexWIxEIqGU9XoQIR6akZER+vr6lEGksbGR1tZWdQ/Zw09Faaq/l8QBTUX0RHy6EXQ8RXc8A2n9Z+u/M5kMDQ0xOjpaQ4/dunWrAhO6N0z6UJQtUY70LLwyRqOjo/T09NTQ8ATw6l7JU5H659X7fsL9R3u9vv9OlkhG+kO85BMZGer7W6fhiQFGn79CyRORmrSiyMu99YQ8ss4lBk73sr3YcqpAR9ah7pWS+Dy9T/R1KF5heT65jsxx3w+TyQwPDyuP7LRp02htbQWoWSPjASq9r6YqE80f/Zq6d3Gq19O9fYcOHWJ0dFQZxyzLIpvNnuC1lJqpopuKgUPvrxdL6vtQn1u2bXPJJZcoj70ALZkjeky2XMf3fWbPnn2CQanegKOP4WTtqx+Hib4zkUFcb8dU7iW6x6kCU6AGmNaLeEsl8+9UZHBwsIa2nsvl2LJli5oLsufqnlbHcXBdV9WelnAScVbInrRgwQLmzp3Lzp07GRwc5Mc//jE7duxg2rRpzJ8/n1QqpTIJNzU11bA5JOP6VJkZL7a87MD0ZBbgqW6gYs2XQ3Pp0qV89KMf5Stf+Qq/+MUvMM0wPXssFlOp8HV6kdy7XnkOgrB2lWEYik4kCzqXy+F5AZFohD98+7u4+urfZdbsufhAJALfvOVOvvxf/83R3kEam6ZTccPyL35gMDQ0RCoexzENKl4YlGlUc8zqh7PeJ/oGEwQBBAFGMJUEQM9HsR2bjG6lSCQWoVjM0tSQZGDgKGeevoxP/9s/M3dOBM8F2/axzKB6UPj4AZiGjW85EMDgCPznl2/m5lu/Q77k09jUgmsYamMeG+cqAPWrIN0EHVCH4O3FiKkdE6NabsevYmGCgMAQgB62p5DLYjsGlXKRhlSSkeEB4lGbf/7HT7Lu4tW4ZZ9kPCxTki+GgfG2aeD5usUpHN/a36FEIjaeJ4eBiWlaeF6YHMVxHNatu4RUKsWnPvUplQwGqnFl1QQe9TKR9bV+bk22xsbzaNTe79RjVBX1y4KomSBbyHPzN26h5/gQl6+9jJbWZizDIp8bJZGOEXVMyn5Awjb49L++j8Az+MnP7qehcTq+HZbfCS3Pfhi/q1u0p9y6k7d53OsEHhjVMfY9sKpGoiAgwIYA8vkSTc1tlPOjPLH5Wf7zv27ife99N/PnJfF9g6g5poBKbUAp/C0JXl5O0fdHSUCxefNmRc3OZDJ0dnaqBFfi2ReLq2TVLJfLKiPgwYMHcV2Xe+65h3nz5ilDoRyC0ue60i+i0xthrO/kdclGqCssehZNnXY4lfNFPq+DilNRikUhlWcQpa0+/8FE4FSX8ZS4yURiT4eGhgiCsNzJjTfeWGNw0L2AopzKv4MgUEmF+vv7yeVyJBIJRUMUZdu2bZUwShRdnaZ7KlKvdE70GX1v0sdVXh9v7ejKqa7E1V9Tvl8f4qPPHWGByGviCRSl3jAM5dEQulz9NeQ6Mi/0fn+xjFITgfupXF8AqMx7wzCU51wMR6LU6m0Wb4vuXZa+1vtLEkzJfNSTkulGE6g1cp4KuB6vH+q/P57+J79Ptu7EKbJ7924ef/xxjhw5UrMHyZqGsVAwfU+VOTReG/R1cKogTO8zfU/RDXvRaJQrr7xSnTf6d8R4UiwW1R6h7386BXS8/pnqHlv/+anMyfH65GSfk7/l2lP1lkItlX28M0o3KIjRRcDjVAygg4OD9Pf3YxghFf3HP/4xmUxGxUfr19WfRc472YMNw1B/Q9ivs2bNYt26deTzeYaGhhgYGFBZ6nft2gWggGlbWxsdHR0qH8TLCUrh1wCY6vJ8NmO9QK0srnw+z4IFC/jTP/1TotEojzzyCAcPHqSlpYWmpqaamBM9AYYu8m+9+O3o6KiqOTU4OMis2XO54jVX8s73/DGVCkRi8PQzR7jlW9/lnp8/QN/AME0tbZQrAcMj2bC+mufilss0NzaSzefqaGliGQlhi2EYY3VI9bIY1eREQhms9ZLWKwLeBK9Ln1cXmhFAYIa/x94lnnAo5kaY1prmSNdeLr7wXP714//ArJkRDA9sC/ADonZE0WGz+RyxeAOWCRUfvvzVW7jx5lvJlzzSDQ2MFvNVZag65kH1Gczq+AdhnJ9i8qqxCcFfWF10aha5yefT+O8Ljdh1K6TSSYYGe4lHHEzfZeWyxfzZn/4pl126mkoRTDP07JbLJSzDxDYtilWAGmLQKpjWfhtSJ7Wa1dayDAqFMuBg2yaWZZBIxAmCMO707LPX8IlPfIJPfepTDAwMkEgkaGhoIF9N4DGeBVOe/2SK7mT9Mx4g1V8zJ+GS60q5vqmH7TLDmNpIEjMw+c53vsPunbv4veuvY+bMmaQbM7huCcO0sa1wOlgBfOIf3ouNz933P4IVacSyIthWSOUvlcM6ZqZhYZphGSMA35hAQTaq60MxB+o/VwXT43lOjQAzcPElpa8fGhwMwyaM0wbHCQ0wbqVMQ0srD218nGgixt988E/paIV8oUIqWhu/JRTYlxuUwphyKMBuaGiIrVu3qhqPhmGwf/9+FTspzBWxSg8NDZFKpSiVSkpJl8Qw27dv59ixY8yfP/8EA4ruSdKzRtZ7VesVR+CEQ1x/vT4ucTKpB47SNmHgnApdXFdSx/u7HlzpbR9PCTuVs1Jfuzoo1gG7iJ50RD4TBIHKciuKqpy50rb6LJxTaV/9uD/f54Mx0C/fnWxs9Pkk/VIfe6YrheMpxDqrQffEiEI73p45ntGwXqaqpE9FpC+eD7ARkJjL5Ugmk5RKJY4ePVpjeGhvbwfGMvgCKlnVeIBD5rYehypysvlTP1em+hxTAT76GpyqQh4EISXy5z//OVu2bKG3t1fplcJ6kb1CAKkezqLH9o33vM8HfE/WXh2kCg1fTx4EtTVTJW5Svi/fkTjc+vVwKgBTpH7v03UGua/8nuhnsueWtun/nspYCxjVgak+X+Xv+nhqAaaTxbI6jlPDBKpUwsSnhmEoQ0Z9DgMx8owXfqDPM/GIt7a2snXrVp555hlyuRy5XI4DBw7Q3NxMd3e3KqXW2tpKZ2cnZ5xxBmvWrHlRjWOnKpMC0xd7cUzlfqfSGfWWa8nW5bouCxcu5K//+q9ZtmwZP/nJT9i5cyddXV0qVkkGvt6CqbdB4hlM01QejUQiwWmnncZb/uBtvOq1rwZgcKjMLbf9Hz+44//Ys+cQbsVk5qwFHDx0hLa26VjNMUZHc0RiMRqbMmRzI9XnDdutLxrDDGmCQUCo5I71DkL9FAkpvUHdZ7T3T9qXdTGVBugA1sDFdz0iUTh+7CDXX3cVf/P+P2dmRxw8sOxQr7dMC88LY+tczyOZbCTA5Fhfnptv/i43feM7jBaKpDNNVAIfx7HI5rNk0mncklf1jlZjMQKj6kEeW2g+VL2kXrV9BhinTksaT+Trgeq5QOtBn0jUoVTIk0km6O05yuIzz+AfP/YRfuecxeRHAjIZA7diUMyHiUUMtWmJB8KqXljieKkxMpimjDvVeRZm6g3fC+m90ahDPl9k0aJFfO5zn+Nf/uVf2LlzZ3WQTjx09X7RFRJdmX9+fTUOSJ2CT1Luqx9wAHgW4OB7FqVSkeaWFp7ZtoU9e7dzzZVXcd5559E5Zy6FXJF40sEAvKJPJmHyH596P5UPlPj5A5sp50oqM2xQ9vE8v1p+aPI4zfr5U/88k62fwHAxAh8fuzrWBkEQUovBJxaNMjTcTyoZJV8s4MST3H3/w7RO7+Btb/pdFk53MBmjhEmpCvn3r3r/PeEJNdqh4zhs3bqV7u5ulSWxWCzyzDPPkM/nlfdD6OjiEalXIMRDUiwW2b59O+3t7SSTyZo9WJQAUfblgK6P8avPrGjbNvF4XBUwF2AlWU51sDAVw5YoaXLgyzqbKHa0XuoVcl3qgagox+MpqM9H4QNU+YB4PE4+n2fOnDmsW7dOle6Q/qin3slvvb9knMRYIdkvJZ5OvP0wlsX1+c7fyZ51vPf078gYTQZ2g2DMu6mLroDW98tEzyS5LkTJ1+PH9URWupIpYEHuKfc9lQQyU5HxnnsqtFVpjyjYx48fp7+/X7EjZs2apSi49WeL9Ks8j57cR1/bAn50I5juPZb21xsbXsjcGu+1kwFYfQ1Kv/i+z44dO9i8eTNHjx5VdHapExmPx5XuqGeU7unpYePGjRw8eLDm/uM9z8nA16nsBTL39H1L5piM03h7Wj1IlPkw0dx8PvtU/RjX6+DjfXYycKqPV/17pxpjWs9c0vUsnbGjJ6WU+T6ZiFdUPO/nnnsu7e3t6ryVcw/GYtzF+KUn/iqXy8yfP78m07vkAli+fDmLFi3ioosuUvW3Dx06RDabpampidHRUUqlkopTPXbsGEEQcNZZZ71s+sevlcdUZCoWRRHDMKp1EFM1ha6ldlVbWxu///u/z7Jly/jBD37Afffdp9LPl8vlmnIc+qEmm6DUEyuXy6xYsYJrrrmG1atXM3PmTFrb2ykFsP7BTXz3Oz/ggQcfwfUsTCtOJpmhq7uXWbPmcux4b8jfNm3ccpl4PIpjBWCaeFJOMQhCQGYYBIGvPKVhpk8t5lO5doIJQEFdXU71vfE8pwFB9fNBFZoFVQ+SEUBgeDgRk9zICFdf/Wr+7m/fz/RWk+xInsZMAj160jIdypUylu0QYNJ9bIDv3v6//Mfnv0gq1Qy2g1cdzlKlxLS2Jgb7B3CsOFZggR8Qdr9XzXwKmEEIzgNC8C0e3YBJYxtfuIT9ks1maW5KMzrYz+WvWseHPvB+1qyaDR6kkga+C7ZtYdvhvMuOhjW4YolYdYMyUGB6HDEMcF3JXilJL6BS8ahUfCIRh+HhERobM0AYg/pP//RPfPOb3+T73/8+rdOm1SiW9ZvxeBZofV1Nxatw0gNiknot9euqFnQEEFhhVuZIQL4wSjIVY3Cwn1u+/U0OHD7Iq6+4ioULl1IuQCQK6YQJBuTzZT7y4b+A2Hd4ZNM2+vr6cCKh5zm8R0Cl4mEaVQ+Z9Ic8StVIYJi180hsPBPFnNauH79K5Q2TiOFZEDghQAUwXErlIulMkoAypXJoCEulm/nGbf9D1HZ45+9dzOzpKRX/JzHEU42BealFDjrHcTh27BiPP/648uq2tbUpJVKSKEhsrIRNSPKjWCymSss0NDQwODhIMpnkqaee4vTTT1fAFE6kSYlSNV68mnxHLNXRaJRMJsPQ0BCGEeYRGB4erklKIvSzqYooIPV1EKei2Otnid7+eiPPeArdRNc+FaWvqamJTCZTU0ph9erVpFIpxTY62Xk7XhIjMT60trYyPDysgFhvby9z5sypUdiej+j9NZliXu8tONneNl4/6x7PegNe/XdFZE7qe6O0tampSSViNAyDY8eOAWPAVPe8CDCVa+iJcF4sUDoRyJqqiIEpGo0yMjLC1q1bGRkZUeVxzj33XDKZjPIS6UBW7yMdcJhmWAIjlUqpDK8DAwMMDQ2pmr86AKk/PwQsCOh/IX1R/97J+kt/XUD1jh07KJVKtLa20tTUxHnnnceKFStUjW75rD6era2tbNy4kXK5rLyO9Z67iUDV8xXdUF3vPZf26ZRyfdx0g5yALhkDPSZab/tUZbx4z8n0/5P1yURt0de7Hl8/2TrzPK+GVanvbbKOpe/ES1kul9Xrk3lkW1tbVebzIAhLV1122WWYplmTb0Sfm+O1WZ9jOuMlFospD/fMmTNJp9PKWLlnzx76+vo4cOAAAwMDHD9+nHK5zNDQEI8++iizZ89m2rRpJ23/SyUvOzA92SScinfH8zwV/KvXL3Jdl0QioZS9s846i87OTtauXcvTTz/Ntm3b2L9/P8ePH8ewQvqlYdo1i9E0TZYtP52lS5cybdo0LrjgAlasWIoHDA+Mcudd67nngY3c9Yv7yGVLOE6cwAPLjlIolUk3ZOjq7qaxsTE8vH23CjpKuF4Fw7LArLdS1dIdT5RqYh5j7HNBlYBYl0+22q/W2DUNAZz6pzRLUEBYm9MIMA0XA5f88CjvePub+Is/ewdNaahUoDGTAFx8L8CyHLwKYIATieAGcKirhx/8z//xqX/7Aql0M/limUQqRaVcoVQpEY05DA8Ph0qRFxDgYYrLskbvN1Rbg6oL2UBox6Gn1TTGfy71wCcVU+szX/1W3lpcpjWl6O87xjWvezXvf99fsXzxNHw39GoaFhg2+F6YRRjLIJVOVsdF+j680kQSluMxq7RmqFTcagybhXjHGxsz+P6YFcw04a1vfStz587lazfeWDNf6zet+g2/XpGbCpVlMiXtZCJ1w8bbTAPPxzBD8G9QwolYlEqh95Mg4P77H+CxR5/iuut+j4svWkdraytO1MT1KiQTNtFEhH/52Hv4+L9+k5/+9E7KuUECyw5p3nYc8PENKX0EtXR4qmuoemAH1VIuhL/lCY3AQq8VrM+YE+rbGsJ0qFLRq1IqFUimYpTLNrYVoVD0cCJJvnnL92m0i7z5htfR2hILy88E4HuVqpHCG5vDWlz1i57/axIZGRkhk8mwZ88eDhw4oKi6y5cvZ/78+UBoCJQ0/IODgzQ2NlIqlZRyKjUePc/j4MGD/PKXv8TzPPbu3cvw8PAJcxPG8WYHY+UIdKqzHNbisZL4GMuyGBgYYGBggI6OjlOatyKipImyrScqmco16o1GMHGM03iGo/EA7KlIQ0MDHR0dqt7fwMAABw4cYMWKFQos1Zd70tthmqZSmsR6L9k8ZYylvt+RI0dqyvw83xjpeiAy0WcmU4gn6ytRtHUKo4huHKlXBuvBsq4wZjKZGrDR3d2t2AS6512/p84AkIy3ehteDDnVeSPiOI5iOBw4cIAnn3xSJfRpbW1l1apVKr5cFF5AMT/kOfR55jgOqVSKlpYWent7CYKA48eP09fXR0tLS01m8vHOMym/VCwWT2jv85XJQGn9a9K+fD6v1sC0adNYuXIlmUxGAW4Yyy6u71eu69bMk6l4RF/IfKg35sm16kNG6sF3ff9LBm4YP4b7VEXW33j3msp5MJV9eDyjknjoJwOmAmLrr1evR4lxVsrfTPV8aGlpIQjCjLiWZbF9+3auuOIKxZbSY1Vlzsn99ZrIetiLzDt5XRKWWZalSnvF43FWrlxJEITMjeHhYb7xjW+wb98+TNPk0KFD9Pf3v3zA9OW2yuuT5vlsnrp1RzpZ/y2FsgHa2tp49atfzWtf+1pyuRy9vb3s3XeA0XyO3MgogyOj5HI5ioUS0ztmsHbtpSyYH9a/K5RDT1auDBt/+QS3fONWNjzyGMN5MK0ojpMgcG0s28b1AwzDpFIpkUhGKbqF6rP5oZPFCDDFzW8EiBocfqZqvTWqKnP182Ma9djfhmFgYGJhhTUaGTvQ/Oq1Pd/Hsqp0g8AH38W0LSzbIDBsisUQHEUMg3jcwvBK+H4R2yhTyg3zN+/9M/7gD26gIQWVskcsYqnso5YV1l/FtKrXh/7BIl+/6Vt88Sv/TSrdRKUsnyuBYRKN2KF3FBPfDSQnLT6yERnas6I8x0ZANUNvUAWi1d+SCbXqZFVgUOiU4qELRPEwNQugRSFfIpVO4LplKuUi0ViEwK/gVYpEIyZ9x4/wtx/+IH/4B79PU2M0zHFjhT+GJAyuenYD8fSq+TzxvA2zxQaETN5AOcRDQDr2b/1akYit3kunk7zuda9h4cL53HbbbTzyyCOkUikymQzFYlFtUELjK5VKVevmGOVMV5hOaN84BqOxDXns3/XAtv5aOk2tXuEyTBOCIrYVznrf9QChwkIq3cDoaI7bvn0rjzy6kSuuuILzzjuPlpYmPC/AMqDJhn//yB+xfE4LX/vvWxgpFommGhktFrCiCSw7yuBwjng8iW3bZIdHiMejJOMJBof6SSUcyuUivm9gRxxsy8T1xjLcOU60OsjVNqvHq8bNGuE8M8Q0ZGhW/CDAwMc2HUp5D9uIhR8BLEwsO8nXb7kT10/wh299DY0ZKJc94hED3y9imlVQ7QKBFVpCTENj3PsEvwKUKsrprl27lJKaTqe58sormT59+km/q1OKJOtfV1cX27dvV3TbX/7ylyxevLhGsYWx+SWAVIwcehZZqJ1jjuOwcuVKNm/eTHNzMyMjI+zYsYN58+aRTCZPOC90ipsoR1JvUlcuxgOXeqIWXerPMR38SAZYXZGXAuf1HjSxuMvzlstlZYQtlUo0NDSo5HySoEjaI8pjPB5n/vz57Nu3T9WM3LFjB4sXL67xOEvcqLRXjEli6BVAIO2wLIsLL7yQ7du3Kwv9M888w7pqfUkZKwH1krFSz/CbSCRULKK0RZQtYQ0IPVy8cbqHR5hScg0pbSNGaYmfk/GUMRBgKEBbRMZD9kdRXPUxEBqgGAIlJCgIwjILCxYsoLOzk3379hGLxdi3bx/PPfccq1atUiwtXXGU/jYMg7179zIwMKD0l2g0WkNH1gG7Tg2uF30P1sdOnqmeiVCfxEkH2uItXb9+vTImFQoFGhoauOyyy+js7FTzWhKimaapxl/i5mVc8/k8hhGWfzr99NNVDU/P83j88cdZsmSJUuzlbJJYPVGogyBgy5Ytqs16KZ76/UBPfFYsFhUo1J9TPJdWNYme1DmWur/y7yAIFOCWNTcyMqIYGJFIhGQyqea5GLFkLxFvWn9/v9r75HsyDrLecrlczfjrAErozjqDYyKR+SF03WKxSDQaVaUU9QzashbqmQNyjSAIFJjW35d5oo9FT0+P2h/12qbS9/IMlUqFBx98UK3jetCnZ8QV72w+nyedTqszWvpb/6zOtgGflGoAADz6SURBVABUCIIweo4cOcKyZcsAVG1UHQTKObBp0yZyuRzpdFqVWpE5pDNgxOgiQFb+ngy8t7S00N7ersByb28vmzdv5sILL6wxCOqxrLIPyz4yMjKiGEc6tVjPIK4bxuqNZNlsloaGBs4880z27NlTA95fTDkVfPeye0xfatED8n3fV5MwmUySSCaZNXcuhZJLLGKDofKXhDlZA8iVoL8vx2OPPc6GjQ+za+ce9h7Yz+DgINFYBtuJYBjRkDJomGNfNqDGCxeEYCSkv2rKfgBBNRlO6Pk0ajyABlUqGbpnMFDZP8XNGCDeRJkAwhH2Mc1qkWnPxQu86mJ2Kbtl4vEWDCwqxVFGh4eIRwIKuV4Wz+vkff/4fn73ynUEfui7C6yAUjlPLBLD88E0LVxcIjaUynDo8HG++tWbuenmW0hmmjCsapH1wKzrD03BF69TYBLgYaABy7qkQYERvm9WvcbivRI2phmAT62nuVQqYdsOTiRSPSDkAPDxvAqpVJqRkSGiUYd0Kkk2NwR+hXQ8gkGFr/3Xf3LBeefQ2hINsUDVs+m7FUzTIRDP9SnjgxfHIDR//nz+6q/+itNOO4077riDAwcOMGPGDDKZjEpdL7QqsRLqluxT2XymwmCQz030Wu17HkHgInh+7D3jhANl164d7Nmzm0ceeZirrrqKNWvWEI/FsS2wfHj3H17N3Nmd/Mu/f4Ftew8yrWMuRa/M6GiJxsYmisUyuVyJZDJJMV8gn+1lWksThWIWw7AwzNBA41XKYBhEnRh2xKla5cVYontLZYFa1bkrh3VtfwZBrSu/xnqLiWfE+dpN32fGzE6uuGwljUkLHwPP9XEMH8OOhlaQwFbNCAIIfL9qsHrpgWk8Hmfbtm08+uijSsFbvXo1HR0dk3rc5WDWvSBNTU0sXryYhx56iObmZnbu3MmePXtYtmyZUmwF/GSz2ZrrSf/pSpzu7QNYuHAhy5cvZ8uWLaRSKbZu3crChQs544wzaizKooQKKKxUKhw9epQ5c+bU0NpkDYniJEBqKjGUQskSr4ooG0EQJhMSZUviYsfzpgkAE/BmmiapVIpsNks2m1VsIRFpuxgDli5dypYtW+jp6SGfz7Njxw7OO+88pk2bhmXVlofRwZpcZ//+/TQ0NNDc3AyMlY+ZOXMmc+fO5YknnqC5uZnBwUHuu+8+Lr300rAUGnqN5rGYyUqlwsDAAN3d3SxatEjdSz5TLpdVQhBJBjI0NERbW5sC9eJ109sjirDumRN6nf5cOlA2jJDuLbFeeskEmW/ioRODpoDRbDarPB1ivGltbWXNmjUcPHiQYrFIqVTizjvvxPd9zjjjDGAM2EvbBgYG2Lp1K0888QR9fX3qeeo9NTD1PVikUCgA1IAj+S3jo4Nz/fqu69LT08Njjz3Gk08+qYBdOp1m9erVnHnmmRSLRbVOdFqnrPWRkRGamppUPXlJCASwZMkSHnvsMbq6upg2bRpPPfUU8Xic66+/Hghr8KbTaTUe8Xicnp4eHn74YR555JETaI7jiewRIyMjpFIpZfQAlHEoEomQz+fVPaSMoIBVPRZWnkHiqROJBENDQzQ0NDA0NMSBAweYNWtWzRwS2rOMx8aNG8lmswq0Sdkt6T/JZVIqlWpKysh4CRDUvZcTieyTOpVcjA36eD1fj7oYDSRxzuHDh7FtmwMHDjA8PEwqlVL9Jnul9E2xWOSuu+7iyJEjam+NxWJqP5J9T+5TqtYtj8fjlMtl8vk8o6OjKoGUDoRlvstcmz59uor/LpVKPPfcc5xxxhlkMhkVB6wnHnRdl1wux/33368MLtJHkm1eB+RC9/V9X+W7qE8GN55Mnz6dlStX0t3drQD5U089RWdnZ01YhMxBff6Wy2UOHDjAo48+ygUXXKBqoErfpdNpBVr1M08f71wup/pYAL7c87d1TF9C0S3hEtsgh3++UGLvwW5MO0JDqgHDDpOXDI9m2b5tJ4e7j7B7114OdnXz9JZn6B8coKmxlXg8TiTejO8bOJYDhoFlVP1+ftVzplseESDmjXkAZUPACsurVMushEAUTKwQfgV+SC0MBIIaQubFrybYCXRlOKhaVKuwLR6LKQpdPJkgGU+r+AzHgKCUxwtcIkZAJh1hdLiHi849h7/70F9zxumzCXyIOpDN5kmlEkQsm2wuSyKZolAsYRpRBodKuL7BF77wX3zzlm/RNmMmFRfyhSK2FSPQMqIawXgL1VfANQAI/Kq30a+6HU98P4T3Bl4Q+p/UxhpI5t5QYrE4gW/glj18v1KzOUZsC7dSIJmIkMtlccxKmOSot5tVp63m7z/yYVavWkoyDq4LvusSi9roNM2XWxzHobW1lTe96U2sWrWK2267jccee4zh4WESiURIi2WM9qJnCJSYu5NR4KaieJ/scxN5VCeiq9VTd0SREg/IQw89xKZNm7jwwgu5/FWXce7ZZxOJxwl8uOxVZ7Lm3Fv46k3f5aZbv0fJtUinmynnhrFMh2TUxvdcErEIQeAwNDRCNOpg2hEsDCq+R+AHuJ6P55XxS+Vaj5hmXAkUuSFAMvsaxomRz0GdoUR/PwigUC7jWCaf/NS/Y9nv47orz8DEpFSyiKTj4LmhwWtcveHFS44ykXieR7FYZMeOHTiOo8DUq1/96inVqpS9VqfBJpNJ1qxZwy9/+UuKxSLZbJYnnniC5cuXKwu4YRgqXlQHkyKyl8OY8ikKz8yZM7nwwgs5fPgwjuOwb98+br/9dgYGBjjrrLNU3I0+LseOHeOxxx5j165dXH/99SxYsEDFxtZ7zk5I4nUSkWcW0JfL5ZSXVK5RLpcVNbGxsVGBzHp6m4ACXbncunUrLS0tLFu2TPXR8PAwjY2NimLb0dHBkiVL6O3tpbm5mWw2yze/+U0uu+wyli1bRiqVUqBQ+iSbzdLb28vDDz9MV1cXl19+Oc3NzaqGpW3bxGIx1q5dy4EDB8jn8wRBwIYNGyiXy5xxxhksWrSopu8EqNx3330899xzrFmzhjlz5ijvqM52am5uZvv27cRiMYaHh3n22Wc57bTTaGhoIAgChoaGiMfjai8zTVPNTb3ciIyZKPviFRXPQTweV3FX8nnxasp80jOnirfaNE3S6TSpVKrGc26aJqtXr6a7u5t77rmH6dOn09PTw49+9CP27t3L8uXLyWQySgnetWsXfX19bN26Fc/zSKfTivY+HjA9VYnH46p/PC+s61upVBQFVWcAyH5bKpU4dOgQBw4cYNeuXfT09JBIJJSh6MILL+Saa64hmUyecD9ZV+LxTaVSCsgJQJN7dnR0sG7dOm666SZlYPnlL39JLpdj0aJFrFixgt7eXjKZDEeOHGHHjh3s3r2b/fv3U6lUSKVSai1OGC6inSFBEJDP59V4iVEqFosRiURoaGioAUV33nknV111FXoG2u7ubpqamtTanz59upon27ZtIxaLcfXVVzNt2jRVqknW1XPPPcd9993H7t27mTZtGl1dXarfxaAiNPimpiZ836ehoUHtAzKPdfA2mQhrSvduiojR4oWIGL1jsRhr1qyhu7ubSCRCNpvl+9//PjfccIPam8UQKPN+27ZtPP300wrklctltT/atk0qlarxGBqGUbO2GxoaeOKJJ2hsbGTOnDlqT5VYZdM0FTNj6dKlbNq0iSNHjhCLxdizZw8//OEPueKKK2hra1NecQlTefzxx1m/fj3Dw8M0NzeTy+UUKJYxlXrF0WhU5YaQNTVVUDc4OMh5553HwYMH2bJlC7FYjL179/J///d/XHrppcyfP1/1j+4B7u/v58iRI9xyyy0UCgVaWlpYsGCBum46nWb9+vU88MADrFmzhrPOOou2tjaAGiOdZNo+fPgwe/bsUYB/9uzZdHR0vOD58XzFnsxS8nJTfV+oCEVClBsZkGKxSE9PP3/1l++lp28QzwtwohEiToJSuUJ//yBlz6dU9EgkU5imTTrTho/NcLZCEISWcPxqXBkBgR/gazRFFRYWAFUvZ1AFVEJJFf9pAJhC4aJquQzUV8EIPYIB2ut4+IGhPLC6tVIAcblQJhKJYRshUM2O5FTQejwexavkSccsRkeGGMkVefc73saf/PHbSMctLJMq1RRi0SiVsosTsUklU1R8iMXCA/vwkTwf+OCHeGjDw7S2dzA8ksdyIkSjcVxvsvkloFqyP/onvK7/NlRcn48XmFXqbi29VBfPDQiCMZqJbZh4hofpV8u2GKEnrLUxSf9AH/nRCm9/21v5//7sj5k9KxOOhQ/4PrZtVqmwU6+D9VKLUMtc12XZsmX84z/+Iw8//DD/+7//y86dO2ss2iLiUain7ojo/9bn1MlkovfHA6AT/T3e54X+BuEh29LSQrFYZMOGDTz88MO86tK1XHnllaw+Y03oxTcCPvjeN3HRRRfxla/dzPoNm7DsGIYVoxKEpVwMO1pN1mOHVHRP2mBi2w7xaKgol90KvkKEfvVvQ4stDTAlOdlJ+qXey6H/HYnHMA2f0ZE8n/7Ml2lt/ijnnTWHWCpJAHh+BMusztOg6pc1wzJSp+o9eT4i9K/77rtPWfmXLFnC9OnTp3T/eiOHzMPFixezaNEiDh8+TCaT4emnn6avr49p06apBEUDAwPk83kFjus9PbpSrZcNs22bVatWMTw8zPe//31aWlqoVCr85Cc/4eGHH6a9vZ1oNEo6nSaXy9HX18fRo0fJ5XKYpsk999zDu9/9bqXU6WEh4rET5WMyBTGVStXUApSkKFIHNJVKEY1GSSQSitJbLBaVgi8KOITK98KFC5k3bx579uwhHo9z6NAhfv7zn7N161YARkdHKRQKXHrppaxevVplx73yyispFAo89NBDRKNRRkdHuffee3n00UdV4hZ5zmKxyJEjR+jq6iKbzdLX10dbWxsrV64kEokoBRBg+fLlXHzxxdx9993Ka7h+/Xq2bt3K3LlzWbx4sSoSn81mOXbsGN3d3VQqFZ599llWrlxJe3t7jZc2FosxZ84cHn/8cYIgYGBggHvuuYennnqKWCymEmml02ne9KY3qfYI4JO5JjHOAlbFQyT7odACs9kslUpF3Vs82zJuOmAQgKBTYQV4ifElGo1y6aWXMjw8zMMPP0w6naZUKrFp0yYee+wxBRTkPuVymWKxyGmnnYbv+xw/fhzP8xQ9bzK67skkm80qqrMwAr7zne8oJVovFyIeXn1dO45DLBZjaGiI9vZ2rr/+elatWlUz76V/ZL0LWBkZCSsPCJVT99AVCgVisRhLlizhkksu4amnnlLGC6ENi5cLQkVcGG+GEdZolMzA+nhK3+hUXQHEwpQTkCTUVBm7zs5O9RyxWIzHH3+cAwcOqDqtw8PDFAoFfu/3fo+ZM8MQL2mjMCN2797NzTffTGdnJytWrFDA84knnqCrq4vjx48zZ84cCoWCAp86+wNqqZmy/4mXXeRUzmUd2Mr4Snvr59ep6jU6a+Xss89my5YtHDx4kGQyyZEjR/jv//5vFi5cqPbgQqFAb28vhw8fZmhoiGg0SkdHB11dXWp+iKdRDymQ9kqNzWPHjmFZFs8++yz5fF4ZrHzfp6+vj2uvvZZFixapCh3t7e0sWbKEw4cPq714165dHDx4kHnz5qnkqcLQ6OvrI5vNMnv2bLLZrGKz5PN5BXZlDcleUS6XSafTNayKyc6HpqYmCoUCF198Mfl8nueee45UKsW+ffs4fPgwS5YsobGxkXQ6rYyYg4OD7N+/nwMHDoQlA/N5tm/fznnnnUdzczOlUomBgQHWr19Pf38/GzduVNnvOzs7VcLXQqGAaZocPXqUw4cPs3//fmzbpqWlhaVLlyqnxsshv/EeUxiLD9IPk1gsRnt7O//93zfzj//8L2x4+BFy+TKjIz0hqIqnwasQjdm4voXvmRimjWXFsG0rpHMGYAQlTHwFNg0k9tOvUnurC10HTgJex6qUEnJEx9p8wlnkjwMWjOpGIs7CIIxtlb8hBFHxSBwDKBSLOKZNQ2Ma3/fJ54awKVCslFgyfw5/+ed/whWXnY0JxB0oFcHAJxIxcWyJBg2ho+eGoW+PP7Wbf/rnT/L4408SjafJZUtYZgQCm8CvJl4KjBOy6AoNt6YuJCc+I9Qrv9p1gqBK8dVKLPjqfwDEnEjVWl7B9w1cjJDO7AUYpk8hN8z06dMYHuxj7swZvO/9f82Vr7sUxwHLGBsLOxJ6YgVomHYVoLzM+FQ2b1HODMPgVa96FStXruQXv/gF3/nOd2rih2RTFgqRUIwmAov1StHJQOx4r08GSMc7YPW/R0ZGaGhoUHE30ubQe5fj7rvv4pe/fJgLLryE1135uyw7bQUA5501k8WL/oH77n+Mr3/jWzy35yBNTdPIF8p4fkDESTA0PEwq3QSBScWX2Cs3ZCxYFo4dKpx+NTNX9YnU+q3+qwpOw5cn7q8x49HYSwa5coWIY2NHUwxnXT78kU/xL//8EdZeMJORLKSSgGGqthmmiVktIeX5Y3P0pRLTNNm0aRPZbFbNsXPPPfcEetZEosfnyfwTT8AFF1zArbfeSjqdZnBwkA0bNnDttdcq6qXjOGQyGQUERcmT2CQ5OAUQyT0ka+yFF16IYRjceeedHD16lMbGRo4fP87hw4dV3I1O021oaKCpqYlKpUJ/f7+yMAOKUuy6Lvl8vsYzdzKxLEvF5Mn8FfAkgLNUKqkEUJFIhJaWFnVtMcoI7bChoYFXvepVysrt+z67d+/myJEjam9KJpPKGxKJRFQilje84Q20trZy1113MTQ0RFdXl1Kq5dlEqZezMpFIMG/ePBKJhAJqej9Ho1GuuuoqYrEYDzzwAPv27aOxsZGRkRE2b97MPffcQ3t7u7LEt7W1KcV45syZNdQ0XRYvXszZZ5/N+vXr8X2f4eFhlU1fPKydnZ1q3MUzWCgUlNIoRjmZh/IzOjpa4yHUaY0CAPQ9Vc9KKp4/oU+Pjo6q9gsAq1QqNDY28vrXvx7TNHnqqafo7e2tiT9MJBKq9m9jYyOnn346Z599Nk888QSHDh1SgGWy/XcyEfqq1EZMJBIqxEPGWOaYeOIEFIhRYPbs2bz2ta9lzZo1zJgxQ61FMXDqsckC8mSuDgwMKKeAeLB02q/0Uzwe55lnniGbzZLJZHAch/7+flU5Qe41Y8YMLr30UmbNmsV3v/tdlX1bN77qwFrYEZFIJKwnrWVj1SmlyWSS5cuXs2fPHn75y18yPDxMPp8Pk2MahqLNt7W18brXvU6BhHPPPZdDhw7x1FNPkc1msW2b3t5ennvuOTZv3szg4CCZTIZ8Pk8sFqOxsZGrr76aTZs2cc8995BOpwFq4kqFFSGxjWJ0q8+8OpX9RwwnQoPV80vo5RIn+u5U51uxWKShoYHrrruOO+64g0OHDgEhE2Xv3r01tU+l/5uamrj++uuJRCL87//+b41+LgY1qI3nX7hwIWeffTYbN26kq6sL27bDjPzafqxnRIYxuvEFF1xAb28vzz77rKJrRyIRjh8/rowUsj80NjayYsUK3va2t/GDH/yAQ4cOqT0hk8movpEzKJFIqPAA6ddoNDoplVcMBatXryYej/Pzn/+c/fv3q7m0fv16ZRTTz0AIz+a+vj46Ozs566yzauZIV1eX2s+y2SxHjx5l9+7dNTHLtm0r44Ds79OnT2f58uVccsklKtv2yyG/8cB0PAVYFKRk0mL+/DZuvvnz3P79e/jM5z6HW+khkUozPFrAsiJYZhTfMAgIs316XoDrV/B98H2XVNRSwFDn65umiYGBW6Wu1t8fCLPOmiFBVxDORJawGmgWKBW57h0INKqsEUAyEaWQG1WWXBOP0cG+6mHhMX92K9de+xr+4C1vIpMCqtRdA7CtsRImQyN54rEEvgG2E9729h/cyb99+j/pPt6HE0nhRGIEgYHjRKl4YQyVZTvVlmoxeoavlPP6ba/++es3xxMOaoMx+m4VKKqPGD6lcgHPc7EME8eRVOhgYeBELBrTNqZR4e1vexPveMcfMXdus+RyIvDBdQNMy8AMfAI8LEOSBIhF7+VdQvrmLQo5hIm+3vKWt3D55Zfz4IMPcvfdd/PMM89gmmFBdNmgToWWeCqW+8mouvrmejLw2tbWxujoKNlslkgkokoxQKiMuhWDQqHAD++4nR//+MdcvHYdb7zhLaw+83TaGuCG687l8nXn8p3v/4xbbvsufaP9GFaUcjGso1ss5TANG9uJYNpWNZ6sjGFYWI54lEEHpoFhKEp6teTwhDJR/8i8dgMf33WJmDblsoc/XObjn/wC5t+9n4svnK5KLJlm1QATpokiQPrtpUWmhw8f5sYbb2RgYADHcZgxYwZz5swBwgQ2emzjyUTf9wTQrFq1iiAI2LFjB57n8d3vfpezzz6bjo4OlVjk8ccfp7GxkYaGBqWoS/yQKMe6UiLAF0Ka0hVXXMHixYvZtGkTjz76KH19fcqqXS6XSSbDpFjpdJqOjg7WrFnDxRdfXBPDNTo6yr59+zh27Bi+76syKY2NjZMmt9i5cyfd3d2qZI0e0yfPMzg4qBTfZDJJNptVfSvXl9+e5ymP1ZNPPsmhQ4dUHTrXdWlsbGTJkiUKVMszCgBZu3YtnZ2d3HvvvRw4cIBcLqeUQd1DJ2tt5cqVrFq1io6OjhogHY1GFb2xXC5z6aWXsmLFCtavX8/27dvZu3cvTU1NzJo1S2Vgb2xsxHVd5s6dy3nnnce555477vwAmDZtGuvWrcPzPI4cOcKhQ4dqYvJEQYxEIqpdw8PDdHd3c/ToUaLRKM3NzWqchE4oHtJCocDAwACpVIq+vj5gjJYoAFRAgOxRUnpIPA2lUonp06eTy+VUHJfMR6Ea/uEf/iFnnXUWzz77LEePHqWvr09Rgdvb25k5cyadnZ0sW7aM1tZWNm3aVOO5hrEYyuejJEq226NHjyr6u4AzobOKl1NP+DN79mzmzp3L6tWrVX3EcrmslFrZv3QGmtAZAY4cOcKePXtwHId0Oq0MJboXRtgIsVhM5Q3YunUrx44do7+/X8VWBkHA4sWLWbNmDW1tbUyfPr2mNKBO9ZS5JPtuV1cX3d3digKrxyEL9VsoyYlEgte85jU0NjaqmGyhZDqOw5w5c5g9e3YNxdR1XV7/+tezcOFCNm3aVJP0Z2RkRIUENDQ0sHLlSi688EJ832fv3r0qg6sYBvT+Gx0dJZ/P8+STT9LY2EhHRwejo6OqZuxUEh/BWEZ1YUkMDw/T09OD67o0NTXVeJafj4jXUNq9YMECbrjhBu677z66urqUEUTGUZgAK1eu5JxzzmHRokVs3LiRBx54AMuyaGlpUQxHET0UIJPJsHbtWjKZDNu2baOnp4eBgQG1V6dSKebNm6euUy6XVcKs1tZWrrnmGtrb29mxYwcDAwNqvgvgSyQSLFy4kAsvvJBzzz0X3/fDJKl796q9RmKiZf8rFApq3xHP6lRp0mLEkX3xXe96Fxs2bGDTpk309vYqo4y+RiV3QCqV4swzz2TdunV0dnYqEJrJZDj77LNZuHAhjz/+OM899xzPPfecyqYNY2tm/vz5KhZ4+fLlrFmzhhUrVtQYU14OMXzfP+ns/lVSFl8KWppsHmL11KVcCbBsg0IRYjHYvPUg//mFL7P+wQ3kCxUMK4JpRylVPPzAxLSiGIaFaYe1Cv1KGctwsU2fwDyxDqphGAT+mHdTf8ax32HylKn2RQ3twqjGmRpjyYRCD6pPWFsxXNTlUqFKXYyQz4UbxZIlSzjnrFX8yTveyKKFTVp5DMjlSsSjUWw7vEc2WyKRiipoefx4gS9/5Ua+9OWvYkaSmHYU27CJxGLkciEdoqGhsSaGxVTtAj0plG+MT4Os76dx3w9MAhzCREhjNGAMX90vZEB6hPg6qNKXSkQch2QyymXrLuZP3vNOVq2ah67nl0phBmJhwBo17R5LpBWPnxhnM9F4vVQiiVUgpGfIBqsre0NDQzzwwAOsX7+ew4cPk81mVVbME+fkiW2eiIo6GQ1oqh5T/TX9c+Kl0ZVEoBqXVyAgPOi8ilulQHpEnBgXXHARN7zxTZy+6nSwQyL4SB4efXwPd/38Hh5/YgvHewew7ATFYgkvMIjFEli2jeeFmY8t28Z1wxjvcK1V22lQjfQGww/U2jsZcNcPf7U3GGBEwrghM7AJyj5JJwpeieZ0hK9+5d+ZPzdOPA623DNwqx5TE79KXX6p5ejRo8yYMYPBwUFM06SxsVHFZp3K+aArc0JnFaXfsiyOHTumsvyK9VmAZi6XU8l39MypuudA9/YJDbZQKCjL7/Hjx3Fdl76+PkVbEmvx3LlzFaXUNE2l0AlNMZvNKoNIqVRSwG88YFo/p7u7u+no6CCXy5FIJFTbotGoimeU74yOjqp4Pp3pIM8tiYEgBGK9vb3qmSVmsrm5uUZRHx0dVZ4Z6S+pzX306FEGBwfp7+9XmX0bGhpoa2ujpaWF5uZmZQjQEwDJ+Ak4EeAk+0pXVxdHjhxh//79NDY2qhjOWbNmsXDhQjVmOggUxVX3ZgEcPHiQ3bt3K+97JpNhxowZdHZ2qqQlEh8miWhkzkgSpnoP0/DwsKKJyt45MjKi4g1lDkr7JKYXUEBUz6Aq4EaPlRXaqQAoAVOlUol8Pq/iPeV+/f393HjjjfT29uL7PitXruRtb3ub2v9EeR7PM1i/zkQk9lY8OCMjI0qJF2+cPo569k8ZV6k/bNu2AnNCW9bno6wN8YjK2SJsi3g8XpNZW7w7spfofTQ0NKQ+J95Q6VfHcTh48CA33nijykp98cUXc91116lYWpn/ruvSXS3ZVyqVaG5uVteRdSOJXiSDPaCopoODg8qTPG3aNJLJJOl0uiYBjXhjK5WKAn6FQkEp/K2trSxevFitI8mOLWtSX5/6/JL+kXAWPUnNePrseCLrUozW0r8y7rFYrGaPqXcCTLa/y14mRiMxhHmeR39/P/v372dkZETdS/qjs7NTMVYsy1J90NfXR3Nz8wkASp5bjzEdHBxkYGAAQIHSeDyuYkH1GNBcLqeSWUHoyR0YGFB1hmVPa2lpYfbs2WGSxOq8lCRn6XTINJTYZukfab/EthaLRZqbm2sYDxMxH2Q96PuLhHHs27eP7u5uVeNX5n46naazs5OOjg4FkPU5JGMs67pUKimjWm9vL319fYpNkk6nicVizJs3j/b2duVdl3nxYnpMT0UX/n8CmNZvVDCWTl8ez/XDcjAB8PAjO/nCF7/Io489SanoERg2TiQBlkW55IJpEXGqmfMqBUyLGkVA7ivgSQVqMp5Sb45loh2n7Sd7PTBqqbCGX4WOhg++B4ZkGfXxyqFVa+GC+Vx22WW8+tWXs/K0VmxCz6BlgO8HWJaBaVL1CIdUYCdqEgC5Atx738P8x2c+zzPPbMO0Y5hWDKr1X13XV+UQVPF215PGEWYn9quKfRhjG/gmgWmM1ZHUfuuvWxgnvO9jYhi21i/VDL3avfzAwy0Vcb0yUcemrb2V01esZO3aSzh7zRmsOm2mSjrlVx271aocYVShYeB5FSxjjO4mdFgI++hk8lIDU5nTQk2E2rhG2Zj0bGtHjx7lBz/4Affff7+ieOk/9dZn/TkmA7GnCk7HOxD1v3XPhVDx5LlCRbZKn6ta8xPRkLodJvwKsJw4V19zHW98y9uYM78Tt7rGcwV44sm9fP97/8O+/Yc4fPgwrg+RSAw/MPA8CAwLy3JCf79havGmoNWNUVmh9TGpf5Z6UArh/PZMl4rrE4+kcQseDhZeuUDEqDC7s5Fbvvl5GhogEavS3/0Kpmlr2atf+v3ZMAx12IknJx6PKw/fZN8VBV73cAI13giJ25HYM7mH3FfPRikgRgdsMmf1bLoiotDolDBZC7rnXmLRBADpn5X7yj3198Z7ZpF68CD7IlCjeEq5Df23eCZFwRF623iAQO231fuJUiV9r3uY5LryHQFe9YBQXhNFWT9HxVMqIESyngpdMxaLqTHQ760/v9xX5oDez0K/q08AJZ8XMCGeBJkH42WYFcCrJ1kabxzGm1M6zVnGSujHpVIJz/NUvXTxNOvPK8+pK9h6wh69pM2BAwf43ve+x8DAANlslnXr1nHDDTe8IGCqf16fF/Vjofevvifr3lr9b/FAiujX1T2WOtVXRE+QJO3TE6kJmI7H42q89HEvlUps3ryZO++8U1F5L7nkEq699lp1LQFu9XOiUCjU6Cgy7vXloaTdcn/Zn6T9AsxlX5G+0fc0fe6KV1Rfo/K+XFv/fP1nZL3JfqAbrk4m+r6lG1pkD643fp0qMJW9Uh9/GMtELGOgG55kzsm+on9XvKV6P+mAVOZO/R6vJ5rSPaX6nHMcp8agKnNPN7bIGpM5q4M8mVMCJmVcBejr+9qYfljLmBSpP3fEaysGS/1+krhN5m19G+XZdCNn/R4k7dLbInui/Ft/BnnGF1N/fVGB6XjyqwSrujyfTprMo2MYBuVSGEcJUCyBE4XRHDz8yCa++Y3b2LlrL13dR/ECk0gkhmmHGfsCPwRLSlE2xurBea6vNqmQRuTgBWMTSiad73HCxiATT6zgEyn7sikEQYBpgWWYeF6FcqWA55YJApeoYxGNmKxYtpTXX38dr3nNFTQ1hoq3QcjlNgkrUviS7hdwvRCcGWbobXrwoc385xe/zAP3PwRWhGQiTb5YwqoCdIuwLmi9ZwhfKBk+GIHKMmzi42NiGk4YoRtUS71ov5Un2DTUv00M9W/MMYtO2B8uge8RBB4YPhYBjmOxZPEimpsbWbhgHr/7u1ez5oxlmFV7gSlOVlBVfgLxtBonQ52nnhF1MiXipTLMCKCTOSfgolQqsX//fnbs2MFjjz3Gc889p8ofiCKkb+JAzWFQr3TUr7XxFCd5Xf85meiUnvrvA/hhoDWB5xMEXjXe2yeorjXDMOkdHKLiwsy581jzO+dz9nkXcvrpq5jR0YJRTfz8+OP7+N8f/4StT2/jWG9fGCttR6tWigimaRFQpRQRYFkORvUQHK/P5beu6OiKnlG1ovi2T+BD4DuY2NiBg+G5+JUsXmWI05bN5Ktf/TSd7Uny+REaEomwJq8bTAiMfitTl1Ppv5fayPSrkhe65zzfOfeb0n+6iDIpsXOSYEa8j7IH1AMEGDv3RUH8wQ9+wMMPP6zAwrXXXsu6dete5id84aLrNuMxSESEVilnjNCD6wFfX18f9957Lxs2bFAGsne84x2cc845iuYooOOFzrmpeAx/KxNLff/VO2Ym88j9v96/v4r5N9E9JjJ8PV/5LTCd4DvjA9MAz3WxrAgEAfliiXgiBgH8/+2dyY8cR3bGv4jIylp649bUxqFIDUkPdRhrZFEYeYGgMSRBBwGGIAG+2Qf/Cb4a9sUGdBv4JMD2xRDGgC+SYd9kQJAMYQbSSJQoUx7QYxIUhqSaBHua3eyuJTMjfIiMrKjs6uqlqroyq74fQDS7uqoyMmP94r14b/VBG7V6FVe++l/84tNf4quvruDqN7/CnTsraEcdJEZYV1KXJ9SZ3aSAEgFk0HVDEZCIdQJokwmuxGgEMhWsiYaGgRISMlAIpIJQQKcV2bUxFCANJOzrgbTitpmG6Y/jCFHURiCBo8cWceqJR7C8fBSnTz2Bl37yR3j+0rOYq0skCaACoJI+FgEAqbUYADZbbUgZoBoqRAnwyc9/iZ/9y7/i3/79P7Cx3kRjfglJYhDFGtVqPduFE5BWyEJCSCdU3cK862LrLKZIk94YXXGl6Ft3/m6zq0sntIzRMNIeWq9XK+mBbonFxXk89ugjOHHiGH7y0ot47rlncep7ywiEFeACQLutUa9KmMS/erecWZvx8qz2crBUHYMsjOMUpm6Q8a2PbkHUarVw79493LhxAzdv3sStW7dw69Yt3L17F2tra2i325mLVr1ezxYL/s6gW3z5myr+PW33FOhlJ8HaT9y5/9v8velmiDEwOgZ0x27KxDEMErSjCEJJGBFgq93B2sNNJELi0UefwONPfA/nzpzDSy/9MX707O9hfn4Rza0IX135Gv/5wcf4+pv/wa3b99COEnTaCRKTBkKRAYwRiNOIn67f5zdSIEWa3sls21hRQgLSoGPa9sSoqULKChRCSJ3AxE0kyUN0mvfx4ovP4q//6i9x8dxZiDTlVBxFqFSqFKZDQmFKYToM7p6c1cO5z7333nt4+PAh3nrrrcy9ENhuoXKf/eKLL/D+++9nZ5Efe+wxvPnmm9l57rKyk9XNvba6uorLly/jySefxIULFwAgi1K8uLi4zVq0traGjz76CJ999hkePHiAdruNCxcu4M0338SZM2ey7/c9bYaBwnQ4BgnTfn/PM+vPl8J0H5RNmO5UXntOzMAkEUR6oDJJNAQUpFtwp6Y0LYBWE/j19Zv4+spVfPPNN7h56zv8969+jd+u2XDSsdYIg8AGR9H2M86HXrl8p1JCBUGap9QgDCo2O2e6sIU20DDQcQKNBBUVZv6rnbiNuJMgMTFUGlVr+dhxLMw10Jiro1qt4NGTJ/DMMz/EH/7Bj/E7PziFJAbmGlZGxdpalQLlXFc1AhHCaIFOEiOsBE5X487Kffz0p3+Pf373Z+hENlVGoGrQsC67gO9KoSGEsufghD2XKZ0w1dat1j5Lk7NESugkdWfOWVr9unbnXVyQk27OPYNjx5fwxBOP4fz58zh9+jROLh/HiRPH8MijJ3H06CIUAJeGrtOxQkohDfojNCoq9Lwy88LUE6jbhGh5hKkTjb4wdfguks59pNPp4Ntvv8X169dx7do1bGxsYHV1FQ8ePMDm5ia2traypPTOFSTv/uXqyEV/9D0B+t1/P/HZ7xm5e7L3IRHFxvZXYaxPuu5Yy6nQth1KiU4cIdIJIBQSbdCM7BlFIxXipnU5Wlg4ih+/8Pv48z/7Czzz7EVsbQH/d/02/uvjX2B9YxPr65todWIrSOMYmw+b2Gxu4dZ336W5dU3X4u79lEJkv0MImxIqHQcgAa0Sm2JK27RHUgcwOkYSd6DjJnS0jpWVG/i7v/0b/Olbf2KDNs0vQLvzK2Jw8B0yGApTCtNhcJt7vlv03bt38fbbb0NrjXPnzuHUqVM4c+YMlpeXsbS0lEXwbDabuH37Nq5evYovv/wyCxTTaDTw6quv4pVXXin9xlPmTeZ5i/ibmDdu3MA777yDxcVFPPfcc3jqqadw9uzZzAXXuSNubGzgxo0b+Pzzz3H58mVsbGxkgWHeeOMNPP/88z3pAJ277bALewqn4dhtrOHzHQyF6T4okzDtR2aNgYYQGtBpImtVAYyA1gniWEOKAEKlkfqkytxdEwNErQRrD5v4+aeX8e3t7/Cb39zODsvfuXMHKyv3srx/UikIobKk2nZh7c5lpmdZUsuKSTSM0JnlVMcJqvUa5htzmF+cw+L8EuYX57C0uIharYYfnD+Hc099H+cvfB9Hjy4grABBAITpsQolgSg22Npax1y9irASwEAjitsIgxo6kUFYSc/aAGi1Y9SqAVbu3sc//OM/Yf3hFuIYiBMNKQMElSqCIEQlsHnBqmEFQHcXWLqfae5Qt2C3D1yj13FDwhgBhW4KgrwodVY5d3B+aWkJS0tLaaS5CsKqRK1mA5jU6wphLoK6MTathtBWiBqTBnkQqTjXMhWmO4tSYHTCNHsUnpDLvzZK8m5UeXfS/NkM3zLtW0RdDkIX1MTtVq+urmZnjjY3N7M8in5yeHe2xLem9rOg+sLZlc9PVO0HwbDCN0AltLnYZCoFpTCohRK1WohqLUSS2M+rSporslGHVAGg0u8SQL3WQBCEOHbsBJ6++EOcPnMWQQB0ImTtqdVJyyCAOLZnVLe2EtxfXUOCXnG9W310/9m0Q7GJIbTdoDEmdb2OI5ikjThq4bs7N3H+3Gn86Hcvpj3F2+wx9nPkYFCYUpgOgxNabi4HgA8//BDvvvtult+w0Whgfn4eCwsLOHLkCObn57O0Q2tra1kU5kajkQm01157LctdWGZ8jx1/bnFrIee+HIYhwjBEq9XC448/jhMnTmQBplzAspWVlcxzx80BzzzzDF5//XUcPXo0c/31z6NS+EyWvOfUTn/fCdbP+KEwHZLR7w7o1IXVII4iaG0QpuY1nSSQyq5K41h7g10AFdhlcBQDIrCL1nbbhpO/ffs7XL9+HSsrK2h12vjt6gMAQLsdpcJ1Dc1m0/OtT4VC5tqr0Jifw4ljx7F4ZAHzc3Oo1mo4srSE48vHcPLEIzh6/AiWFmwIcOgYCwtzqNVgA7ZoK0ydiG4322g0qhDCWYg1tNHQOkGgKgBs5FGlJCCAKEogKyrNexohihMAEmElRKWSfqcNdoZqFeikR+xcABiR3k8+IAxgLcgGvQGbVHrGz8f/PQi6gZjcI5PS3p9U3XQdcewf9HdCLA0SYGKEgRXQbqJzVsIwdAFE+gtS5Fx5RebSmwYpGHgOdfeBufe+xzMI9xOn7vV8YBEXfMDluXK51fyD/W4B5gIH+IssZ1l1uf5cigG/LJl7u+ei7f/ff82P3uk+51I/SClRqzVygtagWglRb1TtxkXqAuYHI9DGBikJqwGsmFUwRiBJ7KaFK20cAVEEQHptTqabHYnd8AhSa7wx/eMQuSr1/+ZXc3ZEVdrXhehaWwEgiWz6pqgD1EL7t4cbD9CohjaumgpBYXpwKEwpTIfBbZ75wXA+/fRTXLlyBdeuXUOn00Gz2czmfP+cv9Y6c1kNwxDLy8t44YUXcOnSJRw/fnygt1dZ2E2YfvDBB1lKJXc21M0ZLieti0rrgk4JIbLoqS+//HLm7uw2Uv1gZ3spHzl89tquWT/jh8J0SIZ9SNvLrdNIhzYEUD4oQd49EQCSpHtWL04MjBFp0KPutyYJEEUGUgpsbrUhhHWPXF/fyBbtQBrJ1wBSip7dvUajgaPHltKw5ApC9C6MffxfnZFKqfQMq9ZZHtIksiH1K6HKriVlGuksTrpn35R1PWy1OqjVQpuSQtrv3tqy0cvqNWuO3dpKENQU3HlR6QLOeGUSRmaLbJtyQ2SpcwBAWT/InmBH/k9rQe4NeuSnx+l0OqiECmEl6PGjNIkNoqSUSCfB7sSW1b7OP8E+4nREwjT7ugFteByDcD6aaL5MQohs0eRSWeQ/69yu/Eh4+Qir9pyzbWMuGboQ3YiZfh/KC+J+Ltz+AiYfMMP/Z0xvxEutbftQXhoiHSeZp0IQBBBSwqTlj5JO5h7u3HSlDGy/Sduaj78BopSN5m3vr/vTr8Z+VdrTJJL0PQLQIsl2eGwaKRscLVA2XUxvjt7UkmxkH2v+7DBuV739fFdZmCVhOu72YYzJ8m268dHlWr169So++eQTtNvtLNhcq9VCp9OBUgrVahUnT55EHMc4e/YsLl68iLNnz2ZpXHYKfFgmdnPlrVQquH//Pj7++OMsjdmDBw+yXKPr6+tZGiSXsqbRaODpp5/GpUuXsLS0BKB7xtf/vztGNWz5yWgZZZtm/QwPhemQHPQhDSpvlMSpa2cqNGAyi5C/2xeGAQQEotiematUKhDGLiCTKM52+YIgDekMA50AYaiyxWSSpNFuUwuMEECnnZ57VO49tqxSCrvwTXrDTWsd97hE2vQuskc0GCNsMKXMwpjm+UzXryZdXKtQor3VQnXORtbVqaCAtFFH3bPrScFggE7bhuyuhAEM7FlYpM7I+bSKIl04G2HdYZ3VFLA6UuoESBNx9Dujp6QVtpnLFABtDIwL6AOVCS9jDKCtu7BKBVFza8tazZwgdW6lzrIrA6+0eof/+4LUUQ5hmhd1/f6ed512Cyc/nYKf5Nl/bxb8Kmf1zF8/H7gof7Y0/36Hf73taBjEEMJYIQeBRKdiUWsYLaBUBRUlsw0dk2ZTyjI0iTRNEHo3fZLE5HIf2vPZBvZ+lZIQENCeKOwR3zsE9PIRkN1mJjWACAni9GoSgI3U+/BhgoWGQtyxrsRBCOjOpg2GFtQpTAdAYbodCtMuo2gffuoIl4/QHZOw+ZbbWFtbw/3797G+vp69x71vbm4O58+fR71e35bTc1IJ7kfFTlZf95pzdU6SBJubm4iiCBsbG7h37x7u3LmDubm5LAVGvV7H8vIyjhw5gnq9ns1PzvrqhKnvEbVbAKTd6n9a+nxRGLV2YP0MD4XpkIxyEnWvS6XQjhNIA6iKsulKtE2/4haXURxBCINABdAu5YtUVuTEMYKKshY1ASBxeTpdEmdnybG7hEiDAyWJFcC1am/+LHde092vQZIFYgKQCjLnZuyZazyfwSQx9nyslNCJgVQC0EAnShAqZXPEaKSHLAEooNNsIqzXAaHRbrVQrdUQRxGCSiUTrEoppH6ydjWvJAx602UIqyJzKtMGqkH6qy/lpElSF2P0Ny91K6zn7Ej3vc630qWhUfaSxiAxpkeQ+rmhEncGdtuivr9L76iEqb3N/vc5jkHW37H2d61d2bobHnYH289r5XJZ9YuI3Gu13C4u8y7D7qd/bQC7Lhz8XG35zwIaQqaC0Qjb14SCgdpWq8a5nEvYRmhsyhUZCuuubiQqobVQQvSKVJ31OWRy0yDJrKvwRGi+rH4es3z9CgMb9MgAkBGMiKHhknJXIBAgSRSkEJDIAn6n/SqyTZAW04F/pzDdDoVpl2Hbh5RyW85YXyg5912gO56631utFpRSmdupm2Pb7TaMMVmqrrKTP0riXvPnGWchdVZUN2663J35enIeMNYYYOd4t0nqruXykO6lbAf9OxlMfn1AYVo8KEyHZK83tt/y5V1I9399bS2D3vcM+Jb81fdVVnc9uyrdSRRtX6jacok+LrNmj+Xu932uLH3+Dl+b9pbHv05P4KED4Vxsu/flp+coExxkD0K+7chcP97+TP0+bttIP1v9Xq41PNmGh9C9mxw9LuPeRg9sn3Uu5tMuSnfbWBx3nxk0ObO/Tp5Jt4/d2O2cY78jDbPEXlylBzHuZ3YY48thXasoTLsrb5k2O4cdP8dVfgrTMVyfTJay7jKzfRGynUn2ZwrT4lPk8X4/wmoW21OR6w6gMB0HFKZdilD+YepjXOUfdICLEEIImSjbXbgJ6VLk9rHbUYUilpl0mbTFlgyG9TM8RRw/KUwJIYQUnp0CqRACsH2UkVGeASeEHJx+4+ekhD2FKSGEkFJA8UEGUbT2UaSyEELIIIoyflKYTjnjdnWgKwUhk2PYSaTo/XO3XdwiTKJkcrB9kEnC9lVsuD4dTJGspD4UpoQQQgpLEc/AkOLA9kHGBYVNsWH9DE8Rx08KU0IIIYSQEcMzlMPB50fI7HGgdDH7YdKupKOkjLsvLo/aKFMelCnBOnB4CYQPwm75oiZdPrJ/RulKOO7xrV/7miZXyEk8P1IcJt1+mW5oOCZdf+Nm1tvAQfRBkdrEsBsn0z7/HhRaTKecQR1n1gfFIsD6GS+HtTHGyYQQQgghZDgoTEvOQRbBFDzFhvWzd4pikZymROm7WfEJIYQMD89Ikjycfw9BmM7ywy0irI/DZb+uHqyfctHPVa9MInVQWafB8lv0508IIbPKrI/P0z7/HhQ56QKQw2PWB4Giw/ohk2SWJ0JCCCFkUnD+7UJX3ilntzOM7AyThfUzXsYd1XG34AW7UbT6LUJAMEL2StH6DyGjhMHbZgvOvxYK05JzkEbMhl9sWD97Z9hnNY7gR2VnGu+JEEKKBs+YkjycfylMCSFTzKQtpkW36AyaBLl7SwghhIwHzr/9GXse03FxWAs+5iGbPsbVdvy2wrZBdqLoYnUn2KZJEShS/+H64PApUv2XnXG30WE3actU13t9lv49cfzoD4MfEUIIIYQQQgiZKHTlJYQQQgghhIyUMlk9STGgMCWEEEIIIYSMjH6itEx5vslkoCsvIYQQQgghZGzQekr2Ai2mhEyQcUSFJYQQQnaD6UrIYbGb9ZQQB4UpIYQQQgghZKRQfJL9QldeQgghhBBCyMjYSZQaYyhYyY6UNo+poyiNmy4v5WTY9jMoQfJOr4+rzbINjp7d8rAdJJBDUcYsgHnUSPkoUv/ZD0XpTwd9fpMo/yBhAxTnmRaBSc8/k77+QSh6+xk2D+xhfeeoocWUkCEQQhRmYV/UQYYQQgjZL4Pm1qKLCkLIweAZU0JGDCfM6YKCnxBCJoObTzkOk1lkULs/SPCyMngblF6Y7vZwOZiRw2TSnb0Mg06ZYCRBQgiZPEIIjr1kX5R9HTTs+mPQUaMi9yW68hIyIiZ1BmenwavIA09Z4TMlhJDJUHahQcgwDLP+KNPapfQWU0ImyaCJ8jB3eHeylDJP6mD24wpTpoGdEELKTr85lGMymUVG0dYHBTssEhSmhIyYMnR8sne4+CGEkMnAM6ZklpnFM6Z05SVkiuDkPVqYh40QQgghh82w649B7yvy+mXqLaaHlUeyLCbyaeAguSOHudZ+08H45Rt3559Emyu6K9V+co+O4hpkZ/bzrPlMyV7YrZ3sZ3yaxvF5p+v3s5QUcfz2GcYiNAtMun0dhP2UmfNHf6b9XmkxJYQQQgghZIqZJdFOysvUW0wJIaOl6GcUil4+Qsj4YP/vhWKEEFImKEwJITtS9DxYRS8fIWR8DNv/p128Mg8zAVjnpFzQlZcQsieKPrkVvXyEkPHB/r87fEazBfOckzJCiykpNZMeXCd9/cMmHwyqaPfPIGSjpWj1S6aLUbevaev/o8xDzb48fey3TmetDYw7j/usPc/DgsKUELIvin6Gq+jlI4SMD/b/Xrh4JoSUCbryEkJ2pOh5sIpePkLI+GD/HwzzMBMH65uUBaG1nrnWOq4Oyh3aw4EDLCkKw+a5JV04fs4Gk2r/ZWlffD7DwzG2GIyjTQ3abHHXcz/HkQd1p+8c9vPj4CDrkyJAiykhhBBCCCGEkIlCYUoIIYQQQgghZKL8P9AxmL7wVZRVAAAAAElFTkSuQmCC"
-LOGO_ICON_B64 = "iVBORw0KGgoAAAANSUhEUgAAApIAAAFkCAIAAAAcyUyoAAEAAElEQVR4nOz9edAuWXoXBv6e55xc3vVb73f3Wruq940WSGqh1dASWCMLeQiBRmNrBuGwiZAxNgbBGCIMDMOEPQasgFBMwJiwB2wFyCNpZDFYA6gZNUKtjW6ql9qruqru9u3fu2bmOc8zf5zMfPNdvu/eW13dXdX9PnXjrfxOnsw8ec7J8zvPDqxpTWta05rWtKY1rWlNa1rTmta0pjWtaU1rWtOa1rSmNa1pTWta05rWtKY1rWlNa1rTmta0pjWtaU1rWtOa1rSmNa1pTWta05rWtKY1rWlNa1rTmta0pjWtaU1rWtOa1rSmNa1pTWta05rWtKY1rWlNa1rTmta0pjWtaU1rWtOa1rSmNa1pTWta05rWtKY1rWlNa1rTmta0pjWtaU1rWtOa1rSmNa1pTWta05rWtKY1rWlNa1rTmta0pjWtaU1rWtOa1rSmNa1pTWta05rWtKY1rWlNa1rTmta0pjWtaU1rWtOa1rSmNa1pTWta05rWtKY1rWlNa1rTmta0pncq0de6AWv62pAxBoBWtLIOUTk9zquwpjWtaU1rWtOa1rSmNa1pTWtaTWtu+xuUmLk+XslMB1a7Zri991+dhq1pTWta05rWtKY1rWlNa1rT1wOtue1vdCKimqVGxV6LyFqfvaY1rWlNb0Naw/Y3HC2D9AVWaQCYmYjWQvI1rWlNa3o70Bq2v4GoyViLCFWEhkk5M1+M4mta05rWtKavIa1h+x1IBCiD5P6/c1cRE9WWZkkcE3NkrY2iyFo2xjCDKLLWeZ9n2TTL8izL8tw7dx8Uf5CWlO2Rr2S/rOmtp4UF4v67uftdQADQnJmiD7MMXdSAcJeFaf+wU+5hV8RZgxgw86VS/XJVoX7AQoULiMM1elG1uf58gEbP2rFAje5t3nP+/vQwXbo4HOHZK9eHamW7mBauuu/jmnXK1zv/EaHy255nsV/rBrz96eJpdP8ZTEQLLKxq+clYa53LASxUCEywSHnzIKau9M0M5sjEhcugBIDYwqDb6l6+dnlvZy9pJ5d3Lz/6xKM7mzuF+F67Q9ZEbGDYgJTJgITQTlIhkKiHsqL+NSCyJjYWhkm0EK/Oe6gUzkNdlk/yzGX52Wh4541bt+7e+dLLr0yL6WQ4ORudTUfTvJiifLvGUkUGRKGcecbohxc0xohImqaTyQRAu92eTqehTvm+b7bn1/RlEi31ft3pihJMQKBqmStHnhgq5fWYXcDMDKPiAW6gl0gD0IggjUWT5g8UEAIwq0NESiAirXU4xPW5uRZjdgka3hNNnVH5UnVBc7dKq2BOhYxCoWKgESFRECCAAB5wgFprCcY5DxiFBQiRBRTFtKoGarSyalaJQAQDoNrwLr5M1T6e6+saqBQAmJmZCeKc1O+hCgasgWjVTwJVSHVR455cjg9bMOAnK/phVdvK6cFmVWUCMUDza0U4DGvFMtY2bluuKjz3sgjMDJf3LN+zsTEKxcoAEzEzC1RUsMyThD0EYBj+bbnMrLnt+9LDwTYzAtoSzb4HAGmaTqfTUMeYKIqiPM9FhGgOrZt8LTMbY7z3Ad6iKEpbnWvXbmxf2r127dqlS5c2Nzf7/X6r1TLGxHHcbrfjOA6C7jiOrbUiolKiftgW1LZmIdzKMqmqMcYYE3YSoX64Zx2hxVrLzFmWjcdjkKqq9957XxRFnufOOe/9yy+//Prrrz/zzDPPP/98MZ2W3SESWVMUGRp7EVRraPP1w17He02SxBXipSAiY0zQsovIGra/CnQf2G5UmxUSl+s1FlfeeoU2FFkbi/OFOmsggPdeS9Ck4JroxVfVm7cJHG1dWCM0YKJqQVdo+AWAqNUuH01UbTMAImuMAlAV1XL+qYoqGa7+mhHmHSYbby5MDoCKhUYkcXktCcGl7di7fHJ2BiWTdlhNkWXUinQ6hgrIkwFpQaqRRZFnoctmsA2GMlVvJVDALTy/GgXbGAQfOFEiLXuyskohgjXho14tPlMwwYAZbNUBxLAxyEAJ4uEVpIijmtMlmBo1rbWVXGHuwyRauc4IKQNSdzWqHVjg5bkhoyj7H6QktAjhCjglMAhgIkNSztmK5xGQqnql8FC0otQ7dc458aqqrETEDGOMl0KKQl0OKfeHC5vItw+tYfu+9GYEUAvcc0BfIoqiREScKz+/lVx1+Mw2NzevX7/+1FNP3bhxY2Njo9VqdTqdJE2jKEnarTRNrS0lJVJReJAxRlWLogAQRVGeFWG7HSrXX0goaaq3w6/3PiD0AlPivbfWBoQGYK0NTTWWawrVAqxOp1NrrXMuyzLn3Gg0euWVV1566aVPffJXDg4OnHOh/XVXGGPqrUwURaH91lrv/dIaswbsrx6dI/O+YC/bFBRX8zycMGCGKsKYM6AEUQYCg6UAV1IZRmRLEBOaMVhgam9HNk7TNGmlSdLiyDJZAOPxVEtGXAEK0iMBj8a5smGFEMJvkDaRaDhWJlaEXyIiP8O0JqicrycSIQkIFLABgJDG1maTKbHp9TYYNJlkqtRrWZcfxyZvpbE1GJ+dHu7fLvKM4MLrLcH2bBQeHD6IiGG81hgvQaBFhsX5UkthSFVVYKKe9wTfkOSTATG1O1GUxEnLRAmzUVURqBhRC+UGsJYfo3NuleBaAnDONU/DKFHZaVXHMgCIk7DpqTZYVc8bkJDwUi8UxaSS+hgiIgmrWb3iiVL5SFWPCs6ZEUfGWmZDpIV6Z5iK6WQ6GRTZFOpr+cfbErXXsH1/ejjYZg5YaGooBUBESZJkWVaLxwMFOAdgTXxpb+fJJ556z3uffvyxJ7d3NqeTPEmjTruXpJHhKIixBZp7VwNqYEADZAawDHx2DdtxHHsnNazWIM3MgfWnBoU/g3Q6TPoa4wNCB6gO7xUKVdXLbAtSVwbAzDUwE1EA4MlkMjobeJdPJpOXX375U5/61Gc/+9nRaBRFUZZlaDDcYaFp7nsCry8iIg6z3fSavvK0CBpNTW1do/xfVaphyW4OUj33A3gDALH6BByBDESglewUFsQA0+ZWd2MzTdpgUxSFK3R4PAEnNoriOCZrmKwSVNFqtYhIwQCUCQDBKDFFiYJJoYTmry8cmBjU/CUAhQ/4jcZkvsCTwoOUBFQIOWUfmD+AvUMUJZYjVWWvxCqu0GKg01td610xOT0+Ojs9huQGAJyKxzJs1wtOYDgX+1zntOME6Mx0YE4cwlx1OJVdzwRjgAhFCsTU7fa6/VarJcRF7rPCTbOcrIlsYuPEcFR+gJxY7mm1M5ttZUiXvscS1EVzALS86SnFbH7eAFZElnTnM4Z3xSwkW809ogDqgb/P87yu6cP9SRQQdcoaMcURWxb1eT4+LbJxYimfjrLR0BXT0LGV2PTtiNxr2P4KErMNgDqDH45qiLpy5cpjjz32zd/6LXEcd7u9fr/X6XSjyBKxiN/c3MrzbDrNiiIXUWZiNszsK7Su5djhzgFTl6OI16i8oDuvmfUmq71sW14XOueaWB5IRJIkCbL08N0GyCeisG+o5QdhS2Ej0+90A0sNIM/z4XC4v79/+/btX//1X//0pz99dnrKxkjYykSRK4pWKymKomLK11D9Vad5tg/AvGnVrIQAhhA8N9C6BpZKbVwrqRkATAvaBiIIoIQ4iXobnY3tOGk7wbSQSZ5roSCDOEnSdhynu1vXoFzvAEQCy1YJrlDKkACAjQBgWgDs8MugwO8JtP6FaETMukIK1VSB1yTE0EgB4UI5Vy4AEQLUQiNLlpTFFSQZaSYy5eLk6oZMTm7dfuP1/TtvwBdsiFW9ZPU9F2G7acGmCyrngPJubiQYIlDAGGNt7AWucGEPBDYwFmA4AZi63Z1LN0S740yn4zGchzG21UnTNIrTbrcPJgILAWAK3AHFmTPQFbC9IJyr+elyWZjbRAiAoDSutBCVGF+h8KqLXLViVmGBgm3QXHtIABA3N5fldkcAToyogxRGC0ZOxcjlI50OJ6MTX0x9NlYtCCAoAx6Kt6WYfA3bbzEFRAxsdFGUsy3InEVkZ/vS+973vve85z2XL1/e2Njo9Xr9zc1Qp4mRzBx40CiKmLkGRWbOnUPFfdawTUTT6TRUDlLuKIoC1gZ4DrDd5P6bx83GB6BFQ7cXmtRut0WkVrTXbQ4y+WYPhD/jOA67kziOjTGuanY2GSdJkqYpAOdc4KpHoxEzv/DCC0VR3Llz5xd/8Rc//7nPVZxB+eJEJOJq1XtzN72mryTxvO66KgSApjkaCMzwphKMS4XZCpTKVzZgW1qOswVbULxz82lB5JzLC+/V2CiJkzZFqY1bbCOOUhu1yEYgowoVEldCfomrhglhmxj0l1BVKKuqBJH1POu2bIlWb0/Db8RmZmE3b2iyunM0JiIlJ+yUvBCIDNTEJp2OJ4nh7X5b3Nn+3ZfGo/1O5A5e/gzGpyU/Z1S8q83s5vqYKm+Rhc6fQ+5SpDFn+Tf7g6EGxICldlenDspo9/s7e3HcHo6nznmy7U73MplWFEVREkc2Dp+zEDvnyDDBKAVrtSBTZxALzbbvVRdJ00hFVWdWBDLbZDTmiqiQwpPU1gMKkKpQ9Ubzq0opeGvAeSnVr9efwLijNBWSorR8BJSITC2B8CyAWHKWHPuJZKdueqrZYHJ8CM2CFSFBmFhVtbTSe9vRGrbfclp0u9rY2Or3+9///d/f6/X29vZ2dnba7U4Q+TLz4GxElbEVgICLgYsNK0UAS1UNgu64FdfYGWrWIN00IgvHAcKbXDjmsRlLzMQyw10LyevjcHkNnwt3qGE7z/PQgLB1COWtJMmyrGbN4zhm5jzPVbXVarXb7cPDwzt37qjqs88++/M//3Ofe+azQViAxgq7pq8i1YpM1NBCs3PcWNWYG5xfhdkMRIBF0kXmQDFg0r1r2zt7ReEPjge23UlavVarE8UJ29jGCZtYybBJvLIXiBoR9aWhGWzE2iAAKqSEShREQg1sFs/suDJLXhAUYZVth8yviPebb2zFAlCCMpWYqtaAxftOEhlk2ejeZPDGZHhrcPQqRkcghS9AxIbE5VApdc++QHNfVMM2GkqKRltWLtylKB0AW5CFEDRCZ7O3ube5tXdwPJwMHSXtbnc7bffjtGWilE0rSNbDYhLeV8AiAiZmViaVylaURODCNJiDbZKFz1+1Qk0fpHozgT8rarlH+cQgvVYKomnVJX0EyRLTW24LfFE3RgQCEqVyow8AykSGlIJWQAkenkgNChSjfHScDe7h7B50CvVAHjC7skJn0KrGvA1oDdtvLXGr3Z6MxwC2d3be//73f/CDH37kkUd6vV6SJO12O4qiPC9qLjPLsnarW2uLaw00KnVarcAO7LL3XkhCSW0gRkRRFDU58lokHmqi4rYXdNVYtWzV2EyVmrmuUBuTe++dc2FzEEWRNgzUw9OZuSiKOI7rt6jlDZbZex8ECXmeF0URThljhsMhM3e73bCDnkwmZ2dn6v2//LVf/cf/+H/54he/iEoXECTwa/qqUFh2S9P9mnWqaZkZUaoBxIBiaARKqL+zvXM1bm0OR9PRVJK00+n0KIqTXtfGwb6SvUDAAKkSyIiyKnklVQJTMBsTyUG+grJy+fKq6r0S1Yx4EIMzhMWRCikLPCkrCYSUhGGU5srDr6PZ2bpOMGar69S/gNjghqSWyEItwAwm1W5shmf7+egeuaPJ4I2zw5eQHcEAPgiyFeoBjWKrIs65YAM1D00zb+YAc02aiQQWrOuTCM4DzL3NrZ0rZFrjqZ/kFEW9dn+n39+NWj2RKHcqasKnFJYdZYIXIVhi5VIaF9hs8dWnzaIolDwpBDr7JV8rIKpyTwpVUiGqfakDoJYa6LAiVbrtansk4hrGblxvEUIvL9tZqKdqGqqSgIKFYLXdUmaAEFG1khkL7zPJRvnkzI2PMD1DMYBk8BNG6dcj9TQnrQV+bytaw/YcBaepOfMKAhsSUWjDoANBWgUOdlLeU5BXK+3s7n7s9/zuj370o1tbW+12e2tz21o7mUwau3tDTUPu+e19vWmthXLzSjWBWazc1CotMNZ1tSYMN0vqO9R75wVuu3nP+iZNLnzl45rNXjgwWO14hiWxPBERaxTZ4fBMVV999dWf//mf/+QnPzmdTIy13ufErJWzXQB+VxRMXA9fsEiv7dLX9KbIBlZF1QeGlwBr4P2MAScCW3gHBShqa6FQA2bE3bi3nSS9QqJcTJr2W92dtNXnuMUmtjaGjQoVqRZirb4F1cpxSBd4aCH2IK9CzYBCOgO2ct6GJZ8U7JUAVhYSVvbw9fHKX6HyOPx3QU1WFvJsC1WFRkbjxLZd7t10stGNp8N7o9NbbnwH2dF48FoxPjYoFPAzZy2t+g/nAAMDMMSiLljdE1d2ewTDcC4AWUxIVA1gYOKov2larThK1MQCE8XdTmcr7W6SbYtar7YQFmUvLMQkyuSpNA+YbYV0flVpqpRVC9QnVJUk8MkLsK2kEAUJyYxbDSpqWgXb9UbQq9b3UgFIa0E6kRKZegWCqgpxkH6TKrySAOIRDPtJVSM23ntSY4hVKTJqkLli7CbD6ehIJqfIB5AcKEiLqpG1YUHldreG7bctBW+lZklpfm0pz4swnZln1lLeaY0ZUIqT5Du+4zs+8YlPcGQDYGdZlk3z2iOrgm1D8xSMLZZBrqlLa0KjshLpcnld8oCwPYeOtLh1WIbtuj4u3CLUrXrTsD3XZlZAVX0URc658Xh8fHz8qU996ud//ufv3L5tY4PahUwVQNpqTccTa22apoF3b4RtWdObIQID4CXxeGUJCWLjgg0HAaYDl6K7e+XqDWPjo7Oh97a3danb3e5sbMOmQOKVcyHnRZUUrJaDOxbqeVWNVcmWNSTVAk8UpsR5A0ooLYmqOzS5vfsJvZsc7cq5vVTfUeJVlZDEFA/PRu042u61br36BYPB8OiV7OyWFqc+O7EQAyhQgBW1txfmDxYoGPqFhcCxZUAKDxCMhXcAG2gEb4GEoo1+b8uk/aNRbrr9jY2tdrcXJSmZhNgQxw7GK4saL+pgggyDIRaeNDD6Mme2t9hdAjCp1BA7U1JoKberK1cHohCIB0nlgDfTVjCRqGLRkhzSiLQSnlVt5mXGP+hsi2/IaFBpAwov8CXnrRpFUTadxjYyoKJw7bTl85EWJ5KdTcdn+eQM2RCSAQVBZg549bCXchTB22/xWMN2SbUvFpWBPqpNYggAwey9N1zaeQUfU2LudDrvf//7f+/v/fbHH388iiJrbdpu147UlQW1rRm+CiVNPQWbOjYsYeHy2lGj+QI6nleo6pua7LpaU6K+/NBleG7GMG/Kwxdc2s5D6/Ma3KQmx18/lyGABv8xEel2u0VRvPHGG6+//vpP/dTffPWVV7gSv6sIMVszE6GHpobgMGsTtjdHAbYjJsxCoIAJAvYqIBu+EEQx2AKdG099y72jLJ9mcauzub23e2kvafcy5wsPBxIlLxAKZmSkZMSzElMZ8kQYwXRXDEhVCVKdQhV4kmemZ+fQHAzonDzrYthmnRk9PRhsi4sApgh2Mhpv97rqRq+9/LndHk6PXpwcfwmTI0hBCgNEsALK4asnPAgPxwQTkSHLeTFWgG1wDAeiFgpAk3T7aq932eXGqzXJZnf3MbGJMcZYS9YI1BVSiI+SWFQ9VKAeKhUXHWvtHu3nRNMyj8GVbINFQ4X6a0Xjm10oZ4iqgKSUhchMwEDBw75C36qcfellUMrGa4QuB4XLjV1dGLzwVVWDQKjcgvgoMpPRuNdp5dnUgNppa3B61k5lcvyKz46yydBnoxDJrslGCDXNC7hktdew/TanWnc7KyLYoDn2fhbwlsyjjz76b/1bv++DH/xgmqbtdttaW+QeJMPxOJiJpWkatgKq1DT5RoPnBspIn1gSXC9QA/x0JSIuoF0oL+WKlUweDTF4E5KX+eOVsN00Mm9ca9BYDZex+cFhe+E+5bN8ked5q9VqtdLJZJpl0ziOkyQBcOfOnbOzs5/5mf/xf/0n/4SNsdbmWRY++GCjF2K/XPC4NT0AcRCSh2NVBVhBCoaxEIAsKE4u7aWtztQnhd/p9K/uXb7S7fYLJ4V4kPEAG+PEF+K9SpiCZaxbjVSpYqqVS3vjygVIPSlAAQwUIOhcPOaVMDxj+wgOXh8YtklhyneDEjX1qyt/PcEb49QV4+nl3Y1ifHL3jecSGp0dvIRiH5PDwDqSh4FhxB4iKB7GOJlbSXtaemQkBbwUDmBEKRzFO9fa7e1pBo9kY/Nyv7fjuZ10r+Wec+9EPBlmBrEGQbOHVxUl8ZVfHgNGeKXlPOZNsbQy5CZlEq1GZLk/pVlYgatS9V9l6R3E6R5Cqr40RlMIVcFZwhatksHUN2RauDNMQ74iqorgbSsqvpMmg7OjfrdjCePBWSuNR6d33OhLmh9njZgqtSgmBHmpAvTW9hlr2H57U1OaHcyvVNXYOMuyIINlE/V6vY985CPf+q0f39vb27t0hZmD3jrLMu91Y6MnBK+z6D9ERDA1t4o5xtoEm4+ArCthexnGLkDBc3BxRfgUnCOEX2jhgjC8uRuo4Z/Z1oUrG/BQsL18VbfVnk6neZ6LOihHcWlHE4Kpdbvdg4P911577V/8i3/xcz/3c0WReTfHVSdJIiJr3fabpkpQxACYLBnjHQADxIBBa2P3+uMct89GmU3bO3uPJp3LRWHAFoATNcawMSIwceSk8N4HU14wiXj1aikGuIyIDwQxLEp743rtboKBXUgXsQKJayEtScFOGj5g9+W2A2yTAkzL3t5Lv0wcTSaj7c3Wyb3Xhye3WtH09M4LGN4GxmHFNxY+BxABMSCEbNHX60IyJiIYFyKXI0LSBidwZuvRJ4/PpsztncvXe1u7XghqbdIfjAgmquMiEkPVg1wJZirCwTq60nrM29YEBhfzwBC2UOVqMGdGvhwldQG2yzgrtTVAzY6TQiCovOZBQSMegtwtPEVnrWKdv78aKErY5rDsEgCIJUzGg62NTj4dGXVJxHfv3Ep4Oj19Rf1AxBFAVForhfvNtne6rA16e9EatmdEDfVMLTMvDUOsff/73/8t3/Lxd73rXZcu7W1ubo6Gk6IohsMhEXW7/YANJo5EHBmuI5haa4NovZbAYwaEjDLy7Qp0pIaZWH12JXIvHKyE7SaHHarVAcabd7gvbNO8SRoAY6Llblz55/J2oUkNOdvctZPhqN1up2la76hUVeFbrVYI2+Kc6/f7o9Hwc5/7XJZlf/X//JfPzk7yPI/j2DkXLgneaCufu6b7EAFETFYkcCIWiCjZgG1tX76p1Dk6GXN787En37O9c3mUFU6tE1UKEXa9EiKOvZY7JyExxrAtI1qpF6uGZ0HBFZULVtPxZn6Znpu3mK9Ec/UDZ1l6BC3c6rx35Up6/CCwDUALt7vZffWVz2eDuxGG43svwp0BE4gHEAL/e8cAgyxUgezhEIFANlaxQYfd2r1pk83B2Lf7ly5de6SzsTsp/NR5m8QAj6e54TREeQrfi/dF8Kqy1qJE2fI33N7rEusvCsCQLQPAVnDbkI3PIqXU3HOjh32jn3kuJ0gJyfWfJXtDDecuha89vGewDc8wNeSHVla+4MF0nCUwx8oEUfXqXbsVTYdn3ZZRNzo5PohIhke3UBwSplgwu6PF8Xh7o/Yatpeo6ViVJMl0mn/82779277t227evLm5uRVFUTYtptOpCIKDk3Mu+DADKKQwptTbAVAp03bNc9hzEm8mKpU985DMq3KCXcBbL+BuXe083fbKkgtgW5dM0sKpmttuNmNlSQXb9+n/+TtwGsUipd0ZMzuXq2ocxyF0Wrfb9VKcnp5ubGy02+3Dw4NsOv7FX/yFf/SP/tHx8TFmzOKa3hRRCdvGJt4rPANR0t/t9C+beGM4pc7mlRuPvy/u7OwfjcbTImmnFOWTfAwwkyEyxkSW7DR3URRjjn8SEYG4lGeslQb+rIwHzaUVL80s0AhglYbYvNFS0RB1HLP5qQDm5aAPZJIWAOFBhOSsRZvzV5/71wkXvjic3nsJGEGzCLAUlNishCJIDir7+9WQsIQcodAk1hcOknR3H7XxziRLks6lS1ff1du5OhwXI+dgrI/g1Qm8MQyf1yZjpGC2ERtmdrmHKCupBj/pYIAtObzwHHKHXZQhCwgp1zpvVkbD3K8aSt841nIkZtusUtm82M/wwXahpuqMsBZYfISqeoaZH/RqGyHh6yYFQ23YThHEMnw2SWPNRicuO/N+kh3tAxncEKh3hI1QQjNheJmNJIjJ5W2J3GvYLomZQ4hDE1lfOBAu711+6un3fOIT33f58pVer+dcSBuD4LJsTOS9D6HKQjQ0Y4yQsKU6HnjJZCvbiL1bwdcCMMyAlALziqiR67PGzgX0vQCwL4BtnddtowHYtcP3Stg+zySNaC5KWt2ABT4ebxK2IYW0211VnU6nlbe6D+FoptOp977VahUuK4oiTVPvvaq02+kXPv/5X/qlX/qlX/ql0WjUvNl9nv11SAtAU1PVFbRiWWriCqepFB5qAcO93V7/cpT0hdpxa6vbv5J0tzNnCok5SpQiJ5naqVBuOWIyReFVicl6r6W+aH58WdVq3oBtxsyWmJWCj08pOA2WcKyzwGdaCmGpXuHrclR8M4TRiEke3JManTDXP6WxW+iEGaM467cguqfSU01jnRy88kxCo+OD13S8D54YmpIoa73oswI+uKPPjJVRP4aWkrI0viWADMhG21fbne0sM2w3dy491u3f8EiGmcbtLoyd+qyAhyVi73yWsGfVSoQHEajz3msSpaREoqohrRWTqGdx7IWlTt5b9xtXNtt1f1ZdVgqUZx7aM02zAKzqawM0JYG62ihwfqGYeXbNykkgvnLRbuwMalFc6T1fGhoqqfcFBcmlGgUHdDcqKoVF4bIzzYfZ5DAfnsCNIRkRQb2i2qOVmuwgK6/dJWQN2197spa9l3rHnraS6SQjBhGJ1zBmwQnYWOud6/U2f+AP/eCH3v+B/tZ2r9vPc1eH0Qa4jl2q8+FCS3iDN4aYOeSvZGZjIg6fwyoYVg9VtSaO4jICfhCnp2mQ8ZZ5OIIpu/feRHGZiLeGw8r4lYiCSHzurM6a1zyoA7wsgHQdrw2Nz+wCLrzu5JXbiJV/LnM81EhhUkvRK0GFaVZbOGjsx8uODa5iseU4jl955ZW//Jf/8rPPftEHZt1Q8N8LefpCpBdZsll7G36lD0jVYDSRYBG2Z4CyEIELNZCAAUOQYCJkOtAE7Y2da4+baGM41qS9c+Xq40qpp0hgQQa1fyuJkgiJmWWbqIZbl/BJNUDgivLqQLX2vxEIEWltZly+snpVUvULG9/AUyqBYeb9iWt7ZizDNilCEiAiJQOBOhUFWxurqiFmUfK5uklsCG5ydOelOD8YHb8xmewDGVEevjfD8MEtscZqqnqWqicrkUQhKdqsPWRydQAhMvAKanWf+KZxnoCj7a0rOztX46SbFTTNHJlEiAUQ8qHbVZVUuNqX0HxYMS4jfc4iI4VeEkKly603QOEVZtYwTca6aikFLnyusE7oWQrXVQikbmHDOBeBvMlwkwAIEdkYUmlLpDRILw3QjJAwvEdB6iVEcwlMlAvxzYi8t8YnDJedZOPDfHxYjI80PwWcMeW4lF2ySI15Vbd2qdLbgb6eYZuZsZwpKoRP8QqAqpBeIiJeAXnXu9/7Pd/zPY8++ujly5cBjuN4Ms6DE5cxBLD3hfeq6o2JApfcWEpY1RfeGRNEx1JpclnEOSfMIbkIiIyWy422krZ36r0vI+ATBWu4EH+7NigjKlVqSnwebKPaY89x3hVsYx68a+552T58ZUldH18Z2K65/Jqhr6qtCDuzwJHXlVW1stv3WZbt7ewOBoNnPvfZv/bX/trtW2+krdZ0MrJR5Ioyc4O11rvzchi/82getleINRqvtpRnKQhCFJG1ee4ApFE8KQjxNnqXks5m0tpq9y53N/bY9jNnjG0rSNmUDAk5CokRYZVW7KuaM2euSctSa5nTamuljq0AsMH7zmd+LM838AAAeDHvRTl7VwlvSZmEvPdqvIkMGTgVUSYYRsQK47260VYnGp3dfe2VL+z0zdGrn/fuBCiAgoyIzIu7NawDs7hb5X7GA8JQYwDTYOw8WE0EYZBtXb7c3n7k8CTq7T1+7erNpN0ZDbPBcGRM0m6388IDwfQ6HIiqZ4BkJs+qXjnoCWZC6fJUCBiM5e9RMQ8M9X1mNZdsvJsR0BpgL/WDMOPdZ+PbFJSHBdNrE7alEtSXHHs1r5zCKQohOIWJknwyTaIUIMnzVmp9NmKfZZPDyXDfZ0fIh5BJMEATfSd/4RV9PcN2oDp2pqrmeR4QyJiIiEQ1MFtJml67duN7vue7Pvzhj166dGk0nbRaLe9kMBiE+gGAmW2AWyJ1TojUmCjE7lH1IeA+SumxIdIA0iIoiiyO0yA2CjAfwJsqxypU7G/w76rjileLXeARmZmdKFWsTDmJSWrYW+C2iQiiiyXzMHmOWxctQOnFsL18UP+5sGMI1FwpLsB+AMEydPm2ywMd7jmZTLa2tlR1PB73+/3hcNhO49u3b//cz/2//sE/+AfMKPI8hNZptZLJZHL/CfTOoVXc9hxpjXpBdFzWdqhYGxBUwbYtEsHb3t5jUf9SrjbpbPS39tL2Vu6tILZxJ3e1wiPwSVIagXN0X0vvZklpQD4H8wGky5nWwAYBINIc/QDSM46wnLSVhbOqPhRsA0xqRRyMY6uwqgIRVm8NEvJqfN5p4XT/xfHwjVaS3Xvhs/AFoQAKayDkguyGOch6A0oHZ2CHGR6WDsEBsANmm9hmuZik73NGsrn3+HsmmXGUPPb0R8YOzgmUjYmIjTEJmyjPnarWfHbYh6nqKthG/b5Lu5yZRrdRXjZzaeAaVuKN8DhaqbTxFsB2LZ5xIKHmkAmAWtknCleGebHReDzudjpZlkXgVmrHZyetmEZnB+Phvg734SdAiKlSTu+vA/q6he2Q3xorwp8xAMNRHTvi+o0b3/3d3/2BD3zg5s2bReGMMSdnZyISlNNJkgRxdxOB6vTPNTUWBWK29edRZ4kOjSlbUMUepzJzlwkbglpE7JyLoqi+cx2HiNkKFDqfCKTBNi1z202ji2XGt0nNahfDdrNavVxiFZqeB9torLPNttXd2GjDuVN05Q2992majsdj7/2lS5eOjo6SyERRZK35lV/5lf/qv/q/np6euqJgZpFFPvudTkuwvSAEhlJTw2oNQg/6sAyThROAGNpH5/Ijj33wjTunl6490t25lLa6k1y8GJt2gHhcFCZKggEulfro0qfIIKoiks4tkCu46kpOvlQ4C4G5ErYxG/qZvdnc/cXX1z4sbJdbc/LEhbCKCHlLYgylkUhs9N6tL0pxLzJnx699BprBEUEIwkZ81VJrrCvd5EKksxCG1AHg+RjvYVDUQAXgGNrefPR9cfv62Rh7V96VtPsmiaeu8IWAjWFLxooPoi8DwIexI6j6MqpJyM+11PM1bGP+02taklddVHZ98yZUWc7WiTjnGHe8tbDtAQEFv+qyEEJz05c0KO7Fo9VqnQ1O+u2WYZ0MTjqJGZ7uZ8OjYnKKbABkoALkyzdaw/bbmZqIUjPBSdLyhTjnQtzbJ5948ju/8zufeOKJa9euRVE0mUxu37l3+fLlJElCYqugbxYpU3oEfr12KwoZNZrpuZiNNXFQj4Vq1to4jq21rVarmSlEVcscG7EBxHsNiWODGjvAVa2Foka8lAWcW+Q8zjdPW0ZcNNCxWb8uaXLVNYQv36RZUv9W3P+5tnLL44V52K5e+T5mwAsXBguAXq9njBmNRtPptN/vDofDzX7PWvvKK6/8/b//93/+5/7nbq83Go2IKGReeufSeR26enWiSkgrgLABG4DgFCBGpkAcw6X20pOt7o3BJHr8XR90HnG7Y+PUeXGiamKwFaiWJmblkk0qQZnJMHy/YKIL3HZzVtQrPqk0FvQZNeMfVJcEmF/cJVTwMAs01Dw4B7YhUGYW9iIu5IQ2FBsyKTFJ8cYrX4h5KMW90d0vgAeAknCpHJgbi8Bn2+rpIT2GZ9QRyUngfbBpDmx51EJre+fauwfjKGlff+SxD2dFYqLo5PRulJgkSshY8XBORMQJQla9OkVVgG0ApQZthYTDA029fkkLDmCqejFshxGheZ+9evv15cN2qTUnB/KYwbYGf/2wkJcDBQBqjB2PR1v99nQytJInVvfvvBobGR3fgZtAipDXC+RQihBWDvs7jL5uYRvBtFtEVaMoMsZMp1OACQzQjRs3v/d7v/fjH/94u92eTCb9fn80mnS73SzPw3IP4PT09PBofzIZF0VRFEUA6XAAYDKZeO+DG1KA7YC4cdQKcvUQEiSO41arFeKeEpExJkmSbrfb7/dDWjBlRZl4sEy1Ge4fx2mdGSzYq58HwzXnsRImVyLlMhNcHyyYnTfrr4Tz5j0XDlYe1wHjFtpz3hMXRL66YjWZW0E2NjZOTk6892G3VBSFtczMp8dHW1tbzHxwcHD79ht/7s/9ucODgyRNs+n0HW1h/tCw3bBnNihDXpdaVUSIe1ff/ZGJ655O7M3HPxi3NpO4c3x86lX6m5smsqfDoVPpdDq5d6U0lULg6JJFDjrg+6J1o51LJoGlGNY3YXvluFf13zLYVlJPnpkJRkRJ1BBHxEa9ofzVFz7TiorR6ety+iXYKfy07slAQeugWovHuZJzSBBpGIgNcnOQBxVghYGNYaPNm+8quDVxySOPfqDdv3lyqjbayIq837dFMcmyQkQSm5goUdWZ+HCWWVLKngzW4Cs6PIDi0jYIiyU1bC+VN3psSbcdnv5Ww7YrFfCCCrZLQU696KmXdhqNhietmFCMzo7vxFQMT+4iH4TLiURr+yaihehv71D6uoVtIhN8hNCQk8dxvLO1+4f/8B/+ju/4jn6/D0BVT8/OXn/99clkeu/evel0ysz7hweTyeTWrVtnZ2eHhwdZNsmybMHk2FirwZJ8ZpRBAEM1hCaqC8uY2FkGoiiKOp3Ozs7OlStX9vb2+v3e9vZ2FJnNze29vb1OpxOg2lpbFA4o7Sq1TMEZMbNT1wDIOZDD+dz2Mnifx2FfAM8XwPYFBwu0EOalrtkE7OblwS98jj+rZCfNknoFmebZpUuXfOEGg0G73TbGDIdncRx3Op3j4+PYml6vN5lMXn311b/39/7eL/+v/5+VjQTwTsHyeQ8iQROw6xHQuQtmh6XU0AIJkHT2Huvu3Dybcmf76s61J6Y5gVNCHNnEiZ/kE7YmbSfe+7PRoNVq1TtFBqDlnDfEC0C7ML4rj6v7zHTSTfBuXlK67ejc5fWib+aDFK186MWwraYAG3jLEhuKIiJ1Q5ef3H3j81t9f/DqZ5Gdwni46VyvKojABCiTks4MxxFkuUFCboCoGqcckaKNZIPbm9Tqi2n1t69evvFE7uNCojTdmuZqjHH5KEmNMZErxOUFUEc8DBYAUkFjedBwNSsBkudGwatqE7xrHVSjrxa57eqUzPBySbf9FsE2z2AbXrmR21stwBDWyjYttMOy5tkotZiOjtz0mNx4cnwLlMNPQ59TCDOuDGIQQfw75dO+gL5uYTt4ajlXOlAVRXHt2rU/9If+0Ld+87dcvXp1NBrduXPn5ZdffemlF0bj6WAwGI/Hr732WuCnT8/O2LB4AaHenQWz82V/oVI/2MBpCmtHqfK5jxUEMSdJcu3atXe/+903bjzS7/f7/f7m5ube3mVmhnJoUjCjs5adCi3BNhpc8hLsrTZQWgDdmnQ+3/byMR4MtpvhVAOF4yDcOw+2V93HNi+vD5q2BY1vXzu97snJSWyjNE2zLAs2+UFoEUWRuCJsjNrt9v7+/mc+85m/8F/8F+d8xu+Mb/tc2G5+2dqsDzQWa8ACKdC5+f7fc3jineldfeRdrf7uaFp4YuIUGhEZsmQtexUnBTOZ2PiiKMeolMqGPatn5npAyicuwTbmR3M21vOJKIAZzz27sILtRYCvYLtZ+CZgG1ZE4Au2miQcGfhifDAZ3xqdvZjvfxF6BlOgALTe9Mxc0ggA2IAIRqr5IwFZARAIMAqUso0Ool3TvdTauBF1tnevPeI4dsImSsEmdxLiD6pqkN6p80RsjIGEYFCoYLshIcd8BPaGBX4VB+JBYZsahdVvw3jwKwfbnhUCOJBTKt9LVQmRKuBDlAgmBbEaeJKCkBXTgc/P3Pg4Gx3ADSATJqlfSAGAQQxj4Ip3yqd9AX2dwHYtDw9i1TBv0jSdTqdJkjDZH/3RH/3+7//+LJ+cHh8988wzv/4bn3755ZdPTwdZNpkzeipXEAYk+HiGwpVwVc62+fWILdUsOAXoqvN7YobuVX7u0mu8kaSErly59sQTTzzxxJMbGxvXr1+/fv16p90L4E1EuXfGUBACE5FzzhjjnCt1XQ2cDqr0YKleg2joJVUNBvbUyPxdv2BtLrfwvhfAdqP/ZpWbhQsly3Renabf9sVUtsrMecehWqC16YM0y7qG51968Sd+4icmwyGYLZMrCgDGWgDeOUCCoUO4+dsw5hrNJLGY5aggBBeG6rhyT9fSIMoDSkxJVwtG70rv0uPjPN678q6N7auFmsIh5FXLvTCnRESsylBVhLyxXHsocIh0QVo1g9yChH4BsFeWNzG1ThLaQN+ZkZrMLVml4Ldxh0Xb8gW0nh2IpypOQP1dEFHu8jRtkcRumrUim3D++qvP5JNbxf7nwWdAFly1jCLoqT08KJhj15b5AISJRSXkxvYKEGwEV1Q5N7VD7as7V572vEnxzu7VxwqKBUYMqMzMK0QkBBWjwR6hXjrKMJ5hPL2qskqtawiwPd/nsz5Z7tVVQzCnp6eZAGMWEG3Ftukc3TYAVNmPSEMwhtIYSIPV+DxsqyMGKfsA21VCbnKFxnHKoOk4M8a0k7RwmRYTQ7kUwzw7m44PZXSIYgBk1rj65SolBs8Sca5h+21FcRx7773XOga1tfZHfuRHnn7qPcz8hS984TOf/Z3nn/3iJJvW9evg4cwsUMwH1i8xlSi4eFVA3rDOLYM8NGB+wTJ2laCSGNVioVAQs+EoRGgR7wEmZhVN0vTatWvvfe973/Oe99y4cWNn+1Kv3yFjxuPxYDBIkiTkowypxoAyPom1NkB4yByKCr/R+MZoFeHLhu0m9J4H2w8C3vMlq2G7mdOsWV5yY0uwPaugimqNViJVPTk9/lt/62/9s1/+ZSii2BZV9PJOtzsZD0UkTVMAQeHydiNqWCYv8NlEAFWhn5QBGEPsPRFytbBtSLL95IcGLla7sXvtiVZn29h2njufe2OMIfYKMIdgvcSq6pWVgjhYlMhALUCESJVYCKTKHuSXofq+JfVa/1bBdvMOwCJsB5O3Zuy/sAshMuI8K9oJ56Pj/dsvbHT93S9+GnQKGlYWeCFuSqRgj6JOalnBdvBVglMwA1zCNkouIAKS5NJj/Y1HzybRzpV3X77+1NHpFCYWNkKOWAx5IiV4JfISaZ2iPrR8JWyrgkSAmglpdO9XFrbL3/NN0kJgq/qqEJHifNg2JWzDKUl4QVWNbCubTL1zW/2NIssnk1G/287zMxTDIjsej459NkR2Cj8GMi5DnFaZzsrVd9GG/51L73jY7vU6g8GImYPbD4AwpZn5h3/4h69euV4Uxac//RvPP//80fERE4m6sJO1cSQiVfwsI66SaVPNcwNAFKfMbNiyIRUoRLyCNM8K4iBWExWEtHggBdyinBzAAuc9K6XIJjVOgChE21aRpikWG3Pjxo2PfvR3vfe97+n3+zdv3ux2uyIynU4D3zwajdK0RY08H8wcRVEURZMsW46K2oThZfR9KNi+ALlXFr7lsI15AGjC9lxrFXX/NEz0NYoiJRwfH7/++mv/yZ/8ky7LSqArtRvleBljCOL9hQqPrwVdBNsMosBnB56YQCAtbBQVRYLW3s2nf/drd4a7N9+1sXfDMSsb58UXwp4ijiKKlSBwAapD58GE7Y6hCraJOOgdQx4n5ZnAdpmfrse3sbIv1in3jst67qX7LID6EkKXcLUSuQ0hqEvQNMMUE1Fa5FkSZfBnR/svRDQ4evGziByKYUhUTQgRxxgggVYSjhq2JcB28KQrO8IGk3ELJOBe68ZThY+T1u5T7/5Y5tP9o9GlvavDaSYUWG0Y8qRSmgpSXEdEoUaPlTG94VW1KU8SkTrNyfwQlALzBbglWu4f1YYEcgG2y6vmYRv3E5KXC0W5wZo55qwUkiMMJ0SCe5uqKqkXa21i7NnJcbedtNL4YP/2Rj8en92ajo7y4RGKDCigU8BRY/Vcw/bblGp5oLXWe5+m7UceeeTDH/7wdDr9V7/26cPDQy9i2HjxFWzPUavd7vf7W1s7MBzmvXMuy7Isy5xzVDKrlhmVTyGHKccMa+MoMlGUWFsGMU3jyPsiz/PAEw+HwxCvNEgpbRTVwcbLVUM1mKo19xBE1PRPFR/MKJiNeeSRRz7+8Y9/6EMfunz5cpqmSZIYY05OTpzzURSFP8ur6mWp8e2hYr51LsHJ7ECrMC9vGrZXQe+bh+2FVCUrqbms13lcmrfSKnxH3S31K4yno42NjSC0eO7ZL/6ZP/NnxoPheDQIRuZEGsdx8LmPI1MU/h0E21UNA7bwVSZhBtTu3Hwvx5dHRef6kx8qTBp3+oPp0MFBhNlEsOwNa8zMQrmyD+GDwpwJPRysJKGGapNpJeGwbV1cFucGaLFwtSibKt5uGbYXRrZk6RRL91kUmM+1RHxzkpfP8ojEphHn07sH+8/22pN7z/8mMIU6OAWYymgpAFTmDADnYLtEchs8yACKAAuN0Nrt3XjP4MxvX3ls79oj4ynbqG2T3v7hYaffQ8kviCEiDfmn2VMIcI4KSsveCLCNMq63r3E6yOtpyZi/aW8/36Uzf+7qoOzKciCWYBt4CEtyEWly2+XF9aZhGbZLeaeo+hCUPlxTZK6VxpJlrZRHZ8eG3M72xpde+Tz5s3xyhOkE8OXcU1/PD56D7abn2Dub3vGwbS07J7WL16VLlx555LEoip579oXT09MasGf1I9vd6O/s7HQ6HefcYDAYDcfBci1K4lar1Wq1kqRVq4pLEyohUeedhqzPxMpkQ4mXIvyKB0jEFfVy4L2vpXCbm5ve+8lkcnp6OhgMXBV9xUY26FOZOGwpFjiSiqQEXGNCRJEPfvCDH/nI73ryyScfffTRXq83Go1VNXijBTm5eBRFYWJTc5nhRk3YxhIqvxNhu9lXy7rt8j7V2rcA21FiR6NRHMfBhe/ll1/6f/zdv/urv/qrbjpJ0pQgQTbOzEFS8g6AbQAA24rPJgM1IVQFJama5OaTH7i7P93YeXT38rsLbuVqCwgiEhSGyRhDnn0B8paZYRRmDrZDdD8VoiAXh0EZvopVPZGex20vwS1mk7KUgOvCWdJFS/JlKk+Jn/tzJmWZK6/PujyrQ/3Xc96oclGwGx4dvZTEZwcv/AbslIzXsYeCEIVgKQIBvMLVEd1pkbuDEmxEzikQgVJQG/FGZ/exEbrXH39/u7sxnhTMqYmTMi1GMMsnISJWJi31GmJo/qUWJduBzouMttAbC+A91+AF+ceFsL0cbuW+JmlEtQVt0/97AbarDQE1ZfJMChVRV7RjO52e9NrG58M7X3px51L38NYLcCOUTyGEsDNV8xdWgbfbx/um6R0P26iQGwARMbP3QQJDANKkRURZll27dm1nZ2cwGt69s0/WBJg3xsRxnCStOI6bImNmW8NPkMWKzHjXJjItYCER1TGug2q5vurs7AxAKAluYN1uN47ti88/e3x4KCpxFBcu08pwNNwkjmNVX5tBWWvDm1bEO7u73/Vd3/Wxj33s6tVr3W43KPXH47GqRjax1pbKyMbWuFZ119R49bcAtrGEms3C8yzb63sulJ8H2w+u2y7rL3HbofFZkadpnKbp6enppUuXptPpq6+8/LM/+7M//z//bJHntY8TACYVedt9+U3AaLaNDKsHiKsk2Ry12v3tq6Z//d7B6LGnPujR6vT2hhPxxGwiGCgJsRKRihEBqzU2Vnii2ZYufB/hWEqlNxFRLVQlWjTSDLSMu9VyD6A0plsQdAfYXrj2vPssRDKvDxZge/Zc74JFSDBtKRcEFO7s7uHdF3sduffcp4EzcAFfCsSBCCVsOw2WaDRnQx5GAdUkBKE01LebiLZ6G1f7lx7J0+3O1uU4bk1zgTKYYdgYdi4PyQWICMoMlFk+uF5qFl8EWMTO5qellfA8ULWkBMnEubANoEy1+QCwPetM1fNgu6xdidYXnrgE2wFxvdQymNJPgY0K1Pt80O/Y4emd0eiw1zZHd15FforA7RhWqdx25jVczbXg7fb9vjl6x8N2kJBba6MoykslMXvvI5sYY65evRZF0b1798bjcafTa3c6GxtbNk7jNAkfbQhvIiLMBkCtu6xhuHB5E5xoPoh3oJp7U9WIy4za1AhtFiiIr733WZZNJpPBYDAZD1txFFne2toUkS996UtnZ2ds4JxL0zjLshpojaGQHpTYBtvm2l49TlpFUfzBP/hvP/300+9973t3dnaIKOQYVdVKMVnJ2eYRGvOY/SZgu/mCdA5X/RWFbSwsZCRCCBmoFloL1EYxpRSTSNvdzt39/XYaJ0ly7969p5566uT4aDwe/8P/6X/82Z/92eOjgzpKbppEWVa83T7782AbBOZISgMvm3S6/d42ty/tT3pPf/jjg8HAREk2dd3+Ru7EGFs4ARkhFihRGb8XbNQrwVTzYW6eKDVyuZLUPVzTMtzS/H53EYPnA3DW7FozlEr4Qk1jZGv40SVROYCaX8ccMimp1AGOwg7ee++z49M7z2x13Z0v/DY4Awr4jASWQ9NYYSRwllTZxilCVjUADZN+gABicItbu9Zup+3Lm9uPpf291uUrd0+GzHG303dOnVeyRsQRK6DgZogYVlVD3JQqNxUQqlrGdaDS4JRBNMeOz/VJfZOm3cB5uu3zYLvcvS3ptoOkcBm2iWbJPR8Mtr3CS504DkTKROSn024rhkz277xsMEljd7b/OmQIn1PocYaCIIQ6umslWKFGnwq+HpD7HQ/bQDDVmC3iSdre29vb2dl9+eWXs2mxsbFx+fJlm8TwMHHknVIDsGcwrExEtSF5c9VgM4OrevWpo5TzfCoOUyXorGE74ES9S1DVwOUTkarAFScnR87nIuIL1+52SPXWndvHRwcArLXB7RgzWYIPojkbRwBc7oGwu6TLV668973vff/73//ud7/72rVr1kZ5nmdFASZDtVe3mYftKmJGA6q/og5gbxVsLwBA44LSMWmhQvXOC7BNAu+9b7fbgAwGA+/99uZWXmQRm//uv/u7P/MzP3N6chK2TWF7t7Ixbymdr4ELItlSMLvgrs1oeEFouI+N4AFElG7uXXnERu2Tsbn0xO+eSJymcV5MkyQpioJgjIkIFmxETeE9GeaIlcQ5ZzldCduCcvKU3cpls2jOb3geKVcJyetpFkpRsVkN8PbnwTbmEQJYsCoHEBJSaHDx8I2IbFKIoaCQltgSxA+GJ4PjL3V4//SVz4IKSAYtCOCG8bqCBY2MLKGvlakxXgGzOW5LQUg3O5uP2GSv07+6sXWDk95Jntl2m5TzQgxH1sZCYIaXggg6ZxYQYHu+G0NWbBIoN3qJajO0kAesMTEW9dBN2K76cJmP19p4tgHbs+Wi9vy+H2yDKlZbIc1NVQn/opWtuK/ccLTOjhjgiRRWyRoU00ExOYIf5uP9fLgPnUAyw6WcpRLd8BJsl0z8Gra/otSYdWWU3XqpAofka8EAzcROvAbxpyqAzsbm5cuX8zy/d+9eu9vvdDr9/maapkTGqzCIiLxbXBAXAGMZOb5MWnnDEvKBKLKGSmVzkU2Gk/F4cDbJs93tzclkcnh4cHR4CKBex62Fc0Lzky/I1ZMkybICwLd867d+53d+5+OPP97b3IiTlhDUSZ7nado2HI1HoxBsVVUjJlV1PjfGMFNROBNFAdpr8A6PCLnDm8i9Ep6XoR3zAH8xbDd7bBn4sYTWy9xbHYal2Yz6uasYr3qfUe76g2tpkiQnp8cvvPDCf/If/8cQ3d7ZOjo8ZGNUHFSTOMnyDEASJ7kr3jo4D8F3g9B45oQ9OyjZIS6l38FzIZSAq7VJiI0TDzKgBL1LvZ3HYDajdGtj90bmSE28OArERAbKGu7BBEgQzxqNqNrzSaWAaA6rLo7UouX/Mlo3qYYTYF4Rq6pL2S+A+TTSNKswz2eXt2K105FLkhZHrpCJ05xIlQme0qg3HY1JtJdwbN3w9M6t157rd/zJy78DGgMOWoTeNvNNFkAJdeou1pYh62QCuCihPFcQEFkUCTp7ce+G7Vzubd7c2nsEpn10Omp1UyXisqtnW5a6kxYmv6o2sbDKYi0L+Vo8lEN+9PkEOVqpvZvuW43NzRzv3qi/WF72MKnOWxs0tlyrbQgCpjbyZ5cjSGQCWquKotAQwgYiMFqlDGEF1JOKhfjp0OUnmp+hOMtG94rJCaEwBj645c6N0cIKMycq/zrAbLxNYbvkKqqpowCh1YomkyJ8nJWVGWvwn2Ta3NnZ2NiYZMVgMOh0OlevXgUH0Vekqs5LzVizrFg7mvRlwnbze2t+gefBkinxu1wMVUst0cHBPRGJjU3SKM/zo6PDo6OjPJsEz1VDpZFqHNvgqg7AGCJjnXNhE/ORj370933iE+953/uTVidNW1EU7d/Z73b63rlup59lmZciYoqiiA2MMRDJihwclVuK+bBrc5KJc/qquaC/adheRuiVT1wJ2wt9u3zhMmyXNsBlTanD0TCj3+8fHh4+88wzf+pP/UmIkLVa5O12ezIeAoij2Hvvxbfa7crz8MunJmyjqTidX3Vqhy4FeUChYLKkHPwOBVATQ9huX2ttXJ34Tm/nkd72zeEoi6JoJk3BLPidUlArmLIVdR8iqodvHrZnWzTM9fNDw3bjt6GfDgaAS+kmHxa2SRIi8pgUMvHIlBWwUGIfsdeYpBMjH929+8ZzGz3c/uJvgYZAVroJBaDUVd5Eld+0obaIdtrxcHwaMrWYKPI5I9mLNx+Je9fbG9d72zfFJFNBFCfqHOa/CMyLIhambvN9V83eRZh0S54yNN+3qrrs6d68A51bjiqq2WwH8PCwXQoUKthWVVfBthcCNMoLT0BiI2OMugwut+RO9t8wmLrpUTE6gBtYdgbeC/zXCxI/FL0tYTtQE7YBAHFsiUyWZQDHcWw4mkwn1x959Gw4yrKs3W5v7+5ubm5aG4sIGQtAvIZMXKpKxhIRy+J0XKAvE7YXUmU0YawJLXV55UkZoo4ba60xZIyxxgyHZ+PxOJi2FUUGIInsl1576ezsRJwGdrnKOxIH8XstTk/TVESyIv+93/Fdv+8Tv//97/tgHCcMIjKHh8fdbjfoCEK2UFM6VoKILoDtBf67fpGV7/VlwvZKzG7+uQzzdWGzGQuXLy98NcwQURWSSVU1ju3+/v7u7m6n0/nH//gf//mf/EmybAlFnqdpLCJ57W0P1OF93gpaDFa64hutAlZWckWghNogiLIhpkf/yuMU98X2t6486m13nKHd2XDOzWB7pisoYbtULpwD2+WKXF7dmB4PDNtY+u7mR6TBXpffqdYfTjm40tiuUdOVCKvuw6zsvRfJlRVGPQRqDEgynzC1I50O9g/vvdhLi7vP/zYwASaAh0rJPMzprcs+DxxrqEBAHMVZkRsLD0AYtgfT6+484Xhj79q7Ots3RjnExlErnWaFaRiTLI3rudN+ed6eh9zLEu+a2272VeM+i6Z894Xtpq79vrBdjZoPrtgAqJy9tV5bFIVqAfIAiydrYxJ1LreskVE3Ho3ODkgmKAbT0RGmx0BmWUi96NeJ0Pth6W0J2wt+n2HPWxkJxkkLqnnujI329vZu377z+FNPXb9+XURy56yNvffD4dhEFghoSBU/waRzMbNWIveXCdvLl6/cVjd/GSBqgo0CEJE0SYJuO/iLTyaT0WiQ5VNLOD09vXPnjngf0nJXpuYSXL9qWzYAFNmk1f63/8Af/NCHPvKBD3xAvEZRcnZ2liQtYyoohYgIMyVJkrs5x7AmDC8s3wurj54jNq9rls96MN32eevXfXt7oW8XCldy242as/XIuXxzc/Po6AhAmqYvvfTSj/17PwogSeJsOgbQ6XSC59hbB9g1zXN3zfdQzETls3cDGh8IKIXtdzduOOr0t6/3t69PYQpljlMFh2EsR6H05CYiksqJi4iUmgNngm4bS7CNemQfBrbL91hCHXx53DbmuNIZO+hcXsb3taVxCYQsMWnRMpoND/ZvP99Pi/0X/zVoBGTQKnitNn6rzIGNYSi1GGzKVCEgQC21N3Vsdp/88NR1rz3yHor744LiTtczj/NJkiTqZ+b3K1cGzE/+CxhrrJrPDykkx9xWSRtyhCX4b8J2c1DKChfBtjC01l6XsK1cWaR5hVf1oCDvtgak6kkdaYZiko0G09Fhavx4cKCTE5Ajcio5AUTLmUi/IehtCNtLVLUxSdp5nqsiTdvdfp/ZKuHxx5700NrbishYa62JsqK0Kq8/D/EQdZbnXnkZub9M2H6QuzXBTHQWGxmND9VaG7Hx3uf5FOAkiYjIOccGJ0eH0+nUGDOejO7dvjOdTADYKHJFhkrPXXYbqVYLT6vV/fEf//EPfegjO5f20jQ9OjpJkig8K2C/F2ethc64zyZsNzE7UPizmdJj+ZUfCrbfNGY3V7flEOvlYnSebnvJlqI+1Wq1ptNxMBo4OTm5d+/en/iP/sPJ4Kzb7Q6Hw+DQ75yLIvMVC1TexO/S6EznP9oQPrMSfAKwtrvX6lztbjySu1bavZz0tjLnc/VcevATw6DxFRAHVGYAGrq0LAGA2oYRKLn8ct6WG83FfLJ4MNjGarb7gbjtxrMWue0FjhMQIafqiSyUvVdxakCWJKZ8Oj48uftSJ80Pnv8t0BDGQYrFPKJlrHWqh4MgQB2BVYShhChCkQN2A0X6+O/6rntH7uqNDzhNWv1Lnuh4cNrutZJufHZ2ZilpmoUud8vKyf8g3HbVWW+G227e4cFhe+73HNgmUUDK5NnkqnKuYJtUFeIVZWIuAzMejy37fjcmNz05vOUmp61YT/dvIR+EmCrMGnYntevvNxq97WC7uaFtFjFHIgqg09vY3t7NC2+tvXL9WmB3VEsr66IoCBzHcYiwI5Umm4iCBSaDFkIWlI9bJXR9a97oQuQuDU5kJhYIMkxVdc5Z4jiOibgoclVYa/J8GgTgw8FplmUiMjg53T+4W+Q5CJGxoi5AoHpRaBSzE19GKyb7B/7AH/iu7/qeJ971VJIkSZIMh8PRaBRiqzlfEDhJWk3Gd6FVAGrtbyg3xlyw9Xlw2L7g2vDnwlOWmZV6u7NQGMoXEoZeANuB8jyPoggQ732v1xuPx8aYZ7/wxf/Tn/vJe3dv9/v94IgfyFqepUB+K2nWtsYcWrKppKoGMaKN9tbN/sYjara3Lj0xnvJgPG1vdJQxyYZJK4ZjohK2y60ShS3jHGxj1v/3gW3Mz3BasvxvjuNK+RawDLdvktuuOcjyhiSeckBUrDqFmJiMYUSaDQe3j+6+vNlx+8/9NjCEncLVFsmYsyFYCtphgrAXooBQqbJIepeyM7n2nm89ncTXbn7AJDtkO8Op9yTtXjLJx3kx3NjazMYSuhT3WxnO66WLDy7mtsuac/m7luH5vHJUHtgrdNtaPfdi2A6DCRDUNmBbZ0nMCh9ZEHLJBi470/zMZ2fF5LQYHoKFSULIyDBjRWT5c/hGoLcvbKP+dgjBdLa3uRlHSe781ubOxvaOtTaO48lkYq2FUkhTHUWRczIej6MoUlWtsoFV4BN25XNMVfmstwi2F5an+iNcMDaeMbKWRCsvSZ2BXEg2SgprLZFxLjcmimNrjJlMxyKSRhbAaDTKplNADu/t7x/c9c4B2krSaTYFkCbxJBsHsWq32x4OxwDvXrr0Iz/yo+9+33sfeeQRa+1wOCQ2gUePoigYjsx1WoPQWENpyfltuR/eNGwv8xwL7EUNz/UyEShIDpo1L+a2wXNyyPpxeZ5vbW2dnp6islew1rbT5JnPfubH/v1/H0CcJHmWGcsi0gg1/2UvInMfQGDvGJWJeHjEwjMUADFMhLgXd3Z7W4+2e9c53p4Wcdzqe8HJ4KS32Wl17MHBQTfth+2WqgZheAjfG7C/iqAyM0zjICHnxqzAjFlsgnfZ/AthG6umSqO8YUz+kLrt+QhrFdiT5JIxQ7zRXCKO0oipmEzGB0e3X9jZ4Ntf+FfACDZHkVPlvzSzO4NdWpAEEFMNlKIMoQ3TBjpPfvjbv3RrdPWRD3S2H1Hqng4yjqKklUyLsWgWxaqqTCnRbFe0sq/mD87zgFjktlUVpSx67uzF3HYT5ssevh9sr9RtnwfbrEwqQq6CbSkNG70pYTv4fAW/eDh4102tz0dH+1/y2Ulqi3xykJ8dgIooIgBFHua7Va1jqnzDIffbDrbDJ9H4chD2vCaJL+1dViWvdOXKtd5GfzqdOucijsKKHGysQvxwIiqKgpnDIqJ1RBQSy+arANvLf9YhWdCEMSZRT8wmRHdB+YkGVjuOY0OzlOHhpeI4pmBBxrDERJRPs2k2Pry33+m07t65c/febQLiKMqLHBBiES27MsTvzHMH4Ju/7eO///d/74c+9KEoikDsnAsxU6nhWLIA2M2Vl+atyr+asL2Sq667N5QvMOJ1yUrYPq8B4/GYmVutVlEU1trpdBrHcWT4pRee/+N//I9PxuMojkMaGGO5io73FYJt4pkX6mydUgITizA44dZG0rvU6l1uda/F7d2Js8pp7hRMSRI5nxV+msQxo44iXqu2zQJsNw3TLoBtYE7PXTb/frCNVbOlKlwtJEcDDM4Tkp8H206dtVadSuYjpoT82ento7sv7m3a28/9FvxJmXxCYVAHPQuGTow69RYBlRQXKG3Lqcx/GoEStLY2dx8tuH/t5vso2S7QycTGSccrvDhj1Fh4mXjvI9uaN6eYm5/LfVX37QIcYtVk1jKa6dz6tlK3fQFsM1YL21fCdmO8VsO2EQYgKKo0S1WWBDENzFYSBZTgOjGfHd/JxiexyZGfDo5vIT8GFaZSYzMBRN7T11P+7IeltyNsGy4VTF5gTKSAMdHV6zdGk2kr7Vy+dr3b7Q5H4+l0ytZYLrmruek1o4VYWg2/moenlWzZyj/Pu3ahmhLqFbO+T6Wla+ClBtbWMoNMSHgHIjXGsCEDItI4ivb3795549be5d1/85nPeu+dd9YY76eoNkBlwC9CsF+6du3mJ/7A933bt33bpb0rIfLGdJp1Wt0Q2DxQCNad53nYNyy/yzIMr8TdBexf7snlxat+Vq01mHXRqmqBShhpJCot+UKRhQaUZ82cdlZEQuSpIH4It9LaRJ/VEFvLn/70p//Un/pTUhRRHFUJ3CR4dTdfzVr70MJzqvg4AJUbNQBD1qsTgKBE6lUAmMj6gijqqkQbl5+I25f7O9dzSabecJoKWAlKCPmbOXSXUA22ZXTxwP3wzJJcZx3CTSF5+WpMRMRk6+HQWfoWBs35zTe3rc3y5sA1CqVm4Kg8u8jYnSckL7I8BCgNbvdUqZkEoU1KWhifZZOjo9sv9Vpu//nfBEYhTUgNw6g6Xmrn0vJBHiQwJZ4TyqQizltgA8lW1N3t71ztbN1IurvOtArEFLV05lsoBAWEIUrRyv7B0icTDpqvewFml78QiBLNVWvCcBO2q55fBOAFbrtRjgssyWle4V2WK1PQPJADRFFz2wwXtntGREg9E1Q9+Snc0E1Oi3zg8tN8sK/TI9AkMhBXfheV6Xi9qfJr2P7akzUUvJCjOPZevVcbRVs7u2Tszval/ta2QKeTTFVtHEVRVIYJA9CcXjNahu0va4yb4NEsf9OwTQ3D3arF4Xsul0tjzFwajOAqRmyMCZ9cSBjQTlsK7/Pi8HBfvL93787p6WA8GRI8QW0cEVGWZf1+fzAaBlbGWOuVvvmbv/kHf/CHHnn00VaaEpF3aLVao9GIiLa3t0ej0WAw2N7eDn7bC+/SZKMXuqK59KzkJBY6RFeZpC3cofnchZpzK8j9YLu5uDRhu1zMKtjWhnS9DmOeZ9n29ubdu3e/8IXP/en/9D8N2o20lU4nk9K0mGGMCVufi6fECqLqV4FyJjOXc5iYLUgL7wCxUVRGu+c2fHz5ifefnOHRJz88yti2+2MnaqAkyr7uJQZDGXMJpg2qSQia8dkyN3wmiK/q/i/l6FX42ADbs/HlmZJiYZ+0+K7VPqkxjm8ethmkdVa9CkJEwMqGYOBYp+Ph/sn+q7t9fv2LvwF3DBpDBVpzzxaAwgEhCprRMlipghzCBspCCkDBITiXdpE8YrrXNnf3NrauxN0tidJcTaFMUVybTTARaRVBjOem7puG7frPBdiulYB1nQVuWyshuTbgeRm2F26Cc2B7dvY+sC2VhruMc2cp8oUTEcswTOqd+oxkUowOSMbZ+Hh8to/8FFwwplpHpVvDNoC3IWwHiqKoKIo4Tr1gb+9ynLaTtL25uR2lyXgyzfM8SuLAypCuELpqlahxebFYaY/2ULQSgL9c2NbFj7b+VIwxgd0MK1IURVRZngfYZkBV4jgej4fXrl69d+9exObo6MCY6DOf+Z3pdNhul5nI2+32eDyuTX1VhJhV5LHHnvzDf+SHP/qhj166cvnkeBBV2UXrXGF1HrNl+DyvH5ah+mLYPu8mNe4uPLeG+YUb6nxY2fryVTOhBCFp3DNcgcogv3p0ZZxPCi/O5zs7O4eHh7/zW7/9Z/7z/4yJxDsQoQraHCKholxJH4bmO4PK9SmIGdmwIXARpJHMUAHFQOfS4+87PZP3vO9337o36W9dGTvvCR4Oxik7hI2gMqkhMqwlPz3brBAD4AaEK602SdOG7UWZaa0B3giY1ODC7zu+eLOwXT4OM8hhUJ1wj7mszwoSYiks5ePBveP9l/sdf+cLvwEaQyeAqzG7AQOFAEGrXcG2BwkYZKEeFEE94Bm2B+3Fm+9vb9zc3N5r9zfFxoVqJlpAbBxp+bKGYUg5JAeQiqt4E7CNpQVtESYpKAvmzWgqGJ6hbMMkLQjJv3KwzcFWhgQQj7ptLIWLbQSRPBtHJGnCLh8Pz/aRH2l+Nh6e6OQEKIz1QC6+3PQANWzXZgdr2H57UBSZovA2Slzhr918JE3b7U6v39+c5FnhvLXWxpFqGUclMnF9YXNOr0oUH+jNjPF9Oac3B9sAghiz4rBnv2VuzbBwMxOXC2tVgau1lywzM2fZtNVqMan3fnNzczAYnB2f5Hl+enb4/HPPxlEcVN0AyDReRzVJ02yS2yj6kR/50Y997GMf+shHDw+PAQSdbnB/YuagYr8Atlfid/1bn10IR1NXrgtXLl41pjb/XFm5lmzjAWA7oJTMN74Gpwa3zSGsDRGlkT0+Po7jOEkjUnzqU5/6c3/2PxfviUk1mN+U3F4Iee31YebbatiGgKlMXkEolbAMAlobve1Hpy557/u+6fbd043t64OxcwAZEnZKHuSIFGDWCCAOMVDrqRPeOtiNl+AVFtlzLMkrqS9RFZKlAdsULNRgm9KjldPjy4Tt2eUN3bZ6CUNvrQ32/6oaESLvSfLx4N7J0au9trv1uV8HRkGfXfcwgAoGtAwWW6GCQglOCSaC9zApfAZohLgHF/euvLe18ZRpXWl1OmxTB3IqUhoP+PBdExlSJkRGLQDhEnceELYV5+84VzHc0HL6zb6RVbDduOciBpexu1eYqs1ge/nRq2EbYF/DNqTKn80KX4hlEDxcRsgIeTY+nY4PaHoyGdxDPgaCJ3cegkLWBjpVu9ew/XaitN2aTiZx3Mqz7N3vef/+4fHjjz9po4SIJlmuhCRJAEynUyVN0zS4I9HixEbTD58bE/1Nj/DFyP1lwPZsKQxJjFHusv0sTpkoIMw25Cli5hBdLdwh8MRpmp6dnbXb7e3t7YODgziOLZvh6Oz44HBzs/9bv/VbeTHNs2mIeBDWA60SOQS7YgAf+6bf88N/9Ec++MEPR1G0v7+fpmmd/yrothdgu1ZsL79XXXklfs9tsObvuXzD+qpm4tQvB7Znq14F2807zMM21waPZaHzaRoPh0NjTLuTjkaj/+X//Qt/5+/8ncHJMYAoMqrqXA7AsvHiH5rb1llw3+asNmycKGBAUXCsMJ2NzuZVTXZ3dh89HUy2d66cjQsvFKfpNM84YkBD/mYom9KXqX7TEOd3xm2Xr18em0a3NGF7VlJHUiOaCcwDbINXwM/CDGmOV+PP+8M2Nzu0ISRXP8MqERd2mQlrqtnk9O7B/qtbXX392U/DD0BTiG9siZp3rfN6cZVaTRgigBI4gRSAbQF9FNHWI++3nb3epSc9tcCxwipIOXDXKporSbUdj4xGUENkhN3DwjYqS9VmBzaRu4GgEmC7MZkfTretq8Kz1FeBwopxbnDTFbAtHtVSJQTVkJ6UDSEfj5hdN2UphkdHt7LxcWqLydEbMj0NTDVR2WxTaU4r4sbv2pL87UBMcRzn0+Lm409MJ8W73vX0cDTp9/ujydRaG9x1Sj0lh68UqHbNczN7Hrbrs1/mCJ8H3l8ObNcfMGMm+FXITBLupbaUjqLImCjkAG3CUlEU3W6XiPI8b7VaIf6MtTYy9uDeHWvtnTu3vvjs50V8yCQPLeN8AYiiJHh/Taf5E0++60f/vR/77u/+bu/9aDQKIVRrk7QaDqlBK7tiecleKF/oED1Ht918RP2+K3uyhvaVsI2lhYYqayxZvEkJbyF6z8KOQQrHzHFsnXPT6XRre+Nw/+CXf/mf/PTf/lvj0QgQY4z3BYDIWOfdw8F2AFcqeabmGyrAJhIYeAMytrPV39o2rR3TvjFxttPrT6dTUW33+sPBOG23vFclDktk2WMa9iihQ4Ix2ozbRgUSVMpySthu5p6vhqyE7dlWrAHbTFEj9/aKcV8YuPlp8OZhO0Q+qMIuuZCQIKYiP3rt4I3neh2989xvgQfABF5LEycAYAFrHSO2bpqAUBtbCgCycB6IY/gE8eXO9pM23rl0/UlJ2wWsV0OICDERKUkQzQs5QwoNaVosIQagxj8kbM/C16xE7vlfTzNBdFmnyT2XX4Q2kXWRdaZzymvYXikkPwe2hVRIJeidvGoQ+ZBCnEtiwzLJJkduclwUp9n0xA0PMD405InISQBso2DxtWazhuqavuEwGyHr+9uLhNjGSSdh5l6vl7ZaCs7zvM6J64qCI46TWFWn06mxEVC6slBDnx38JqopBQDlt/CQ6+gC0Spx65dDpd6xskurP+Z20nIuL4pcdOZZEeLJMHMIHhJCwpXpvJhG00mv248SHk2mSZL0NjbPzs4iQ9u7e865y9fo0t7Opz71q84Jc5Qm0Wg0MsTW2rzIABSikY1eevHFn/7pn7579+73fu/3Jklyenqapmm/3w/a8SYKntc/F/x5Aa2s2YT8hW6vgaRe95vAf94jHnzsQhqi5j1VAIKHxkl8fHS8sdHb2tq6dev1xx997Pu+7/vu3bn9z/7ZP7v1xmshf3NwR3zAZy00s0pVsbgeiQiIQAZpt7uxmXa21HQyxLbVH+cTZR/HPBje6/b608mYKQUAREGkAFKFU/hmFLPy7SrHmnqtJRLVUilDolRFFKnOKxGRAqql1zsFc8UyoI02Rmehz9+qz6e8/3znhI8ihDKNosh7Px6dHd19ZWeDX//8p0Ej0BQBQVwAaKtNvsVUYnJFtXOaZeT0DiayPjdmY6/VeSRKL23vvUtMK4cr2HEV7YDAUKMCy2xAJKIE1TAAX+6Lr+zMZiFRHeEWCyVzn0ZzVl/YqPrmqvqgX/I8qRZa5ivzAW5UFQpVbw27Ij89ueemR0nsfHGG7Bgomm7xREaD7c/c87na1H5jxjZ923HbIUmwXL56LUrSdz359NHRSb/fd855La2EnHNCMosGClZaNXyNrH/NHbo85Csvf2wrP7+LAUMpTDMhMvPLMTeQqWJhGawQcaPh2enpaZ5PQ4oRBL2pkgSLUYJl0+70+r1eq93udrsAF0XRarUnk0mSJIX31loq03tHSRId7O+fnBw9++wXjg/2AaRpnE8zhQ8xM0RFwcSRiqSt1rd/53f+0R/+4ceeeGI4HGZZliRJzaXVr7wA4cvHy7/31W0vX9VE6BpHQ3S2pjiuCRUruW0AC/XP47aJSGTGuGsjR4sxpiiK2FgiGgxOkySB+jRNfZH9N//N/+0XfuEXRJw1xrl8JfTejxqibAggNXNhYuMKBSLqbnc3riStzTjZ4HR74jtiY2tUkBduEnwrCJapDTWBwyMqU3wqSchfXnPbtXShNEYDNTo/MNSGKlvxeodUS86V5qeBMoxRgJTBWuvCV86NhQkQXvR+3DaxcCn5Jy+VbpuEvNNg4pRlI8PCJMOzk9ODV3bT8e1nfwMyBCbgAgoSsAZUYMAIVOFmFmnS8PKqmieAwoJS7l6yrb325mMb24/bZEuTVoapGIVGrFa9DcERmEFwQUmhQfGBcu9DEV3MbQeNeJmUlakONlxT80tZ5m5r3fbstjNxesUQN3TbWuqquT677Ldd8+igmXdZ/dCKFw9ceMmLa+3DqznDoYpmCnAwqu+0orOjO5PBAcnAZ8fZ6RvwI2hmSeChABmA2AWTSsOYE5IrIKU2Hd+I9JWH7QVJHyrjFyCyUeEKAMQQkTiO89yZtHvp8vVWnOzsXUrTdDQcB2X2Au9STzsRAZeJL0N5kCevhIcL6AErL4DEMhGH7SSp6ixIJJPPxUYMZS8FaQhMBeecMkVRFLEpXJYkSauVDganR4f7d+/e3ex32+1WlmWHh/tnp6elyqo0fbJJu9XvdONW25LxqknS6na7W1s73U6fiJxzALE1HJksy9I0JaJeu3NwcDAcnp2eHD3zmc8SqytyhED/1fxXMJuIQc67D3/ow//HH/9jH/jAB7IsE8J0Ou11+6PRKE3bIkJsbcTiGmEoypVoheduDQ80b4bQBNQmADTZ6BIh5kuaeu65AaJFpG9Wm1+tAECFaD7cW3Mxaj49WPLX6vyw3gUuRNXHcXzv3p2//bf/9v/3n/4ynAcpkVFxzGBS7zWOy0A3VAWNXz1/iFRDZwVWTwgkrF6BKEbU2bj0KOJLaWvPm55qRMYKQOplLgEPM8WorKSrIShF3Itps4OI2zQEb42YAWzn/IzLA2VtCslriQgxwQiBlepAqAuTgaoZUNkQXPTdaYMAQAgFR5ElI4VOhbJwH1cgNanLvVGJWRIznY4O3njtuW6c7z/7m8AEyEAFqrRd1d3rTq/+KRhWJIBu6AlAGRSB+zA97l/ZuPRoZ/s6tzYEidfKop5MQCai8kbMZUokrTZA9Vak3i8uYzYRgYgrhTNQuqWt7BmsmM8SchwsGOTWjuykutilQIBbVV9FT2u61TXl4QrU1vu+vE6JGpuSErbhVR1IAO8lYwaRgRep7PGNunxypsVZMT7JxwfT4V3kAyCzRmsddmNarAzQ9I0oG6/pawbbFixVmEadjYHtb1/u9DZv3LhBlZvTcDjs9XrLeZbq+bSwstc81nJbmti8sI6fR8sVygl9XrSvIGvUsHEuPTaJKGw7GMTMFDJuKZiZLHnvxbmtrc3xePzqqy8zaRzbwenpZDKejIciQqTMLPWMrt4sdJAKieDGjZtElCbtjY2tjY2NdrsbxzFbO8qncZrEcTwcDjtpB4Av8oN7+6LuVz/5zw2TMVwUU0DSNJ5OcxtFRVEmA83z/MqVK3/8P/gPPv7xj0+LfGNj4/R00Gl3VWk6nbba3eOTw363M/f2RG8VbGPV4FaPWAyfMhudh4TtsNwsw/bKFoqU3Go1y4JTqgIQcRsbG88998W/+Tf/5m/85qfVuSRJs+kYEMOzeKTMSNL75Oe21pKyeEdAZCJRzcRRFKvw9qPvHhV2+9JTmbSFewpjQ9hIAKW3cd1sA2CeewYAmEUHrQDbtYY7dOIMjM0szM4czJho7ib1/olmftuVP/fMFK6qU5r7hVV/ZSc0h6MJ21ZjQIUyhwzswQRliGFnjcKqT00xHb1x79Zz3bZ/45lPQ8aETOFLyXj9BisfqyDYEElFw7afAI1ALdht7l/b2H2svXU9avfFpBlUlSzZ2nuztlNB7e4/N/MbE5UXp27dMwvzmR8WtkWIF/1oajCm+f5cvFz8ebANQBvyyzLzhyjAEKpgm8u9bAnbDlAnBUEAZhVrTESAy7UYTwYHxfgoGx656ZHmp4RpiPT+jZk/+2Hpawbbho0XHxhurdxkOxub3e72xtbu1atX8zwP+qrRaNTtdkOSpfNQtrm2nldngYtaKF8J81jxYSw+cakpilJCXy2FVOr8nHMMiuOYIEVRMCSO4+l00u120zR97rkvDgaDre2N/bv3BidHbIz4ekUO9sCqgLXsVWqeP5wMD2Nju93uzval7e3tTqcXxzFZ02q3PTSo+tpJW0QiY1X18Gg/SaJP/vN/enZ60ut1BoNTAGmaOifOuTRNp9NpYBeuXL36Yz/2Y9/0sd9jrd3Y3imK4vTkbHd39+TkbHd3dzg8W+iWZurGeYbsbQrbMzhpnKJVPmkBbOo7N+M8M+l0Ot3d3X755Zf/7E/+mVdefBFEEA9IHMd1rLQL+OxmnzBIVABQGZ3LcLqxffnm2RTXHn3fYAqKukJp4SUizGC7ZOdq/q/WATde0MydpVpx3YBtavLoprTaXQDvGrbnh3gG23V5xdw3wto0+pnPk1rNR8WpjyM2zhWiTlnJQIUCw2eVjZeE8+nwzsGd59pJdueLvwGM4IuQNiq82CLNRX0IHQ4CkYFCJSAXd2B63L7S331s69LjnG4WFBdgJfbQiM3FsL0wFs3OWeEp95CwvXQQQjjPedZUXee1EoCj8WnM4bfMOOkatht1wjHXoviqZhB919+XCooQEA0AqVFViGdobBTq/PhsOj710+PJ6MAPj1CcAVOCq/VBa9i+L33NYDuYGRg2gtIyPIrj3b2rNupcu3ETQIhTOJ1O2+12MzHiMiovr7lacdvLlRfW4uWleYGW19mLYb4yap/jtkN97z1E2YAUqt4QMVMc27PByRtvvNHv9yeTyZ3XvwQFqBRax7ElojyfavlxsNd57XzFLakApXzCRFHU7XZ3d/a2t7e7m1semtgojmNmWxRFbKM0Tdng8PBQXfHKqy99/nPPJGlgDWfLZZqmWTFVkSRNiegn/+yf/8AHPtDf2jbGnByfGmOsjcfjca/XaXY4zUSCswZWp8LidR/YXujq82D7vO1XZS3wcLC9fKsFlXZ9eZmEYwm2VVwcx6PR4OrVq88+++x/9Cf+w5OTE3Wu1jUGm8ogNKrd6paJ2QbPb2PIq0IZiGxnu7dxferiKzefGkzEJF3Y+Gw8SdMUvmE2HDyvdOYeswzbZGdBTKkhJD+P2668uR4YttnUXYoGbHPz/o2uPg+264GYRxcBuWAUHWyMfSHq1BAnhslNhie3TvZf6reKu899GhiBMniPBdf52eaGG0Ult0oQJTCjxGxK0d6Nkp3+9qPdzRtxZy8TmwlTFLM1ImIa4u4mbFcls5nfLA8HTVF5NVJzf+IBYLvROSU8r4Tt0Gk8XxmN9S2AKyrYLhs5l5hEARIfVm+naCK3znIZkAicqgc5gNVFrExwFo7JIx+Oh4fZ8LDITtzkBJNjIAO7EvaBN2nH+Q1GXxPYDsQBhKy13qlCL+3t9Te32p2t7d1L0+kUABEVRdFqtbIsa2ZwUm1aQs6W7/M44+XCFcv9A9AD1QyujeVblsY+ACBqjFEvIR1nCNaR5ePheDCZjJj51VdflSy3aeymGaiMiY1K9lX323ktaLgqlSX93sbm9la729/du9Tv9piZyLRaLSgHbXen2xoOh7dvvxFF0T/7p79smL0rAHQ6reAY1u13hoMBADZGRP7oH/2jP/CDP7S3tyeCyWSy0d+cTCbNbU0Nz8uMRQ3n58H2xSVfOdgmzIn0mw+tne7mL5/jtutbxZEZj8fW2k6nlWXZ5z73uT//5//8ydFBmsRZNtFKsRJ2b8HUfOU4RiYO4UvZkoiCIm7tbOw+qrrR7l2ZOmuTHkf26OR4Y7c/Gg3iKtwQVfIMmRPJLvpkl98RL45UiDHe9OGuQH0m4q5gxszuU/ZMQ2Ixl6u73EZQZdRWlTeF+fdZguYxyXlMQZ4pIjLqWJ0yOGZYZKdHbxy88Wy/4w5D/mzOoG6WP3s27wJgh7erS8I09jrzBGNQgtZOe+N60r28delxE205tCcFhDhKUjLsvWPS2k/6PNhe3vTMHS8JzNHo//Nge7lzApXwTLMKTfZ6nnteZLupykQy+zrmEoooQPCRqoICMPs64abWmQNJVF2QopNyMeHIxDF7YErFKJ8eZ8P9fHyUnd6BHwM5ULFkVNnvr+l+dI6C9qtCIVlTsCkj5k6nk6bp9va2c67VaoWcVJ1OJ6Q6rrkuNJaVZuECKs/WkaXCBf5gueZ51KxJ59DKx1HlqhH8sG3EcRypymQyGo/O8mLy8kvPieRgcdnERqZE61X7DNOghfsHBI1jtpYBORscf+nVV15+8fmXXnjx1muvj8fjEFeciFqtljHGO/XeP/HEu4yJfuDf+UM2bnOUsjGj0ajT7Rprh4NB2mohRJ5S/aVf+qVPfepTr7zySnj67Tu3FhT8TVC8787pPHrAXdRCby+vXw9LC21uZmxrVmhWa87GAMaqenJyZox54okn/uJf/ItJuz2dTlU1TdOwDwtjdIFvmPPOGENsRQgUUWe7s33NJFtR+9KkiMj2lOLDo9Pt3Z2jg3tpHCn8csPOe8Hl4y9nmFbS8iksTYw6ZfuD3GeuPUyAUgiAU4gUYohjRoRidHb38O4LG109fP53QGOYHN5BMKfPBpqY3aCK40SN7gxuobXT3rja2bze2bhK0WaBNBcjMEEy4b0r3GqRyQX9vDxMK0suvu0CLS90K/88b6FrTuPlS5buycH+rryKA5wrSMp/c8RJZFNLhhX5eDw8HJ/eGZ/dy0YH8EMga2L2Wjj+4PTV4rZ1sSA4lgQjK2Ojfr9/+erVzc3tdmdjmhdRFAXeJY7js7OzVqu1ctGkhgJs+ckXFC6v+Pelh/uWSjvbOQkBM5MKMWJjCTI4Ob13eEe0uHP7DZQJpjiKorwhPjVsiChEarz4gSGK+2IrmEUYoHarffPRR7qd/tbWVrvd3d7edip5nnfavZOTk+3dnYODewD/i0/+8+ODO51uZzQ8AxAltshzGxlX+E63PRqOAXzie7/3B37wh65duxbU29bM5bcmoot12wuWfOdtmJY3QPXQr1x96k4OqUHo4bntheeuZLVFRBvCXtaZgNE5t729vX/vTpqmxph+v3/r1q1PfvKf/9Tf/Bvj0YCNMcYUeW6sZWbvvfjFwaraw4BRBtQi6XR2b6SdK8o9pb5QizjKsqzb7xwd393e6Y1GA2uTBTl/lSBkLhTu7NXKoKSzS6TBhZf2wNT0S2ys6cFhe060OwvbEkqCyV4zhEs4MBypaghvOT8r7k+zUSNxfmQiq54kUwYlhjUf55Oje699YXfL3nrmXwIDWIdiOlt4akgIsV1DN5cnl5yIiACCbVNrs92/0tm8Hncvm2S78C2hFGS1UuMGO/9mothlbvti3fbcgZmtFc3OP8+SfEXn1ELyBRFnw5SMwn4JM+XO3E3ur9sm+ASAogCcUA5IaVAsQMVzQ72qgMQIEhOTcy47Gw7uTs5uF+MDTA6hI6Bc5cK8q9J5foNbiD8ofc1gm8l6FWti510UJ9dv3tzc3Lx0+cpglKVJazAYpGlqrR2NRkmSBB5lJWyH42VUOw+zdZWR+crC5fs8BHIvwTYze18wIY2sNWY0GuzfuXtweHc0PlWSki2Y9yCG6vIOlOZNpZp4Fi7iMpDcrCmhk5lMkiRPPf2enZ2dbrff39r03qtQu90eTyetVuv4+Hg6HX/p1Ref++IXvHPEUCm3z8aydxInUZ4VAJ56z/v+xJ/4E08//TTRol/pebCNmXB18XWW36t5oTaik14M2+XZtwi2a4a4vrbklRuOUtyQ6Bljjo6ONvrdKIoGgwER9Xq90WjwP/2Dv/8P/+HPDM5Kw72QuwXAeeuTZeOEgAhJv71xOe1eonRHTddrLIhU1VpbuGmSUjYdGWMIdt7LqxRZ3xe261eTZnDTVbA9G6OGh/f8FmFWubS0XwKwIIT3WPx474vc8x+dZG4cxxZiJCsiQkx+eHrneP+VhEbHL38GchpycdaKa4cmbNtSAF0C9rLjrwUZUIx4I9m41Nl6pLNx1STbYjpTZ8CJiSwRecm9LyLDcWJdITXreTFsL7zswus3Ybvun7cQtkMFVqiqqFtg8R8Etsv/+wgAyCmcoJhJ1EshOZFC4UmUIAxPRaZuMhkdTU7v5qN7cKfwZ5CJZfgQoI6AEBJGeS0lf0D6ysP2Uji6GseJDJP14h997PFJVnz0ox8dDMdkI8yMEoHF7/Yi7Hxwnnu5wgJszFrbKG8erNw713WqkD4znsblmbW2224Nh2fdTutz/+YzkbFv3PrSklipvtF57V0O77fc6NlNLEe+DAvMAKyJLl+9cnnv6tbW1tWr15NWZzQaRUlCpZjdv/7ay4B88ld+BQy4AiTdXi9ouOMkKgofUOfpd7/7//Bjf+yDH/wgOFLVMrcYERFZGweJ8UL/NE3SVi7Ws5XqHKF3c00M91+QwaiqjSOsmjy1H/9CfcMRVrXnvO2dNPSy5S5QSjF104sMgGFmxv7+3f/h//nf/9zP/izCTqwSq5wH3hxMx7l95cZ7kGyfjWnj0s2xg8Jm3oEkioxlFXEqDmCCoQp3dU6HagAI5hhxBBEz89zsDeFlGlAdeKbyT57jFOsDXnIkCw/1jbi31ROhqqYhlak1vqEHlvE7CDZCJrpasxBCLUVRJM6RImaNyY8H9+6+9oVuWhyE/Nm6mD/bzb6FMqIKAYAvTUdKyUGlj6IY2kHUi/qXty7d6GxcF9vNJXGUkE2VSJkYHnBMEiANlNTMtDbmRtOSHA37AIPZy8qSJfn8lihsMBbDrSyvNk1qOiXOlwsqbhuNHW0VFwWqq03SGh+LqIIRvq8CpIKiqszilMgYMi7Lg4erJUAm7E+y0eHo7N50dITJIfwQmDBCYpLS9LaMZlPmM/9GTA3ysPS11G0zw4uPW20lc/nqFQUnSaspvlve79d/XrDuP0ghVq3UD1XzgrOrKou1Nknj4fCs121/4XP/ZnNz441brwcJ21eUvBQAmDi2hhnOF2+88frnv/DM6dnx669/6eDw3ubmZgglUuTe2uiJJ96VZcX3/2/+HXi1URLHreHZiI0BkGeFikRx3O50nnv22b/+1//6Zz/72ZAf7OjoCECSJEVRUBVZbJl7rml5uakBb1mgEiiATX0QVvOFmsvPrampT12u3wTy8+6wTAvNa14egmM7527evPnDP/zD3/P7fz+AGrr0fDcwhW70N7a2Lw9HeZ7h6pVHjg5PoyhhhrHeUA6dFG7iiol6aWanXbnRWVm+8LLntqRxduXBKvKqfrl0oX49FsstrwuDKiHP8zzPQ0ZOVbXMKNSqiSExFePBvbu3nt3q4eD53wSGwBiYYTYjAuy8JVrVx6gwm0CmPAABFCPd5u6VVu9y1Lokpg/qwLTZJFqaxHtAKKTyrPn1B+vD+y4UbyFd8Kw30Yz5vYUAAtIKXBlgUoYay9ZlLraRFK4dR/DOIJ8M7k4Gt6bjfeTHkElQZmvo7LmhIcAC9msLSe8U+hpw27MTzCK8e/lKr7fx2ONPqhIMu2K217t4JVqmB6/5IBV0Xgu+sHKdh+ULwVPDRCei2EaT6bjbSl9/7dXB6fHJyXGeZTN30geWvj/sgFU7WjCxUm1nzsT81FNP7125lufufe/9gLVWFXmeG8NpK75161YUmV/8xV/w4tx0UiVaoDiOZ6p35ccef/x/97//sY997GMhVSiA7e3t11+/deXKldoXoEF19Mi5Hls+vu+fWBqFJm+38qpli/ey3C+KK9FgtZc5m1q3vYBGlkoesVmo8EkSjcfj0Wj0l/7Sf/nMv/7XUZq6bKqqFT+0KIUCYEx689EP3D3M2r2btrtNUXdUFLDqqSD4MoSkKNQYE1Uc9myP25SZV/KeWWqQcm9auXXNSoLems2sbzHL/UUNAXvzKi1PzarJnMS+IXGp/L8XhmDxEVXfWmtDZt7yQaqqSgojbNRFXIxHdw/vvNSKxvvP/hYwBE2gAoUpvTgYiBTiUYSoZQBT2cceITQ5gRjKgAOIgRjRluk91upd627sRekGma5QLBx5IoEIiSEP8gQhUlYBGNSaGYrzooRpQbdNRHWg5dmMnU+YRnV+glDy0Nx2GLvF/US5GVraSzWTnzYtybUSkjfWvUqHTSrlhV5L1y+GwOe+HUejwWCj356MzqzR6fDOyf7ni+k+JgNIDhQgFwLHGgWqZU9gFQaIAAWqVXFN59NXbWuz4kEioMimadru9EycFOK9W4HuF28Pa0xoHi8sChcXLl+7ULLQjGbhcknzVPM+zhdpGt+9c2s6HQ+HgzybGFPVfGDMfhNUG3uLlqEIjaE4tiruuWe/+Gu/9inn8uee/2KWZSLeGBZRV8jVK9en0/wHfuAHN/qbABNZY2JjTMDsYMqbpukrL7/8f//pn37mmWdOTk729vZU9fDwMOQdOW/L1aTmWZrntmtUXmbdmhzMymVr5dnm4Dbvs4wZzT8veNBC/eYl9Z/isb9/uLW1tbm5+Rf+wl+8cv16MZ1GUbIsw1y428svPbu7s3k2OJiOT4GppVz9BD6DFkxqmSK2hkidp1WMb7MfzuvA8/rzgrut7PyF3+U/l4+XTy0PfWCviSh4TATpBYmP2Flkg+Nb+7deaMeT/ed+CxjC5hAhnYGBgnUFr1AFpq3+VgQcstAWkl3bu9buX003rkTtbaW0EOPJKkjEg4ThAmYDwgpShlpe6rfzXnCBlguXK6+88MFpeS1aWWH5E1h5XM7qwCPTjNUOsVakcElkx8Ph9kZrPDjoJHJ6+KXJ2e1idA+TY8gUKECeACIwlxlbZg8BFnKXrekC+qpx21gcEiYI7Vy+0u9t3Lj5OEcxgQWqvrm/u2h1Lm9zTuzxhcKFPxfWZZ1XZF58Q31gbrv6HsJaIkT60nPPqvr9O7dDJHBi9Q85UR9swIIfKqORYoWZ53jOEBVSCaBv+qZvZrbb29uXL1/t9jfu3bsXRTZtxcPhmffFv/qX//L27VviCxtFrihsFBnmLMuIiI3xTlvd7k/+5E8+/fTTN27cODw8TNN2SPSJBlgyc2kqpX5l19WwvVCyTFoJUVeWY4l3Wa7T/A2mUufVXPF0JqXqrMyZB4oIyWxulBkkLWXZJKTDeeGFF/70n/7PhoOBFEVlerOC2ya2IhG4df2xD7xx97h/6Xrc6iqxC8J1MsZYhhGPwgtHVmc91gyxUvLZmF95peFjXfthM3MdYkVVhcrUZ0S0on+YUFmMl4Wzrp6Zwi0OwZJt+QXDhGqmhjaUmE2UkLbgB0e37t15vt/x+8/9JmgIk7N6dXWCEABcRU2uAKbktk0IvQkIcW0dZ6FtxNut/pW0d9VuXDXpBpvUCanGbCMl8lIY6wEl9mUuVBhSUmImWydYbZryoTG6deYVImrOkLk1p+G9PXeWFvVoD7JSlfLnym5mNktLRnohTGk9n2e67dD/jOYdtC6vr1IpRx1etMi67Wh4st/v8sHdL+XZ2Wj/VRT78BMgmJ8FyIeZJU7FgkuernXbD0BfBW6bVz9FFURJkiStdqvVyvOcbdSUv9V0ccnKswuF592h+XtB5YVvbOHLfKDnMpj5jdde7Xbb+3dvp2kMhLXxK9fbizLJSoI7638bMSBs+Dd/89dv337j4ODg1VdfHY1Gu7t7RJwm7SRpGRN94hOfuHHjJsi4okhbLedclmXWWmutdw5Anud/5a/8lV/7tV+7d+/e3t4ezsfUBZ5s5dmFwuWxWB7rZV6neZNAC4O48ERago2VYxMMoVc+roaZpg7eGJOmaZ7nw+GQiJ5++um/+lf/L71eb/nONTGHiBkFuHjjlc9sbvLZ8avZ5DBmsSDyrLkWU/GuBNZldvYBS5oDsVy+fPly5eVhBbRGhvMGZaFkuVo4psrqsCgK5xwzW2vZ0PD0zuG9Fze6sv/8b4NH4AxuhtmhCwVQiK5wI25skrj6H7XQupR2r/X6Nzu9a3FnW23siIU47DNBQuQBZbjSdyBYt2kMtbW3SPOllqfTch2smmPLJW+CFhaohfYsn8WqBi98YoukXP5DtftTabei8fConcq92y+KnI6OXkJxCJlQacFXvZpClBXlPwDBEo3hGQWtMfsB6Gup/+92u865ra0t7z0zO+dUlSuqV0BuUL0gLpSsxNGVULqAqViasivn63LN+z534fjs7CzLssPDQwDT6TSO4zJ7MkDg5r+H70g+/x84pKBCqfICgQ2MBQEuLwCI96209dprr3zumc8eHu4/++zzxNzrbdy9e29rc6ff3zwbjr/t27/9Ix/5CMDTySSOIjTcmlvtts9z59xP/dRP/eqv/upLL70U4Gqhc5ZX8IUVqt5TNC+sVZvLVy0vgsvjshJy6mqohPALjVmu3Hz0QgNqKs2suIzlqdWeIyuKrZ1LKJlvee973/vjP/7jJo7PG8vIJgDa3Qh+AIxOT19rpzI4uTMeDTQXoxFrTGLhA8vLOgecEtrVeAtBI4mTqtYxMVSVNMTZDSdEMYe45WvCKzxIZgxWSTPrM2h5lyBvqM2P50zPxENm1mrnWaU1Byh83VoJV4qiODs9fOON57f65t6zvwOMwFmQjVc2aKhsmqT8e8bFLYMBgQiccmu727+ysXWj3b6WJDvCtiDyABlD1jgVSG5ZGY4ghNBpRGKhETRq6u8X2n/BjLrgYHmmvTkiohmyNgvnj88rWVgklxuJWd40sGrElGdjw/7u3Vem06PTO89BToER1BmAZjJxBqwKNxgMAYSrRJxrehD6KsC2rPhmCMbaje0tV/jt7e3M+TRpVTG8TI3NNULXa/HCn8uouficVYULFYAVSH/BDS+4z/KfpMIEUjk9OrRMp8eHxjAgRVHYyDxAXomHpbq3S5/URoRUBBsc8fAOqqXYnBmT6RjQyXT0hS98bjwe/Or/75MnJ0e7uzuHh4fW2m63S0Q3H33s93zzN4NMnrskbgVvHGvtZDwAeXWFsfzX/+v/+td//de5kZhy/pv3Td+SZToPJuslfmGtx9JCecFYL9esU7bP4+9Fa2WwJ1rAuGZrw53rpgLIsmIwGLRanaIohsNxmqbf+4nv+2N/7I+tFIoAyPKs1UrGowkAGKfjk+lwPzH56PSOy84i9nHEtlQEhF+BemqYDpWNIamxtmoe1zZJc21eeuPwms0s9ctAom+KylzM1S9ESSyJJZ2t4GE34JwTAUTJOyuO/SQb7B/dfnGj5d/44m/CTIEM3ocpHfpD0NCOrpgIgrAFAQArSIAOzEbU2k16e3Fnl5KO48gLh8lrjCFS+MosLry6moU184IveGE23nd2LZNWG6+HuuqCxgiV+WaqXwFEyiRy0nBbNSEjKZEhBSnPLMfJCVfJGNWSWqNsFKRTg8l0dEeyg+zwZWSnyIeAm8W01Vl63Ll3XDpY033pK+6AVO+hrLGFn+Xh8YWo0pNPPjUZZ0mSeOcjY4lIoLMoJbXP9IKJUBNcw++8vLTZAFW9ELjLmzWumrucmZo3qQ/OQwhVsnGUZ5M4jiFevbege/duRyy37tyDilQhqYuZzfxDfJarJvfKyxuq08abNS+v3GFdvRI5N/385357c3s3Sfnxxx/f2NocTYbWxK04MlHcanVMlH76X/1LgAgGIQcMCwjqRZwC9FN/429s9bc+8pHf1e51oyiaTCZE2m63B4PTtJ3WZkZVX5UNIaLKlwb1ilsuNPNc+MqFbx5U5jKJ1dcuX1iW6MyPuZ48RBQilS6AsWoICVHqUMvuLNlBApRKF3llnung2aZZ4clEsUnOhmMm/qF/93+7f+/g53/h5yQPFgO+CnInACaTDAAIVIBYOB85J8rjTIteLxqOYVsbTu00y6I0YQiRAqxEQbetZWSwsG9jDYw5bJlZHEIQnkXeVmiZdDwchg7j8isFguYbIJRhVJvSDPDMLoQak4qpRk8qY1+G6GnwQT4tCiaCWnXWmIhs4SQTcjAEwDuJTKIO5BEDEbJicDK482LPTo+e+ywQYmz5OgGeaPV4rVSm9WhLcNf2DTsPBlugC9Pl9l57+5H25lWY9kThNGdEEQwU4nKArSHAqBdwBNVStk6BoS9QYl3ZA9VS4VVRBheqGgEtvdWrLOOkqpUNuZYdVc/MkokFEUkZPqW5YSpPle+yOKt9OF2Nb/WVkYKCKEZDQ0U0+F6DRJVVmMQQWEOSL3Go+pfApfc9csQZ4BVwU2PRMsoReZaBusHg5OXTo5fd6A7cCOLKNCQoN0qKSrcNbrxNxV3U7cea7k9fcW67no7OOwDMbKyF8vbe5SJ3vY0+MwdfbWvj8+NizjgkmidgDkEX6i9fcm47L6y/fLCSlBCk/WGrLq5Ikmg6GkL88OzMuzxAVAlFTKt4greELorDdU798M8VxfT48N5rr7788ssvvv6l19I0zbLMFdJp99JW59KlSz/wgz+U5YUCadxSEdWQfAyGQKRM9Jf+0n/56U9/Os/z8Xgc8lwRqTGGmaOoTFa98PhFTjEQrRBK18fNMWoKZt5EZ9Wov7oZS8TnLy3LVzHbSoAUvIDKBFx/5I/8kW/7+O+N4tgV3rBxhVSVy2kXZL8sgOTw481eXEyP3/ji71y53Mvzs2x61ut3C5erllacq3TKwbqnfi8KwuzlV17Ra40N1PyuaPamTVpwi195EIgav6pa+2cXReG9EymV9nmek/qIJTWaDQ8Obj+719eTF/81MCJkBD8nU6XGQQ2FJRo0wsWUYl0GIkQ9tHfT7rUo2fHcdhQ5Y9QQAsCV/2pON0h0zUy0O/PbnjXjTTHT53YpFr6FcxKTvwkqldHlrzQNV2v/SUaYhvWWWliZiIqiUNU8d2nSZqJOKyWXqRuNTm9Nh3f9dB/5AD4z6g3KAIQzAXlJq7puRbU1nUtfcdhWKBOjEjIRUYjBtLu7a4zpdrtBpkpV7IsFPF7AYFolJ19G8QW6oP5KuuARK++/cG2QHgNQ1ZAvPM/zk5MT51yo87Cf91eVVF2R3bl963Off+bwcP+lF17s9Xre+9PT006nc/Pmo5PJ5Id+6N+Nk2SaZwpAUcdDU1VRAeS//W//xqf+xSfTyG5u9pn57OwsSZLxcJxP87qmzgsAVUmrNaNcs+SidXABZZsDtFANq9bT5RXz4kcsPO6ClixXI52V14vytWvXfuInfuLmzZvGWq+iUMNRrcuv30MBERXvT47//+z9d7glSXYXiv7WisjM7Y6pU1Vd3T09RmMkITdGmpFDM4O48sggCSPgXbgY6cLDPUAguIAu774P3uPx8d7FPwESjDCCixxCfFczciMkjekxTE93T3tbvs6pY/bZJjMj1np/RGbu3Jm5d53qmS61OevLOpU7MjIiMjIyfrFWLLM3HPTsRv/Rj/7m2a1RLzE3966MBnF9w1hVVVBhcyUSJwjEE5RQ9YboIriTr/xZLkpZgH39QTw1vKl4B/EiTtWXyC3l7Ut76iIFJNe3PEQcm1xpLpoTKbNhNeTZCBsRkjzifHZ8Y/f6U8O+XHroI+CSz66b9mopH1eE3dxCTUQriYFX8gvMNgmikelvb2xf2Nq5K+ptEaxXw4iY7JLhf0tMXR8P9cgZS0OxhrD1sVFXzQ2JQSmrkbMxTlYNqpKaInRadWjnwVADtVQJ/0lAIuSUnZJT8sqLA0qR2XRZMkw20+lsc2jn0+uQ/aPD5w5uPj8ZX9P5GJqjeCEMNI3OT+lzQndCJU1rerzee/E+SL/Pnj1bfPu+mDVq09ZKCmXWYbKNqW2O+ZbFrqni5FQsUUmYWb1EUTSZjr33x8fHuctRk9ZS6VfrpUaVmXc2m3/8/o+Ox4ePfOahJEmSJNnb2xuPx+fO3TWfz7/zO363ggA2xngHKPLcDzcGUWwBnU6PfvTH/sUv/tL7J5Px5uYoz3NjTL/fZ7aB0Qp11Of/KqVxgtacFX5KFzXu6sTsNQCM2qTZmb9976qiGpNvDagKmk6n29vbP/RDf/VNb3oTKlE8TNU/RBWzC1UveTo+2OtFFv34mU9/omexOYyz6ZGGTWtlgKuFjipUupXM0WLKG311W9ToMdVC97FdYPcbJ3E6E5qzEWutgVUHzYS861tKOJ8cXN29+sSo564/GvygzYF8gdlLPBqX+mgVW1yqp0FKv1wM6qF3hodnBxt3DTfPJ4MzbHpeI8BAF9IIrBiKa954+2qjhM4b15fWyHnyzCcnUksalUMIFR+srEIheLZXEiUR9mASF/WjM7NJtrXRP7x5Kebjg4On3PxqPrmC9CY0C9oGRAiqe3pHIObVRncEtqEiYowhU2yZnT17djqd3nvfa2azGQBVZWZRrUPlCVXPVmFzvQGd+Tuhul3F7SI3SCJjg4JuHMf7+/uqelRGktDSDCtg/EtQKqQilomhLk+Z+aMf+tD+/t7jjz2SZ/PhoBccj2/tnN072P+u7/meKE68J4DZRHEvmRwfO5+FZfyN69f+4T/8Bx+9/yM3b9587Wtfe/PmwWAwStMi7FWlh7yodwWEVFdXnSw1fgVXvf6uVbd04k37UqP9J6Q89yLyhV/0RX/qT/+Zc+fPA3DesTVaQp8WistFfjYMnx/vXrnnwg40vfrsY9vDSNyMm2OIg9BCoBJ2U4P+Fwmk7HNVqNLyW6BCcL3gvEuO2TeOwHMvVN5IIEoarH6DLoWWh4SDUCqgqVQHxKu63E0dUg/nJXdO1CkBFmqQTg+v7F55dLOX3XjsftAReAJyINFSblCykkywxS5Nsdrhhbh8wW8yOMFguze6a7h1b3/jgkm2PZJcjBdSMQCjChq9PFrWvPFyJ6IN0r4tP+8c0iQaeO7FJKYI8klu7KKRao3vr1FNq7+D2uLnmoxaLYtlsQtJAImyKKmSCEFIPLyQCIsQNLfZsexsbE2O9oZ9t3vjUfLXp+Nn4fbgJ0GHP2B2ePdd7Tmlz5bu3N52FVIpTpJzF+5mY7e3d/LMw9iw8QmSRgzpNfh6e1D6AtD3BXHb4UZrrapnQ97ns8k0zWbzWeETrTERvNid/wKICF48M/eTOM/mxpoHPvmJJ598/IEHHjg+Pr733ntVtdfrvfGNb87z/H/4xm9Oen1rYoCzeY6A+hEDnq1OJ+N/9a9+9P6PffTKlSv33XffxYuX2z7D2+i45qR+vmYXo0HtGbNRdWeGk7yp9asErXjokniZjIkODw/f8Y53/PW//jeSXg9EwQ4eBbu8eCMEiE+jmAF/5enH7nvT64iy5578zGbPEJyqD9i8rPtdPiA8oKpe4aG+Zce1RO2eaV9d1XsA6qx8ves6Sy5LcswCEskdnLeEHiNCNjm4ev3KY5t9f/Wxj4FmoHSFH44lM6+SWk5syMD0aXC2t3H3YPOe/sbdUX9HeZh5dr5wyCpS3zg4KUuNtYN2/e31k86hi9Xjdk35t0PMlUN2LSUTJBXMi6oEXltJVUkUQqPhMJuNN/u0e/VxdTf2rz7qxpcgMwAIJoVS/wROzbo+9/Ti720TeLH5yVCGsUR0/vz5PM/JmjCdBd9NbFZyz425r/6zynzCW05CbaPwk98bnjWKouPjY2PM/v5+1RsEGCr05OVFMP/67Ek16Ij7NE17ceRdZqy99Nyzjz32yKc+9clLl54fDHoKRHG8c/b8vffe903f+C3OaxwnNkrCVpb3OYDgD3L32vW////+e/fff/8zzzxz7ty5fr8PoJrdl+sNKVzf4V4zPVFtmlsDLY2T9qVVGRoNWNOYxqVWtoKtaY4iw7l3zgmAL3/nO//8X/iLNk5QiqMqHWAtN0oJUMmJBHAXH3/onvPbMr95fHSDxZE60hzitbSe0ppNdlGQBB/agS8Mjs19mLBLDltUfcVzl5vfgeEv+dtiLeBVPbwj8WFGF3UKH/7WS6ufiHpRH5jucCLqRR3AzNaogShDI1bJjyeHV69dfOTcBl997GOgScBsE3yXUh2jOezqlIcyPMOjPAo2kwx4wL0z/eGF4cbdyfAu09tRO8o0yoSUDRkWeKjjxibw0ttcWMDX04tVg3peVrMq+79p9EiF5nshrqiOUm/A1zu/exmxUj2tbSq2is+uZ2ES28xBYYnHWhykGnAdw16k6djI5MqlR9LplaNLjyK7CckC3Jcy8UpG9FLkTF4B9OLDtmoVwzHMXN77yfH0/PkLx+NpFCVhCgvrzfqqs3HShtU6RlILuds43Wk1WFEntFfbz+1WrSIK6peMKDKT46MkiYKEPHx4hEWZn7sl8+eSuPzQCZpmaWTYuwxAns6fe+65j3/845cuXQqWXb1eT1Q5ir/ru75nPkudcyj5S6DQU5vPJ8fjw7/zd/7OI488oqrOuZNo3q7H1DoDVwfsKsJjI/MtMfuWDTj5jW3q9CsCIBgBjkaj69d3nXPf+I3f+H3f930AgwyCtnltCyWMGO8yJgEcJL387GMXLpwd712DpiQ5SuQuhc+qGtimAgBAqupJfOnAcqXMtv5Tl6mOAWXakoaaiNT17xonbYKocxLEASxikLOfzcbXd68+cWaES49/HGYGmcP7gNmGyiYsQLNYe5R6aiIBXyGFPFkjoA8zsvFO3Dtre2cRbZEZ5UicGgWzJWaAvKpn06F99tlT49WvyrOiz5cK+ZxTbfuwYrUBJahhZaiFN/BMSiQgKPyxZLt7u08cHzw/v/Yk/BE0NwxTaKAZFkvBeRwJTEsOckqfC7oTe9vOZVTaxQL8pV/yZcwcx3Gv1zPGQCkIyYN3LbQUyIElFhzlyA4pWkJFhbvVcG8zwdQSVFYUSm5UVE/hLh9tyzLPQJQkSRRFaZqKyO7ubojSqCIEKNR5Ry+fwex84YpBvJ9Pjq9evXzz5s3r16+r6nQ6tdaeP3chGfS/4Zu/ufJNK17jxAQT/bDb6LPsH/3v/+DXP/hrEZs4joNScZbNe72eqnLL50ngucuje8qrdNDqk11DQw1FE5qd3eDU65eqAjujgjaE/PXBWeWvhqWWKpaN2lUIyqpqrQVT3EuOjifDjc1v+/bv+N3f891QJWOYixCfUVTczsW9JXL7+e615wZ9Pnj+CZ9NEqvq55aFVLw4a5oeN1lBUGKwoaqzASEqg9sv7V4rl7vdpB7i1OcoVMFFxYt3QV072IgYFAczRJ1K1+FdWFUYAkPF5T7PfC6WYsmUPeLIRHDT8fWb1586M8KNJz8JdwB/DEgZ1KuMX7eE2cVwCHBbXF/sbrMZnkV0BtGZ3uju4dZ9ce+sUi9VIyC2hi15dV7mxDkbL5IvDZIaX1v1WLlp3eH5J3Rafad5YUgmS9wzKUqFgKVCQs/Xh3TwLlf4mPNSqgig1BtYaCqUs4oGWV7Q5K8Nb2ny/eVEp/AQgXiFD09hYFzqiCISG5seqzUaWTYWeZ5fm0+fmR0/r7Mr0DE0g4KlUDIArBTxXBAs/XFKLwLdCdiWsNVBYXQhz/OzZ89DWZUa5had/HQnE9yWkzcuNQrEWin6LandvHaby4cV53NAZseTPM/H4zFeVpFtVjS0mBYZ+pGPfOjK5YsXL14cDAZZlhHRzs7OG97whq/8yq8cbWwESVqWlhOEKlRtZG/cuPrP//n/78Mf/k3nMgBRFI1Go8PDw2AGWkffdt2dl07CfNRvbDMxDW7mJOWsyq81KVEb11dR8OZrrQ1eb3d2dr7ne37PV3/t16kT8Rp60nmVwo9H8NevBBc4S5+O0+lBf6s3vf58Or05GkQ+nxp2g9h4H3w7C4JIVbShNoUVvdq42tUJC7Ft2ZU1APNFMJV6CeEkrMhDDPLK4NMYQx5GwOIiuPlkd/fqk2c3+erjHweOgRm0vsDlZU8dCyWqArPDFm21KCYAkXcRknOj7dcNRndztOG0l0vkPClYSISkCKGtygjC6jVvrLtzTjiKblnOSS6temu3bENnBgr7IKSB1S5AHFDVfjLI574f97J5ltioZyBZJtk4P74yn1zMZ1eR7wNp0D0TAWARApyfxsx+8enFV0mrPiEiFaHIpml69uxZALL4IpnIBGPLinmlFoPbhvB6eh3Lb3cnu03tik54oyE2xAaUpmmWZfPpFIvpu8PC8qVG2nKFUC7kZTDoTScTVf3oh35jcnz03PPPKLyX/PDwkIje8pa3fN173wPDzJGxFkAUx2wMSFye2sheuvTsv/iXP3L//fdHUWSMmc1mzBgO+5PJpGK4izYUJ9wYnw3gbMBw6P/181fjljWJa0ponDdqb7SnXYIUKuLGCWZpTiZK+sPcq5K59777/sQPfP/ZCxdAGG1sABBBkkRuuV0lcnufHs+Pb/Y3o/HFp3x6lFhldZCcJVfkhdPT4FG8/oyqgeUvDax92Oeu89z17dUqpeTCi11YEQdR9QIVFQ8Ncmkh8SSeVcLfcEKVCrq4sBPMEIgjFfLeSDY7vLZ/7Yntgbvy6EegY2AGgLSKEcKCSBd2wPWBUfDZREDl44MY3Ee0AXtmuHXv5s59yeis174XK0VsNGEIw4McKDCatVhY9RNInedernfpWwlXy1ErjaVS4Lwbfmmq9Hq95X65UlO1Yqku1eINlhy2qpb6Y/VDPamvyqx24mnBfGuhPR7GrYKU1enmYDg+OBzFSd+IZtMeZ9Ojq0f7T02OntXpNbhpoc1fkAHsS3JKewXSHVoWETOUQRgNN7zXXn8otFAlu11obNOiorVs+m0V2EhprAxWVKEgjWObZZnCT6fHQSGYmV9GDHcndhk2s+lxv5+oy+Mk/vCHfuPKpctXrly5eXP3rrvOMfP+/n6/N/iO7/zd4tU7hbJ4iPdxkgTkjiLz1JOP/cS/+3cPPfRQYDSrPRHvl7ZI0YLSVSjbAFpa7MW80Gdfzc3Uq7vl4uCWFYlIFEVEJCL9fj9JkslkcuPG3t133/vDP/y/bmydOT6e2CgBkGcL2aYqFMIUAhYLkOv8MJ/eTDajG8882otE8qmBh3hudCNKsa109HBnt5/w0tI7kqWfdaoHCgpXRcTnmSVnkB4fXt299vhG319/8pPAFJwHNq7YGgAU3KVIXjoZWGQL/yxoCLtD/bv6Z1872Lpg+1u5xJlnr8xsjTHQXNVBc4KQAlqFuOjemF//ilflrA+ndre0y6znaSSuurezqE7qbEz5uUu1YtcA4tDp0dHmoGc0yyb7W0PcuPyozG7MDi754124SbCGL9czXKwdENYRUryP6u8pfU7pDnhJAxkwM1QB7OzsDEbDwtALTMaSsSUcKvNKTbR2SufP6t5OfH0BQF7fvV6VUk9UVWPMeDxW1fF4HNqzQmm8yU2+JIhQupEuKLRSxQOYzyb9fpKlKdQ/9NCnn3js0clk/OSTj8/n08FgEDQVvvXbflcR2RAM5SxNrbGAeJ+C5NMPfOp973vf448/vrGxYa09OjoKgeCWAYDqPdOY7xrtXZXYuLd4uNZQadOqGfkkmU9O3vs4jqMoCq49syxT1SRJROS1r7nvh3/4hwG43Ce9gVdEcVzxWQVyGxgGkVrr3XRvEGtvFF18/OHNUZzOjiMbOKhuG9+Khy457EL6reqLvdJyH1RVA8te6HjV9MMLdrnyzlHt+NaOYGdc1OrzII8N/tQAMHNsif1sNr58sPf01gauPfEJYApKSV3NTwcL2KOMRQYEyXl9WxsoPcAJoBY0RHSuN7h3sHHfaPse7m/latMcXkGGiRSaEzzBUdjWBVgJGkGDTnX1OPUXLZUAuf7ql3evF1Tyym3t7qYYo614X3Vpe0sCxT5FZ0ydxX52ec1Xy7XGvVX7lSCtJRnUZ+ksidlqlk33tob6xMMf7kfH+5c+g+lNZPPKLV0wzRZAIAIncIqs2rY4xewXie4sbDBvbm6f3TlvbWzYNpBvDWH1njTXVMrbiSevYhU2r8nTro6oUK8bHx/mee6yjJjrdiMvAyqC/TUHRgWk6WwaFto+y55++umPfOQj+/v7n/jEJzY2Nra2zmxsbA0HG9/0Td+6tbXjnY+TPpSdc2wQxQYAMT5x//0/+ZM/+fDDDw+HwxBCg3kRe7yNml0zVNPOtQ3qtanqheBuvfxGG9rFNgqhtcuCQNZa51zwd4vSq0Ecx/NZNhptvva1r////oN/BOJ0nvWSQZY5JstU2SDAe5Ug4XZZEuv+jcujQUQxdm9chebMKDa2ZXkeX7vN3+jhk+RvJ7ZL0NqWQQgcFx6WmY2l6eTGwe5zZ7b42hOfAE9AM6hAqvEXVJxC6A5X6D4tqFyXLLo+yMZ34v6Fweg1g9G9Jhl6snOvwoZtxMyizrkU5AhBVh+0p4tAnO19mfZ5+zEbt7QH1aqh2Ehf1ZNryumsrpPao7f9HlWERFS9IbVw2Xw87OlDn/rNzYG79uiH4UtbL12OxUmk8IpckS9cz9bX/qf0OaU74iVNCnaTmIloY2ODl4lMYbfdwNo2+rYZXFrmpE+O06tgu1Jr7+Sq2zjdoCiKRGQ+nx8fH4dvg2tOTF+S/HWNagqpDR9uAYksQaFRFLEhYw3EHR4dfPRjH93Z2XnmmWf29/fPnj3PUXz2rgu//be/G+AsTfv9PjNEkGWeDOI4BuNXfuVXfvzHf/xTn/oUM+d5WtsULjyTd85E9Rkq9Da6MKbzydbATCN9Pa2aQ4vWl1Sl1P1O18kY45zzXpmtMZExkRJPp9MoiiaTyd133/3GN775b/z1HwZonqYAexUwVcgNFNqcBCQRgHz38rOvv++e2bVLvV48n025MABDV4iRBkgEL+I1ECp9qFVcXWFeXEYIrb2twku5rFgfAKh8e1XZiBSQNJ0dHe7t7T1/7lx07fGPQyfgNDSs7LEIiDREKWQpPJYW43PFlhP3EG8l/bODwV1J/+4k2fEaZeI9FIZh4MLeP4ThQwhtAIBVsSoRYKvX2+il8lzWYFGbRw/byUspLT/khQ1C0A9vrQnq+9w1C3WEfetQGiuqneyy95f47MYbqf/1gC/fPFRVvahT8YY1SycG6ZOPPzDsy+VHP8YDBzdGCCmhDJgQ3xNAywx9VQ+d0ueGXnQQ4eAdrDCCwjxLrY0lzLrGVnNc44S6xNptkF6FoHUWHKs59cYt9XVARY0Squeq31tPMaA8naVpenSwDxUVx7WN7WWRWVuA9pKjSsxXqBsprLF5nor33mXMBJ9n0+kHP/jB4XAoIlevXr3n7te4XDY2Nr7+638nGzubzYKwVhXqkabTfq+vLv/N//Zr/+7f/PiN3eubo2GWp2VX3J7Cc7O1t8p2Wwh9W+VXl+pDYk1+51wURcEEbjabEVGv1zMmEpEo7t3Y2z179uzbv+LLf98f+EPMURB2qBK4coFQLqQiTCbOGjUWzzzy6XvedN/+jec0PTQ6Nz5jyYvVl3KllB3UkVjBGpyuCEGKTcmF0LuDC0QLVFpoTSSGxFBhuSeqwYW4KERFoBoRJQyWWTq+cXj96QtnzOXHPwmdAymcMsMu1rYqhd+u8KvRhUEJXItnggV64CFFm9zf4f4ZjjcQDXyhrUbMUJU8n6v6KCqjsmp9d3ylVOwk4+qE6Y1ppJ6tc6GwJltHThJhJ+yEpNSI48UBVLi/2IeiHJQJhc/Tko9ZDIuSnzOO9/efZhzsP/cgTCaTQxBMLRwKwRBRFU8FWNKzfWmq3L4y6EXvWGOMiKgSm2i0eeb8XXd/5Vd+9XSeEpngME+piA1MpETkW6Z+WvKsjaViGP2Vi+96Zm0JURtEyyLQdoYqMbitak/0zBzmrKBXVZyT9hL7/PPPzmazxx55OJ3PAIniOM/nLxt5UfcUWbi0oOaVai6gwXD4rnd+1cbGxubm9rlz567v7TLjyScf//BHPgSXgySKbZ45a2xwDRbHcZZl737Pe/7aX/2rXkSVvPfD4Wg+y5LBMMsyl8tg2As+19rvi1tea8IJGa7y07JieTVjLr1NXfKyh+Xx0B5FVQntzJ35/fInVuVf5YYlmPx673tRPBwOL1+5+B/+/U/87E/9JxPHPkuNZfF5kZlgDGQRVoOBiONB0t+MexuTVO65702TuU/FeiQmHkZR//j4KI5yCiHJwShlXMGLuRCKkCRgIg5srqkv7FtxdUut7NLHDizLAIByribzmCuckiHYiPvsYZQsiUGaTvd2dy+e3eJrj38MNIfK0uy/6K8w5qphJksGKACBlFiVQTGiDR6d622+pr9xD0ebufZyJ3HCQsIKXax4FgssVgiByCiYlKurSnUPToxyvGmRUh8wi9Lq02l5dclfE9HiIRujrp1YjLRSdbdB9RjHFQmJcC4UtuotqSUlFgbApI1Vq6oKZRpPmSF5rLnNZ5SY2Ehqae6za5Oj58Z7T6XjK0gPITlUqK7yvngjp3Sn6UXntkttLBbQxsZGv98HBw/kJojHG/xxWy5dcb3tMY2a9lmnXL1NWP2ptFnnRkrjlsZJVe98MrWMLEsDT5S79EXp2ReJVuxIae1vjcq9D+Y0TT/4wQ8eHh6Ox+Nr167t7Oyo6hvf+Mav++3v5jgZbm7nmYDI+4K9C8GMP/Lh33zf+/5VMDLu9eLxeBzFxrlsPp/v7OyEcN1YsSnYWEu1+Zh1fEkrWxuAV2H2mjL1VgR0LAGXiMmJj6Joms6v7+3e85rXftO3fPPb3vkun2U26XknYRMhiqLIGl/TgiIIkJObITv286PNPl+7+FTMqnnaiyxDD3Z3+/2EFKwSxKpBvqqqQZ2KVStXWfV1yS0fZ6lDVNVDwyqWKSifqqo4H0KJROTy6c3DG8/esx1de+JTwJTUlerctRFGNX0KSBnXy9RfgCKovTE4QW+bR+f6G3f1hzsU98XEGhnTi4XAGhBaChvl4lUagIW4FMkL2IOX1MqwtJxa2QOrBkO7nFsOjzUD5paJqlqqsLWgtJKeB2k2AFTuqnyep0SkDhuDjQhsFW52OD26Oju6lE6vIN+HzKAuLCKWI3qdYvZvDd0J56bV2ZkzZ+ob23V8pZa4u7G1vGo7uZ2ncze6nr9RL3WJ4jvvWtMSlAsIEZlMJvP5XEWstVyq0L+CScUB6l0Okl//jV87Ojo4PNx//vln77rrLlXd3t7+mq/5msnREQBrYlUiGAXSPIvjOE3Tn/mZn/mpn/qpOI5DLMvj42Nm3t7e3N27HkVRe54qKu2aOrECg9dMf41s7cSKaJlTb7SkUYiWLttWTbUra1H43BFRkJ+nafrGz3vzH/kjf+TMuXMhiDuAwWiYuzzPveEw8GoBe8Sl6Ww+mxiibHx4eLB3/tz2bHIwneyfu+vMfDpRiBC8Qog91CupFPCoutzJ6kmXO00cliNNBQvghY43VDlXkwpyEVFhaETewrMlhopBNjveO9i7vL0VPf/YfwfVV7Q1z+IVhCsqvXEq+WwiEAdtCwtE4D7MwA62esMzveEZk/QBcpKruLCJXukDGFAt1lbpjqaT61VAmkOo3hEtH2RLeWopTZ/knYPhtgit4V3vQxYyYkiZNVi9K8gTfHBcHw6mjOFAnohI+qwjP9PIEMssttM8uzqbXD7cf3ZyeBXTQ0hT3HVKv+V0JxSkilcuMhwOB4OBluGbKuBE7ePpBN1G/gYDvQabTwLenSjeuRqgFsA37gpeRFT1+vXrQM1B5it40AcwEwcqJOi/+qu/EuJ7Xrx4cWdnZ2tr68z2zmte9wab9J1zxhgtWSrvPTNPp9N/82/+zc/93M/1+/3x+GhnZ+f4+JiIgk1UG+o6U+otak+Ljavte7WFu+sful01LQtgblnCmpKttVmWGWM2Nzf39/ePjo7e9tZ3/KW/9JfnkwmIorg3PZ61b6yQWyR32fzG5ecv3Hf37HDv+pXnhn07SszxwY04Cg9LAFc+VlVVPCpNwJKCfXczHOQqCCl/e0GmlBOLiLgckhuIMcKG2SKfjHd3d5/fHPGVJz4NDsGzC2lc82hKfZb8mpaqixGoh3iDBmeHo7uSwRmTDMGxKImIiIPmprUPSF1is8YDrklZNZw6e2lVnvVD97baUydWJjHsDXsiIVIP9QhLB3Ja9LZXdYpcNYcoSxJpX51G8NlsV/LdydGz0+NnsqPLmO0BKVSKfcKiklMO+7ee7qheMzMnSeK9rzOpaEm/1wBtJ5teL209WlML8tvQ2yi2gd/t/PVsxpg0nY02Bnu7u8QswUznFYzZANSfObMFiGEYY8Q7QD56/4d3r13P5+mNG3uj0WgwGLztrW+/6/wFKIkELobjuOe9FxFr7Xw+/+f//J//wi/8QujPXhRPjsZbow2f5Z0qyovKa+DRxpJ6tnr++i1oAM/aqXbV7eGkMaQbAxIrGLsGEVEcx6oaQtEPBgMABwcH73rXu37of/lfEDSiAQC9Qd9L0PsKwstCQxtQwAHu2vPP7pzdnF193iIlmWk+NpLxktI4qRY64uXP8F8ARglexEnr7sCkiGFV92FeeuNS9V5moCyYBogQq4kpTmxEeTo73j/Yu7i9yVeffAA0BwXYXvDVBFMeweU5aOHctPBCyoVUgIKeOZLNeHRXf+PCYPvueHhWuS9ktIgPwBQCfesiohdKHezynXqUQbY7VKgK7e6F6igBvHh9xW5xbZg1ufCynxfW0tVbbpysSifSSrBfH1p1z+d1MmKNWBJLBbctDMdwgCeWwh8cvKpAcogjifIZzm1uTw73hkl27fKnJb082XsC6XXouAgfqyVov7KnspcP3QHnpuWcZa1zLkxJDUa2Pcet56E7gbO6fRULvqrwBiS30XpVkzpvybJsOBwCiON4IYV75crJoyja39/f2NjwPncu2KnrbDr96P0f3t3dffTRR/f29l/3utfdfffdb3/72y/c+xpVYmYAzrmgVhO6bj6b/ciP/MgnPvGJ6XRyZmcrSZL2lNSG0kBtQG0nogto12RrFNjO0zip/1w1KVe0Kh0AM6dpGsdxkiRBaLG5uZllmSq9+93v/cG/8lfz+bzXH0J5Pk2NXYRcrHTdwsERQ2Y3Lz/72re84frjD0fINnok+XFdyh3+V1VVUinV96iEZHTscLf7fLnDvZdM4Tw8AwZkiC2UfHZ8ePXgxtM729HuU5+GmYEyiF/2jll0QOihrqlJgMpvkQEn6G1Fw7O90fn+5l0UbSn3vVonQaWO6v47V733zhOsfr+rUlaNycZdJym/naGz5E6CL5ZYVHg59Qrv4T1EmYQW6nyVhZibpWeGw4O9KxfO9p596pOJnRxcehDZLmQatidq5osvA8uXVwndub3tfr8fYBtllMwGcrd/trGzE3TbuLsGttdj/xpQX9OGMAuHAufzeZ7nwCKc9qov86VvxX0Sci4nwng83tjYgHomNZYB9d79xm/8mvr86ODm9eu7m5vbb3vbO975znee3TnLZAEO/ZMk/Tz3ImBjZrPZ3/27f/eBBx64ePFinFhmOLeQk69pQ3PyWit7XFNUe1pfOT/Wigop7Z3sNW27ZRuIKIoiIpOmuXMyHA6PxmMbR+9617v+9J/7c/P5zCQxmLxzhVe7MhY2gMCYSj6DAdg9//hnLrz+7htPfcZiboOPkeAnvGqTLB6k4psZQuIZWvg7C/GmJEC5r5mNBc5XUIQHFWX18PCiqgZgcfn8cHp0bXzj2fPnentPPwCagnJovmCAl5BbSil5ddKmCNznZCMZnBmMzsaDs7Z3JvVx7mKHSNSUEeCcioP4hal5ALTQw6Ks1bso4pQDqIyPy936pcjZRZ6yu9EFqKjJ95fftQBSBbarTLEbKfWjNmZ87WiWuWIoiZAI+bCf4FXCu/VKXknASoZUBgkf71/ZGtATj3xsYKe7T3yCbQqfQkOIF3A9uvdp/OyXBt052AiOG621a6C6DahtmERLEt7JFvMKCo2hLlXwqqkNPKZlySe1hJ9VHiKazWaTyQRAnmUA2BioEr/s4XkVqSKKrLU8Ho+TJPE+984Zy+J9nMQPPvjg3t7es88+++yzz87n8/vuue/r3vOeMOkYjlQpz3MAxloREe+Px+O/+Tf/5hNPPDGbzdigitTehsMVjenI0E7shN41ZXZWrV1Tdie0NwB7/YM457a2tvI8v3nzZr/f7/V6k8kkz70x5ujweGvrzFd8+Tu/+3t/r88clGCiFXJLARQ+heTg/NqzTwy2+lcvPWmQGs1CKBMU3kmLGHytxwkBSPySt5ZlXytlRUvLF0uWlUWEJGdk8Mfz6d7RwfM75+2Np/87eALM4FMARKh9FrJ8aN3VAYAQLFABhVWOYXsm3oh6W5xscjSCGaSeHCwoAUfMthDmU8eLbrya+rOvGT/t97vqbXamnLCcBpFqUyuwVfgSkaBYMoiQgLySCIkPwWcUXllhoIaIiZgNRTQf9vIbVx+Fv7n31APARObHhhCXuvwALHGwgzuVkb9E6EWHE2NM8GW4s7MTxzEzDwaD4NOxDrrBN1nhq3zZAUugVYCNUspabGeVgQpoBXHLD1o92ncjvdNjWnU1OERj5iiKrLVxHHvvjTHPPvtM0usBIGZRhw6h6CuBz64oy1wwxS7ttcS7DJAsnYl3DzzwqcsXn5uMD3evXY/jeHtr53t/7+8FyKtEcSwCG0XBQTeAOLZZOvvf/tbf+uTHP26ZQRJeaJAbAwh65mumV7RmyZBYBeGuxobWvIWEPFRqk9VjdVcLwVWPX5WmtR3uKn9jvdhobWOtSURBq9EYMxwOQ1TTfr8PIIoSVc29e8MbP+/d733P29/5TtT2X+JeFKbYfj8BYK1FGd8TkoIlmx1G5PdvXIyNpJPDyIo1YpkYYq2BaNAzUFVVKfhgUQ3byVocIVIOQcPOs4pXlbD56n2u4gyxOBEnEVM/sbFxeXbz+ODZ7ZHcfOYB4Ag6RRVOVEuRd4EPlfsUD7jQfQIsx+JkcAKNYQeDjXObOxeS/raDTTNl7ivZipsOd1O5+KiCW5Oi8NpGCtJKt7ysTSq/YwZUcN6AqnKILR5U0+vzCSmTFjaN5eY3EwX5BFW76kFQ4YvuKrUQahoDZXrjqPqqdgjEi/PivHpRLyGWOcSrFtIRDy/kHXlH6sMGNRlQ5B0xxyLscsCLRe6yGzeufnr32sPTvSdh55AMCqsIfgAYFoikFCt0h1Y4pTtOd05IPhgMkiSx1mqpSd4G1M7Ehui7zkzf8q42UQv+0TV7tottpITnqsA+lONcbozJ89z7QmYYnn1FKJFXONkoApCl6bPPPvvUU08999xzFy9evOuuu5K4/4f+0B+GQkTYGJfnUM3StD8YZFkGwDn39//+33/kkUfiOBKXpWk6GAzG47H3/vz583ne1FNb1YB1fMmt8rf5m3pdnSXTMrS3S6Cu9egJKcuyOO5lqXvuuYtvfevbf+AH/ud7Xvs6dWLino2iLM2JMRz2Z7O030+cC05YpHBeKTNxM9bMkLv+xGfuumszmx35bDqfH/V71mVzEccLdbbaE2n7qZfcoBYwX34dIsIwRqB5rvl0Mr6+f/2pC3f1Dy4+DEyhOYBa2Kh2YGYJLtVQY7cXDSIGIlCC/s5o+0Iy2lYzEFhR45WCAGGxAnuhU1vjda8ZZqsu3YIhbhXS/tn420kryhNV7+EF3kMEKvBBlZzIZJn0eoPpZG4Jw8SSiEuPjm4+Mzt+VufXkB/CTwGYYjnFhdLfK4vHeGXQnXC3EliN0WjU7/dDyKNg0LwKktfjbv2WNYltLF8FwO11wKry2/Bf/Qzi3CzLQmwM57JFF9BCX+gOd/4dIKoddbKWXeGyVNL57Kmnnnzq6SfG4/GnPvWpu+++G8B3fOd3eudU1UYRG8OM2fQ4ji0guUv3bt74+/+fv/foo4+ePXtWVYmo3++HQBTMrC1GuaL21LZq4mvcXp8rb+uuQHUkXnNXfbHYqG75ORZzZdhrTQb98XSSebdz7tze/v7rPu8Nf/Ev/+C5u+/2WSYixKyCoHw+m6VRZMq6CjAWycSnDM8je+nJh/uxejfZGCbjo/04IstA4fAkeCNXVS3Y0HKjV+FLJy3CpW65SnBZKgRV8eKdJZD3rOlsfONo75mz23ztiU+C54ALgF11kwRsrZ57eQAVmG3C2OLCPttuoL8zOnPPaPueqLflwLkSuJS6QamuyL3w6IlqD1hVa0rlRSztuvOZ+hssdM5rPHfg16sgXZUkv6y0tdNcZ5OXx0bnaEEbuWmF/7iaD9p6IULlkFluTJrmo8FwcjTuWWPIazbtc3a09/zBjccm+89gtguZLBvdmXJd9UqYpl5hdOdeSRzHvV6PmYMkeRWmhsx1TK3DcANZ12PzCSG/DeSdoN64KzxCONdSN945lyRRoatScuS34qxemV+FBK+bJHGS2Mh4527cuH79xtXxePzEE09tb28bjt79nveqiHNOSkuwYK8cFCAef/zxf/O+H3/yySc3NjYCh22MOTg4AGCM0ZZD7FCvtjgVrMXgRjZ0IGg3/9SZ2G5A+5b2jZ3lNGg2m+3s7BAZVZrN0pt7B1/yxV/2J//kn0oGIyirR6/fDzIdIuR54fwkvIpCB1tzl8/OnRlhun/zxsXNYZxNj/qJSeeTOOIGYqHUUFsVQhvlR1oF9VINiO4M5en05vjgyvmdZO+5R6Fz+KxSSy4r4gVGKJYBoyYbVwAMjYAEdpN6ZzbOvGaweYGTjVxM7iAgZibWhS8ReFIhKVXkZWlgdL6UW3Z++/Y1Q2L9kOvM3M6/qorOhq0nEiVVyzQZH270ezE5PznYiN2VZx7Mxleyw8uY7QNp0OovVxemhH2ptjJeNu6ZXwV0RyKAlaOwcnrFy1t9dGK77TWJa+5dX9RJVgDtxCAwoHI3NAB5iEFZLHJLXVN6hStyLF5lwXMHj1aKKDKRNVk6c3kOyHR6/PDDD+0fHR4ejx9/6kkh3H333V/9NV9TqeyFTVzvfb+fiLh+0rv//vv/2T/7Z7u7u71eL8TbMMaEHfT1k2PH5LWCQss7J9bioVbk7PzZpjUVaReoL90cFLEAAN6JqsZxPB6PNzc3kyS5evXqu9/97r/w5/68eB/H8Xw6s3HE1pApXIxoqVseHI+pdz6bXb/89L2fd68c7x3tXbFWXD4f9qPZbAJSbnUngm6a+GJ3NkQAC7pNPmeIgbKKiFP1xpCNWN18Ptk7Prhy105y4+nPQOcERwqjMAWrzYBV8EIQ3hk/uxpdGoESRJs22UmGF/qb92i8kXmbOvIaFs3euZSQE3JCaG0Iy12Fzahelm8I+cuXpJWGed17WvH5h6VGEDkUe7xa7Vh3vU1peEar11KPSF7f9l7afa/yVE1tRfSq9dbSExUSgvIvRKFBfVx6xhhJNTs+uxU9+uCHE3M0uf4E0iOIC93NABVB1FUBhVM4qQJx4hS5Xyp052A7z/MkSVAGBVmDkatwtM34duZfz4uv57bbJ40bK6qrxAMIzHee52maNvhrkVf8YO+WpCm8cx4oFFyhmmfZZx588OLFi5cvXw26DsPh8Ove/V4VYebxeByQezwex3E8T+cK/dCHPvQTP/ETk8nkrrvu8t4nSUJEYe9Wu5C7M72drT0Dds2JS+nNp1tO7MzTvqXzxlt3MNDv94/HkzzPR6NNERHBaDSaTGZf9VVf/Tf++g9nWdbrDVzmxXvxS5hBVCrNQQFHkl1++pE3fcEbZ4c30snB5qg3PT7u92LSJXnvmr4NtPAAWNfwUEnnB8f7l85uJ9efeRiUEjsoLELUTQskQFRgdIifXQTvWtrn1sW+i4FJEG1w/2xveC7pnxUe5pKkwsLWRDEReZ/7fFbjtt2ik1us9pr3sp7q4wS1l9geA+upUeaa21EKPNaU0/jJxepKg7CBVFmUvbJIzGTV5dOjzQE9/uBHz27o7mP3M0+hrvTtTiokAgV7wBcG317hFG3z+lP6raQ7JKE11uZ53uv1AuCFDe/1susG+q7J3EbcNbQGzjsXBKuo6L5a5gDb4/EYKCTjxAyiLp8Sd67nf6soisg5KMCMJI7CflucJAAeffjhKiR5v9/f2dk5d/68qhLRbDbr9XoEWDaFZi/zz//8z//cz/3c3t4eSplNW8WvjiXrZ8POyXHVbNiZ55blV5eoFki8nkir97ZXxefO83xzczPP8zwv1B6V2IkkSfKud73rz/6ZP5+maX8wCLu5HBjuMrinQHzQJgZUXH8QPfnIA69/4+vT+eTypefO7WyrzwFUe6Vdz+hL42ZfbdSqaghNYUAGlKbp+Pjo+ObV83dv7j3/KJCCc5UiRnbhP7wIoc2ownEWMUKoQPZFlQAYJkE8ivpnBoOdZHA27m1lYnNvFDGbBFT4Ho8sETzBFxbk6incHoJ3LY+T0n4a9XBWqtrguRs+yNAF1au6aw2tHz+NwptlLu9zdxVCpEG3nVnCSbE3YcVrnsaUP/7wf0/M/NLDH+2NINNdqBCYEaka1bCfvTBeL4JnU/lGXvEMyMuE7gx4cAjfGSVxWJirKnHJcBcn2gbdClOxbIrTieiruOROQm32bIB350kbyMM3w8zGUIXjzrnJ9LgSjNcn6BZJ6+SVQgoAeaYBO0SQpnnohiydWRsBeOjBBx577LHRaHTmzM7R0dF73vM7oihhtkRmPp+zMdP5jImZ2TunLvu3P/6vf/7nfy6JDDPyPDWG6v22mD1rnX3ryXRJZal1sYXEnaWtKr969Y1C6iPwtiiO493d3a2tLQBpmm5vb0+n0yhKjqfzKEm+/J3v/Pbv+K7ZdG6jKIp64jQ0gtkA0FIRzBgYi9l0CoNnH3+oH2MQ6ZVLT/UjMsgJwlrx0CyFfbeAfDCaUoISB68dTBbK6gXiLTmSmZvezPYvndnp3XjyM0AG5FXU0mVz7NC2+sM1dcahACw0AvVNtGH7W7a/ZeIhxQNR8mX0Ku99nudECGK8eiGCIHG+9ZvqpMZb68xwwsQmlaseDU8dVkDl32L1UF0NNmTNyCpBKk4AszLAYf+eFSAnNBOkql4V5C15y46NV3KzGNPx/vOa3th75tMw+fx4j4rtCYP6CyFayAvbuqan9BKgO/BOGICx8du//Cu+6mu+Np3nXtlEVgq56WKTJgxdWRo/S+eN1WiZvrRK1Voc7vbkqKqVQ816YiOlcUvtZAEVXDELhlTQH/Smk9mnP/WJJx97aHJ8ELyIMHMVDrzrk34VRqstAraKF2PtW97yli/90i/t9/s3b95U1Z//+Z+HirHsnbOxcVlujPGehoPhZDoh5r/w5/9v3/BN32iMOTw8FMLGaDNzPs/zXjLw3s/n8yRJFL5aZgVUXv1+GRDlJb2K1uhqe+PptsCusnUOpArCG39X/WxXUY1nKjn4IFqIDR8eHn7eG1734IMP/uN//I8f/NQnAURxJD73Pg9NiWPrMgeALfxCxchytJn0ttgOhePts3fPcqROlSMl6xVeKTJqTO59Bhhje6BEhCXoX0JJJWZv2Ruk2Xy8v3t1Z7t/8/nHgby0Gq99zQv2t4IEBUAskLq7MdZCh9nADrm/0988Fw/PcbLhNHaiTFZJSsfgAhS7/5UArHjpHAyyC4a7mBOWXqgBgNrbL9KX3291KcQRa48HLSOOd97VpvISA0IUREqL88ZfJfEs1ZOSMsAsDBioBZhBYCIVJYF65dxhEic2T2NGX1NjOYqNWp2y3NzffXLv+qP55BqyY7g5QZgg2mahX22T0suP7pCo1iaxtdYYQ7bwiMJLm8pKRGyISwXztkC7s9gGZ9zJJdd59/Y5nVio3k4hIpCGv6qqEJA459pT8Ir2vwo/D4F6KQN9PvPMMw888MC1qzc2Rlt55r/lm7+tPxh6FxZ0DAJbExmeTieAxJH5J//0H/33T348y+YbG8MkSebpLMvmAIKSeTIYCqGTgW5hYbUZz+u56lvyTw3MblzqLBy3Aun1jW/8PJpM73v9Gx559PHf9kVf8se//09snTvfGw7zLPdeiUxkoyROAmb3EisOWumYq4if59nYZWPNZ0f71xMj/SgyDHF5kiTGGGUS8QofIloAC6NrESEVldySy+eHR7sX7z03uPn840BKyFF6Bl1gAgMsIBd4dwBQE1hiFGUjbBEU4nQ74t52Mjhjky2y/VytB4EMqAhk0vx8guxEgykbULhJO9EntuYtrO/8VYkneK2BY/b1c1Wt/lYpFTcegpqESDCkQiWfU7yPYhcjNzEms2MbRek0jUycGKvpXLPxzevPHNx8Op9cRnYT/hiFBkDJKy0dp/RSpzsE2/1+P47jKIp4tVeyNli2QfckibeE4XYVt1VCo5GBqg81mCrdmV59WRIrqAiBPJ/NHn3kkaeffno6ne7s7Fhrv/7rv56Yidnlea83zFPnvMRRDCBNU+/9D/3QDz3zzDOqGsdxUEwLAtI8z0m0itLYgMk11AbXhmh0VTmNbBUr3LirftJZ/qpGrhekV7dsbGxcvHjx7tfct7t/8wu+4Av+2l/7a6FDDBtmzl2e57k0GU1wiFftczefpek0z6aTg708m6lPoY5U1DvJnQFBDVNCZMoljkC9qosMmHJmN5vsH928cfbMxuWnn6g512y3uC7ALv3AQAIyEYFgNOxzUwTTi/qj3mizv7EZ9/pKLCIqUgtx1uq02r5vsMNuv8SOu4oYX7V0FSx2CopLqkriq+BpqL3ZujZ4y51Zx9EeXWsIouQNO0NiSKhQDlcPFVIhOIKD5tCc4BUOYJ9Gw+T88f5xvxfHxrls15rDw4Nnbu4+NT+8ivQY6qraX8BmzSm9FOgOwfZgMIiiiGq+Rddzse2UyvtplT84H6XV+9ntMtdj/6pCOlG/fr7oTeYKtutYfhKm6lVCzBwkolFsw/x78dJzn/nMZwBkWba1tfWOd3y5Coh5Pp8DYOIsz6IoiuM4y7J+v/8X/sJfeOKJJ4gojmNSZNlc1IlInudEVHnGaCD3LeEZy0jcOG+XUM/WCcPFdL9682VN7Y1FQOO8ni3Ycx8dHc3nWZa6L/iCL/hTf+pPDTY2vHjvFWBRYWJreTbPI0sISEMm2IgBDm7u8wk0Pz66maZjzefDQZync7jUEBMZppgpJoGIQHMmMXDWijU+nRwc3ry2vT24/tzTgANjmV1rTS8VcpcO0QpfRMolZseIeuj149F23NvguA8Tr5qmOvGvlaE7ok99eDROVhXYGFHtPKvG2Kph0/lQy63lQi3ME3kiCUFjQvxsCSG0FbnCiThFDlGL/nysW8OtGJLNdzf6+eXnH5iNn8snl5EdhPjZCzetpzpmL0968WGbCMBgMAh+xLQ0ce6cmCpq/Oykk+T57KmxgKgvGupwHhpjjGmY35xSg0L/qAb/aAbQ6eT48ScefejhT29ujS5evLi5ufmmN79FlaAUxb2AOs65LMs2Nzdns1mapn/v7/29hz/9oKr2+/1snnrvQ8QwXxS+hLKh3vXTKFYoi62a0ztT0DWz18tHFx53IU2T1kzxzBw29YP/VyL62q/92h/4gR/o9fsA+oMBiETFWitA5kPboF4Wrr40g0+jBFl25N10Pj3sRWyQD5IEXlRY1IqQ98FrByx7wzncdD7ZnR5cO7sz3H32SSAjUtIctSggoYEL8XXQjCuttMMRJiBRU4jHbc/0NuPhmWiwrdHAicm8+MKNjBJEtdJfK/u55JgB1CN3BZ18Va2eNGyNlO9o4WWsYJfrbzBEPKulhJysQuKX3n7Ni1zQq19/rBqT3aNFYTQyGhmwgQka+wZkSAFfhvd2Xp0UVt3kUtOPRhHZfH64PcLjj3xoYI+OrjyE9AakjJ9di/m2alyd0kuZ7kS8bQD9fj8YOmNZhRut6bJCxwZ8ril/FdzS525ve1VKA9eriFVosQIvTu++jMm51DlX6M2Kf+ihh5566qksy7Is+8Iv/MLXvOY+gPI8V6Df74cOnE6nAKIoeubpp3/0R3/0kYceHgwGZ86cYVDw0hU0AbF2QlxFa/ihNfPsqkVAg1YN4HYVJ78lZLDWhkQiSpJkPguRud/9e37P7yXm6XQexz2As9QxsSqoMAhSAoiUWUECzbyfwc3h5zI9mBzuJqTDHqfTqTr1jrwroM6wWspJZtPj67O9yzs7w73nnoTxMFDNVHyL2y4OAgdtr/I7r6mmIVIicIxowIONaLAZDbYQDTzHmVDm4XSJY+5cQq352ZneXpB1FrvqlnpKO88aWnXjqqZqGaZEVctgnt7DA1ASVS9LdZIRYtFsejTq6Wce/I2dTX/9yU+AjqHzmh56fXSd7ui9/MjemWqCN/LKp6k0hYeE8itmasbWDBQmJm1JHZmputSut4utWVoEUM3NWWfL28WGFGYWkYDaFZDXYfuUVhEFMbkC8CAKOr0hVthrX/u6L/zCL5zPsi/54i+bTub7+7sAcucANmycywHkWRYnyYOf/tTP/uxwOBx+wW/7ImZO56kxBuqBpZVT55ipU/391kdRNTCq9PaAbPysZ6vOG4OzMe93FrWqPW2Mr1a0qjqfz2PDRHR0PI5j+x3f9V3Xdq//0vs/kOW5Al5hrSWRIJYGUPJcwUiLJB0DcT6zHPWObl7b2rkAHxk4lV5YkUKdYSXN83yWzw/d0d7Zu3f2nn4c5Jgh+dxABMFgDHXFQGr8rgMFBS6XQD2K+qY3sv2tqL9NydBzrLCqwc0ZK8AIPbnotdoSoNRyCynBIkoXOt7lexFVcBhvRbonorBtT4UsoNa3BUNf/KyKYggUQkvlY/VKq06NnGuQu7isCkX5qIU9WHhWJYC43MQ3RMwKY7ykU8uTpx9/YJTML3/mgWhI+fGMSut4LbUDgip9pz+3U3qJ0x3a2w6hLSvZeLBmWcMoc2tb2tSo/pPu4N52PSU8V3VvdY5yJq0y3JkefhnR0kylGsJRRHGcZ9nVq1dv3LgxGo3G4/Fb3/pWYo5snGapNcX6MuxPZGlqrP3Qb/7mz/zMz1x6/jkRR2Gru8u9SVXPSaies11C53kjsQ38ayr6bLoxUNDLc84NBgNVnU6ng8Egz32S9H//7/u+L/3SL1NBFPfKnq6MpitzqeA/XwAPzWV+dHZriNlY85lPJxv9yDAskWVYVqNO/czNDt3x3s6Frb1nHgVlkFTyKcFREcC7kxZfQT2HIkSJjIkTtn0Tb5jeBsdDmJ5HpBSzSYgtrViU1+mWr2zNjSdJP0n5J3+htxyftRpFSUAipFL0GCtYCVAWhWrhr0aFVH3EqeXJ+OBZ0qP9Zx+ESfPJoeFC3w8aYD/sHohq3d72lF429OIH7hQx1gZ9NCKKoghAA4MDVT/boKurnaEGCvEnwsqggccNsK9wt7MN66meU1V7vV4cxyISTubzuTEGy5/352RqfqWRYkkVhgQkeTaPk2g6Ob7/ox956ukn+oPEOffe9743d3kcxc47Lz4EAYN6okI68ku/+Isf/OAHj4+ONkcDCUG+s6zX63nvgyWec65yY37rdt3q3bURvZ5Srd7qt3T+rP7WqZ5BVb33QfLfKKS9rFTVEIXFQ+N+L0sdM8+zdLS58cf+xJ948xd+QZ5nxNb7grGtt4cZQTUwigjIodnR/rXR9iCfj+eTffhZEkF8ms+P+zFF7N38OJ/cPHNmePPZx0J+wBNk2dgZlVI3LXm+ZYUpmdpiCJDtgxM1ie1t9IdnksGWmmjuVGE9yIlKME0m0sJ0cGGkVAraFRUI1WKfFC7Ea+6+y1fmVX1hQl70vFQ+4LhcfCzeSOEaPlj4L156pVveHiGNIDd1KiNzl97cyp9V3O5a9G4BRKg4lERYPMMzhHieeXDEtge2LhciY8gY8tn06uH+Y4d7T8xuPgWeQVIG2AfMDn5mo1e8i8ZXPN0hn+T1iWkNg9vA7Pb+cePedlENtrhR+BquelXj27PqKgqf6x3oz1ckxUmSleD66QceuHHjxubm5uXLl9/7nvdkeREFdTabVZ5x8yyL4jiK43/1Yz/24IMPHh8fM7MhMsTz+dx7H5ZTIWhYzYvWSalzvbWGu2pP0J2hRbXFZ382C7vGvbXRbAJGnD9//o//sT+xsXVGmUAwNhIog5nYsAEggjwHKfLMEYNY08nR8dEeIbWcT473WbPYyJnNnp+NyU3nh9c3R8n+lWehHppD26Eqq5MAPKgwWoKTEzaFfBYArFKPko14cCbqbcDGXtipIY6EWEFKlTexE1kVNztztTfQVSm3lXnV7WvmkxOWuUgnryRKXkmksK9jBZvIeu9Z4dIsiS2rMInPxseHz83Gz2Wzq8gO4NMQw1OBMn52cP9+ymK/vOkOLbuoVNcKJ3Wuty2FrqMsLxt6tfPzstC7M1sDyxv3rrll1YKgvVZAySHdmf585VHu0mJqJgLw6KOPPvnU42fPnn3qqafe+mVv7SW9jdEGgMA9e+8BybN5ns2jyPy//p9/5+P33+9z1+v1RCRN09FoxMyTyYSZgwxmFfdTb0Njtq0yrGKyG5k7eSwsazBhBWavWRCsylnPQwX7bohMcEodLOJGm1tvesub//IP/RUoQOydQ7CbVnWyGKvWghSGwKSAg5+5/Nhl42x24LIjyY9IJkkke5ee2tzoHV27CJdBXcDsSuCuC1urquAF1pZ7yarCqgyNwAnsgJKNaHB2sHk2GWwp95yQavFBkYKWLZRqs1VND3wJhVRVmkGug3o5SZ3nrnTLKYTcWO7twHO333Jdw7wg70h8dYRg5GuOVWOpPWBUVeEFXshJiOoRMqhClEEMZOksMsqaRZzn0/3Z+NrRzaenR89ieg06rTdTYAQWMNLt8/6UXk50h7htY0zwtVLBdifje0s0XXW1YojbmNouvBPvT0KdlVbnInIK2y+YVIQK93nY2NxI5/NHH3mEiO67777ggnt8PO71egC893Eco1SizvPcsPnbf+dvf+ITn0jTdGNjwzmX57m1dj6fO+eGw2GWZSeB7U7mqZ2nc85dk4LlFUA7pbE4WF9jo1XVCbUEQqp6eHjY7w/f/OY3//W/+TexyBmYVwZgTNA1ARG8E++DgzOXTQ8nk32i2dH157aGvHfjuetXn7r77rNHV56HOLYE1dId2ZLL8RYJIBJQtshDgAX3YIZkN6P+TjTYtr0tjofEkcJWGu4gZQWrQD3KRcZtdc4t+7nxOjpfwUkyr3prtyx2VTtr5MujCMpZhObMPasnN+8br+khZYfHNy+O956X4yuY7UOzYhu8UEPj8tBbSixO6aVPd8JuW1WNMXEcc82tKboEzp2JndQG5hPey2vl6p35TwLkRAV/86L358udak4o62QjoyIgEZHx+DBM7x/+8IdGow3v5d5777XGhnktwHAURc4VO51ecmb83/+3v3X//fczc9Bo895vbGzkeZ5l2Zr3ostoitXKQZ0T960fd7kcLM/Xa07ajey+WovJvZxsTJSwtXv7+8ONrS/+0rf+ub/4g7AGgKjYKAKgIVYYIALmwpojioJcLFc3U5lubkeXH//v20MzSujqs4/BSJJYybMKs4vqAmZ3CV+DpTAVgFH6LjUDG29E/e1kcIaToafIifEwRAxlDfu+4qst3vDsXnXZA9riEppxZJqezoCC7V5w4UC5pa1oRZ9VVdIydHctUVWhUhcDtAcGOtC3G787R1rjBOoRYnEKFVv14i2Jnx3vbCSzw6ubibt+6TMyvSJ7T8NN4V1h6wWAWGAELICH83AK172+OqWXD90RIbmqtTbANpUi5VUMcZudbcNtm9PtLGdN+ScH5lWsdlt7Tk+F5LemhSFvp/NwNgYkUDWWe72ed+79H3j/vffeKyJf//Vfn6Zpr9ebTCYITLYxAIIUR0Sssf/0n/6TX/u1X9vc3Dx37lye51xGU7XW3nIa7Zw9sZa9WzMd16/Wy2nM6Vg1U6+orn1CXTFAVdVa65xLkqTf71+/fr3f77/rXe/63d/93SaJQKgGatBTs5bDCQDvcu/z4MXMp8dHNy7e8/q7d68+O5/cBHKjLksnBDH1CGyNN1tLXeSpoJIYtmeTUdzbjvvbnAyFk7mn1KsE921EEA1utyF+4U3lBBvVnS+rs5/bb2fVqzzJy12TcxWtv71qKhVBRMClmxqjMCqSzbZGvf1rz5/bTp574pMDO5lf/Qz0COJqog+jSoIQRMxjcZTdqKcI/rKkOxVvuyYkp5q5VBsa205M1+ArrRZ6r1kEVK1a35jO2juXAuHkVEj+2ZDLPQiqPoj0vM/ms0kUx0mcfPDXPtjr9R599NFv/dZvDT3c7/cBJEli2bg8j4wlwHu3f/Pmf/yP//FjH/tYFEVJksxms2rgdc7Lawhrxddr5tyww13XR9Mu5K6ndJ7UB2qj6qXSgpbzUjtJlcLOwrVrN5KkPxwOr1y5kvT73/rtv+u3f93XUWykkDkXQMtkARCICBoiNBsQAxCOce3y09ubvXw+ji0gWdj3Lbe0a2hNtclES857oX0NEMFEFPei/ijujaL+0CYjT7FT69V4NQKrRFWJwaKsOuq9XXlAA9BQVat177p+Xu7bVmCSWrfXa6+/iNDxjczVGGiXVtwlSqKVzLou967Sw8lCHi5KQsEnOXtl8Sx+YKPx3tXNgXnyM5/sR/neU5+mOIUckwqBKaieFS5jw4rHgcMReO9TwH4Z0x2BbQIRsTUEA3CYZZhDVCEtwn8xE5jJGOpWNW/AcwNHucWLtwsJ+VFD66J1a9U+G2Bfb1J1b3VV5DSEzmdFwTS16s88m6fZPInjD3/kw1/+FW9/6qmn3va2tzHzbDZLkmQ6nXrx1tgszwgESBzFTzz68L/98fc9/ugjWxsjJlVxVBo3l7QUJAotDrg9szcbuYLPWwX/6IL59QW+MKrXG0XReDze2Ni4efOmtfHW1tZ0Or/7wr3f8z3f83lveBPAMAvRV5Znhk2Fg0QownsQxM0lnx/s7yZJlLs0iLutsS1sLEd+/VFK5FYCwKAIZsDJFiUbnGzADmETX4v5QVRHfqlUpxb905LQ3KrrFlu5i5xdYcFUta7m1lVFN6NPK2bQW46H5ezFWqWS9FcOWUOcLwkdqLaIQwpVncbW3bj6pKXjveceAU01PTIcrLuX21So53W28tQS7GVJL/5rUwXY5b7fH87nWRwlzDZ4xgiROo1la9gQR6XYOWx+kko4MQRDwZtAcVQZSIUUDDJFYWExgHo0HgaFo/yphmCZYmtiayLDofy66+Slg0FUNSPUYg3ZwF73ohheSHw/jnyWuuxE9sGvYloOEahYOkp3EuqltBgSQIwlQH72Z3/6woXzgGxsbERRVEQ0Nyb3TiFRYhWS5VPAPfDJj/4fP/Hjjzz0QD+xhtRAVcJcxk7hoTAs0Fy8MUYEgZVh5XAEOSIrk1A4Dxngoa4bfTvXjlzqcFQU+LA6dcJ5PVuVofqJxgqjpttc1WuMITLWxsZESdLPMue9qtLu7s1773v9H/tjf/xNb/mCAEPOucIXmPiKzVWFCFSIYCu1szSdhVfkoZl3pSBWmu8UEnZVmcAcQo0FeOiDNmG2ODkbD++m/k5mBlMPVTVUHKRevYN4iA8ygzqekdSc6YTd6IXX8YoDXhxFZxKUJGQN3KvAC3yjzWVsscVJ/ajsucNhqGLBRcQF2/BmqK9VHwBBwKit5KhQ/TckBWMDgBjCXjj3yITVC5xy7pk4IRhin873x+OLk8nzx/tPA8eQzCrIoVA0L3QAfbAOh2rzWyvE46c8xsuSXmTYrr4eJoJRWmx9lbMbgmMxNkQwBoZW0CruuS0k78xc57axLB4PJ6uE5CAlbjLo7RKIiPh0b/skdCID3IqMoen0GJAoij74wQ8mSfL5n//5xpgQY9t7PxwOAQQdcgAEJDH/6q/8yn/8iX9/+dLzo8Fwf38/jmNx3jknXlUgUGZWwmQ2bVvD0LJ3syox0Bouak0ibp+l7sx/8kLqME9EzJaZme3x8fRLvuxt3/cH/9DZ8xeIbUB+AIaJglyMjeEIYFXTFvY2p/32taU2wAtUAUTgAeLtaHDWJtti+o5ibyI1FlhakZ/8eW+rP5uZWwx3LcOawdli3AunqoLV7elYmRW1FwuC5ZILDlg1MB9iIisiYMqyzFoWnwFZPjucjK9Pj6/l0z3kx0DOS250GsuOTsA+pZcx3TkhSckErEPcNdTOUC+qAe2rSmiwQU3cvU3icjO+Av5TTfLPOYWVULDmAvDhD384iqL77rvv7Nmz3nsiCsbZAEIGa9l7UeCD/+3Xfv3Xf/3y5cv33HPPfD631jKzsQzSPM187oJnvbYAE1jnAHwVbK8B73bhtHZfZj01MGAVujfqrUbscDg8ODh4xzve8YM/+IOj0QhAZCMAToJkQTU4UQdq6HVbPFmx5b1AB4pgYtMf9oejwXCj3+8HM3pSmFUi5ls94O3cUjSk2W8hZtcK7b82eDdeYuu1FgL2RQopaPFz8SJESVTVgxTkQV6QC3IhJ+RAXuELt2iqqqTeEqzPXRQp6SQyEze/MZ9eGx9emh9dx3wCBZSZDOjUIPvVQnfO3UonTlONJ8ZaBOVl1rmR2Hm1M/NJcq4poV5jAOz6WiQgxym9eOS9/83f/M3Nzc3XvOY1VUy54OI+z3NjyLkidGocx+973/t+8Rc/cOXqpWEv8ZI750iUmUUk7HbHNlqDr3VafxVd6mbogvA1lzqr6Cy2kV6/cU0Lwyg9Pp5aGx8dHn/Jl731h37orwLsFUxchdAQldw7lN/sC5CjEhloGfODIsQD099OhttRb8NEfbAFmAASNaDV4uTmw3amt3GxfWl9OSd8L52ZuWtgNO5qnwAC0sogG+RBqpqX1mheVVVIVUk5T4XFsvhBAvgx+cPp8fOz44syvorZITRYc1WmGad71a8K+i3gthvsb51w+7wvL+8g1hPXQy/X1NNOkn9VCXXefTab3bH+fPXQcDh0zoVuV1Vm/sQnPjGdTr/sy75MRAaDAYAq9loYC3Fssywjon/37/7d+9///lK72zmXkfgoMsxwWZplc7Rm6rKcpiJ3EDuvaiQtKydWiavweA2tQu4TlqClYLz+TWHpMclaO5vN3vLmL/jLf+WHvNdgI2SsNTbomknQFRVxa6tqU7EPrWoAC4oQDU3vTDQ8E/W3KRo4cO4QXgcBKm7VTnBDu3sBfvWw1kuXFhbYS11RqLkoaemZXBYnpVdwQLU4lkjqgnGtqa3V32nxBKJhV77SuSFFsPAmaO3EQxXioR7kQE6Rq+Ygr3DhqcuSWYWNGDfLzm1vTg9vDHvpjaufkfRqevMZZDehM8CH5ZaXwL8XEUNO6ZVNd8LdCkqfpg0IXAXeJ6RV967hqtsy85PXtWqdwbX98lPY/pyTtXYymYxGo+CKPPgkB3Dx4sXZbPbmN785TVMiKp2eqjGcJFGWuWAkJur+63/9+Z/52Z9ixubGRhzHeZ6raj3EKtVQDV38Vl2JbFU7q3sbifX0dsltqt/YxulGaZ1Xq4eqj9KK+r2Bd+K9zqZp3B+86Y1v+bN/7s8H5S/nXKVyTycIurWCCDCAASLYIeINE29wvAHbc2Sc19x58bpswdVN7R5o9M+qu05eTvvq7b6XNXnqL325ooLnVlUNTt2pWHMEIlGgsPgS73a2RvvXnz+/lTz9+CcSPp5cfgzZATSFOiZw6W1HoYpuS7ZTeoXRHYq3TcubygXUUTW4F4GKeUXc62oeaXyBvGySW81TQXCKGgMUbgz5w086yRYjAU0uqlidExG0CLwd8pww0tQpnZxCSMrj4+PhcBgcrQDo9Xrz+fyRRx55+9vfHkWRqqZpGnbBnRPnhJlns5kxkff+8ODgx37sx0abm+9851funDubZjM4GGtVEVlbB+LO2bwBfrcFZp2ZXygcdt/eOYw7q6DSI1Cv19vf29vYGB0cHFy49x4YfPf3fM9//a//dT6bhEmfGapy+82sVNEjGAOTUK9vky1ORoiGOawPvCAtIqIbUKHDSbrQ/15y+iaqIFoRxr5guJuxvFW5s08WMb1qMomqlkKFu2NOKMps5Q+V16QyRemmdldI4+o1lSlExLU8xZxEoGIOK8alDhMeH1zZGPITj3x8lOSHzz6O2CN1CHYxqgoK0Vb0FLBfNXRHJSpr5NKr9MjaO+KdtzTK7LwlJGKFPHNVvfU8jRmcluWoANTdrlDxlG5BURRNp1NjTIXZxpigQ6Cqn/nMZ77oi76oUlsLGawtVmbe+4KrVvkn/+SffOpTn1QvcRwHlag6c1lRhdb1uCDVVbp9TfLGMLtdzD5J/sZqo/0sWNKEpzTNz5w5k2W5d3p8PN3Y2PrGb/6W17/+DcPRZumoPAr3BY/lt0VEMUxMZhAlozjZjnpbxo5AcSYkymSYDIcQmAzlz06Nak3nnLCfP/vXsSalvcACUHn21cJjzcLYJuQJ8najYIVRT/64Z+e7Vx+PaDa+9BSsR5oxwWpYHVBRCkkjpsopvYLpzthtFwG2VdVaG9ijxmxYm1aac00jTwOPwzI2aAUHObyWXooaEI6SNakS68G2aQV1Xq0vC5g5iqLgSxIrRAWn9IIpKOfXLevCeYgmMpvNbty48Za3vCVEECEiBXJXOc2Q0k+n+Cz90R/7l7/yK78UW2MYUB9ZprL8aqTleZ7neWOw1cfkqom+c/pu3NguZNUiYD0gtbO1C28sGkKG6nvJvWdrTWS9iCht75z9gT/5J0dbmyAykc1dDkKvF1ceTzspWIcXftbYMod4Wgo1CqOmx3ZItq8c58oCE0zfq9srxcBmbwQb6CWqm1AvdY6qLtS4FuRVvagTdcVe+FLXiWrhImB5URWMzn3tKFydU3DZRlq5f6jtyLf21EkUvqi61h5VLyIQIQlFBu/rpEriQcqGDMNAJCJAJTZkJHXz3cObTx0fXJ4fXgF5ZBkU7AEwwzJK7h9FkafI/WqgOwczDQBus8htRFwDpfWf7YrWUCMDasz3qvxo8dmNh2qnn9KLTQGkAVy7du3KlSsVJq3KT4zDm/v/5ed/7rHHHuv3kzRNjTHOZczsvc+yLIjZ4zgOvlzWIOgqWK3wsg2oJ8Hmk+fE6tXDLSnomtWaRyLicrn3vtf+mT/9Zze2z4gHlJNebz7PomiFdBogIu99tTgobcQN4gHAFA02t86PNs+KN/NMDMdAhdgV4gX9tQ6Fu1s+3e0+/po+78zZmdJ+KcFV+AtokhZqcARlDe5bAJ/l6nPDmmezzUEyn+zDT+bjq+nkms73kB3D5ygsxZsQraes9quJ7hBst4XV7ZN2eh2k1wi9A9UT69nqV08I523x+0kIQEsT9ZReLBKRKIoAZFl2cHBQRRbpIBKQEKv4/LGHH/qZn/rJixcvnj17ZjqdJkkSXlwQulRCGudcfZZfA97axeO285wEsNffsqaWejm3TK8spYkK91xOkXlHxrz589/yf/1Tf5ps1Ov30/ncGJPnHujGg+rTC10HQJU4igETbZ0bbZ1TRLlDnAzjqB90PgjK2qE2FVyOtB5WK6Bffq6F57LlFq1wk1JqjBdxtIBlHlqhUneqWNWoqm1N8srau/4iQnRRVlmOug1W8JJb9QLjgya8anCZRhR4bifWMLz36XRnq7+/e2nU56Obl44PLqbjq0iPIHkw0UbwN15Ep4ditZ7kKb1C6Y5okrcQrrJ1pi5uew2grkfNBui286xJp+Ud61W1dArM6ZTb/q2gameambMsC8rkqzKLD1ZD9KEP/cZP/fRP7u7ujkYjVXUuC4x72LvJsiz4X1uDuA2AaZyswtqK2gjd2eDGpQZUoIVzjb+dlWpQjKKCRa6Grgh2d2/OM/dlb3v7X/qLPygCY2LvlU+w6VMp2DMxMyPq9YebcTKY5TKbZqoUOpNVGaLISYOg26sCxB5Lj9Duvc7e6OzY26L2O1pV6ZourYnBmy+ru1aSEIArCOpVVZVUlUQNk8vS2GKjH928cfH8du/5px9y6U0330V6BM1ROOs3BCKwolAdl4YftFN6FdAd0SQnCrvIYGZW5tJjPqFS1MYKgbPWhJ+d6FjNLNWnQksam/VWdNjUUpdktZ4zlE+gWvmF8ggzQ8Jm+amc/LeACrRgNsZUW9TlSrSuIA6g0lJWAL/4C+83oP/pf/qjmRNmm+c+TdMQKMx7LyJxHGdZVtxd0wGmZe8g7cFzy+FU5bnlLN8exqvWASfPhpK1pcKUg4mKwF+D0cbx+Oj82TNf8zVfc3Sw/yM/8s+iKPK+9PpX2hhV5L0PH7KqAhzZOI5jMb24v5Hm6iBR3HNiptMZMfd7iXMZwQOqIKgKGV4KbyGl4LfxUKHzl9T4a/0pqlBwrduryGbVa6/PKgHZVtSizQ4v72pps5OUV0lUK7U6XYrMsWhJPUVp8SCBWBmAc27Yi1my+fRoe2gff/Tjw6EZX3oWPIXmUAYZQywqAq35VK/JQk6Z7lcN3SHYDnMr2DgnFZ+qxbe6DrZR0yNDbQ6tlb3qY1vfoqKuVcjdzlnLRuUVooL5vmWFp/S5J2ttQNlg7KeqzrlVAiRj2bsQNsR65375l3+51+t/x3d9987OVpb72WwWolMTUXDtEu6qhsfipDT4WTNs6peqMVZdrbPFDWoP78Zd7ZOTD74lhrvWVGYiJTa0dWbn8OBoY3P49V//Ow8ODn72p38mz9cZNAbcCsVaa+M4FhNPnFBkDJkQfMeyKkHyzLD3WiANkdUTx55q90n7wdf025pia08B1cJNnC7r8dXvaFcKoBB3h6JOUjE5LZYuCrAKEQU/r5Rn05jFIHv+madHAz669Dg4ZclUAQjULNhpcov6ilRGYXh2arr9yqcXH7a1iMtpjFFayKgBEBUm12Htz0Vo2PqtxadSsLbLU14detvVrv+M21e5tOdeVUv97rKMYgMAlUrq6d72HaQG/KyWTAIoo4oxeed6/eF8NvvZn/3ZrTNnv/Zrv+7subtCcO4wUJ1zlS0Z2jDJppG+xIsvrwLrA7jeok4gb5+v+rnqSU+cXqxyRIKkl4gpy7IQpPzmzZvnz2x/+7d/+5VLlz/y0Q/N59POMgF47yseNM9zZkYUO5/ZmJVN5gUath5kns/i2HAAG7CoEiAURPRS555Dhnb7V63mVzStWc7ysn7p6uIzLyQp1Hiz9eo6erg+X8EDdbv0dkuCc7cQ3wyAglg1OHDPDWM2O5weXAXmR5cvoieYz6BiAAUX76oopLVGUAMkAID5KWy/4ulFhu1ykIcYWoY5K+WMzKyQgNzBvWDJgndLHRtzdOd5J8+9nimppto6Q1/PEEwsdKnMQq+lVtEpu/1bQEFxDOAQCqxDPB5IAYJo8HjqQDqfTQCOoujH/sW/3NjY+vIv//LRaCTigmo0EVlr61FhloZEa06vg3Sdtz4hV30SnMaKdcmqsb2ea2c2JWyLiDAZYoqiaDaZ9nrx1uaZ3Zv7o9Ho9/+BPzCZTT/2sQ8VfbhMpRDCM1sROO/c1NnYxKONbLovWToYbTPxbHYshH6/59VBLajSnxJQDjJQAap1fO37OvETradVuxiNwmrlLyRqy5VKW0LQOTstLffD6NPgSGXZkUwpnw+aaUyS55N8fpjND2V8GZRiPgOEGxMiFCTg023sVzXdCSG5el+FyQr6KZGxqmGlqQpwAO/q0y03EMtgdMUnVBMu1YmKHbpaNl14RAI1MFWb3HN7eq1PIiEjMalWMewJABdcF3vV2Jj5fD7o9T/LjjqlNtVfni4naRlEwXst7WHUEEQFAIEKI34N0buR5a6cRwXK89kM4B/5J//w+7//+7/hG795a3N0NJ4ws4mj1OXl9k2QPy4mYlnBQKM5bAooqltJ1TM3vPi1BTz1MovBvwKE6guFKlt7ZVAmGhGoCgAGMRtVVfGq2u/3iciJDEebospR/w/9kT/6/OXnr12+WPV5nERZmi+aCqg4KhZM7LJxPGU4mP7myPQm6WyQDDwi5xUcO/EijkhtBGOE4UQAZVJTPAsbAKoOlffDouS6JGOpWwBQ4HE5qvePqiLs4tuGlqKWO9917QcuuYnQrYKFn7V6hy9uqa4SjBAoCP+LtikADe7cFWAqlnqBXaHIw4hX7z0TGYBISLPI+MyNZ0fX5fAyMCNODYl6+OI+WTRAGX55baoAPGHefK5TeoXSnTAAC5LkIBw3pY52t20VL2FnnUwXhWiMHcXcyvM5ahNrPVsHlaaZVf52C3E7W4yn9KIS12ZpLyoKANYyUAlBw8ViHsyz9Cd+4t9/4P3/Z2Sol0RhY3s6nfpShFxRFcH6JNT2Yb6KV27/rNAXLSRu5K+ntMtfU1d7uIbSvPd5nqfOO4WJk8Fo83/8H//IXfe8BmQAGGsDZte6cUEMEDSbH/YjHyG7+vRDG32jMlfJvffilcDWxmwjVXjvvc9V80Yb1jzCemr3Tz29Te1s5XMFPS+pnLTUc7Xzr3ovC3Oy4AqlzOKc5JmHUBL1rLUiTiWPLMSnPp9AU0QAnIoLBm6VpdpSjPDgaq06AEAAB7hTCfmrge4IbNdMTeo417bV5hU+WDpBsQG6qzC7cYJlAG4krqc12e5AN55SQVo7IIX1K4TgCS53UsjNo5g5CrOl7+BOChKV6zeu/uf//LP/7b/9NyIaDodpmsZxvIzTTZ+mbfxGF0I0Qo+smuLbOL0eZjpT2ued91KLlaculXVVZeY4jt/6ZW/743/8j5MxHEVa7O43+zC8BSl0m9U5Nx3v97Y2Lz//tLFQ5AQnPgMpcxFjWwRejVLUrrp+Et5s9bOCwzbu0vJLWnyYwW579UFa1qLNCGBdL1eqJy8ukXDLdxsADQG/iJVYoAJVMJR9ljORZUAcvDMMZoj66WwynU6cy8hEsDHAQR7SHu3Lz12zLD8VnL9q6I7Cdhue27SKOUa3dtgS7qIFq7hNYL4t6qzulO44Se0AAGYEsy4v3nBEbLvYMCknOkmS5Jlnn/lP/+n/eOCB/24YsWFVhcryfE2lsVNB7Zm6nr4Gd1dlaORsnGMFDJ+c1txYDV1mjqIoiiIiCs7jyNjXv/7zvv/7/2ciI4H/E/BqX+WWKc/nUS8mOBPR/vVLln0cKShndSRe1UOZiJkj5ggnVilvP05nr97yYU9YjnYtJtoVtYta9bLCTwYlhpk0z+bepZEl0nxytD8+3MvSKaBgAhvAKFj0dEo5pQ66E7Ad1Mg7GV+0kG8VrocSqr/VSSde0jLSN05WYXAnNdp2itl3mDQwLmFLGiBw7ejQqOXg1CP34aIXEWWQUSwUgsobXeDF0nQGyDPPPPNTP/VTDz300GhjEAyfCNXMW1Xywr+XVdN9Q5ZOLTkQWlvpndCCFqvaTm9fqhK5dOZffWsi4r1OjmdJb/iOt7/zj/zhP8ZRzFECZfFa+hhbklwA4iWPDImbz8YHw0EEyo8OrhFSaz1RLurgBWBCBLUqpt7m4Gus3WkhKnbZQQpaiKBrt3tVX3hFX7GtUG9n1yLJN7yL132iLfe5Vi8BItVRcNhgKdyecjgPRxh+cWTE5T7PrEEckbjZ5Hh/Nt5HNoEBRZESAzGiEbivarEYrtUobK5Ta7HXTmMivCroTqikLQAPxEw1tTIC6latFNTLtDDuvEXEX1pmvnWFrik1Db5vD2Krli1+1A3AaFHFKb0otNS1XPsr7WwKsGE4BmhjeyfiaP/oUF0GtlCFSmtHVoIWujFG1X/mwU9/4AO/sLOzfc9r7pscz0oLpTrULeSorUuop1dUz9B5y6oS2jiNFmmtMRVWVZfqLamu1guvF2uMcc4FJyrB2LIA7zyDMrP96q/+Wufcv/6xf9nrD+ezCbC821oSA8ZQnuVk+ejm1e27XnM0zcb714db5zyJagSyJKzMKqSqhjg0hJbN59qf/9JVNB+t8dS6/JrWUFVdZ6/e6hZVbdkULDV7UbiqAhKxnc5SQEYbA9F87+CmO7wJzWHYxmRhnYonMpq4PEUWSljEqaNTSfgp3XnYJgIzlc6fS7ttWcB2UF/r/BQ7qW5vXa+x8i9dpVRrhRcM27rks2kJtk8Z7jtGbYaijh7eATC94cZwtM3gXu5n47GKRwhvXOOci3DHEGPI+zxYKX7s4/f3er3v/t7fM+iPSAujMqVanSuWknXAOMF0v0jRW60D2ontPJ389JqiOv9WJ5X2uzGGJErTXBWj0fBt7/jymwf7P/fTP0WR1Xzh8WOhzgVE1qRZmiRJmqYw0cHela3zdx/u7qeRoahv7QDEHoBTgJgYJLqs9B709lWbqx8iKf2KQCHV96bLftBUJWi2FwGr65plLS9mld35oq86TLkEKIJ/1CpCoY1PBPWFxnvtXqFmXQYEwKdpYpgM+3x+fHzgjg7gU0RE1gCiBJv0rLXeOVYWVeRZ9Rap9rdoA07p1Uh3aG+7Dp+o4Vyn8Lmerfpbheas/637Nm9TQ9LeKZyvn3fSqgepJ75I/XZKLWqwd/XZuQqCZOxg0yaDg6PJ3uExmSQaboEsNAJsm1uRhedtGQ6H8+PxL//KL/3yL34ARSxIr5UCmpCqaqlf3tZKa6iah/LXQOwqMG7cfkvMPiE16m38rcTjwa+7977yQKeqvV7v6Oj4rvN3v/vd733bO75CnRTxsutEUELufGw4S1NjFJIinx5efX7z3Iab7Lv5MUluSA08oYi3+8Ke5ST9oGtpVSGdHd65KiopWBuG085sQbdMFJ7g0/l0OIhH/WR8sDe9dhnZFIlBZInU5bnLPZvIRH3iWE3PJiPAnsrAT6lBd2IchJAPQc9FRBq71yFPhazVR0Klb7UA0lU2lKxzPWc93nZ1Ncw4ldCvWtS30bcqp43ZddSvK71XKwZmDnZod6AnT6na1TNkCKQg5gKI44QBRMOtKO7Pc9h4eNfdrx2MzihMf+ssYGxvGJC70qgKo6CIcwVMJkcAJMv/03/4D7/6q788n01Go1Ge52HQmjiSMtp3GAl1nKZl4bOIVDxrJ2xUN4aq68AfLjWWBViNKPV7O8GsXkKj3moMV+fhkwkh5BEkDWxyL3G/N59n995z37d/53fd94bPC3utxsRRHINgYwMgoLDzgqKjBPCQ7OjKJROTjnetEcNefWZYmFR8XuxbhwhdNQr73I3HRxFua+m5CpVtrcymKQQntQzb+ChJWoJ9qWJ1lwm+OkKZDGIQF/HSio2T6qgaUw0AEXEqzACExDPEMgwRRFw63zkzctnsyqVnZzeuQiXaHEVxhPlURRBikOeqMDbus+k74TPn7wZZwBDbsFnedETR/Vyn9EqmO8dtNyCzzQQ3UtZom7evdjxYK9xnp7JbPUO9tdX5qpPG03VeOqUXhwSAV69ECvLCxsZkbZbKaOeCh+VoMNjYSYbbwglFg6i3qYj623e5mbe9YXDPUq2yWvsrhRXTv/3x933kIx+aTsbnzu3keZam6WQyjqLIiwt7wJUeWTUAGjxZA54btObxaFnU1C68qqLz/HNLVC6mXe5ns1me+zd+3pt/3+/7vp1zd8FE3kmeuqK1CqJlEyVFscxSJ/m8f2br6Pln3HyyvdH3+dy7Ga8AmzpOd15qpLx4j7+qGfWrJIstbSq3ur33EMcGllm9z9KZgdvc6Kez8d7ulfn4AEmEns3n03w2N0mPmdlEzBZswAYc2ziJ+sP9w8nWzl1kYxUyNrImFlDLhdSL9/Sn9FKkO7S3XaKmCkm1uq+0I8sZikHCzKAFW1xnC3RZV4VaSit14KRSwyXUFaYeojLgUUm6HCuiUVSVqCGFllTbUNvMOsXsO0vCJnbeKRmAvFeYGFGPzIAsbG+jlwxVTJYTqB/3KU8nWXYUbZ7JxzdDxAWR4OoZQE3Pp/gtAPIse9/73pck/Xe966suXDh/dHTsROfzOUqOipfDjVTndcipQLoxPNop9UudiY1Buyr/GoxZf0lrCl/1dCfeWkuKKIpEZJal2xubb3/blx//nvGP//i/nh4fARiORpPjYxOxyzv0BAEBWLOZMxEGdrJ3hdluDjeOp5k4T8YuvqIQeLvGS1SK5QQqd4tFFaRMVKrEhFsLRQUClnyIcofj4dLX2OKzLWNfLiOgqicioK49UxcJlFESaDlEGIkJDtuNIVURR+JiC2tAPr95sJse3YRzZtS31qRpBogxcXDUqyAViBNmYjaWkzxKpllukoHTmXc5MayJnc8oKLtVDT5F7lcT3SHR7hreus4xN/LUbwSw6qSeB0urhKVI2O2iVjWg/rNeXf28U85/R/rylCCA81mcJFCAY9gBxL7hjV8yHmeDjfPgxGvk1MxSSXNw1I/6m87xubvuAQzUBu0zAa0GMiFSybP3/asffeqpJ/YP9gCJYuvFVY75Qj69lfe0KlsbEVdRJSSvy8xvWeaan6sAu11g+14qeUdm7vf74nU8Hs9m6bvf/d5v+ZZv6w1GMNFkPDXWeieFh9lFBdUh8C4fH57d3gD78f7VdH446BE0DQZbnR3SaGrjQdasQk7Sz7fsmXZXdFFzI6MiZjZE4nOXzS3TqBeTz65fv5ge7cIq+tb7PM+zOE7iuO8zL4V3lWCGp957D1VCf2M7z9SJiYcbgFWBEtX3uU8nnVch3VEheVv1rJENXYBav9o+WbVHvgZEV9V+u9RZ9Il75ZRORspQptr0VOmgpWmKKIYHnHndb3vbM488e+bCG3r9Ta92lmvmycFmwl4isv2ts3dfefrS3W94M2DIJqqVwkRQrWrOg6oekPl89o/+0T94+OGHAXifh41tLXWttYbZJxGGnxBpimasGGad4N3+WcfCetWrCuzoeFUAUWxtZDKXT+czETHGeEUuPsv9//AN3/S7ftd3wCsI3jmyFmwK/raSQlWnKmR579Lzr3vt3fCzydGNLN3vJdTcWsbCM1qj05atugUQEm3scwfPZ8H9WVmsrmBFC3H+rYAZ9f3vZSpbXoyfpc43RF5y0jyOOGZks+Px/p472IO6KOIkjqAi3ofJyzsfJOPGWGMKRRmBeCUPSrZ2oJTNnB2NQMY7sVHU8VSnO9yvGrpzilS0llGuEtub1tTidNuF1DO0bzxh89YU3lkylYL0xWf/Yu6xvSqpW4e2dNTMIAOyFz7v85974uL5N31RlrFT6xE7YaXYxgOlKPUkakS5f+7C1UtX733jm9TJYDjKnLdR0lkrAXEcA6LiDvf3/tWP/sunn3kyTdPNzZFzLsuyPM+dc3X1Ll1muxdN7fq5htqfQKAGPK8qeVVF7WfUGpw3bqxnC9sBYYkTdEuNMQQ+Pj7e2Tn3FV/xru/7g3+wYBO9wvvirSnXbasDEqvL4n703OOP3HffBZkf+HySpcdUQ8R2C9uN1NZKaNUD3hatqv3k5Vd5VFVVQOLzjAmDJHb5bPf6tXT/BixMEok45+bGEDNnWZZlObEVgSoFM7NQo/c+905gyCbc3wAblyv3+jDG5fnatpzSK5zuBGxr10q/PTF1OkCta5N1ZmsA6uLBlrnweqX1xjT+3nKJgNZaoXrGz37uOKUuqnPay2QMnL/3zV9w7dK1zbvuy7xV7s1Sb2xMHDlPIEscOQ+v7NUkvVE03Lh86cobP/8Lp5NZEvfz3Df47KqmLMviOAbQGw53r13723/7/3HjxrU0zwBUWuK6zG23rb9QUxG/JWCvp/pz11NW1YhbabE1EjtvCeDhvbeRiWKrBK8CwDnX7/cvXbp032tf+3Xvee/v+J3fACBKkqVlVsmDVlNMEsfZbAK4i08+9trPe+1s71KWH4u4xmO2P652g8t2SghtydolYw9ex8ubGtzpql7l5aVidVDl7axxLOkciGrwmKbifGTIEuazyeH+TT0+gEoUR8Tea+YlJ1JmBGevhiyURUS9V1eMFqhCBGTm8zzq9ePN7bCtPxhuBB32NV10Sq9s+i1798Rgbu5DN1iNVYbXtxS2Uxf/3aD21c7bV52gJZA8pc+WqPUX6Jhwi0vWxMOz977h8uXro3P3eERpJuAozZy1ETOnaZo7V6kZ2ShJMxf3Rr3RmaeevnjPa99InAT1tCXT21p9mctBND8ew5B494//4f9+8ZmnIyZmtqUzjfD2RURlCUHbsLoGhusU1gTV35NEElvqnOVd287M1Rhu41Y73VrrvQ+hzbUMRm6tTdN0MBgcHh6Ohpu/6zu+84vf+o58noHqdthBgM2h6UycZTNAoR6UP//Ywzt3n/PHB6xz1swgN+orZ6katnhpWcpC3eZtd4iCCLp9FGpwAIrIwQRAvfq830sMY//mjfxwFxFFox4gznsQBd+xqmojY61VEmML5VkhYWZjmI1ha13mbDTIPUBRb+e8IpqOJ/FgEzBAMAmrtiHKgdv9HZ3SK4defNgmEXHBaJsINmJVXxlY8zLV3S80Vt+d4ErLtt0N021qseb1AhtVryofrU33ymY3CA+rKKKda4hTatAy77yKtykPEsAxu8A3KcAmIoqhSTw8R2a0P/HxaEdtj+I+xb1cNEmSdD4Tcb0+g3JFZiI4yed5ZqKeTYY22UxG56/tTVPpRckWAQaSGAbEsFGATKjaQAiqxAzv3Hw2Pdz/tz/2o/s3dzeHA0Pss5yV4DViy0oiIDDKcE9gVRKvhVvK9gBehd/tnI38J6EqmHf93tJpTPDxygSGUv28cYR0cR6ikbEMMkyGKc3mCvFQE0fK5vB48oY3vvm7v/f333XP66HMbKASdPoAKEABjdQBwvDMAsmg+WTv+pnNeH7jOc72B9ZZpOTnvSSaHR9bG3sYUfIgXyiteYhA/SLg1XIHGlD7IKLAtZbHUocT0bJ/byGiwi1KsTvuVb2H9/BCUh1FZhVAhCBKzvvQ5xEbq2q9P7+1ORsfXL/0jE4P0DPUIyez3M2IDAW4JRaoFxE4D+/UhVoQNr2DzbqwtT0RgsaKRJHYwRkansuchemhWHcyAAvYchG6+Mao9rMltFotxTqllzrdAdjuMp42FRxKFZ++jY7rTbfbyFqr8zbyUxfnfcvy12u9ndJtU5tFKHs3SDqNMQB7DxVj+puCBGYQRUMTDZQiJ+IUWkTbloJvK1kiJRBbT+yVyfRNMoz6myYaCkUEG5vIeYmjnhOf9HvqUUQqocCFF4FBJ0cHly4+9/P/+ef2dne3trYMsffeWutyybOgqkaqGqQBnVCqLW8nQIe0tnH7mpyd96IlE1rf8asyVGvczquDwWA8HhNRFEXPP3/pDW944x/+o3/szLkL4r21NqqifAajsmqxAg1uQgmSp9PZ4cFwaOf7V+dHu4mRUT8+uH71/F0XJpNJ0V2qqupR6dW3Y2AvdUWb6p7L6jk7H1zVs7bnRA2qC82jAHaR4LTdWnV5Np8ZlY1Rf//m9cnxIVwGOJBT9bqQHdSkCCRhO7t2lPKkMJCEoAyQgBWWKIHpI+5RMoIQYI1NTBmgNolfuNe5U3oZ0Z02AOuEw3ZiRW2GeJXOWj0FXdptnbWsad768k8NwF4YLYu8a845igtL3E/wN13GeqJivrNJFA9gYhMlca9vo0QJYZY3WBnpkJlVyQuUOYp7cW9oej02cdwbzT3IxGnu4qSfzjIbG6iHuNAeVQ3KVQJM57Nf/41f+y//5T/vH+ydPXdGvYdI0ouCc32Epq7exV6jbd5OWfTYCvyubmwvBdb1/7KG+aoMayiM+TzPe72elpGtAXzxF3/x937v925ubTsnee6ZbFkRqRJxofRdgbgq5ul0Pp32BoPpzV2oy9LJaGt4dLAXR4TlANhC0OD8bEX/LDexdJm2KsMtLjX0sRfsKitx0Q5CGJCihphJvc+hPjLKRsWnR/t7MjmGd2ADouJZ6LbnW4HXYneACMaYKIriKBqoA+IBRT3v1UkRBty5EFr1RCWv0rA/pZc+vfjuVrpmIhQgV8hpqPpbTAEdKmx6q1ANq9KrosoMTb5Z13IVWEbuqhbmsBY+6XR5SrcmKkN9lD1KgAGI4BQiAIwdbBnbmzv0hkMTD2BiJYNgGcQSXi5rsd1IupiYJOCvEkSZGGTYJkhync9NMnRpCrJZmhOzy3MKNgEE0gLHDBsAXpHO5x/4wAc2Nze/6Zu+pT/oZambTidJ0vNOpZoJFYth9iIoOdcTtRU7q57eyK+qREufUhsCOytttyHLsjNnzhweHmZZNhqNjo6OiOg973nPdLz/0z/5k9PZtNfr5S7N85yWsZaCP1oN3jzh87ko97e3dq88d+bu19mIZ9NZEieqXha+mAwWtpVLjorX9ZKCNBgPruyQqh+KtmnZUUUBi/PO+SH4RGNSePE+61vb78XpfHrj2i7yOeAQEQwxICIIsbRvk6rXqqoKAjFxTEQwSRzF6rPc5YAHGZDPBVSNuPAdVX9P6RVEd8JLWiAqvCTW2dwVsN01yGiFc7ROaMdqpqH9tVPLOVRHfiokWRXwF8nBBRsViusgOl3B3oraYTcXDHeYdBrvn8hAFTDgmE2CuE/exP0NIevVqLIAQZ2HmnxSKJ1BQqoEKHHYNSQwmcQycpcSGzhlw5JNVTwAY0hEiUBlACkvPihYgQCf//Ivvn8+mf6u7/yOM2fOXnz+srVWi1UCAYADESkBpN2jeS1T2x6QJ0fu+qXVyN3Bs56kbfX0Xq83nU6jKJrNZvP5fDgczmaz2Wz27vd+/Y0bN371V39lOpuCgoAk1EthHSQaQmeFyOgKQN08shuuHx8e7PY3ZWM4mrspcY/JQS1UlQngsBQzQGlvDSBsVNVfel2FrQTcqtXtlX2HkUtrCGnl0nGJwurQKvncEaRnTBxxnk2Pj/b80S4SC4ANEZF6gYTlimmN7lsRhbUgKeChHKKOIR5tnp1ND71LzWAEZ3127IMYo6xAa1/TKWfxCqM75G6lrnRWaY3dktrlNOTV7RTUvsB2nva9jVs6G995Y7WGaEvLT+kFUCUGaXSiAl6UOY6SkUlGmYPTaLR1jqOBUuKFvSr0Vv0fZl5mJgs2XkmUYIxNBtzbyskm2+fEazwYAURkvC9CUxAjhB0p5z2Beja8f3Pvl375Ax/84K/keXrva+5OZ/OARZX4utyK1dulqpCi4cv42shZT++8uiZzI39nNq3JwOv3EpExZjabAQgm3dZaVZ3P5/1+/1u+5Vu+5mu+NuQmZtUi0lelDlIZN0FVNY8iPtq9tjmMIelsvD+fH0aWSDKIQHNVhRcJdlVtSL2Vxn7nQ7UvdWZec2PROaIMaJ4ZaL8XuXy2e+1ytn8DMYME5NQ79YXbUpAhus29Zyol8gwAKuTVQK3CKEVRPLTJhsIqWYp6oEgX7mc6lNJO6RVDd5TbpgWr2sFtQ4vpQEvvRVQTENX1wLW2RtYuVmPNJN45B+kaAbvWGl/uyVX3BlE5M51y27dJC56bar9RpdZyCozh2EY9MX2l2CYjkwydJwlvpNgyJKiH6CoxpICJ1BCTAMyACKlTpXjQj8zs6Obo3D3He1dtMnTpMQfZYrkdaTgIy0kJ6kV8DmA+m/7i+39h2O+/53f8zig2wVc2E0NVw+wsGiIoY+0ODnUJe+qJ7av1lPZ4Xl+d3orbPmF6nudRFHnv4zhm5vF4nOf5aHNjPB6fYIE9CwABAABJREFUv3Dh697znsPx+MEHH8zTGQBf+vzuapOAPOD2rly88Po3Xbt0XaNE7ZQQs4ogJnIKW218qCpQPV3FdqNLilN0UJB1d3bIyku0+K809WOUDDyHcRvmAe/iyBjD6Xw6PtzD5BCUc9SHevFOlYgtBWtXZchto6eHBjmkMpMWQR1YeZalg/7QWj4+zqAu7m14Z/3suFQQWfRI9bu2+7jUBaf0sqM75G6lscKt8LKOr1TsGS85Wmlwug2l9E52eRVXTYsQJouc1MWa1wmtr7rkGMrZYq0R+SndLrUwOyLEgmjulEyytX1+MNzOcs2VBBbGwhSqTw2d4eplcLnMUiERUSIiBhkvnIma3ihVYwZb08wPts46D8AqKLIFYyQC79V7FRUtDKsEJDYyuzeu/fRP/9RHPvKhzc1RsE2q89zF7V0Md8MOew0wdzKL7U5rgPd6pG/nPGH+Ro3W2mAGOZvN8jzf3t4+ns1F6eDg6PM//wu/7du+7Z577oFSFCdQBVhFglVzuDd8i0li8mzKRGRx7blnzl7YYUln40NLOZNYFiZwwXS+WJ/YLR92+cmlfu4l7yeJNXq4v+sObsISDXpQZ0zQP9NgV0ZkoOSdNIOUn7zagoyClQyZJM187qnX37C9YZaLd0Dc7/QqWP04naFeGXQnYDv4Fgim1eE7b+NxG8IroA1C9UaZ9ZxtCXzDXLsqpCqnDeftZhRysK52chlvO+RZlNyW4p1Sm2jptJpjwi5lZKNgNq1gJcumJzDiebh1drR9zoGnmRe2oiZ4qQobnBUJQai0Qi6JtVhdKRkpzZLJGOI4zWU4PJP0NsXzPMf22QuD0bbCeEelgtlCGwpEqmotQ+FdFiX25t6N//Kff/Y3fuO/9Xq9yNqgeeSyeWzZEkOkapjWPKlxLa58g1a5XVsVsCTcVT+n5eXpqhKWXkiX89RGe+qJ1XcRRZFzzlo7GAyyLIuiKO73nNeb+4e/7Yu/5Lu/9/dsnt3Jsyzq9wD0BwMiAjhJEiLyAmM5S3MAilxdDmR7N646N42sjPf3YlYmn6cTZjWGRMRa1hCZW30I1E0I5mQo42ErkxYRsrEE8539Vj1+dR6stNs5Q5d6yeGFQdYQQXyen93Zmk+Pbly5JLMxEsOxZVJC4W+8miXa72XVjIcG4yFBkVxV1SsJITh5YbJMVtkKWdjEJCPEI3AMGIVRsMJqbSv91KfaK4nunAFY/bwBlo3tYVrmv6tbbmnQ1a6i0YY11L6Latx/3ei8/bG9OH32SqR6Vy3FXQQBHoijOHM+SQaqxCaGGi8G8WZv8xxMzwkrx2yi4Lp5WeIo2hVHoVJHWmz6LbE7JDDzzAvMYOts3BtNprnzGAzOOLDAFoZotUmeuZjBVVWcB8nFi8/98i9+4Nlnn57Pp/1ePJ1O77rr/GQyOT4+JqIqqEVnf7S56k72dw072AbyNfi0qsyTV9fIU1VRVTeZTKJeMhqNjg6Pf9sXfvEf/IP/l80zZ/NZ2h8MZtN5WL7P5/M8z5nhXKFhBSjgoAI3c/ncZ5NBTEf71yWbjoZJOp/m2bwX2Ww2h3ptGcGvfPZarJFV1Ph+288eihIRFRexiSKj8Gk6B3S0MRgf7s2mY7gU6kFQ9VrFYm8y1i98suVlw8YihnnYprNRFPdtPIDpQSOOh8b0AAuQgIgMU9jKq1V/Khh/mdMdUknD8hKyAYRtUGxDaRvs2xDbed7OuarAxl3tlq8q85Rum1oQ6wHDJstdLxnM05SjnnhCNIAdDLbOD89cMNEwDzyysWFu5YKVqAmcKVj9UJ3ZLvgTEkZxLDWESDwprI0GNhoIJ0I9m4xg+gqrsAv3G1pE+hTva0wcvM8+8/CDP/9z//n69atpOtvaHF2/em1jOAzB4ztBtBNc6yeNPJ23rEflBqTVL636ecsy6/k7Ww4gSnpp7nLR1OVkzbu+6qu++Vu/JRr0Z7MprDHWhhCV1trw+SyLRRzEazbJ0ymQSTrOsxnDR0ZVcvEpwalqqZpeVe1rtv7hpS48jyLIWlYcBtRIaTzO4qnFMTORenGqLrIwVtWnhwd72fQIkoG1cAynCGHrQlMWm+O02qvAyr4mRqHIVrUwSBKYWQEnosJsEmsHNhpQNFTuCVtQFNymeaVw3GbFp/SSphdfJa2Fwcxc2WagpowW/gYVtTWky+o21LAK7dqHXrodK5VjV9VXZSs/5UX+JX7xVCXthZIATOxECWaepjCJ5Iq4T6ZPyZl4eMb0Bt55yX2INkxFP0t59y2o0B4ikC7+BjJqYEmcm2VpRDwc7eTz8dH4pk2GmhtxM4Wr6gqQ4aHGFELvsObz4j/60Q8nSfLt3/ldOzvniHU8Hm9vb89mszrHpasZ3M50qmlRrBqfa8rRLsU0ramkVXnW4Tp1p9fBHjUdutAhx8fHSZIcH097vfg973kPgP/4b/8NVL13IU8IJgag0PtbQm4gn86PKeltuHwyHZvR5rlZrtPZ8WC4EW7sXK93EEkdODt7abmEBfarcr1ZYR/MO+fzrN+L+/3ePJ3t7u5qOoG6wNYyBzs3A0ilaqkhPFpR+AsgIgWUlYKAqtCwY2ZRFUe5L5hua4eRsfOjHNQj41QyiAdygZ5OTK8wutOa5BV+t6cbIip0RGmR0pgd2vd2fre0rG2Ope+ze/g2gHwxL4SGhzYVuqwdzcDqCfSU1lOh5kqm7EELGBiKekOORmZ4zpmBivHExOxVyXvL7F2dtQLCPNtc8i00fhdW1eXfkAqoYavq8xwcmV4vERFgQoa8U2VfekMvRPJEBTvFRCJOVI0hw8Z7/chHPrKxsfk7v/4bzt514ejoaD6dKlR1aVypaiVjrze0GnJas4yoGMoX0KvaZWEBgNC0m+hE7tot64y/0fq+5rN0MBpO/QRMg8FgOj0e9OL3vve9k/HRL7z//3Te9fr9LJ2hBHhf+isNNscAFA5qJZtqnKhKnk7zbGoptgyoL5shtXrbVghLW/tAh0tUWgSDqVK6lzihTGOs87mKi2JjLNJsOhkf6PQQEaACYiIlUBCPM0UoV4q1xgR/e7cP3hoCqZGSVtifS64AW6OqTkBKxsTWGNvbID/3LvOOkM+hDIiC5QUuGk7ppUh3yEsalmXLqk1B5RLK3ia3XaU3Cmxn6+Q/VpUWCimjmxQCPYSPD1D1RFSXXYZr6zvj1U664hxw4tlE4mF7A5fm/TM7XjkZbmIwSp1JnVg2ylDnlcQYA/I4uf8nCoiFxl+FqndelIjiXp+hs9QzouHO+XRypJzCW8BX8z4zDEe5y714pmKV4L0Cngxn6ewDH3j/YDB451d+9ete94Yb1/fYGlYSLNlcNeJ8NHtoJXzeNq3A/tvktk/WpKJMQq/XOz4+Hg2GeZ5nPuv1erPpbDjqf9u3fds8nf3KL/7SfDYj0iiKUPgOKwpAEKSEM3VKlB0fcm/LRHJ0czcabg6Gm9PZlEwUti1qDICgVBmrWldr2crOabcfpTSunU0hzmURoddLXD4/2LuB+RSxAfnSCS6JahEwm0t5ngasvX3xeNl21uJhJaw8yTEgBHEOJjImBqAeKiSenGiUDDQnVfLOQU3YfTIcjBcKe8vTSerlTneI266z2qpaSaq1Jh6vLKSrL2cVynYKEhvoW33VVaIW9tz1D77JNLTLLIXhxYzSlBO29vlO6dbU1U9EJF5sb+TSbHTuwix1W2fPeE5yZacsClVYMJGASL0nVVBhThPm+8AOF9NcnbegYiO8LaUUYibyqsEKQVyWZ95GdtCPnXMg7yHqPMRDfAjt7F3OYEHYVAQzOy+qUBGA8zz/mZ/5Ga8kIq997etv7u8zx22YrMZV/fHrgqVV7O9t93RL080wd3Lbjfy3LHNVziiK3PFECQKdzaYbG0OO7PHx8bDfe+973zufTH/j138t3JvnOQCQAbyqVi1ihQeYVNRJNuUoRo58aqyJ6yBc66X2LFG96HXi8e4LVMkYlpKdc8YYy5pl6fH4ALNjkJDtQVwxDzBpqdW+2P4DA1KO+BfCZ1MttixIQEpEBnCGiVTVEyIQKSmUvQhZq8aaKFH1TgTeQcWLf0HLhlN6idKdgG1fhLURIlIu2R0KI9ssZg1SgLT0B9mYvLicbtpcdaO6hXy7a2bsRPTOAqvZVhbiu0p2sCDVE/N8r0xa4eYC5cK+6L1FyCOggdysIXAkRc6hv30h83awtZPD2mToUgBsGCSipIZZoSs0ddHZktCEUu08TKPVX5AxRhVQ55wIYK0Caa7JYJQbhABNkivEKeBUANj/P3t/+m1JctUJor+9zczdz3CnGHOKHCQ0oQGNCBBQVIEoaui1utcbVv2D7/V7r3tVQVc3CIlBQkgIDUhAIQECSSkppcyM8d57Bh/M9n4fzN2PHfdzbkSkMiMlZewVedKvubm5u7nZngfDEIiKCDaZM7VVoPum/oM/+G+z2eTq1avFJPON9AUVU4JHaD084poUaExw3fccrM+HpeI7Vb493zAeczx+x87uHn/38wjdOb/zxJNP3btzG8Dly5fPz89JxWbZqqyuXrn2W7/970Tky1/+UtN4YzO0rnORcsfHbjUbIh7kII1fnWez47parO9Wx0/eWDWb7RZ3cruddSjRasvLxcnnwcJItrlBpyYTEgL3IQm9PZgVTVMdHkygcvv2K1icwRo4p9IQbeqdMEcvyS4ZHPBa7dl7gbq3z7I8hCBBVDyRIWKCKigIGVtYV9gs99ZWK9b6HIDuYx16y+HWbn0MP9XwCJTkHILG+EUfyjabGEdnYAPV3tcrum1QEtKaiiYhhJTcDmSX1GU3DY1Fpz1rbU7MMpI/Ujqd/nb4tHNRobaPtmiCeg2B902e5yHsrSr48wtMaJNKJH68GB6AEWOpoYBEBMOMwmWrygPMnIkw5YecTWueuOKQJkfCblEGQ9T6fnMMg1Eog7c5NlUAJtZl7k3Q8QkUAKn0VWTafy3phAY0ILQuP6wEDqoicMYYN7XWLk+RWRuqTEKtYQU0jfRVtBEkYUqU2trSvv7f/vf/3/nq9P/5//gvq1UlAT4oVB3bEIIXYabAgGoMLlaEuBahMGSjKioli9pZxMfQ5o8Z0fsd3Cxaq07f82JWoFPztp2TmSYATDt4EQCzyfT89J5lA6Bclpaskoggz2ar9eqFt73jk/8+u3Xn7rf/6VtBAfHMJioqrGXvfevdYK33nkkFHmHVrMN8dhC0ufejf5k/8Qtr70nhnAPYVzXQJm+RjnIrqbZ2OIppDClsGBCOH4x61NerxxmgwEJRp9x4Q1y4THyoytWT168uzs5Oz+6iWsFZtnHuhUBkLADEWDOm9kP2o7fT1PMHnW6v49IMCNvklLrXAEG74nKdmVwgICJphEDEpkv6LlElqMgCImJkZGrVBGOkXiGAWFR9tPhwi3q3Weq9sMlm+Jim/zTAGxwARlEJFlezKMXfi0Ko+9wO1IVm6XZWqfvfM1FCpiNjWxAfCOU7he8exqaptP/m+C0dEra9lmj3sWFSwXxeiGBV1QTj3ESETHGkcMr5ZH4pm53UwpU3NpsCYBVW2dJyxwCb/t/9QLsUK6PfeF6UoNRWCItRNlWjxk2qWqaHx3WtxfwYlLGbkOHkdaj/HxF1krcAUq0WX//613//939fgzR1DUBVy7Jk5qKYVlWjqgC3FCayPkmA0MVy8N7XfGAXtoHyHAkfPICdV138bLTdRmAoNU0DcLmubzz37P/yf/u/v+2d74JINplJCFmWOee8F2aOGc699918CtBoswr1IkM9nZjV4h6pOEOhqUJdZVmWu2xcurS9nLuH3DxTnzpmG6V0q0gJ0Vk9z50llOulir90fLg8Pa3WS21KSIAKRBEtN8NF2EY3iHgRrxpUQ9Siq4g+JB7DZun2zW0SNEoznHcBb0SkbIIaUaNkjZ2afEKugMnZzVQYykSWGBKwpSWk7d+3Mhr7WYBHoSRPKWj8G4k4C3Q8fFymSWIp7NLsjUfe+edOgp3+ecGYY2TUP8yosdWGpXzAWwlkL4nQwXGrmpageW4Wi9KwEYEAjTC73GUT4iybHLhsQtY2tTKEZPAlInJ8PbUaqVy7WRUKIlpX5cHh0Z3bLx8cX1mc3ZocHDblWVOuOkNjpw1qE6NrxM7UicXf/9fvLM6WVy5d++AHP5hl+e3bt7N8AuhyeT6dFt5LlKWou7rzh9d49/uSzLT9Nay9MeV+wG4XEO9IIImoFXWTXRNCyPO8qtbW8fve977z89P/uly88tJLIFLVaOc2xmxeh/syrgCwXq8AcJ5JuQJnSjkERCBIrLOhQuA2rn4TiqJglc6ZP1GbtRxWfGwGoS3YxiBlgFUoanSYwUaZ9fT0dpAGIUS1hUZBVXmbwr0WKWiQp5yIWo8NBjqOcMCRjAfpr6LOtEdtZshpzK/LUos0sYgYaVvMvp0D2s3BxKfbNL+Gd3sMbwy8CS5p+0TSiASjMnBMgNNuaYedJHanAL31DBdiuvE+0aR9J11/C4NchK1axNuKIARYQlMFAEEUsPnkqFo3l5946mzZTGaHpph7gVbeujwomroxb3xCICKCAKlemglC1mXLdTWZzZfLs2x6UFcrcAbKIZs30raCda+UFlWxNvfBQ+nO7bt/+If/58HBwbve9a48z4lRVZWva3dw4H3VCmEh5uHktm6poMeQFyzyATwgDd531QUXDhjWfczE2NI06Bn3dZZlZ6eLqqo++MEPVlX1//3//K/L07NIs4moP7DWNr4BABg2RoJCdb1asmdTuFCe1r6YTudsbO3rIMzWSTTfKohYVYjAykSkCBt+qH8dROIUsDGnaFzGrCB2Gpq6rCbOTuezUFd3bt8MTYnIKcQkuUSAoV2J+dL37Wexv/WQEd0120hwzoPADkQHUrDEWqHZrGBeLU/d5Mg3S60XseQN9Y782j1jKn8/hp9ieHTJTQdra2xaRmfD6xnGgbZ8QIwvkKcHx/sa06suePLxnwNcNn6Rtxj0OaoYiDrDqMfexEn3irc4SYadwrhsXq2bZ9/53lt3V3ZyxPmMeSJqghACSMG0MznlsFLCQynM90FEk0QkBCiTMQIKCoEhm5PL1RTCmZscuuKA7ARsoqAWTaoEGNviPgkNotVQ5MXvfOcP/uC//eM/fvPwcE4Q1XBwcLBeLtoZE431RyQoBCq7ldXYr8ROF974eF9PbG/AC5bu4AEGI4+Hii8hUN0Ou2DrluXaGDObzcqyJKKPfOQj/+W//JfJdAowG5MXRVwlNjONbzr6EYiVDcXpknpFskazkPo8+DUhWBZmxPsmic7Sd1TE89sHwtL+IxGSgCAkkbM0ClJYYmYS8evyvD6/AxJYsEVXfEAAEJlOic1K3Cu0N/+6R+r/pSBEMsA8cQ0zDaxyHRZiIrO1/qOrebLySdSAlE0A+aC1EGzWrlhbsMlBDmoYhkGU7s3NbpVkR6cw2neP4U2CR5dupQe9oErmtoSh29EyusuTPB32YZ8kHe1hh+pR1Vb/ty7lHsAmC/IgvwQDARxEZ7OT5bK5fuPt3//+KwdXnswmh1WAD2pdoUpN0xDRJMvrun5DHzRGh2F7XQnBMZflepIX68W9o6OT5fm9YnZYrzmUDYLRmCYVWzpGUjBDQsTp0QBJqvJP3/qHP51PJ5PJc88955xrYiJuqHQRE9Fjrl3esqlec/FOSWH3atzf8+Ljrfl5SGk7PUUJsSciKFVVk2V2OplXVWOM+fBHPnrv7umffPqPT+/dq6rKmCyEOpqWmUmCAgjeU+c+Rqx+eQpXMGm1uqeqk/kxw62rQGRapa8SgRVCcfZIBJ2joraJbtIMLYoQvc1VAwADDt47A5e54Kt7p/ekXMEwTKtIF5FoAhABM4GGPurtsNJXy9yaq30flBIHwLSlx1HUmeSwJQUNhQrVKOeQqvoAYmPgYHQyO6nWp4Ec5wfky9AsCGSJfJdCg0a/j3HZTy08onQr492eYqWttZIs7oGScHsFt9B7jL8Gsv3gl+wUr+P/kld8S67zFG9EgTUqG4EenclWFyIYwC2X1Y23v/cH3/3h9PoNNz1UU6hIADFZBoik8x5iIYxtbESs0DbnaHLqYcWBAevWr8yqqbO8WK9X85Mrp2enB/OT1fK8mBwuyzUotMG41CBW/SZIaHXnBDBxtPkzIAwi+vtvfN2A/uN//p+eeuoZ31RZVoSgrBrinaUzriL6euv42e77Fg/53hsaf/Fddgro+/qodj7UCgASfaq7q5xzVVPVoZ5kuaqu12tj6JOf/ORqvfzMZz7jq7UxTpRVJFYtT8b3Ua1LpEFqDsJM4hFq09QZOzbGtLS0c0JDa7xQohhIsKldKQQC90mdVFUpoItkUSFDZIgl+Gq9lNUC6lE4iI8Mmsbv3U8FYfei603TQyAAkuC9tL/S8FMKeJAuIjIoad7GPuSMFLSJXmO2DMCDRMQV8xACoCaUgIamAoYoa2997sdC9k8ZvAnSdoSt1ZngKeloeZ8DMkJPngeD7CSoqXQ+bh+D7kk5Ob7dfdHcYwDQbXlGiwI2RFdgBNa5WTY//sEPXjl65nmTHSjnlSd2uVGt6oYJRZZp8GVZGuPe4OdMsFPfSgSg9k0+na7WVT6Zni9Xzk0C/OzgktSrpl55v4KUUKiKSkTiSMKlCFAVUQg7bur6a1/7yuzw4Hc/+e+vXr26XK6NzShSJ1WAUo1zyq0+LD1OF//uFx4J8Q94l30DjlXl4w0St3AIwTlHRFFJbp2JCrXf/ne/E7x8+tOfqquGmIGOBKdCn6qoRiW2Bg9mW1ioXy5OswKT+UlZx9DkZCKln9fOZ63lKVmBROCONFtVlRQEX7hMRJaLc1+dwxLYItRRo0wtWmJVhTJar7Qd0jaNAva673Lfmd50flgQgiVWBZTI2KhRF5EmeDacz46sofI8SGCbTbThoBU63jcF3kG5H8NPETwiT3Lq/RuJQNRZhnZsb+tsCKHv3F8ouzzMYy0HdPmN+0ZN4lz7g1g5+AKni/6p+gdj5tAG6W7kjIhU0sczxpyfn7+2nfbzAMnmpk7eAcgZW4UGgLMuqA9R5wnn7GwyPzkvQ3FwMju8XDZcBVaYJhBAxjhIaJqGVKy1HQYziQzayRNEbR7ypKUtB5o8j7bZaNH3Qd+D4sfczqdLAsBYC6ARYeYgcHkBQJSm0/y8rtUUh/PZ2a0fQxvAcKYIQcImMxaBe2/d0HiXZ03lP/dnf5pb93v/8T8dHh6fni2cyxkIImytqgYvxoB4uMhxIRKPK7DPajC4ZGz66bfJ9my8RiU5kl3c3pFJVVuGRKI82ro/dXmC1WROVZsgAM7Ol8cnx7/5m795dn76pS98QVVsnvuqAnqZdvPtMmdCEwCoNNqUAUFRB3YSZs64sm5UyRpHRCEoiJxzjfdoOSoWasPrAYSg1loDbXwDEmstSHzdzIpJtV4ul0tpVmBlR6qiIuRcfBKNKgUaxrltJiSq3Lfo3Uaf2HtfbHTgXeaDjeKbDHrC2SphxkyASY7Tr9yiuPiRW298Y6vaZ5ZdPp8RN0uu1qcSL6RaJXoCtuwjdaHcQ2L+mIb/1MAj1X70y6vHHf2Gj8DMMWlJTxH7NCmv+aa9EHCBiDxGizs7p90Gx4m16a0EA8eZZKcbMlXwho1zRe1DCJTlE8BlxaGdHp+elidXn7z8xDOLZWOySeODtLWSok83SUuJNwO+IdOrg0LGO0Ba3+PoW2TXpZ8fXZkcHJ3dvHN4/UkqDkBWGo0VMfrRBD469RSZA9DUtc2Minz2s3/2qT/+o+XyfD6bhNCE4ImoaSoARVEAkP1eabvfYI8/2gUHY0h54gHsHGTnA+z8c8e+0Ja1i+2TyeT8bHl4ePyJX/v1d73nvQD7JpgsQ3Jhf9A0IR5KaJpyaUjmswmkPvvhdyhUE8fTwhqSyGqralP77jVMDHQmMgQmMJNRH7z31hjHLKGh4HOD9eJOuT6XsAYrsQBCDM6y5AV6wttyfvs+zU8O+xDLhXuBpfOGi38rMZSMcQojashmbnKQT044n8EUGiv3gFWNdOXF2oF2PNBP/k6P4XWARxe3jW113I7tHfF1CLHwdio3M3OacWWMPvZhlp5m73uwnVhv3432oi3ahZ7eOrA1K12FIvVMrIJampjds649FQducryqML36pJseky3cRE8XS+eKsD21RBfw9uN0qhsMEyXv9EsNaM94tI7WttpC3jK4tGP0LYGsGletlsW1p8/u3Dy6cvX8rsr6DAiA7wJromZWAFR1ZYwJIYgPxFyV5V9+7i+scf/pP/2nPLN1E0KQzFrf+KoORZFVvhF5IJNN/3Y6Unr3v4MVvnPMi/fIoNsFPfv2Psapm/mNTEmbGkIczcRNE4xxCn72ubf/7u/9h7KuXvzXf1ElKItIb3ToX0Sj358AkGa9BLs8PzAHk9Xi9mR6ZF3hRUlgba5EfeJC6qP72pTesIQmeKZgyDDgfQ2IdXy+vKehAcCOmTlIoBiQFvwo6VInD7ev083DtpdY9/8t4Zw6XrDv0H1Bpk53tAuf8JgHIkpqclJM27YJWCVqk8AxM0QDmLkwBYNtIOMro030QAjdd2OJrhZbu0/2mvAfw5sBj+5LDLDDYP2lZ3uCjRHO7Ynr+OyY7qbt9xUUBg8wuOq+g7+lyfYQIocl1rkQS2nbAlyA8mJ6UqvL55euPPmcV3dvUYKchDbqj1uv7g6YqNN5R3jwSX6jRHOwy4t7Z0s3mcPmNJ2f3llMpsdmegR1QCZt1rN2qcR3iZl9RSTLMgDLxeLP//RPPv/5z3tfz6ZFWa5EgnXsfR1CiP7MO2XihwWMVvJ4De/cFzte/UKV1WZ82kHUdwrcPXgfiLgsKxG8653v+e3f/uT1J5+OhdUhtElelnL8AmvZGAJCszxryrOTg0moF015XlcrSG26fLtdyT5VhITPa70dDcEQGIG1Yq01lL5aGFTQNbQ2JIZAGo1r2ikJeD+F3gPRhW17QvYdjPtc0Die2DaovD3VsaFQ05UqFJBXFsrVTk1xaCZHJpvBFSAHclHsRqwc/hh+iuGRuqRpxzXrtguYtjbjjXwQtXZ9n/hnSkTHI6foKeHNVbc91MaYC7uo9XCc9JLkXRAt4iZqBN6Saz0mitKNtjDS7DzLy3oNGHa5NIK8mB9eqjwFLq48+dyq8sJWNJwtlseXLp+dnVkT9ZBDi2FEP1tfjTam6mHnrV4XC9nd43eyu8bLWzmlz6JKwFY1qDqIm06rUEsdDo8un1bV8rw8PL507oP6CqHSNo/qRuHY1B7EzFRXVbxXWa7++x/8fp7nH/vYx/Msq+t6Pj+YzexyubS51V1eaRe8yL5VveNl96u77j9RDyBtt7Jx3xIfL+kvoNatLFpglfLJ7Pz8fDKZgGm1Kn/pAx9yhv/f/+v/6/zevXi1c0WXHTb+kEAR1DlLBO99vTp/+QffmRwch3opIq44IEajMY4MXa4V7t7exAKDITSZgSEgrEMoEerQrKtqZZ2R4CU0KkCn9lOhXaiyTzS0c+MTAIzpMQx0y2O8l7MB6O4sK8MMVEBMGZv82X9WANxKy0Rq0IbhdVEeRiBNtA05m1nbaA0KAYRQQwAVVQjtz374GH4K4FFQmpbRE+l/U7Z9QCx7JNUTTozE4geUEsZkOB1Zd0F/r51nxxDd3B7kYX4+QRP5Y3sOmtDGW4sSTaYumyvZfHZ0dPWpqsE6aBXA1mVFXtd1dAjq8ipvonWEOFH3PYC386jL/a7ikQilY2tlikqFwM6GqinmB8t1fXj1SdjifFlaN4F12Dgqt3jbsOmfJK4T65yEsDg//+M/+sO/+7tvHB7Os8yen5+J+jSa8eKFel9AstSxa9lvJu2BxxlcOLh8x+fYDVtMhveSZYVzedOEsqycy9/1rvf8p//4n2cHRzFne1+enJmJjICIrarWdR187QwxPKSkuqzXS18uJTQmVrc0xmYxDEEUoTOCCCCsQhBigTZNvazL86ZeNOtzv7onfgmtiBrxlYq3zM5kXRKhcUqf/YbtXUL2xVL1TimcyOyQqvf8qQR0wgNx1Fe0ucrjhJBhYuthAmXqJpzPTT4xriCbwWRoc7kgTZ2eWF9GbPJjeJPgEUnbcb+2O7A7Rk+P2228Waxp2a7xOP3xwKS3D3cgIfxjhDXus6ND2picSnHWW1VJvtvzNAS1LvNeAD04vBSUvbqTo6twh6+eLg5n8/V6ba2dTqd3796dTqeh8V2u73YyJTHZ7UAYujs/eVpnqWsBAN1YVRNP8p3vo0jehZQAbdNWKWAzV927Nzk5KZfLIpuuq/W1J5959aXvqTFMToyDCDSNeAuAJW2Th+R5rhoAcVn24x/96M/+7M+m0/mNG8+JD8vlcjKZNCH08REtlbtwXT2sbXs4iw/McV48DjppmwggidFW7eZOwka63aRofQq4rvxsNvO+bpqmKIrz83MR/8u/8qt37979yle/fOfVm8F3RdZaf1VWMLOV6HcWmtzmAbRanwFOlOv1SslxNiWXKZM0VeS1ACFiqBgQsTBBQ+WbKvjK1yupV2jW0KZeN2QtmUzEe19nJkckY5sZfi20a4uy7vSBTQzS6SVj5VO3QzYtumE6BYBym5yduknvRyMiISaFgIUokNhiQqhUNRCJCsRfxIs8hp8OeATSdl+cJ2KiFo/0cuqA5kXSHrPgayedv+4UcUD+9/XBiDyPZYt97MLPIVDyO7LzpaAEtuR9QDGbnFxdeRaeHV5+Snl293x1MD8qa2+zgojOzs5ms1ldlynNThBHHL+d3vsuA9JhYYbXADFXJcCt1L9d3KlaLfKjg/V6bYwJSi6bni2qa0+9zUsGnrCbkilApl8RhqOFVAlqiKtq3dR1URRNXVvnvv2P//j7v//7N2/evHzlhAjeNz2Dmy62wZ/jdbhvMe/s8FAwnJz7+aMB6Gj27tHSAwDTWbFaL7z3s9kMbKuqViVriv/8n//nD7z/Q8VkCuJOBBRVBVHUcVlrrWWF1r5s/BpowIFMCM15tT7VZk1+FaolERE5IkMwrDCkTGLgCxcQVr45RVgirFAvoBXUI9QGwZGweg21hEo1RCe1FFovcn0gGt6u21Hy3QdAa/fBz0MPoT6tOkVGk1ptPPeROxsmLyh8IM6OODvh/AjZlFwB59Kh2rsAXTWgwca8wEbwGN5AeOOlbRJmiIj3nsghJgU0pKptMmERaPSQJBGBoVTI7u3HwwXao4AkSFF1QI/RWtZUAVJV2S6JPcAm8XZtWDYUBC8BEWkSmJnAIhJUosNHCIEJ1DmsdmGpP9swrJ9NW+c66OtnI8rZhFi8oRV+iSGBeDo3xfHaZ644np48JWZ6vi6tzUNTWQZBoJpZE5raRAK5UUZvqLVqq7VuBcfO6cm08ujQQ6JNedWuFulPxcLLgPRWvnacdv1E5wneZHiLsblbBkQQNGendeNAqkGUax+Y8tOVnx8/tTq/I4GJjWGE5lwB5+CbEOcjRnFHv6a6bAisgQD73X/57h/+X5/65O/+9gtve1vTNGB3++696XQ6n88WiwUR5Vm+Xq9di0+HktC+FAipDTtd5+kqTRMV7FoLABA2WooLRXNqDaikzG34L7XbMYqAiu5eLe8uqlBREpuRqpR1pao2K1T1bLGeTfLf+refzPPJH3/qD6HqsqKpSzam28ISS6gRgyjWX/FQaO2RzbQOZVhNpoeHh1cWtRXOQgiODZP6prQWhUG5uteU9+r1GapFW4sTCgiphNKrDVk+D5C6WsJpMZsHIS9AEACGmIkUCBFTRasKUWcton7+VTasLpHpXLK3oq63v5rBNjE23FZ37b5BbxfnZOSWsBJAYEbvBt7K5QrmLs85KwTCIAZA9nxFs+nTmVtWd74HXaLIyQYt1zEMhMEEUgSBADCGQthY4neR7a2shY/hDYJHyChpTC2U6MpUe69OVW2ZdNmipkiQxYDEpo1j4WDA2g9aLrjF4Hfv24xGuLj/zzZ0ltptgTseao8kIkJVQAXIJ9JoU9Pk4NL85AlP+aoh5TxyPKRj37M9s9fR7EHzeMJfq0pmu2RCZ7/UqI3c4VKEaDLsSj+ywCismmwyP+Fsmk0OgieyBQAfhrfocG0AIBKccYD+/d9+/Stf+es7t28qwvn5+eXLl40xd+7ciTqn9XpdFIXuB+zaEdKBdvxon5Ko7/aapus+MH6kfTbdliNH533fYnyOBTPqyk8m0w9/6GMf++VfAZmmqWPCL2MtMSdMCUTRZdLzYEUoSUvHDfnV4vS2YXjvM2Obqtbgjw/mRn0Iq1Av1K/hV5AaaIAQuc9o3VXfiC9JPSGQNt5Xqg1DiDXGO6gqlPdR3/Q1ASR6qYvw7e4FPPLXGJvAt862V3EMfIg2BaJRbZJu25KblMGImRxcfsoeX4Un9TD5RCSu7ZZPiC8grafamGY/FrgfKTw6T/Jtqtm2tQLzBgOpqI4yAm1dnv4JtBL2YPxxf4wI7cWN/SlCK20TUUr0oyiBNoV0a6ofhjv+DMJIK7rTstzbnZkQLbnSuqxGQZydcfMQrJ0cTOdHWTFZlirB71NIED2QurG34+7jqygtvvkGAgOBiBRCBFKiLu7r4Ojk9NUfZNPDenGbs1yaKsnwuj0EQVWasAZYxH/hi3+h8L/3H/7jbH68Xi5EZFrkBG2aBqq+rtriLLtAd4VIxLxpvUWzvWn0i34A7/QNPCQzNNhx2yPtGGrYpy0ColVV5YV75plnfu3Xfm21WnzrH/+HNI1zrqmj8VWJYB01jUI7FyoDaICoekaWi/i6WRTFeuLmEqrjg2K9WqwX5dHh5KXv/wi6RlijdTcHSLp61VCFQr33hAZMGtlPQyDhWB6se2gig5hl/6L5oyRV6A45u52WXRzAbiUKDXlnTc5GT/X22mT8NvMabV8JtSwhBBhMpseO9V4VZMUwAg4QrxCBWOLoj0C65bbxGN4seNQuaejoXWwGVERIuSfbCmgXfbBTxhociAyJ9IB+pw+ws3HcOW0RCRuyHYWY1gWLRISYRCSSdhH5OSDb93FI2VDxmBRUohwuiMmYGGRgc7g8iJtfenJ6dFV5sl5VAmutQ+tfu8MPdh8F2SdD7yMJbyjZ7nyBdNsFT4QQmjApiuXi7sGlq+e3XiqOr5Snt8EFgm+jy9oheiwrzEZEmTTL8rJcfflLf3l4OP+3//Y/RJe0uKKin0fTNJ1T9BAueN10ino6rUkQJkbTuOOVcX8CfwGpHj9A2i3apFS15Xt009k51zTN2dnZM88888lPfrKq1v/yz//YJNKeqhh2cE3TqAYwI3L9gCI0vqlNxs6a9emt+QnPp/N7d145nB8w4aV/+ub00nx1ehfSxDQj/adUcOixUAhAHTX98esxWzCBuBUVyOxYnH0Iwa7Xp1F81049xAWnqAvLTudK9/Tf15iAghrrSBXrVXBmdnL52ZWbrO/+CG6KZgWtVSEkpOlbpRZueSxqP3p4pNK2Rj42apha27ZoIm1L63W6uxYI9sjQ6e/4z1Q4G6daS8jzRhmbjtM7gKr0PsnRkhS5ELSP3fnLvDGT96ZCgmmiQL3zJTXmo6AMZk7Z3Ljp5OBqlh8t1tW6FpfZmCwMkcDH+SfdvnzrZh2C3/bi2XyUIQLsDt5waYCVhKDaCVIEUjZ5tirXBwfHy7M7l558/s7tHxeH132z9qu7AJAEwlJUUKhAxRArSVnVAIIv/+j/+u/GTn7zN/7dfD5/6aWXbJ5Np9OmaVxmJQh2aEyRZqsekMaBeXtw4c7GMYwZ5Yu7XdCyc0DFcEdHcEXu1365Xp0Uh88///xHP/rRe/fu3XrlFWtcDNdWoCpropZ0EEECerlWykWpIZswGl8tbi/vvXpyctKUp+dnp0dXjk7vvgpfAQ261Hj9apKNQUgRGiC0CnGQQphIYQACWWWWyKYnFBRbnzmRTUci9cYJN/6ZNGqa6SyZGCWAenm9lakTms3AxlN9MKE7XTUJAhVnnXiqqwCbzydzmdmyCoyzwITSgyRIfOfuMZJR+9/dPjAXspWP4TXDI5W2I9kWFWq9xFsleUesuad8Y2SRoqSdknEqTKeX97S/d8cdWPguuBD7dYSdMMSR6YjlT8a75WcPhtQTbbYHYLw/sZE6GTCAA0+QHWT58eGla0LZci1BnXUgMhBP3affuuED8Dpjpe5Af/ggFOh1AdW27PKWwM0KwOWTs8Xy5OTq+dnd6eHV1dndzM5gS4RV23nb3MAMlXaZWYemUcB/+lN/lLniE5/4xBNPXFsu1+v1uvNDbt2Ohs+DpFZ3snpTmp0eXEzLd73w1iB75mSHWD84e4FpYzBUlO+rqgJ4Op02TSh9/b73fcC5/L/+1/99eXYGgImNoeBrVTCDFaFzrDCOQwBUtFpXSpevPnX7pR9lx8fV+e3l2flkVpyfnqJegD0QQAEgjJKLdNmUGRCEmgwhrKEhqBJnoEw5fg7uQxD3Cbv9t+i05TtypwxG2JzVrWymY0l9p5w9HucCvESkIp6pMM6qmlUFNgcnV59bnf0IkCABzRJoRPHz4HD78wKPwJM8WXbaytodymjJ9kiFvXdj7+L9t8bvYSf6SBFH/7t152Tw+CvRkzyajcBRwAZAYFUvKqA+FSvHUrg/87DFV3NSPxtoi0onPdsPxuAMPEVxNJldzg+ucHbcNOJFmdkZFvXapcZLCMxWfFdy772K1pQ+7aNMbyQwRvW/waogUQ2NZNODu2er6eSwWi+z2aV6ec/mM/UIzQrqoQJqda6kMMY0EgBMiqyqalK4zK4X5//nf/8DFf+bv/VvnDNl6a1zoanZZUBbD6qTubcSf47ffUAv057jqdsHuitf1gUj0GC/79qD6eU00pzE9K51XTvnwNSIr6vq6PjgfR94/9nZ2V/8+Wfv3r0jKpnJg/eAEEEiR0QghojvEgko6sXtl1986vnnfvT9H9YhXLr6xJ07NxE8WKAe8Om9u7XMINK2MJy0c1CLySKmIrEMa4naMmfYQ4N3Tsjgzy73+MZ7vJWVOw0TEUWfhmS/dF+T0lzoG/I8ptnKRgeP0a8iUqZYlhzGZcGzF7GGJvmhycuYqlaYUS1Vmx1W7XRITRseLCPNY3it8CYoyTGWhrHVmF7SHxhjdISdNdFLD8jwTqfZwS1Sgr3zFNCas7V1J0EMAANgiKNfGjSScB0//88dRO+q1O8arUsPWRgHO3OT48n8yvTw6umiMa7InPW+9hpY2VBAJFwPCReIJmNm6w0F3UJMXeQVFEDwmuVFaDzbvPGYH15ar5ewlTPw8CEEBE1c+QCgaYJhQ0RlWRNhNssXy8rYbL04+9M//Ywx5pd/+ZePTw7Xq1iMRGXDJPWPA90W6S6eioGo/VAzNt4gF/w5aNfEoJ5ut9ZYu4vtyLLMWrtYnGVZNpnMTu+dTyaTX/vEb1RV8xd//tnV6rxp2qVnjA3BAzCE0MoCYEtECD4grH70vX+6cuWab+TOzZcAKoqsLBctzabU2yB+TQJBRQnCLX/lAYYGlUbbDN8u7nhgR0oJ6sKxfkLYmMO3LX37uIQH0VoNQVlViIyoSGjAuc0zVV1WJbsDowrRAOMDUJ8LhPpSqu3lO+34j+ENhzeebKt67/uk4kzMRCKBiERCG1kblcwCYvUhtEG826uwNYtuG6SBjfEnxQjaBcAA6BOubeVlSy65mF0gJbR6uy5FDDTq0JhZfBPjarKsaJpmPp+f3V29rtP3JgNtIjxYOo9d5lg0IrqmsSsOyM485S6/dHLtBtmD00XDNg9igkiswEx92My2b3PPtm1THSQtO5iqfW47PcfW0wMkFKJ7oe2W7l66raEZy/T9gwF9aG5E+QzAOBtUwAYCAVV1YJNP50er26fGOLa5eB8Dypi0q0zFIbpQgVVluawABO+LyezurZv/x//x+8bQRz7yEWpVPmqtFY5JAtqCeNba4Jv+fXd8vl3pytP+/dnUt2Pr1PZU9/33EYm+8vfgAQYx4v3W07C1GDbdFE3TZFkmIkJq86IRFQkf/cgvA/jMp/44hDrPJlW9rmsf/dF6mRuASABADA0A5NbNl9GV2yrLemPq3d762qoAt9rieKFZGzfJstmiKolYg3A+FVFVY9kobyopRJBtYYCIYm2u6EIbU5ZyOqVMaKXfsYo7MWZ3/+NERk9LzJvkEhllPu/c4Fvuj4iYcgDEhomVVBBAIJNZlxtXnNc+aHNyeXb3x/+qCJTm/d1id9rDkcz9WNR+Q+CROAEmdHSQk3wg6fYUV3fBOKt5P2YIYTz++EZI8MVgnPFdBrcb9AkhRHakJxXW2lgy+WcYaPyXdAG1Xd4NMgorAlVAmdy8KalBlk2Orzx5owncKIGdkI3pxtoq2jFQ9LXy5q9BktARN/a6wJ5BObJzUCa2RCSAgJTo4OhynhfMGbIc5FQRQmogGCdFl6pas6H14vzTn/qjv//7vy+KTHyI/uSxPoaIOOecc8vlcu9z3s8LZLBTxt3GA6aNO3fo+Kbjq3Y+atrtAv4gQCez6cc++vFf/cRvAFzVNcAEQ4g0DOjZ+BhxHFpxmiAETwiE0GbqvgB0K5R/Yx5SWZzdnU5yrVZZZqReZ7lxxoiEyKzE+MZxSuaOGTK9YXunNnv3sySJLvr+D6iWv1gB046jluAACIlyQKuw4ABTeXPp6rNHJ0/dffn0iRfehXwmyoDt0r0Rcev1cmERpcd+5q8/PBIleUcFQwhKIHDnPipxz0ZnNFJGjAfjvbqgHi/0qzCy1Wl7SqGxTaexval24poh6onIjZiZ2vdQIoKEoKqQKFtoFL7zPH/9Z+/NB8Em9zcTWBRQBwJg1cyQTdVMrj39Qh1cMZufLho3KXzoQ0PScJHo7BsTsSkg2NRYizqWNvy9n/++GvZQcBwo69BqR3citNeiP9wPA/zXWiLjrWP9uuixAWWRLMvWNasQs1VuNHTPk+DhKG0BACQGPhlrBXLr5it/8dk/Pzo6unHjhkC99yYzxphmXYkPLi9cn4pyl5FV95e8wy6CSjvN3iM6u5Oib15mj0upbisz0r2ZiOChk/YpbJTYhC5AlBSBcXL50oc/+pG8cH/66U8Bwpa9r3chi/b/9xX6tt9HBqc6T29qfGXMZHXv9vTK1dXpLXd4Al+zyYMIApgZhgES2UzsVrR0FxdOXeQY9fZsRRc13rZQ726WPk37abifse2ytga4ILd5ZGC22mPO1/Y9SQDfJk8jgrJ1k/V6eXT8pDH68s3vHF5++uzlF9vabRRTbLQ50cJjofrRwiNySdOOchOziihislJtCzz0ajQa6rGRoKTBho9n+7jtMRrqKTQR9VGwO4l62jJ8gC65aXc7EaW+RqcqiUgIPt4rFlT+mYcRppYugxW1X4ja0rxuCnPgDi4/9fSN82Uznc/uLZaT+UndCLrEoK2vUDsSKxlsPii6gyGBGWD/vnGnuPboYKMk3E7OrNzhYlIEEQ8ocWAKIQRmttaqNL5FqcIck3T2eWQ3EEIDwHuf53ld++/867f/7E8+88l//3tPPPGUy4wE8fDM7L1H0+R57usKyXQNie4eGEvA++Rgwt4533fJvpadYvd4P7a2i12Mu0BD0/zo5bNnn31uMpmEED77p5/pk5Z33gYYPMJD0xSSjqmMjm0AYr5QCqFiV6zu3eEsb5antpiSJWZHpKIeYpmZCCEESiXQyNgRUoq7dcMtNi5lv7Yc0bU9tdfVY/DnBdzqRuLXtrI5dV4asdE5tzg9m8+KZVVdffLGojw7u/PS5MqN9Z1XEUpoaPc3deFz+tjO/ejgDSfbRNS5YQNxcypG0rYAgBAljh77dvs+4fi+ZPsCWXx8l/6gTazcKvpJpW9gVR+vjooEw24+n7++s/cmQKyfnZawAtBiQ1EYKIEsYJBPbHEi2cmVJ16oAk/nhy/funVy+XpZVcxmK6AVmiRKTM3G0c1QEjnPqG5KZ1LH3PUPs5Oc732VbYbvdYFOjAKw8fhFzI2trBpIhQnMSqwG2qzL3BnHdrUWkTp6QnW27dZVIB1fBJmjptGqqvI8r6rmW9/6Flv327/9yaeeeVoCL5fLYjrLsmy5LoHtqsu7WN6dCH1nh/tK5/efnD0+7dizvwB03tEASNUDUA29C0Ji1m3/eQnHl05+9PLLTz/5xIc+/OHl8vwrX/qisVno8p3F9PI7boot6g4kZGbrebfcBlOSb5i8iDQlYIyzJI1fB2QmLxxZU9e1enF5LsQhxFVH0plCiNqqHmmuodZvPMq7lLakRDeN3eJeYu7lbCJKl9AO0zh6pqFvjCJ1fKrI62j3nDHJmixXp4eXDur1igk37y2feOYdLzYqXJtirTVJjGhHaCuGEba2+2N4g+GRKMkTW04k26I7pG3VNpQ7/f49TU1LEW//trafPv0yEvG6/zOl4oORx/QeKbaK5L5NrsKbY9EQYl5fE9+wKIqjo6OfbUcM7VCbYqgtjPtdATJgh2xaTA+y6aXi+LlVYyaTyZ3TxfGla8vlsphOqrIxxoz28VaQ6z4y0KsH0xaMiff+ywedMaJVPymQbL8apcZpZiYWNlAE8n55flcyS6jqpoR0it8Io0kGwXIM4Aa1scvwTfX3f/uNyWTy27/9yaeefq6qqrquoxnVe+8M67aX2QO9AQ0tpnup8pbiacg/jdsvkN0HZ8cMxPjCAW8NIM/zpgl5nr9y89Zzz71w9+7d1Wr1D3/3DQKnTGJcRF34NboPtCFaezbpRTs3SMjzSVVV1rlmfTabHyzLGtwoQluAJz5nm36UqXPaamXfmHZ0K8XQXkf0nS1b7Mh+eXrYP32G8b4j6XYc94lRATUWxN6jmeZZWVZamhfe+eHv/vM3MjfVUEoIvX8qNAre6dSlqdN+ZpHhTzG84WQ7rmMki0lERGNF4U7S7dKttAQcm116gWzd3mDgmLon1CSl4umzDbqN79jZtlvdkYhIVAYECSHEgngiogpr7Ww2e31n782A3flZtdMVwjrOpllxUMyPsukx2QlrfrooJ/PDsqqK6aSqKmOJ1Hcon5UUyoqoZh8S1DGGp22ZO+n55vPzwgIkJKLHwwRV5agqNFD4ql7JeommWlfnUA9UXVmUZDKBAV7LMletGwGco7ppbyMhfPWrX51O57/2iezg4OB8uaqqyuUFM6tsitrtlK0voKDpmtfXatsec0iDHZQO2J8a3Gv8SO0u7nL+g1o9kECCBCUcHh+9fPPVd7zjHUx68+Yrd27dEgka2jDzuGPR5+TUnmajY7N2k5OeOx2/urW2qtZ5nkdFyGp55vLDYKiuK2JvjDHGRCzD3C6QThTuo6u7DxrV0Wo60XozezsP9tPyoZy9dWFb84tGZ0lVgyqztpoONQCTRt2GEGN+NPvxD7/39HPP3b17N8smAnvnLFy68ly4WwWpRCQ0Cun0IiPU+phav6HwBrv59Xuo2wFxZ0rYENk+f2iAhs5tMnr1xG79r4ioIP7GPsk4PfncOIEPIN5FEth34eDyTWcEUS8iiiAi8VhEmhCitx3zo4uDf2DgvV+Zkt8L6mf3HuDEYAc3ofyIi0smP+HsaFWrKM2mB96LMbapQ5ZlfKFraTvqg3nD/rSBETXSrmclUiIhK8QgAyJiJQ4sNTVrWZ3i7GYxy0ACNCBlY9DKgt1wI6K4XjdKMIYa34qk0Urqq+ov//Ivv/bVLzdNVWTOMuWGNfjBCh//mQ4+3hTjzoP9Mr784qEGZ9Nh+1Pp784PrYl1Y2tkEkCcM5PJZLVeMrNXPPf8237nd36XjDPGkmm9tUEChPYqHWf16Rq2VLsXUZroT2CMqevaGa6rNamQNoUF6oWWC8uaOSMi6gOTA1hgkz0VYymGCr99U93DQInyIJcA6MM2Uiq+zUMASOuK9nV4W9e2s7OzJ5555pWbr7osB5u6kbL0xfRkcvR0Nn/CFieUzWBzUGfept5pv52wx1rzNw7eeNs2jApi+AqTqerGZk7VE3O0cYtIG1vU+32ptsJLjA4G90I4WgcZQqdZl2ZTwT61YcfjtF3aqEqzjV+g2vu1JU+9EdMDAMKGzBNYfAiixpCIeGmUEBG2sRaAMS4aL63lGLHz5kmKPKyfjW2po+uW1M8GUvwSXXEYKgwqMLk0OXyiksns0rMmO1hX3lkjkOBrQ1CFYdY4YVFJCMSKbp23y06tbLS0bbwRu1Mxcizx/I+trXNBigEVaBPfqKaYzvRormMkhhi8txH2JcgoensrY/uTEYRUSRuGqskU7MECkmh/ZYL3xE3OjVTL8vwWqjNjpTx7BdG9SSG+K1mRDMwUhbO2kLQCqpDQev7GEnQAQKZeL/7yL/5MfPmrv/KJg9lstTonY4UNsYFyCMJMzjlVbZqmr8+t2uZ+5zZnUJcQfhdv1NPR/utQl9Sy33ftvG0ErIHEHL0Xhi79MVVDF6u8IT/GpKSoy9nVPUNcGV0axQAVJQ3iIUpEQlrXNTO/+z3v/5//F/zJZ/747q2XQWBDEmAsgm9zC6TP0s39boF73y6N7xv3dRM8AIXW1cr7H08nx4EkLE/t9NLEFZWHwhJbDR6qYGKjECVujDESSPuAqVYNycAumVj7EMENRAwGtN+xe+gNaW8diYh1294UDSlxVatEj9FoaLcAiE3/IYkAGDL5atlM88NYyzSzTM6sG8mnT4nmqjn4FZQ1NEBhDCCtBUwAwHarR7YndMzNX+xn8Bh2w6MJAOu0cBvFdgyTgLbpVoBePdVih54298eRZkv3i65lyOBH+tqbtQY8+9iq19PjzfNeYOpW7R1nRNpbqKoyCdS3j7eR7McDvnmwjadSTEZbh5EiRtQSY4xVGHBwc3Lz9dK/8Iu/eHcZypqNnSg8q2zKbiqBNPHABTr31Ji08kEg5XL2cTyp6nWfnfWNABPNlKJCUXXLIIA0SJM74uCXi7u6PiWtMvJ1udpS9esQBTNUREJcqFsUZYS/NLgsOz87/fM//7PZZPrxj398VuSrqnY2W9U1KU8mE2tt0zQhqLVZskd6iGt1ryJk7Bagkavtj0edx7Bv/geD93zDzn23bzMCUITISRK1JQBU4KHvec97lsvzP/vTz5SrMwkBjOCRF7Zae+revYPXUcUoGmpfnYEypcKXS87Z8iSQEVViC4AMoF5USAIRKW05EabT+Jo1TNsX8vbe7jokZoKeOSAiTWcjDTpTAkxkAaJLXbRYr73J5lcPM3N6u2maBfIG9XkIIIWhdLlFlsQMXPy6J8RjLfpPAo9IqRu51J7IdS0ayXbnkbvXgRwjBV3fnpLGnmwjMWbHNZr+2Q9FnavamDaPxx88hnZJV/rG9M9+5J945n5C2JVROoIOjqWl60TRsV8l5kMWwAIG2RxuCspu/MK7z5ar2ezS+XmF7foC7efbruWVfNNWdhqg7PsS6XHPoQV3v7q1H+F1YeMVUFgAARQjAYnEEAFiSRhe/dqXS61XpBXJVsprAANURdH9PPR/9kbvoZ9ahKYpAa6r9Wc+82lj+Jd/+eOTyeRsVRk21lkRX5ZeRIwxzPA+9RCOsmk83EtW07kd7IXXixlKRxvbvMc902OKsU/KICXiqAiOrLiIzKfT973vfdbQn/zJp9flQn0NRlVGsXgAr/OubJqaQGpNqNbO5G5SKIIIgYi5i5kEoLYL02hhL81OcpJv7wimLtvaeK13huzd1nGM9khHtreG2GlTT9RXqhKcy212pOGJFUm1LsRbhIWiCYAxxC3e48ji/lQILD938Ehc0kAxi5n3PuZljNtUVTqyDQCEYdD2xVJvf9Cf6iFtj7rxxM982GdAXwc3ipcPTqUXbqM5ZmMkhN7vPfFlfbNALhIvWqVGfEIhgDqdiIAgDHIgBztx00ue8iefebt1UxP09PR0fnBcV773U91JWdMv2O/8nZ0H23tAv/fJ3BfQ+Pte+5qAQqsoUgUzhImhgUms0Xp1HqozphBYtKpUgzEm7E9F0a1DBthZp6o+dPUttvoBhJjwIMusMe58cf7pT3+a2Xzowx+dTCZV45smJtmNtvOUE5WEZdGNvWnf64355hH33Pfc91IXjDyg0CkPPTh1wSfTzh0mGRP37p0eHh6/973vz7Lsv/63/03Z9gn+3lAwoNDqAESa0vuV01wlgAzBRssNwRjbBsKqDqnpAKiL4R7TXWznS9kc7/+k47ukww5ocz/OmHj3LcZqVa3Vmtn8am6z0zv5yhvlAtU9ReVD1BtJG3X24KjvMXV/GHgkcdsK772qeu/JOAlBVcBtdtwYTAW0ZpnB5WM6PWrcTbaxTYATEjvsE6FHWAMkokqqPRFquZCoO+xGa5X5RIaZi6JYLev+UX8KyDZGuUHQy9aRHd5WsSkAJQ4wUAt1mBxm00vsJteu3bD5/HRZTyZH7NerxXI6ndZ161twAXUcSAwAiGTQeRDDvbmqV+qqxmAVtN9lc2364UYCSvsAr4+0TQCMMKmqgbIBQ6GepVFfSX0u9ZK1ZvHSJsjcWtCKLVV4T7OLyTRzRVU1PqywnXpz4+8RxDlT1zVQT6fz07O7f/THf6SGf+0T/6Y8PWt8XRRF5qKSvK0h29+z+yVsLPgP8LLaPu+gZXz8gKOl23OsHh+Q7fFdNshBuXu0KC+KiExms1t37zz9xPVfoHd88nd+99Of+WNAVJsHEvdeB8OqcPRXbWxdWg9TzI6DeC+iQsY4hlOOqrtU5B1Jxl0I1oBwRiTT5xjf0NGkItyDyO7bHTjlpdHJ8Olvpx7fXG4NNU1T1jDZxBX57MgR8nJ10wdBOAdKQFTBUIZoTDK7WfNjTPizHC775sEjUpLH9N1N0zi2QVqMFqVtEely4Q95yQhjZLG9vXUA/YmHsm2ng6cSwOAZ+lMiwm3VcNEucNZae3h4uFqejcnGw6K5Nxg4atTQKTl6iE8ZNJ51yOZuciWfnxSzy25y6WyxzvL53bPzk+NLy+Wyrst9UnWfcWknmk479+29zJ1etTXC6JJ9Aw6+8liaf42gLMZBlUkMgUkMfAiV+mq9uOvIa6hCeQ5t2DA0hBCG2vzut0VlyuyKzE3BDsxAzGKx+SLU2xwIbIAG6DKpnZ2efvZzfz47OLzx3AvXrl1bLBbn5+eTySTPs7IsY2B3T7Y3hPxCyWwwsfoA1fnGg+yeue1N1++vfv0MdtwgT0M/PKLviPaMSHvTpgnz2cHNm7evXr363ve+v2maz37uz1U9QA9BGB6Su4t8EMck5lpDCfWigcAWJDmRM2S9sogQWxUKQa3btgAPSKkOG9NuNCLP40HSP3dqvFPYztmy/zW3fUecc8HTspLCZbP5EyBXS4A0qBlVgDaAmDZ870Fm/jHlfmh4dLZtVfXeGyc+eCIlcK8k73HL4KoxPz5u7wKrVUe25PvatvtuA/QxRiLjx5AuVWq8b6wDZq09Pj5++cc/3PkKbw4MxT0k9bPb6RokSgAAMMgiO7Szy/nsipucTA+v37x9enh8sl6vJ8X87OzsysmlV2/fKopCiTuvwo0M3SN8bLKOAwC3f7Y+w9iWvHuZe+sNesqNjUTen1TV1P0YI/JzMUp6WAhQEBkiIBB88OtQnkuz0noR2KuvoE0MZrx4HCVAGcZm+SSobSqVYPLisCqr/tFbet39XZfBOgSPqq7IcOayV3/840996lO/93u/d+WDlyyhqcrc2dw5hvS57lS15RDaOdxtMUnZI2AHn7r18BdqsC9uH6i1Bnry+w5IYPS1tjr3a1VfVZVzJismr9y6fe36k+99/wcWq/WXv/RXCPXGSERvHHkQCT5GXCAQZ2a9vufcnN3EwsawVahlxBxEmwiX5L3MmGPo2NZBTrRI4BM5O7kkzUke3c2Iu6yoRGgLjsaZj06/pLRhKHvmeOOpHvOfEmln+ma2MNwEqQUMa4rD2dF1NtKUHEhR3oPWXsX0u/j+KDBdk49J+P3hEZHtnrxpu+Uiqu1t29wvxzG/Hw8GXtkJFtiM3O//FBdcYNtOHyxy9/3g6XG/uwZn+z97noCZp9Np8i4/BWR7N0SWn9Hukm5uCdaw91HOPsgOLhXzq9nssskOThfN7PDyclVn2UQRnHO3bt88Oj6qyhoPpk54YC36g71AR13o9SXL94OYWUIRwAFSaVP6ahHKRZFpvVqK1IAQten+jCEJyXtpInArQMZlU7Z5XVNT1rBFMSmq8m6H2XfgL+/BDCIjIVRlSWx//P0Xv/a1r81ms2dvPH/lyqXlcr1YnDs3zI2f7Jc97zUK/YrHuzJpvJZVvZOvGuzE7efcsrL3SpTtnn16OFMUtqoqomCNu3XrzuVLVz/4Sx8uy/Lv/uYrfe26B3jKh30tADBkRAMgzCQi0CrP5uu7d5pDTF0emHxoCMRkYKyguf+IADZ67La853Y79v15wWhELX3e+sR7BG7d4+NJZBovUHZ5FpTWTWUNzy890fhSWSV49QHNmWoFAjPCg4aPPIaHgEfhkkZsmqYRkVg9NzZ2W1Y3qEHb/jvHGeOUCL6NhaUOF8bxWtEOrVeEasdShrCVVSql7iniSNmFgY4InaZotVo555g5GhRDCNbak5OToijW6zUAa633/s03bydqOers2wRWiLQcNoc2OBg+MEwBcZefeO50KfOja2rnDTJ2phbmLBcIKRtj3HTabAfNq0YUk75sWiZkUxQBCS7ueO2QnOWENRqya50tfqNKIaXNxxxRu46j2qyfnR80fRF0StpUYRPn0DAA5IYZvimX1elt+FWeabk4BZpWK6jtlIcwKlUaKTdZgGCyxmsjIS8O5pNLdd0s7p2eXH3i9PYrIg0bJ6ECwNuJXGP8cDuYeBj7d1/7qiHk/y67dOlSnlmQqarKWkdEMW2AtRYK0WCM6dHxiARukczB/KSca2zZl1FnQPUHswpshWaM2bW+JXrDjJ+tk7NNOpoCIQRjjIgHMJnPvOr86PhXf+UT9+7cvnnr1fViAYixVlVlTEl+MtY6aJfaIQgIEFnfuXlw5Ynze6cr5cn0xHIhiiyzq6o2joEN1xJ5jtQAFNf/ZrpaeTrheNrwe+oZ1rbOWPs4m0pi2PqU3G8g2ly69WW7hWG2LwTB9N7rQeLdNcDDGGX1Cqn95SdfOL1ppWqUGDX75c2Atpj8Zhwi2qTTSNfP40yoDwdvcJY0bAmnaYT0zkRmF4DsgZ0d+j/T+9732rTnoHEwsqr2pLrH7MaYoiiIqCdmMioV+qiBBn9tGxEi6w1W6lKkqQUVQHH01Ntuv3z3F971AeW8ClBYJQsyAAlYCQIN8dP+ZKLuLvzyQP1TGKP+AbyGYVOXhb4Pkxr1uVFIuTq7U61OmbxhXy3PIs3en5Eujcm2gAEc2Uk+OSomc+Mm5JwtZvbg8PSsOrp8zeYzCcImN8bIuBrplo3IkzNf/8bffPrTn6qqdZbZe/fuTKdT733kUCmJcjRtmrYtSXcwe+kp7KHrF+zTi+d5X4fB7fb13PfASD569KFR1TzPD45Pfv03/818dgAlkxWhEQkhL163Mn0KCHjkGyJAOD+9PTucaVPW1YrJzyZutTwrMubO52O8OO+7UB+ww8PuqYfpzFAmGCUCq5BXVjEaiNeVFLMrh5duZMWxmBnymRp0mqZ2W2gSevMYfhJ4RPW2U/KrqkD8TxQbORu7EEQ6xvh4gF9STKQjKWHcf3DVYMz4K0lYbdceu0ksCCaABAgD4MzlvYjDzCJ+LE+8CbB1/14fHmOBCIg2sJicMIOZz67dOF36t/3Sx26flZODE9LsbFm5zLZZLoBYcUQhg6EH0vPoVPIwNC4VtSMJQ5Tgu2NsJ2zpU0BgcMngebqWh9PhpzS7WxIKaGaFtKrX57K+h2alHDTUgI80ex9o+4Ix5YUDDMgYO7XFXGGDQgKBjcknouWqCjafipLUKxAbg961jYZR8YDCQL1v/v4bXz8+Pv61X/v1SycnTV3GxETR5SIm5tQuT/Dw2UYtW5otSvUl9yGrO8cZ3Ci9cDzngw59y2YoZQBK/baEqoIQYh8mVfggishGm/e8+/2L89WXv/Kll1/+UbTXVmW90T8lL/FAq2QEW9Ikeq9pQV1X69Ukm63v3T586qhcn03zLEgD3tiwe7k2lYlTXnsjhY9qvHaXMFFrsd9Hs1PpOZ3JrjIYdffdPEk8UFUaJWZoxW4WJaGYeV0tjPEek2zmjCV40apSr+qh6zGJiUGJ+uCWi8cwgkdn247SapdtQ6Ul3qp9upU9fH06yAUHAwK8DwXIdoj2xTQbgMjYotau/qgnjO/lvY8Cdz8UdbrW8FNn3hEB8yYTC0MIsGCGmxUnzy3vVe//1d94+ZU7k4Ojs2U1m0+zTKPnSnTLVda2WJ/2TmQtpNih55zSA0r8zAeX9C07Bxy0pJ0p0eU+RITTCFIqktLsKKoyKZNk8Mvl3Xp1Dq2Jg5YLaJPedpycbJtmW5AFZZzNbDZlkzchkhlhBTEX86PVnZvGmXx2sPYeUmtSOQ2RcieDG8feV9blvmk+/7k/B/Bbv/XvnMvjkwcJ3EFUDo3ns5/G8SQALRHZt5sumElsE4nxzrqAFRgzCuMllF6iiVuoMaZXgxERgv7SL32ImT//l5+7/fKPu3yi2PX4r0P2rjZZPQCIX537dX14+ak7L3336IlnwUEVQRmdwnlAaAezt3VWt07tuO8ug/fOkTfyjA5P7ThoObeNYiAiPW2HIiJSJhJjLDc+WDbTo6vEUgevTQOTQRpS382Ndqn63mxJ5mcc3niynfhBiAhRTIQZCbagDd5uBViM9vCD0++N1XzU/4Jx9lH6i8dJcVCEiBB7f3LfVf/t98+btlJjYiZF70YbfdBE20xGAAEGxJQfuOnlWotf+OjHv//j25cvXz1f1WTMYr2aTqd15RUCbQUdIbByzFgO6lWvfYZh0vZs6P5URIm+lXLitIw3cAz72T1XYz/zzmVhN6odE5tdYw7dzgkJe6GqndhtGJZ0dX43rO9oUwEeoYl+48wkYfwQDJJ0bMCCHewU7CYHl8AmgKUt0E3KTNAmoDi6Wp7fXddVcXhcLs7Er6yb+GaNodEDAELjAXhfxZD7L33xi97L7/zO71rrmNnXTV23PoN9SNVgTgb4ejhdF7JTY9g32zs31/iqCzZj+6Wi1qZjqpNLpDV7E0Vvkhi9EqTOsuyd73x3VVVf+OLnzu7eMS4LTbl9/z779+sjAhJgDTdBXG7P7rxspoent354+ckbvgkMG8jpjhwV+2zSgHYu86P+vd/45tZbI2zG3GKklDZJMsj0eocoS3cHSRXweEAgam9IMK2qDkTCREwwAQEKY4vi4OrcyxlyrO6gvhmpddyoe7biY8n74eARpVvRjbt1EGhMFqQqMWQoycA4TNI0kIYHp/o/BwQY29Ffaf+BtD24xRhZ6MgbPP4ZxeuBI1ss3nf58uVXXnnlYjz1iKCvnz3KDJz8xSCGnU5mh8XhZXf0/L2FL2aXFmtfVv7y5cuv3LqZ507hNwHHnf+2qvbGXNoVGz3UglIrjuyTxTc9t92GL5AS8BNP706Bvl8VkRUjImjQ4Mt7rxrTGG1CvVYVEJiQxmdvrxVuXQgUsU452YkxBezEmrwW9UEDiAxFB3EBSB0YnM+l1KoOLi8CqW/Wu4kKSczCpQBInCuauvrqV79aFMUnfv23JpOJzfLlchlLV8U9mJq3B5MwaEwF5fSSfQR7673vxz3vO3Vfir5ZBtuNkVcOIfR2gZZcKauote5d73qXInz5y39159WX9z/4Qwrc1F8VGYje5RMSfJYVdbmAnYZqaYv57R997/jJFxrvFXbnHO4UkQnc87pjkXrQPhjhPtI2kDqmXHxVL20DvvVvV2YlZRND10SDyzIo176yZnp4+Xm2x4tbL/pyAV8D6GxqDID5TfX4+dmHR5LcVBGZX+89GerJNqBRGuvJNhIcOiB7A9w62P99CFYPWz7A28q0AXMwoPeDW49XV0/+e5VdjxOtoSzLrl+/3pPtwe3eDIibfoj0Wz0hAczI5pPZ4fTgcjE7QXFUlRQCZZk1Gd05vXf9+vVXXvnxbDJBN0SsWSQgECjJer7jTWMdLdoxCQmZ34upR/133EtVu1hk6cdMv/sDzv++bhFhhRCaupT6DKFilCICDYBQF9S1fWUivUVehy3YMOfsCmun5CZNoBDUt7YHAK3OKbd5uV7lxQTOVqc3kbnpzC7uVUjifbcfD0SAkqo2dQ2gaZrPf/7zs/nxu9/97qvXn8jzfL1ehxDApFCzixVO332wZSg57ieTkvJ6Dwjp99p53/QuSPAAku2f9EziQeIkk0YnDaUuVQDBstOAfJqvFveszT7w/g9W1fqLX/jLul6pHySR5YukwdcE4gOB1JduftSszmCz88Vdzq/3mYjStybeTcg1MrsjUqp7aDY4zUqUtLfzGVdMK1tT146dQ+041sgpxiSBoIzFKCugQiFGegdhUZu5yexg7tSs69t+WZV1VG+MAtbb5fUAs/kYEngESnKJOAWtHjsIlJmVulQQJO3ahAz26nifj8l27Jb6qI8l7PSSgWx9Mc1GYtseDBJvJEk0eQiBCcblR4cnBNNr8FLl5BsLrVSHjk63jxbfI+2oBGM5BEAtsqmbneQHV/LZFTO5sliHrDg0hhbL82kxaXx1586d+Xwuvq3KMNrbewnApmX71gDSJmq929L5vEhdeTEZpj6BKw1w/eCSltJz5xojbX4JFmrJLUkgCCGQem3WsjzD8k6Rm2bdBPVR/IjrjszO9CrR3ZLBRtmCc9jc2IKzgm3eCIQNtfF3KghQgagXyYuJ+IqIppevrM7vNKdn2XRer87QT1T/Mp3Bqf/KxFZD40P4sz/9Y0Dm8zk721aGZFIila0dtKU7HbVjtON6yr3vE4wvRLcLBo3jPuMOg/vuvGPU4cT4eGZjjOk15KRclY2IgG3wNRv7i+/7QFmWf/XFLwAYxXOnt+Y+AfD9lOeyk9wTKEggsmy4WZxyVtiM6tNb7toxgRQOoiDTGpjaAK8+ljUmRDI7hWyM9tTWKe10WrT72ouhl6r3UO50KtoPSqLKMMbUvjGkxmYivK6C4ezw0pNU31izlqc3EZZQ3yYkkC5LY+uoIW0ALy6c6cfQwRtPtjsbSFVVWZZVTSAysfguoIBCW2tV5JCFwvbVPfncqKO3dnv82ExxMBHRJOvZgMdXVUn2atvYke+t+6Kj39teTn27QEPwAAyzlyAiIATFZHoY5GUFsqyoqyUAwxv8sCmTR5umh4Jh/WzaOtdBVz+bFORbtCLY7DpF8AKTgydH154L5mR2fCObXzs/r8ixhFoCMmu89wTjXC4CMjkg3E7UxgLNW2i6zTc+mOFeRAPQVguO4xBUg3YrBACIAeVOGwMgxtfEkstxHGnVhgIi7khI+1TpfKpqyzkFoEvnuqkeDQBGOWdpmsoLkXVksiDkRYiswpOEwmhuQrO6V997FdXaWa1Wp4xA3Ru0yEsEYJdlTWtIVstGghewIic3tVkehIVzZBN1rhINqsJtjXNVNXEoAoPUayT2QZAXs5q0rpdwGZraWGsYTV1bkDHsg2x784vGsmPQann+2T/9lEr9id/49SLj0/PzopiqqCgxmZhBoaoqAGQ4phygxBraE4yoTYmWzXZSdeu7jxbohqsbC9ZjsT5lfNNhxtJ8/ModCeGkESrCTDEmKVZBNWTjmmID41gEoQEFmc6O3/Gu99ts+vnP/hkbkrqCirVWxKsItdSjNy3FvbY/h5diU1Ja25/NxiYQq4QaUKkDcZgczNe3v2sPr0+nl4JmISisZWO8irKAlKi/JTOcAh6h/8KtlqvV8HSIr0d0cbu3X5EVLU+Irp/qJmVhP+FMgG4+eq9hYd64mgooniUQNCMyTASFagM2RGqYoeDIgggAJoOgzSKE6bVfXOsElGH9MkJA01CAJVG1gBOYAFUqYcOGJXhMue8Hj8STnKR17GSDuIBgFS2+1t7sqlF82bFd0+MBiZVdZ8ciwuB3PNo+xj9FJinf0F+4FZwtNCnmtReA66rq5JI3fhlScqDbtLw/Q3Hbs2qMIiJQcenpt905bZ5/53OBD2/eLQ8Oj5tmEf2WNxg2hty0aeTbm20Y8AQL75PAUth8mvYxOZL55NqH0FXq+O4xKoEEsdrVjkiz/hYMBBGBqiEmsgImApEBKwfkmTVSrhd3ZHXXoiQuQ1Vy59S9/ZRsrG3qmpidtXVd+yC5dZVXW8yEchFjs4nJpmStFzQ+wNg4l6SR3eAYVU/tuqIW07I1NvMaWK2IBO8DwtHB8eL8Xgg+M64MTfpWvXQYRNarxd9+/W+M5fe/7wPHh/P1ulIyxljfhNVq1ftda7fpVLV1W05tUtszd/9PrLu7jTea7rFf7LzF4KpBY+erONSKASDDtW9CCGSYjGVrL12+khX5+fnyb//2a1ACsQ8BKtNJvl5XvbA7+t2zi0cPm67jLtudAlJXS5KQT068X9SlLaYn1uRlExqByYxoiGVzPNQoKzr+aPde3uHhgahF07YD6SblOLAD+7XdYDZy+baAvpnnrZuYzfAEwGPDQHQ8Mff5jO1a3Pza29RKteLm5gJ5putao3KtNdGFEJOX0+6XfQxjeEQBYFVVNU1jnQkhEBkFRKOSXDcRLZHEbRO5MV4eke1RFq0RaU+X7L4AsL1kW4a4YPAYPdmOL5M5Z607ODg+P79jjPHei3SG5NcDRkhuJ5nbkgA6TArAa+s67mCKS0++fbGiX3j3h8/XnvNwfDJfrs5MYmNL8WM6Pxcqn7eg/WrKhM6rfNQBvRiXfOX7MgE6wmm9DW984T6lohB8IGozyUBVNQSCksCZQNL4alGvFlKtSWqSRtC7no1ysYUGUBVEFYVCK69ZPlObqRp2RZZPyGU+aAjayi66EeMIEoNgg7abIu5MYss2d0TN2Z2T60/d/fEPifjsfOHIBW3qsDNTZmtoCCH88Ac/8CpFPvnF9713MpmsliU77tUh0eNae5/QTjPRB/XttD1vzfYI+hizAewkG/sGv6AxLsV9dx/3tzFFo0oMgfPeG+YrV6780i/9Up6bL3/xCxoaqGZFvlpXr7ur1FBIqBsUor5pdGVskWXOsvUgUgKY1Ha7KXqJCwDioT9amr18ax7a5UToc6sN3NGBRHBvme+xMjxt2cp3OPJ3k0Tvkg4o1MWJCTGzgV5/6u2v/KB0V8Lqx/8Ka+qmshBCA/hWQ9HbB14nPPnzDY+IbJdlWdc1m8x7H8m2dlmXVaV1RtOYp1Av2MBjkjwm2227DMn/mNlPB9yJUFQ1JdvpOLStbup0+CSgo6OjGzdu/NM/n6nWAFTB9ylz/FBwIVrZUPGREp46NR5nsAcHl55elubZF94rWljHSqRoFDVR1lPDlGd6EE64E9GGjTs/KO3hZfa1PzikOl7VqHjfJyqRslFhIGZiDKRiIKTeWVqdn/rlXWgFeG0qhY8xwalqoxsHQHRmFhHkRVGVjYLc5GCx8naS58WUjKtq3wQldllWVE3LxPB2pU5QFM40xEcnQ5wByI8u33355pPPvf3H3/suIB5EZEX9vpkyFHNUya1XXv2rL3zBGPPud/+iqtbrkq3rUw7ESMUsyyT51ukKpwcmqH17Slb3+YUM7nXBmBdQ+n3tgz5EZNgQkfe+rmuGquq1a9dU3yPef+WLX8iLaVWusPE/Tc238ppTSfZTkdY7qM7P4OasZr24GyZazI4ztuvaG2OFTCR7UWDeJ2drcjw+UOoL+2x30x2XDGj2rqu2UuEO8p5u3Xf7o7f9mVXZmMl6vX7m2ff86LuaX9Hq1RdB5LUkNACIwEqiQGBmFh3Vm38MI3gELmmAYr1eV1U1mR70OUKJVVs6vSHb1BmSd3LZ2EW20/5b5DzJorf32j3tfSNGRCjtOSbbROxV54cHs8ODoAoJUfMTdLQH9fXTCCVPSIBu34tAREbJS3tTpmKez5+wxZWjgyfZXT5fVrOjw7Jen53dmR3MpYl25S0/fADQGMcpg6nmbQ9/dHs7atq32mHQfa+uJ3VPveVImJ59WALelbns6EGXuI22tDgKaLTCCQwYqkoqRGqNEsSoD+XKr09RLwAPiWJBS9q0f+gEoxumxnvAWpdVpedsOp3Ml6WHyV02JZPVTWh8IOMi7Y+P1yW9Ue7WGjHF6VelAKjGoN08y/JqUv/4ez964tkXXv7hi7FmSTK3G4ikJrKz1ma+aX7w/e9/6UtfYrY3nn1eRA0hBO+9J2sovjsDXjezh0B9frpdH2C8XzYwUrOnX3bfLktbdt7u4g4X9InSf3wGZs6yDBAvgRiHh4fPPfdcZs0X/uJziOpiDMrAvw621p4HasVTDfClQCA+GJKM2R06NkHBapQjfyzSxgOKwgKtVTuFbdq5FfO9Q9TGjliv9rv0xq7eMW5TYWhA1xOa3RH1rp3aj8lEFNVI7YXOueV6fXx4vVzde/aFD7/4nW/gKldnL6FuonmUCERqxSksCyugeEy57wNvONlmJhGUZdk0TR8Cq63j2BbZjlxwr7Ab7M/e/Dbc/7xxShps3QF9HSOO9Kqd5BzbnuQpmafO7blnpVVVVJioKIq6rhECwGAxzF29k9cDtnRd7RR0zQIMmQECQUVi0hUyMBM7uTQ5uGazK8dXnv3xq2eXrl07PT8Vltl86n3DRASbKq7bcToiulN6HhPdwdn+1LjnztH2UoUHBkoCYHaPRgqlGKFFUCKyBo5EtdZmvTq9baQK8KiXgCcmtCVquPdC2iglARWNycx8A7ADZ1UgJTeZHxuX+aC1D0omz3JRqtdruLx/ig15JOm0JXGWKMAwiFSC8sHhlfPl6uWXbz39/AsvfffbNst9tdq4RCUQKbez7H0NsGH34ne/m5ns8PDw6rUnimK6Wq3KsnTWWGvruq6qyrCNk5XMlWJb6HsQ8ontzYIHoNyDAe5Lue87ZnpJFHaDtnkMrbWqwXsvQZX4+bf9AhF9+GO//Ddf+bK21PH1yWk4rigYmwmq0qDxdsIG63KpNpdscimEAGVSKwSYyERGYZT7DKM7dRh9yw5ZOTnYE8/C40vSP3UobVN6r4G0nV7eXchlVU1nB6t1NZ1eOj27c+P5D7z8kvPShFWD+jYUIjAEQA3MY1+0B4RHlJN8tVq1bqvdatCRbbtVd/PDSdvocrkM2nemVcEI9dyXbKvuyACDTsLu22VTiQgun4jS9OBgtTiNzu0YCi0/2frs95cC4KR+djvy9ujSfmWTIZtzfjw5eKqYP3F0cuO7L9167oV3vnLrJgjWGMMIvlcJRv49vl0qN7f5xjebfKuWyFbOcAB9Le2h6rX3fRrpMwf9985Bwu+3DxIv5N18QGf56+cmCpcchImISQhKCKqlX59Xq7tangXyCCVQAwoNu/mVjkYqkNli7QNAk4OTstZmHfJLl9kVAeSDgJ1hFqUQAsi0JH/0iqoKEjADrLGgFAyDRamqquNnnrv30osv/fBHb/vF93/nm38f3cv7XGwDmbv/Rs65sqpe/N73/uYrX/3QRz/2xJNPOmeMIQMlaZOAGrPRLXXfKDLKG5/tCz7H4CuMWy5m7Padum///pdG7EIEZqgGDQEShNrc7CEE0TA/mK+Xixs3bmTWNL7++69/g5hV9pDtEaPcwe69vO/JLRsvXhXql4FFyQdygTNjDgPQa8qEJBJHS5QmtEgOtiTsndCx2oTtiA9NGE7eGrbNvIZuLfVeZgDFiPA2uKz9monUHvO4aVfdoJscNlTXpcsnd04Xh9OjlV8eXH7Wky9z1OfA6vYmiAThdWOaft7hDSfbMZ4y2rZ7GikiPXpV3bik9ZjxYcl2K+wmpHqfbXvfgHvP7rFtY8QZqCqYfeMP5tOiKK5ef+Jl8dXqTATWvq4C916I2q2tG7GxPhBg2R3lsyvZ9Epx8GQ+u3K2Dk/ceO5HN19xzjETsXhfO5cHT8AWfaLtQB1gd2oIPLCUvJM3f5jX3DHU4IEffEDqom5IPUstflUu7vmzW7ZgX54DobMCq6razPhmN2IxZErvifL50ZV1o6psj46MndSNBCgzO7JeQl2WYOvyPITQhfBJx3x0f6JzJiBoDEAkquq6yGfny0Vx+Xq5uvedf/7Xqzeev/nS9y+w3EsTrOXgtapWANd1+dd//SWTOTbm6tWr0UWLiAzIdhV1kchY7RyOTEL3n9D9l4yp7L6PtW+F7DSWXzCCyKb6mVJbIMAYRyq3bt6ez6b5pLj+5FPvWK+bsv7Hb33z9TJd9cwKdTGKRERKIo0BBYRQr4P4yTwzVNfrxeRgDlUhMHEgArUJTR/ESrRTUN7Zrfuy7RP25gP0Sw4bfcl9B0xPtYI4Oqt2p4F3mQ1ey3o9mU0rH5gyNdNL154/vRNCCKH00LWqMBRo2ijex3A/eEQuaXfv3q3rmohCCKp1pLFj2zbQ+U+O4q371T/YosEnVRaI+vKaQ9NOd2F6eTrgvnYo7xynT4CMBA1Fq31V+6OTS3WzevE73+7y+L1Ra5E20jEDCH0eju7tmyCgDCimB0/Mjp9BdphPr9WaibHn5coVLjrikIA0C741OvToux0bferizTwAMU40bTfU1enq+XHqgrN3ylsRiQzxwohpoK3+2r16e4MU9Xtp49OTzm22H1WNNdmMIWZCEK/ibCYSnAmOya/X53deQXlucoo0m+C7QuRQwoBmE0DUWqe96nR6RHZyvq7BWXF4wq5YlbW1jsAKtOlAbIa26PtFbJxqxF9ERAqCgm1WNw2xCxrgCqjevHM6O7myvPsqlKAhytwb30GBAuqllZ+BuN2++PnPWWs/9rGPxeKeVVOpkBNT102e58YZ733wQkQxUpO6r7NTKT0molueFqlPcrJf0r3c1+1+EE5usEl33mjnJe0dsUELIejBwQFUTk9Pc+uef9vb69q/euvWnVsvA0LWKkK097NJUiUOZe778OIpvlJVIMTFYCABUKnL1T2bwzhbr8/yiWVb1CJBAlsGc88rd/Nm+kfoZe6EcMa8oXFfbAgwJfOjiRYt+aAct2F70ebtek+RjZcZdCOCxwYhMFMaFqEbBkC9r5XJ5AYaOGNSZ+whwx2evK1cS/bk4emPvyP1PaIG2tb57DPzvGZu/uceXqOT5MNC00H8cydNTXnnQTFsHdXPTgtgp42DcXaOtvPanccDGJ8ajKOqMTFyURTnyzVZ2xbuCK/T+qPxX9IpxsVDFKpgkGFj2BiwBRnY6ZUb7ww0qUNx6drzjWYBToiVBCxtsiNiqIEatHRwC/Y9zoMX2945yMUqvtcXYhUsa60xpr8vq8BXmQkk9er8zvLsDqsHfKgWkWbzYId0n5EICgRA2qpGJp8clVVYrCrrimx25JVLH1yWa2J0SKBD92lqmh2Twf0pVVVuI49dNkU2gZrlqiI3IbYgG2vGqCLoVkZebm+3ycvy+c9/7vOf/9zZ2RkRZdZNJpOYtLxpmtVqFUuPRNQZdO9e0G36Pd50487Y3ukXtwwmYjzI+OxDAYCmCcELsyUyzubPPPPsr/zKr82PTgBWLxCiVtMCvghNPjQK5X4ZicLXUq9CvWAt6/qsrhZM3hmGePGBQVC+YJuMNOcX9XmQ5x933mpRenDlfNcnrj0RDkIhMIRswITtpWvX33V6bi899U7QNIA5b8Mre6QK4GL885aFN76UCEMFTdPUdR315LF9s88Tp2rdE7c9QApph6BDTfUAoaSnsAfRDPpv3Ui3Bul/e0/1nmmNQERNE2azWZ7nV65cufnjl4g5ZtEaTs3rxkqm9uw2yVK0RwMMNzu49lwl2fWn327yy7fvVgeXr56vS1Bo+2ogsgAROQCgALSV2VJdgm7bhgei8/afAyty3xLP7lYypxJzos17+DmizWzw9tW9YMcqol5JmcSwkG98taoW91CdQ2po1dPsLehHo5irTlUpgAlsXa6cBw5g5yZzdpNVHTQIWwNJHyIxNOiGZnd2GAakNRJucuGh+77KQFACiNll+awGowxsCyiC+ijOtymjafu2yTsQs/rmb776lczaj3384wcHB+uq0jZ6zUNhjGFiiWloklU92Djjb3Tfj5VeOO6/8/Jx42Cf7uvZ34JIoz4vopq+3TrbNA0RE1HVeK8ymx++813vuXd2+q1v/cPdm69CpU1wqNhp744f7eEXqLTG5shJiQ/NOggZW4Smtrnk2ZE1Tj0Eath2Kut0MXJKzIgIStRZlFvr+CiNeS9n91+hfRq0LmZJ/5gLN7VwU3uXTpkjtLGGMMyG5Wzt36kOgEilTWXNTGIDEyTL80ntzbNv+9APv/u3B0/9wvmPv1l5zzmkGs7pa0ECP+/wSCqAQZumCSE0TUNkRETRepIBUGxs27gfuR1T7h3JSneR4XH7vgGH5HxkI0+vSnGQqgJsjKnrqsjd9evXGf7myy+pCDHvylmN15heYHSJQAikbUJTapliYrjJ9MpznmZXrz2fTU8CzwrLZ+fL4mBWNat2E6ohIlaDzld8J3T7cGz2Htop9xHgcfvguO+G9NTDT88+0FbzLKIBUCIwS2b86vxevVqwNgKPZgXUxlCPqePn1+5LxTnSNskaAYbshFy2Xvni6CSfHXpw2QRiowTfNIb6LZYuJNljQ90WfVriS4AQMQgSggRvLGcuywtbE2mzVjhA271MBAq7PmTLyZAiK4qqLL/85b8mYz7wgQ9Mp3M2HDVh1jpjjASNpUestdrs2JXYtcu6Z76PbDT2Fd335wWN47MpNUqeTVQB2oEB+v5EHIL3vqYsYza/9IEPMfM3v/k/7ty5rb4GWlp38Us9IGgbBr6tWJEGuq7Wd8ATZXUNWz4wbEhzqO2d1AaCdb8fRy07Oqczs93CY0v2Aw01CtTuXzA1hQAEYiBSbpAKWEksiIVztrNpkV17avXKj/4+v/Zcdfvb4pt+tgeCwWNI4ZFUAOtcekIIxtkQRFTRlhLRoW0bw518MdnGCIPs4+UvINuD/uldBstm/Dzbj6FeghK8hIODg9s3GdaiqWk7sflPBDGUK6EBLV2BqgaQARhkAGNmB9n8CuVX58dPTI+fWFZNaKpsMjekZblgS626ridIpOiwfcw+qDtMd9xbryO0OZtoI4V3+3lYGxv9Tu6PEweZAbxGUbudit68y9r6JrTO8BwpN7VGY0PBl6eyuit1SRRYG4l+41sJa7pB4/szhRAHYRgHcrCZmAKZmunc5JPVqg4hkLNsWKoKhrGRrXUw3EAx3iU6BVoRPHILMdpCiImVJXAIGgwz28zNvCgpgsSVGi8W1e3g/YTLFZWq9MS2rqovfP4vvPcf//iv5raIclhMQty7LqfrNqWLwF58qvfLMnYxqf5JKDe2ydL+CxiAb0SVFKQk0YBCRHXdzGYH7/iF91iTffNb/+PVH/0ABLZG1GNvYpuHg7glOuam4wbVa32GLCCYujTK5IpjS7kPiBEOW5xxOxL3LftQS0v5YqTJFqFtc5sPrk0js7coN5g6/kCiu1x8EtkY0Tpj+iBWjRmsRBGZEBEgICEYgvEwZRNuvPCLZ8tbq1M/fer9q5f+GVoCnrZz1DyGAbzxZDsad0UANE3DNgshKCIWkx1km4bbeEy2kezVVPE1IqJbxz0DMR5/Z+cx2b6QYLeHwYc8z0NYK7GIHB8f37t5S0SGdunXBn397DFZafGAAgQyMLnL59PZVZ1cn588d3e9nEymGvTe4u7R8aXFYsHIAEBNtFa1JlpglHFiBzwgTaXO3Uz3aLxTOfuhRt4HF1AMAoM8FMRKxICKNAjN8u6rViuWWupS2/hsH8KGnvZydsvfaNtAxGScUkamgCnmlw8D+GxZ+SDgrqY1d/EzGxv2hRQoKi8USuA+iIGiwUMBFw3zItIEmKAEY10OghLEK4QQ1j2tv2DFRewvIfzdN75urf3ABz905fK1Oviybrz3TMYYI6plWbpoOtkvcA+H3fP5durGd/a/mHLfVwgbbNLuFmkhjc2CbPPeqFibEan3fr2qL126PJ1OAZTl6uzObfGC4e1Sm9dDR4goOH4Aaku7iqoHPJQ0mLpShbM8J9emvyXeeveLYdxn3+a6WKTeOqU7+utA2qbNqQ3hVyJYSAAxQyjynlFvjqBM1k1Ol6t3/+LH/uGbuirv4OgZ3HkR8AO0HDMU3ffd3zrwiDzJIRJCqOvauDwEIY6mwSgWaCwmGJm3C2zb2EllEwvcBdzZDnr/gNL2/pzkaWMK3vsQPDMfHBwcHx8vzxdNuXp9yDYA7GaumdHyBmRgc87n2fQgmx5OLj938159cumk9lVANTvIbt398eXLV+u1QDnmPlMNpBrJA1K/7k0RkdFDDGzbbQa017619qnWX/OAu8ZvD4gohFCWpZSnqNZAiRAAD4QeQW9SOG9oNgNCEnEtW2vJZgGOXWbzGbu8rIMPHsSwRgFIIKatBbT5cmn6zI1/WqwpAghpL4hLl7EOIh7MZIwhDl5F1TAb45TUQQI0eFU4eNmjhG/15M65mPvI2Gy5WHz1q18Nio98+GP5dJJlWayDEo3B3ntrLbZXe4q+xzT44g+W7tDB972YWu9sGRyPH0xVIRor4Kiqbn401vfUGHKkWvuGQUFJRdljPj9417ve0/jqW9/6hzs3X971Kq81npMMVFUp2jOAttQmCAhlaAjKDa3K1SorZuwyorBR1LVlcraopqpuirMNCfCO3GqqKrSDZm/0KAT08dxKPUKQNrortnPHG95Po64WsICPKjrTDdb49XQ6rcsVwVTevOe9v/KNL/3F5Wsnp9VdWVXRK+1B2JS3Jjwqst3mP25EJKg36mI5e9VYdF0BVu3FhA0MifR+sj3IuLJzD49H23mLtPM4bhvbWGz7NQNgzhdnbGQ2zY8vXbl9+5aqDqLIkuEunLNWrEt+k2s22q7USxgMl9v51cns0sHR9cnhU4sKJ5eu1M1aVEDkRa9curxalMZkXcEnAG1iQ4H2aRQTPLgbTSMmDKONXndMbi8mvYm6b6CQjgshPhODZCPyXgjc1lBRgHo/LwEUGh2siDxBGSH4laxPcX7TGfHVWiHGGFUW8QCMs6HZzrDYqTcEpCC2ObuJmkzVwuY2n5wtSpPnrpj6EFSayEBdKPNyepS8v7T1kge9mUMTQghsKQb7MbN1JgRRWGWnRphFGlUIgu4sAA6ASJumip71TV0CaKryr77wl9Pp9MZzL1y/ft1a29SlV7XWZlkmoqSbPTIW3VQVkESzsvt9L1gJD0KwB/v6YnKOzT6l6FOmbWG1DdkOIcRypc4536iIEHOe56p0enrq/eTKlSvvefd7l8tluVqvFmdQSd3+AYycLmX7dzdQ1KK07hEbjEdRU+ZrMh6hbFZ3HFmXXVIgtAo2BiGhuDE1EkXPS9oqNpp4PiYZzfovuP0R9z3p9mN3unFsq+UvIP8R+j2e1PMlImJnVuUyd5kona7W04n70G/+h69/4Q9nRzdKCJb3gEAkcVo0JGjmtZY8/nmCN56dae9gf/UTv3Hj2bfdeP6F1bomGDI8FnOxLbFpAmkwX0poe7Katu/c1empfb/7+u9rGRwAUKb1enk4n6+WZ5M8++d//Obtm6++/NIPqSW8Mf9oJAJKHTXaftwOofcEe4AFFARmoC9B0RWjsCgOaXJlcvjc4dEzdnINPIF1QkJErVWCFBIH5Z6fiHPOKqH1tOruL2EwsTTir7fncPPteGvSNor30Bk14tm4F9ML27MaAFYNEfcCiO5Zqhrzorc5xpOinyRKUFYhhYA8WMAKFqhqYAqsdc6SUVOv7y3uvizlylII9b2op9DNU3M38/2TgADT2uUcm6kQQQ1PZpODS2C3rgKbTIj7h2FtX3lPXeohOd+I9KqAclJ1MU4O8yAYrRfGBRCWRqVRv1K/Vl9CKvgyZrSK02mMESVVvwvZMYC8mH7oIx/91U/8+mR2cPf0LM+KfDK9d+/etMijXYmIYmWwlH53XyFZA5tUAkCyVPbR7D7p5mBf9/t98313Eez7kvNBPe/xnh2LdHVdE2mR5VnuFovF3/7N1778pS9CPKCGTZCGIMwwxjRN2CaWDIhuEc6HEcoJgAMMaJJl8+n0kCcn+cnTi4YM50rc1N4WzjmzrhbGspJEsk2wUAe17bSRdOZnM3i70LIIGxt2x50zUXQAb/sbYwDEStt957gGoF2eVN6cFWkZgkjgO+aAemu3dAk5+rtTxD8UEy0oAEPlt7/5xUvT5s6/fAVyRtoYQUbsFYLMQ0EB5ONcxazA4RFksfrpg0cSt00E4PT8zIe6TTRBokoAB1DAVlLxAaTD7GvH9p6PvztDugeB3elv2j7uM25Jg8j7A6+iGsDUNI2CVGk+OyyKaZYXvRaBemdkjExmW5PW/8qgmQCGMLUpVhQQZZBDcWgmlycHT0wOnzDTK+SOlCdCcRv3jsQGMJvgy80pCHGSy3DwAbdg/3fecWrcmA7V5kQc4Zcu3Bm9RmC3FDdWY4iSMoENtX5G0eEoiHeWCfXy/Pb67KbVyqEM9Rn3IW3A9lRTgpHjI8VmJ2CYgiczWxwo2CvYulQp09XPvsi4PP67J9MAtlU8DPBoqyoQmRcS5UAWZI3LjcvJOsDYfNbVAkVMiKYiPKpIgfatpa7W3/mXb//NV79ydu/OydFx0zR3b9+az+fovmBUl8XkoETDPSviY1Kdwfbct2EfpIPuIbTphRf/ecF9910o4vPcOeeqpq6r5vDg6J3vfPcHP/xRdhOAgkg0e4ugaYIxqc5r/PsAkH5o5ShaklTwC6nvhOpOvb7H4g0FhjKzBG2CJyIlIVKlGFuF7qab+ggD7DTYvzsl481DXaCd7nbcoM+eS1RI4r/uBdOsLKTc5o7wMIGsR/7O9/7qnVfLK+/6GLITVS4K51UMTFTS94HjUOh2foK3FDwKJXnkq27evPn2tzd9Od64VSjqrFqfB0HHHad9ejKMnZRbd3Prg2Ps3/bj3/HZccuAi48HQlAlZm6ahohE5PDwcHF+Op/P71RllLCISIm0i6vdgVeGurj0oYGNICsgBI0UznB25GaXp4dP5gdP5rNLppgKUfAeGJqIxkrsfZJKqvTuFeaq0SDYzRgBkfdVbZ3bkjhy2h4K2+LX9t1369g3rM3w6TqZRtuqqAJliMIIkXJkTZQgqoEhhpWl8eWqXJ1ruTZaQ2TPxo+adsbGzYJbGyk7mAycscsmsznZSRBVIWOMBBlK0ADrHm5jP4y/xUV8ksLE7GiqzGy4IIZqCCLGsfcBwaeS34At25hIAFV99ZVXyrrJismHPnKY5a6qKuoqcGztRyHRVu/Sqp1jsG601QycHu7reX5he//bP8C4f7quHoROX/wYvUk1hFBrnef5tWvXPvjBD65Xq29/+1vSNKvVqiiKsiwJEFHdtYMf5sY724L3dVUR5Bx8b3KQMQxUrbFBxddqXAaEuOB7N9WoQR+Mt60P3+ziLem546Q1vSRJmTam8fuOL4bxVf2uB1otXAC/5+O/9a2vffbo+jtPX+HF+jaDAhppWXmGcLf39+QmeAvAI7Nt4+7tO3VdhxBALCKg0Ffp0E7hSV1ZrfQDDwjnkKDq5lR6sK9w52D/p9s1fdrBaBjhkZ3EnhRegzHGN7XLTFP7ophOp/Ojw5N7d+5KW5Mj4IEX+rZVOwqALbkK6GxiMLAzO70ymT85PXwmm17mbCpkVJteuBrM5xbnNCKo6d23d3t37X7kSNvWMtpv0bwYLr5LB8O8LgIGc6cZVqiHBoYS1bmh9eK0Wd1jqQJ8qNaAZ2aRjWS7LXCLbmQmBliZYQq2BblYizNXxIIPHER1W8AiyE8Scv4Q8xa5qFZdIUrO2AkR1U3lirn4OlQrEWFmBu1zx+2WmJzdvfP1r301y7J3vee9J8dHq3IVvBhjoge7MQxAAkIIhpNLNcYKxmF0o5h4gLd4ELI96Lbzkgs6PPggAIwxVVUZY/I8D40/OzsrMnd8fOlDH/qQc+Z//O3X2biyrPM8r6uqRx7d1b2q/LWB9IMIfN2oBgXdcVnOpMq5y2Yk7IOAYoYTAQwRQfrMZcIGrbWbKPqp3JehSUn7gEKPDy4eZKdqDRu8kSrbN2JA0p0lWJvNn3vbh7//r397fO2d937wD2KW8CU6iwzBykY59RYVtx8F2VZVMPuqappGVQENQWI5io5ya9dxSE03I+wh252ct1uVPbgcidS+s33nHceDXIBTvJdoFiKiqvZukmdZdnB8lE+KslyriPYxbtT5oQzna3MYO6RbgUGxrrxEJEmM4jCbXS9mT00Oni7m19gdeFUfRBlkCMJQ7jeMdpbinQcA0ixmykZVGW2O9/4XxNr7s8W8mwRQmx0kWkCjGjXajLltibeQ8bxt+J4RoqexDNuJ19F7K8q0QGd3IBOCqgqrECuTGm2Imma1alb3ZH1GqChUCg8EEYmSNLqb9BiXgABRMLHVmDWCHWeFcuYmc2OLJkhAYOMI3K3n3qiZhns9pLjdP8CDiY8k0obUqDZBCUQms876WmDJkAnew9cisuWpNB4HAjKquPXKK3/9V190zr3zne90hjlaIYOIKrM1xihURcA2Dtg9YcfYdTzAA3IePyFdf8BTO7fqzpautjAZY0Ljm6aJS+LGjRvr9TJ35u/+7m+JtKqrKHNvDzb4+jvhQSLHFBCNWZTK02ZdqDQmO8iywlhjYIg4Ghm1lZGJiDrl0H2Sj8bNmuzotv9Q2kbrznaRsqc9xSlzTxvntQeVzjdLRdnZ4vTs/OTS2/Ls4J+/+VfX3vHhV7/7JXAZsaJRAZRhBUZBCv/WpNyPqHAnkwrper1WDaQk0jpRRZKhI/ei5NKhjJuS0v7anTQ7lRH3Ed3+dyCdX9x/fND/KW1aSJKAIKi9GJvN54eHx5dw7856tYwX3XfOaHSAVgcdFGiDQohhp256ZXr45GT+VD67xtlJIOtDHRCIlHduxW2l4kjaHsnlOtx1sb0l9tgaIRkq0YHvp8qDYQe3uB9KH7nsKgtYIFAlVmtgoQiN+tXy7o8YDbTUctHXz+7Gb8fh5P2juj+AmY2QUxhyGWdToczYAsSNBBE1TEQM8eDNVkqt1D8hXEz8WCGqRMREPpAIlMhQZg1RIU2zZqVschCqVajXCh9dIHcOx8SigciA+NYrL3/1y39dZO65F94WSIW4qb33HhBrbVvQQrVTjEffsdC980PQ7BSG7NoDxHlffIsLuMMLOoiIMYaZy7Jsqto5Z4xZr8umqp999vlJlmdZ9ld/9UUol2X9mpVJAMa6og4kOesRls3qjgavqj6bmsJkJgvK/d4UwJICYBUhQCixy2xN3XgG0lPYlrZ3ZrsjMn2w2YCo75O2HxDay4EQKC+O156oOHnnL/3aP3/zL4rrL5Sv/gvCCr6fFwUoAF3e6LccvOFkmykWuFAAq9UqhGD6ZBSA6kb2ok6z2V+7U+QdUO6BtL3vqsHvuHHEDei4/4PQb2b23kM1hBBdgdi6wtrLl69679flCgJFK0F3cm7rTtma+OO8JXM4WJiK1p4NO+XZ1cnR08XBk/nBdbYHDWwQErLMrOQFChDxtr42xTWUpqHoRt90jFGeDICSvMxbBL41arQyt6I3r8U3COjijmmLOUj4qvZgTw5U9N7m7e+Wu1b0cNGkx4ZTUUdCUtXr06Y8RXmmHBDqQXz2AHqRecNtcEbslCzZgt0UcI1GM6IjgiqrSkqzf0IYo9eLUSGjDdAiYrADoKBGhN00iIhXkBqbia8hMW3I8MXjdzKkoiAV61xd+x9+/8W/+8ZMRK4/8YxzzhkWT7UPUVWefCPqCDal9aPSL4jtlp3vO+ijSeRI2nmwSdOr9t1ojAcw4unTU3HbxgOBgkmAJgTvGy/N9aeernzz3vd/4Jvf+gf1QTXsiNVrx03/4F3HKXlGF/Q+JkJByrsewtZUqzsZsSmOQwCxS+6g/SYbXDzg17sdl1LZjda6/aJ98sTNIAbbg/dyNjozeduYVB4bw65vvU31wSFoluenZ4vJtKD88Im3ve/lb/+Vvfysv/1D1sq06QC9ArFq4c4b/dzDG0+2mcXHOklUl2sEURZASI108o6qxhII4+/aE1Tadl4dd+v/jMe9jXxAa1O0ON7S4/77fneScADEHLyQCpFhZlE1xhHp/ODo9PSU2G5tzgdYdbJ9bC17j2jPNvPr08MnpwdPZQfXTXHUiPNBg4YoLgDqvbe8lW5w8Jqbxx5lUNqinRcy6Q8Fg6uSL7K7P29jkPsCG4gKSWASQiPNqlqdVue3rAm+WkJ9rCciomjjsyX1HkhBwIAFGeIMbNRkZHNS52NyUzYckzeR4S6asX3gRwgUTdpiQDDsPKmoSoBh5/KZB9XlGYOK6TxU66YptRWRhxBEM8N1kKYuiYxq+Jdv/1NVVb/5Wwfzg6M8nzhngzZoBes0erMdUDfPs4EBTb0v7NtxOwcZ44GLhxp3G/eJCWeIqCiK1nM+CDPnLi/L9XKxfvrpG977sixffPFFX5U/gZL2ovDuXt9OgKqQZAirujQmn2Y6i/EgrL1zFhOEGDGIQok7OTiRntuDOPimPZ2PC6j+fWFfz53YY9A5Jfx5np0vF3aSl9IwcXH4xLUXPvjq9/4OZglZqqygdbre9m3en294w8l2ajNm5hdffPG9H/il23fumlgUr/Uoa+tVASLYQbkxkrP7pSBhi80cJF25AAsMhk2fNm28gJCnsBnWh1a/GvMmQiBKkPnhUV5Mp/OD5fk9CAPiMtvUbQxiD5SoarUV+6DaBUQReVUQgybZwROzk+emh0/y5BLZg8qTsqolQwZAAFidNZZGbPh9MGlX+oKo+y6RshoLgDvn6s2H4GhejtKpEiGJSAFJtGqLtoaQHah2J0/QAzMP0rRFzr9ppX9BFxutiNk1GmjjDAoLXy7P7r4clncNNV39bNnUzwaC9yCTYgB0+NIrGZPDTAJbMs7lc+MKhVMiMlEyYlUFGQAiMYJ2E1enql1s2w4y1s3wDjrUqQx2Ry2PoJVKRUlaGcmAAJLQ1LAmL+YwaNbLslqxkLVF42t0e42AtvIMQRS+j4HVAKCuy3/9l38W0C//8q+8453vLkvoeu0yY9isVqtsMo2bxRijMCGEWMt8zA4iWS3jSdgHaaRGumf3kZZ94+98nrR90MFLYGtUtK5rVSIyKkpklAzYCEBsbzz7vECD4gcvfi80Agg7J77ZuI72UQg7ZO7dpFrbTGnDaE/HaERCtQA7N3X1+h7BZbOTsqnyyfx8sXLOmSxr6irLsxC8QrtYfXRbcgcLrqkpultvqfd412GzDluJXDQ1n/dfx7CNmnUiSpOop6tXZfj5en4ijhOkIYXLTSUrD3XGEBf57Jknn8tOv/+t8s73a60NasPYEbbxVoJHQLaBuFwEd+/ePbl0ra5rBoFEYyTeZpnt8P1OxhkS1K4nkmMdd0hPYbSlU+I9aNx3vI/8d7+83U4EFSWIzo8OQ2jqumyqEuI7vJTkpkgemKitxKggYqNdmhYVwE7M7Goxv17MrrnJVc4Pgik0WrYYncsbpfo3bI28W7D+yQx1O0ZOGh/6qh52BLUAaPNKSIJWhJUAEWkmFhSa1fm9Zn2PQkloQtXS7CHiVIBCl3MGYYNZmTlT2KDElNviwGYTD1M3wdgcQOdMyJ2f3RsCY6vBGJSYVHTLc4+hILZQEa2ZnMsmgVQ8+9CAuzKLumGUefzVOorzw++/mGVZUHnm6Wcnk3y1KonqyWTadAs4Klf3LaExob14uvZR08GcpP23CMN+fvq+N2oPtN08qluUoWkaazNp/Pn5Is+zp558pq58COFHL31fNUjTmCwT7wFRhV4gRT8sEBgI8KFeKjEHIhhlOphfXa6Xx/N5HcQ31Xw+f/XmK9euXSurup+N13K3gZ172/GFiDCIIXytN0qh/wRCCOpBQk44YnwxzHOX6eRwbYnPXl0Zg7pesIWGt6KcHeHRxG23e+DWrVtPPvVsVVXMHCIZDtG2GqdfNQYjd3+kBynZTs/G7Dwp9Y0wRhb9OOnOH1D6AUYYP8bFvwCi37VSEk0OUkjT1FeuXjs/P7905YlXfvBdW0x9uYoJindOmnKk26zKIBOFIhCDiefXji7dmBw8lc+u2+JYzMSLCqmSEnkABAcQhKml2SmRbmXi9KV62kPb1b00Bh7Txv9A+tSnaD3Mu3ag1w+3PLsCAJNqzMUWPcnDayDt0lKZ9jdK/KzaB7jH6mcRv+UcEGpfLavlHb+6h7CCX6U0ewdQp/QBAphgwCzsYAqbTdhNjc3BWer7Qi3C0n4yU8rXTmUb4/7Q8OCoUGIwQqpt7d7FGKMSxRtnM2bmhkzQFRFBm9aRp/0SO8tJt6M1dflP//StEIIhPP30jUmRVbUP0sRy3ABCEDBFz0SiTYzZTnmrh34NPBS5TVS7W9y2drbw8bWvjWz3O6ZnxEMImSUhVFXN1h4cHj7z3PNkjar+8HvfMfkk1GubOV9XULAhCTs4oW7gNGBsPxCQcgChlBLStDltGrbzyXGQyoCtNYvF4uDgoKrri8brnMgGU9I7k+tWo+n795cPDrpXoj0rljdvvOd5xo2ingyc0RifIUpME87yS9fcKStxffqjv0c+lWYFBzQXvO7PMzyquG0NANfrNUiasjIua8lwLE+om8CJnuBhe0cNCPNmYN1SBA3IcNJtx+Vpo+zxSNz5DBjt9uQ3KmzTqHQFiGCqqrl86cqrr746OzpZnt7tvJUx1ptJbzwEo49XhIHNMbtycPmZg0s3bH5MZqYmE3DQhrjVUMUakSxbecdSHDpQmo0bh1fpjkHGPdMxLxhQlXs+4AHke9aODm0PJDGbfbRBqCoxiMVCDOr18na1WlBYQ9aolqDGWgQ/Hjy+TKSwXboYMsqOOFPlvDjIpgfCrg4sdVA2xuWDXN9EXX2mbU5oMGMPDmMtol5YjLLlaeKig/CGhm+chkBMhsnBgEK9JBKgU+a0zgN7xEON3ur+O9/9trFMRDduPMfGnJ6eZ8UEnVOxBLlYU73zQ+/cofv+3Hlq53684PJ9z5C2RzzAKZHtXqGpA4HzfCKC87OFYfvccy+szhfHx8f/4xt/0zLiADHL3pSbMt7s25CwYAolbERKEmgJH0LJNXDP+yvXLJlpXfr58cnZcnH15Nq9e/ecy1Nye/EK7NXgu9o3B/0KJJjUPN77k134RhfcGtj+BNQOGrlwsIoKgwxZy+bk5PoLL9V3Jk+8ff3KPyOfoyzJcFsT/S0GbzjZNtyljSUCKEZWTK1LKWj7zVSUoDTcloOD0U6jQft4K+7b3vtYgRR20vgLho35vWMOj5i3FUogZTZBPFt3dHhsWZeLBXzTXrENLQvTYg+GEsgCBDfB5Ojg8gvT46ez6SWBCyBIEIrevMwgiCVWlqi89YhmtlTN3LmOb71d0khjbQcYNMTsRCSxXUPSoiCiLnnRhpcigChNapRq5vfpGzafoOWEEEUhiWUTmDV4hZAG0wbbguGrxa16cdtXK2gDX4KaNtxrB76MQoYk0fEMMmCn1rGdUjEnNxHhIEEAAjORaup0tgn47h41aiwY8Tl1121fV+gU3tJygR2LB41WbiMamqAAwUwtWxEPAbQBa8/L6OgtejCGQlBpqn/5p3+MqPba9acnk4mqElOXzlRUEXPX9PqFlGDotivo1vPvofT7mMixNL9v5P6+Oyn6fUwzvXJHOQqnxrimqYjIWhdCWK/X1tr5dPKhD330a1/76jve/f5v/+M/kMtBonX1wH5SqTP5Lg81jX6Rrc5MIUAFfxoqJcXNV757/clfYEJdro+Pj2/duT2bHuwMiErnasCyj7vt8BuHiba64YB7dUn8gLR8/AkMO5FalEmDUVaBoPFgY0xD2bVn3/vSd3zxhCtf+Tas02axrWt6q8CjyEne0wFrTVmWp6d3g/hBnvBNCvHQ/tm3p9nFWySxpyXtLAmkf953qMHlg/EvvlDU///Z+/NnyY0kTRD8VM0MgB/viptHMkkmM6uqq3u6e2pHZHpXdqVl939fWRnp6Wnpma68D17BON97fgMwM9X9wQxw+PUiyExGMquoQr5whwMGmMHMPr1VNYoERdw5OaqIlOVos24++8XPbVl98sln+4Ove9+6TNRkAANTlmfnF1dPzi8+dNVDMZNARQCCBkXgnNOfiJilS5RMQpz90XrC3oIcHDyU806+0NNeo4cnHLZ8x8mHpLS7OZAklsYki4Gmog7EFCX6UK8W1y+0XVJYaz1D3IAiAd4fbqJdlm9FTvCV2zewBWxVTi7BrvbaeoGxxhQAhzZS91Ypu3TdNQ7yVnvX8RaOvq89UoIAkh6lq1JDUE7JqpG9iqJwhFF2xo3YFcY6tgXYgg2yD8TJfSAGIVIQxdj+5je/+t//6395+s1Xk8lIRNDF7GnHuaY5n59tQP3XveN7NPx128fdJXnqwsOb6jG03nsYDJDjSLuyE73CbEUk5YwqXEVE8+WqbsM//uO/vbi4+vnf/6NG0TYi18UY0i6unHyfR/OZG8DocKpJg2amYYGw+ebrP52fjUWDQpras7NZ9bPjbnZy1Q+P7H3QO5npu3/9tjRsjcioGPLGRGdBhhTaRDSLdkWjaYvJh5/9UzF6f/L47+ENtHg3EPZDo3fhkpamjSpE5ObmpnDV/UePRbY8crKniiZRe5suYLjS+iN7B3WnnbuUZnccP1zGR1f1G/92Oda1y7SePgKAgOar5dnFedv6x4+evHr9/MF7T1598/RAGzckghKYYQo7mZ5d3p9ePqHJI6HzoKnGlSp5JSGypAQYUkMAUSREpQACwQ3TrO0pXXVX8ji0ew1/PXH8IMNotvWmzWIw4EyqOOphdvS+mZQFyiSKnSv7ZpmZSWOMm9Xar6+1XUNXEA+NoJDykmOYG3zQSK8iVAWYlSxsYYqK3RjsIkxUEhCUjDEklKplEIQo1yHsd78OoSl/pmz6PtGru+hbqdbzhp7vk5PGEJDmYgZ/ZiFSYqFYFpWKhDYBUkwVTXFqAqZbCIwlERLvf//73xduZIjPzi+JHIwFqe4kh9Z+Lg0P7XWqH5k7ZGUcW4Y0MIcdnnb0yCnAPvwVADHt3TQFcWiMRERkYozGwFobIyTGzaaJMf7TP/3ffvObX4fY/vEPv0Ns2Tnxe3bXzg6YhuFtxfGOoxJSyotHAaCN9aIaXa5m1/V6bu1ks9mcXV7Ujb9jQ++V53uj1eO6npCSdb8wQTc4Rybq28rZR98jkYlKgGU1zGANXlqmKGzAvGia6eh+aFbv/eQfX34huL+q51/FO835/1Lpe4ftpDa0xnofJcbZzXVVjmOMBE713VVVlZASSXbT+dTK3INYIGtYj8D5LiAdXbSnAPuOux8+2875JHkmiyLnT2CFQClmsiKQGMejMz/xr9wrhE1qpzdFItm2mUUAYnCBYurGj4rJe8XkCcrzOhaK1ljHFEUoiiT3M6IkFxGSkJoeL48odarQnb9ErCq7x3eUTlvM7nPCHKd9VdVJJSRJnyHnbspyAyRnFMlHOZWjFgQRSYUFrIr4Zbt6rfOXVSntei1QY4jIhhAAsIUc2LZ7tb+CiK2Sha3IjU0xccV03QgXztoiRBXvYwQbY53RmF0jhYgVEWrAQjoM2erJHMvN+pckJRpwJLsMUXpOBhEZYwBRFYFxYwpkbCuRIymIoGF4yR5ZwyFKDELMgIhvfv+H36zXy//8n//fbGDSAhSFMcAwUfE+VO/u+MM6rTvS0h6cDw/2K3qI9P3f3iXtFCofXdd77WDnZXGOdklmrwgiZbbOmRhjXdfGmKqqYghlWbZBPvvsM+eM9/7p11+Ibw5HMg+v7mH2HXmV8kDkq4D0utJeCalXN0+v3vvF8z/+86NP/910dBaZN7WHrRSgpESi0GmzmdSA+mDK1JwQpTQSp9U5eViG3ir77+VbcZlvolychZiZuJuZwmwMUYhYbjYX1UjacHbvIxFvrZ09+2U3mgO/gWM8+t0BeH9b9D1uKYms5RwPqszGSZT/x//rP4/H0yeP34+qjY/OuSBRRApX1c36lEfoXmWw7TrkfWAenj9sKp8wqM89PD4UQIdNJVvaIfzvSQmDZd95vBOialIeJG1b2m8MiBRt285ur5fz69vbb9rNAsqFdRI8kOI9JAIgBy4xfji6/8nlg0+K0SOhSk2hSaLreeQk3ZJDZ5dKA9AxQL3jifR/dVvNeudvf1XXl340ZDj+pPujnViW9DV5emeXw7RIJDeiqobyh70W4gG7pqoMMTEgeQmAFBxSWj0JhOgojqxY1O389ez6ebtZOA6huWWEQTdSvDuYnUQPgEiJSEWSs1aEJR6RsZGsLUbF+EKNC5HIlkK5JLmqdhLKdtjzOJCQspIcKuvehjU5JNqt2LY33w4pFR7PGehUug7vsE2yDQWk0LSXF2eb9VzaWvyK4P1qDvLQ0KsMtgimGPSrD3hnEH7xD//4v/6n//ujR09evrixpiTrVMg6DuL7nZG75HEJVlWV0uvr+AvKjhBHEPdQGjscgeESPrVv7J156pyjL2vnYGJbB8xr+lVEYozOmclo3LT1n/70h9/86p+fPf1aQwMSTp4bCgDGoLPL7yRN6+7R71d7uOLS3Qgdd9Vx5OACPBpf/UTN+fTiCczYjS/XsWDj2ERoo1KrRoZhKgyVCqswAoAiWEEtkSGU0B1duhDvadHz52zzNtth6XzIiQjcmeb2fA52vx41je2+nZSTMTMWqjHV5Imqhp1GSGgLQ5bD7Pr5zTe/q9qvVy9/x47Fb4jV2uj9rsk9c/w8gO2/eeT+3qXtjNmU3LJYVdtNXSVPcgIrYowpibcSiK3ueuoOgWG4krck2xMO8fuYtH3kIffQVw/OO2x5eM7uyfnXBGKq0A47RSTZH5NkXLhqVE1wcXUd6mQ0HTRhAAJXGF+6s0ejs0emuhfMWRSyTJSTb2YV7272YEHepvPWwL0ollNJJw+XlAUlYXz+3PXiqP6Ogf0CoAeDyMNQse6mb5WE/K5WVUlBhnutL5CcdVvnoNKuFq/bxWuOm0I3vllxt7sNupHk4NwLVdKOd4sgNuMYGTBuNCnH5+TKECmq2mz5ZgCcdJupUAoPthtCsgYM0nTvdPDw4PdBfOyFnSAaTy9uXl9f3b/X6K1S3MxX5/fuza9fnDg9I+xwaibc+t3vfqOq//4//NMvfv5vbq7nIUjrg4hRjszoU5MerqyuoawMyHroXTq6sg6hd+8Wh78ebepbA3YeCun/Dn+11jJz27Zte3s2nXz66WckGkJ4+eIbBC8qVVU0dQsgxoTcd3kSHEMURZauOoWWdtYdbWHd+tUXk4c/m79++vDJxyxBA69DtBydi5ZT+ioyxkAAHfp+RwBCYlRSBqO3p8E+cMRqfnDOG+hgqAVI1YLSzMi9phDZ5jLFyhS55PGD6YNm883NvSefXT/7YnR2f7N85b3uhI1874vvr0PvIgCMDamSigTvrXNPnz5V1fsPvS2cqkqMCdlTRLXIydV1FFz1BKbuNTI4Tntt9lzz3o3u3iZO7UdZ9aqs2R8194hBpARNPslgUmfUO6K1MoggXnwq4hPBCgZKGt2fXnwwunwyOr/PVRmhEnS4VFKkpR6oTA6VQcPl1DM02FUbEBGOqa/fBl8Pzzl6VTL4DoCmLwuW454j9kOIozIxKCXehpAmTyuxDIS2qeerxW1YzThuEAKOM9ICTSziNl62q7RtwAawphiNp2emHDVBRclaAyTMHsh/x9KWHu5ZR8H77WmvhMOhTfEo8bbeeR/+1eUySt+Q1a2tryfnZ7PZzb2L8fJ2Ob24mM9ejc8m68Xtt3pO8f63v/rVaDxhsj/5ycc317NxVdW+3SvJIyJQ7t57/zxpGkv34S7sHP6UeN+jo/E2qHzqnFMH75j2/U9N7atRURRFXa+bpjk7O/vJT35iLP3yf/DTp19BYt20ZemaxltDIqrfWtQ7HZsHoGmBcvX6G3P2aDV/VV2YqrhCZEW0xEyFkle1UZXBStoZ1ztxXe/mIY7Q3roe2MXT56ST2yZU3htBPTSQ737YvZn0gSb9q08PICJFUVRXDyfx45tvfjd+8MH61ZcwFWTdMzeDbXC4I/7Ni9p4F7CdrNcZjEVEXrx89uDBg/VmeWYuiFWiphDnGGNyFu0vPcVrD//KmwTlvfNx4vyT7Z+o2328cfRVOVWVQEmDSbmd9KwSBeJ9s1rPV8v57fW1b1O+Sc0VKdUAJY0eTM4+OL/3UTW9r8VUwaqBDQCTgrrfckPf11kdFM/ePcJA3LZ5sD6HX1WPRNcQ9Sq8tGh1cP7+5Xc/OQAokyEAolFVVQQUScVwKDiuFzfN8lpDDQ0SWiDwrnmXgH6VbnWMQNKYKRGZKsK48XQ6PeeibHxsW1Fjy6JqfNyyYt8mK/vbdu0vTW8r3McIRlnw7e315XQ8u3nROWHcQUd3Oqkmk//+v//X1WrTNP7nP//Fq5fXzrlUW6NbxVvtd7f4CJBUtCRhuXa/H97gKN+MwRwezt5vC9unXtMdlx89LiK+jcZSWY6Cb6+vrytXfPzTT6MPZVn+8Xe/ta5smibV5+6HrvuwzfR3mo6ckNZVTupSGLR19MvFbQygyf2qtFVSnomAqVSlINTVR8/7MAFQe8AlvhXt7SR72u9Tp+19OCVZ7bXT/5o0tZ1ol2HCsru490G9XGw2rzG+h82r0dm9zeIVb6NKmcGCZK07WX3gb47eSb3tPm5bwSDvfVVV8/l8VE3AOUGPiIQgImEvMeBRoXbnL+HoCaek5OFr0472bndHU/3XUzOPCFEVKYtHClhOtw0+pQsXSOs3q/ns5vrVcn4bfZvWLpnOBmNHKK/GZx9Orz4cTd9HOQ6iQaLayMZpjNjRaXdd6uv3dPRGLvoQepPAvW1z55zMsRLtRFoPxXfdPbJtc+BPPnjyLGp3AndEZv/7kU96PCcakoOAYTKkRgPQtutZu7oJm1vEhtSn+tlEkC6Ok3YHgTQVKOc+AwlMQcWYUJWTc1OOW5EmaCQ2bJIFXQde75S6MZg+dzBMfz5y73GKd525+zsNwubT993dUAtnNuvl2aQiMbPbWxGZTqfL2ct8uyN3OBG8RNQ0DUh//6tfXl3eZ+b79x+AxLARjTFEAMzElBNkqqbsAsi5lRS55Gv2uD8p6R5dfacG5+4jR/mAt8HpO86pqmqz2UgtZeWMcSG03ntmfPLJJ943DPz+d78lLprGF0XVtt++PnfiWtMSByPVM0iAH9SUHNsVijOsX9Hk3mbxTNiMzh+4YtQGiNqiLMnaGEVpK3GSJk1SAu0/w71psOfsTrPOHbIbrjsgvD+nb1VVkQI4sh4OqpoqK4pEZk5XikggEj67997Pv/xTmN6zy2vZLK5NeR7rdedweleQ7d8uvYMKYDnPHzOLaBQPpdV6EUII9+8bKkQikVPVEIJqTEm+hi0MX+3hwtPBacNfT0rJB7CNg2k03B1Owv+xOaeqUTolJTSXlQSzirK1DEIIwTebxWo9W63nwdcWaq3z4mP2G69QnI8v3j+7+LCcPEJxHpXb6COCMWlkzPCB30inmIxDl59DOqYQ25Fy9pq648PhwYOfjj4CK0GVCZGZCqNGodFrWC+un7G2iA2ahSJawwrpcnFwHwqFwbbEQMwBKhbkYEsuRkVxTqaovbQhKpmiKIS4bVs6UYvzlIS9N5Jvj7tvvMXdTMCpW9M+YOefQmjPp6PNalk6Wq8XZxeT5eL6ju1Mh/v68LlUNbQAm7L6L/+//+96vf67v/uHn/zkJ03TyOCUro0kfyfkHu7sCn6DkmDvp6Fr5PCEo4U+946cmvDfDf775zHGAIhB2RrnSkjYbJqz6finP/2EhKy1v/7Vr0CmbQOndDd/FmVni/Reom8BoF0ALoSlYfLrl2XpjDWOCq8EMUqskjwwszeWAVIBMUrr61s+wa6Ush9QOph4O5ecEqNPIvf2LwAMUwIQUS6uKhrYNlp+8Om/ef38D5PLuFo3USLgFUHy/puYePnW6/AHTO8kbptZoySrrqoC9NVXX7335IMYIxuNMRpjRURTNaIkqgI4AZlD4KRBGYO9v4n2wElV9UAJ3585vAtOLPJD1mH/K1Q75V/27xURCIM0io/tejFfzG5Xy5mEvupfysJlYcYozu3Z4/HlB27yQO2kERalSMzGKMUQgoHhbCnULq2/0D6Y7HOa+iZd4sERSp3JWoPtT8eDKL6FbXtYIRv7Kco72bEPzdqSNWRN1HbjVzf1+kY2M6WAuAE8Tq9JOgxN4wJkYUtTjG05NcUoCvuoyobJZO/xQb2EJGeTgkFysMe9M9v2KWBLBndJEu3g2hw7nj1yO/xWIUSVaB3mL7+5fHjv9tVzSAu6a/MeSu/bB2OooChd29Qg/uf//l/LwhLpxcWFMaawVhU+aowxVbDtlgn1xvcudf3xCXmUrTxkhvbY7qNN3Y0Qp666+5L+a9u21hbGuBi9D4ENGKzEPkgU/OTjT9jZIPjjH39PqjH4k8LtTvO73vvHiBTEEIEruW0DOyP1LJKq5XZlnTHl6L41thEJKYNi5sCGOwN9O3fGE+NAlBJUHM7bCIB7O3d3wd6bot0PgtjfJc3e7n7KnDIJqfTcP6MBArmqLB++99lXv2+ufvqPN5//kt2Z+JnCy78IS/Yhff9K8p7lVjXGAohRZzc3Dx8+FAkQhYhQUFWowuzANnZnyR5sZ9+Eu2XxY4h++OvhLrB35BD+D9sHcnVcRbJRQyWwsgKkCLFVhLZezuY3t7fXzWYBVaTM0BoBC5RUXhbTR9XZ+5PzJ2qmQV2IogTjjLVG1IfWO7e1JOlboMIhYB8ePAUJQ/oz7bin5em7SZgIFJnEUGRpvV9tVjf17TPn4OslYsOsAGIMAMhwFueO3UthmAs1TrlEUZpybIuJF45CxMzWiYhvWzauqqqms0TygSL6h0knRzhhtgqBGFIVvJ7fhOjHV2e3r553/jvxLVS1O6QCV9hkryVrNcj/8V/+t/l8/p/+03+icuScUdU2tDEKkTCX2E62DrlPGOMPV+jw62F89h1szdGm3sSw3nXw8LgxLoSQHowIElU0ANS2XpWY7UcffSyC9Xr97NkLILwp/8EdtOc+JhAYA9+IK8j7BoBuZlFk2TSqpiqnRTkNtQQVW5SRAkHyrRWAIeUunO/bPc8eI6W7Mrfu6uGGV53arE69Jto5osYYArz3MUbmHGnmJVJh100Y2dGHH/+bl1//4eLJZ7NnvwYsKCdH7Nbvm5mhvxV6B7Ddi1aIMWUOYgWPRqPPP//83/9P/7RYrQx4PJ5eX9+Ox1UUGU6jLSIOlN7UORPqrpJt+LdXpu3/dJDeYXg+Dpb30b9HsTCR99GVxrDx3iPkxNDBt64wi9vFzfXLxfKmret+TJQQFLAVyqvR2fvjqw/KyUOPAjCRQZ2NJwRiWGusCIj6zP7JuyepzYWImBSd7Ekkw6386JrJ0bQ7It2BzV6JQOml5DORa1SrKnUhMdR5kxIGqzfl1xzI6zHvGelhqM9YadLdWQGwsqoqRKBQIY3OScGxXtzevvoqrm6MEb+aA54QhvWzVYTYKramEEXvtczEjmwV2JhiVIwv2JatkJKBYUVOAm9dqapt2xpiVWXaRoALHYHGvl89nByFkDuYm1MTae/Ck/xZPiExc+k5U+RrNMaQSZ6ewTCY2ED9ZgkNEur1psXdfjpvYlZytXhAQ5uW1e9/+0sA//E//sePP7m3WKyibwtXOFuuVqtyPEkv2lqrQIwxRq+qScN8quNvw1YeIgR2Oe9hC0fB+/DzoX2tPzjcUlQVJGBKOQGHpwkoiDLruBx98ulnriiMrZ4/+8o3KyS8JUFQJBWjdIzRvsw9mNxH+x4BQmh7PUtAu0DrfXH+1ee/fe8nBaM6n1wuNitbudjNFVUViaQm1cHJi3TQweEtDiae9AcGWSLQ51c+uHa4mW9XEO2mxR0036VG6B41x9KqaudJbm1yT4sChREJUWB8NAWfXz386eqGxw/X6+vfoCjQ1nnxMxilDwEHsSp/i/SuKoDtk/zhD7+/d+/+q9cvvI9FNZ7PZkVRtG2g3UKTd6yuncVzYoWfgt47Ttj7cHj+YTvbvVUxGo1WmzWknlQTdtxsapVQlHZ2fT1f3CxX8+SWQmQ1hXoJYCt25258vxw9dMUVzBQoRKEsSn2xepPytfS1L4fbx51s7Ld2OTnkmr9XSms7RiHWgYpYADAhxqayRLGez27b1SuKDdTHOmP2vspe0VWTS2mi8s4nYGPKEAlRXTkppldsS68corI5mgj6L9/H7zaSf9YrUNGU8NaQYUCixMY36xhq+AYSAAHpXk2z70idGPenP/2BGcv16tNPPhuNSlXa1KvxeLxp65R9pWkaBYwxxpjD9bVt74RzwClY/W6j9K2u2lt03bXHXcFjjEVRkcblclUUxfvvf5gY7q++/KOxLjQNmKyzwXsF2Jwqnrpv4TnEcNZcvxU5X16wY9PePLv34cXTz3/16d/9x+vb5+XkTKTNuYUTcdYIgnYC6nrmu/86PH50QIZfcXDtqXOOSkd7zR5lf4d4TypKUVhZEMAMVjPl0VWJzegMr7/4b25a+FXLFrFFRChc1frV0YH+26J3CtsdQykAL5fLJ0/eWy6X9+4/BHOMcTSe1nUtEk+5pO0dTMflTcCMvbV9Qto+hOFTMH+q/UTee8sGKq1fO2MLR20bV4vlcnG7Xi2aZqMhgBKPbRABZ1FdlJNH1fhxNX1QlBfClU8Ryio5OaYCypRKFOSq1XaL2VmajEScFEvZbNhJwHc87SF1nt7ZY3y7frIp8o5L34rS3SMBSf9MBIkEyruWKFKCQ0qJyUJJXkPTbpbN8lW7miGs4NeAB0649lDCe05vKuZyLAxbgpiKUTk5d+W4jRRE2dij0TUActhIVjek43yX4PMmOmnsP/3rWzY8+MzorN2qKqKGIpMywCohNL5Z+maF2Ha5XqXfu3MDpx7hLR+NJPrNb3/9S2OMZfrss1/c3s6ttSG2RGQMAYhRUnV4Vj5VLXd722N889FN/9BVbXjJqQ84sRz2EPqO+wLaqZC6a0kBBImWnURufE3GnJ2dvf/hT8iasnK/+9U/wziQBO9h+pyIB2PZj/ruAx74leycQEBYLVx17/rL31x8+A/Pv/ndwyc/DeRbUQNOCeoSbiPlbu2KbW9bOIbZex/6Z1HFMNdQFxtC3bPsjPCQ2TopbecTBrpPzQmaVTW9gSzZ5RyFMU34qBTIkC2LyYUtw/XL63sf/8P15/8XShPrCIIzLuwniv9bpb+atA1FjPHm5vXVvQfr+YLYrNcbVVGVoT4Wu0zc4bLpEGp/BpyCW70zDvttVvhR9r8nX7dFUcBS9D5IYOZms7y5fb1eLZqm0WQm6MtakUV1WU0fTi6eFNV9ttNINkOWqiJSFpdT0qC8MA6eJO28aVpvf80D+CafpkPaU2ThzwKVO0i2/AFJclSDqkIUqqIGRIiO2tXi1Wp5i1CTbLSZQ1sy0ouIaX0PXlJiitJsIYDBjkwZ1NpqUk7ObTVpI7VewMbaIiUtf3t6ozPB3dcOh/FQG3l0g7v7vnmDpOE3ACIqhsCkhAiJITahrjNmq0fvbQjty1P8BUgBErL2N7/9pStsXde/+MXfb+o2QWqMkVJ+dCXNkSM7SUmPtHcMtg+/ptOGFtbDdt74oadDt4879pb8efeh0vFkaimKKsY4m82MMR+8/2Fo6vF4/N//638BtBhN2s0KuxGVO09yhF+660DyU1MR386BYj17asf3msWYq/PCVMIcQCKkTMTSz4Djtz74ZTgshwK0Hti597adO/wPjnFRg51/9/0CSYuUZQlVpNETRK9sCGxLtudu/GA+r6fv/f3y6e9hCogHoP8iNOT4C0hP3+k2CgA8Pbt4/N6H773/UeFGrho1bTSGQ2iH6aiGrO7ekfx1F8b644c5zPNpb5K2jzHUx9o5oP7M6AMbVKX1vrl5/Xwxn4mE2fUNVFOylPQfuYKLM3f+uDx/dHZ+n83EqxWxxAWMEYgSJRUWwZjOISUZtpV7WAIhe+oyM3hgKUxK9QNueue9HBMptn1RORxP1VQSvb9qm+5Rc+y19OcPc5LnOOyBgJXDM0RBQgqRoBDVaLr5YrDx869X8+f1ZsGIGmttFtDIVlNUYa9M0NxeSh7by8kWMCjGpqii2Gp6VVYTL+yDCjGx7bq/U2Az+a/eLRwfHcm9mbA3wkM6hS4AoPHInnjX+YN4gXyKAJDYFpYtqcYmNuvg69jU0ddAk1MjpLGjTuDOTQybPtTQvpnIQAVsjAT9u3/8tz/96ONPPv1F2wZV9T5EVeecErz3AKy1p+TtvRW3fcBjStc95uZwrO5e3afufvS0/ec5eC05T4Nqig2z1oYQ6rouiuJsMi6s/W//7f+o6/VXX38xe/2CCqPBQ7cFvgF0SYs7C08m1q1mKADbXXXgciXMsAU3tbjqzDdSXTwRGk+v3ru4+kDtOMK1QgJVwzCsSpZsn5M8UcpJfjieuquX2htkBeNg/IlI4z7MDy/XjgbjORjwnWGPw7HNf0kQAxEJrOZaPpEQDLzBZnn7zfL1V2MXF9/8yZoQmpUz5OO/hIphfx1pmwA2ZrlYfPA+39zcfPzTe0KMvkb1rkC8t2b2l82dHPHwa8epnXBVO3bVHe3s0fagqDGGKW42m83qZrmarddzHxogggAyXUSxcXZkR1fF2ftufE/tOIJjFEELgMVqSn4tTJSU35IFU3D/CJ1MPNjcBw9DOf3V8aJ7dyDQqT3uL0LbN4sIhWpMHjyqmjCbiAwbkIQQYtvcvn5qZU1hLc0aCGygQMJsoK9vNmgfgAw2U+PYlWSr0k3JFE2ADxHGFq6KirZprPt2CZm/c5f3sPzUr0dF8G8r4hPUGWNYWaUNbWia6GvJcnaHBPo2SaO+NXKrwFiOIbI1v/7VPxORj/LhBx9V1RhI5WY0ZUM8Zb/cae0YbB9+vfucO06++8y7P+cjRy4GACJi5lSfm4hGo5GqLtcbQ/xv/+2/+/3vf9c0jWqcX78GAObdNFOnUqcdexf5CWzaVlVDW4uz8M3CFON69mx0+V69uBmPLrm0xrpeeIVGgUY1rLuTcKDo1qHEvDsHeymlP3KoIlLV3kF177T+Xey/FBq89MPXOoBtACSk4kDErIIQVFJp3QAeucvxmYs1h9Wry0ef3D799Xg02mzmx0b1b4/eAWwfj/RNQ//y5cvze7i+vh6fnW82tXOWefsrDlbakDujbr/HwSTAscXW/T3Z/tvA1RthWyLKwoS2vn79Yrm8Fmk1emljN+kFZAAmUxbVxI0viuphNGc+iiIoIgwTpZKUBdQQLIEgARSJI5SVHCGVn84VRTRZtYX2BDuF0LHF/8aNsv9ASOG2f8l4iY5zj9gpI5bLlJOoMUys3of1chVWr+J6aWjF0UcEIEo6GVtHie4Do8shBeTa7TCWy8q4kmzJtgwwUZSMZeMEpAJi7iprCrbFmDLTA+hQwhBwiqH6zh0/HPm/hG0bOCbzMUNjbP2mWa+0rSW2LEERCbINc0//7KgaBse7lk7cc5uKbvgYbBCDuML6NrArf/XLX27WbVs3H/30k9FoVJVl0zShCUmw894PvZGP9OvYcrsDR4cws4crRwH+aCOHP2lXwWzvZOqikzvK4dEAeiyMMSb/OxEJIbiiePl69tFHPz07O4viASwXt8cKfb51PB5Bs9eFJYhqACFEEEHCGrbyzdJptbi9GZ+XbjIiKpDDIgSqigjYfqxO7W9De9ne+BxqOHZaGHzcU7PfsVfT4NWfslkAIGWjFioCrxxBIbKqMKndNBbt6PLy05W61fVvnvzk02df/vd3pFv+/uldSNsEHLLtqpGIr69fPnj85PX1y8v792ipk8lovVlC9ydHd4kOZlXyhiDVI2/0Trg9omF7E2B3WDA8uFcLKJmqhcvSrRfL5eq2qdehqTebZf5V+6Yc3NSNL6vzB+X5Y3FjDxNiAMQ6ttaqUogZ5ruJmz/TXmjcncY8opSccztQ3ZkEyB1lf3YH4WD72DeFnhbI8pnS3REATN4ZJOZypknJy6BU3YMJwiFovWjmL+PsqTMh1GuBGEOqLBpw3PNWhp8UDC64nJpiQnbEZhSEA2CMs66MMbZ1w8zjatTlm9ymjExFh0j5qMn3z7Ftvw31fMhbAvkeYFNW5oiBxujbzTLWK8QaiIJIiEgcyV7bbxa73/bpE4r5Nhhro28A/vrpFyG0RPT+hx9cnF/FGCXEoiqZbV3X9vQO1K/0Ye7uU1v5ITwfIvreh9N3PHlw2GwGuZ2B236WFPhBZIyJMXrvjTFFUaTUzir0+PETZv71b/6HhLiMihgO4qcPv3IO2NunPuG4WDaiUQEiiABSB38TGonKrijKUWmMCgNkVFmRZrl0DDqITHJN1wOBu48TO0r7MsN2lNL3bsqRUlrsaRJKsqORJhUZKUCKiJwKl7udqs8CS4oIdEVUu1ESqKogNc1MYokM26r19dWDDy6m9M1X/yePH8rmNVTewBLl5+578uZz3z197/wHofc5yWasXcWmPbu8X5ajf/8f/ud640fTybpekeEYVVWdLVU1+sCc92vqLR/UQbgSBkVed6Edewf1wEaOg8W/B/8qppdBUgaftLqCBiIqrVPVtm2JqCgKZ+zyZvX61QvfrJt62bbLZG2KaTNWC1Qozt3F+2eXj4vRpVAReazg1C9iJaIsOLLt+9VZnRQAGZsGkYiSSTbLK7kiJxHR0MKdj2AbwpF6ljxI5eD9937I2yES7atNDAY2lcHl4RHNGY6SFUo6m3au562qBJgYAQFDCa3EEKLAGhgIqW/HDpNCm8XT59/8zi9fVCWa5S1DZZgHjfpkHd2eqaC8uElhFSUZS64qqomtzlL9bJgiBTSnglRHMi+QqFBfU5mVjy7uU1Y6YDtud9NdymESQHgwxv0vOzqrvuQzEBQgwyCGkIIhTGI0rOe3Ipvo14g1tAFC5gje8TaUe8APn7z/0U8//tnPfn5+dhmjbpogAiIik/NWMnOSaGP0fcZQJKWRdNs6cCj9763c5OPWu2LIoMNvROU76KgkMLzvqdP2rR6pTi5gLRtD683q8z/8/k+f/2E5n0n0kBQUmuOwmTMb9KZH5MEE2eJ6b/NWGPAUo/PLBz+9evLxsiFTngcqRQBJygDHbKDcucKoMu0sDjJphxFkdqTfELrd6Y74+y3jRaTo6uduGeVUYCb/VUCITMc6x7QqRZKV0BApa9pPtkJLDkknEU3bHEOUYiiYShvFL2c3z+az59pcY/7HwgXvY34X0MIVrW+zj073knZWyg8Pub//nORHleQEKIwxoljcvn7w2d/9+lf//D/9u/9wM5tx4RLQ9Cqm5IDaMX3U+0B1sJ2/pYZ7zD60oOwBzwEO7R88WI0KYiBv65aYmTebjTHm7OysbdvVYgng9YsXk7J8/fIGCJNRtd6sRWAth8g5d+nogRtfcXGhZiq5fkiXbUFZFZR9K5RIOhE5hVjQ0NKpmv1A9UDg3j0yUEvspDtN0/SQbzs4Mggi627di7p9noj0PAeN5Z/i8DMlfzImIibDJFBRiWFSWRvrxfWLev6NjWs2dbNcdPNnGA/DW0cq6hh3QDV5RRfElSkq6yrjxmBHcEqgvfrZSRdASAWCup86j0Xlb21P/osRC8mxGqFHZQSmlLdSlJgcA6oIIcRWpaXoSYKqz2bsd9If2iqKu4RcBEBub1/F6EMIH3/86eXFA8toUqmCbranla6qfTahxJ0DnWMjJc/h4y5ph04AOlCY752/R2+D3Kdg+42NDLej7VOJhCAAF2705MkHRVF98fkfb2+v280SItYSsXqvclS0Pk5piHYC+QbykiiWRk29fvbVH5c//8f/9WYdKDprnDGJuRFJmXtz1hRWlWzOAgDKPigH/rxv0f3kYpnFZVV0NQbTNh67q7X7K9urKJc+3nZwoLpTjSCVLkkUwCqG0nZFohKJRRmtRnBRTB+VYj2MPVs1i28AZmaRMK5Gm3ozLqt1U2OPrT1iMPqh0F8rAAxEiDGycQp9+fLlw4ePr6+vx9NJG6JG0Zjr+kmI2SdZqLM96lDaVtmuiiE2H5WB7sZsoJ+X1EvsqlGJc54vRYevBJimacqyIqLlfFVVVWHLP/7pd2ej4unTP1ajKgRZbdbW2hAkRIap3PiqnD504ytbXJItoUY73boqD1iT43Vy8k9Z2ZSYS06PrKpdfm/uGkS3bIegmzy/tj6fqcq1nESofQYo24CPleXuBzbL69tLOL0ZUgKJJuOqqIpRSuVRRKMvWQxa39zMZl+3i5dWNxpUYXezCg8+d6i9ffVIXSMuymo0Na5QUyhbheHUT+07ni7ed/z5DgbmfVnqTS28kRnYAWwmVaUs5SQSJQwfO70LSr6LENUYfB3atcQW2qqGzN/oO4LtU+Tr+rpuWx9F5OOf4uLiqio4CBJUYzDJeVhcJPN7/agqcFy63ePLdUDDx7gbXO+gU+3sofLeCYe6PWTrFUURBHHOXVxdjc8mRFo+L549/do3mxADg2jgpjZs/W05ul0ybGKzifWrsw8uP//T7x598PNN26omswYjSQvEDANFhADaIfegd5QK3lPm97swHiSJFziSBSGdgN120mLtbNj9B+qkeQze49A6yd220kPAgJuPmWXUbBknJlUJQZw14/GYoTVq4YftZq1hLeqrcbnebJxF7WtOOsDM3MuBweKHRX812M761xitK5ezmydPnjx/8c3Hk58BEJEQIhGRNYPzO84sRzn2q5T2pG0cW2N7x49+INo23V+lBMCnFPb9pEyB1YUtm01bluVZNX369KtXr16dX4yuX351flnNZwsQmbIKbYCtoFxOH5Zn98eTh6Y4ixhFcZJyGhokRf+Q1dCOR8i3Gxbz2OnafmfzMtD+V9nbrfda3rZy7PMdNMCnXRt/344AWRU9FLUVlPpjVbISmFVVw8jJevmyXjwTP4fWvl4CIXFqXf2Dgcp4wBmoUkrvSsyAhR27alxUI1gXhFQpkoKMKB3Tb2s/n/p+He3O0RG44/hhC4cAf+ri4aVJ8ZQnZAbsnQ2FNBJS7sYoMURfh3bt2xXFViVA2ncuLxx3QU3PulrOf//737Vt+Oxnv7h//6Ez5Gvf1ZTM3teAbKMED9bpXnf2YLv/mlqQTly944W+Ja6/5fmHeq+9X6XL0JkeL1X5JPD7739YVVVh3dOnX21WC4kCqCsK37Tfgt06zZwRKWKLslwubkxJL57+6eF7P21C0wZVckzWGDBzhusY2WAw1Ptx2ERbwWZ3wh+O3hazjw7dka3jUM3ZbY/H3o4woEqK3hyebIIqSqI586wSu7Ki6b3FZvbww79/8adfUlnWm1syAENCQmwGTLbH6V0T+a9O3zsHbmAByCAAsR/4qirqOgDMxkrUn376mSuqJ+9/IFDvo4g4W4pIcsVMy1BVUxDJYDi3jipH2fDh1713nz/o1hi2de7okZ6DkJAQNOWbQloC1tq23pRl6X3z4tnzKJ5Ib6+fg2oAriTfKtRydSZNnDz6iXVn5ejSVZcRLkQr6kBOmcjmkSEiHRizk7pKktKqW+fobdv5ObLoT120ZT5Tt8Z+ACDBoeXphC1qeOFwcqSCg9s4adXeKa8fz77Uc7Jkd6dpF7etoBC1NcYgOvEKIUMw8IR1bF7Pbj6vVy+MtuIbrTcAnHU+10mTPcMmARHo6mcbsGVbqHHOnRXjs6KoIpEPiErERtmoUF8/m3PNtPS4VoaT4e3obTToO+zUW2rcs3q854QY4F4zKb0E0H1ghUZxhohFY4jtqm1W0tYaNzmtSmaOBp6Mb/Uc350IFkhq7X1RkaxVEQhsNf74408++eRnV5f32ZbInHpIqktVjTFaa3FiXd+hJMeBbXvosrf3Ro4CxqlpcERuBoY3uvu0/nhvGxaRfjUlbW3rm9n166fffPX06Ver2Syz3Xrof3KSstyaP22dTiXBUFGKOIgtH36sPBqfPbj3+CeLWoBCyTE74kLAAAmESEEhGStJk4tMlmV3pAtVgjkxvXMgNU7P/8MB1x0uf/uZhkX+BrHd1GkkBDmHVc5mQRpjJGhhGRCJHpCS0Cxns1dfTSfx9ef/HWaD2CTNAStSmgcBFB4kW9h+x3zvW9D3X7izi8nZIyLUdWtsEUNgJolxPr+tRpOmrYuycs5573umO8bYKXSTTbZPnCs9L3b3crpL2t75aci8Q0kluTskBkwVYFKQol6vLs8vbm5eP//ma2YQYza/7dMg+FaL8bhdRWnivQ9/sVjHcnopZurFibKPIFbDSoZUNCUeT5LoYAPKt9wdtGP8ZjpwSiLPTjknueC3p0NBfTjsuhM1zr2QrYN5r+CoBCVLxEwMOFaSVv3y9asvffMazSLGNSSV8aIQdnIjZKap+8u5frYBOdiKXUmuLKoLti7CREFUBbEQp2HdDkm/yQ5GYW9s3960fdQcc0cLbxLoO7czMt2I9nqGQ6d9cYYMK0FDbIPfxHaFlCRAWmBb14v+krnQviNpl5Au1Os//OH3yc79/nsfsXUAVDUESY4s/bt4e3YcyNWG+iOaoraOXXXHkbfk3o4+xhGRANg7Tkx96WizZbVd2wYinl5cfsg8GZ+9ePns+fPnsd4A+M4SX28EyvNGAmJEedZcP508+iisb9ezqpo88CAogkSJDbhgawybxKbrYBNKxYp6CfsOFmf3EY6MRn9wr5Gj2/UpA0RuP0lxymnv1M6Jo1MPQMCk6oMQqStKLi4mV7qYf33+4c/nL34NjvDBMiTk3YAhHaikm73dWL9behdK8hMeucnrgYg5eD+Znt1ev3rvg9Gr5y8ePH40qsZBRUSYmYlERHdU3drJfTR4+3cprwbLKXa40kvbHde4cz5USFlUM6xyjjSLUFZgVBa//fX/CKE9PxsvV/P57BYQaxEirENUbteepg9McXF9vX74k8+CFkqVFyMgEDGDKMrWIwNE1GXIylW0VcGp9lZnlFVVkghAczWqdBwKJUmuJelI0vNsbds58idHuhMAPjDeZIe1oep75y0mJnYQBafb19sNztCxnNPIIdUmzYIAEzmARYShjmHQ1OvXm8WzZvECskISEzt9Q++BuJ02+9hFoAKuNG5syjFMSbZUNkEpqhAbGAvVKOjXftJDUw7z2hmBN1qmD+lQ9X13C2/DDfTMRJeCOR/vZ2j3rwAwrBRDDE1oVqFewye/8QjyfXx7V6DlXWj9TnW+t9SycxKCtPXTr7+IMQYv9+8/vLi4qApXSyMiTExMQbYbN3aX8ynk3kP6RMO8DjvP8y2z1929vewd3IL0IYumEiEMzpqAZPggeO+JlchOzi7L0bSaTNlWz7/50q+X2nlcfxvVaIfU3VsvS1O3kazVdgker559fv/DT2+ef3nxfql2zKYitogQCUkV1Zcg0JQJHBg4zFLfP2T5uJ+jQxmtq5xNPSeazu8/q6r03CRtQ100ydnpdZBsayvo0Lk9TW9N3jKISp05MQJQIcOsmhhBZWcBeCGYUTExRawZ9uq9n9188StbFX69JoARaE9R9EOld2bb3h+IBMnBe2NtVF0tF0VZ3dy8NnY1PptWVQUgRk9UEDEzhz4xlpJm/7StVXWI3P1SOWpN6ZLUD1Z4cnkbcJHdT6SqKqSk6VIiJWWGQOMffvfHyXRsQ3jx8uso3hgl1hjBBqEFyKC6UBobd37x6P1IFbgQclGhqmxJGaohxGiM2zNVDPeO/Py0Pd4dybxkf062f++t7ONFWe5a/t05R7zT+3EbfP2W81vUkoMqaQv1hgRh0axezF99BWkQ1lsZPfvKdIbnYyoGhSMqYAq2Iy5GMBXZUk0hClERGGMMM4tSVzkDlHedkw/4rZD76BZ/RwtvidkAtl4UnXwzwOzEJwkAQmSCiA/tum2W6leILSj0Wp+Ouc1xkoNQnO+P9mW8/Z9zOQdtN6svP/9TvW4+/uRnRVGMRiNmilG7BGpbFvAUHGKw/Puve+Atg+xjRwW7veNvQ2/fzqG8mMztRNSbA9L+w0RQElE2XJajq0uKQSpnf/er/2sQ34U3vLud+bUz/k0Ti5LaNgCMWEPj6y9+Vz38yWr+0o6uRmMurAlEIUaJFCHMWeW87ddgnxmO/w5rsjcCtOMKv7c/D9/aoXFhbx/On4c73n5vRYCushJSDKGIxhiNoaKoRKRtg2ETozm/erKa63o1Hz38dPPiC8ApokC4K1BESbX6vduQvyO9I9g+uiySHjuGNk3KtqnRNB98/PCrz/8U2+bs7MIYIxJi9ESUtmFRCSEQkbVWlZumsW4Qrzxo9pTCKol6Q4tLSqiaWmA2MYr33jnHhnwb2ZFvI0TKsqyqKvr25vXrm9evzyaj25vnITZEEaQp+lgBjRZ2YoupHV0Uk6tidE9RRbWA6cVn1SjaIvs6sg5CrjXnUEFne45J/Y1stEbKRk5iknUWXZxmZlpjAFHMwZeCXO87e8HkSsw5MietmyF3LHSM0Unnp1yraQklzOgYiJ6x0KwQFwIgMQLZZKSqItGADLMX0RBGJSZTt7l59s2XvwmLF9YgNMt+mmRl+5Y1R388vWTORU8N2xJuxMXIuLEpRuSKNqRsDAxwFMRuMiT7XGfVJgBKucTZQLePfla8EWIPIWT7nG+N/Yebfr+FpdeNVLVJFRBrrUZVQEJjrQHAGurlWn3t2434DTSAIigSsFVIoVN1vjvahZa0nx+FGwkvnz1drVaL+fznP//5gwcPoivW9SbG4FwRo8Sg6MRMIsNskt3kELaZuVvOOzi9o6C+02xxSEdxZb8HbypitjcZ2DCpApIMf9u7kwEEUUMI5Kgcje89eOgKy6Qvnn09ny9EonbR7b3xqF8RJ6bbDnL7JsGeAKmgkdYvvkSkEejibCrSQILjShleImD2OmxIAY5H+ps4y33/UwDISrgjQ7Q1VOVlrjKwXqcRyzEplL0LiXJd8+SkKRpU1fTlwLLknWM4IzTGAGQ/u7r1AMAUWVTRCI/PHlWuWFx/iaqGv4Ff5HxPpg8vtaQpu8sPTvj+q3mSHyMB+OvP//Szv/v7V69fWGun0/M2SIIAa4tkE0q+KiKS+KnO4nLIo+3QnUotAsDM3vs+RrxtW2utIYZo6ZxzzhBmN9fXr15C472r8c3NTes3gFCXjiWkluzUuEtXTU15buw5qARZ1VTXC1AllgxvFDhlQhj4wZ0S4IbPfCCLb7M10UCtmodixx3p5CC8yeB6REupCRl068q3t81pMi4TmDNLIhoQZFKQ0fr25YvN/GvGHNyElEsuFw7u9prdkVAgditZYJkLqInqnKlcdWbLcVBu2kjci3pvJgX3N/kOGvLvhcho5sZ4OATMLMFbx75pR2Wh0RtG2zQa1hoalQ3EAx4aEquVk7budGgY//oDITG2WC9mf/jDb0JoP/vsswcPHpWFXW9i09TMxjoD5aASY9RBYZvjs3GXuvm/f+Q70J8zN/YE7hzOOtRd5ecXYwwxIHlPLoribHru3oO1Vr/4cja/IWYVCSLGuBhj57oIovwfgJhjR47pPPrZpAm5BSD45WbGr0UePPpJVKtqYiPGOdXYbymD3gjvSdBvprvm2xv37VMHvxsJAInEDC2iMtmL8VQ1YrMUSAv1uhN7k3b2H2LRsO8dtvWttomhsZJ+/6tffvZ3f3dz+9oYU1XjOkZAiTSEVpSstUTkvVeCtTZLdeleu1auvePDz71LRf7KFMX70BRFUVaVDdq2rUhQVWtYRG+vX6+WCwMdj9xqVT/9+gWQVdA7NnFydnTflffLamLKKdmSuBIyuzFQkUhVh+lLYxatcuXaTmmGbG/WHZt3wsskhSdrdEx8Bzqmm7rMn0QkO1Hgg3HgTprf1ZzrFsK3KTrStdrHZO8sNgUkC65dAkMAbCCSvW8MKUFEg4oUJEa0ra8X119ult+w1JBlMsRSjhjjnVjtAfYoOGYwc0IF7MgWlRtNrRsp2eRIcpiGvVMUC7L8Oqyf/QPA6TspxaVmPQyr+LawhtWTQdtsYrOO7QqhTVHayCF/oAEo4F138sR6P/EQSdnWbtZffv7H6Jv6k/rhw4fTyXi1WiHpkDXE7XzbZ233VBRvw69/Wxh4I0f7xmuHl+uOtJqUvQAQY2QQoCIiPqeNK4ri4ux9H4Jz5Wx288UXX4g0rih924AMcshTXsGcJFfaf+9Dtp26X7tt2WPxsnpUrl5/VVj7+P1PbmZrdhWDo3J+ZBbKnjfZR5v3dGDZf3s/N3v+9dTQZEV3r/Humt8ZnV1L9vYM6bfuFEOaAnQ7w5Kkp+5+zSQASFQ9syOxIrYwZ8VZSaSguJEawUOaLACBCUzIPjCnOvHXoh+UtA2QQADi3/321//wb/7tze3ri3MpispHjdGjCxRRVREBU8+6HrLhh+CdKNnUh+ekpVWWZcrTtF4vY4zM7Jxj5s1qfX19HdpmNCpj8C9evgSELW3ZBTVQgjWwDjwtRw9deenKsRoLcgpKERyaXcw0mW0TzvUrTHfAdbBNHFiGdPCVdn/G8GcMfxkI4rsHhx+6V7BTM+DowG4/UI/c/apK4r6kBogQY0COJxGCr4zWi1eLxfNYzxE2Ut9COydOMMDDXQaZG4EmBVj2Gy/ATrkoR2fV9IJs2QqFNoBtURQx7nPHtG3sCA1X5J+zQX8HOubOlrI/muRamNkLIpBIDIVlH5tRYZrNpjDcrmcSGg0blRYSt5i9e5dBZ35wuw8AQJiZmJt688UXn9d17ZtPn7z/YVkWIUjThhAimK21RLwrqgIH0/IISB+8+bvf755w/EY5+9SvR+fSQWu7qRpSZVsNKqpZ7a+zxfL99z+s63pyPR2Np19/9cX85gaZo+bsY5r73plj82qSgVG8e/XdzbtFEeFC/fKLqw9/dvvyy9JVVw8+uFl6MKsYyva4jtlXdHnLth28YwR27nt66O7iqw4wXw89lnJGjUM5jQCk/OpdPkQIxJCSelVDYCUHNsXo3hnHNqxiLWiuEf3g4emHuWp+YLCNXiqSX/36l3//d//w6vWLi/OrVPWvKCxLkoPFGANGFM94A7r0lGeJkCiYcw0S1SQs8nq9BOCcVYhoVMh6s9qs1qv5YjKZFMbNb1/5tjGGmI0PHgDIgAxgYSsUVVGObXlhyytyUzEu8Ra9u3c3gUSAlEUkZvulos9mMMx0lpa0RmSOD10etNSvlA0hUBelLRKSIw+A3p9TVXmQSCz/mwIk+locqkLHuWMd5Ccy2Xw9yF+x1RYoshsRqUoC/hgjMzFEIQqf9iAD8asXq5uvNstrQkMSkmrBWQqtAtLL2T2HMliSfaxXAVO5amKqM3bjSCxRYkqinGnH5zaP5oG7Xi/I7s2Wt3Ec+/NpCAz9AxB1m2QyChLlTK6AtbZpVvcuptevn907n7z4+ouqcnW7gtQdZoOylQF9JrFBr7oPfwX9wtCdat8tLpWjTt9ikBcvnovE2Wz24Ucfl+XIOWetjTFCpfMJ32/97t1/T4J7I0/2l2LaDgE7Hdxzh6T8P6zNeRJTMnaitH8oW3Mzm9+7d++ji3OYL5h5cXX/yy/+pKHN+fGIOZUpiNK3v8MaDJA7DcbgfYj6JWBvvvztk0//3bM//soV1dXF45c3S1uNY1LXU35QBatCKXkFmUEHhyCadQe7nTwxpKlG535QKfWX7MJz2r5EdWeTV0JS0pEicTCUV7ocKYunMIZijIieuRBo48WYcnT2oKrnrSEvQJxn2//QQ/4HRj+4x2JLXTVlBtvPPvvF9e3s/r2H1WRauFJATdNkqzYhhGC6nMZ76+QUfkvsnb9y5paUA7ltW2PZOScSmqaJ0a9Wm9vrm/cfPX7+9JsYa2IqC26aWhVkoJHhSqgDShqdF9VZUZ4Vo/OAEXGJLtMTM2uXrFEJfdmPHmSG2/fAOSUfSP/osFYK7yy9HrY1Z3FPTmdbGDZMO413sD0cqJSqZXiw+7oVbmwa5/1AzC7Ff07wslXUh+CNIYaIBFA0hkQD+cXsy/8hq+u2XqqkfCABCLSriFKgqx+shLA9QgVMRW7MxWhydk/ICgwoy6aSxpi2isdEvWL/0NdMVcF25+tb09EGv21Th/pe4rSVseYgNRArqZDG8ai4ffX80aPLb37/27OL8eLVM1NxbBfotj5Cdq/VFIDa11/Z5cXeOd3hZyDWcggCwBgSgSoR83R6/vDxk/fe++DJex8URdE03nsfc2r9fTn41FDfDdtvdEP7C9LwXrTjm8dAv94ToyaUo0Mpue8A7JwLrSfSyWSy3qxefPNssZj99je/ktB2niXCqWinytYM1KmvunsJ9nMWMSACkIFEB0w++of/5YvPX3367/6XJtoAVnY72q90XY6E398xOj5xf1TpxMvfM1NuD0oepr3GuwP7geDCZtsjUUbH9w7efo4dIhDEGQmtVzhrKlUOIViDSYn18mWzeraePwvrl2gWiA11XuV/hRXzJvr+YfuIjvJ4/Oh2puWJYSGA0qd/9/evXl5f3n9QFIUryt5lNGrirU7C9tEVmKpF5jvmKSiqWlbFarXYbDabzappGjZgstGHdr1xhBhDFJ99qk0KNWA3uhSqhMaj6UNXnoNLU4w9sYIVUWNgZmOZsysNCwFKCktkoKScalZF5Mo2W5Dejkn2CTfU2aWzu2x+b9zjMSX5m7a+qZQhXLfnDMM22OyNTwLvTuzb10OarWw9/CCQpP02gzdLADQENlD1isisirhaLdr5N+3z/+HiInjpTPgARUnJDvqpogAcUBCEsQGgIOVCuWI3ttW5KSbFaOqFgoJg0DFGImK6FYxuh6G+y7sMkICTKnKvp29J3xdsp/eb5GXdwnZhsV7cTkfF7fOvLi+nt8+/toUN7QLs+8WVFOu6lakSbEsvMHVj+45p6yR4MFJ5Z7QWRMZnKzZbV4LNe+998MGHH52fnztXGmMElLyvv5VtWw46fPereTvd79vS4dzgHFI1tIjl/TDdkZm76AGFUllNF4uFZeMKE2OsqoIJr169+PLzPy4Ws9ntTWiazoVTIV1WoSxz28Gikl7D3c0PBoQJIAQl1TGKex//3T/96f/8wy/+n/+f5SZEspLd2xjJgEk6TK44rPr1bWE7xb/1mWeOjlVeEQPAHr6UxOoLm7SwSYUUrDlSpre1K3W7pTJDmIKKKAjkoDbVGmOKBt6vr+vl87B+0a5fSnNDMbvr/wjbie6EbQCE5DMJZbCB4IOPPl6uNtba8dn5+fl5UqyJCBurqqmCW6L87pUT50kKZek1japKkgLAlFhTdjNV1Rjm89v1JuvJ27bdbDbatNDeUzp5rWvif2EKwFTTB2pGyqPR2SNjR61ndmUkFgJpVI2WjbGcgj1YoWygBLVgA03pSLWHbXQyceeGlvrSI67RgdCsOXSdtcuzlHpNOU/CdmujTg+8ZQuyVJfc33ZYXaEheCT7UN4Yh6svbSiqyTs+ECnABKPEfXUBSwT1EhtFa02Mob55/aJ5/keE5+QXqgYggtGcojRutdiaFAIWcACAholhnJCDrUwxcdWlq6a1F3YFG6eq3nuNYoyx1kbZmqZYBypZIfB2HHAMtvFtNuvvAtsHKW6SsqS7pHtBlJnOpPdLDn2GQmg26/l1adGsZsZIbGvAE8vWFLi1JuAIbOfbvGX//oI0NMEMleR54x0+mjFG8pbL5XhyeXl5//7Dx48fX13dB1Fdt0rcT+87pO0tf0lHDp66Csi5UQ91dXeffzcdSts9bKc2iMiYrTghiKkGtjEmChvjGBpCiOKttYU1IF2tFq9fPv/qq69ev36pre/e/W4G4h0bqAwM02lGMEOchQ8p2WQFjIHRB//wH7/++tVHv/jHSE7URDKiRroklWQkqQRIOZcYTt1KP6c7Ue4iKcwJrUaC7eG+fVx8fxNsg40gh6ClwrXpwxC28yOllBsxGENKCFHJOmfLGLXd1JOqjO3Cb679+nm7et6unsPfpkGkvUXTMQE7Y/tu6QenJN/SVvoGwOPJdDQaOVsCKMvy4uKiqsYR6oVUNSpERCISWquSMUYo1VAWVUpu4QBGRalRRAMgMTTr9XI2v65Xi3tXl9baZrOZ3d4CsM6RsveNNYixW/xqAQdbltOrxsONz6vJBRdjhQ1ggiFjoTtxOwn/kg07G5W7yrWZzM6y33Lfu7bPHr/7bUKgpNt6Ucx5O0sTFDvHsdsUABjjDodcCbGHbcqwt+PgqZQ4BiTMQyTUbJRgFdZHUmWCsQz1LaMZmVgV0a9fP/3q95ubF8RB69eA36rvMnuQt+9k66eBOU5RAhbsqJqUkzNbTkBFgFGynejMXdpuUdW4zUvSsWvKIDEwcjAIR0bgTUrUPZXvKRGh/2CSH09WYEhnZeii5nK1eJO04lFhnE2ukYbJsqivCf5sXL588ZXRqNJKW4d2DWRHv9N8xg/RAxZHYPuOMwFgMp0+fPjwyZP37927V40ni01IKrfEfMcYRcRaK+F4oI7SDgxvj3dapaGyXVUZWwb6UKw/1v7+CVuh+WA6EdGpdg4mkuTlPFh9STuYmLnxeNzUm9evXz979vT65avVaiXeQ31RkG/7qG6j25zHx4e6b52oECXAUXU+ubi/bvDBT39RjO7V0XhxPho1zlgIFkQRYgyMpYrZaqA2RGZOGR4ii5JGDhm2IxnZNdINtEp7w/sdNBw7godq381T6zdrZykAKck/Qy2r0YjSEEm9Wb1czT5vV8/gXyNuEINJG1GvskISLdxA/ox92v93wxX/gGF7SwygKsdN01jrzs/Pi6Lw3hOZsqrcaAxjjTHWOGMM2CQJZrVZp7nCplMTEzHk5vVt9K0PrfcNIzCTszCWXj1/npy0CGBCCtMwbKLEnHhHLVDw6AxmLGInFw+4qNiNYG0QRFEigrEGQ1Q+Lo3tKJfoMBE/J5U4HUPu3ZOTvXn72xa5t/eioUi3vZJPeCMyCQlnl+ZsVdLsjdklrlLKKV5JoRuFQIm4IFMCRnyIoR0XlsLaYtWuXs1efhHbOYV1vb7tAka759lK9Rgq8bawTVNwCVcVo7Grztk5gQ3gVEQkjaRNl0lUgurxknsHg3mc3gls9w/IKskCsoVtJU56GohH3IxHhYbN62++GI2sxib4OvqNSgQCAUSQd7NPvHPqEY6Zp9Pp/fv3Hzx4cHZ+7+rxB7P5qsvZoGVZMvNyuSzsETYUKbPugPaAoZ/k/V8a5D5C934Toh9/UD4CPzi+6o+r8Q/P32EXhvMti7npizjnSDGbzV68fP7y5cvb29u4XgGeEJDTuqjosQnSN69gmK4gMeWq7ORMNXn4+KNn1+vHH3w2uXyy2IDdNMC2obaFJ4oaGREMa7hkGBUosRKEJJIqSWRREgJMICPbCklHx+c7YzYA6qXqYz6AB9Rx+BRAQXL2QAu1FK0lGI3Bz3z9YrV65ldPsb5BbCwCDAS7a01cJ3sIwQOSPn0PrhFH6IfnSX6C6qZmYgDX19ej0ejevXsAZvMbLGdsjXPO2sKYtP1pBI3H4yghhOC9b9u2besQQoyRlcuicM6UBk0bVstFX+HAWhCM91EUo2qiSpumLqtx07RQ4yYXVXXuA6mpqtFFNTmLKIQ4SPKeRlYcDRKP9Eix15c9fvNgKosq0PlqUlcyL+0eOypH2qY6QVbbiqalmGXifqkMaukkK/ipOEtJmtvu6RUESYoC1ZiV5iRdyk2oGhGCpqINkSEGgaglaUjW16+/qpcvWTfN4hpaW8fBo0sHcUBb5R4EIAJxqVySHRWjcVmNyRXCBmruAKt9Xdtfm2SbkBnICTtNYlJUFZTCQxmUQuiEoAYiITiLUVXVm8Vy9gqpOrNvY1tDk1WF6IdodPtLEnXu1PP5PNmtJtNFUHt2eZUCQUdV1TRN27aTycS3YXDpjkkHxyCBjrlEHZ75RiX5HS9hzwK1NeGdPvkQ2ocpu/NP3ROFECybi4uL0bg6Pz//+uuvXz77xtdLaDYNys52se/zmYiZo6TMLcTJAU1j3Kyfff3Fgw8+efnsy8Wyfvzhp01ooFGgKla5AHetE0BKjCgtkC1dCjERycxOWWO+X3pxr6dvxOyT7M7bXb5//jYFTTKDCkhSCJMpCmfPjW1vsYm+QZQAsMqBOLANuUwkeHcWqB/UFneKGICzpe+2fO48n5np4uoSBinnnyqJSAwiIpvNhg0ZY6xla21KT22Jv/7yqTHWGBYN3jf5fRPK0jR1H9tAWeomq4rq8nIyvliu6qaNk7P755cPbDlpvEahIIgCcPKkNjimBCM6lM8GblCd5L2/pDtr98GvO4bq/szdgwwgYqus22kYBvu3G55DRJ2vXhZ+s789AKE+SDShPkvk5DFHoopICIa14Ch++c1Xv+e4KZ1fXX8DvwGnslR9z7f9USCpPYfuS8Y6mJKKc+OqspoaVyrbqBTAqtTVz2ZAbAqF0Vwk5W7V8DuWtnvhKO9TPf+kfc7t7J7Qp6ZhqEbPJExxcfNa6nk1qdrNXKJHbABNJswk5v1LlbbRibx99lBrrSuqR+9/VI2nP/v4k+nF+c2rGy9xNBo1TWN4W+gTg3zmQ2l4D0cB9BVmt0fi7uLaPf+Qou5rZQ/ZcQzW5t0Ac2Q67SRA3ebSMYZCCBrFWltWRYzx5ubm9vWrm+sXi9ntcpFTBee0B5k7ObIyDFnJ1V2JmaMmu7sBHFBO3vu4DYbs5P2PPm0CCZcrr2RK5mR4IsPJFTQM+jVYIH0GlDt1D99Nzk4DQgcL4KgSvn+2TknegmKnJCfAUjQAsarlYHkTwnw1f76evZTFNcIaWicnpBxfiT5Zbz+9utRb72Q9/s3AtjGmz+K7o+WhgC6xX4omzLq1fI6kiPl+Yjg2UXSYhyvheut9jAowyBJMasNV04sHT169voWPo/uPLi8eRCEfQKZUmAiKyYXTsDLl6ia7XORgCzg+cTv/330Qzb8mLyqY3esOkBvYrdXdjY7qru2c9y/cV54zKyVrMYAuerLPLp7K5PW+IQKYKBWUDSmTEAJLq7KGbJ59/YeLqVvePIvLV1QwI8ZmtfXuUGBb/TrlNUg6OgYxyIEMWWeKUTE+Z1sZWxLbIBDlCOo4FU5yJ4sCQllZb35wsE3SV0DPRdGwhW3igeShviJs1vPJuPJNvXj2FQpzNh0tXj8HIpDy0gzKcb4rpdxfi1LYyMDfmMmWDx8/mY4nl/euPvrwpyBaLpdFUXhR1aTzzJvrHtuEXXgYukSlI4lLOITtu0HlMP3IUWX4G1s7acQZsB05/X/HcKQI71S3O4klIP3m68+vX718+fL1arUg1U7ZEHcnyjaGm7KSXLahg2SIrQgABy3Hjz5QHm1a/fDjn0Ue13ESuABEVdjAEkRDjN4Yk5ezZmjsdrZBnfjdbg5dCo50fJdOjVtfn/7u07ajqRY7sA2AoYbgWBmqUG+oBerYLnw9a2ev2tW11gtQA2qTyy8TYthp9x2vwr8Z2AZgrbWmqJsaoFE1ArCp16DB+HXTmkiH4ZE7smQHGYl8qoOZxbuSjAtNBHF1duG4XDZe3fjq8ZNxOV6um7YJZTVldpvGOzvKae2RFaARqhA6lG47y/TBkfTZYJcNpoGc3ZXPG8rTO3vKtqkTUrvu2N7eANsMkAzayR5PopRNswPYTlKjIR3HqNC2slpalbBazp6tF68kzNv5NUyENvA1VGzlQrONVqK9Mib5LRiYElyCDRVlUY6L0QWxITJRKQolzO41CkRK2tm3JEfG/5BgW7Liootr7wJQqdu2MnIDohpZA5rVw6uLF8+ebmY3V4/ur5bzdnlLljTUgDKji5VPrfyLhe09wbT7ysYWMcRqNHr05MnV1dV7731wcXGxWtchiFCWgYawvWsMArAjjR3RjemAaR6cfwoPtpns3tSdYWt3nHA3bA9+zdkeE2znsFjSGH29Ws9ms9nt9c3NzXx+ixg7WOlXxg5spyNb5XtSfVHyri2g1pzfr8bnq1X9+Kf/wMWTQFVQiRpS1LQAipiDLZVZQcrpgxDUqBD2eKPt6A04p+9m3eJuo387kT3DNqhVioB0ArchcgRDQhI9tLGsRJ7ipp69WM9ehtUN4hJUAy1SQahuLKUbtIFDzvdOfzOwnbMpAUVRqFDOUwaQESXZcQZQBgmTBVLRjvwL7zbY+RVbMEkK4wsCslxNiU1UFGZUnJ0Xk8tWyZC1RRmDtq2XyM6VwCBvSefQmzRNyX8dBwJxOnX76YSE3T3YFj67VCrpvJ3Ayb7NPel8u0462Ni76VDWHz5GViLt7mtCQpSmqqjGpHiDKEDQQlWNtpZayMavXy9mz5v1K5JGwwahAQI7J8FDYSsX6u7F6VZzoikcCwawVE7JVMLOllVZTcgVyfssqe+yUoGzeTtpBTJsa1Qwsz26bt4Cj9/ytO8M26bbZPp3LQohUiIFBVVh9VMjz/7422JcnZ9PX714huCLkWs3qzRIlFMzdwOHd87nvys61Cd3OnMYW0iIxtkHDx6cX15dXt67//CB5hzUrJq9sLogq5jcKe/c1gf+KAOJFm/CbGDfJe3U839nJfkpOGeGqqbSR0nUDiE0TXN+caZRQgjNenN9ff3ixbPZ/KatNxrCwBa7hW2kooQD2AagBMMmRgUMbInIKMaP3v/gxXVz9fgfuLq0ZSGqIaeUMkokIowsJRjhFEItLMS8FzrfI7cOaA/OD+k0u/Ot1OydJoCCUkwinwCAVRhDVoU0RtXIpIbVaItmsZq/XC9u1M/gbxFXQEjJykm3A6rbzDbyDpD7bwa2MZj0THYymRBR49umWXcSdEpAtiOAENDxRV02A7gEt0roihAzQHZyUY0nUXmzamDLy3sPxuOpV2qE1BQxStM0UC6KyrFJeZ1213ZKb8RCUILKzmKjrUPKzoAPZurQ2p0uGcDzIODYkN0Cw6CX2YbNuzL0sED9gTP53n27M7Os3029rMvtcoNHQFihiGmDk6ClY0fBt7P17bPV8oU2M9I6buagyIyU846NYbIhNNsb7UrbCiew4MqMzriYRDKuGBfVWKCdMzAnzNaUFiYmr9pk7fvbg21mVo0MJY5EERRVI0kz/+L30/NRaNt6vQApNCYhm4iGFkSizpD2LxS2E+3JxMl/Rbf+TTwajx88eDienn/66aeihJQBQJLumrcRd4MwqkM0TZN8CNvY1eLimI9IJj5eIPgUAL9R2n7LzyIhFU2IMaZaxsaY3qBg2Vhr27ad3968evVisZy9+PppVml1yN3lUtyCDXPW34h0s4uQwi8RAVM8eO/j1wszvXpydnVlbFUHaYUiDBlLOcsCkwojV2JQEiYrA69A6ggdbA9UR3ch97eF7aPnU6fAVw5AVA6ASJIKhJgtqxMBSSq0JCR+4rRZ3tar66a+9quXWt9AN4WT6LPA8SNs3007ORacc2dnZ6PxtBiP58v17OYmeIEqoiZGdKDySSQgAnMXEUIg4nJUlCNblGTsYrakajqenJejiTGFKKlSAEUyyWVSO7dMHgza0LKS5nnsft2D5J04Tt3C8I4SbLgshylTus1lyK33imLdOWe/Td7ak3dWRWfb2717EvdTOa+cjY5j1JRnsSydIW59TaKFM6Ro/Wbk4OvZZnnj65m2cw0raWcSNohh6IGAflpzTHIQEaCZxVLkgHiyY9jKjc/L8bnC1D5w2ku2fEwexswPZRjscixQMh5vh7ffeU9JLW/UXu7RqcC5ExuH5EJrKVmpUg74IxKJqlElEMeyYkBms1t5/Wx8VoRm2W7q5KrKDJGwM5DYXbX/omH7kAgpGxNLLqbFrihsUT58+Pjs4vzRwyfjs2mMGkKQqDFGV9i2bVU1VQ6MMaqqMabLoIx+XdPBtBl+OCooE9FRlzc9SOPTt3yqPvfh/Oye57gC+aBcVteOYWR1uhpjVOJisVjc3qyWy2fPnq6Xc0oqa429a2pyScMwk3+3Z+wmSSWguPf+p8s6BrVXD987u3gviNsI161W4/NN3YhIUTrLFMVDWmbeE2D2+jv0LTh62inavpcTJxxvRxkpmwfJFrYpyTk2+aapbOUlo8GRGDRtvVjPnrWr1xrn2t4grg3ljX8A211NxR9hu6c+/Wc/78uydEWlxtWtTCYTJsNsiWi+WBnjvPc7/DJT8jafTCYxRt+GoMkWaoRYlB89fk/YQUlgo0Ji4pqYDEfoTmG4tJaEkty5lWgVSikR4J5G+i7YHq6+HavPEU/yQ34/R3gPzsxtdl+Vd17x9r7dstmB7VyRPrdglAhgEahqaV1bN8Q6KkporNcbAx2P7Xr+zNc3m9VNrGcIK8QNYg2Nw3rPCgAWSMlcpXNyRzc4BuRgimJ0YcqJUMGuMsVIYIPELUIPRuAO2I7Zw/zPhe23lLbvoGxfkGAsGXYARFI9ZDARMyTUzlnrsFrOVjcvQHp2Pl69fqZho5J5dua9Uo8HyP2vErbT0k42bMPOOMtsru4/PDs7m55dXF5ewlhEKUbVer0ej8equlgsYoyj0YiZ67p2tsD2pQ+DKo/L5XsHt6fx8fmT2OK9ZmngGH+8dwdmtaFL3e6cPD4PsxVJIwBrrTGkUUL068Vydnu9WMyWy/nNzY2GACJnbAhBoYlBhIb0yMTo/C76ZtGBt6mml/cfffD6tok8fvzBz8mcedibRX12fsXOrterqG01Koik3mwc22OhK38WbO8M7BvP3qXOk1yAqJS2owSzDE36MNPxKGBVYwJLQNhEv2xXr+rlq7h6ibgAtclol1SoqkZhmFli+yNsb+nE9mphRxdXD4wxDx8+Jra3t3NiM58vI0iFEkuejCfMnPRIAJiNLVxZjFxZGFcSuwgKUUMQHyRoSgfNSimrCA7CDCRxbemJeDCLlMwBbAMAsz3cBbaMRf7Kg/OTAX7HQYa6UgpHJvcJlzRKNukTtu3hE1FOjKqSZWFK/IohgrLEWJYOwdfrTensdDzyzeb61ZdGb9v6JmyWaJeITZdNBZRVEb2vWeJGhVlVY1eFEyALU4KsrSajyaUtJxE2CIGMkhOkKmo7XaaUi344toN18kOD7S5QJxpjiqIwBO99aGtCnE5GMbazm5d+syBnANF6Bb8CIgHZuZe2NaMGzi/pEfe+/6ugTk+TDIsdnJCBKkBn5+eX9x44567uPXj44EGI0VXlcrlU1aqqVHW9XhOZyWTS1F3G6U7axltgxiESH+Y8P5x+R+X4kx3cm6hdpb5uefanDVM2DcfHEBFERQMAY8gZy4bKspxdv765uVksZ4vFol5vVqtVaDqjFSkzQb1IF+N04jGZE+fpHj75VM35q1ery8efXD3+qY+8rH0klKMqaLuu19bx+fn5ar7hg2FBt/Udug6cegVHtR13POcpGsA2gJ3kTKpdMIvaDrmVEVTaglE5hM189uqrzfw5/AxhBcrZ4Dkp+dQQSH+Uto/S7j7LQAnwo/c/YFuMqrPp+fntbFGOzsAmKmLUKIgqghzb7YyRiKAiolFElaJSChyKggTYZLg3dyXXj3S7nC8MMphDig6fOknX7O3s3Xw9kgO8/zwwqO0s2qOq8qNjorsAv/3pTpe0PdgGVKDKmp42igIwxMxMKjG0RqVkhoZ6s2pWy+Bn2r6IYaFtjeCBCIppaIbBXR1sJ4YpyaBAcgN0lSlGYGers7KaWDcKQj5IVCIySoAoOGc9p84kcQdsy5tg9R3DdgihKKwzJkbvmxbii9JWpdEYl/PrZjVnQ4albWutN1ABfEr3DCDXaB+0uYPc/1phe4+6EeKiLNumAejBw4ejyWRcju8/elhUpZJJFl/nnHPO+7her8uiwparO1g1B0zeKYA5FQA2vOo7wPa2EYnbawePOTTW7GQfFuIUVS0iGlTVEBNpjLEalUVRrNfLF9+8uL29Xq/X69Vqs15DOiU5K1Ig+y5y70TiEIhQjaaLlQdGH3zyj7OVrL158PhDNc4rAsgUzpZF1FDXbUGuV/Id6hL+AtL2ieE82Y7o7ohpjhns+iogwKpQ5xvhSaMzduQMx3Y1f7m4/SZsbtBcI64Bn/IVdmPG+v1jNv6GYHvIbW3zcgsA41zlfRhPL0dnl8T2wcMn6zrAFgqOwkE1Si7XycziQ4oRyuxqKq5FCCGqahikz+3THaObKCmkIatkOzPwlnItsuPScM8d7ynZdtjP3Sv64zL0JNetGzwOQF0P1H10MI2G8L+/hLatUu8tYhjMiKEtGAWrtPV6cbNc3KqvnYvt/BvoBpprruxkyabsbDmgpFI0SgQ1sKUdnZtiIuxsNWZTKrFILq6a20iaEkCzLuIIbL8Rqo91f//r9wTbuVy0BCI1rIygodXYQH1br0JTg6IGH5sN0MkCJEQqkrMNnITtdxhw8sOkoaGnKIq2bZnZsPPBu6J49OBRVJleXl3dv39+fi4idZ2M3IW1Ntm2O9gYOISeUMzsWbu306Y7ZVezvV9UtEesu2H7yLagAuorJG3BO4sBmXUbrHrNXcibZM6VRMwcQktExrIlKxqvr6+//vrrZrler9f1etEhNxFHIo0hufIB3U7U38MwvKAsp6CirkN1/kh51LQ6ffDo/N5jJVvH6IXIJPU491qCfhD2xudtpO2jtLcPvOVF2PZpcHCrUGXVNKQsBCAQEQMMKo2h2K6XLzfz5+3yBfwcYQEKjAjNDIS8E0b6bxK2MWBdq2JUt75wZevFuNHF/UdNG8vJ+Wh6CbLCTkERFPu5J9lQLZLrECRLsLOliMQYU7ZtYTGJSYRJjluppEbSmPdzZbdux3EnlO7zcWl7Z9rtbBPbc07B9lBRtgfb22X/bWAbu/tLdqqCECJpUxbGr2c3L78Rvx4XJvi6mb8C6r4wLTEDKdnZ7k2HXVQAjtgJORSTYjzl4iySdeVYNFVcVk48FoAUlrodqG2M5inY3tsRDrfLt4Tt03Qctg+3j9RgWY6apol+4yzGlYO2m+X1cnFLsa1KK6FulgtAmdga8sEPNeKpxVQrrSvmBfwI2x11AJBfrnMuhKCqKTUTgcvR6MOPP76+nRtjPvjgg8eP3wNQ162I8CA1k+r+KujbPzx+yra9d9V3gO1j7IJwl5aIiIawjS6ZCbAD24V13vu0anrkJiLvvbW2LEuR0LaBGca4ENrl7Wx2c/vq1cvlau7bGhKAuI1K3sI2d7NNAFRltWlagK0rgieuJg8effDieg7Po/d+8vDxTyK5de1DTF4deTMZwnY/mG+57o6+Cxxbd4fnDA8PtI80WMuSkBtAlxGWoCwEsDCzRkKEM7ayFNvVZv1y+fpLaV6jvoVuoMGgD2T9EbbfRGngmVLyLLZ2TK6cnj1oo5aTc3Il2Qq2ABkB5dpQsUPc2LmiMhNRCgpXjancJzgrh2MENCvKCdt6POndpFpY3eNwCgNDVyrjGAN+qD/vMvVsoXevizllSp70g4jwXubeXpsAfsh9DwISdoLKDo5k6TBnLNcMm+ohHtpYI7evn/nltTXRUtusZuo3zEoS0nwlkJLRZFzo0zsMEySlZ1UYM1ZXChVUjN34Am7ilYytQvYM6UrnQpKub5+/SQIEttKG5C0s+fnvGMy+M2yf2k0Ox/Bos10L7Ot2NKoKRz5slvPXUi+IQlVSaFZ+NYMqIJZJJRLAbFrphm4A2+jnW/58KIH/6yXu03sBBDLGhBgAOHKtRsCc3bt/7949EWGyV1dXV1f3+yQQqlBVHSjN4p277hHA4DcI0EO4epvu7IL3FraBbrrzVsdwCNulK0IH29KBIjNXVbXZbIJENjDsitIy2bbZVMatN8vFYr5YzOaL2/n8tt6sEVNyhewTk+6aHwFUlGXb1OgK0LE1EhVkRldPXHU1XytiUV4+vrx8xMWoCVF0B56powHbdHxtHg7L4VD/GbBtSAewTVFy4mHpInRYCIIItqwG0RgYAzXkGZv17dNm9bxdPEN7A/WmW61xfwP/XuhvDLazrmhrCk510WGMbaMoDMCgAqacXt7nYmSrCRcVsRUYgYoawxWUs2DtRRGT9jzGyAbGGFURkZQ7mogoORYmi4hG6gpad9NwT9SWFLqd1OnYn1VbZ/Kjs43AIO0KvA7geUfa7puSYUawrRI+tUJJ4SrpmXcfsr+E9mCbRI0xyZzGCMSAeok14ub6yz8UZ1XlZDV7FdezlGuTkMe/AxXePmBiF4a9JEDBNHbllFwlcChH5egctmwjgiiRSWY5jQESkg8BlIe27eRbIKoM07NQSeeR97Rc+pdVIwZXJo1Jf6RbnJknYCBqrs7dj8bhCwIA3oHtYZgv7yKoqpJiWpXL1Wy1vNXQGAsiH5u1NkuoBwkzNEQGDJPm3NDJ61CIiKn3A8DOs/3rhu29HZyQQ8IAxN6BC0RQhSHrYogAqsnk/PxyNBpV1dgVxeNHj0QTcqSAqM7uNkjptQfSw6+pJt6p6C+c9iRPGqzhDOz/9jOTyPRHhgVjaChhZ+KuOl+eiiknGTNba0W1D3hLGGkLlxzpk/mPQdYYSzCWvG9ns5vX1y9nN7dtW89uXgOHEERbfxUEIoCgCmbkZKgozfieG10qj4CC3Ojy4ftRIYIUUkuUahWZjvlQ7YdukHH9gLKhDNvNJktS6b2TspJ0f9FrRwfVC7u/vRYypV5JtX0hKS2Pdo+RNLJKCBoAWDNyXAYvvm1Lg+mINS43829WN0/b9Uv1S5JNr/s62gP6i8L53xhs302ErfcT2YqLsizPbDV2xZiL0rhCufShErHJRUU6bFajTdMQJck7OymkBW3JAtmRYViRcyg9U2eCzBwucQLOfdKdkprdseG3IZxsoyaGSjNSpAmY7L2Dyzt2mCiDkLKQJL47acw69dQ2jCpL2L0HOwkQJXpDsSqtRdysZ7evn8X5zfhq0tbzsFpAAijCAKJQTdlhtvIAdnJJbnfW9JcrO3kPZmqtta4kYwWsClGlvYC3Lj2OAj0bZEB7nwc7Y2cdgEOWRY5sjv2G2P/llKesW+qCHdNm/77SjUQJbKLm/Z5IDbEh7nS1IpJrozHIGDImrl4/Za1jjFF8CF5CC2mzOm1QqHR/xA7oL7vs/zVQP2KZ1VYFTFWNz87OR5MJIi7v37t370GyjomoqopSGyWlMWmaJsQ4Ho9TYdDxpPLexxhTNErUPqWo7kmN3Zo9rpVBygDTwUj/2bAdHu+9OYYwdkSjI1s2nUFg6hX+p8SDnePKiZ81xhSFtZabtp5d38znt7P5Tb3erFYL39RQ7QUmYzmGFt2ktZaZuW2DAtYWUA5RATeenjlXNtE2GI8vHl6c33fFyEduvSqMmkLJsHUgamPrYxCStBgLNjSoD5btmIjOliAhGOLtaKsQwwJIe133d7tjdH9lIEr1/kB7bkAyfIl5rEg4y03Jt5xZGIBRqQrSZjGffdMsntfzp8AGaAuLoF50YFwYGLR6W152W8uakhPT5E76FwDbWwvf7vbHxI7dyLjKlmNbjLgojZ2Y8l4UKyJBoogIVCQKYTwepyqfQTxRquhFBmSxtZWS9Opo6qW67XMolKlLOt1tFvvPiX3k1mMAfwDYAzzbZ+F1p987SWlk4L63netJXcBZ1jSdqUlCFPXEvrBqoG29Ws1ehc3cGJlWbj57pX4D6exeW0YieT33qZe6Z0NS4ycR2BBb4yzZMxo9Uh4Ng/H27F7bgUmCye7g3K1pVKUux/IOYKvGBNjHYHvbZh9Tm7h2oa3vYT4OFhAZ44xJ3vUhhOAbDbFwhlUNs7VsiH2zmc/nfvGqKgNrk/LVxBh6Rc6/Qin5r0KZY0wZmJJ+zDhri4cPH6mqkplMzq6urs6mF6pa1001Oqt9a621ltfrum43ZTEajcvNZgMgzVsAPgYRYWaT4Uz3YPIO2B5CcQ8Sw3U6XAt7yVZPdjP7n3IyFZ2y/h4ed3YUQpDoAaR6iSmQYTabrdfL2fxmOZ9tNpumaWLbghQIUDhniGi3WGomTr0BM3Mgd+/9ny9rrRt1xehs+rAcX0RyPoBsGRVNDFEF1tjSsgGJIgRIdoYlSiUcbdIQ7JjJkCwczIM8GdsR3h+dHStDJ7rs6zmSfi793TL6nJ6kS8EJZmVSWChi7djfXn8Nf7O4/gq6Buq05yUuMXMHW30kS/ZOx1YT+a8XthNA6D5sAwyy4AKudEXlyjEXE2PPBYZMlwJMNRVlYrI5G1hy5ehcXawSbaf7wFK7axMl6h3Bt4qsncXWaXGHtGsa36EjgH3E8r09OR5nxonMflavlKJEQiBSZjaU9x4SFWnHFd1cP6tvrkFhPCoshdX8Jm7mQJfTmHJ1cah2JsXhLftB6Jw+yMFY48qiHHExpvIqwg1HL1G/be2pQA/1E0e3sP4FEfUmBgVSSRnCUH4Z/ApAxSTWpX8SIgJrUrgdPo9zZQwaYisipOIMFc44Zt/WRCqxbTarerNB9LYsxwXPr782GjqeSQZpjH+E7XdH3YQdsto8nkzPz89VqAm+qsaPHj16cP8RmOtNq6rGEpNlxyLYbFbj8ThZ1gRbzXPvBDe4UT+xj2+te/Eib7Tm7pYP2fnpuBKedtj04e5x1DDcaac01VxhA2utZaqqar1ZzWaz5ex2tVqtN8vNZuObOvo6pShmYyB5vSSVe3IXsGyIKLkXsK1isGZ6NZ6eRbHrlQfc2dXjy3uPa69sbSQWJSEINITWBxlXk8Hzp6Q6mkZ72GUBTO6aHnrd3k17ZrK7Ybsb1d5niEkJohL8tDLRryeVvvzmDxIXqxdfAC0QoZJeQqpyklKydEEhP8I2kAPiE2zv2kUIRrOd1YIsitIWFduRckXGOOeMLYxxSgYgBbdBkmoTzL33f2Ksuj03AujdyHu9Sq/u6vORUZaAdcsEd6TgnPykS4HSwdIRW9eelat3lNj2cehNfUxaBaCwybqbzmIQSFhROBujFx+ksyITEVO4/eZP1lFVcPBNPb+G3wDRWEhsSYUGmdR2OrodeQZyCdvMM9nC2NIW47IckSvVVsmvr6/GeEqblyi5CJ3auYY93Q5D5wd3dF/baUWNqAPlmoPb9Mjcq8p3mxIl6SwOrKRCGqBRpTWE9XrerpegWBSODXzTxnqFbdak7UMOW/6R3hklO1Eu92ecb1PGFZpeXEwmEyLjfby6vD89P7u8vGTmzWbDzEVRCGE5W6R9I0WEClSjKO0kKx3OsdPJ0HZUOHvc/5A6r4u3mvnUeaSeSut0eJeEQyIwxnQ1QEPiSEASYyydLcvSFdZ7P5vNXr94Pl/cMsnr1y/9pk6ewLkhTm59EZo9zrphYdgCUVNWpfH5PVtMmkabOtjx+Xh6Pp5cKHEQlQTMplg3IbHRzFtHGQGMMSqZ85C+gCOpqE86s+P+AspDhXnaGfhEhpxjSnIALOmEnDeCVYkVBEFoLqfj5fzldITnz/6kumluX6Le5AK7CL0TFu1sj9BuGnxn+hcI27zdJnuZzwIMNuCCx2Ni45xjWxhTEluoUWJbjAhOlNqgIYgoWVtY6zT26JLhBky9K5MiCiFNWgMCCUQzXzaA54HCfEcW3HZk9/yda1nTZ4IRguREbAcjcRy2SWF7BCIIiUCjamSIM8ZZJlIJ7Wa1Xq3m2CzLMbermdZrIICIEFQ95TCwNDx+Ii0AABULSURBVKrAAIjIbLNVQdElMbUoRsyVsZWxY3KVdZW1BbH1kKiqXVB4rxLcfewjG83eacf3OxLqEhbubV5HYVthREpl5i1s57urhLQtEG2r9LFyyZbyuUFiiNJIaCQ2zXLmKlsWHCVsVnP4Oi/a/S2imzkHBSV/pO+DjDGDct1DYhBZa1UpJjHRFWVZPnr45HYxL8vR+++/P5lM8rVEVTFKcnaytqYciUHEuqw+Pc4XHujS7qjP/UYuc/j1UOBGlp6N0nGG9bi0vRuYSpSLcRVFEXzTtm2MPpkGnLHEeP7Nl4vFLPi2advbm5suz5oAnCXJtH6ZNZUyJoBAbDVtIWSpnJTV1JXj1msblE05mZ5PJlNm2wTY0YVXSoMMcErhjyRcqWpXG4KyHVMVbe+G1v3lnc+7uy0j3K292BslgU3ilyQTKdB715eG16vZ/Yuz1fzlqOLXL5+KX/ubFwgNpAEFkFBKNakY6mJTw99JzO4e+M+49gdAJ2AbHa4QjKSJk3XmDGNgmI2zRWlNRcYSF0pOlV0xdsVIyYWoMYpKMvsaAVGKFetC8pPMparCA/fetAxECTtwu6sez1MoeT1uO3ICtpPrVd+aEBS21xsfLmNk3hc5+pwgoik9nCUiCKuoeGgsCtvWy9Vy4ddLBA8GW1NYNIuXGhrElKNUCJEhhkkG06xHbuJcvbMjBlmgBNlifElmZOyIXEVUwliCJcNeWtW4Zwvs95TD7eYo+p4iRUylLffYI1VhNseU5BzVETGlnS5pT1iJFKIgMUlDNnA/LcDifetr39QhtIxoWNioYVmt51IvUy0BctCQDDfmsCAbfoTtvzaxcRKz/iy/ICJjjAistefnF+VopDGytZdnl6PpJInjquqDQJQMM1gJIXhl6mEb3YztjD5vhu2evjNs7/C+d+aHOKLPN1ZESHJKFiJKyzOr30DEmnahGFQ0MEnTbEhUNMzn89ksWb436/kczNtUrJZVFdHnErv9ogSDHdgh6PjywWR6uWnC8nYF0NnFvfN7jxt1ahwzE1uAIyjGKAoiE5WS/E2UtSbEGhE66Xr7bgHQwZE0/AzNHopDOO90p/3f7lcWmHSj5CSepXaQZeebTVWUbbO+fzlZzq5F/er2uaxvYj3TZgm0oAAWyDYZy/Bh/px8av9SYDtDIdCNCgEp45kSq6RsXcn9P+l3GcYZNzK2ZFOCnW/VusqWVVFO2FiAJbIIwEY0v1R0+pmUFyR9TfjTa8M5y540BImtgXYL5DKIGsQpJTn2w0KSCmFvMfcfenSRzG+qiggzLIOZoFFjkFCr+OXrV2RQWDYsiKFp67heQVrAA5GJDSNGnzzg+ltuhWyQAEqdcZsYZGEt24pNBS6q6lypIK6ErMJGZSIHCHFQ+N3n35E29uD8IBv83bbtzk20H2fEbf31ARuU/ub30leDSAY5SGLlASVRRYRoLpqpsV2sDBEbMFQ0eF9H32isoQEUjYHCS8y2A2OQ4rF3H/JH9fhfgRIOoXsLxphki8VgBhKRKjEzwUSJhs29B/dLV86XCwCXF/fu3btXTaaODQwbGAGCxKOs57C+QE8C7Nmeh4/3rWC7q+B3ILMdr8+7H5DWHaWgO5EmKSNqjPHs7KxTLYS0CxEZhpaVa5oNg6y1IhIlrNfr+Xz+4sWzpmnaeh1CUAlILFHK3JKXJjiFSKbQZmMRCWphiunF/Wo0Ca0sVo0UE3JlURRFWTpXknHMhYJiVJBJBTWRspZpiqvWwa6fxwnAwDV1+yupJCvnXmBY2mWl9+zvfwWrGhCDorJmI5lClYiMgQmtn4yr2DZlYVbrGYW1Ll/4+mazudVmDtRIex1lxqV7f9un/W7g/TcO20C2/uQJKbT7Arta5olHo8xLIsnBDDC4gLEge//+k7ppN20UJVeORqNxUVRsyuCzZia5j+V9lzil/EBXb6NfUTs1wShr1feeWKkH5rdKhT9Yw6wp5op2ozV743Q3Dl33o8kBTlEk+LbxzcbXS/j6/PIsNHVTr2KzQkwcqwDCRKJtp1Dqh3ir61WAYGI3qoCAGGxgC+dKU1TOjmCropqqOlEThKJwBGU2htpUdHqvd6dgGwd7zV2w3ZW13j/eST8H1wog6PQeqkKiyWid7B0xBgkhhDZ728ZwNh5BYmibENsQWpUIjXlGSEieJpz0EIKOqXmTp+uP9L1RZ7Xd0ZMPMY8HTuZA9h7Karac3Ncx83R6Vo4qJts0jfe+qsZXV1fT6XR6fqmU2WtV6srk9DbvfXOYUs43sGND7Vwy9yf/gPa+9jB8TP8PFdrT2O0xrP1fUepCp5DA27Fhtm3bblnnoWQfhYisZRGJIVjLRVHE6IuiuLm9vr29bZrNerG8ublpmzURNLZpKW2jQNF9IEAMhAELMmxK5eLB+x/UTVzVG2kaKKGsRuNzW1STyRRklAyR6XTmpGAfswW663nGaSLqgmuH21hyLDi+pRwbT04uq8KBSJVyHI0KAQZCTJZEnWXVaBmkmzB7Gtqb1fK6qW8QViAPld5we6Aq/9cM21vahoHx8NAx6vZTTrYXKKOsJtMz44rGR++TX2VxNr1PxhJbze5nRhVBADapaoiCRHJKvF6hGrFVAicPi2zK7TwSswod+2UZe0oZEjDQgFG2RPWsfcx5OTS7UCXWmIicscysEEirftM2q6ZeS/BE6ixbEiZZvn4OKBCSygCQxAoP0wX0k2Ngd+BdjQYAtmVZjSbsCgKTLQs3MlVVt6IwohTViCIiFVOLrpv6e1q7o2DMCgk7yuQ7lOTZ6AWb0rYMuYHhXXpKffJhTZzTqUoq0Ry9StgsZsSGSFXEOVtVFUHatt7MXh34lGlnUNgZrr3B/JH+SjQ0mp2gwZw6xkbvzHnDZjwej0YTImq9DwrnTFWNy9I5V45G5Xg8raoqswsRIbbBCwBjjHG27eazdNHiQMZLHJvep5TbPedxaG/qen1ce9crgwFWEmabNX/DLK3KfYaWwdoxSXs5uEt2UlGNvm0vLs5U9fnzb66vr0FKom3bLmbzENvYNppqA5KAwYYk9EEoJjuxpqqAxkIURFyNR+OptUXjQ916tApXmrK0pgAbZibjmFw1OlM2BE4G+GQMJDLe+w7C+wFkyZI5HQzXyTroDAeAKIJEKSLV5wZLJANDZDiVXIMQxKjX+hqybJvlcvV6vXilcYlUYFaHs+tH2H4TbGN3ye4t4u2CpC7gkAAYKoqqGhflaPZ6DjdyZUWUAkIKa0piG0QFhmBAjsgk+1byLKXkdkiU8pljsOrkQHXGJ/b1PqtwpyTolpBGytJAPwXS0hJrrXVMCu/9ZrNqNhu0G7QLN7LjccWGms16s15qW0OTeB2HvmZpWR8m5+vkhZ3Ni5iZLBFVk2kMqgpXFuVoYmwRhZoQ1VgFp4q0qtrlhBeKcehMezdsE1AcBrAdc2HrhzMG6Vgl7Tcp1ehcmRidGH2MKhJiVEWIoSZSzgaFgBAQPIDx5TkzEGVTr2LrgVQrJfSVSYcPub393kv8Ebb/+vQXgG1gGMFBTOycExEffFGMqkk1mZw5Z0TQNJu2Damwd5H2kMIa46y11lpjDLGFYccmse69n7OGeDSt0ID73wGbobS9p0g43sVjniKJOoUw9WcqwZBVgkbpkj1TqgtiunJqHc4pETGptbZpNnVdxxidM8y8Xi7n8/lyvspJaRDadr3eLNrNah92FCkrPwBV6dgLJlcQkQgjyvjyHrElMkE0BAkSIQQ28AIqUqA4kvOaKpQm0ymAHsVz9wFlo8BeFodhFsXdv4g+cg58DUIRELDJkTLKhtxADFCDYGKrsvbtsm3nvp37dqWx0c64+KOSvKfjy/JUx/ak8A40Dq60KQGtrUbn1hYEbnxoaw8FyIGMGY2JnbOldSNrHcAxaBsDG6e8I9KldbXNZp5ussWe40/aZzfb0SGrjMsCGlO64VSdL/o2xti0taqKb+AbxIiyHE2n5+Pi9vVTDeu2bRGylxlISRWIfMDlJFzajX/PA8ZkpY/SZmusdc4Z4zbLTa6aZpiMAxlNgSGakg7s9k4jVI90WRUnths07f6RbL0+tOopSGEMICCDPjozLcgggMA4WDa2MIaMcQy1JhsXVFU0hBAkBBFpNktj+mT1mrwaFOHbBImm7f5HlfgPke7eH469sz50J3k85eJ2lOrRK1QiQMRUllVRFBcXF8YYw04Rg5eUYS1C2zYYa6uydEVhjUnuVSA6m04PnaQUOWgteZUOtEQ70uEQv09JjUPak907FmEr7ishtH6bN1C6wGWwhh1lftLzGaj33jk3Ho+t4/V6vVqtnDHT6dl6EzebzXI5Xy7nwddspCiNtVhvliGEtm21LzWWZJEoW5tnek9q807CBuzQmbfZOGa+uLoE2zQ+AEQgIiqYzWY9YPe6N5BpQgTRwFvoLtjOwYJJl8YR0N6BsWkjyBAcsyHKQ8GKgoxEH8NG0TA1ElvfrGKQH13S9ugubnrfsnRMCt9H7r7ikqKLaCIYR8xkXFFURTm2pliuN23ToolIsYmj8agYsbPGFkOE7qG3jVvXlSHvLPEga65CCc7YftnkxaMAiXovEjRm34oYfWx9jJ4Yk9F4NC6JdLPZLGdz3ayAaCsK7boLI1UmBiUr7EB86D4oUrrX/vt2tJKZoINtZmMKaw27EMTawhgjQEzJTYw1xgTZ85SWPt/ToWCtB2FgPRU2Kanu1o33T6maLM2Du/QnqGqMMSTyHjFCZKhJw07+MkXenWNnlaOc4Iz6308Rd/oJ+dGS/cOkPwO2uyWc/KvjYUQAszGyc5zYsLXOGDOZTNjaqijSdyUyRAIs5/M90EjH27Ylw4aYTJcyWVQJ0YdB9QH0u0TpiqP7SYoy38vUvdvp9DEPTFrRKV0R986bYBUk5YExZMnmut4qIioSS1cUValR6roGSVmM2kaNK6rCWceqofXrul63flPXax+auq59224XXCowQZAhW05gNjHGbNPshQEyMMD+PtPtWkQZnodcPgHsumaHOhY6GWgfk21QsoY/4YkyBCALpOTqOc4NSkSVRmEE4mBMJPW+qWVbnOHHALCTNIi36TnYjg473C9F7V9tPjX7lAKIUbOYmIzLyfXNumo8Hk/PnC3b4NfLTbOpQTlnCxlDMJ0xCJPJpH826e6IxCMfW2ah9X3xDIgGiRpFNRTWQKPJKa8NMaIPMfr17evk296XFAAAA0QPCtbYJDj2bjiDmXRkNPZHcv8zADAxOgf7fEJKVpN8sfJqQe9KmrT6KrsLJt/1tLT9FtLD8GyQfgukVAz7lRKyggSadAWiW6buoHR4r0o4oVbdPtKP9EOiw2nPA7g8+bYGk7ZjBLl/uSkBZ3K9Tm+/LHMh4BR/nKW3rI2m5BI21Bg56/q134OxEpxzymRAMJzU5iTah3caUFK2R2g6Lj4cZOTeV8L37SBL7Vs+Xanr6RF2JA1eKr9BsMQwqlFFIIFdKb7Jo+EcgOA9wMxllw5Buv8UREVhk3Jr4A2IFLw5VIj2o85MXemX3RdoOkjeYd+PuLLmV0bYd7Y/pb3boQTb/Tgh8xBpn4CCQm5fSiQrB0UgIkXT9Xfvr8a/5ixpx2nwVmh3Ge7i8uDYEcygFMcZoiJubdA5OW1KWNefChgHIggBhl1ZucKWhSUWQowaNWiEqEI1xQYLIoSUMKwYNvxbuYKsKYyFYURpYwhNG0IrmyUUUAERDIEIMUADW6MQleQbleugAGDKpw/6BTIk8cR82Tk8HEnCzvqOtOV4+lDR/eC0dC4BQEpWIPHYUH8L6pSH+e4Hi415J6jjKEvUR2hix0lEhhvxEKSZQZxcCHY8CI+P4FBX0Ue//Eg/GNqdoIwjTNYR7N6u9f1Irf05mMzYdV0Pb4EdjZHgSBLN039PJGI6/veEx/jO397PfGcckq9zPodNV11wBw6TA6vuXwVAwcYYk3zBukVlTK6AAOqDrCAqKRNLGopOlzX8ltrtIHH7ANsbd1YDH3aiSfvnzErxA2brVLqEE+o86tQPgl4TkSMFBhisg11NLdR0bkLZCkkg3fYMirDt8r9O2N7tO+//sEcD4W/3/GyvYjYAdGvFFUcMiGhIWTaTiBmHMLh9YekvpxLJbIwhlhxVFJhs4nAVCUBkoMwZAFH/N4VMEMMwRKFdEEUX8QXV7pb7mtgdo4DZ8s3WEYDg+9z2O93PO5CGo9MpmY66AipQCHXGGTKwlmPQmOOV2Vgbg3RKiRyVR50S/tuKn/2oJBbkjtHqVNPHzzn8C4Cg2M0flT4a01d17Mb0yLT5/7d3t8ttg0AUhs8u9v1fcCLojwUEEvLITafJtO+TmUziyIokA8unlI+Xu+vbE7a/1yk1jzfi8NMkwjlxZp0+wOh5jQLAk5Wtr8RWu8netLHZtMB60dY3Ny/bqRptshgYO6fcNqi0p9tWqV7OOXvFanSsAbhY/VpOQZHp+fSccyntZPujMPNFczfC574SOs6hdfiXUpTHmlB7aMd+M4yYb+t1LU8v8drV80c8x0zSeOfpNnhxLGxcNhTYQ/VrlY2HJvY+DagFi0ffiamNXcfnUx4alpa45Oa5SPKYU17i7qf7jt/274ZtrRK8Wvu7HLZ37w+Eq1WsyAc10JjKpvo85rFeVk517WfyvE0DF6t81OvRVu//twgpVtPV+EpybWPgaz+0s/OhvydJxWMxhTQWSCZ/PPPHRzv9PqYwhe3Dka+6FpWllLTVpZNyU0rpM5eScwwuWMltYUe13WpfzC3flauerX6bhaLNtM8XPU85Ka3tcAjbmvc89qp4Svnz2EHatjv8Stj+GV6G7eDyrBzf57/sYTultA9j+7DDlkPNp/9yFT6txvJpsfh6y8i276Sfy77hF2958QebE+8Qhvdqb3u9D455ksm2XOKaxFWZevtat/Kw4/Gy90JpLwNOPRz9yZ527DMfJ5SdnrRmUmrndB7zWsq1GZCHg/coaFsgya3Gc7xWY+vcYumbpHhyq/7v1vYry7C9dtlzG3lHd/bxhn2Bwe/oEeLqaIYa7nqbKYUdGxx3j+Le1TinsPut4S9c7a9XDO7sf+VPHD3+pnF46ruPBeF+Dj0XX6/e+27Au8jEPuTvW2km+hjubw8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIAf5xdbpXpXXRjOhgAAAABJRU5ErkJggg=="
-LOGO_FULL_HTML = f'<img src="data:image/png;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/4gHYSUNDX1BST0ZJTEUAAQEAAAHIAAAAAAQwAABtbnRyUkdCIFhZWiAH4AABAAEAAAAAAABhY3NwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQAA9tYAAQAAAADTLQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAlkZXNjAAAA8AAAACRyWFlaAAABFAAAABRnWFlaAAABKAAAABRiWFlaAAABPAAAABR3dHB0AAABUAAAABRyVFJDAAABZAAAAChnVFJDAAABZAAAAChiVFJDAAABZAAAAChjcHJ0AAABjAAAADxtbHVjAAAAAAAAAAEAAAAMZW5VUwAAAAgAAAAcAHMAUgBHAEJYWVogAAAAAAAAb6IAADj1AAADkFhZWiAAAAAAAABimQAAt4UAABjaWFlaIAAAAAAAACSgAAAPhAAAts9YWVogAAAAAAAA9tYAAQAAAADTLXBhcmEAAAAAAAQAAAACZmYAAPKnAAANWQAAE9AAAApbAAAAAAAAAABtbHVjAAAAAAAAAAEAAAAMZW5VUwAAACAAAAAcAEcAbwBvAGcAbABlACAASQBuAGMALgAgADIAMAAxADb/2wBDAAUDBAQEAwUEBAQFBQUGBwwIBwcHBw8LCwkMEQ8SEhEPERETFhwXExQaFRERGCEYGh0dHx8fExciJCIeJBweHx7/2wBDAQUFBQcGBw4ICA4eFBEUHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh7/wAARCAQABgADASIAAhEBAxEB/8QAHQABAAEEAwEAAAAAAAAAAAAAAAcCAwYIAQQFCf/EAGIQAQABAwMBBQMGBgcRDgUEAwABAgMEBQYRBxIhMUFRCBNhFCJCcYGRMlKhsbLRFSNDU2KUwRYXMzQ3VWNyc3WCkpOis9LTCRgkJTY4VFZ0hLTCw/AnZGWj4TVERYMmRvH/xAAaAQEAAwEBAQAAAAAAAAAAAAAAAQIEAwUG/8QAMREBAAICAQMCBQEIAgMAAAAAAAECAxEEEiExEyIFMkFRYSMUM1JicYGhsUKRwdHh/9oADAMBAAIRAxEAPwDcoAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAHDkAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABxMxETMzERHjMsd1ne23NLqqt3dQovXY8bdiO3P5O6PvBkbhG2f1SoqmadO0yZ/hX6/5IeVd39uG/VM0XLFiJ8qLcTx96dI2l45Q3G6tw1zMzqd2OfKIiFVO4Nbq8dTyP8ZPSbTGInxtw61bnmNRvT/bTy9PF3Xq9H4d23d/tqP1HSbSKMRwd4RMxTl4vHrVbn+RkOn6pg58f8Hv0zV+JPdV9yNJd0BAAAAAAAAADiZiImZmIiO+Zl4Wp7y2lplfY1Dc2j41fPHZuZlET93K1a2t2iNomYjy94Ylc6l7At1dmrd+j8/DJpmPvgp6lbBnw3fo38ZpX9HJ/DP/AEr6lPuy0Yn/ADydg/8AW/Rv41Sfzytgf9cNG/jVKPRyfwz/ANHqU+7LB5e39xaFuC3duaHq2HqNFmYpuVY92K4ome+Inh6ik1ms6laJie8ALWTkWMaj3mRftWaPxrlcUx+VCV0eLkbr2vj19i/uTR7VXpXm24n861O9dnR47r0P+P2v9Zf07/ZXrr93vjHp3xsyPHdmhfx+1+sjfGzJ8N2aF/H7X+senf7SddfuyEeDG89ozHMbp0Tj/t9r9b1dOzsLUsSjL0/LsZePXz2btm5FdFXE8TxMdyJraO8wmJifDsgKpAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAU3a6LVuq5crpoopiaqqqp4iIjxmQVPJ3DquVgWexp+l5GpZdUc0WrfFNMfGqqe6PzoQ6n+0Raws25pmycezl1W5mmvPvxM2+f4FP0vrnuQrrnUXe+tVzVn7n1KaZmZ7Fm9NqmOfLinjuTpG2yuvaV1I3D2vlfyfFsT4Y1vJimmPr48ftY9c6d7vs/OjBtXY/gX6f5Wts6lqPamr9kM3tTPMz8pr5/O9LSd67u0eqKtN3LquPxPPZjJqqp+6qZhYTll6LrGmT/wAP03JsR+NVRM0/fHcWO+IY1sv2i9x4NdOPunBx9ZxJ7qrtqmLV6I+r8Gr8iZNDubC6j4FedtvMt2cuI5uW6Kexctz/AA7c+Xxj70bNMMtw7Ft3tc2/qOi3eMq12rMzxTeo76J/VPwl06IWQv23Ztuva8XbtQC9RDsWZmmqKqZmJjviY8lu3S7FFIMj0fcVy3xaz+blHlcj8KPr9WUWblu9bpuWq4roqjmJifFHNNL1NE1S5p9zs1c12Kp+dT6fGETVO2ai3Yu279qm7aqiqiqOYmFxRIAADBOrnUrSOn+lU1X4jL1S/TPyXCpq4qq/h1T9GiPXz8IXx47ZLRWsbmVb3ikdVvDJtzbh0bbWl16lreoWMLGo+lcq76p9KY8ap+ENfd/+0XqF+u5ibN0+nEtd8fLMyiK7k/Gm34U/4XP1Qh/e279c3jrNWqa3lzdr8LVqnut2afxaKfL6/GXhS+l4nwnHjjqy95/w8jPzr37U7Q9Pce6dybhu1XNb1zUM7meexev1TRH1Ufgx9kPD4iPCIj6l6qlbqpetFYrGojswzMzO5Wqlqqn4QvzCiYVlMLExxPhCU+inSHVd95FOoZk3NP0Kir5+RNPzr3HjTbifH+28I+L2egXRu5u+ujcO4aLlnQ6Kv2q14VZcx6elHrPn4Q2xsWcLS9Oos2aLOJiY1vimmmIpot0RH3REQ8fn/EfT/TxfN/pv43E6/dfw6m1dvaNtfRrWk6Jg28PFt/Rpjvqnzqqnxqqn1lh3UzrDtXZM14lVyrVNVpj+k8WqJmmf4dXhR+Wfginrb10v5l29oGycmbWLHNGRqNPdVc9abXpH8Lxny9UBV11V1VVV1TVVVPNUzPMzPrMufD+EWy/qcifP0+v918/OinsxJN3p1337r9dy3hZtGh4lXdFrBjivj43Z+dz/AGvZRnqWoZ+pZFWRqOdk5l6qearmRdquVTP11TKzUoqh7dMGPFGqV0wWyWv3tO1urj0W6oj0hXVCiYTKIW6oj0hbmI9IXaoSH0R6Wal1E1r3lyLmLoeNXHyvK4/C8/d0etU/k+6J45clcdZtaezpSk3nVXa6DdJ87qBqcZuZFzF0DHr/AG+/EcVXp/e6Pj6z5fW3U0XTMDRtKxtL0vFt4uHjURRatURxFMR/78VGg6Tp+haRjaVpWLbxcPGoii1bojuiI/PPxd98rzOZbkW/H0h7ODBGKPyAMbuAADDt49Stp7T1inSdbzb1jKqs03oimxVXHZmZiO+P7WXj/wA+7p5/Xa9/Fa/1AkkRrPW/p5/XW/8AxWv9TieuPTyP/wCTyf4pX+oEliMv5+fT3n/9Qy/4pWv43Wvp5eq7M6zctfG5jXIj8wJGGNaRvzZuq8Rg7k0y5VPhTVfiir7quJZHRVTXTFVFUVUzHMTE8xMAqAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAa7e1h1CvY0U7G0jIm3Vcoi5qVyieJ7M/g2ufj4z8OI82wGp5drT9Oyc6/PFrHtVXa/7WmJmfzNAN0atk6/uDP1rLrmu9mX6r0zPlEz3R9kcR9iYHkx3K4lxw5iJSq5mVFUqu9TMSkU8s76b7J6h61dt6xtDCysebVX7XnRe9xTE/CqZjn7OYen7PfTunfW567+o0VfsNp0015MeHva5/Bt/bxzPw+tuXiY2PiY1vFxrNuzYtUxTbt0UxTTTEeEREK7SwPZWT1KsbdvY2+NB0zVL9qIimvCy6YuZFPnFVFURR2/8KIn4PPu6dpuq28jM25XXNWPV2cvT71M0ZGLV6TRPfH8vjEzCUWN7v2ra1i5b1TTsqvStexqeMXULNPzoj8S5Hhctz50z9nEm0o8pp4niXasrOLqFzU9ZydE1fCo0ndePTNd3Dpmfc5tH7/jzP4UT50+MOxbiYniYmJjyXhV2rUOzRDrWpdqie5IuRBwUySD09C1WcG57u7M1WKp74/Fn1hl9uui5bpuW6oqpqjmJjwlHVT1NvaxODX8nyKpnHqnx/En1+pWYTDMxxTVTXTFVMxNMxzEx5sO6t7/0vp7tirVM7i7lXeaMPFieKr9zj8kR4zKKUm9orXyWtFY3LrdYepGl9PtD99e7GTquRTMYeHFXfXP41XpRHnPn4Q0x3Lr+qbl1vJ1nWMqrJzMirmuue6IjyppjypiO6IWN27n1Xde4MjW9ZyZv5V+fLupopjwopjyph5tNfxfTcLjV49f5peNyc05Z/DsxUrip1oqVxU9KLsswvzKmVMVOJl0i23MlLXQTpHe3nmUa3rlu5Z0CzX3U+FWXVH0af4HrP2R8KegvSe/vbLjWNYouWNBsV8elWVVH0af4PrP2Q24xcfD0zT7ePj27WLiY9vs0U08U0W6Ij8kRDxviXxGMf6WL5vr+P/r0OJxev338K7NvFwMKizZotY2NYt9mmmOKaLdFMfdERDVr2hOsP80Vd3a+2MiY0iiezlZVM8fKpj6NP9jj/O+rxse0N1mr3Dfv7W2vk1UaPRM0ZWVRPE5cx9GJ/e/0vq8YRpqPhfw3pmM2Xz9ITzOXv2U8Lgp7UHah9Bt5rmVFTmZUzPcrKVFS3UrqlnXRzppqvUPW/d2u1jaTj1R8sy5jupj8Sn1rn8njLhmyVx1m1p1EOlKzeemvle6J9LtR6h6x2q5rxdFxq4+VZXHfPn7uj1qn8nj6Q3W27o2mbf0bG0jSMS3iYWNR2LduiPD4z6zPjMz3zKjbGhaZtvQ8bRtHxaMbDxqOzRRT5+szPnM+My9N8hzeZbk2/ljxD3OPx4xR+QBiaAAAAGqvtWzx1Ox/72Wv07iJYlLPtXf1T8f+9dr9O4iVIq5UzUnr2a9mbY3LtjUsrXNGxs69azOxRXc55insRPHdPrKVp6U9Pf8Aqtg/dV+tA0u7Xe55bnT0o6ff9V8GPsq/W83UOiPTzLt1U0aPcxKp+nj5FVM/lmQahVS9/am+d1bXyKbuj6zlWaI8bFdc12qo9Jonu+7iUtbz9nbJtW7mRtXV/f8AEc04uZERVPwiuO774QXrOmaho2pXtN1TEu4mXZq4uWrlPEx+uPiDaPpZ1v0jcly1pe4KLWk6pVMU0V9r9ovz6RM/gz8J+yZS8+ekTxPLZr2buplesWKNo65kTXnWLf8AwK/XPM3qIjvomfOqI8J84+rvCcQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAYT10zasDpJuO/RV2a6sObNM/GuYo/wDM0g91PHg3R9o2ma+kWrUR9KuxH/3qGpPyKePBaES8T3U+jn3U+j2Jw59D5JPolDx5tT6KK7cxHMvbnEn0Wq8OquYoiOZqnsx9oNtfZp0CnQ+lOnV1W+zkahNWZemfGe1Pzf8ANiEmPP23iW8Db+n4VqOKLGNbt0x8IpiHoKLAAMW6i7Mwt36Zbpm9Xg6riVe907UbPddxbseExPnHrHnDCtB1TL1jMy9A3Di28DeWm0drJs0d1rUbPhGTZ9YnzjynuS8xbqDtCxubFx8nGvzp+uafX77TdRtx8+xc9J/Goq8KqZ7phMSMUpniV+3U6uBm39Wry7GdhRp+4cDj9ksCPwZifC/Zn6Vqrx+E90rtNXcvEqu3TU57Tr01q+0kV1Ss1y5mpbqqEPf2vrnyauMLLr/aZni3XP0J9J+Ds9TNkaLv7bN3R9WtxFXE1YuTTETcx7nHdXT/ACx4THcxKuWTbT3B2Zp0/Or+b4Wrkz4fCUbms9VfKZiJjUtHN+7V1nZO5cjQtas9i/anm3cp57F6jyronzifyT3S8W3cb6dY+nGldRdt1YOVFNjULETVhZkU81Wq/SfWmfOPtaMbp0DVtq7gytD1rGqxszGq7NVM+FUeVVM+dMx3xL3eJy4zRqfLy8+Ccc/haprV01OnRX8Vym43xdlmHcipKvQnpTlb6zo1PU4uY+38eviuuO6rJqj9zon09avLwjv8Ov0E6U5W/c6dR1H3mPoGNXxcuR3VZFUfudE/nny+tuLpuFgaNpdnBwrFrEw8a32bduiOzTRTH/vxYOb8Q9OPTx+f9NXG4nXPVfw5wMTC0rTbOHh2bWLiY1uKLduiIppopiGrntG9aY1uq/tLaeVP7GUzNGbm25/pmY8aKJ/E9Z+l9Xj1vaR63V65dyNobQypp0umZozs23PE5M+duifxPWfpfV4wFTX3OXA4ep9XJ5+n/t05XI3HRTw7EVcKordftue292MjzZq7XbIrdft/FzFbp6ivS7UVOJlaitnXSDpzq3UPXPk2N2sfTrExOZmTTzFuPxY9ap8o+2VcmeuOs2tPZNaTadV8qukHTjVuoeufJ8ftY2mWKonMzJp5i3H4tPrXPlH2y3Z2pt/Sdr6FjaLouJTjYePTxTTHjVPnVVPnVPnKjZ+3NJ2poGPomi4tOPiWI7oj8Kurzqqnzqnzl7D5Pnc63JtqO1Y8Pb43GjDH5AGBqAAAAAAaqe1d/VQsf3rtfp3ESpa9q3+qjY/vXZ/TuollI2a9kb/kXq398P8A06U1oT9kX/kbq/8A2/8A9OlNiAAARd7Q+wrG69pXtUw8eP2Z023N2zVTHzrtuO+q3Pr3czHpMfGUouKoiqmYmOYnumAfPOHd0bUsrR9WxdUwbk28nFu03bdUeUxPLv7802nR9763pdETFGNm3KKOfxeeY/O8TzSN+9t6pZ1rb+Bq9jj3eZj0XoiJ8O1ETx9ng9FHHs3ZlWZ0k0qmrvnHqu2fsiuePzpHQDp6tqenaTiVZeqZ2NhY9Pjcv3Yop++UXda+sNjaN2vQtBptZet9n9trr77eLE+Haj6VXn2fvaz7h17V9w59WdrWo5GdkTP4V2rmKfhTHhTHwhOhtbq/W3p3gRMUavdzq4+ji41dXP8AhTEU/lePV7QuyYnuwtamPX3FH+u1cxbF/Kv02caxcv3avCi3TNVU/ZDI8fp/vfJtTcsbW1WqmPP3Ex+cGxmD176f5NcU3b+pYszPH7bh1TEfbTyzjbm7ds7jj/iTW8HOqiOZt27sduPrpnvj7mkeraJrOkVcarpWbg9/HN+xVRH3zHDrWb93Hu0XrF2u1donmiuiqaaqZ9YmO+DQ+gI1s6O9cM3GzLOh70yPlGLcmKLOoVR8+1PlFz8an+F4x58tkaKqa6IrpqiqmqOYmJ5iYQPE1DeG1dPzLuHnbh0zGybU8XLVzJppqpn4xM9zrTv/AGTHjunSP41SxjrX0wxd54X7J6bTbx9dx6OKK+OIyKY+hX8fSfL6mqWo42RgZd7DzLFdjIs1zRct1xxVTVHjEwDeHRd1bb1rLqxNJ13T87Ipo7c2rF+muqKfXiPJ7LQfQNa1DQNaxtX0rJqx8vHr7VFcefrEx5xMd0w3H6V7903fWgU5ePNNnPsxFOZi899ur1j1pnyn7PEGYgw/qpvzTtiaDOZkRF/Ovc04eLFXE3KvWfSmPOQexr259vaDetWdZ1nCwLl2mardF67FM1RHnx6POnqJsb/rTpf+Xhp1uXXtT3JrV/V9XyZv5V6e+fCKY8qaY8oj0W9D0vO1vVLGmabj1ZGVkVdi3RT5z6z6RHnKdDdLR96bU1jUKNP0vXsHMy64mabVm52qpiPGeIc7l3ltbbWVZxdwa9gaZev0TXapybsUduIniZjnxeH0g6d4GxNHmPmZGrZMROXk8f5lPpTH5Z73pdTti6D1B2vf0LXceKqKomqxfpiPeY9zjuronyn4eEx3SmvTv3eETvXZap6mdPao5jeugfx63+tdxOouwsvMs4eLvHQr2Rfri3at0Z1uaq6p7oiI575l8+uq3T/XenW6ruh63aiqmea8XKop/a8m3z3VU/H1jxifsmcVonsV010T2a6Ziaaqe6YmPOJb44VLRuLOHrTHmH1YGt3srdc53Fbs7J3jmf8AHNEdnAzbs/05TH0Kp/fI9fpR8fHZFhyY5x21LtW0WjcCi9dt2bNd69cpt26KZqrrqniKYjvmZnyhVVVFNM1VTEREczM+TTf2p+uVW4b9/ZWz8yY0e3VNGfmWquPldUeNumf3uPOfpfV42xYpyW1Be8VhszT1Q6dVeG99v/x+3+tVPU3p3Eczvbb8f9/t/rfNfu8OI+5P/s09Cqt5+63TuuxXZ2/TVzj48/Nqzpjz+Fv4+fl6tV+LSkbtZyjLaZ1ENy9H1PT9Y061qWlZtjNw70TNq/YriuiuInieJjunviXcWMDExcDCs4WFj2sbGs0RRatWqIpoopjwiIjwhHfXLrDoHS7TKIyqJz9YyaZnE0+3XEVVR+PXP0aOfPz8mKtZvbVXaZ1G5SVMxETMzxEMN3N1V6dbbuza1jeOkWL0c82qL8XbkcetNHMx9rRbqX1l37v2/co1TWLmHp1XMU6fg1TasRHpVxPNf+FM/VCPonjnjiPVtpwv4pcZzfaG++Z7TPSaxMxb1bPyuJ4/atPu8T9U1RCnB9pvpPkVcXdT1LEjnxu6fcmP8yKmiOLi5eTx8mxMi/z+9Wqq/wA0K8rEzMSZpysTIsT6XbVVH54X/ZMaPVs+je2urnTXcVyLWlbz0m5dq8LV677iufqpudmZZtRVTXTFVNUVUzHMTE8xMPlLPFXjETH3s/6bdX99bCv240jWLt/Bpn52BmVTdx6o9IiZ5o+umYUvwv4ZTGb7vo6I26GdXdD6oaPcrxqfkOsYsR8swK6uZo5+nRP0qJ9fLwlJLDas1nUu0TE94dTVtS07SMGvO1TOxsHFomIqvZFyKKKZmeI5me7vmYh4kb/2N/1v0H+P2/1sD9smmJ9n/W5mIni/iT3/APabbQmOzx+DT9zVg40Za7mXO+TpnT6f6NunbOs5c4mkbg0rUMiKJrm1jZdFyuKY45nimeeO+O/4vWvXbdm3Vdu1027dMc1VVTxER6zL55ezpvjSene+c/c2q267lu3pF+1ZsWqfn371Vdvs0RPlzxPMz3RETLzeqnVrenUTMuTrOp3LGnTVza03GqmjHojy5jxrn41c/YtPDnq1E9ketGm8G4utXS3Qb1yxn700yq9b7qrWNVORVE+nFuJ73m6X7QnSLUL8WaN3WseqfCcrHu2af8aqmIj73zxiJjuiOI+pV38S6fsdPur60vqzgZeLn4VnNwsi1k41+iLlq7aqiqiumY5iYmPGJX2E9B+f5zO0Of602P0IRH7a26t97TtaHd23uPI0zStRpu4+Rbx6KabnvaeKon3nHaiJpmY4iY/BY6Ypvfoh2m2q7bCavq+k6PjzkatqeFp9mP3TKv02qfvqmGC6v106S6Xdm1kb40y5X6Y0134++3TMflfPLUc7N1LJqytSzMjNv1d9V3Ju1XKp+2qZlZo7Vc8URNc+lMc/mbY4NY+aXH1pnxDfm77SnSSi52I17Kr/AIVOBdmPzPS0vr/0j1C9RZt7xxbFyueIjJs3LUffVTxH3vn1OFnRR25wsqKfxpsVRH38LHPfNPPfHjB+x458SerZ9TNF1vRtbsTf0bVsDUbUeNeLkUXYj65pmXoPldpGp6hpGZTmaTn5Wn5NM8xdxb1VqqPtpmGzPQj2mM6jPx9A6jX6L+NdmLdnVuzFNdqZ7o99Ed00/wAKIiY8+fFwycS1Y3XuvXLE+W3ApoqprpiumqKqao5iYnmJhUyOoAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADBOvFv3vTLUqPWuz/paWs84Pd4NouslHvNgZ1HrXa/0lKAZxI48F6+FZYvVg/BT8i+DJqsSPRROH8FkMbnD+BiYXOfjRMfu1H6UMjnD+CrBwonUcXu/d6P0oBtjYpiizRRHhTTER9y4pp/BhU5LgAAAMb3ntn9mZx9S07IjA13A5qwsyKeeOfG3cj6VurwmPtjvYvXV8vsZGT8knB1DEqijU8CZ5mxXPhXTP0rdXjFUd0x8YmIkx5Os6PbzMm1qONVTj6lYpmi3e7PMV0T+FauR9KifTynvjiUxKGARX8VUVvR3No13Tezl27fZx6/wqYntRaqny5849JeLFyPVdDszWoqrWZufFTNz4pF2qpZrlTNzuUVViGbbL3D77s6bnV/tkd1m5M/hR+LPxeD166V4fUbQYuY028bXsOmZw8mqO6uPGbVf8GfXynv8AWJ8KbkxVFUTMTHfEx5M/2ZuejUKacDNrinLpj5lU/usfrItNLdVSYi0al8/9Y07P0bVcnStUxbmJm4tybd6zcjiqmqPz/CfOEgdCul2o9Rtam7d95i6Di1x8ryojvrnx93b9ap858o+yGzfWTo1oXUbNwtRu5NemahYqii9kWbcVTfs/iTHrHlV5fFne2dD0rbOg42jaPi0YmDi0dm3RT+WZnzmfGZnxejf4j+n7fmY68T3e7wvaHpWnaFo+PpWl41vFwsW3FFq3R3RTEfy+stXfaa6306nORsrZ2X2sKJm3qOfaq7r0+dq3MfR9avPwju55t+0711nPuZOydl5kxiRM2tS1C1V/RfKbVuY+j5VVR4+Ed3LW2ieIV4nG7+pkWz5u3TV2aZ4jhVFSxFSqKnrxZgmF/tOYqWYqc9p0iyvSv9oivvWYqZv0h6eax1F3HTp+BTNjCtTFWbmVU802aPT41T5R/IWyxSN2nsiKTadQ7vR7pxrPUXW/k2HE4+nWJiczNqp5ptU+kfjVz5R9s9zd/Zu2dH2loGPomiYsY+LZj66rlXnXVPnVPnLjZe2dI2jt3G0LRMWMfEsR9dVyrzrqnzqnzl7T53mcy3InX/F63H48Yo39QBiaQAAAAAAAGqvtW/1T7H967X+kuoklLPtXT/8AFGz/AHrs/p3USzKRs37I3/IzVp/+of8Ap0prQp7Iv/InVZ/+of8Ap0prQAAAOAaW9eaKaOrmvxT+/UT99EMGZL1P1CNV6i7gzqa4rt3M65Tbqjzppnsx+ZjSUNt/ZannpRY/7Ze/SZD1l3j/ADE7GytVsxTVnXJjHw6avCbtXhMx6UxE1fY8r2a8P5J0k0yrv5yK7l6ftrmP5Ede2Hn11aht7S+fmUW72RMeszMUx+afvEoIyL9/KybuVk3a71+9XNy5crnmquqZ5mZe/wBOtp52890Y+iYUxRFfNd+9McxatR+FVP3xER5zMMdiEl9Dd/6NsHI1TJ1HTM3MyMym3bt12Jo4oop5mY+dMeMzH3A2Z2Rsnbu0NPoxdH0+1RcimIuZFdMTduT61VeP2eDJEKx7RW2Z8dE1eP8AJ/6zmfaK2rHjo+sfdb/1kCYs3Exc3GrxszHtZFi5HFdu7RFVNUfGJave0R00xtp37Ov6Fbm3pWVc93dx/GMe5PfHZ/gz393lMfFnlXtHbVj/APhdYn7Lf+sxXqn1p21u/ZGfoNjSNStX78UzZuXOx2aK6aomJniefJIgqW1/sw7uu6/syvSM2728vSaotUzM81VWZj5kz9XfH2Q1O5TT7I2XXa3zqWHE/Mv4Haqj401xx+ckbSIk699Lad2YVWu6Hboo1zHo+dRHdGXRH0Z/hx5T9k+XEtiB89btF2zers3rddu7bqmmuiuOKqZjumJjyl7OzNy6rtPXrGs6Re93etTxVRP4F2jzoqjziWxHXrpHG44u7l23Zoo1einnIx47oyojzj+H+f62sVdqu3XVbuUVUV0zNNVNUcTEx4xMJG4eD1c2vf6eVbtu3/d+7/armF2om7F/jutxHnz4xPhx3tXt+bp1LeG4r+s6lXHar+batUz82zbjwop/X5z3sdjujjnu554djBxcnPzLOFh2LmRk364otWrdPNVdU+ERAhzp+Jl6hn2cHBsXMjJv1xRatW45qqqnwiG2vRTppj7I0z5Zne7v65k0R7+7HfFmn97on88+c/B1uh/S7H2Zhxqmq0W7+u36PnVeNONTP0KZ9fWfs8EooSAAxHqvsDQuo21L2h61a7NXfXi5VFMe8xrvHdXT/LHhMPnz1M2Nr/T7dF7QdfxuxXHNVi/RE+6ybfPdXRPp6x4xPdL6aMR6rdP9B6i7Wu6JrdniqOasXKoiPeY1zjurpn88eEw08fkTinU+HPJj6u8eXzWsXrli9bv2Lldq7bqiuiuieKqaonmJifKW6nswddaN4WbW0t2ZFFvcVqnjGyKu6M+mI+6LsR4x5+MebU3qVsfXun+67+39esxTco+fYv0RPu8m1z3XKJ9PWPKe6XgYt29jZFvIx71yzet1dqi5bqmmqmfWJjwl6GXHXNVnraaS2a9qrrpXn3srYezMyYxKJm1qefaq/o0+E2bcx9Hyqq8/CO7nnWPjiFUQmv2b+imR1Bzadc12i7jbax6+OY+bVmVR40UT+L61fZHf4TEUwUO97LnsydE72/M6jcm4rVdrbONc+bRPMVZ1cT30x6UR5z5+EecxvBi2LGLjWsbGs0WbNqiKLduimKaaKYjiIiI8IiFvTMHD0zT7Gn6fjWsbFx7cW7Nm3T2aaKY8IiHZeVmzTlnctNKRWHjb23BhbU2nqe4tQnjG0/GrvVxzxNUxHdTHxmeIj63zV33unVd6brztyazd95l5lztTEfg26Y7qaKfSmmO7/wD63F9ufV68Do/Y0+1XETqOpWrVcetFMTXP5YpaOxLbw6RFZs5Zp3OnY0/DytR1DHwMGxXkZWTcptWbVEc1V11TxER8ZmW7PRX2a9s7a0/H1LeeNY13XKqYrqs3PnYuNP4tNPhXMedVXPwiEIexPoONrHWL5dlWouU6ThV5NuJ8rkzFFM/ZzU3uU5WaYnphOKkTG5dXC0/AwrNNnDwcbGtUxxTRatU0Ux9URCvJw8TJtVWsjFs3rdUcVU3LcVRMfVK+MG3dAvW/2c9s7o0zJ1PaOHY0TXqKZroosx2MfKnx7NVEd1Mz5VRx8eWkGbj5GFmX8LMs12MnHuVWr1quOKqK6Z4mJ+MTD6stCvbP0DH0XrRfysWzFq3quJbzKojwm5zNNU/b2Yb+JmmZ6ZcMtY8wjbpzu/VNjbxwNy6TcmL2LX+2W+fm3rc/h26vhMfl4l9Ktp63hbk23p+u6fXFeNnY9F+3388RVHPE/GPB8s4b2exLrFeo9GaMK5VNU6bnXsaOfxZ4riP85PMpExFkYp76er7Yv/N91/8AuuJ/4m20Cie5v77Yv/N91/8AuuJ/4m20CjwX4X7uf6oy/M7miaTqeu6rY0rR8HIz87Iq7NqxYomuuufqjy85nwiO+W1HTL2TcOnFs53UDVL12/VEVVadgV9mij4VXfGqfXs8R8ZR17EkTPXK3MeWlZP57be1TlZ7Ut01Wx0iY3KMtO6CdI8GzFujZWBe/hZFVd2qftqqdHcPs6dJdXx7lujbUabdqp4pvYN+u1VR8YjmafviUtjF6l/O3bpj7PL2nomNtvbWnaDhXLtzG0/Gox7Vd2YmuqmmOImeIiOWJ9cemWL1S0DTtHy9TuadbxM6Mqq7asxXXVTFFVM0RzPEc9rx7/DwSApuV0W7dVy5XTRRTHNVVU8REesyitprPVHkmImNSinafs89KtvxFf8AM9+yt+P3bUrs35/xe6mPuSHpe29v6Xa91puh6bh0c89mxi0UR+SGIbp62dMNuXa7Ofu3BuX6J4qs4vN+uJ9OKInhhGf7VnTXHrmnHxtezIifwqMOmmJ/xqol16c1+/dXdKp1nGx5p7M2LUx6TRHDGt3dOdkbrxK8fXNs6dk9umY97FmKLtPxprp4qiftRFPtbbA5/wD0XcX+Rtf66qj2tensz87SNw0//wBFuf8AzojDljxB11+7Xf2iulF7pduyzYxr9zL0XUaarmBfufh09mY7Vqv1qp5jv84mPijCZ7k/e0/1j2b1O23o+HoWLqlrOwc2q7NWVYpop93VbmmYiYqnv57P3IAnwenim00jq8s9tb7N+vY+3Zf3R0cxLGZdm5l6Peq0+uuqrmqqimIqtzP+BVFP+CmRq9/ufk1/zPbupmZ7EZuPMR8fd1c/yNoXl541kmIaKTusADkuAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAxbqnR29lZlPrVb/ThCk43wTf1JjtbTyKfWu3+lCJpsulPCsvHnG+Dj5L8HrzZhTNlZDyZxvgqwcbjUcWeP3aj9KHpzZVYdn/h+N3fu1H6UA2AjwcuIcuK4AAAACzmZOPh4l3Ly79uxj2aJruXLlUU00Ux3zMzPhAK79q3fs12b1FNduuOKqZjumEabs0W7o2RF232q8K5PzKvOifxZ/klhON7TehXeqH7EVYtNG1aoixRqc8xX73n+iTT5Wp8PX6Xh3RPmRaxdRwZt3Iov49+jxieYqpnwmJ/ldb474tdUeVK3rfwiCLsT5uJufF2d06NkaDndirtV4tyZmzd9fhPxh5PvufMS7VVz4rdVz4rE3PioquCF6u58VmbtVFcV0VzTVTPNNUTxMStV3Fmu4CV9hbpp1e18hzaojOt090+HvafX6/V53XvQ937i6b5+mbL1GnD1Cvvro/BqybXE9q1TX9Cau7v+zu55RtZyruNkUZGPcqt3bdXaorpnviUw7F3TZ1/D91dmm3n2o/baPKqPxo+H5lflncJ8xp82b+PkYWVdw8uxcx8ixXNu7auUzTVRVE8TTMT4TEuaKm5/tPdEqN44t3de18emjcNijnIsUxxGdREf6SI8J847vRpfcouWbtdm7RVbuUVTTXRVHFVMx3TEx5S9jDmjLG4efkxzSdSvRU5ipYipVFTTFnGYX+0dtY7Si9eiinmfHyhab6R07Zr0s2LrfULc9vRtHt9m3TxXl5VUftePb5/Cq+PpHnP2t9+n20NG2RtrH0LRbEW7NqOblyY+fer866p85n8ng1A9lHrNY2Tqle19x28e1omo3oqpzabcU1412e6JuTHfVRPdHf8Ag/Vy3et10XKKblFVNVFURNNVM8xMT5w8fm573np+jfxsdaxv6qgGFqAAAAAAAAAAap+1h/VPsf3rs/p3URTKW/awq/8AijYj/wCl2f07iI0jZ72Q552Rqv8AfD/06U2IR9kGf/8AC9X5/rj/AOnSm1A5HBMxEczPER5g5Yj1c3ZY2dsfO1Oq5TGXXRNnDtzPfXeqju4+rxn4Q62++qO0do2a6cvUaMvNiJ7GHi1RcuTPx47qY+My1X6m771bfeuRn6hxZxrPNOLi0TzRZpnx+uqe7mf5EjFapqqmaqqu1VMzNU+sz3zKvDxb+bm2MLGpmu9kXKbVumPGaqp4j86iJTd7MOwb2oa1TvLUrM04OFMxhU1R/Rb3hNUfCn8/1A2H2lpNvQts6do9uI4xMei1PHhNUR3z9s8tfvbBx66dxaBlzHzK8W7bifjFcT/5myqH/aq27d1bYVnVseiqu7pN/wB5XEfvVfFNc/ZPZn6olA1XiWX7D6d7k3rhZOZoVGHct412LVyLt/sVRMxzHdx4MOhKns2b2xtq7svadqd2LWnarFNuq5VPFNq7TM9iqfSJ5mJn4wkKuhPUSI7sTT5/75H6lmroT1Hmf6RwP45T+pt3TMVRExPMT4S5Rsagz0G6jz/+z0/+Nx+pT/OF6j8/0jgfxyn9TcABqDHQbqL/ANCwP45H6khdAemO7tn72vaprmNi2sWrDrs0zayIrntTVTMd32Snquumiia66opppjmZmeIiCiqmuiK6KoqpqjmJieYmAVA8vdOvaZtrRMjWNXyabGLYp5mfOqfKmmPOqfKAdbfG6tK2hoF7V9Wu9miiOLdqmfn3q/KimPWfyNMN57gv7n3Lm65kY2PjXMqvte6sUdmmmPCPrn1nzl6fVDfOpb61+c/L5s4lrmnExYnmLVHrPrVPnP2MToiq5XTRRTNVVU8RERzMz6JQpmXs7H3PqO0dy42u6bFuu7ZmYqt3KeablE/hUz6cx5x3wkevoVrv87ynWqK651zn31Wn/wBh47qY/snnx9nih+uiq3XVRcpmmumZiqmY4mJ9BLefYO7NJ3lt6zq+lXPm1fNvWap+fZr86Kv1+bIGkPTLe2p7H3DRqOFM3ca5xTlY0zxTeo/kqjyluRtPcGl7o0LH1nSMiL2Nej/Coq86ao8qo9ED1gAFrLyLGJi3crJvW7Ni1RNdy5cqimmimI5mZmfCIVXrtuzZrvXrlFu3RTNVddc8RTEeMzPlDSf2o+ude8cm7tHaWVXRt21VxlZNE8Tn1xPhH9ij/Onv8OHXFinLbUK3vFYed7UHWDF6h6va0bRMWxOiaddmbWXXaj32RX4TVTVPfTb9I8/GfKEKwt09yePZu6FXd+2ru4dy+/xNAiiu3jRT82vJuTExFcT+LTPfz5zHHhy9WenDT8Mve8oN8m4Pspda8fV8XE2FuaqxjalYoi1puRTRTbt5NER3W5iOIi5Ef431+OtXVTYGu9Ot03dE1q3NVE814mXTTxbyrf41Px9afGJ+yZxazdrs3qL1q5VbuW6ororoniqmqO+JiY8JVyUrmqVtNJfVEa+ezF10t7ttWdo7tyaLe4LdPZxcqqYinPpiPCfS7EeMfS8Y82wbyr0mk6lrraLRuGsv+6AWbtWyttXqYn3dGqVxVPxm1PH5mnMQ+hHtY7Wvbp6LaraxLU3MrT6qM+1TEd8xbn58R/gTV9z58xD0OJO8emfLGrNifYJyLVrqVrePXMRXe0mJoj17N2Ofzt1XzZ6F7zp2D1N0rcN+Kpw6KpsZkUxzPua44qmI8+O6r7H0fwMvGzsKzm4d+3kY1+iLlq7bq5prpmOYmJ84mGbl1mL7dMU9tL4DK6jSv2+b9mvqVoViiqJu2tJma49Im7Vx+aW5mpZuJp2Bfzs7ItY2NYom5du3KoppopjxmZl84+ve9aeoHU7U9wY/PyHmnHwomOJ9zR3RP2zM1fa18Oszff2css9tMCiW6nsFWrtPTTWrtcTFFzV6uxPrxaoifytK/N9FfZk2tf2l0c0XAzLfu8vIpqy79Mx301XJ7URPxiOHflzqmnPFHueV7ZH/ADftd/u2J/4m20Dhv57Y/wDzfde/u2J/4m20Dhbhfu5/qnL8ycfYh/q4R/erJ/Pbb2NFPYg/q4R/enJ/Stt62XmfvHTF8oAyujobh1fT9A0PM1rVcinHwcKzVev3KvCmmI/O0H639a9y9RtSvY1nIvabt6mqYsYFquafeR5VXZj8KZ9PCPytkPbg1LIwejHyWxMxRnajYsXf7SOa+Pvpho3Hg9Dh4o11yz5bTvRbt13LtNq1bqrrrqimmiinmapnwiIjxlL+0fZv6p7gxbeVc0zF0axcjmmdRv8AYr4+NumJqj7eGUewtoWkajv/AFXU8+xbv5mm4lFeHFcc+7qqqmKq4j1iI458uW6ieRyZpbpqUxxMblpVHsi78qjmrcm3aZ9P26f/ACqa/ZE37EfN3Htyr7b0f+VuuM/7VkdPSq+dfV/onunphpGHquu6hpOVYy8n5NRGJXcmqKuzNXM9qmI44pnzRo3L9v27ajp9t6zNymLlWrzVTTz3zEWa+Z49O+PvaZeTdx7zem5cbxETqG4v+5/xH8yW6Z8/2Qs8/wCSbONXv9z7mf5m92U+UZtif/t1NoXncj95Lvj+WABxXAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAY71CjnbN6P7JR+kjKqiOEmdRqoo2tfqn8e3+lCLJyI48XSnhSyqqmFPZhaqvx6qffx6rC/wBiFzEoj5ZYn+y0/nh1Pfx6ruFfic3Hjnxu0/ngE7x4OXEOXFcAABRfu2rFmu9euUWrVumaq666oimmI75mZnwgFOVfs4uNcycm7RZs2qZruXK6oppppiOZmZnwhpl7SPWu5vTJuba21ertbdtV8Xr0cxOdVH5rceUefjPk59pfrZd3hlXdrbXyK7e3bVXGRfpnic+qJ/0cT4R9Lxnu4QVEvT43G6Pffyw58/V7a+FU97YP2Z+uFW3btjZ+78uatHrmKMLMuTzOJM+FFc/vc+U/R+rw16mVFUtGWkZI1Zyx2mk7h9PNTwcPWNNrxcmmm7Yu08xNM+HpVE/yoc3PpGXoGpTi5HNdqrvs3eO6un9frCNPZd65VaTkY2x945nOnVzFvTc67V/S9XhFqufxJ8p+j4T3ccbU7h0jD1zTK8LLp5pq76K4/Coq8qoeTek4ral6FbReNwg73seqmq4vbi0nN0HUqsLMj427kfg3KfWHmzd+IOxVcWq7izVcUVV/EFyutXp+fk6fm2szDuzavWp5pqj83xh1Kq1uqsE/bJ3Pi7j0/t08W8u1ERfs8+H8KPhKEvag6FzuGMjeezsaI1imnt52Dbjj5ZEeNdEfvnHl9L6/G1omr5ej6laz8K72Ltue+PKqPOJ9YlPO0dxYW49MjJxqopu08ReszPzrdX6vSStrYrdVS1YvGpfMie1TVNFdM01UzxMTHExPpMOYqba+1N0Lq1ScnfOzMTnO4m5qWBap/pj1u24/H9Y+l4+PjqJNXHdMd/o9bHnreu4YL45rOl2q5FMcuvXVNVXMuZmZ75ccKXvNkxXTjhs77KnXKrTbuNsTeOZM4Vcxb0zOu1f0GfKzXM/R/Fny8PDhrLEKopUtji8alat5rO4fVRy1c9lfrnOROLsTemZM3+61peoXav6J5RZuT+N+LVPj4T38c7RvOyY7Y51LbS8WjcADmsAAAAAAAA1O9rD+qpa/vZZ/TuIkbN9cekm5t772o1rScrSrWNThW7HGTerpr7VNVcz3U0THHzo82D/73Te/9ctA/jF3/ZJEcbe3dubb2NXjaJrmZgWblfbrt2aoiJq445nmPSIet/PP6gcf8rdS/wAan9TL59nTfPlqO3/4zd/2R/vdd9f9P2//ABq7/shDDaupvUCf/wDbtU+yun9TzNT3dunU4qjP3HquRFUcVU1ZVcRP2RMQkT/e7b6/6foH8au/7Jfx/Zy3jXXEX9Y0K1Rz3zTcu1zH2diPzghnu5nujvnmfi5piapiKYmZnuiI82xmj+zXgW7tNer7qycijzoxcWm1M/4VVVX5kmbO6ZbL2rVTe0zR7dzKp74ycmfe3Yn4TV3U/ZEG0oE6S9FtX3FftaluO1e0zSImKot1R2b2RHpEfRp+M9/p6tpdOw8XTsGxg4Ni3j41iiLdq3RHFNNMeEQ7AgFrLx7GXi3cXJtU3bF6ibdyiqOYqpmOJifrhdAab9Zum2fsfWK7+PbuX9Dv1zONkcc+75/c658pjynzj48o9fQPPw8XPw7uHm41rJx7tPZuWrtEVU1R6TE+KHN6ez5t7U67mTt3OvaNeqiZixVHvbHPwifnU/fP1J2Ij2J1k3dtTGowYu2tTwKI4osZfMzRHpTVHfEfDvSRg+0pp026YzdsZlFfHzptX6ao5+HPDAdY6C9QsG5MY2LgalR5VY2VET91cUvByelnUPGmYubU1Crj97ppr/RmQTJf9pHQ4on3G3NSrr8oruURH5JY/rXtHazepro0jb+Hi8x825kXJuTH2RxCO8bph1Av1xRRtPUqZnwm5biiPvmYe3p/Q3qNl3IpuaVjYdM/TyMujiP8Wap/IIY5u3qDu/dHbt6treRVYr//AG9qfd2v8Wnx+3luRsbv2Xok/wDyFj9CEG7d9m7IquU3Nxbkt0UedrAtTMz/AIdfh/itgtKwrOm6Zi6fjzVNrGs0WaJqnmZppiIjn49xItbg1jTtB0jI1XVcmjGxMentXK6vzRHnM+EQ1B6udQs/fete8mK8fS8eZjExefCPx6vWqfyeH1zL1j2B1H35qcWrWo6DiaNj1TONjTk3u1VP49zi1xNXw8I8vVgEezxvnz1Db/8AGbv+yBD8tg/Z06WVRNjeO48aYnur07FuR912qP0Y+30drpp0EuaXrtOpbvycDOs2OKrOLjVV1UV18+Nfapp5iPTz8+7umeYiIiIiIiI8IgS5QH7RXSurMi9vDbWNzkUxNWoYtunvuR++0x+NHnHn4+PjPggfPXnhmfSbqHqGwtejIt9vI0y/MRmYvPdXH41PpXHlPn4T8Ja6q9CMzWNyV6rtC9p2JZyea8jHyblVFNFznvmjs0Vd0+PHdxPh492GV+ztv6fDM0D+N3f9kkbQ7e1jTtf0bG1fSsmjJw8miK7ddP5pjymPCY8pd25XRbt1XLlVNFFMTNVVU8RER5zKE+h2wOpWwdZrsZuZomToGVPORj0ZVyqu3Xx3XLcTbiOfCJjmOY+qHoe0ZtrqnvTSqds7IyNH0/SMi3/xhkZOZXbvX+Z/oURTRVxRx4zzzVzx3RzzNaxadb0iZ1CBfal68Xd1ZORs7Z+XVb0C3VNGZl254nOqjxppn96j/O+rx14plO9PsmdUfPM2v/Hrv+xezs72TN3Vbjw/5q9U0ezo1Nfaypwcm5Xerpj6NMVW6YiZ8Oee7x4l6tMmHHXUSzTW9p3MMa9mnoxldRdUjWdYouY+2cS7xcr8KsuuP3KifT8ary8I7/De3T8PF0/Cs4WFYt4+NYoi3atW6eKaKYjiIiPRY0LSdO0LR8XSNIw7WHg4luLdizbjimimP/fj4zLvPOzZpyz+HelIrDE+qewtD6h7VvaFrVrjnmvGyaIj3mNd47q6f5Y8JjufPnqXsrXdgbqyNv67Y7N2j51m9TE+7ybfPdcon0n08YnmJfTJg/WTptonUva1elalTFjMtc14ObTTzXj3OPH40z3RNPnHxiJX4+f051PhGTH1d48vnHjXrti/bv2Ltdq9aqiu3coqmKqaonmJiY8Jhu17MXW6jeuLRtfc9+i3uKxR+03p4pjOoiPH+6R5x5+MeaGY9lLqd25iM3bHZ57p+XXfze5d7TfZb6pYOXZzMXW9t42TYri5auW82/FVFUTzExMWfFrzTiyRqZcqddZ8N0K6aa6JpqpiqmY4mJjmJho17T3RPN2VrORubb2JXe2xlXJrqi3HM4Fcz30Vf2OZ/Bq8vCfLncnYdG6bW2cWzvKrTrmsWo7F67gXKqrV2I8K/nU0zEz5xxxz4Pav2bWRYrsX7VF21cpmmuiumKqaonumJifGGHHlnFbs7WrFofKjzSd0o63b16eWacDAyLWoaTE8xg5nNVNv17FUd9H1eHwbD9TvZa2vr+Te1HaWfXtzKr5qnG9373Fqq+FPMVW/smYjyhB+4/Zn6r6TXVOLpmDrFqJ7q8LMp5n/AAbnYlvjNiyRqf8ALh0XrPZLmj+11t+5apjVtqanjXPObF6i5T+XiVvXfa80S1aqjRtpahk3OPm1ZN+m3Tz8eOZa+ZfR7qliXYt3tia3NU/vdj3kffRMwvYPRXqpnzNNjY2rUzHj76imz+nMK+jg8/8AlPXdz1X6zb26jTVi6rmUYeldrtU6diRNFqfTtz41z9fd8EeeKatA9l/qpqV+3Gbh6bpFmvvm5k5lNc0/4NvtTymvpr7K21dCv2s/duoXNx5NFUVU48W/c4sT/Cp5mqv7ZiJ84XnNixxqP8I6L2nuiP2VujGTvDXMfdu4MWq3tzBuxctUXKePlt2me6I9aInxnz8PXjeOmIpiIiOIhbxrFjFx7ePjWbdmzapii3bt0xTTRTHhERHdELrzsuWclty0UrFYQ97Y/wDzfde/uuJ/4i20DpfSHr7s/U9+dK9V2vo1zFt52XVYm1Vk3Jotx2L1Fc8zFNUx3Uz5eLVmn2Tep0z36htan6869/sWviZK1pqZ+rlkrMz2WPYe/q21fDSMj9K23pa2ezf0H3j056iVbi13P0O/iTgXcfsYeRdrudqqqiYniq3THHzZ82ybPyrRa+4XxxMR3AGd0Rv7SOysrfXSfU9J0+jt6hZmnLxKPO5ctzz2I+MxzH1zD533bdyxdrs3rddu5RVNNdFccVUzE8TEx5S+rCF+tXs97Y6gZV/WsC9VoevXI5ryLVEVWcir1uW+7v8A4VMxPry18bkRj9tvDlkpNu8NNemO+dZ6fbssbh0Sq3N2imbd6zdiZt3rc+NFXH1RPPlMNqdte1hsnLxrca7pWraXk8fP93bi/b5+ExMTx9iEdyezP1W0m/NOHpmDrNryu4WZTH303OxPP1csVyOjnVKzcm3XsTXJqju5ox+3H3xPDXeuHL3mXKJvVthf9qPpXbtzVRl6rdqjwppwKomfvmGCb29rvGjHuWdn7ZvV3pjinI1KuKaaZ9fd0TMz98IX0zoH1b1GaZtbMzLNNU8drJu2rPHxmKqon8iVti+yLqd67bv703HYxbMTzVi6bTNy5VHp7yuIpp+ympx9Pj07zK3Vkt4a8753fuXfGuV63ubUb2fk8dimZjs27NPjFFFMd1Mfn+Lw29HVvoHh5/S3D2f06wNL025Z1G3lXrmXdrpm9FNuumZruRTVVVVzVHj3ePHCFo9kvqZPjqe1o/77f/2LtTkY5j7KzjskD/c+/wDk3uz/ALbj/wCjqbQoX9ljpZuPpdpWvYu4snTL9eoZNq7ZnCvV3IimmiYntdqinieZ+KaHnZ7RbJMw70jVe4A5LgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMS6tXPdbKya/S7a/ThC8Zvd4pg62V+76eZtceVyz/AKSlr58s7vF0r4VlkU5keqmcz4sdnN+LicyfVO0MinM+KrFz+zmWKufC7T+eGMzmfFR8u7FdNfP4NUVfdINv6O+mJ+Dl19NvRkadjZEeF21TX98RLsOS4CmuqmiiquuqKaaY5mZniIgHF25bs2q7t2umi3RE1VVVTxERHjMy079pnrdXui5e2jtPJqp0Oirs5eVRPE5tUT+DT/Y4/wA76vGr2mut9zcmRkbP2llTToluZozMu3PE5lUeNNM/vcf531eOvsy9bicTp99/Lz+RyOr21cOOSZcS2zDNDmZUVSTKipztC8Ka+9tZ7KXW/IzcjC6e7pm/k5FUe70zNima6piI/odzjv7ojuq9O6fVq7o+mahrWq42laViXczNyrkW7Nm1TzVXVP8A78fJvV7OvRvB6baN8v1Gmzl7ly6P+E5ERzFimf3K3Pp6z5z8OGLkzWK6s04It1dkibt2/ibi0urEyPmXKfnWb0R326v1esII3Bp2doep3NPz7fYuU99NUfg10+VVM+cJR3D1e2TofUfT9iZ2o9nU8zuqrjj3OPXP4FFyrn5tVXlH1c8cwyLee2cLc2lTi5MRbv0czYvxHzrdX8sesMHevlr7T4a+e9+Libnxc67p+bouqXtOz7U279qfsqjyqifOJdL3vxWQ7NVxbm4sTcUzWC/Nb0dt6/naBqlvPwbnFVPdXRP4Nynzpl4s1/FTNfxSNntq6/g7j0mjPwq/hdtzPzrdXpP6/Nrd7U3QiLtOVvnZWFPvuZu6np9qn8OPGb1uI8/OqmPHxjzdzZu583bOr05uNM1Wqvm37Mz3XKf1+ktjNv6vg67pVrUcC7Fyzcjw86Z86ZjymFYtNJ3CZiLRqXy6ilzFLZb2rOiVelZOTvvaWJzp12qa9Tw7VP8AS9U+N2iI+hPnH0Z7/Dw1tiO56OOYvG4YrxNZ1KnsuYpVcK6YaK1cpktxNNUVUzMTE8xMeMNv/Zg63Va7FjZe78r/AI1ppijAzbk/01EfQqn98j1+l9fjqLTSvY9dyzeovWbldu5bqiqiuieKqaonmJifKVsnHjLXUlMs0ncPqCIM9mjrLTvHDo2xuTIpo3Dj0ftN6rujOoiPH+6RHjHn4x58Tm8TLitit02elS8XjcADmsAAAAAAAAAAAAAAAAAAAAOHIDjhyAAAAAAAAAAAAAAAAAAAAAAAAAOOByAAAAAAAAAAAAAOOI9HIDhyAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMG67z2el2rXPxPdVf8A3aWr3yzu8W1vWLFnL6X7htU0zVVThV3KYj1o+dH5mmfyn4rVlEve+WfEnM+LwJyp9XE5U+qdo096cz4rdeXzHHLw5yp9VM5M+ps03U6R6rTrHTzSMuK4qrixFq5xPhVT82Y/Iytrd7LW9bWHqeTtPUL0UW8yr32HNU93vOPnUfbHfH1NkJmIiZmYiI8ZlRYqqimmaqpiIiOZmZ8GpPtOdcP2Y+UbL2dlz+x0TNvUM63V/TE+dqifxPWfpeHhzzR7TfXKvV7+TszZmZNOm0TNvPz7VXfkT4TbomPoesx4/V465xPc9jhcLX6l/wC0MHI5G/bVTLieXMqZepMMUOOSZJcOc1WhxK7puDmanqOPp2n413Ky8i5FuzZt09qquqfCIhc0zAzdU1Cxp2nYt3Ky8iuLdmzap7VVdU+ERDdv2cuimJ0/wadb1ui1k7lyKPnVR86nEpnxoon19avsju8cfIy1xRufLvixzeeztezp0bwenWkU6nqdFrJ3LlW/2+9HfGNTP7lbn88+f1PP9prrZj9PtOq0DQLlrI3RlW+Yj8KnCon90rj8b8Wnz8Z7vG77SfW3D6c6dOi6LVay9z5Nvm3bn51GJRPhcuR6/i0+fjPc0W1TUM3VdRyNS1LKu5eZk3JuXr12rtVV1T4zMsOHFOWeu7Ve8UjpqtZuVlZ2bezczIu5GTfuTcu3blUzXXVM8zVM+rb/ANljrvTrNvF2NvPKinU6Ii3p2fcq/pqI8Ldcz+6R5T9L6/HTtVbrqt3Ka6KqqK6ZiaaqZ4mJjwmJa8mKMkalxpeaTt9Muoe0MXdel9jmmzn2Ymce/wAeH8Gr1pn8jXfVcXL0rUb2n59mqzk2auzXRV+ePWJ9WSeyz11jc1uxsveGVTTrlFPZwcy5PEZtMR+BVP77Ef40fFLPVDY2NuzTffY/YsarYpn3F6e6K4/Eq+E+vk8u1Zxz02bImLRuGvHvvi4m78XWzLWTg5l7CzLNdjIs1zRct1xxNMwtzd7hOnam78VM3XUm44958RDtTd+LJenu9cvaeq+8p7V7BvTEZNjnxj8an0qj8vgw6bjiawbhaXn6frmk28zDuW8nEyKO6eOYmJ8YmPyTEtQfae6JztXIvbu2tjVVaHer7WVjURz8jqmfGP7HM/4s/Bl/S/fmTtLUfd3prvaXfq/b7UeNM/j0/H4ebY+xd03XtGi5bmzm6fmWpjvjtUXKKo4mJj8kwnHknFbcIvSLxp8wohVEJg9o/o7ldPdYnWNIt3L+2sy5xaq8ZxK5/cq/h+LP2eMd8Q0w9zFNb16qvNvE1nUqqYXKYUxC5TDVWrlMu3pmXlafnWM7CyLmPlY9yLlm7bq4qoqieYmJbsez31dxt/6ZGlatXbsbjxaObtER2acqiP3SiPz0+X1NIqXo6DquoaJq+Lqul5VeLm4tyLlm7RPfTP8ALHlMeanJ4leRTX1+i2LNOK2/o+lAjboT1QwuoegzRf8Ad4+uYlMRmY8TxFUeVyj+DP5J7vRJL5nJjtjtNbeYevW0XjcACiwAAAAAAAAAAAALNrJx7t2q1av2q7lH4VNNcTNP1x5LwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA4mYiOZmIiPOSmYqjmmYmPhIOQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAWczHt5eJexbsc271uq3XHwmOJ/O0K3Jp9/Q9ez9IyYmm7h5Fdmrnx7p7p+2OJ+1v21l9rLZF7F1O3vbT7VVWNkRTaz4pj+h3IjimufhMcRPxiPVMIlBs3Pi4m58XV7cnb+KUOxNfxce87/ABdabnxZr0m6f6lvrU7lfvPkOiYfzs/ULndRbpiOZppme6auPsiO+fiHr9Funmo751uMj3t3C0jDuRVk5dE9mrnx7Fufxvj5ePo9f2leuMX7V/YOx8yqcK3T8n1HUqbk1VXuI4m1bq8Zjyqr8/CO7mZx/rX1mwLGj/zuultU4WgY9M2crULU8V5X40UT49me/mvxq8u7xgaiY4ejxeLqeu7Lnzbjpqu09yrlaipV2nrxZhmFfKmXHLmFto0L2n4eXqGdYwcHHu5OVkVxbs2rdPaqrqnwiIVafh5WoZtnBwce7k5V+uLdq1apmqquqfCIiG6vs4dFMfYmJRr+v27WRuS/R3R+FThUz40Uz51T51fZHxzcnkVw13Pl1xYpyTqHZ9nPozh9PtNp1nWLdrJ3Nk2+Llf4VOJTPjbon1/Gq8/CO7xu+0d1lwemmi/INOm1l7lzLc/JseZ5psU+Hvbnw9I85+HKv2h+tGl9MtI+RYnus3cmVbmcXFme61Hh7256U+keMtDdw61qe4dZytZ1nMuZmdlVzcvXrk99U/yRHhEeUPIx0tmt13brWjHHTVY1fUc/WNVydU1TKu5eblXJu371yeaq6p85dblxMuOXowzSqmTlTy5hZXS9Yu3bF6i9ZuV27luqK6K6KpiqmqJ5iYmPCYnzbp+zF15o3dTZ2hu+/Ra3BRT2cXKnupz4iPCfKLsen0vGO/uaUUU1XK6aKKZqrqmIpppjmZmfCIhub7LfQenbdrG3nvLEirXKoi5g4VyO7CifCuqP32f836/DNyop0e7+zth6urskzrB0/o3PhzqmmUU29YsUd3lGRTH0Z+PpP2Ncb/vLF6uxeoqt3bdU010VRxNMx4xMN0kX9Y+mdvclqvWdEoos6xRTzXR4U5MR5T6Vek+fhLyolsa8Tc+Lj3jr5VF/FybmNlWblm/aqmi5brjiqmY8YmFv3q6Hc958VM3Pi6vvXE3filDte8Z50o6i5G0s35HmzXf0e9Xzctx31WZn6dP8sef1o3m78T3vxRI3TzcXRd17buYuTbx9S0nULHFVM/OouUT/AO/riY9WjvXjpRn9N9eiqz7zK0HLrn5HlTHM0+fuq/4UevnHf6xEp9JOpmRtDI+QZ8V5Oj3aua6I76rEz41Ufyx5/X47Aa1p22+oezLuDkTZ1DStQtfNronvifKqmfo1RP3S7cbkTgt+FMuKMkfl84oV0ss6ubA1fp1uq5pGo0zdxrnNeFlxTxRkW+fH4VR4THl9UwxCmX0eO8XiLR4eTaJidSvwrplZplcpnvd4lzlkOzdyattTX8bW9GyZx8vHq5ieOaa6Z8aao86Z84bwdIOouk9Q9uxm4k02NQsRFObhzVzVZr9Y9aZ8p+zxhoJTUyHYO7dX2XuXH13Rr3YvWp7Ny3V+BeonxoqjzifyT3snN4leRXcfNDvx884p1Ph9ERi/TPe2k772zZ1nS6+zV+BkY9U/PsXPOmf5J84ZQ+YtWaTNbeXsRMWjcACqQAHCBusO6tyajuzL0va2ZnWMfR8aq7l1Yt2aeZ7u1MzHp4fel/fGuWdubWztXvTH7Rbn3cfjVz3Ux98sN6F7f93tTK1nU7fbytcqquXe14zanmIj7eZkGVdNtwUbm2Zp+qxVzdqt+7vxzzMXKe6rn6/H7WRTMRHMoX6O5Fe0upGv7By7kxZu3JyMHtT48Rz3fXRMT/gyzzrDdrs9NtbuW66qKox+6qmeJjvjzBlc10RT2pqpin1me4pqprpiqmqKonwmJ5QrsLamqb32lgZOsa1m4Ol2bfusXGxa+JuceNyqZ9Z5ep1J1rI6e7T0fau3L165nZVU2rN27MVXIp7XfP1zNXHIJUuXrNuqKbl2iiZ8IqqiFfMTHMTyizS+kVnKw6cnceu6plalcjtXKrd7imiqfKOeZnj1ZTsPa2ftivMsXdfytSwK5j5NZv0x2rXrzV5/mBgfRjsT1d33XERHN7vnj+ySmKjIsV3Jt0XrdVceNMVxMx9jXTZek6zr3VHdem6fqVzTsO7kVVZ1+1/ROxFc8U0z5TMsn3t0vtbf29la9oGuapby8G3N+Yu3ue3FPfPfHExIJd1vFvZ2kZeHj5deJevWaqKL9HjbmY7qoYv0q2lqO0dMzLOqa3VqVeRdi5HfV2LcRHHd2pmeZ8Z+qHHTXcGRufplZ1TLntZE2blu5VH0pp5jli/QvFjWthbg07KyL/YyMy5ZmuK+a6Im1RHzZnnjgHv399Zdvq3RsyMLG+SVWYuTkzcntxzTM8ceDO6LlFczFNVNUx48Ty1yv7I0+11ssbVnP1K5j140V1ZFV79umexM+PCW9G29pHTvSdX1ijO1DJs02Pe3Yyb3b4iiJninu7ueQZlcuW7VPauV00U+tU8Q4tXbV2ntWrlFyPWmqJhCmz9C1XqjRd3LubV8vG0y5cqpxcLGudmOI/NEeHrKneW2tR6Y27W6Nq6vlXMC3dppysPIr7UTEzx9seQJxW71+zZiJvXrduJ8O3VEfnYTv/flvQtgY2v4VumvI1CiiMSirwiqqntcz8Ihje3umV3cmm2tZ3jrWpX8zLpi7Fm3d7NNuJ74jz7+PQEuUVU10xVRVFVM+ExPMMI3NvfK0rqPo21rWFj3MfUKIqryKrkxVRzNUcRHh5GzNh39sapl/Jtw52RpF+xNFOHfntTRXP0oq+r86Jd57IwNJ6n6Dt6zqOpXLObRTNd25d5u0c1THzZ47vAGyVNVM+ExP1SwnaG0NY0feer61m7hv5uLmVVe6xqqqp4iauY7XM8R2Y7o48lew+n+FtHVMnPxtX1TOqv2otTTl3YrimO1zzHd4sI6HZORe6ob1t3si9cpovV9mmu5MxT+3VeET4JE1cxzxzHPotzfsRc93N632/xe1HP3IF3FG4M7r1n6RoeoXMS7lWaaK7vamYs2uzE1VRHrx+dlmodG9NnCruYuuavGoRTNVN65e5iqr4x/+UCU1NdVNFM1V1RTTHjMzxCNugu49S1fRdQ0/Vb1V+/pl/3UXap5mafSZ8+OGOzVqvVbeWoYljU7+Bt7Tavdz7qe+ueZj7ZniZ7/AAgE1Wrtq7T2rdyiuPWmYlVExPhMSiTWOmuZtrT7+rbT3FqVGTj26q7ljJu9u3eoiJ7UfCeHc9m6/dyNl5ly9duXaoz645rqmqY+bT3d4JQRD7QOp6zhantzE0rVsvT4zLtdqubF2aeeaqIiZ48eOUvIY9omeNxbPn/5v/z0A7/87be0RPHUnUOfLvuf67z8/V+pPTqqjI1q9b3DocVRTVd+nTE/wvwon+25hM7pa9hY+o6LmYOVRFVm/ZqorifSYBRt3WMHcGiY+q6bd7ePkUc0z50z5xMeUxPcxfp7sjUNsa9quo5e4L+o282fm264n8bntVczPNXl3MX9l7Lu3dA1rEqrmbNjMpm3Hp2qO/8AMq6DZeXkbo3fTk5d+/Tby+KIuXJqin59fdHPgkS9VMUxMzMREecqLV+zdmYt3aK5jx7NUTwhrV8vWepXUTO21gand07QtK7smuzPFV2Ynj7eZ5iPTiXtZXSu3pNic/a2uanialZp7dHvb3bt3Zj6NUekoEnRMT4TywnQ9navgdRNQ3JkbivZOHk9vsYk9ru7XHFM8z2eKeO7iGK+zZkZeT/NLczL125djLoiqK65qimeKuYjnwhc2LlZFftA7wxq8m/XZpsxNFqq5M0Uzxb8KeeI+wHv9RN8522t1aFpGLh4t+1qNyKbtd2qYm3HbinmOPr82dxdtzV2YuUTVPlFUctceqWzMLQN47fxLepajlfspkzFyq9ciarcTcpj5s8d34U/clvaXTnS9t63RquJqWq5F2miqiKMi/26OKvGeOPFIzSuuiintV1U0x6zPDi3dtXefd3KK+Pxaolge5end7cO4sjN1Lc2o06bXxNvDs1dmKJ44nv8OPsYnvbZl/Y+lVbl2rr2dR8lrpm9Zu3e3ExM8c/fPhKBJvUKOdja1H/yV39GWH+zRNU9MbU1TMz8svd8z8Ye5f1b+aDpJf1aaIonK02uqqmPCKuzMT+WJeR7OERHTKxx55V79IEkoY63anuC3vzQNF0fXszTKM+im3VNm5MRFVVzs9qYjx8UzoJ6959nSup+1dTyKLly1ixRdrotxzVVFN3niI9e4Hr/AM7PqBNXf1T1Lj4U1/6739kbK3Vom4LeoatvnO1nFotV0Ti3e1FM1TxxV31THd3/AHvL/n37d54jRdfn/usfrZbsLeeBvGxl3sHDzcaMWumiuMm3FMzzHPMd4MmiqmZmIqiZjy5ELdLL16vrzvO3Xeu126YuzTTVXMxT+2x4R5Je1qZp0jMqieJixXP+bIO1FdM0zVFUTEefLDNN3vdyupWftK5gWbdnFt9unKi/zNfzaZ47PHEfhevkxfohp1rcPSrU9Nzr+R2MrMu27lyi5+2RHFPhM8sQ07ZmnZfV7VNp/LM+3jWLXat3qbv7b+BTPfPHf4g2KprpqiZpqiYjxmJc01U1fgzE/VLCtF2nj7N2fruPiajnZnv7N292smvtVUTFuY4ifTueD7NF67f2Tm13rty7VGfVHNdU1T/Q6PUEp1VU0xzVMRHxlxFVM09qKomn157mAe0HXXR0v1Cq3XXRVFy1xVTVMTHz484XMCuY6D0XJqq5/YKau1z38+78eQZ3NVMUzVNUREefJRXTXT2qKoqj1ieUB9LduazvjaNm1ma5mafouJVVbt0Y9X7ZkXOeaqqqp8o54ZRv7Uqul/TzC0TRMi9fzsq7VZxrt6YqrjmeaqvjPfER9YJRu37FqqKbl63RM+EVVRHK5ExMcxPMIo0vpBiZmBbydza7quXql2ntXaqMnim3VPlHrx6upsvO1bY/U6nYup6ld1HTM+3NzAu3Z5roniZiPyTAJiqqimOapiI9ZU0Xbdc8UXKavqmJQzvjMzdy9XadnZmtV6RpVq1FXFFzsVXp7PPjPjM8931Pdv8ASfHxaPf6BuLVcLMp4miuu926Z7/MEmC3j0VW7Fu3Xcqu1U0xE11eNUxHjPC4AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAsZ2JjZ2Hew8yxbyMe9RNF21cp7VNdM+MTC+A1w3/wCzfXczrubs7VbGPjVc1fI82auLc+lNcc931+Hqj7L6Hb2xI95mZe38WxHfVfvalTTREeszx4Nzq6aa6KqK6YqpqjiqmY5iY9GuPWP2W9C3Dfv6tszKt6Jm1/OnDuUdrFrq/g8d9vn4cx8IdMcVmdWnSttx4hFdWm9K9oX6r+798W9zZFmvj9idt0zci5Pj87ImYpiPXiYn0liXVHrJre78CjbukYdnbO1LEdm1pODVxTXET43a4iO3PPfxxEfCZ73j716RdRtoV1/sxtjNqsUeGTi0TftTHrzRzx9sQwfniubc91ceNPnH2PRxYcde8d2XJe09pX6alymv4utEyqitq6nDTtxU5ip1fedn8KYp+ueHs7c27uHcWVGLoWh6jqV6fo4+PVVH3+Efev16V6XTiXoaDpOp67q1jStHwb+bm5FXZt2bNPaqn4/CPWZ7oTj079lzdOrRby92Z1rQsaeJnHt8XciY+P0afytlNj7C2N0u0XIydNxcfBoot9rL1DKribk0x4zVXPhHwjiGfLzqU7V7y6U41ree0MV9nvorgdPsKjWNYps5m5b1Hz7kd9GLE+NFv4+tXn4R3eN/2hutOldMtHqw8T3WfuTJtzOLh891qP3y7x4Ux5R4z+VHHWb2p8DDov6P05t05uT30VapfomLNv426Z765+M8R9bUvWtTzdY1LI1PVc+5m5uTXNd6/er7VddXxn+RijHfLbryNPVWkdNHOv6zqm4dcyta1rMuZmfl3JuXr1ye+qf5IjwiPKHUipa7VP41P3k1R6w1w4yrmpx2nNFnIuzxax79yZ8IotVVc/dDKNvdNOoWv3LdOlbM1q/Tc47NyrGm3b7/ADmqriIWm0R5R0zLGIl2tLwM7VdQsadpuHfzMy/VFFqxZomuuufSIhsBsf2Td46jVF3dOq4WiWYmObViflF2qPrjimPytmulfSXZnTmxM6Dp/bzq6ezdzsie3fr+HP0Y+EON+VSvjuvXDafKNPZu9nvH2jVj7q3nbtZWvxxXjYndVawp9Z8qrnx8KfLme9sSDzr5LXnctVaxWNQAKLMA6p9MtK3nZnLszTg6xRTxRk00/NuceFNyPOPj4x+RrPu3bet7V1CrC1vCuWKufmXPG3cj1pq8J/O3XdLWdK03WcGvB1TCsZmPXHzrd2iKo/8AwmJRpo3N2FFV6PVsBvX2f8TJruZW1dTnCrq74xcmO1a+yqO+Pyoo3D0t35otVyb+g38qzR43sSYu0z9kfO/InaNMU97Hq5978XWzbOXhVzRmYuRjTzxxetVUfnhYi/TPhXT96R6HvefNlPT/AH/ruzM73mnXou4lc83sS7P7Xc+P8GfjH5WERd+MfeuU3I9Y+9EjaW5qnT/rftSvb+qR8mzZjt0WLlUU5GPc47rlqrwq+zxjumGp/VnpjuTpxq84+q2vlGnXa5jE1C1TPur0eUT+JX60z9nMd71LN3sV010XOxXTPNNUVcTE+sSzvS+qmuWdJuaPrvyLcmlXaezcxdTp95Mx8K/H7+eGnjcq2CdfRyzYa5P6te4qV01fFI+s7a6fa3kXL+ia1kbUyKuZjC1CirJxefSm7T86mP7aJeZqfSje2Jhzn4GFj69gxxzk6PfjJpjn1pj58f4r28XMxX8S86/HvX6MOpq+K5RV3qrulavYmYv6VqFuY8e3i3I4/IsxFymeKrddM/GmYbIvtwmrPOlG/wDVdg7io1PAn3uPXxRlY1U8U3qPT4THlPk3f2JuzR957dsa5ot/3li53V0Vd1dmuPGiqPKY/wDy+ddE1ek/czzox1H1Hp5uenMtzXf0zImKM/E57rlP41PpXT5T5+DDzuHGeOqvzf7aONnnFPTbw32HQ29q+n6/ouJrGlZFORhZduLlm5T5xP5p8ph33zkxMTqXrxOwBAhPr3m5u5d06P070W5T8ou1fKMiZ57NE8T2e1x5RHaqn64dvG2n1psY9vHs720e1ZtURRRRFjwiI4iPwGZbd2HgaRvTUt2V52Xm6hnxMTN/s8WomY7qeIjjuiI+qGXg1w6gbe6gbZz8Dfeva3p+pXsK/atxXj25pqiOZmO182I7PjH2pP6oanj6v0W1DVMOrtWMrDou0fCJmO77PBlu6dFxNxbezdFzu1GPl2pt1TRx2qfOKo584mIl4Gn7Bw8Xp/f2ZXqWdfwrsVRTdr7PvLcTMTxHdxxz8PMFPRH+pZoX9wn9Opg/tG2r+n7j2vuWbVVzExbvu7nEeExXTVH3xE/clfaWiY+3NvYmi4t27es4tM00V3eO1MTMz38d3m7GtaXgazpt7TtTxreTi3o4rt1x3fX8J+IK9Kz8TU9Ps52DfovY96iK6K6Z5iYlXYzMS/kXsexk2bt6xMReooriarcz3x2o8kYXOjdnGuV06LurWNOxq577NFyZiPumGVdP9i6Vs63kV4l3IycvJ49/kXq5mqvjwjjwgGC9DuzPUvfUx5ZER/n1JE6m93TzcE//AE6/+hLp7J2NhbX13WdXx87KyLuq3PeXabsUxTRPMzxTxHx83v7g023rGh52lXbldq3mWK7NVdHHNMVRxzHII59nrmOi9HPrfUezNVztjWfhqlX+joZrsjaeJtbacbexcm/fsx2/2y7ERV87x8O5b6ebOxNmadl4WHmZOVTk5M5FVV+KYmJmmI4jsxHd3AjzV7tGP7T+JVerpt014lMUzVPETzbmI/KkbqZpmTrWwNa0zD5nIv4lUW4jxmY74j7eOHQ6idO9G3ldsZeTdyMPOsU9ijJx5jtdnnniYnx71/p/sq1tL5ZXGsajqV3K7EVVZVzmKYp544jy8QQt0V6fbQ3dod6NQ1HWLGrY12qm/j2szsRFPlVFPH1xPxhnWf0U2JiYtV7O1fWrNiJiJqu6hEUxMzxHjTw9rdXSrRNX1ivWdPy8zRtQrntXLuHV2Yrn1mPX6nTxukWFfybd3cG4NX1q3RPMWb96Yo5+PeDxeu+2Z0/plouPpleRfxNHu00TVdq7dfu5p7MVVTHpPEc/FJexNXxNb2pp+biXaa4mxRTcpie+3XERFVMx5TEw9S5hYtzAnAuY9uvFm37qbVUc0zRxxxx6cI6zOj2lU5dy/o2uavpNNyeZtWLvNMfV58fXMgkanLxasyrCpybM5NNEV1WYrjtxTPdzMePHxQz1TuU2OvW0rt6qKLfZtx2qp4j8Of1s52T060jbGp16tTlZmfqNdM0TkZFzmYifGOP18r3UbYWkb2xbNOfVdx8nH59zkWZjtU8+Xf4wDLYQb0Innq3vun0vV/6apnfT3YFW09QvZ1zceqapXcs+5ijJr5opjmJ5iPXuV7K2Bi7Y3Xre4LOpZGTc1auqqu1copim3zXNfdMd8+PHeDD9ImP99DqEemnzP+bSmO5+BV9UsTxNjYeP1HyN7RnZVWTfszZmxMU+7iOIju7ufJlsxzEwCH/Zyjt1bqifGc7j9J5/QTUcfb26tybU1a7TjZtzL7Vn3k9mLk08xNMTPnxMTHr3pF6f7Kxdn3NTrxs7Jyv2QvRdr99TTHYnv7o4+t4279o7I3zreTbrzYsazhzFq/Vj3IpuRPETHaifHunxBkm/9a0/Rdq6hk5uRbtxVYrot0zV86uqqJiIiPPvlg/swTM7HzufH9ka/wBGl1da6fbQ2Xo2Xrur6hmalds2aoxrebe5ibkxMUxTT5zy9X2bdPycLp7N7Iomn5Xl3L1vmPGniKYn8kgk5CftJTMbg2hMf9Kn9O2mxhnUrYGDvecGcvUMvDnDmuaJsdnme1x6/UDMuYjxmGA9W996Xt/b+Xg4+Vbv6tk2qrVmxaq7VVE1Rx2quPDjn7ZeJHRLC+nu3cVUT4xN+O9kG0ulu1Nu5VGbbxbmdmUzzTfy6u3NM+sR4c/EHW6B7Yydt7IirPtzbzc+78pu0VeNFPERTTPx4jn7WPez7/yo3n6/Lf8AzVJjYtsnZWFtXUtWzsXMyb9ep3fe3Iu9niieZniniPDv8wRz0vyrO2OsO59G1W5Tj1592aseu5PEVT25rpjmfWmvu+pL+4dX0/RNJv6jqWTRYx7VEzM1T4z6R6zPoxTe+29lby1ydKz8qi3reNZpq4s3IpvRRPhzE91UfmeNd6bbT21j3NZ1zVM3NxsOia7drMvR7uKo8O7zn0gHn+zHejJsbnyYjiLudTXEekTFUuen88+0TvH+4/7NV7LuPf8A2B1vUblqbdrLz+bXdxzER5fezXQtkYmk781bdtvPybt/UqJorsV00+7o76fCYjn6Pn6gj32hblNjfOz8m5MU27d6Kqqp8IiLtMym2mqKqYmmYmJ74mPOGOb+2ZpG89Mow9TpuUV2qu1ZvWpiK7cz4+PjHweRsbpvY2xq9GoxruqZ02rVVq1avXP2uiKuOe77IBgOhYuX1Q39rNjcGtZ2NgafMxZwMW97uOO1NP5OO+fHvOrnTzZ+1NnX9QxsvU6c6qqmjGtXM2aqblXajnmnziI5lnO5umGnajrtzXdK1LN0XULszVdrxqu6uZ8Z48pnzde/0l07O07Mt6vrOp6jn5Fr3dGZfr7U2I5ifmUz3RM8JHGzZ59n2zM/1su/+Zz7N/8AUwx/+1Xv0mU6RtfG07ZFG1aMm/cx6carH99VEduYq57/AE571WxNs4m0dvW9Fwsi/fs0XK64rvcdqZqnmfCIhA95CHWj+rHsyPKblr/TJvYjuzYun7i3RpOv5OZl2b+mVU1W6LfZ7NfZr7XzuY58fQGW9mmPox9xERHhEQ5AQp04u2cDr7uvHy66bN3K95FmmueJrnt01REfZ3pO37q2Hou0dSzsy7Tbopx66aYme+qqYmIiPWeXh9QOmuj7tzqNTqyMnT9Sopin5TjzHNUR4cx6x6vN07pHge897rmvatrVVFMxZpyb3NFEzH4XZ85gHU9mCubnT/KqmOJ/ZG73f4NLy9CuUW/ae1mi5VFPbx+KeZ45n3VueI/KkLprs7F2Rt+vR8TNyc2ivIrvzcvxTFXNXHd82IjjueXv7plpO6dWt6zRm5emanRTFM5GNPfVEeHMeseoMt3BbqvaBqNqimaq68W7TTEeczRKMPZfybM7U1HBm5TGTbzZuVW+fnRTNuiInj05iY+xnew9r1bXwMixc1nP1W5fuRcru5dfMxxHHEekMU17pBp2Vrl3V9F1nP0S9dmaq6cafm8z48ekfAFHtKarh4nT+vTbl2n5VmXqItW+e+YpnmZ+p3ceZj2eonz/AJn5n/7Tq3ejmj5Wk5NjUdW1PO1DIiI+X364ruW4ieeKYnuhmNG28enY0bUqyL04/wAh+RTd4iK+z2ezz6cgxD2aY/8AhXiT65N79J4HtU6Zfv6Ro2p027lePjXrlu9NH0e3FMxPPl+DMc/UkzYW18TaG3beiYWRfyLNuuquK73Ha+dPPlEQ9bU8HE1LAvYOdj0ZGNepmm5brjmKoBD+2ujuxdb0bG1TA1zX79i/biqJpzojifOJiKe6YnumHt7d6WbI0Td+HlYuq6le1fDj5RbsX8+K6uz4czTxzx3upkdGMbHybleg7m1bSrNc8zZt1zMffEw9/YXTXSdq6lXq05eZqWqV0zROTkXJ5imfGIj9YO3vTZO0t5ZPu9Tt0TqFiiI97YuxTeopnwiY7+Y+uEcbv2prfTPSp1/b+8c+rFtXaaZw8ieaZ5nujjnsz9XZhnO6OmWmatrV3W8HUtR0jUb083b2NdniueOO+Jefj9JcfKyrV7ce49W1q3aq5ps3rs9j84M62rqVesba07VLluLdeVjUXaqI8ImY5l6a3j2bWPYt2LFum3at0xTRRTHEUxHdEQuAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA44Y7uHYmzNw0TTrW1tHzu1PM1XcSiav8bjn8rIxMTMeDW0XZvs/dIsqqJnZuLZ/uN25R+apbs+zx0ftVxXOz7FyY8q8i7Mfd2kqi3qX+6vTX7MK0fpP010iqKsDZGh26onmKqsSm5MfbVzLMMbHsY1mmzjWbdm3THFNFumKYj7IXRWbTPlMRECi9at3rVVq9bouW6o4qprpiYmPjEqxCXT/YrTP63Yf+Qp/U4/YrS/624f8AkKf1O6J2On+xWmf1uw/8hT+px+xWmf1uw/8AIU/qd0NixZxMWz/Qcazb/tLcR+Ze4ciAAAAAAAAAABYysTFyqezk41m/HpctxV+d42dsraGdV2srbOk3avWcWjn8kMgAYn/O22D2pq/mS0jmf/l4V09O9i0+G09H/itP6mUgMZp2Bsmmeadq6RH/AHWn9TsWtm7Stf0PbWkU/wDdKP1PeAeVa23t61PNvQtNon4YtEfyO/jY2PjUdjGsWrNH4tuiKY/IvAKKrduqJiqimqJ9Y5WpwsKfHEx5/wD64dgNjrfIMH/oeP8A5Kn9R8gwfD5Fjf5Kn9TsidyaUWrduzbi3at026I8KaY4iPsVggAAAAAAAAAAAAAAAAAAAAAAAAAAEc7x6Qbc3Bqt7V7GTm6Xn3qpru3Mav5tdU+NU0z5/VMJGARRpfRDRKMy3kazrOp6vFueabd2vs0/VPfM8fVMJSxrFnFx7ePj2qbVm3TFNFFMcRTEeEQugAAAAAAMF3r0u25ufUa9Tu15mDqFfHbv413iapiOImYnmPD04eBY6I6Zcv01aruPV9RtUTzTbrqiO705nn8nCWQHU0jTsLSdOs6fp2PRj41mns0W6Y7o/wDy7YAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA//9k=" style="max-width:100%;height:auto;">' 
-LOGO_ICON_HTML = f'<img src="data:image/png;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/4gHYSUNDX1BST0ZJTEUAAQEAAAHIAAAAAAQwAABtbnRyUkdCIFhZWiAH4AABAAEAAAAAAABhY3NwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQAA9tYAAQAAAADTLQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAlkZXNjAAAA8AAAACRyWFlaAAABFAAAABRnWFlaAAABKAAAABRiWFlaAAABPAAAABR3dHB0AAABUAAAABRyVFJDAAABZAAAAChnVFJDAAABZAAAAChiVFJDAAABZAAAAChjcHJ0AAABjAAAADxtbHVjAAAAAAAAAAEAAAAMZW5VUwAAAAgAAAAcAHMAUgBHAEJYWVogAAAAAAAAb6IAADj1AAADkFhZWiAAAAAAAABimQAAt4UAABjaWFlaIAAAAAAAACSgAAAPhAAAts9YWVogAAAAAAAA9tYAAQAAAADTLXBhcmEAAAAAAAQAAAACZmYAAPKnAAANWQAAE9AAAApbAAAAAAAAAABtbHVjAAAAAAAAAAEAAAAMZW5VUwAAACAAAAAcAEcAbwBvAGcAbABlACAASQBuAGMALgAgADIAMAAxADb/2wBDAAUDBAQEAwUEBAQFBQUGBwwIBwcHBw8LCwkMEQ8SEhEPERETFhwXExQaFRERGCEYGh0dHx8fExciJCIeJBweHx7/2wBDAQUFBQcGBw4ICA4eFBEUHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh7/wAARCAQABgADASIAAhEBAxEB/8QAHQABAAEFAQEBAAAAAAAAAAAAAAMBAgQFBgcICf/EAE4QAQACAQIDBQQHBQMJBQcFAAABAgMEEQUhMQYSQVFhBxNx8CIygZGhsdEIQlLB4RQVIxZDYnKSorKz8TNTY3OCJDQ2RGV1w1V0g8LS/8QAGgEBAAIDAQAAAAAAAAAAAAAAAAECAwQFBv/EAC8RAQACAgECBQMDBAMBAQAAAAABAgMRBBIxBSEiQWETMlFCcbEUFSORUqHRgfD/2gAMAwEAAhEDEQA/APjIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAbjs12Y7QdpdTGDgfCdVrbb7TbHT6FZ9bT9GPtl6z2U/Z74jnmmbtLxrBoqbxM4NJHvcm3rafo1n7JTETJt4cy+G8L4lxO9qcN4fq9Zav1owYbZJj47Q+t+zXsh7B8ErS8cHrxDPWNpy6605d/Xu/VifhDvtJg0+lxVxaTT4dPSsbRXFjisRH2LdCNvjrhHsi9oXE6474uzubBiv+/qMlMe3xiZ70fc6nh37PHa/Nkr/bOKcG0uOZ5zXLfJaPsisfm+pqzM8990lZT0wjb530X7M95tW2s7YU7v71cWhnf7Jm/wDJv9L+zV2VrSI1PH+NZLx9accYqR901l7bWdklZ5nTBt4xj/Zr7ExP0uL8ftH/AJ2KP/xsin7NvYbx1/G5/wD58f8A/h7FWeqas8+RqDbxTJ+zL2Im30OM9oax5e9wz/8Aja7iH7MHArxH93dqeI4fP+0YKZP+HuvoCvXkvqag2+YeIfsvcQpitbQdr9Lmv+7TNorY4+2YtP5OR41+z37R+H44vptJw/inPaa6PVxvHrMXir7OrzS1g6YNy/O3tF2R7UdnrXjjfAOI6GtLd2cmXBaMe/pf6s/ZLSP0ty0rlpNclK5Kz1i9YtH3S4Tth7IPZ92o95k13Z/BpdVfvT/atF/gZO9P7093laf9aJV6U7fBo997ffs0cf4dGTVdkeIY+M4I5xpc22LURHlE/VtP+y8P4zwrifBdffQcW0Gp0Oqp9bFnxzS3x2nrHqiY0lhAIAAAAAAAAAAAAAGz4dwPiGuttjwXiPHeJ3j7PD7doXx475J1SNyra0Vjcy1g7nh/YisbX1moiYjf6MR1+6eU/bLc6Ls9w7S7TXF3piNt+m/x26/a6mLwXkX+7UNO/iGKvbzeZY9NqMlYtjwZLVmdotFZ2+9lYuEcQyTHc08238azFvy3epY9Lp8U/wCHp8VPWKRuuiu3Rv08BpH3XlrW8Tn2q83r2Z4lMb92n3W/RX/Jfif8FZ+D0W0LZhmjwTj/ACx/3DL8PPf8l+J+OOfu/qT2X4j/AAx8/a9A2D+y8b5/2f3DL8PP/wDJbin/AHX3bfqf5LcU/wC6n7Nv1egro2T/AGXj/P8As/uOX4eeR2W4pP8Amp/D9VuTszxPHWbXrSKxG8zv0h13HuP6bhuOaUmMmaY5R1iP1/L8nB8V4nquJai2XUZLTEzyrv08nL5uDhcf013Nv3bnHyZ8vnOohi5qRjyWpF63iP3q9JWA4zfBfhxZM1+5ipNp/Jv+G9ldZqIi+efdVnn5f1/Bnw8bLnnVK7Y8mWmON2lzq/Hhy5Im2PFe0RymYrvEPQtF2W4dgr/iROW20b/rv1j7NmxxaLTYp3x4McT/ABTG8/fPN1cXgmSfO9tf9tK/iNI+2NvN8HCtdmmIpgmYnxjnt927Lr2b4lP7ldvhP6PQtto2jl8Fsw26+C4Y7zMsM+IXntDgP8m+Ix1pH2c1P8ndfHWv5fq7u0LLQmfCOP8AKP6/J8OHns9ro61n7v6rJ4DrY/cn7o/V3FoQWhSfCcHytHOyOMngesj92fu/qTwTWfwT+H6uvt1UspPheD5T/W5HI/3Lq/GPy/VT+5dZ/BP4fq6q0+DH4hrMejwze8x3vCPn5/FS/h3HpG5mdL15WW06iHNanhebTUm2a1axEbteyNdq8urzTfJM7b8o3Y7iZZp1ejs6FerXqAGNYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAGdwzhmbW/4ls2DSaaN+9qNRfu0jl0jrNp9KxMux4DxfsL2ZyRfR8AzdruKRP0M2u3xaSs8+dcMb2v/wCqfDpCdDWdh/Z72n7X5Ytw3Qzi0f7+s1H0MVY9Jn63wjd7z2J9hnZfg001HGbW47q6zvNbx3NPE+lOtv8A1TMPMuJe2P2k8RmcOC+k4bjiIiuLT6euGKR4RG8ud4n2i9o/FL/+28Y4rkifGmWaxH+wtGlZfX2nx6fSaemm0+PDpsFIiK4qRFK1iPRJTJj6Rlxz8Lw+KsmXthaZ73EeKX85/tV5/mtrHaysz3dfra+v9u2//snq+DT7bpato+helv8AVtEpq7xEbw+GK8S7VYZmlOJcXjbrFNRkmPwlteG+0vt5wvbHg7R62IrPOuXa/wB/eiZOs0+1qz4+C6s9Hy9wL9oXtLpr7cX4Vw/iGP8A8OJw2jz5xvu9S7I+2/sRxqaYdXqc3B9Tadu7q6/Q/wBuOUfanqiTT1Ss80tbc2HpNRh1WnrqdLmxajBeN65MV4vWfthl1lKEtbeSek82PSd+jIogS19ElUdOvxTUBWvglpHJZX70lIAiN45JIjnutiF8deQER+LTdq+zHAe1XDbcN7QcL0/ENNbfaMlfpUnbbvVt1rPXnE7t1WI35KxHNI+Sva5+zlxLg9M/F+xObJxTRUib30GT/wB5xR/oT0yR15crdPrS8Ay0viyWxZaWpekzW1bRtNZjrEx5v032nfk8n9tHsZ4D2+wZdfpYx8L7QREdzV0r9HNtHKuWsdfLvdY5dYjaaTX8Jiz4eG97cdkuPdjOO5eDdoNDfTaikz3L9ceavhelv3qz/wBdp5NEosAAAAAAAvxY75ckY8dZtaekERsWNnwfgmu4neIxY5rSf3pdB2b7JTfu6niHKsxvFNuf4/nP2RPV22lw4sNIx4qRWvp4+s+bu8Hwa2X15vKPx7ubyefFPTTzlo+C9ldDooi+WPeZPPf+f6bfa6DHirSkUx0rSkdK1jaI+xLWN/Bf3Xp8PHx4a9NI04+TNbJO7Sgmi2asiarbVZdMe2PavNFMMq1fRDavorMLRKG0LLQntCK0K6WRbcxWVL2itZta21Y5zM+CqVZtFYmZmIiOsz4OV7T9o4x1tpdFbe08rWifD5+duuP2s4/N7TotFeYpE/TtHWfn59OTnnO8vP8AiXiut4sP/wBn/wAdXicP9d12S98l5vktNrT1mVoyeHaHUa/URh0+ObWmdunR56tbXtqPOZdOZisblj0ra9orSs2tPKIiN5l03Auyep1cVzav/Cxddp8efp1/L18HTdn+zGl0FIyZq+9yzEb7xy+fTp8eroortHTw5PScLwSI1fP/AK/9cnkeI/px/wC2r4bwjRcPxxGDFE2iPr26/wBPsZU1ZNqorVd+uOtI1WNQ5k3m07lDNUdo8WRaENoRMEIphSy+Y8FtoUlaENoRWhNZFfdSy0LLQx7Mm3ix7sUrwjsssuuw+Ja3Ho8M3taO94R8/P4ywZLxSOq3ZlpWbTqFvEtXj0eC17TEz+7XzcjrdVl1WacmS0z5Rua3U5NVmnJkmevKN+iB5rmcyc86j7XWwYIxxv3AGk2AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABmcP4bq9deK4MVp35xO3h8+PRsuznAsmutGfPHdwxzjePx28fh9s8uvb6XT4tNijFhr3ax1nxn1mWSuPfnKlrac3oeyuOm1tVkiZ5cus/d0j/ebnBwzQ4q92uCto332tzjf4dI+5n7eCmzNFYhSZmUVcWOs/Rx0j4VhftCuxslChtWesRJsuiAW2xYr/Xx47fGsSiycO0WfHFMmGO5E792OUb/Dp+CdWPAIlpdd2Q0Wo3vpr+6tO87Ry5/lt8Ihz/EuyvEdJWb4+7npHjHKenP0/Hd31ZZFJjx2lSccStFpeddlu1nabshrvecH4lqtFatt74Zme5bp9ak8vt6vevZx+0Fw7X3xaDthp68Pz22r/bcMb4bT52r1r+MecuA4pwHh3FMXdy4opfaYrev7suG7SdlNfwm1suOs59PznvV5zWPX9fTwY5rNV4mJfdnD9Xpddo8Wt0Gpw6rS5qxbHmw371bRPOJiWbj9Hwx7NfaV2m7CayLcM1U5tBa2+bQ5pmcV48dv4Z684+3d9a+yz2j9nu3ugjJw3NGDiGOu+o0OW3+JT1j+KvrH9CLbNO6p6JKI8fololC+qWiKkJqQkXL46rIX16iFYXR138FI6ro+t+AKrducr/FTxShy/tH7D8B7d8AycH47p4vHXBqKREZdPfwtS38p5S+Gfal2B457Pe0d+E8Xx9/Dfe2k1dKzGPU4/OPKY5b16xPnExM/odaOsOe9oPY/gvbfs3qOA8c0/vMGT6WLLXlk0+TwyUnwmPumN4nlKtq7TE6fnKOr9qPYPjfs+7TZODcXx9/Hbe+l1VK7Y9Tj/ijynzr1ifTaZ5RiZAAAGVw7RZtdqIw4az15z4QtWs2npr3RMxEblbodHm1maMeGkzzjedujvuAcE0+gx1m8RfJ1nfz8585/CPxm7hHD8HDtPGPHEd+Y+lb1+fnpDY0t5PUeH+HVweu/nb+HH5PKnJ6a9mZjnwT45YmOyfFbnDt1lzbQyqTzTV5sXHZkUtDLEqTCTbdbaq+J3JWVY96ob1Zl49GPePRWYWiUF4RXhk3hDmmtKWva0VrWN5mZ2iIUmFoY2Sa1rNrTFa1jeZnwhxnaztDOS9tHobzWlZ+laOu/6/l8ele1vaC1720ejtNYrP0reMT+v5fHpyTzPifim94sU/vLs8Ph69dwGx4HwnUcU1MY8dZjHE/Sv4R8/Pg4OPHbJaK1jcy6NrRWNycC4TqeK6mKYqT7uJ+lbp+Pzt90T6dwXhOm4bp4x4aR3pj6Vtvy9Px813COH4NBpq4cNYjltMxHzy+estjSHs/DvDqcWu587f8A7s4HL5c5p1HZWK8l01ViN/RfEejqNFBaqO1fRk2hHevoTBEse0ILxzZd4QXiWOYXiWPaFloTWhHaFJXhBeEV094Q3Y7Lwjsx7sm/RquL6/FosMzNo723lvt9nm18l60rNrdmWlZtOoRcW12PR4pneO9+Xl9vo4/WanJqss3vM7b8omd9v6mt1WTVZpyZJnbflG/T+qB5bmcyeRbUfa7ODBGKPkAaLYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAG07N8LvxPX1x7bY6z9Kfn58PFrIiZnaI3mXqHZDhscP4Pjm0R7zLHet8Pn8Nl6V6pVtOoZmHBTBhrixxtWsfbPrPqrsyJqs7rYYkM1+5bNU819Fvd5ghmpsmmindBB3VYhJ3Fe6CLaS1q46Te9orWOspZitaze8xWtY3tM+EOC7WccvrtTbT4JtXBTevx8/n7PPetrdKaxttuKdrcOG849Fj95MTzvy5/wAo/FqJ7W8Wi/epelY35b15ufGCbzLL0w7LhnbrUYZiNXp65a+Mx1n8tvxd1wTj3CuLU2wZ6Wt40t1/Hm8TXYsmTFkjJival684tWdphMZJhE1h6j2x7C4tdGXiHBorjzz9K2GPq389vKfn1ee8O1vF+zfG8es0WfPw/iOlv3qXpO1qz/OJ+6Y9HWdkO3+fR2rpuMb5sHSMsR9Kvxj5+Hi7TtD2e4R2v4bTU6XLjrmiv+FmpMb8+e0+nzy6rdMW84N67vTvYV7aNF2wjHwTtDfDoePRG1L793HrPWvlfzr49Y8dvaa8p2fnTxXh3E+z3FYxZ+/p9RitF8WXHaY32neLVt1/nD6R/Z99t395Wwdlu2OqrXWTtTR6+87Rm8qZJ8LeU+Px61ifaSYfRNJTUlj1nadv5p6SuhfE8l9Z5rInmviee4hdHVWOqkTzIn6SRfCnj+Zut35iF8+MKWgmZ5kxzSOT9pvYrhHb3svm4HxbHETP09NqIj6enybcrR/OPGJfB/b7snxjsV2m1PAeNYO5nwzvS8fUzUn6t6z4xP8ATwfoxbp1ef8Atr9nPDfaL2anR5Ypg4rpom2g1fd547eNLedJ8Y+E+Ctq7TWdPggbDtFwbiXZ/jWq4NxfS30ut0uSceXHaOk+cecT1ifGJYOKtbZK1teKVmYibT4R5sLIn4fo82tzxjxVnb963k7jheiw6HBXHjiN/GfX5+ekMPg+PT4tHWuDb157zv8APj8PBnRfm9JwOJXDXrnztLlcnNN56Y7MqtuaWl/Vi1slpbm61bNGYZuO6bHfmw8d0uO/NmrZjmGbjuycd/Vr6XhPjuzVsxzDPpZJFmFTIkrkXiVJhkzMIbnfhFmzUpS172itaxvMz0hOzRnvWlbXvaK0rG8zPhDge2PaSctraLQ3mKRP0r+v6/l8fqu2PaS2XJbRaG81pWdrWjz/AF/L49OPeX8U8V3vFhn95drhcLp9dwGfwfhubiOoimOPoR9a09IcDHjtktFaxuZdK1orG5V4JwvUcT1UY8dZikfWtPSIemcK0ODQaaMOCsRy+lPn/RDwzRYdDpq4cNdoiOc+Ms+j2Ph/Arxa7nztLhcrkzmnUdk9EtEFZS0l1YaEp6pKoKymrMbLQiVZR3hKttCUIb1Y9457su0ILxzY5heGLeEdoT3hDePFjsvCC6C6fI0/HuKYuHYJ5xOW31a+TXzZK46za06hmx0m86hbxviWLh+Cd7ROSekddv6uF1uqy6vNOTLaZ58omd9v6qazU5dVmnLltNpnpvPRC8jzebbkW1HlV3OPx4xR8gDRbAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADa9ldBPEONYMH7u+89d/jHrHX7HrkY4iIiIiIiNojycd7KdD3seq1loty+jHlPlP/FDvPdNjHGoYrz5sGaeinc9GZONT3bIqwpx+C2ac2bOLw25LZx8wYfu1JozZxrZxgwu4RRl+7lWMcePSOoOQ7dcRnR6GNNivtky+U7THz1+5563PbHW/wBt43mmJ+hjnuxz+fSPsaZrXncs1Y1AAokAAbvsp2l4h2e1kZdNeb4Z5XxTPKY+fnpMaQInQ90tPAe33AdrWjvxHKemTDb5+Zh5D2l4JrOAcRnTaiN6TO+LNWNovH8pjxjw+G0zi8I4lrOFa2mr0Wa2LJSYnlPKfi9g4dxHgnb/AIDfRa2Ix6mI5xvHfpbwtE/P5wyeV/3V7Ov/AGcPbPOo/s3Y3tfqt83LHw/X5bfX8sWSZ8fK3j0nn1+kqztOz86O0vBNb2f4nOm1G8xv3sOavKLx5x5T5x4fdL6N/Zs9ss8Qrg7HdrNXvrKx3NBrctv+1jwx3n+Lynx8efVWfaSY930dEr625saLTHKftSxbmuqni3Mid5RxbmRbn13BLub81kW5m/MQlmeojmevkrukWz8Vt9iVtp5g8n/aG9lmn7fcG/vDhuOmPtFosc+4v0/tNI5+6tP392fCfSZfFes02o0eqy6TVYcmDPhvNMmPJXu2paJ2mJiekv0oyPBP2m/ZRHaHS5e1/Z7S78ZwU31uDHHPV44j68R45Kx9sxHjyUtXfnC1bez5d4Vr8mmyRWbfR6bT028vT+X2y6jT56ZscZMczMT59YnxifKXDtnwriOTBeKW3tE7R6zHhH6fd5bbnC5k456L9mDkYOv1R3ddW3PqkpbnDDxZa3pW9LRato3iY8U1Lc3oq2cqas2l0uO/qwqX9UlL+rPWzHMM+l01L+rX0unpkZYspMM6mT1S1yerArkXTmrSs3vaK1rG8zM8oXiys1Z9sta1m1rRWsRvMz0iHCdru0dstraLR3mKVn6VvHf9fy+PSztX2hvlvbR6S9q1rPO3lP6/l8enKPPeJ+KdW8WKf3l1eHw+n13AZvCeHZuIaiMdK/R8bT0hwceO2S0VrHnLpWtFY3KvCOG5uIaiKUrPd8beD0Thujw6LTxiwxEREc526oeHaTFpMFcWKOURznbqzKy9dwODXi133tLh8nkzmnXsnrKSkoaykrLpxLTlPSUlJQ1lfSy8SpLIrZLSeTHrZJW3JaJVlPEqyjrZWJW2jStvFDkhLMoskqymEGSGPkT5Z2aPtHxjDwzTz9KJzW+rXrMfPz66+bLXFWbWnUQzY6WvPTVD2j4vi4bgnaYtmnlEeTz3V6nLqs05c1ptafwNZqc2rz2zZ7ze9p35yheN53Otyrfiv4d/j8eMNfkAaDZAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAe0ezbRTg7JaeZ2n3k9+J9J5/wA5dF7rl0Oy2h/svZ7R4Ovdx7bs/wBz6NuI8mCe7XTh9FnuvRs5w+i33PolDWzi9CcXPo2E4fDZT3PMGvnCpOL0bKcPPop7kS1fuvRhcevTS8H1Wa8zWsU2mY61ieUz9kby33ufRzPtPvbS9k8802+lMVmPSfoz/wASLTqEx5y8YzZLZct8t53te02tPrKwGozAAAAAACbR6nPpNRTUafJOPJSd4mPnnHohAeu8F4twrt3wS/COKUph1tK7xMdYnwtWZ9fu32nlO8+bcf4Vruz3GbaXNa1MmK3exZa713jflaPKfya/TZ8umz0z4LzTJSd62h6fw7inDe3vAo4PxiaabiWCP8DUR1ift61/L7pX31fur2ewfs4+16vaPS4uyvabVVjjOGvd0ufJO39rpH7sz/HH4x9r3eLzvs/OTX6XiPAeMe6yWyabV6e8Wx5MdpiYmJ3rasxz+EvrX9nv2tU7a6CnAuO5qU7Q6WnK87RGspH70f6ceMePWPKJrPtJMPaa38VYtzY8XXRfey6rJi3Mi3NDFyLc+ohkd7qrv6oe91Xb/FIu33lSZj1WbqzPxBS7GycucMi0ob9EofMP7UPsprpMuftx2b0m2nvbv8U02KvLFaf89WI/dn97ynn5y+dn6Railb1tS9YvS0TW1ZjeLRPWJfH/AO0V7Kr9kOJX7QcDwTbgGqyfSpWP/c8k/uT/AKE/uz9nlvivX3hes+zzXhHEppPusvOZn/a9fj+fx677HkraIvSYtWY3iY8YcS3HB9fatpplmbR1nz9Z/X7/ADdHg83p/wAd+zW5HH6vVV0tLr6XYlbRMRMTExPOPVJS3N3K2c6asyt0tbsGtkvvK1rNrW2rHOZnwZYspNWZ72taza1orWI3mZnlDmO0nHbZLW02ltNYidpny/r+Xx6Qcf4xfJecGntasVnr5T5/H8vj00Di+IeJTb/Hin95dDjcTXruAy+GaHLrs8UpG1etrT0iHFpS17RWsebftaKxuV3CuH5tdnilKz3fGXc8O0mLR4IxYo+M+fz5I9BpsWkwRixx4c58ZZUS9TweHXj133tLjcnkTlnXsmrKSsoKykrLpxLTT1lJWUESkrK8SrMJ6yvrZBWV1bLRKumRWyWluTFrb7klbLRKNMmtl0WY8WViy21dJ5tyRZLKd9o+0vG8XC9NO0xbUW5Vr5fP/XwicWXNXFSb3nUQyY8c3t01WdpeNYuGaeYi0WzW+rXy+fn1841epy6rPbNmtNrTPjPQ1mpzavUWzZ7za8+c9ELxnO51uVb8VjtD0HG48Ya/IA0GyAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAL8NJyZqY462tFY+1YzeA1i/HNBS0bxbU44mP/AFQD6W4Zp5rwvSRMc/cU3/2YTe55dGw02n20mCP/AAqR/uwrGDlHJtsDXe49FIw+jZe49CMHolDVTgV9zz6NlOD0V9x6A1k4PRScHo2vuNp6E4PRA1PuPR597cb2wcB0mKu+2XLNbfhMf8L1b3Ho8t/aFrWnCuHU5b+/3/3bK3+1avd4wA1mYAAAAAAAASafNl0+aubDeaZKTvW0eCMB6FGo0nbvhXuM1sel4zpq71tM/RyR+e0+PlynzcXo9TxLgXGceq0uXLo9fo8sWpes7WpaPz/KYYunzZdPmpmwXmmSk71tHg6XiGXD2n0H9rpjri4ppqRGWteVclfCfnpM7dJja33fujs+r/Yd7UdH2/4J7nVTj0/H9JSP7XgjlGWOnvaek+MeE/ZM+k1vz6vzu7O8Z4l2f41puL8J1N9NrNNeL471n8J84npMPtj2S+0LhntA7PxrdNauHiOCIrrtJM/SxW/ijzpPPaf6xF622iYd53l0W5setl0W58pXUZHe3lfux+99y+J5iEsTvPVXdDE7r+8kXWlHZWZ6rJkFt+bC4potLxDRZ9BrtPj1Ol1GOcebFeu9b1nlMTDNtzlFYHxJ7b/ZtrOwHaCZw1vn4Jq7zOi1Ex9Xx91fytH4xz89vPa2tW0WrM1tE7xMTtMS/QHthwDhvabgGq4JxbDGXSamu0/xUt4XrPhMTzfE3tN7EcV7CdpcvCeI0m+G299Lqax9DPj8Jj1jlvHhPpMTOG9dMlZ2wuE8Sif8HNyjzjpH6R+Xw6basuOraa2i1Z2mOje8M1+O+OMWSe7t03np6fDy+7ymepwuZv8Ax3n9mpyMH6qtz3orWbWmK1iN5mfBpON8Um1pwYJmIiec+X9fy+PSPi/EptecWCZiInr5evx/L49NOjm87f8Ajxz+5x+Pr1WAZOh0mXVZYrSvLzcutZvPTXu3JmIjcq8O0eTWZopSPo+Mz0djodNi0uGMeOPjPmh0Wmx6bHFKR4c58/6MqsvScLixgjc95crkZ5yTqOyasr4n1QxK+J59XQiWpKespK2Y9ZSVnyZIlXSaJSVsx4lfWV4lWYZFZVrZDErq2W2rpPFktLMWLJK2WiUaZEXO9shi/q1HaDjWLhmDasxbPaPoxHh8/PlNcuauKs3vPlC1Mc3t01T9o+N4uFaaYiYtqLfUr5evz+kT5vrNTm1ee2bPe172nrM7mr1GXVZ7Zs15ta0+M9ELx/O51uVb8VjtDu8fj1wx8gDQbIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA2PZn/4k4Z/+8xf8cNc2PZeN+0vC4jx1mL/AI4IH17GD6NY2/diPwhbGDl0bW2Lmj9zt4Ntga/3KnufRsfdeinuvQGsnD6Lpw8+jOnDz6Kzi59AYPuicTNnF6KziBgTi9HjX7SU9yOF4/Pefu3/AFe5+79HhX7UEd3ifBK+Hucs/jVTJ9q1e7xsBrsoAAAAAAAAAAk02fLps9M+DJOPJSd62hGA2/FLYuK0txHT44x6iI31WKP+OPOPPxjx36zN2F7VcV7HdpNPxzhGaaZsU7XpM/Ry0nrS0eMT/VptPmyafNTNhtNb0neJhXU2xXzTfDScdbc+5vv3Z8Y+Cdj7v9nnbThPbfs5i4xwzJEW5V1GnmfpYMnjWfTynxdJW/Pq+D/Zr214r2G7SYuLcNvNsc7V1WmtP0M+PxrMeflPh977W7KdouF9puBafjXCNRXNpdRXf/SpbxraPCYZa22xzGm/7ySLMOMnXmlrb1XVTxb1X97n4saLeq7v8+oJpstmUfeU732gktPNHaeZa28rJtzShbkcl7TOxvDO2/ZvLwjiG2PJH09LqYje2DJ4THpPjHq6y8osm0yiUvgbtl2b4r2T7Q6ngnGME4tTgtymPq5K+F6z41n55w1NLWpbvVmYnpvD7O9sns/0nbvs/OGvu8PFtLE20WotHj/3dp/hn8J2fHXGOHa7hHFNRwziWmyabV6bJOPLivG01mPnr4sFq9MssTtiAn0mnvnyRWNojfrPKCtZtOoJmIjcrtDpMuqyxWkcvGZ6On0mDHp8cUpEdOc7fPJZpsFNPj7lIj1nzTxMQ7/E4tcMb93Mz5pyTqOyaJXVlFE811Zb0S1pTRK6J9UcSrE+q8SrKaspKz6oK2XRLJEq6TxK6JQRPiviy0WRpPEqxZDWVYlaLK6T95fFuTG7zX8b4tj4fgmKzFs1vqx5fPz4RNcmauOs2tPktTHN51Cbj3GMXDtPMRMWzW5Vr5fPz4b8FqtRl1Oa2bNebWmTVZ8upzWzZrza1p6zKJ5Xm823Jt+IjtDtcfjxhj5AGi2AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABtex8b9rOER567D/wAcNU3HYeN+2fBI/wDqGD/mVIH23fD9KfuQ+6iPBtMmL6UofddJ5Npha+cXop7r0bCcXos936CGvnF6Kzj5sy2MnGDCnGe76sucfMmiRhzj59HgP7VFe7xfgn/kZfzq+iZxvnv9rCvd4xwL/wAjL+dFMn2rU7vEgGuygAAAAAAAAAAAAM7huhvqbxa0bU9fH1+H5/fMWpSbzqqJmIjcsF3Xse9onEOwPHoy172o4VqLRGs0u/1o/jr5Wj8enw57i+g32y4fpTtETG0R9n6fd5NMvkx2xW1KtbxeNw/QHgfF9BxvhWDinC9RXU6PU0i+O9Z8PKfKfRn1vz6vjr2I+03U9iuJxw/iFsmbgWpv/i445zgtP+cr/OPH8/rbRavT6zS4tXpNRj1GnzUjJiy453res84mFq22iY02Vbr++xK338UkXWVZHfO94Qg7530iebLe9vKObbyp3uYhfM81lp5rZtutm3MFMjyb2+ezWva/hs8X4VjpXjukpyieX9pxx+5M/wAUeEz8Hq9pQZCY3GkxOnwBnxZMGa+HNjtjy47TW9LRtNZjlMTHhKXR6rJgtG1piu+/wn5+ej6J/aJ9mU8Ux5e1vANPvrsVd9dp8deeasf5yseNojrHjHr1+bmD1Y7bhk8rQ6nT5q5qd6vKfGN+jIiXM6HVXxXrXvcukbz+Hw+fN0GLJXJXvV3jwmJjnE+U+rucXkxmr8udmw9E/DKiV1ZRVmF1ZbsS15hNEqxKKJXRPqvEq6SxPNdEoYldErbRpNErolDEqxK0SrpPEru8giUOt1mPS495jvXt9Snn6z5QmbxWNyRWZnULuIauum082m217R9CPNxGqyZcue181ptaZ333brJkvly2y5Ld69us+UeUejG4hpq5KzkrymOv6uLz+rPG47R7OjxunHOp92pFbRNZmJ6wo4rfAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAG67Cxv224HH/ANQwf8yrSt12D59t+B//AHDB/wAyCB955Me97T6ofd8mzy498luXjKH3fLo2mFgzi9EfumfOP0WTjENfbGttj5sy2P0W2x8wYk4+ak1ZVsfNbavVIx5p6PnT9rONuM8D/wDIy/nR9JzR85fteRtxrgP/AJOb86KZPtWr3eFANdlAAAAAAAAAAAZGh0mXVZYpSOXjM9IWrWbTqETMRG5X8P0ltRkiZrvXrtPj8fT5+HRY6Vx0itft5GnwUwY+5SPjO3VdMc3d43GjDX5c7LmnJPwsvFbVmtoiYmNpiWl4tpZrb31fpRPWfGfj6/n1827lbkrW9ZrbpP4eqc+CMtdSjFkmkuUetewX2nW7M6yvAOOai08F1F/8PJad/wCyXmev+pPjH2+bzPiOk91bv0iNp5zt0n1j9P5dMFw7VtjtqXRiYvG4ffuLLS9K5MeSuTHesWras7xaJ6TE+TIrfd80/s/e0+2gyYOyfaDUb6O89zQ6i8/9jM/5uZ/hnw8pfRdbxy2neJ5xMMlZ3CkxpnRdWLx13YcXXxdZDK7+87KRb7EHf5qxcQmm3qb8+qLvczvc+oKzPPqst1O9zWzPNIjvHP8Ak+cf2hvZp/d+fN2u4Bp//Yslu9r9Pjj/ALC8/wCciP4J8fKfTp9H3Y2px482K+LNjrlxZKzW9LRvFonrEq2r1QmJ0+C2doNbfHaK23t4fGPL9Pu+Hf8Atx9m+XslxO3FeF47ZOBaq/0JiOemvP7lvTyn7Pj5kxVtbFbcd2SYi0al1mO9bVi1Z71ZjeJSRLRcN101nuZOcz+Pr8fz+PXc1tG0THOHe4+eMtdw5uXFNJ0niVYn1R1lWJ9WzEsMwkrK+JQxK+JX2rpJEqxKPdFq9TTTY95iLXt9Snn6z6E2isbkiJnsk1urppccTMRbJb6lP5z6NJe98mS2TJabXt1lS9rZMlsmS02vaeckNLJkm8/DYrSKwuhJCOISVhWEywddpY27+P7fT+nz8NfMTEzExtMdYdBEeGzX8Q0kxEZMcbx0+Hp+n3NHlcb9dWzhy/plrgHObQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA3fYHee3PAdv/ANS0/wDzKtI3nYD/AOOuA/8A3LT/APMqQP0FvWO9b4o+5Gye+3vbfGVkbQ2WFDNI8llqR5MiYWzslDCvj8NlL05p7xHRHk23BBevNbaI3nZLeY3nmivMbztILLxzfNv7Xsbcb4D5e4zfnR9JXnm+a/2u+fHOBT/4GWPxork+1and4YA12UAAAAAAAABk6HSZdVlitKzMTO3x+fPwTWs2nUImYiNyaHSZNTkiIie7vtv5/P4fc6bTaamnxdym3TnOy/S6XHpsUUrETO3OY/KPRJZ6Di8SMMbnu5ubPOSdR2RzC2Y5pJWTDZmGCJWTCk9V0xzJjmiYSx8uOmSk0vG8fjHq0Ot004bTMc48Y8v6fPlv0Uwh1OGmbHNbdfCfJqcnjxlr8s+HLNJ8+zmn0J7AvajOqrh7KdpNTvnj6Oh1eS314/7u8z4+U+PT4+BavT2w3nl9Hf7vSfnmipa1L1vS01tWd4mJ2mJ83E86W1Lo+VofeEX57Tuli/q8d9hftNr2g02Ps7x3PEcWxV20+a8/+9Vjwn/Tj8XrFbs0TvzYpjTNi/NWL82NF95XVvzWQye+rFue+7Hi/qrFuYJe9zO9zRd47wLrTustzUmefitmQYvF9DpeJcPz8P1+CufS6ik0y47RymJfJ/te7A6rsTxrfFF83CNTaZ0ueY6ePu7eVo/GOfm+t7NX2j4Rw/j3B9RwnimCM+lz12tExzrPhaPKY8JUvXcLVtp8Rtrw3WRt3Mlvjv8AnH8/v89th7ROyHEOxvHr8P1cTfT33tptREfRy0/WPGHN1mYmJidphTFktituFr0i8al1cSuiWt4XrK5MUY7zHLl/q/0/Lp5NjHV38OWMleqHNyUmk6ldErolZCLU6iuCk2+tPhDLNorG5Y4rMzqE2pz1wY+9Md68/Vp5/H0am9r5LzkyWm17dZVva+TJOS89689ZUjq1r3m8/DNWsVIj0ViCIViFYhO11YX1hSsJKQvEKzJEei7uxMbTG8T1iVa15r619GSIVmWo4loZpM5MXOJ8P5fPX49da62aVtWaXrE1nrEtHxXQXw3nJT6VJ57+Pz8+e3L5nE6fXTs3MGfq9Nu7XAOc2gAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABu+wM7dueAz/wDUdP8A8yrSNz2Gnu9teBz5cQwf8ypA/QSb/Tnn4qRkjbrDEvl+nb4ysjNEbc20wM6bwsnJGzFnN6o7ZwT5MkeaLJljzYmTNHmjy5+fVIyMmWN+qLJljeebFyZvVFkz9eYhmXy+r5z/AGtZ73FuAzHhizR+NHveXO8C/aqr39TwXPHOK1yV+/u/opk+1and4eA12YAAAAAABPotLl1eeuLFSbTM7JrWbTqETMRG5NFpsmqzVx46zO8uu0elppcMUrEb7bTMflHov4boMehwdyu03mPpW/lCeY9HouHw4wxu3dy8/I+pOo7IrRzWSktCy0NyYa+1llkwkmFlo5qzC0LJjn0UmF0xzUmOakphHKmy6fwUmETCYY2qwVz45rO2/hP8vg0GfFbFea2iYjw3dPtuxNdgrmxTtXe3lEc7f18mhyuNGSOqO7ZwZumdT2aPS582l1OPU6fLfFmxWi9L0naazHSYl9P+xz2iYe1vDo0OvvTHxrTV/wASvT39Y/fr6+cPl20d201332nZkcL1+s4ZxDBxDQai+n1OC8Xx5KTtNZhx626Zb8xt9v1yc11b83A+yrt5p+2XCP8AG93h4tp4iNThjpb/AE6x5T5eEu0rfm2IncbYpjTNi/NdFue7Ei/NdF+aUMmLeqsW59WNFtl3eEJu8p3kPeU7wJZlZaVk25rO9ANF237N8N7VcDy8K4lSO7P0sOWI+nhv4Wr+ni+UO13Z7iHZjjmfhPEsfdy453raI+jkr4Wj0l9j3ndyHtJ7HaHtfwW2mzd3FrcMTbS6jbnS38M+dZUvTqXrbT5RraazvE7S3vDdZGbFFMlo73SJ/lPzzYHHuE6/gfFc/DOJYLYdRhttaJ6THhMT4xLDxZLY7d6vwmJ6TCMGe2G205McZI06HiGrppcUxWYm89PT+vz8dBkz3yZveWnefLw28lmS9r23tMz5LVuRybZp+EYsUY4bXS5q5KxG/Pw36/Cfnn96WIajFeaW36x4xvs2umyVy03id5+eba42fr9M92HLj6fOEkQurBFV9at6Ia0yVhLSFK1S0j0ZIhSZUrVJSCtfRJWrLWFZlWsF8VclJpeN4n749UlY9F9arxVXbleLaDJpMsztvSecTEbR/RgO5zaemfFOO8cvCfJyvF+H5NFmmNvoTziY6fGPT/p8eHzeFOKeuvb+HR4/I6/TPdgAOc2gAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABuew893tpwOfLiOD/mVaZteyE93tXwifLXYf+OCB93ZMse8tO/jKKM+0dYYGTN/iX5/vT+aH3+0dW2wNnOf1R21Hq11s/hujtn9U6QzL5/VHkz855tffP15rMmfnPM0M3Jn59UOTP15sHJn59UGTP15/iDPy5+vN49+0zMX4Jwy0c5jU9fL6Nnp2TP6vOvb3SufsVOW3OcOas19JmYj8t1b/bKa93z8A1WcAAAABkaDR59bnrhwUm0zO3LwTWs2nUd0TMRG5U0OkzazPXFhpNpmduXg7XhvD8WhwRSkRNv3p+fn8IiXhfDcWg08UpEd+Y+lPz8/hDJmHpOFwYwR1W+5yeRyfqTqOyGYWTCa0LJhvzDW2htCOYT2hHaFJhaEVoRzHNLaFlo58lJWhHMc1JjmulbMc1JTCyYUmF0rMlq0pN7TtEdZVlMKWmK1m1p2iOrR8S11s1+5SZikTyj58fyOJa6+bJNaTtWOUen9WA43L5fX6KdnQwYOn1W7isxMREzExE849UulwWz5IrWGdqtLFsW/e6eO31f6enzOrTBe9ZtDPbJWs6lH2e4xxDgPF8HFeGZ5w6nBbes+Fo8YmPGJfUHs87ZaHtfwaNXp5jFrMURGq00zvOO3nHnWfN8oWrNbTW0c4bbsl2g4j2Z43h4rw3JNcmOfpUmfo5K+NZ9JUrbplMxt9iRfzldW/Pq5rsZ2o4d2p4NTiXD7xFuUZsEz9LDfxifTylvK3577tjux6ZcX9V0X5sSL+q6L80oZHfO8x+/4HeEJ+8p3uaHvevJb3/UF82WWn4LJss7wOM9qnYfT9ruG9/B3MXFdPWf7PlnpeP4LenlPg+auI6LVcO12bQ63DfBqMF5pkx2jaazD7GvO7zv2u9hsfaXRTxHQVrTiunry/wDHrH7s+vkxXpvzhetteT51F+fFkwZr4c1LY8lLTW1bRtMTHWFjAyiXT5pxX357enWEQmJmJ3BMbb/TXpmx96u2/jHkmrVotFqJw5Ou0T4+Xx9G9wWrkxxes8vydvi54yx8ufmxzSdx2SUqlpVbWqalW7ENaZUpVLSpWqStfRliFJlWtfuXUqupVdWsskQrMq0qt1ejx6vBOLJ08J26JqQmpVeaRaNSr1TE7h5/xXQZtBqJx5K/R/dnwlhvR9focWt004skR05T5f0cHxTQ5dBqrYclZiN+Uy83z+DPHnqr9sutxuRGWNT3YgDnNoAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAbHsveMfaXheSeldZhmfsvDXJdJlnDqsOas7TS9bR9k7g+1bZ95m0Tynms9/t4tZpdR73RafJv9bFSZ/wBmFff7eLca7Ptn9Uds/qwb5/VDbODMvn680eTP15tfkzdeaPJn59UoZuTP6ocmf1YWTP6ocmf1BnZM/Xm5z2i4Z4h2Q4hp6VjJf3fepX1+Z3+xsMmf1Qa2Yz6bLgmeWXHak/bGyZjcaIfM4zONaWdFxbVaW1O53MkxFd99o6xH3MNotkAABlcN0WfX6muDBSZmZ5zEb7JrWbTqO6JmIjcqcO0WbXaiuHDWZmZ2mYjfb+rveFcMw8P08Y6VibzH0p6/Pz6Ql4LwnFw7TRWsROSY+lPz8/YzZq9RwOBGCOq33fw4/J5X1J6a9mPNVto+xPaqy0Ohpq7QWhHaE9oR2jwVmEoLx9yO0eCe0IrQpK0IbQjtCa0IrQxyvCOY5rJSWhHltXHSb3nasMc+S0LMt646Te87VjnMtBxTXWz5JpWZikTyj58VeK6+2oyTSk93HXlEfPz/AD17iczmdfop2dHBg6fVbuJtNgtmvERE7TO3xNNgtmvEREzG+3Lx+fwbfT4a4q7Rt3ttuXSI8o9Gvx8E5J3PZly5IpHyrgxVw4+7XbfxmPnovUJdWIiI1DR3udywdfpt479Nto8PL+jXTExMxMTExymJb6Y33jZga7T/AEYtWN9uUT/Kf5fd5NDk8f8AXVtYcv6ZZ3YftRxDspxvHxHQ3maTMVz4Zn6OWnjE/wApfTXZfj/D+0XCcXE+HZYtjvH06TP0sdvGsvkd03s97Ya/sjxeNRg3y6TJMRqNPM8rx5x5S06X0zzG31NW6SLtLwLjGh41wzFxHh2eM2DLG8T41nxrMeEw2MXbG9sTJ7/gd9jd87/qlDJ7/qt76DvKd/mCabre+im63v8AmCa1ll7IpvzW2v6g819rvYOvGMWTjfCcda6/HXfNjjlGaI8f9b5+Hhl6Wx3tS9Zres7WrMbTE+T63tbyl5X7Xuw39ri/HuDYY9/HPU4aR9eP4o9WLJT3hkpb2l40KzExMxMTExymJUYGQZnDdVOHJ3bT9Gfn5lhi9LzS3VCLVi0al12Ka3pFqzvWekp6Q5/hGujHaMWXpPj5/wBfz/Po8URNYtWd4mN4l6PjZq5q7hys2Occ6ldWElKlISUq3IhryrSq+lVaVX0rzZKwrMq46pqVUpVNjqyRCmyleTH4xwrFxLSzivEReOdLeU/ozaVT0qvbHW9em0eUqxeazuHlHFNDm4fq76fPSYms8pnxYj1Pj3B8XE9Jalqx7ysfRn+Xz+rzTX6TLotVfT5qzFqzMc42eT5/AtxbbjzrLt8bkxmj5Y4DnNoAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAB9S9l9f/beznD9VE/9rgrZnzm28XE+yzXxqew+hr09xvi2+Hj9+7pLZvVuV7Nee7OtmQ2z+rDvmQWzJQy75vVHfNz6sK+bmjyZufKQZeTN6osmbrzYWTN6or5vKUjLvn680d83Xmwr5uqK+b1B557VOH+54tXX0j6GaNrbbfW6/r+DjHsPaPSU4nwrNprdZjes+ryHPivhzWxXja1Z2lrZa6nbNSdwsBkcP0efXamuDBSbWtPhHRjrWbTqFpmIjcq8P0ebXamuHDWZmZ5zEb7PROA8Gx8N08RtE5Zj6U+STs7wbDwzTViIi2W0fSs2vceq8P8ADowR13+7+HG5XL+pPTXshmiy1WTaqO1fR1dNLbGtXnyWWhPavNZeqkwttj2jmitDItXn0Q2hSYWiUFoRWhkXhDaGO0LQgtHNFaE14Q570x0nJe21Y6zLDZeEWa1cdZvaYisdZc5xbiFtRlmlJ2pXlELuM8Rtqcs48e9cdZ5R/P4/Px1jg83mfU9FOzp8fj9Hqt3Eunw3zXitYmeamDFfNeK1iZ3brTaeuGu0bd7br/Jq4ME5Z8+zNlyxSPlXT4K4ce0bb7c9vyj0XL9lNubr1rFY1DQmZmdyt2JhWYVmEiyYUtWJiYmN4lfMc+hsrMJhqtbpZie9Tnv87fP/AFwnQXpFomsxvEtXr9PatpyRzifHz/q5vJ4/T6qtvFl35S3ns97Ya7spxSMmObZdFlmI1GCZ5Wjzjyn1fRfCeJaPinD8Ov0GaM2nzRvW0dfhPlL5Mdf7OO2uq7La6MWXvZuG5rf42LfnX/Sr6tel9eUs1q7fR0X8CLtdw/XabX6PFrNHmrm0+avepes9YTxfx3bDEy+/6nfY3fU74hP31O+gm6nfBPN1tr+qCbrbXkEtr7LbX25xKGbrJukeYe1nsNEzk4/wTDymd9Vp6R0n+KsfP6+TPqW1v+jyb2o9ifdXycb4NimcVp31GCvOaT5x6fPXrgyY/eGStvaXmYDCyEcp3h0HAeJVn/2fPbbfpM/Pz+XPq1tNbRas7THRmwZ7Yb9UKZMcZK6l39KpqVaXs/xOmopXT5ZiuSOVd/y/T7vLfe0h6nBlrlpFquNlpNJ1K6kL61VpHovpVsxDDK/HVNjr0W46pscM0QpJSvoyMcI6QnpDJDHK6leTS9qeBYuK6ab0ju6mkfRmI529Pj/08pje0jkT0MmKuWk0vG4lNMlqWi1Xiur0+XS57Yc1Jres+MInpXbDgNeJYZz4I21FI3/1v6/m83y0vjyTS9ZraJ2mHi+dwrcW+vae0vQcbkRmrv3WgNFsAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAPUPY1xGf7HqtBa9p7k96sT0rH/AFmzv7ZuXV4d2E4l/dvaDDktbbHee7bntEev3bxHxevWz+sNnFO4Ybx5thbP6obZmDbP6o5zerKozL5vVZfNvPVg3zeqO+bn1QMu+bn1Q3zerFvl59UV8vqkZdsvPqhnKxr5evNZbL6gyLZfHdxPb7HpLZaZ4yVrn22mkdZ+fnq3nHOMYuH4JmbxOWeleuzhJnV8W1/PvZMl5+O27HknfpiNzK9I15yh0OlzazU1wYKTa9p25PR+zfB8PDNNEcrZrfWt6sXs5wrFw7BE7RbNb61vJvMcxyd7w7gRgjrv938Oby+TOSemvZkUjmviEVLQliXahzpLVRWqm6rLQlDHvXnyWXhPeEd4UmF4Y94QWhk3hBdjstDHyQhuyMn4MXU5KYqTkyW2rHWWG06ZIQ570x0m97bVjrLlOM8Svqs01xzNcdfqx8+Pz8b+PcUvq8s48czXFXpHz4/Px1LznO5v1J6Kdv5dbjcfo9Vu4k0+G+bJFKVmZmTBhvmvFaVmZb3SaWmnptG028ZamDjzlnz7M2XLFI+Vul01cFdo528ZSxC/Y2ditYrGoaE2m07lSIU2jdfEKbLaQs29DZfMEwgWbc1Nl8xzNuaJSj2Umlbx3bRySbc2LrtTXBSa1mJv+THe0VjdlqxMzqGt12GuLJPdtvEyxl+XJbJfvWn4eixxbTEzuHRjt5uu9nfbPU9mtZGDPNs3Dctv8TFvzpP8VXuui1um1ukx6vSZq5sGWvepevjH8ny46z2f9sdT2b1fuM02zcNy2/xMW/1P9KvktS+vKUWrt7/F/U94wNHrdNrtLj1ekzVzYMsb0tWV/vGwxMvvre+xput95CUMqbqTk9WLOT1Jv6gmm62b+qCb81s39QTzZba0TWazEWrMbWrMbxMT1ifRBN1s39QeZ+0rsV7i+TjPB8W+C0758NY50mfGPT569fOH0la0WrNbRFq2jaazziY8peZe0TsX7ucnF+D0m2KZ72bDHWu/jHz+PXBkx+8Mlbe0vOhWYmJ2nlKjCyL8WS2O8XrtvHhPi7bgXEqa7DEWnbNWOcT4+vx/6/Dhk+i1WXSZ65cVtpid25w+XPHv8T3YM+GMtfl6VSElIa/g+vxa/TVyVmIvt9Ksfn8GxxvV4rxeItXs4t6zWdSlpCakI6JaNiGFfSEtfNFWV8TsyQonryhbutiyObrRKNL7z9zlO2fBK6qltbp6xGSsb32jrHn+v3+bpbXRZLNbk4aZ6TS7NhyWxW6qvIb1tS80tExaJ2mJ8FHY9reB0v3tbpKxWf3qx0/6fl8OnH2ia2mtomJidpifB4zlcW3GydNnoMOauWu4UAazKAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAupa1L1vS01tWd4mOsS9T7LcWrxHhOObWr73HHdtHp88vu83lTadneK5OF62MkT9CeVo8Pt9P6Tz2XpbplW0bep2zeqO2b1YOLVY8+KMmK8WrMeE9Fs5Wywsy2b1RXy8+rFtlW2y+qRkWy+qy+X1Y1skoNRqceKveveIjw8Zn4eYhmWyNVxvjWLQ47UxWi+bpy592f1/Lx8p1HF+PRMTi0m+3jbfr938vv8ABqNJpdRrs8TtaYnnNpUm82npp5yvFYiN2VrXV8V1n7172n47but4Hw3FoMUTytltH0reSPhuixaLDFac7eMs6lnY4XDjD67fc0eRnm/pr2ZuO3qycd/Vr6XT0v6utWzRmGdS/RPW/NrqZE1cnPkzRZjmGbFjfdjRkVi68WV0ltKy6k39Vlr+qJlMQtvsx8ia9mLqc1MOK2TJeK0rHOZYrT7rxCHU5KY6Wve0VpHWZcb2g4tfWZpxY5muKs8o/nPr+X4ru0fGL63NOHDM0wVnaI35z6z6/PrOlea5/P8AqT0Y+38uvxuN0eq3cS6fDkz5IpjrMzM7Gnw5M+SKY6zMy3+k01MGOIiN7eLR4/HnLPn2bGXLFI+Vml0tMFO7HOfGWRsrsu2ditYrGoaEzNp3KzY2X7Gy6q3ZTbZJEKTALe6bLtldkJRTBsvmPRi6/V109JiJib/l/VS9opG5WrE2nULNfqq6endrP0/y/q0eS9r2m1pmZVy5LZLze0zMzPjKxx8+acs/Dfx44pAAwMgADpexPa3W9ndVFd5zaO8/4mGZ/GHs/C+J6PimiprdDmjLitH21nyl85tv2Y7Qa/gGtjPpL70mf8TFb6to+fnlDJS+u6tq7e+zfmtnJ6tL2f7QaDjujjPpb93JEf4mG0/SrPj8YZ/fbETtimGVOTmpOTn1Ys5Oq22T1EMqcnPqtm/qxe+p7z1SMqb+qnfY839VO+DJmxF+XpPhMMXvKxfluDie3XYumecnEuD0it53tkwR0+Nf0/l082vS2O80vWa2idpifB7/AN9zPa/srpuM451GmiuHWVjlMRyv6T8/1xXx784Xrf8ALyQZXE+H6vhuqtptZhtiyVmY5xylitdlZvCeIZuH6mMmOfo+MT8/P3PQOH6rFq8Fc2KY2nrG/OJeZNrwDimTQ54rad8NuUxM/Pz8ZdPw/m/Qt0W+2f8Apqcrj/Ujcd3o1J2SVlhafPTLjrkx23raOX6fFPW/k9TFomPJxZjTIiyvf9WN3/VXv+q/Urpkd9Za6Kbo5udRpLa6y1vVZNltreSs2WiFckxMTExExPKYlyXang3dtOr0td6z1rHh6fp93Xr1NpW5Irek1tETWY2mJ8WrycFORToszYctsVtw8xHQdqOEWwXnV4I72O0/S26xPr8/zc+8lnw2w3mlncx5IyV6oAGFcAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABn8M4rqtBO2O8zXwjfp6fD0/J0em7SaXLERendt/rbfnyj75cayNNGnybY8sWraZ5Wi20fbuvW0x5KzWJdhfjXD4/wA/H4T+UoNRxzR0rvW03+Ex/KZae3AM9qxbBmx5qzG8TG0fzW04Dq5ie9MVn4x+rYimb2qxdWP8snV9orzvXBSI6xv/AD3n9IanNqNVrLT3rWtv1/rPx8220/AKxO+fLXaOsRz3/Lb75bDTaXT6aI91T6UfvT1/p9jLj4eXJ986hS3IpX7fNp+HcHvk2yZ57teu0x1+z5j4t9p8WPDjimOIiv5qRJEupg49MMelp5ctsndPWV9beqCLK1s2olgmGVW6Wt2HWyStmSLK6ZdMnqlrk5sKt9pXVyc2SLK6Z9cnqujIwa5F0ZFourNWZOT1WWyerH95zYHE+K4NJjtvaLXjw36T6/opfNWld2nULVxzadQ2Wq1WLT4pyZbbVj75+Di+0XGcmuyzixTNcFZ5RE9fX1+fjOJxXiefX5d72mKx0r4RDAef53iM5vRTyj+XV4/FjH6rdxNpsGTPkitKzO8r9Fo8mpvERG1PGW+02nx6em1YjfbaZ2/CPRqcfjTk857M2XNFPL3W6TS009Nq7TaY5yn2VPF161isahoTM2ncqLtuai6FkKbGxtzViAIhTaF0KSkUmCS9q0je07Q1PEeKRaJx4eUefn8f0/6MOXLXFG7L0pN58k+v11MMTTHaJt4zHPn5R6/l+DR5sl8t5veZmfyUve17Ta07zK1yM2e2WfPs38eOKR5ADAyAAAAAAMnh2t1PD9VTU6XLOPJWd+Xj8XpXZftnpuI0rp+IWrg1W31p5Vt8/Pm8sFq2mqJjb3y1/HffeOS21/V5Z2c7Ya/hvdwam06nTeVp51+E/P2u84Zxrh/E8UX02eO9PWlp5wz1vEsc102vf5qe8Y/f5rfeeq6rL7/qp32N3yLgyu/yVi7Ei66LwIZMX5deS6LsSLrq35JFvGeG6Hi+l/s+txReI+pePrVl5j2m7Ka7hF5y46zqNLvyvWOcekw9Ti5Nq2rNbRFqzG0xMbxMKWpFlotMPCh6f2i7IaHiM2z6PbTajy/dt+nzzhwHF+D6/heWaarBatfC+3KWC1JqyRaJZfZ/jV9HaMOaZtinlG89Pn+k+Ex2Gn1GPNijLiv3qT+HpLzRsOFcUz6DJHdtM08Y68vn5h0uF4jOL0ZPOP4avI4sZPVXu9Ai/I77V6Dium1dI7torefDfr8P0nmze94vQ0y1vHVWdw5VqTWdSyO8t7yKLbQpFl+pXSabKTZH3lJsjqTpfNjdH3jdGzS/LWuTHNLxvWesOJ4/wy2izzekb4bdJiOX9Pn0dpuh1OHHnxWxZI3rP4erU5fGryaanv7M+DNOK2/Z54Njxvht9BqJjbfHPSY6Nc8tkx2x2mtu7s1tFo3AAosAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAzNDxDUaSY7lt6x4S6DRcX0+oja092zkxsYeTfF27MWTDW/d2cXiY3iYmFO85fDr9RjnfvzafOZ5/f+rYYOM7zEZa+Pj4R8Y/R0sfPx27+TUtxrR2823iVYlgY+J6e0bzvEb7dYn8Ov4MiNRijbe/c36d+Jr+barmpbtLDOO0d4ZMSRKCubHPTLSfhaF3fr/FDLFlJqniy+LerF95X+KPvJ1GKOuWn3p64hHTLLiy6LsDLrsOLbvTMb9N42j75YufjWGm8UiJmPXff4bcvxVtysdO9lq4b27Q3XfR6nW4dPEzkvtMR9WOrmtVxnUZZmKTMRz8dvy5/jLXZMt8n17bxvvt0j7mll8UrHlSNtinDmfulvOI8dtaZpp/ox6Tzn4z+n3tFkvfJbe9t5WpcVKTEWteOv1d9pcrLnyZp3aW5THXHGqwjiJmdoiZmfCGx0HDL5dsmWNqevzzTaXLoNPHKvet4z3o/VP8A3ji8v9+v6s+HDijzvZjyZL9qwycWOmKkUpG0R969hf3ji/h5f69f1P7wxeX+/X9W/wDXx+0tX6V/wzlY5ywv7wxeX+/T9VP7wxRPT/fr+qfr4/yfSv8Ahmx12XwwJ4jgjwmf/XX9VLcVwRO3L79/yhH18f5PpX/DP3Vj4tTk4vEW2rWu3nG9vz2Y2Xime/TePt2j8P1UtzMUe60ce8t7ky48f1rRHp4sDVcVx03jFG8+vOfu/X7mlyZsuTeLXnaesRy3RtTJzrT5VjTPXjRHdkanV5s872tP3scGla02nctiIiOwAhIAAAAAAAAAAkwZsuDJGTFeaW9PH4+aMB1XB+2Ws08Vxayvv8cRtv4x8/MOq4d2h4Zrq70ze7ttzrfw+3w+3Z5WrEzExMTMTHSYXjJMKzWJezTPLeJ3j0U7zynRcZ4jo5icOqyR47d6efx8230fbHW4+7Gox48seMzXn9m234yyRlhXol3/AHlYu5LTdtNLads2mtSP4otMfhtLLxdreF3ttvkifsiPxmFuuqOmXRRZfW/Jo47RcJnrqqx/6qz/ADX17Q8J8NVH3J6oRqW7i/qrF2o/v/hUf/Nx9lZWf5QcKjrq4/2ZT1QjUt3F1MsY82OcealcmOf3bRv/ANGl/wAouEV66uP9mVJ7S8Hj/wCcj/ZlPVBqWLxnsZw/V97Jobzpcn8MzvWf0+ebj+LdnOKcOmbZME5MUTyvTnH/AFd7Hafg8f8AzlVI7U8G256qv4fqpNaStE2h5dW2TDknabUtHKYmPwmG44dx/Ni2pn+nWOW8/r1/P4Os4hruyutrP9prpZt/FWaxP3xLmeIcK4PNpnR8Uwxz+rN42+zef5px3yYZ3jsi0VvGrQ22j4rpdRXeL9zziZ6fb+uzLreLRvWYmPOJ3cTl0tsEzfHqsFpjp3Msd78JU03EdVp/qZP5fby6/a6GPxWY8slWtfhRP2y7iLK7uVwcf1FZiMkRaPGbREz+GzKxdoa2na+KlY85m0flEtuviOC3vprzxMkezoN9zdpv8oNLHWsT/q2n+dYV/wAodH5XZo5mCf1wp/T5Pw3W62Jame0Gi8rrZ7QaOPC0/PwI5mD/AJwf0+T/AItprNPj1WC2HLETWek+UuM4rw/LoNRNLxvSfq2b+e0Ojj928/PwR8Q4tw3Waecd62325btLmf0/IruLRuGzx4y4p1MeTlxfmrWuSYpfvV8JWOC6IAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAArEzE7xO0qAJJz5565sk/G0rfeX/AI7fetE7k0vjLlid4yXifSxkyZMk75Mlrz/pTusDcmgBAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA//Z" style="max-width:100%;height:auto;">'
+# The logos live in static/ and are served by Streamlit's static file
+# server (server.enableStaticServing in .streamlit/config.toml), so pages
+# reference a URL instead of re-sending the base64 image on every rerun.
+# Bytes are read once per process; without static serving the data: URI
+# is built once and reused.
+_STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+LOGO_FULL   = "logo_full.png"
+LOGO_ICON   = "logo_icon.png"
+
+
+@st.cache_resource
+def asset_bytes(name: str) -> bytes:
+    with open(os.path.join(_STATIC_DIR, name), "rb") as f:
+        return f.read()
+
+
+@st.cache_resource
+def asset_url(name: str) -> str:
+    try:
+        if st.get_option("server.enableStaticServing"):
+            return f"app/static/{name}"
+    except Exception:
+        pass
+    return "data:image/png;base64," + base64.b64encode(asset_bytes(name)).decode()
 
 
 # ─────────────────────────────────────────────────────────────────
@@ -95,7 +129,7 @@ def _get_seed_users() -> dict:
 
 
 # ─────────────────────────────────────────────────────────────────
-# DATABASE LAYER  — SQLite + GitHub persistence
+# DATABASE LAYER  — SQLite + remote persistence (GitHub, local dir or S3)
 # ─────────────────────────────────────────────────────────────────
 #
 # Add these to your Streamlit secrets to enable GitHub persistence:
@@ -106,15 +140,200 @@ def _get_seed_users() -> dict:
 #
 # The token only needs "Contents: Read & Write" scope.
 # Create one at: https://github.com/settings/tokens
+#
+# Writes are not pushed inline: they are queued in a local outbox and a
+# background worker uploads the DB once a burst of writes settles.
+#
+#   GH_SYNC_DEBOUNCE  = 3     ← seconds of quiet before a push
+#   GH_SYNC_MAX_DELAY = 30    ← never hold a pending push longer than this
+#
+#   GH_SYNC_MODE           = "delta"  ← push row-level changesets, not the whole DB
+#   GH_DELTA_COMPACT_EVERY = 50       ← changesets before a new base snapshot
+#
+#   GH_COMPRESSION          = "gzip"  ← "gzip", "zstd" (needs zstandard) or "none"
+#   GH_COMPRESSION_LEVEL    = 6
+#   GH_GITDATA_THRESHOLD_MB = 1       ← larger uploads use the Git Data API
+#   GH_BRANCH               = "main"  ← branch for Git Data commits (default: repo default)
+#
+#   GH_PULL_MIN_INTERVAL = 10    ← seconds between freshness checks
+#   GH_PULL_SWR          = true  ← log in on the local copy while a refresh runs
+#
+# GitHub is only one storage backend. STORAGE_BACKEND selects another; the
+# GH_SYNC_*, GH_DELTA_*, GH_COMPRESSION* and GH_PULL_* settings above apply
+# to whichever backend is in use.
+#
+#   STORAGE_BACKEND = "local"               ← "github" (default with GH_TOKEN), "local", "s3"
+#   STORAGE_DB_PATH = "virtual360_data.db"  ← local / s3: DB path inside the store
+#   STORAGE_DIR     = "/srv/virtual360"     ← local: directory (default ~/.virtual360/store)
+#
+#   S3_ENDPOINT   = "https://s3.eu-west-1.amazonaws.com"  ← or MinIO, R2, …
+#   S3_BUCKET     = "virtual360"
+#   S3_REGION     = "eu-west-1"
+#   S3_ACCESS_KEY = "AKIA…"
+#   S3_SECRET_KEY = "…"
 # ─────────────────────────────────────────────────────────────────
 
-import base64, urllib.request, urllib.error
+import base64, hmac, urllib.parse, urllib.request, urllib.error
 
 # ── Local DB path ─────────────────────────────────────────────────
 _DATA_DIR = os.path.join(os.path.expanduser("~"), ".virtual360")
 os.makedirs(_DATA_DIR, exist_ok=True)
 DB_PATH = os.path.join(_DATA_DIR, "virtual360_data.db")
 
+# ── Profiler ──────────────────────────────────────────────────────
+#
+# Every script rerun is profiled. Functions marked @_profiled — the DB
+# helpers, remote storage requests, PDF and export rendering, the reset
+# mail — add their wall time, call count and bytes moved to the rerun
+# running on their thread. A call's time and bytes include the profiled
+# calls it makes, and only outermost calls add up to the rerun breakdown,
+# so nothing is counted twice; what is left is widget rendering and other
+# Python. Memoized helpers are profiled inside the read cache, so a cache
+# hit is not counted and call counts are queries that reached SQLite.
+# Calls on other threads (sync worker, deferred downloads) are totalled
+# separately as background work. The admin panel shows the last
+# PROFILER_RERUNS reruns of every session; 0 turns the profiler off.
+#
+#   PROFILER_RERUNS = 50
+@st.cache_resource
+def _profile_local() -> threading.local:
+    # Shared by every rerun's copy of this module, like the profiler itself
+    return threading.local()
+
+
+_prof = _profile_local()
+_PROFILE_CATEGORIES = ("db", "sync", "pdf", "export", "mail")
+
+
+class _Profiler:
+    def __init__(self, keep: int):
+        from collections import deque
+        self.keep       = keep
+        self.reruns     = deque(maxlen=max(keep, 1))
+        self.background = {}            # (category, name) -> [calls, seconds, bytes]
+        self.since      = datetime.now()
+        self._seq       = 0
+        self._lock      = threading.Lock()
+
+    def begin(self):
+        """Start recording the rerun on the calling (script) thread."""
+        if self.keep:
+            _prof.rerun = {"at": datetime.now(), "started": time.perf_counter(), "calls": {}}
+
+    def end(self, label: str):
+        rerun, _prof.rerun = getattr(_prof, "rerun", None), None
+        if rerun is None:
+            return
+        rerun["seconds"] = time.perf_counter() - rerun.pop("started")
+        rerun["label"]   = label
+        with self._lock:
+            self._seq += 1
+            rerun["id"] = self._seq
+            self.reruns.append(rerun)
+
+    def add_background(self, category: str, name: str, seconds: float, nbytes: int):
+        if not self.keep:
+            return
+        with self._lock:
+            stats = self.background.setdefault((category, name), [0, 0.0, 0])
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] += nbytes
+
+    def snapshot(self) -> tuple:
+        """(finished reruns newest first, background totals)."""
+        with self._lock:
+            return (list(reversed(self.reruns)),
+                    {k: list(v) for k, v in self.background.items()})
+
+    def reset(self):
+        with self._lock:
+            self.reruns.clear()
+            self.background.clear()
+            self.since = datetime.now()
+
+
+@st.cache_resource
+def _profiler() -> _Profiler:
+    return _Profiler(int(_db_setting("PROFILER_RERUNS", 50)))
+
+
+def _profiled(category: str):
+    """Record calls to the decorated function in the current rerun's profile."""
+    def decorate(fn):
+        name = fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            stack = getattr(_prof, "stack", None)
+            if stack is None:
+                stack = _prof.stack = []
+            stack.append(0)             # bytes counted by _profile_bytes
+            result = None
+            t0 = time.perf_counter()
+            try:
+                result = fn(*args, **kwargs)
+                return result
+            finally:
+                seconds = time.perf_counter() - t0
+                nbytes  = stack.pop()
+                if not nbytes and isinstance(result, (bytes, bytearray)):
+                    nbytes = len(result)    # e.g. a PDF nothing nested has counted yet
+                if stack:
+                    stack[-1] += nbytes     # the caller's bytes include its callees'
+                rerun = getattr(_prof, "rerun", None)
+                if rerun is not None:
+                    # calls, seconds, bytes, then the same two outside other profiled calls
+                    stats = rerun["calls"].setdefault((category, name), [0, 0.0, 0, 0.0, 0])
+                    stats[0] += 1
+                    stats[1] += seconds
+                    stats[2] += nbytes
+                    if not stack:
+                        stats[3] += seconds
+                        stats[4] += nbytes
+                else:
+                    profiler = getattr(_prof, "profiler", None)
+                    if profiler is None:    # _profiler() costs a cache lookup per call
+                        profiler = _prof.profiler = _profiler()
+                    profiler.add_background(category, name, seconds, nbytes)
+        return wrapper
+    return decorate
+
+
+def _profile_bytes(n: int):
+    """Count *n* bytes sent or received toward the innermost profiled call."""
+    stack = getattr(_prof, "stack", None)
+    if stack:
+        stack[-1] += n
+
+
+def _profile_reruns_frame(reruns: list) -> pd.DataFrame:
+    """One row per rerun: total time, time per category, calls and bytes."""
+    rows = []
+    for r in reruns:
+        row = {"#": r["id"], "At": r["at"], "Rerun": r["label"], "Total ms": r["seconds"] * 1000}
+        spent = 0.0
+        for cat in _PROFILE_CATEGORIES:
+            top = sum(s[3] for (c, _), s in r["calls"].items() if c == cat)
+            row[f"{cat} ms"] = top * 1000
+            spent += top
+        row["Other ms"] = max(r["seconds"] - spent, 0.0) * 1000
+        row["Calls"] = sum(s[0] for s in r["calls"].values())
+        row["Bytes"] = sum(s[4] for s in r["calls"].values())
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def _profile_calls_frame(calls: dict) -> pd.DataFrame:
+    """Per-function breakdown of one rerun (or the background totals), slowest first."""
+    rows = [{"Category": cat, "Function": name, "Calls": s[0], "Total ms": s[1] * 1000,
+             "Mean ms": s[1] * 1000 / s[0], "Bytes": s[2]}
+            for (cat, name), s in calls.items()]
+    df = pd.DataFrame(rows, columns=["Category", "Function", "Calls", "Total ms", "Mean ms",
+                                     "Bytes"])
+    return df.sort_values("Total ms", ascending=False, ignore_index=True)
+
+
 # ── GitHub config (read from secrets) ────────────────────────────
 def _gh_cfg():
     try:
@@ -128,140 +347,2656 @@ def _gh_cfg():
     return None, None, None
 
 
-def _gh_api(method: str, url: str, token: str, body: dict = None):
-    """Minimal GitHub API call without requests library."""
-    import json as _json
-    data = _json.dumps(body).encode() if body else None
-    req  = urllib.request.Request(
-        url, data=data, method=method,
-        headers={
-            "Authorization": f"token {token}",
-            "Accept":        "application/vnd.github+json",
-            "Content-Type":  "application/json",
-            "User-Agent":    "Virtual360-App",
-        }
-    )
-    try:
-        with urllib.request.urlopen(req, timeout=15) as r:
-            return _json.loads(r.read())
-    except urllib.error.HTTPError as e:
-        body = e.read().decode()
-        raise RuntimeError(f"GitHub API {e.code}: {body}")
+class _NotModified(Exception):
+    """A conditional fetch found the remote file unchanged (HTTP 304)."""
+
+
+class _SyncConflict(RuntimeError):
+    """The remote moved under a write (stale SHA, non-fast-forward ref update)."""
+
+
+@_profiled("sync")
+def _gh_request(method: str, url: str, token: str, body: dict = None, etag: str = None):
+    """Minimal GitHub API call without requests library → (data, ETag)."""
+    import json as _json
+    data    = _json.dumps(body).encode() if body else None
+    headers = {
+        "Authorization": f"token {token}",
+        "Accept":        "application/vnd.github+json",
+        "Content-Type":  "application/json",
+        "User-Agent":    "Virtual360-App",
+    }
+    if etag:
+        headers["If-None-Match"] = etag
+    req = urllib.request.Request(url, data=data, method=method, headers=headers)
+    _profile_bytes(len(data or b""))
+    try:
+        with urllib.request.urlopen(req, timeout=15) as r:
+            raw = r.read()
+            _profile_bytes(len(raw))
+            return _json.loads(raw), r.headers.get("ETag")
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            raise _NotModified(url)
+        body = e.read().decode()
+        if e.code == 409:
+            raise _SyncConflict(f"GitHub API {e.code}: {body}")
+        raise RuntimeError(f"GitHub API {e.code}: {body}")
+
+
+def _gh_api(method: str, url: str, token: str, body: dict = None):
+    return _gh_request(method, url, token, body)[0]
+
+
+# ── Sync state (outbox + metadata, kept beside the DB) ───────────
+_SYNC_DB_PATH = os.path.join(_DATA_DIR, "virtual360_sync.db")
+
+
+def _sync_db():
+    conn = sqlite3.connect(_SYNC_DB_PATH, timeout=30, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS outbox (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            reason TEXT NOT NULL DEFAULT '', enqueued_at REAL NOT NULL)""")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS sync_meta (key TEXT PRIMARY KEY, value TEXT)""")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS conflicts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, at REAL NOT NULL,
+            tbl TEXT NOT NULL, pk TEXT NOT NULL, resolution TEXT NOT NULL,
+            local_ts REAL, remote_ts REAL, detail TEXT NOT NULL DEFAULT '')""")
+    return conn
+
+
+def _sync_meta_get(key: str, default=None):
+    conn = _sync_db()
+    try:
+        row = conn.execute("SELECT value FROM sync_meta WHERE key=?", (key,)).fetchone()
+    finally:
+        conn.close()
+    return row[0] if row else default
+
+
+def _sync_meta_set(key: str, value):
+    conn = _sync_db()
+    try:
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO sync_meta VALUES (?,?)",
+                         (key, None if value is None else str(value)))
+    finally:
+        conn.close()
+
+
+def _record_conflicts(conflicts: list):
+    """Keep merge decisions for the admin panel: (tbl, pk, resolution, local_ts, remote_ts, detail)."""
+    if not conflicts:
+        return
+    conn = _sync_db()
+    try:
+        with conn:
+            conn.executemany(
+                "INSERT INTO conflicts (at, tbl, pk, resolution, local_ts, remote_ts, detail) "
+                "VALUES (?,?,?,?,?,?,?)", [(time.time(), *c) for c in conflicts])
+    finally:
+        conn.close()
+    _log.warning("sync recorded %d conflict(s)", len(conflicts))
+
+
+def sync_conflicts(limit: int = 100) -> pd.DataFrame:
+    """Most recent merge conflicts, newest first."""
+    conn = _sync_db()
+    try:
+        df = pd.read_sql_query(
+            "SELECT at, tbl, pk, resolution, local_ts, remote_ts, detail FROM conflicts "
+            "ORDER BY id DESC LIMIT ?", conn, params=(limit,))
+    finally:
+        conn.close()
+    for col in ("at", "local_ts", "remote_ts"):
+        df[col] = pd.to_datetime(df[col], unit="s")
+    return df
+
+
+def clear_sync_conflicts():
+    conn = _sync_db()
+    try:
+        with conn:
+            conn.execute("DELETE FROM conflicts")
+    finally:
+        conn.close()
+
+
+def _outbox_stats() -> dict:
+    conn = _sync_db()
+    try:
+        row = conn.execute(
+            "SELECT COUNT(*), MIN(enqueued_at), MAX(enqueued_at), MAX(id) FROM outbox"
+        ).fetchone()
+    finally:
+        conn.close()
+    return {"depth": row[0], "oldest": row[1], "newest": row[2], "max_id": row[3]}
+
+
+def _conflict_count() -> int:
+    conn = _sync_db()
+    try:
+        return conn.execute("SELECT COUNT(*) FROM conflicts").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def _db_temp_path(suffix: str) -> str:
+    """A new empty file next to the DB, unique per call; the caller removes it."""
+    fd, path = tempfile.mkstemp(prefix=os.path.basename(DB_PATH) + ".", suffix=suffix,
+                                dir=os.path.dirname(DB_PATH))
+    os.close(fd)
+    return path
+
+
+def _snapshot_db_bytes() -> bytes:
+    """Consistent copy of the DB (WAL contents included) via the backup API."""
+    snap_path = _db_temp_path(".snapshot")
+    src = sqlite3.connect(DB_PATH, timeout=30)
+    dst = sqlite3.connect(snap_path)
+    try:
+        src.backup(dst)
+    finally:
+        dst.close()
+        src.close()
+    try:
+        with open(snap_path, "rb") as f:
+            return f.read()
+    finally:
+        os.remove(snap_path)
+
+
+def _sync_setting(key: str, default: float) -> float:
+    try:
+        return float(st.secrets.get(key, default))
+    except Exception:
+        return default
+
+
+def _sync_mode() -> str:
+    """"snapshot" (upload the whole DB) or "delta" (upload row-level changesets)."""
+    try:
+        return str(st.secrets.get("GH_SYNC_MODE", "snapshot")).lower()
+    except Exception:
+        return "snapshot"
+
+
+# ── Snapshot encoding ─────────────────────────────────────────────
+try:
+    import zstandard as _zstd  # optional — pip install zstandard
+except ImportError:
+    _zstd = None
+
+_CODEC_EXT = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+
+
+def _snapshot_codec() -> tuple:
+    """(codec, level) from GH_COMPRESSION / GH_COMPRESSION_LEVEL."""
+    try:
+        codec = str(st.secrets.get("GH_COMPRESSION", "gzip")).lower()
+    except Exception:
+        codec = "gzip"
+    if codec not in _CODEC_EXT or (codec == "zstd" and _zstd is None):
+        codec = "gzip"
+    level = int(_sync_setting("GH_COMPRESSION_LEVEL", 3 if codec == "zstd" else 6))
+    return codec, level
+
+
+def _compress(raw: bytes, codec: str, level: int) -> bytes:
+    if codec == "gzip":
+        return gzip.compress(raw, compresslevel=level, mtime=0)
+    if codec == "zstd":
+        return _zstd.ZstdCompressor(level=level).compress(raw)
+    return raw
+
+
+def _decompress(blob: bytes, codec: str) -> bytes:
+    if codec == "gzip":
+        return gzip.decompress(blob)
+    if codec == "zstd":
+        if _zstd is None:
+            raise RuntimeError("Snapshot is zstd-compressed but zstandard is not installed")
+        return _zstd.ZstdDecompressor().decompress(blob)
+    return blob
+
+
+# ── Repo file access ──────────────────────────────────────────────
+def _gh_fetch(path: str, etag: str = None):
+    """Return (bytes, sha, etag) for a file in the repo, or (None, None, None) if missing.
+
+    With ``etag`` the request is conditional and raises _NotModified when the
+    file has not changed since that ETag was issued.
+    """
+    token, repo, _ = _gh_cfg()
+    try:
+        data, new_etag = _gh_request(
+            "GET", f"https://api.github.com/repos/{repo}/contents/{path}", token, etag=etag)
+    except RuntimeError as e:
+        if "404" in str(e):
+            return None, None, None
+        raise
+    content = data.get("content", "")
+    if data.get("encoding") == "none" or (not content and data.get("size")):
+        # The Contents API omits bodies over 1 MB — fetch the blob directly
+        content = _gh_api("GET", f"https://api.github.com/repos/{repo}/git/blobs/{data['sha']}",
+                          token)["content"]
+    # Cache the SHA so we can update the file (not create a new one)
+    _sync_meta_set(f"sha:{path}", data["sha"])
+    return base64.b64decode(content), data["sha"], new_etag
+
+
+def _gh_get_file(path: str):
+    """Return (bytes, sha) for a file in the repo, or (None, None) if it is missing."""
+    return _gh_fetch(path)[:2]
+
+
+def _gh_put_file(path: str, raw: bytes, message: str, cas: bool = False) -> str:
+    """Create or update a file through the Contents API; returns the new blob SHA.
+
+    With ``cas`` the write only succeeds against the SHA we last read, so a
+    file another replica changed in the meantime raises _SyncConflict
+    instead of being overwritten.
+    """
+    token, repo, _ = _gh_cfg()
+    url  = f"https://api.github.com/repos/{repo}/contents/{path}"
+    body = {"message": message, "content": base64.b64encode(raw).decode()}
+    sha  = _sync_meta_get(f"sha:{path}")
+    if sha:
+        body["sha"] = sha
+    try:
+        data = _gh_api("PUT", url, token, body)
+    except RuntimeError as e:
+        if cas and not isinstance(e, _SyncConflict) and "422" in str(e):
+            raise _SyncConflict(f"{path} was created by another replica") from e
+        if sha or "422" not in str(e):
+            raise
+        # File already exists but we have no SHA cached for it
+        _, body["sha"] = _gh_get_file(path)
+        data = _gh_api("PUT", url, token, body)
+    _sync_meta_set(f"sha:{path}", data["content"]["sha"])
+    return data["content"]["sha"]
+
+
+def _gh_delete_file(path: str, message: str):
+    token, repo, _ = _gh_cfg()
+    sha = _sync_meta_get(f"sha:{path}") or _gh_get_file(path)[1]
+    if sha:
+        _gh_api("DELETE", f"https://api.github.com/repos/{repo}/contents/{path}", token,
+                {"message": message, "sha": sha})
+    _sync_meta_set(f"sha:{path}", None)
+
+
+def _gh_branch() -> str:
+    try:
+        branch = st.secrets.get("GH_BRANCH", "")
+    except Exception:
+        branch = ""
+    if not branch:
+        branch = _sync_meta_get("default_branch")
+    if not branch:
+        token, repo, _ = _gh_cfg()
+        branch = _gh_api("GET", f"https://api.github.com/repos/{repo}", token)["default_branch"]
+        _sync_meta_set("default_branch", branch)
+    return branch
+
+
+def _gh_commit_tree(files: dict, message: str, expect: dict = None):
+    """Write files as one commit through the Git Data API (blobs → tree → commit → ref).
+
+    ``expect`` maps paths to the blob SHA they must still have at the branch
+    head; a mismatch, or the branch moving before the ref update, raises
+    _SyncConflict.
+    """
+    token, repo, _ = _gh_cfg()
+    api    = f"https://api.github.com/repos/{repo}/git"
+    branch = _gh_branch()
+    head   = _gh_api("GET", f"{api}/ref/heads/{branch}", token)["object"]["sha"]
+    base   = _gh_api("GET", f"{api}/commits/{head}", token)["tree"]["sha"]
+    for path, sha in (expect or {}).items():
+        try:
+            current = _gh_api("GET", f"https://api.github.com/repos/{repo}/contents/{path}"
+                                     f"?ref={head}", token)["sha"]
+        except RuntimeError as e:
+            if "404" not in str(e):
+                raise
+            current = None
+        if current != sha:
+            raise _SyncConflict(f"{path} changed on {branch} since it was read")
+
+    entries = []
+    for path, raw in files.items():
+        sha = None
+        if raw is not None:
+            sha = _gh_api("POST", f"{api}/blobs", token,
+                          {"content": base64.b64encode(raw).decode(), "encoding": "base64"})["sha"]
+        entries.append({"path": path, "mode": "100644", "type": "blob", "sha": sha})
+    tree   = _gh_api("POST", f"{api}/trees", token, {"base_tree": base, "tree": entries})
+    commit = _gh_api("POST", f"{api}/commits", token,
+                     {"message": message, "tree": tree["sha"], "parents": [head]})
+    try:
+        _gh_api("PATCH", f"{api}/refs/heads/{branch}", token, {"sha": commit["sha"]})
+    except RuntimeError as e:
+        if "422" in str(e):  # not a fast-forward: someone else committed first
+            raise _SyncConflict(f"{branch} moved during the commit") from e
+        raise
+    for e in entries:
+        _sync_meta_set(f"sha:{e['path']}", e["sha"])
+
+
+def _gh_publish(files: dict, message: str, cas: tuple = ()):
+    """Write {path: bytes} to the repo; a value of None deletes the path.
+
+    Small payloads go through the Contents API one file at a time, in order.
+    Once any file is over GH_GITDATA_THRESHOLD_MB the whole set is written as
+    a single commit through the Git Data API instead, which accepts blobs up
+    to 100 MB. Paths in ``cas`` are only written if they still have the SHA
+    we last read; otherwise _SyncConflict is raised.
+    """
+    limit = _sync_setting("GH_GITDATA_THRESHOLD_MB", 1.0) * 1024 * 1024
+    if any(raw is not None and len(raw) > limit for raw in files.values()):
+        _gh_commit_tree(files, message, {p: _sync_meta_get(f"sha:{p}") for p in cas})
+        return
+    for path, raw in files.items():
+        if raw is None:
+            try:
+                _gh_delete_file(path, message)
+            except RuntimeError:
+                pass  # already gone
+        else:
+            _gh_put_file(path, raw, message, cas=path in cas)
+
+
+# ── Storage backends ──────────────────────────────────────────────
+#
+# Pull and push only need four file operations, so every remote store
+# implements the same ones: fetch (conditional on a version token, raising
+# _NotModified when unchanged), put, delete and publish (several files in
+# order, compare-and-swap on some). Whatever the backend, the last version
+# read of each file is kept in sync_meta as "sha:<path>" — that is what a
+# compare-and-swap put checks against.
+
+class _Storage(abc.ABC):
+    """A remote store for the DB snapshot, manifest and changesets."""
+
+    label = ""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path  # the other remote files are named after it
+
+    @abc.abstractmethod
+    def target(self) -> str:
+        """Where the DB lives, for display and to notice a change of store."""
+
+    @abc.abstractmethod
+    def fetch(self, path: str, etag: str = None):
+        """(bytes, version, etag), or (None, None, None) if missing; _NotModified if unchanged."""
+
+    @abc.abstractmethod
+    def put(self, path: str, raw: bytes, message: str, cas: bool = False) -> str:
+        """Write one file and return its new version; _SyncConflict if a ``cas`` write lost."""
+
+    @abc.abstractmethod
+    def delete(self, path: str, message: str):
+        """Remove one file; a file already gone is not an error."""
+
+    def get(self, path: str):
+        return self.fetch(path)[:2]
+
+    def publish(self, files: dict, message: str, cas: tuple = ()):
+        """Write {path: bytes} in order; None deletes. Paths in ``cas`` are compare-and-swap."""
+        for path, raw in files.items():
+            if raw is None:
+                self.delete(path, message)
+            else:
+                self.put(path, raw, message, cas=path in cas)
+
+
+class _GitHubStorage(_Storage):
+    label = "GitHub"
+
+    def __init__(self, repo: str, db_path: str):
+        super().__init__(db_path)
+        self.repo = repo
+
+    def target(self) -> str:
+        return f"{self.repo}/{self.db_path}"
+
+    def fetch(self, path, etag=None):
+        return _gh_fetch(path, etag)
+
+    def put(self, path, raw, message, cas=False):
+        return _gh_put_file(path, raw, message, cas)
+
+    def delete(self, path, message):
+        _gh_delete_file(path, message)
+
+    def publish(self, files, message, cas=()):
+        _gh_publish(files, message, cas)
+
+
+try:
+    import fcntl  # POSIX only — elsewhere the local store is locked per process
+except ImportError:
+    fcntl = None
+
+
+class _LocalStorage(_Storage):
+    """Files in a local directory — offline runs and benchmarks, or a shared volume.
+
+    The version of a file is its inode, mtime and size, so a freshness check
+    is one stat(). Writes go to a temp file and are renamed into place under
+    an flock on <dir>/.lock, which also makes publish() atomic for readers.
+    """
+
+    label = "Local"
+
+    def __init__(self, root: str, db_path: str):
+        super().__init__(db_path)
+        self.root  = os.path.abspath(root)
+        self._lock = threading.Lock()
+        os.makedirs(self.root, exist_ok=True)
+
+    def target(self) -> str:
+        return os.path.join(self.root, self.db_path)
+
+    def _file(self, path: str) -> str:
+        full = os.path.abspath(os.path.join(self.root, path))
+        if not full.startswith(self.root + os.sep):
+            raise ValueError(f"{path} is outside {self.root}")
+        return full
+
+    def _version(self, path: str):
+        try:
+            info = os.stat(self._file(path))
+        except FileNotFoundError:
+            return None
+        return f"{info.st_ino:x}-{info.st_mtime_ns:x}-{info.st_size:x}"
+
+    @contextlib.contextmanager
+    def _locked(self):
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            with open(os.path.join(self.root, ".lock"), "a") as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _check(self, path: str):
+        if self._version(path) != _sync_meta_get(f"sha:{path}"):
+            raise _SyncConflict(f"{path} changed since it was read")
+
+    def _write(self, path: str, raw: bytes) -> str:
+        full = self._file(path)
+        os.makedirs(os.path.dirname(full), exist_ok=True)
+        tmp = f"{full}.{os.getpid()}.tmp"
+        _profile_bytes(len(raw))
+        with open(tmp, "wb") as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, full)
+        version = self._version(path)
+        _sync_meta_set(f"sha:{path}", version)
+        return version
+
+    def _remove(self, path: str):
+        try:
+            os.remove(self._file(path))
+        except FileNotFoundError:
+            pass  # already gone
+        _sync_meta_set(f"sha:{path}", None)
+
+    @_profiled("sync")
+    def fetch(self, path, etag=None):
+        with self._locked():
+            version = self._version(path)
+            if version is None:
+                return None, None, None
+            if etag and etag == version:
+                raise _NotModified(path)
+            with open(self._file(path), "rb") as f:
+                raw = f.read()
+        _profile_bytes(len(raw))
+        _sync_meta_set(f"sha:{path}", version)
+        return raw, version, version
+
+    @_profiled("sync")
+    def put(self, path, raw, message, cas=False):
+        with self._locked():
+            if cas:
+                self._check(path)
+            return self._write(path, raw)
+
+    @_profiled("sync")
+    def delete(self, path, message):
+        with self._locked():
+            self._remove(path)
+
+    @_profiled("sync")
+    def publish(self, files, message, cas=()):
+        with self._locked():
+            for path in cas:
+                self._check(path)
+            for path, raw in files.items():
+                if raw is None:
+                    self._remove(path)
+                else:
+                    self._write(path, raw)
+
+
+class _S3Storage(_Storage):
+    """An S3-compatible bucket (AWS, MinIO, R2, …) over plain HTTP with SigV4 signing.
+
+    Freshness checks are If-None-Match GETs; compare-and-swap puts use
+    If-Match / If-None-Match: * conditional writes, so the endpoint must
+    support those.
+    """
+
+    label = "S3"
+
+    def __init__(self, endpoint: str, bucket: str, region: str,
+                 access_key: str, secret_key: str, db_path: str):
+        super().__init__(db_path)
+        self.endpoint   = endpoint.rstrip("/")
+        self.bucket     = bucket
+        self.region     = region
+        self.access_key = access_key
+        self.secret_key = secret_key
+
+    def target(self) -> str:
+        return f"s3://{self.bucket}/{self.db_path}"
+
+    def _sign(self, method: str, uri: str, payload: bytes) -> dict:
+        now   = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+        scope = f"{now[:8]}/{self.region}/s3/aws4_request"
+        headers = {
+            "host":                 urllib.parse.urlsplit(self.endpoint).netloc,
+            "x-amz-content-sha256": hashlib.sha256(payload).hexdigest(),
+            "x-amz-date":           now,
+        }
+        signed    = ";".join(sorted(headers))
+        canonical = "\n".join([method, uri, "",
+                               "".join(f"{k}:{headers[k]}\n" for k in sorted(headers)),
+                               signed, headers["x-amz-content-sha256"]])
+        to_sign = "\n".join(["AWS4-HMAC-SHA256", now, scope,
+                             hashlib.sha256(canonical.encode()).hexdigest()])
+        key = f"AWS4{self.secret_key}".encode()
+        for part in (now[:8], self.region, "s3", "aws4_request"):
+            key = hmac.new(key, part.encode(), hashlib.sha256).digest()
+        signature = hmac.new(key, to_sign.encode(), hashlib.sha256).hexdigest()
+        headers["Authorization"] = (f"AWS4-HMAC-SHA256 Credential={self.access_key}/{scope}, "
+                                    f"SignedHeaders={signed}, Signature={signature}")
+        return headers
+
+    @_profiled("sync")
+    def _request(self, method: str, path: str, body: bytes = b"", headers: dict = None):
+        """(body, response headers), or (None, None) for 404."""
+        uri = "/" + urllib.parse.quote(f"{self.bucket}/{path}", safe="/-_.~")
+        req = urllib.request.Request(
+            self.endpoint + uri, data=body if method == "PUT" else None, method=method,
+            headers={**self._sign(method, uri, body), **(headers or {})})
+        _profile_bytes(len(body))
+        try:
+            with urllib.request.urlopen(req, timeout=30) as r:
+                raw = r.read()
+                _profile_bytes(len(raw))
+                return raw, r.headers
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                raise _NotModified(path)
+            if e.code == 404:
+                return None, None
+            if e.code in (409, 412):
+                raise _SyncConflict(f"S3 {e.code}: {path} changed since it was read")
+            raise RuntimeError(f"S3 {e.code}: {e.read().decode(errors='replace')[:300]}")
+
+    def fetch(self, path, etag=None):
+        raw, headers = self._request("GET", path, headers={"If-None-Match": etag} if etag else None)
+        if raw is None:
+            return None, None, None
+        version = headers.get("ETag")
+        _sync_meta_set(f"sha:{path}", version)
+        return raw, version, version
+
+    def put(self, path, raw, message, cas=False):
+        conditions = {}
+        if cas:
+            version = _sync_meta_get(f"sha:{path}")
+            conditions = {"If-Match": version} if version else {"If-None-Match": "*"}
+        _, headers = self._request("PUT", path, raw, conditions)
+        if headers is None:  # If-Match on an object that has since been deleted
+            raise _SyncConflict(f"{path} was deleted since it was read")
+        _sync_meta_set(f"sha:{path}", headers.get("ETag"))
+        return headers.get("ETag")
+
+    def delete(self, path, message):
+        self._request("DELETE", path)
+        _sync_meta_set(f"sha:{path}", None)
+
+
+def _storage_setting(key: str, default: str = "") -> str:
+    try:
+        return str(st.secrets.get(key, default))
+    except Exception:
+        return default
+
+
+@st.cache_resource
+def _storage():
+    """The configured remote store, or None to run on the local SQLite file alone."""
+    backend = _storage_setting("STORAGE_BACKEND").lower() or ("github" if _gh_cfg()[0] else "")
+    db_path = _storage_setting("STORAGE_DB_PATH", "virtual360_data.db")
+    if backend == "github":
+        _, repo, gh_path = _gh_cfg()
+        store = _GitHubStorage(repo, gh_path) if repo else None
+    elif backend == "local":
+        store = _LocalStorage(_storage_setting("STORAGE_DIR", os.path.join(_DATA_DIR, "store")),
+                              db_path)
+    elif backend == "s3":
+        store = _S3Storage(_storage_setting("S3_ENDPOINT", "https://s3.amazonaws.com"),
+                           _storage_setting("S3_BUCKET"),
+                           _storage_setting("S3_REGION", "us-east-1"),
+                           _storage_setting("S3_ACCESS_KEY"), _storage_setting("S3_SECRET_KEY"),
+                           db_path)
+    else:
+        store = None
+    if store is not None:
+        previous = _sync_meta_get("storage_target")
+        if previous and previous != store.target():
+            _forget_remote_state()  # pointed at a different store: nothing cached applies
+        _sync_meta_set("storage_target", store.target())
+    return store
+
+
+def _forget_remote_state():
+    conn = _sync_db()
+    try:
+        with conn:
+            conn.execute(
+                "DELETE FROM sync_meta WHERE key GLOB 'sha:*' OR key GLOB 'etag:*' OR key IN "
+                "('base_sha256', 'applied_changesets', 'refused_sha256', 'last_pull_check')")
+    finally:
+        conn.close()
+
+
+def _restore_db_bytes(raw: bytes):
+    """Replace the local DB contents in place (safe while connections are open)."""
+    if _outbox_stats()["depth"]:
+        raise RuntimeError("Local writes are waiting to be pushed — pull aborted")
+    incoming = _db_temp_path(".incoming")
+    with open(incoming, "wb") as f:
+        f.write(raw)
+    src = sqlite3.connect(incoming)
+    dst = sqlite3.connect(DB_PATH, timeout=30)
+    try:
+        src.backup(dst)
+    finally:
+        dst.close()
+        src.close()
+        os.remove(incoming)
+
+
+# ── Pull / push ───────────────────────────────────────────────────
+#
+# Remote layout, the same in every store (GH_DB_PATH = data/virtual360_data.db,
+# GH_COMPRESSION = gzip):
+#
+#   data/virtual360_data.db.<sha256[:16]>.gz ← compressed base snapshot
+#   data/virtual360_data.db.manifest.json    ← codec, sha256 of the base, changesets
+#   data/virtual360_data.db.changes/*.json   ← delta mode only, in replay order
+#
+# The manifest is the commit point: it is always written last, and only
+# against the SHA we last read, so two replicas can never both move it.
+# Base snapshots are named by checksum, so uploading one never touches the
+# base another replica's manifest still points at.
+#
+# A plain data/virtual360_data.db without a manifest is still pulled, so
+# repos synced by older versions keep working.
+
+@st.cache_resource
+def _sync_lock() -> threading.RLock:
+    """Held by every pull, merge and push, so no two overlap in this process.
+
+    Re-entrant: discarding local writes pulls while holding it.
+    """
+    return threading.RLock()
+
+
+@_profiled("sync")
+def gh_pull_db(force: bool = False):
+    """Bring the local DB up to date with the remote store.
+
+    Each file is fetched with If-None-Match against the ETag of the last
+    successful pull, so an unchanged remote costs one 304 response and no
+    download. Checks closer together than GH_PULL_MIN_INTERVAL seconds are
+    skipped outright unless ``force`` is set.
+    """
+    if _storage() is None:
+        return  # No remote store configured — use local SQLite as-is
+    with _sync_lock():
+        _gh_pull(force)
+
+
+def _gh_pull(force: bool):
+    if _outbox_stats()["depth"]:
+        return  # Local copy has writes not pushed yet — the sync worker will upload them
+    last_check = float(_sync_meta_get("last_pull_check", 0))
+    if not force and time.time() - last_check < _sync_setting("GH_PULL_MIN_INTERVAL", 10.0):
+        return
+    try:
+        if not _gh_pull_manifest():
+            _gh_pull_legacy()
+    except _NotModified:
+        pass  # remote unchanged since our last pull
+    except Exception as e:
+        # The app keeps working on the local copy; the admin panel shows the error
+        _log.warning("pull failed: %s", e)
+        _sync_meta_set("last_pull_error", f"{datetime.now():%H:%M:%S} {e}")
+        return
+    _sync_meta_set("last_pull_check", time.time())
+    _sync_meta_set("last_pull_error", None)
+
+
+def _gh_pull_legacy():
+    """Pull a plain, uncompressed DB file (repos synced before manifests existed)."""
+    gh_path = _storage().db_path
+    etag    = _sync_meta_get(f"etag:{gh_path}") if os.path.exists(DB_PATH) else None
+    raw, _, new_etag = _storage().fetch(gh_path, etag)
+    if raw is None:
+        return  # File doesn't exist yet — will be created on first write
+    _restore_db_bytes(raw)
+    _changelog_mark_synced()
+    _sync_meta_set(f"etag:{gh_path}", new_etag)
+
+
+def gh_pull_db_async():
+    """Run gh_pull_db in the background unless a pull is already in flight."""
+    _startup().refresh(force=False)
+
+
+def _gh_upload_snapshot(previous: dict = None) -> bytes:
+    """Upload the whole DB (compressed) and point the manifest at it.
+
+    ``previous`` is the manifest this upload replaces; its changesets and
+    base are deleted once the new manifest is in place.
+    """
+    raw    = _snapshot_db_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    codec, level = _snapshot_codec()
+    base_path    = f"{_storage().db_path}.{digest[:16]}{_CODEC_EXT[codec]}"
+    manifest = {
+        "base": base_path, "codec": codec, "sha256": digest, "size": len(raw),
+        "changesets": [], "updated": datetime.now().isoformat(timespec="seconds"),
+        "schema": SCHEMA_VERSION,
+    }
+    files = {base_path: _compress(raw, codec, level),
+             _gh_manifest_path(): json.dumps(manifest, indent=1).encode()}
+    if previous:
+        files.update({name: None for name in previous.get("changesets", [])})
+        if previous.get("base") != base_path:
+            files[previous["base"]] = None
+    _storage().publish(files, f"chore: sync db {datetime.now().strftime('%Y-%m-%d %H:%M')} "
+                              f"[sha256:{digest}]", cas=(_gh_manifest_path(),))
+    _sync_meta_set("base_sha256", digest)
+    _sync_meta_set("applied_changesets", "[]")
+    return raw
+
+
+def _gh_upload_db():
+    """Push local changes to the remote store. Raises on failure; used by the sync worker."""
+    if _storage() is None:
+        return
+    with _sync_lock():
+        _gh_upload()
+
+
+def _gh_upload():
+    if _sync_mode() == "delta":
+        _gh_push_delta()
+        return
+    manifest, _ = _gh_get_manifest()
+    if manifest and manifest["sha256"] != _sync_meta_get("base_sha256"):
+        # Whole-file snapshots cannot be merged: refuse rather than clobber
+        # another replica's upload. Delta mode merges these at row level.
+        if _sync_meta_get("refused_sha256") != manifest["sha256"]:  # once, not per retry
+            _record_conflicts([("*", manifest["sha256"][:16], "push refused", None, None,
+                                "remote snapshot changed since the last pull")])
+            _sync_meta_set("refused_sha256", manifest["sha256"])
+        raise _SyncConflict("Remote database changed since the last pull — pick a side under "
+                            "Sync conflicts, or set GH_SYNC_MODE = \"delta\" to merge replicas")
+    _gh_upload_snapshot(manifest)
+
+
+@_profiled("sync")
+def gh_force_push():
+    """Overwrite the remote with the local DB, dropping remote changes not pulled yet."""
+    with _sync_lock():
+        manifest, _ = _gh_get_manifest()
+        if _sync_mode() == "delta":
+            _gh_compact(manifest)
+        else:
+            _gh_upload_snapshot(manifest)
+
+
+@_profiled("sync")
+def gh_discard_local():
+    """Drop writes not pushed yet and pull the remote over them."""
+    with _sync_lock():
+        conn = _sync_db()
+        try:
+            with conn:
+                conn.execute("DELETE FROM outbox")
+        finally:
+            conn.close()
+        _changelog_mark_synced()
+        _sync_meta_set("base_sha256", None)  # force the base to be fetched again
+        gh_pull_db(force=True)
+
+
+# ── Delta sync  (GH_SYNC_MODE = "delta") ──────────────────────────
+#
+# Every row change is captured by triggers into _changelog, and its time
+# into _row_versions. A push first merges whatever other replicas published
+# since our last pull (see "Merging replicas"), then uploads only the rows
+# changed since the last push as a changeset file and appends it to the
+# manifest. Once GH_DELTA_COMPACT_EVERY changesets pile up, the next push
+# uploads a fresh base snapshot and drops them. A pull fetches the base
+# only when its checksum changed (a copy is cached locally) and replays
+# changesets on top.
+
+_SYNC_TABLES = {
+    # table: (primary key, columns)
+    "users":            ("username",    ["username", "display_name", "role",
+                                         "password_hash"]),
+    "tenants":          ("id",          ["id", "tenant_name", "tenant_type"]),
+    "user_tenants":     ("id",          ["id", "username", "tenant_id"]),
+    "tenant_types":     ("type_name",   ["type_name"]),
+    "assessments":      ("id",          ["id", "assessment_name", "tenant_id",
+                                         "date_added", "created_by"]),
+    "assessment_areas": ("id",          ["id", "assessment_id", "area_name",
+                                         "category", "sqft"]),
+}
+_BASE_CACHE_PATH = DB_PATH + ".base"
+_NOW_SQL = "(julianday('now') - 2440587.5) * 86400.0"  # unix time with sub-second precision
+
+
+def _touch_sql(tbl: str, pk: str) -> str:
+    # An upsert, not OR REPLACE: a trigger's conflict clause yields to the outer statement's
+    return (f"INSERT INTO _row_versions (tbl, pk, ts) VALUES ('{tbl}', {pk}, {_NOW_SQL}) "
+            f"ON CONFLICT (tbl, pk) DO UPDATE SET ts=excluded.ts;")
+
+
+def _install_changelog(conn, enabled: bool):
+    """Create (or drop) the _changelog table triggers for delta sync.
+
+    Inserts are logged as 'I' so a merge can tell a new row from an edit;
+    every write also stamps the row's modification time in _row_versions
+    (deletes leave the stamp behind as a tombstone).
+    """
+    total, current = conn.execute(
+        "SELECT COUNT(*), COALESCE(SUM(sql LIKE '%_row_versions%'),0) FROM sqlite_master "
+        "WHERE type='trigger' AND name GLOB '_log_*'").fetchone()
+    if (total == current == 3 * len(_SYNC_TABLES)) if enabled else total == 0:
+        return  # already in the requested state
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS _changelog (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            tbl TEXT NOT NULL, op TEXT NOT NULL, pk TEXT NOT NULL, row TEXT)""")
+    for tbl, (pk, cols) in _SYNC_TABLES.items():
+        for event in ("insert", "update", "delete"):
+            conn.execute(f"DROP TRIGGER IF EXISTS _log_{tbl}_{event}")
+        if not enabled:
+            continue
+        new_row = "json_object(" + ", ".join(f"'{c}', NEW.{c}" for c in cols) + ")"
+        conn.execute(f"""
+            CREATE TRIGGER _log_{tbl}_insert AFTER INSERT ON {tbl} BEGIN
+                INSERT INTO _changelog (tbl, op, pk, row)
+                VALUES ('{tbl}', 'I', NEW.{pk}, {new_row});
+                {_touch_sql(tbl, f"NEW.{pk}")}
+            END""")
+        conn.execute(f"""
+            CREATE TRIGGER _log_{tbl}_update AFTER UPDATE ON {tbl} BEGIN
+                INSERT INTO _changelog (tbl, op, pk, row)
+                SELECT '{tbl}', 'D', OLD.{pk}, NULL WHERE OLD.{pk} IS NOT NEW.{pk};
+                INSERT INTO _row_versions (tbl, pk, ts)
+                SELECT '{tbl}', OLD.{pk}, {_NOW_SQL} WHERE OLD.{pk} IS NOT NEW.{pk}
+                ON CONFLICT (tbl, pk) DO UPDATE SET ts=excluded.ts;
+                INSERT INTO _changelog (tbl, op, pk, row)
+                VALUES ('{tbl}', 'U', NEW.{pk}, {new_row});
+                {_touch_sql(tbl, f"NEW.{pk}")}
+            END""")
+        conn.execute(f"""
+            CREATE TRIGGER _log_{tbl}_delete AFTER DELETE ON {tbl} BEGIN
+                INSERT INTO _changelog (tbl, op, pk, row)
+                VALUES ('{tbl}', 'D', OLD.{pk}, NULL);
+                {_touch_sql(tbl, f"OLD.{pk}")}
+            END""")
+    if not enabled:
+        conn.execute("DELETE FROM _changelog")
+    conn.commit()
+
+
+def _changelog_max_seq(conn) -> int:
+    try:
+        return conn.execute("SELECT COALESCE(MAX(seq),0) FROM _changelog").fetchone()[0]
+    except sqlite3.OperationalError:
+        return 0  # DB predates delta sync
+
+
+def _changelog_mark_synced():
+    """Treat everything currently in _changelog as already on the remote."""
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    try:
+        seq = _changelog_max_seq(conn)
+        if seq:
+            with conn:
+                conn.execute("DELETE FROM _changelog WHERE seq<=?", (seq,))
+    finally:
+        conn.close()
+    _sync_meta_set("last_pushed_seq", seq)
+
+
+def _gh_manifest_path() -> str:
+    return _storage().db_path + ".manifest.json"
+
+
+def _gh_get_manifest(etag: str = None):
+    """Return (manifest, etag); (None, None) if the repo has no manifest yet."""
+    raw, _, new_etag = _storage().fetch(_gh_manifest_path(), etag)
+    return (json.loads(raw), new_etag) if raw is not None else (None, None)
+
+
+def _gh_fetch_base(manifest: dict) -> bytes:
+    """Download and decompress the base snapshot, verifying its checksum."""
+    blob, _ = _storage().get(manifest["base"])
+    if blob is None:
+        raise RuntimeError(f"Manifest points at missing snapshot {manifest['base']}")
+    raw = _decompress(blob, manifest.get("codec", "none"))
+    if hashlib.sha256(raw).hexdigest() != manifest["sha256"]:
+        raise RuntimeError(f"Checksum mismatch for {manifest['base']}")
+    return raw
+
+
+def _apply_changeset(conn, changeset: dict):
+    for ch in changeset["changes"]:
+        pk = _SYNC_TABLES[ch["t"]][0]
+        if ch["op"] == "D":
+            conn.execute(f"DELETE FROM {ch['t']} WHERE {pk}=?", (ch["pk"],))
+        else:
+            row = ch["row"]
+            # The writer's columns: an older replica's rows predate later migrations
+            cols = [c for c in row if c.isidentifier()]
+            conn.execute(
+                f"INSERT INTO {ch['t']} ({','.join(cols)}) VALUES ({','.join('?' * len(cols))}) "
+                f"ON CONFLICT({pk}) DO UPDATE SET "
+                + ",".join(f"{c}=excluded.{c}" for c in cols if c != pk),
+                [row.get(c) for c in cols])
+        if "ts" in ch:  # keep the origin's modification time, not the replay time
+            conn.execute("INSERT OR REPLACE INTO _row_versions (tbl, pk, ts) VALUES (?,?,?)",
+                         (ch["t"], str(ch["pk"]), ch["ts"]))
+
+
+def _db_schema() -> int:
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    try:
+        return conn.execute("PRAGMA user_version").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def _gh_pull_manifest() -> bool:
+    """Bring the local DB up to the remote base + changesets. False if no manifest."""
+    path = _gh_manifest_path()
+    etag = _sync_meta_get(f"etag:{path}") if os.path.exists(DB_PATH) else None
+    manifest, new_etag = _gh_get_manifest(etag)
+    if manifest is None:
+        return False
+    applied = json.loads(_sync_meta_get("applied_changesets", "[]"))
+    remote  = manifest.get("changesets", [])
+
+    if manifest["sha256"] != _sync_meta_get("base_sha256") or not os.path.exists(DB_PATH):
+        raw = _gh_fetch_base(manifest)
+        _restore_db_bytes(raw)
+        if _sync_mode() == "delta":
+            with open(_BASE_CACHE_PATH, "wb") as f:
+                f.write(raw)
+        _sync_meta_set("base_sha256", manifest["sha256"])
+        applied = []
+    elif (remote[:len(applied)] != applied
+          or (remote[len(applied):] and _db_schema() != manifest.get("schema", 0))):
+        # Local replay history diverged from the remote, or the local DB was
+        # migrated past the schema the changesets were written in — start
+        # over from the base (init_db migrates it again after the pull)
+        if os.path.exists(_BASE_CACHE_PATH):
+            with open(_BASE_CACHE_PATH, "rb") as f:
+                raw = f.read()
+        else:
+            raw = _gh_fetch_base(manifest)
+        _restore_db_bytes(raw)
+        applied = []
+    # else: local copy already matches the remote base — nothing to download
+
+    pending = remote[len(applied):]
+    if pending:
+        if _outbox_stats()["depth"]:
+            raise RuntimeError("Local writes are waiting to be pushed — pull aborted")
+        conn = sqlite3.connect(DB_PATH, timeout=30)
+        try:
+            with conn:
+                for name in pending:
+                    raw, _ = _storage().get(name)
+                    _apply_changeset(conn, json.loads(raw))
+        finally:
+            conn.close()
+    _changelog_mark_synced()  # replayed rows are already on the remote
+    _sync_meta_set("applied_changesets", json.dumps(remote))
+    _sync_meta_set(f"etag:{path}", new_etag)
+    return True
+
+
+def _gh_compact(manifest: dict = None):
+    """Upload a fresh base snapshot and drop the changesets folded into it."""
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    try:
+        seq = _changelog_max_seq(conn)
+    finally:
+        conn.close()
+    raw = _gh_upload_snapshot(manifest)
+    _sync_meta_set("last_pushed_seq", seq)
+    with open(_BASE_CACHE_PATH, "wb") as f:
+        f.write(raw)
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    try:
+        with conn:
+            conn.execute("DELETE FROM _changelog WHERE seq<=?", (seq,))
+    finally:
+        conn.close()
+
+
+def _backoff(attempt: int, base: float, cap: float) -> float:
+    """Exponential backoff with jitter: half the step fixed, half random."""
+    step = min(cap, base * 2 ** attempt)
+    return step / 2 + random.uniform(0, step / 2)
+
+
+def _gh_push_delta():
+    """Merge the remote, then upload rows changed since the last push.
+
+    The manifest is written only against the SHA read at the start of the
+    round, so when another replica pushed in between the whole round
+    (read → merge → publish) is retried, up to GH_SYNC_ATTEMPTS times.
+    """
+    attempts = int(_sync_setting("GH_SYNC_ATTEMPTS", 5))
+    for attempt in range(attempts):
+        try:
+            _gh_push_delta_once()
+            return
+        except _SyncConflict as e:
+            if attempt == attempts - 1:
+                raise
+            delay = _backoff(attempt, 0.5, 8.0)
+            _log.info("push raced another replica (%s); retrying in %.1fs", e, delay)
+            time.sleep(delay)
+
+
+def _gh_push_delta_once():
+    manifest, _ = _gh_get_manifest()
+    schema = (manifest or {}).get("schema", 0)
+    if schema > SCHEMA_VERSION:
+        raise RuntimeError(f"Remote database has schema {schema} but this app only knows "
+                           f"{SCHEMA_VERSION} — upgrade it before syncing")
+    if manifest is not None and schema == SCHEMA_VERSION:
+        _merge_remote(manifest)
+    if (manifest is None or schema < SCHEMA_VERSION
+            or len(manifest["changesets"]) >= _sync_setting("GH_DELTA_COMPACT_EVERY", 50)):
+        _gh_compact(manifest)  # also rebases the remote after a schema migration
+        return
+
+    last = int(_sync_meta_get("last_pushed_seq", 0))
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    conn.row_factory = sqlite3.Row
+    try:
+        if _changelog_max_seq(conn) < last:
+            last = 0  # local DB was reset since the last push
+        rows = conn.execute(
+            "SELECT c.seq, c.tbl, c.op, c.pk, c.row, v.ts FROM _changelog c "
+            "LEFT JOIN _row_versions v ON v.tbl=c.tbl AND v.pk=c.pk "
+            "WHERE c.seq>? ORDER BY c.seq", (last,)
+        ).fetchall()
+    finally:
+        conn.close()
+    if not rows:
+        return
+
+    changeset = {
+        "from_seq": rows[0]["seq"], "to_seq": rows[-1]["seq"],
+        "created":  datetime.now().isoformat(timespec="seconds"),
+        "changes":  [{"t": r["tbl"], "op": r["op"], "pk": r["pk"], "ts": r["ts"] or 0.0,
+                      "row": json.loads(r["row"]) if r["row"] else None} for r in rows],
+    }
+    # Random suffix: replicas number their changelogs independently, so the
+    # time and seq range alone can name two different changesets alike
+    name = (f"{_storage().db_path}.changes/{datetime.now():%Y%m%d%H%M%S}-"
+            f"{changeset['from_seq']}-{changeset['to_seq']}-{secrets.token_hex(4)}.json")
+    manifest["changesets"].append(name)
+    manifest["updated"] = changeset["created"]
+    try:
+        _storage().publish({
+            name:                 json.dumps(changeset, separators=(",", ":")).encode(),
+            _gh_manifest_path():  json.dumps(manifest, indent=1).encode(),
+        }, f"chore: db changeset {changeset['from_seq']}-{changeset['to_seq']}",
+           cas=(name, _gh_manifest_path()))
+    except _SyncConflict:
+        try:
+            _storage().delete(name, "chore: drop unpublished changeset")
+        except Exception:
+            pass  # an unreferenced changeset file is harmless
+        raise
+    _sync_meta_set("applied_changesets", json.dumps(manifest["changesets"]))
+    _sync_meta_set("last_pushed_seq", changeset["to_seq"])
+
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    try:
+        with conn:
+            conn.execute("DELETE FROM _changelog WHERE seq<=?", (changeset["to_seq"],))
+    finally:
+        conn.close()
+
+
+# ── Merging replicas ──────────────────────────────────────────────
+#
+# Before a push, whatever other replicas published since our last pull is
+# merged into the local DB in one write transaction:
+#
+#   * rows only the remote touched are taken as they are;
+#   * rows both sides touched go to the later modification time in
+#     _row_versions, and every such decision lands in the conflicts table;
+#   * ids both sides inserted independently are renumbered here (child rows
+#     follow) before the remote rows land;
+#   * a tenant name both sides added keeps the remote row;
+#   * local rows left pointing at a parent the remote deleted are dropped.
+#
+# Normally the remote changes are the changesets we have not applied yet.
+# When another replica compacted in the meantime, they are the row
+# differences between its base (plus changesets) and the local tables.
+
+_SYNC_CHILDREN = {
+    # parent table: [(child table, foreign key column)]
+    "assessments": [("assessment_areas", "assessment_id")],
+    "tenants":     [("user_tenants", "tenant_id"), ("assessments", "tenant_id")],
+}
+
+
+def _merge_remote(manifest: dict):
+    """Merge remote changes we have not seen into the local DB."""
+    applied = json.loads(_sync_meta_get("applied_changesets", "[]"))
+    names   = manifest.get("changesets", [])
+    rebased = (manifest["sha256"] != _sync_meta_get("base_sha256")
+               or names[:len(applied)] != applied)
+    if not rebased and len(names) == len(applied):
+        return  # nothing new on the remote
+
+    changes = []
+    remote_path = _db_temp_path(".remote") if rebased else None
+    try:
+        if rebased:
+            raw = _gh_fetch_base(manifest)
+            with open(remote_path, "wb") as f:
+                f.write(raw)
+            rconn = sqlite3.connect(remote_path)
+            try:
+                with rconn:
+                    for name in names:
+                        _apply_changeset(rconn, json.loads(_storage().get(name)[0]))
+            finally:
+                rconn.close()
+        else:
+            for name in names[len(applied):]:
+                changes.extend(json.loads(_storage().get(name)[0])["changes"])
+
+        conn = sqlite3.connect(DB_PATH, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            if rebased:
+                conn.execute("ATTACH DATABASE ? AS remote", (remote_path,))
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if rebased:
+                    changes = _remote_differences(conn)
+                conflicts = _merge_changes(conn, changes)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            conn.close()
+    finally:
+        if remote_path:
+            os.remove(remote_path)
+
+    if rebased:
+        with open(_BASE_CACHE_PATH, "wb") as f:
+            f.write(raw)
+        _sync_meta_set("base_sha256", manifest["sha256"])
+    _sync_meta_set("applied_changesets", json.dumps(names))
+    _record_conflicts(conflicts)
+    if changes:
+        user_directory().invalidate()
+
+
+def _remote_differences(conn) -> list:
+    """Changes that turn the local sync tables into the attached 'remote' database.
+
+    Inserts and updates come parent table first, deletes child table first,
+    the order a replica's own changelog has them in.
+    """
+    changes, deletes = [], []
+    for tbl, (pk, cols) in _SYNC_TABLES.items():
+        differs = " OR ".join(f"l.{c} IS NOT r.{c}" for c in cols if c != pk) or "0"
+        for r in conn.execute(f"""
+                SELECT {', '.join(f'r.{c}' for c in cols)}, l.{pk} IS NULL AS _new, v.ts AS _ts
+                FROM remote.{tbl} r
+                LEFT JOIN main.{tbl} l ON l.{pk}=r.{pk}
+                LEFT JOIN remote._row_versions v ON v.tbl='{tbl}' AND v.pk=r.{pk}
+                WHERE l.{pk} IS NULL OR {differs}"""):
+            changes.append({"t": tbl, "op": "I" if r["_new"] else "U", "pk": str(r[pk]),
+                            "ts": r["_ts"] or 0.0, "row": {c: r[c] for c in cols}, "base": True})
+    for tbl, (pk, cols) in reversed(_SYNC_TABLES.items()):
+        for r in conn.execute(f"""
+                SELECT l.{pk} AS pk, v.ts AS _ts FROM main.{tbl} l
+                LEFT JOIN remote._row_versions v ON v.tbl='{tbl}' AND v.pk=l.{pk}
+                WHERE NOT EXISTS (SELECT 1 FROM remote.{tbl} r WHERE r.{pk}=l.{pk})"""):
+            deletes.append({"t": tbl, "op": "D", "pk": str(r["pk"]), "ts": r["_ts"] or 0.0,
+                            "row": None, "base": True})
+    return changes + deletes
+
+
+def _merge_changes(conn, changes: list) -> list:
+    """Apply remote *changes* over unpushed local ones; returns the conflicts."""
+    last = int(_sync_meta_get("last_pushed_seq", 0))
+    pending = {(r["tbl"], r["pk"]): {"inserted": bool(r["inserted"]), "ts": r["ts"] or 0.0}
+               for r in conn.execute(
+                   "SELECT c.tbl, c.pk, MAX(c.op='I') AS inserted, MAX(v.ts) AS ts "
+                   "FROM _changelog c LEFT JOIN _row_versions v ON v.tbl=c.tbl AND v.pk=c.pk "
+                   "WHERE c.seq>? GROUP BY c.tbl, c.pk", (last,))}
+    conflicts = []
+
+    # Ids both sides inserted: move ours out of the way first
+    next_id = {}
+    for ch in changes:
+        key = (ch["t"], str(ch["pk"]))
+        mine = pending.get(key)
+        if ch["op"] == "D" or not mine or not mine["inserted"] or _SYNC_TABLES[ch["t"]][0] != "id":
+            continue
+        tbl = ch["t"]
+        if tbl not in next_id:
+            next_id[tbl] = 1 + max([conn.execute(f"SELECT COALESCE(MAX(id),0) FROM {tbl}")
+                                    .fetchone()[0]]
+                                   + [int(c["pk"]) for c in changes if c["t"] == tbl])
+        new_id = next_id[tbl]
+        next_id[tbl] += 1
+        _renumber_row(conn, tbl, int(ch["pk"]), new_id)
+        pending[(tbl, str(new_id))] = pending.pop(key)
+        conflicts.append((tbl, key[1], f"renumbered local row to {new_id}", mine["ts"],
+                          ch.get("ts"), "both replicas inserted this id"))
+
+    for ch in changes:
+        key = (ch["t"], str(ch["pk"]))
+        mine, remote_ts = pending.get(key), ch.get("ts", 0.0)
+        detail = json.dumps(ch.get("row"))
+        if mine:
+            if ch["op"] == "D" and ch.get("base") and mine["inserted"]:
+                continue  # created here after the remote base was taken — not a delete
+            if mine["ts"] > remote_ts:
+                conflicts.append((*key, "kept local", mine["ts"], remote_ts, detail))
+                continue
+            conn.execute("DELETE FROM _changelog WHERE tbl=? AND pk=?", key)
+            del pending[key]
+            conflicts.append((*key, "took remote", mine["ts"], remote_ts, detail))
+        conn.execute("SAVEPOINT merge_change")
+        try:
+            _apply_remote_change(conn, ch)
+        except sqlite3.IntegrityError as e:
+            conn.execute("ROLLBACK TO merge_change")
+            if ch["t"] == "tenants" and _fold_duplicate_tenant(conn, ch, pending):
+                conflicts.append((*key, "merged duplicate tenant", None, remote_ts, detail))
+            else:
+                conflicts.append((*key, "rejected remote", None, remote_ts, str(e)))
+        conn.execute("RELEASE merge_change")
+
+    dropped = True
+    while dropped:  # a dropped assessment can orphan its areas in turn
+        dropped = False
+        for tbl, rowid, parent, _ in conn.execute("PRAGMA foreign_key_check").fetchall():
+            if (tbl, str(rowid)) in pending:
+                conn.execute(f"DELETE FROM {tbl} WHERE rowid=?", (rowid,))
+                conflicts.append((tbl, str(rowid), "dropped orphan",
+                                  pending.pop((tbl, str(rowid)))["ts"],
+                                  None, f"its {parent} row was deleted on another replica"))
+                dropped = True
+    if {ch["t"] for ch in changes} & {"tenants", "assessments", "assessment_areas"}:
+        # Foreign keys are off here, so nothing cascades, and the rollup
+        # triggers neither follow a renumbered id nor see an area whose
+        # assessment is already gone
+        _rebuild_rollups(conn)
+    return conflicts
+
+
+def _apply_remote_change(conn, ch: dict):
+    """Apply one remote change without queueing it to be pushed back."""
+    seq = _changelog_max_seq(conn)
+    _apply_changeset(conn, {"changes": [ch]})
+    conn.execute("DELETE FROM _changelog WHERE seq>?", (seq,))
+
+
+def _renumber_row(conn, tbl: str, old: int, new: int):
+    """Give an unpushed row a new id; it is then published as an insert under that id."""
+    conn.execute(f"UPDATE {tbl} SET id=? WHERE id=?", (new, old))
+    for child, col in _SYNC_CHILDREN.get(tbl, []):
+        conn.execute(f"UPDATE {child} SET {col}=? WHERE {col}=?", (new, old))
+    conn.execute("DELETE FROM _changelog WHERE tbl=? AND pk=?", (tbl, str(old)))
+    conn.execute("DELETE FROM _row_versions WHERE tbl=? AND pk=?", (tbl, str(old)))
+    conn.execute("UPDATE _changelog SET op='I' WHERE seq=(SELECT MAX(seq) FROM _changelog "
+                 "WHERE tbl=? AND pk=?)", (tbl, str(new)))
+
+
+def _fold_duplicate_tenant(conn, ch: dict, pending: dict) -> bool:
+    """Both replicas added a tenant with the same name: keep the remote row.
+
+    Access grants and assessments of the local duplicate move over to it.
+    """
+    if ch["op"] == "D":
+        return False
+    dup = conn.execute("SELECT id FROM tenants WHERE tenant_name=? AND id<>?",
+                       (ch["row"]["tenant_name"], int(ch["pk"]))).fetchone()
+    if dup is None:
+        return False
+    conn.execute("UPDATE OR IGNORE user_tenants SET tenant_id=? WHERE tenant_id=?",
+                 (int(ch["pk"]), dup[0]))
+    conn.execute("DELETE FROM user_tenants WHERE tenant_id=?", (dup[0],))
+    conn.execute("UPDATE assessments SET tenant_id=? WHERE tenant_id=?", (int(ch["pk"]), dup[0]))
+    conn.execute("DELETE FROM tenants WHERE id=?", (dup[0],))
+    if pending.get(("tenants", str(dup[0])), {}).get("inserted"):
+        # Never pushed: the remote has nothing to delete
+        conn.execute("DELETE FROM _changelog WHERE tbl='tenants' AND pk=?", (str(dup[0]),))
+    _apply_remote_change(conn, ch)
+    return True
+
+
+# ── Background sync worker ────────────────────────────────────────
+class _SyncWorker:
+    """Drains the outbox: one push per burst of writes.
+
+    A push fires once no new write has arrived for ``debounce`` seconds, or
+    when the oldest pending write is ``max_delay`` seconds old, whichever
+    comes first. Entries stay in the outbox until the upload succeeds, so
+    pending pushes survive a process restart. Failed pushes are retried
+    with exponential backoff from RETRY_DELAY up to RETRY_MAX seconds.
+    """
+
+    RETRY_DELAY = 5.0
+    RETRY_MAX   = 300.0
+
+    def __init__(self, debounce: float, max_delay: float):
+        self.debounce   = debounce
+        self.max_delay  = max_delay
+        self.last_error = None
+        self.failures   = 0
+        self.pushes     = 0
+        self._cv        = threading.Condition()
+        self._flush     = False
+        self._retry_at  = 0.0
+        self._thread    = threading.Thread(target=self._run, name="v360-sync", daemon=True)
+        self._thread.start()
+
+    @property
+    def last_sync(self):
+        ts = _sync_meta_get("last_sync")
+        return datetime.fromtimestamp(float(ts)) if ts else None
+
+    def notify(self):
+        with self._cv:
+            self._cv.notify()
+
+    @_profiled("sync")
+    def flush(self, timeout: float = 30.0) -> bool:
+        """Push now, ignoring the debounce window. True if the outbox drained."""
+        with self._cv:
+            self._flush    = True
+            self._retry_at = 0.0
+            self._cv.notify()
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if not _outbox_stats()["depth"]:
+                return True
+            if not self._flush and self.last_error:
+                return False
+            time.sleep(0.2)
+        return False
+
+    def _due_in(self, stats: dict) -> float:
+        now = time.time()
+        if self._flush:
+            return max(0.0, self._retry_at - now)
+        due = min(stats["newest"] + self.debounce, stats["oldest"] + self.max_delay)
+        return max(due, self._retry_at) - now
+
+    def _run(self):
+        while True:
+            with self._cv:
+                stats = _outbox_stats()
+                if not stats["depth"]:
+                    self._flush = False
+                wait  = self._due_in(stats) if stats["depth"] else None
+                if wait is None or wait > 0:
+                    self._cv.wait(timeout=wait)
+                    continue
+                self._flush = False
+            self._push(stats["max_id"])
+
+    def _push(self, max_id: int):
+        try:
+            _gh_upload_db()
+        except Exception as e:
+            self.failures  += 1
+            self.last_error = f"{datetime.now():%H:%M:%S} {e}"
+            delay = _backoff(self.failures - 1, self.RETRY_DELAY, self.RETRY_MAX)
+            self._retry_at  = time.time() + delay
+            _log.warning("sync push failed (%d in a row), retrying in %.0fs: %s",
+                         self.failures, delay, e)
+            return
+        conn = _sync_db()
+        try:
+            with conn:
+                conn.execute("DELETE FROM outbox WHERE id<=?", (max_id,))
+        finally:
+            conn.close()
+        _sync_meta_set("last_sync", time.time())
+        self.last_error = None
+        self.failures   = 0
+        self._retry_at  = 0.0
+        self.pushes    += 1
+
+
+@st.cache_resource
+def _sync_worker() -> _SyncWorker:
+    return _SyncWorker(debounce=_sync_setting("GH_SYNC_DEBOUNCE", 3.0),
+                       max_delay=_sync_setting("GH_SYNC_MAX_DELAY", 30.0))
+
+
+def gh_push_db(reason: str = ""):
+    """Queue a DB upload. Called after every write operation; returns immediately."""
+    if in_unit_of_work():
+        _unit.current["pushes"].append(reason)  # queued once the unit commits
+        return
+    if _storage() is None:
+        return
+    conn = _sync_db()
+    try:
+        with conn:
+            conn.execute("INSERT INTO outbox (reason, enqueued_at) VALUES (?,?)",
+                         (reason, time.time()))
+    finally:
+        conn.close()
+    _sync_worker().notify()
+
+
+def sync_status() -> dict:
+    """Outbox depth, last-sync info and merge conflicts for the admin panel."""
+    store = _storage()
+    if store is None:
+        return {"configured": False}
+    worker = _sync_worker()
+    return {
+        "configured":      True,
+        "backend":         store.label,
+        "target":          store.target(),
+        "mode":            _sync_mode(),
+        "depth":           _outbox_stats()["depth"],
+        "last_sync":       worker.last_sync,
+        "last_error":      worker.last_error,
+        "failures":        worker.failures,
+        "last_pull_error": _sync_meta_get("last_pull_error"),
+        "conflicts":       _conflict_count(),
+        "pushes":          worker.pushes,
+    }
+
+
+# ── Connection ────────────────────────────────────────────────────
+#
+# Connections come from a process-wide pool (shared by every session via
+# st.cache_resource) and are configured once when opened, not per call.
+# Tuning, all optional, in secrets:
+#
+#   DB_PROFILE        = "default"   ← "default", "low_memory" or "fast"
+#   DB_POOL_SIZE      = 8           ← max concurrent connections
+#   DB_CACHE_SIZE     = -16000      ← override the profile (negative = KiB)
+#   DB_MMAP_SIZE      = 67108864    ← override the profile (bytes)
+#   DB_TEMP_STORE     = "MEMORY"    ← override the profile
+#   DB_STATEMENT_CACHE = 256        ← prepared statements kept per connection
+#   DB_SLOW_QUERY_MS  = 0           ← log statements slower than this (0 = off)
+#   DB_SLOW_QUERY_KEEP = 200        ← recent slow statements kept for the admin panel
+
+_DB_PROFILES = {
+    "default":    {"cache_size": -16000, "mmap_size": 64 * 1024 * 1024,  "temp_store": "MEMORY"},
+    "low_memory": {"cache_size": -2000,  "mmap_size": 0,                 "temp_store": "FILE"},
+    "fast":       {"cache_size": -64000, "mmap_size": 256 * 1024 * 1024, "temp_store": "MEMORY"},
+}
+
+
+def _db_file_id(path: str):
+    """(device, inode) of the DB file, or None if it does not exist."""
+    try:
+        st_ = os.stat(path)
+        return st_.st_dev, st_.st_ino
+    except FileNotFoundError:
+        return None
+
+
+class _ConnectionPool:
+    """Bounded pool of pre-configured SQLite connections.
+
+    A connection idle for longer than ``health_interval`` seconds is probed
+    with ``SELECT 1`` before reuse, and any connection whose DB file has been
+    replaced or deleted (e.g. by "Reset database") is reopened.
+    """
+
+    def __init__(self, path: str, size: int, pragmas: dict, statement_cache: int,
+                 query_log: "_QueryLog" = None, health_interval: float = 60.0):
+        self.path            = path
+        self.size            = size
+        self.pragmas         = pragmas
+        self.statement_cache = statement_cache
+        self.query_log       = query_log
+        self.health_interval = health_interval
+        self.opened          = 0
+        self._idle           = queue.LifoQueue()
+        self._slots          = threading.BoundedSemaphore(size)
+
+    def _file_id(self):
+        return _db_file_id(self.path)
+
+    def _traced(self) -> bool:
+        return self.query_log is not None and self.query_log.enabled
+
+    def _open(self):
+        traced = self._traced()
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False,
+                               cached_statements=self.statement_cache,
+                               factory=_TracedConnection if traced else sqlite3.Connection)
+        if traced:
+            conn.query_log = self.query_log
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.execute(f"PRAGMA cache_size={int(self.pragmas['cache_size'])}")
+        conn.execute(f"PRAGMA mmap_size={int(self.pragmas['mmap_size'])}")
+        conn.execute(f"PRAGMA temp_store={self.pragmas['temp_store']}")
+        self.opened += 1
+        return [conn, self._file_id(), time.time()]
+
+    def _healthy(self, entry) -> bool:
+        conn, file_id, last_used = entry
+        if file_id is None or file_id != self._file_id():
+            return False
+        if isinstance(conn, _TracedConnection) != self._traced():
+            return False            # slow-query log switched on or off
+        if time.time() - last_used > self.health_interval:
+            try:
+                conn.execute("SELECT 1").fetchone()
+            except sqlite3.Error:
+                return False
+        return True
+
+    def acquire(self):
+        if not self._slots.acquire(timeout=30):
+            raise RuntimeError(f"No free database connection (pool size {self.size})")
+        try:
+            while True:
+                try:
+                    entry = self._idle.get_nowait()
+                except queue.Empty:
+                    return self._open()
+                if self._healthy(entry):
+                    return entry
+                entry[0].close()
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, entry):
+        conn = entry[0]
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            entry[2] = time.time()
+            self._idle.put(entry)
+        except sqlite3.Error:
+            conn.close()
+        finally:
+            self._slots.release()
+
+    def close_all(self):
+        """Close idle connections (leased ones are reopened on next checkout)."""
+        while True:
+            try:
+                self._idle.get_nowait()[0].close()
+            except queue.Empty:
+                return
+
+    def stats(self) -> dict:
+        return {"size": self.size, "idle": self._idle.qsize(), "opened": self.opened}
+
+
+class _Lease:
+    """`with get_db() as conn:` — commit/rollback like sqlite3, then return to the pool."""
+
+    def __init__(self, pool: _ConnectionPool):
+        self._pool  = pool
+        self._entry = None
+
+    def __enter__(self):
+        self._entry = self._pool.acquire()
+        return self._entry[0]
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self._entry[0].__exit__(exc_type, exc, tb)
+        finally:
+            self._pool.release(self._entry)
+        return False
+
+
+# ── Slow-query log ────────────────────────────────────────────────
+#
+# While the log is on, the pool hands out _TracedConnection. Its cursors
+# time a statement from execute() until its rows are used up or the cursor
+# is dropped, so a lazily fetched SELECT is measured in full. Statements
+# over the threshold are logged with parameters reduced to their types and
+# sizes, grouped by normalized text (literals and IN lists folded), and the
+# first of each group gets its EXPLAIN QUERY PLAN. A cursor dropped before
+# its rows ran out is finished by the garbage collector, which may run on
+# any thread after the connection is back in the pool, so that timing is
+# only queued and no SQL runs for it. Switching the log on or off in the
+# admin panel reopens pooled connections as they come back.
+class _TracedCursor(sqlite3.Cursor):
+    _trace = None                   # [sql, params, seconds] of the statement in flight
+
+    def _timed(self, fn, *args):
+        t0 = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            if self._trace is not None:
+                self._trace[2] += time.perf_counter() - t0
+
+    def _finish(self):
+        trace, self._trace = self._trace, None
+        if trace is not None:
+            self.connection.query_log.observe(self.connection, *trace)
+
+    def execute(self, sql, parameters=()):
+        self._finish()
+        self._trace = [sql, parameters, 0.0]
+        try:
+            self._timed(super().execute, sql, parameters)
+        except BaseException:
+            self._trace = None
+            raise
+        if self.description is None:  # no rows to fetch (DML, DDL)
+            self._finish()
+        return self
+
+    def executemany(self, sql, seq_of_parameters):
+        self._finish()
+        first = (seq_of_parameters[0] if isinstance(seq_of_parameters, (list, tuple))
+                 and seq_of_parameters else None)
+        self._trace = [sql, first, 0.0]
+        try:
+            self._timed(super().executemany, sql, seq_of_parameters)
+        except BaseException:
+            self._trace = None
+            raise
+        self._finish()
+        return self
+
+    def fetchone(self):
+        row = self._timed(super().fetchone)
+        if row is None:
+            self._finish()
+        return row
+
+    def fetchmany(self, size=None):
+        size = self.arraysize if size is None else size
+        rows = self._timed(super().fetchmany, size)
+        if len(rows) < size:
+            self._finish()
+        return rows
+
+    def fetchall(self):
+        rows = self._timed(super().fetchall)
+        self._finish()
+        return rows
+
+    def __next__(self):
+        try:
+            return self._timed(super().__next__)
+        except StopIteration:
+            self._finish()
+            raise
+
+    def close(self):
+        self._finish()
+        super().close()
+
+    def __del__(self):
+        trace, self._trace = self._trace, None
+        if trace is not None:
+            self.connection.query_log.observe_dropped(*trace)
+
+
+class _TracedConnection(sqlite3.Connection):
+    query_log = None
+
+    def cursor(self, factory=_TracedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+
+_PLANNABLE_SQL = re.compile(r"\s*(SELECT|WITH|INSERT|UPDATE|DELETE|REPLACE)\b", re.IGNORECASE)
+
+
+def _normalize_sql(sql: str) -> str:
+    """Statement text with literals as ? and IN lists folded, whitespace collapsed."""
+    s = re.sub(r"'(?:[^']|'')*'", "?", sql)
+    s = re.sub(r"(?<![\w.])-?\d+(?:\.\d+)?\b", "?", s)
+    s = re.sub(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", "IN (…)", s, flags=re.IGNORECASE)
+    return " ".join(s.split())
+
+
+def _redact_params(params) -> str:
+    """Parameter types and sizes only — values never reach the log."""
+    def shape(v):
+        if v is None:
+            return "NULL"
+        if isinstance(v, str):
+            return f"text({len(v)})"
+        if isinstance(v, (bytes, bytearray, memoryview)):
+            return f"blob({len(v)})"
+        return type(v).__name__
+    if params is None:
+        return ""
+    if isinstance(params, dict):
+        return ", ".join(f":{k}={shape(v)}" for k, v in params.items())
+    return ", ".join(shape(v) for v in params)
+
+
+def _query_plan(conn, sql: str, params) -> str:
+    """EXPLAIN QUERY PLAN as an indented tree, or "" if it cannot be explained."""
+    if not _PLANNABLE_SQL.match(sql):
+        return ""
+    try:
+        # Base-class execute: a plain cursor, so the EXPLAIN is not traced itself
+        rows = sqlite3.Connection.execute(conn, "EXPLAIN QUERY PLAN " + sql,
+                                          params or ()).fetchall()
+    except sqlite3.Error:
+        return ""
+    depth, lines = {0: -1}, []
+    for node, parent, _, detail in rows:
+        depth[node] = depth.get(parent, -1) + 1
+        lines.append("  " * depth[node] + detail)
+    return "\n".join(lines)
+
+
+class _QueryLog:
+    def __init__(self, threshold_ms: float, keep: int):
+        from collections import deque
+        self.threshold_ms = threshold_ms or 50.0
+        self.enabled      = threshold_ms > 0
+        self.statements   = {}      # normalized sql -> stats, plan and parameter shape
+        self.recent       = deque(maxlen=keep)
+        self._dropped     = deque(maxlen=keep)  # (sql, params shape, seconds, at)
+        self._lock        = threading.Lock()
+
+    def observe(self, conn, sql: str, params, seconds: float):
+        """Record a finished statement, explaining it on *conn* if it is new."""
+        ms = seconds * 1000
+        if not self.enabled or ms < self.threshold_ms:
+            return
+        key    = _normalize_sql(sql)
+        shape  = _redact_params(params)
+        with self._lock:
+            self._drain()
+            planned = self.statements.get(key, {}).get("plan") is not None
+        plan = None if planned else _query_plan(conn, sql, params)
+        with self._lock:
+            self._add(key, shape, ms, plan, datetime.now())
+        _log.warning("slow query %.1f ms [%s]: %s", ms, shape, key)
+
+    def observe_dropped(self, sql: str, params, seconds: float):
+        """observe() for a cursor finished by the garbage collector.
+
+        That can happen on any thread — even inside observe() with the lock
+        held — so this takes no lock and runs no SQL: the timing is queued
+        (deque appends are atomic) and its plan waits for the next time the
+        statement finishes on a live cursor.
+        """
+        if self.enabled and seconds * 1000 >= self.threshold_ms:
+            self._dropped.append((sql, _redact_params(params), seconds, datetime.now()))
+
+    def _drain(self):
+        while self._dropped:
+            sql, shape, seconds, at = self._dropped.popleft()
+            key = _normalize_sql(sql)
+            self._add(key, shape, seconds * 1000, None, at)
+            _log.warning("slow query %.1f ms [%s]: %s", seconds * 1000, shape, key)
+
+    def _add(self, key: str, shape: str, ms: float, plan, at: datetime):
+        stat = self.statements.setdefault(key, {
+            "count": 0, "total_ms": 0.0, "max_ms": 0.0, "params": shape, "plan": None,
+            "scan": None})
+        if plan is not None and stat["plan"] is None:
+            stat["plan"] = plan
+            stat["scan"] = any(l.strip().startswith("SCAN ") for l in plan.splitlines())
+        stat["count"]    += 1
+        stat["total_ms"] += ms
+        stat["max_ms"]    = max(stat["max_ms"], ms)
+        stat["last"]      = at
+        self.recent.append({"At": at, "ms": round(ms, 2), "Statement": key, "Params": shape})
+
+    def summary(self) -> pd.DataFrame:
+        """One row per normalized statement, most total time first."""
+        with self._lock:
+            self._drain()
+            rows = [{"Statement": k, "Count": v["count"], "Total ms": round(v["total_ms"], 2),
+                     "Mean ms": round(v["total_ms"] / v["count"], 2),
+                     "Max ms": round(v["max_ms"], 2), "Full scan": v["scan"],
+                     "Params": v["params"], "Last": v["last"], "Plan": v["plan"] or ""}
+                    for k, v in self.statements.items()]
+        df = pd.DataFrame(rows, columns=["Statement", "Count", "Total ms", "Mean ms", "Max ms",
+                                         "Full scan", "Params", "Last", "Plan"])
+        return df.sort_values("Total ms", ascending=False, ignore_index=True)
+
+    def recent_frame(self) -> pd.DataFrame:
+        with self._lock:
+            self._drain()
+            return pd.DataFrame(list(reversed(self.recent)),
+                                columns=["At", "ms", "Statement", "Params"])
+
+    def export_json(self) -> bytes:
+        return json.dumps({
+            "threshold_ms": self.threshold_ms,
+            "statements":   self.summary().to_dict("records"),
+            "recent":       self.recent_frame().to_dict("records"),
+        }, default=str, indent=1).encode()
+
+    def clear(self):
+        with self._lock:
+            self._dropped.clear()
+            self.statements.clear()
+            self.recent.clear()
+
+
+@st.cache_resource
+def _query_log() -> _QueryLog:
+    return _QueryLog(float(_db_setting("DB_SLOW_QUERY_MS", 0)),
+                     int(_db_setting("DB_SLOW_QUERY_KEEP", 200)))
+
+
+def _db_setting(key: str, default):
+    try:
+        return st.secrets.get(key, default)
+    except Exception:
+        return default
+
+
+@st.cache_resource
+def _db_pool() -> _ConnectionPool:
+    profile = _DB_PROFILES.get(str(_db_setting("DB_PROFILE", "default")), _DB_PROFILES["default"])
+    pragmas = {
+        "cache_size": _db_setting("DB_CACHE_SIZE", profile["cache_size"]),
+        "mmap_size":  _db_setting("DB_MMAP_SIZE",  profile["mmap_size"]),
+        "temp_store": str(_db_setting("DB_TEMP_STORE", profile["temp_store"])).upper(),
+    }
+    if pragmas["temp_store"] not in ("DEFAULT", "FILE", "MEMORY"):
+        pragmas["temp_store"] = profile["temp_store"]
+    return _ConnectionPool(DB_PATH, size=int(_db_setting("DB_POOL_SIZE", 8)), pragmas=pragmas,
+                           statement_cache=int(_db_setting("DB_STATEMENT_CACHE", 256)),
+                           query_log=_query_log())
+
+
+def get_db():
+    unit = getattr(_unit, "current", None)
+    return _UnitLease(unit) if unit is not None else _Lease(_db_pool())
+
+
+# ── Unit of work ──────────────────────────────────────────────────
+#
+# `with unit_of_work() as conn:` groups helper calls into one SQLite
+# transaction. Inside the block get_db() hands every helper the same
+# connection with commit() deferred, gh_push_db() calls are collected, and
+# callbacks registered with _after_commit (cache invalidation) wait. A clean
+# exit commits and then queues a single push; an exception rolls the whole
+# unit back and pushes nothing. Nested blocks join the outermost unit.
+# Units are per thread, so concurrent sessions never share one.
+_unit = threading.local()
+
+
+class _UnitConnection:
+    """The unit's connection as helpers see it; commit() and close() are left to the unit.
+
+    rollback() raises: a helper undoing the transaction would silently undo
+    every other helper's writes in the unit. Raise out of the block instead.
+    """
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        raise RuntimeError("rollback() inside unit_of_work() — raise out of the block "
+                           "to roll the whole unit back")
+
+    def close(self):
+        pass                          # returned to the pool when the unit ends
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+class _UnitLease:
+    def __init__(self, unit):
+        self._unit = unit
+
+    def __enter__(self):
+        return self._unit["conn"]
+
+    def __exit__(self, exc_type, exc, tb):
+        return False                  # errors propagate and roll back the unit
+
+
+def in_unit_of_work() -> bool:
+    return getattr(_unit, "current", None) is not None
+
+
+@contextlib.contextmanager
+def unit_of_work():
+    """One transaction and at most one gh_push_db for everything in the block."""
+    if in_unit_of_work():
+        yield _unit.current["conn"]
+        return
+    pool  = _db_pool()
+    entry = pool.acquire()
+    unit  = {"conn": _UnitConnection(entry[0]), "pushes": [], "after_commit": []}
+    _unit.current = unit
+    try:
+        entry[0].execute("BEGIN IMMEDIATE")
+        yield unit["conn"]
+        entry[0].commit()
+    except BaseException:
+        if entry[0].in_transaction:
+            entry[0].rollback()
+        raise
+    finally:
+        _unit.current = None
+        pool.release(entry)
+    for fn in unit["after_commit"]:
+        fn()
+    if unit["pushes"]:
+        gh_push_db("; ".join(r for r in unit["pushes"] if r))
+
+
+def _after_commit(fn):
+    """Run *fn* now, or once the current unit of work has committed."""
+    if in_unit_of_work():
+        _unit.current["after_commit"].append(fn)
+    else:
+        fn()
+
+
+# ── Schema ────────────────────────────────────────────────────────
+#
+# Each migration runs once, in its own transaction, and bumps
+# PRAGMA user_version. Append new steps to _MIGRATIONS — never edit one
+# that has shipped. A DB that is already current costs init_db a few reads.
+
+def _m1_base_schema(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS users (
+            username TEXT PRIMARY KEY, display_name TEXT NOT NULL,
+            role TEXT NOT NULL, tenant_access TEXT NOT NULL,
+            password_hash TEXT NOT NULL)""")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS tenants (
+            tenant_name TEXT PRIMARY KEY,
+            tenant_type TEXT NOT NULL DEFAULT 'Commercial')""")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS tenant_types (type_name TEXT PRIMARY KEY)""")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS assessments (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            assessment_name TEXT NOT NULL, tenant_name TEXT NOT NULL,
+            date_added TEXT NOT NULL, created_by TEXT NOT NULL DEFAULT '')""")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS assessment_areas (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            assessment_id INTEGER NOT NULL REFERENCES assessments(id),
+            area_name TEXT NOT NULL, category TEXT NOT NULL, sqft REAL NOT NULL)""")
+
+    # ── Seed tenant types ────────────────────────────────────────
+    if conn.execute("SELECT COUNT(*) FROM tenant_types").fetchone()[0] == 0:
+        for t in ["Commercial","Residential","Retail","Industrial","Hospitality","Mixed-Use","Other"]:
+            conn.execute("INSERT OR IGNORE INTO tenant_types VALUES (?)", (t,))
+
+    # ── Seed tenants ─────────────────────────────────────────────
+    if conn.execute("SELECT COUNT(*) FROM tenants").fetchone()[0] == 0:
+        for name, ttype in [("EDEN Tenant","Residential"),("Thaala Tenant","Commercial")]:
+            conn.execute("INSERT OR IGNORE INTO tenants VALUES (?,?)", (name, ttype))
+
+    # ── Seed users ───────────────────────────────────────────────
+    if conn.execute("SELECT COUNT(*) FROM users").fetchone()[0] == 0:
+        for uname, ud in _get_seed_users().items():
+            conn.execute(
+                "INSERT OR IGNORE INTO users VALUES (?,?,?,?,?)",
+                (uname, ud["display_name"], ud["role"],
+                 json.dumps(ud["tenant_access"]), ud["password_hash"]))
+
+
+def _m2_indexes(conn):
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_areas_assessment "
+                 "ON assessment_areas(assessment_id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_assessments_created_by "
+                 "ON assessments(created_by, id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_assessments_tenant "
+                 "ON assessments(tenant_name)")
+
+
+def _m3_rollups(conn):
+    _install_rollups(conn, "tenant_name")
+
+
+def _m4_data_versions(conn):
+    _install_data_versions(conn, "tenant_name")
+
+
+def _m5_table_versions(conn):
+    _install_table_versions(conn)
+
+
+def _m6_tenant_ids(conn):
+    """Integer tenant ids; users.tenant_access JSON becomes the user_tenants table."""
+    conn.execute("""
+        CREATE TEMP TABLE _m6_access AS
+        SELECT u.username, j.value AS tenant_name
+        FROM users u, json_each(u.tenant_access) j""")
+    conn.execute("""
+        CREATE TABLE tenants_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            tenant_name TEXT NOT NULL UNIQUE,
+            tenant_type TEXT NOT NULL DEFAULT 'Commercial')""")
+    conn.execute("INSERT INTO tenants_new (tenant_name, tenant_type) "
+                 "SELECT tenant_name, tenant_type FROM tenants ORDER BY tenant_name")
+    conn.execute("DROP TABLE tenants")
+    conn.execute("ALTER TABLE tenants_new RENAME TO tenants")
+    conn.execute("""
+        CREATE TABLE users_new (
+            username TEXT PRIMARY KEY, display_name TEXT NOT NULL,
+            role TEXT NOT NULL, password_hash TEXT NOT NULL)""")
+    conn.execute("INSERT INTO users_new SELECT username, display_name, role, password_hash "
+                 "FROM users")
+    conn.execute("DROP TABLE users")
+    conn.execute("ALTER TABLE users_new RENAME TO users")
+    conn.execute("""
+        CREATE TABLE user_tenants (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT NOT NULL
+                REFERENCES users(username) ON UPDATE CASCADE ON DELETE CASCADE,
+            tenant_id INTEGER NOT NULL
+                REFERENCES tenants(id) ON UPDATE CASCADE ON DELETE CASCADE,
+            UNIQUE (username, tenant_id))""")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_user_tenants_tenant ON user_tenants(tenant_id)")
+    conn.execute("""
+        INSERT OR IGNORE INTO user_tenants (username, tenant_id)
+        SELECT a.username, t.id FROM _m6_access a
+        JOIN users u ON u.username=a.username JOIN tenants t ON t.tenant_name=a.tenant_name""")
+    conn.execute("DROP TABLE _m6_access")
+    _install_table_versions(conn, ("users", "tenants", "user_tenants"))
+
+
+def _m7_assessment_tenant_ids(conn):
+    """Assessments and tenant_rollups point at tenants(id) instead of copying the name.
+
+    A rename is then one UPDATE of tenants, and deleting a tenant takes its
+    assessments, their areas and its rollups with it (ON DELETE CASCADE).
+    A tenant name only assessments still use is added back as a tenant, so
+    no assessment is lost.
+    """
+    seq = conn.execute("SELECT seq FROM sqlite_sequence WHERE name='assessments'").fetchone()
+    # Triggers on the rebuilt tables are dropped with them; the rest would
+    # point at a missing table between the DROP and the RENAME
+    for (name,) in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='trigger' "
+            "AND tbl_name IN ('assessments', 'assessment_areas')").fetchall():
+        conn.execute(f"DROP TRIGGER {name}")
+    conn.execute("INSERT INTO tenants (tenant_name) SELECT DISTINCT tenant_name FROM assessments "
+                 "WHERE tenant_name NOT IN (SELECT tenant_name FROM tenants)")
+    conn.execute("""
+        CREATE TABLE assessments_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            assessment_name TEXT NOT NULL,
+            tenant_id INTEGER NOT NULL
+                REFERENCES tenants(id) ON UPDATE CASCADE ON DELETE CASCADE,
+            date_added TEXT NOT NULL, created_by TEXT NOT NULL DEFAULT '')""")
+    conn.execute("""
+        INSERT INTO assessments_new (id, assessment_name, tenant_id, date_added, created_by)
+        SELECT a.id, a.assessment_name, t.id, a.date_added, a.created_by
+        FROM assessments a JOIN tenants t ON t.tenant_name=a.tenant_name""")
+    conn.execute("DROP TABLE assessments")
+    conn.execute("ALTER TABLE assessments_new RENAME TO assessments")
+    if seq:  # ids of deleted assessments stay retired, as AUTOINCREMENT promised
+        conn.execute("UPDATE sqlite_sequence SET seq=MAX(seq, ?) WHERE name='assessments'",
+                     (seq[0],))
+    conn.execute("""
+        CREATE TABLE assessment_areas_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            assessment_id INTEGER NOT NULL REFERENCES assessments(id) ON DELETE CASCADE,
+            area_name TEXT NOT NULL, category TEXT NOT NULL, sqft REAL NOT NULL)""")
+    conn.execute("INSERT INTO assessment_areas_new "
+                 "SELECT id, assessment_id, area_name, category, sqft FROM assessment_areas")
+    seq = conn.execute("SELECT seq FROM sqlite_sequence WHERE name='assessment_areas'").fetchone()
+    conn.execute("DROP TABLE assessment_areas")
+    conn.execute("ALTER TABLE assessment_areas_new RENAME TO assessment_areas")
+    if seq:
+        conn.execute("UPDATE sqlite_sequence SET seq=MAX(seq, ?) WHERE name='assessment_areas'",
+                     (seq[0],))
+    conn.execute("CREATE INDEX idx_areas_assessment ON assessment_areas(assessment_id)")
+    conn.execute("CREATE INDEX idx_assessments_created_by ON assessments(created_by, id)")
+    conn.execute("CREATE INDEX idx_assessments_tenant ON assessments(tenant_id)")
+    conn.execute("DROP TABLE tenant_rollups")
+    conn.execute("DELETE FROM data_versions WHERE scope GLOB 'tenant:*'")  # were by name
+    _install_rollups(conn)
+    _install_data_versions(conn)
+    _install_table_versions(conn, ("assessments", "assessment_areas"))
+
+
+def _m8_row_versions(conn):
+    """Per-row modification times, used to merge replicas in delta sync."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS _row_versions (
+            tbl TEXT NOT NULL, pk TEXT NOT NULL, ts REAL NOT NULL,
+            PRIMARY KEY (tbl, pk)) WITHOUT ROWID""")
+
+
+_MIGRATIONS = [_m1_base_schema, _m2_indexes, _m3_rollups, _m4_data_versions,
+               _m5_table_versions, _m6_tenant_ids, _m7_assessment_tenant_ids,
+               _m8_row_versions]
+SCHEMA_VERSION = len(_MIGRATIONS)
+
+
+def migrate_db(conn) -> int:
+    """Apply pending migrations; returns the schema version before migrating.
+
+    Foreign keys are off meanwhile: a table rebuild (create, copy, drop,
+    rename) would otherwise cascade the DROP into the table's children.
+    """
+    start = conn.execute("PRAGMA user_version").fetchone()[0]
+    foreign_keys = conn.execute("PRAGMA foreign_keys").fetchone()[0]
+    conn.execute("PRAGMA foreign_keys=OFF")
+    try:
+        while True:
+            conn.execute("BEGIN IMMEDIATE")  # serialises processes migrating the same file
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version >= SCHEMA_VERSION:
+                conn.rollback()
+                return start
+            try:
+                _MIGRATIONS[version](conn)
+                conn.execute(f"PRAGMA user_version={version + 1}")
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+    finally:
+        conn.execute(f"PRAGMA foreign_keys={foreign_keys}")
+
+
+def init_db():
+    with get_db() as conn:
+        if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            migrate_db(conn)
+
+        _install_changelog(conn, _sync_mode() == "delta")
+
+        # Keep admin password current — only written when it differs
+        row = conn.execute("SELECT password_hash FROM users WHERE username=?",
+                           ("admin@dexxora360",)).fetchone()
+        if row and row[0] != hash_pw("dex123"):
+            conn.execute("UPDATE users SET password_hash=? WHERE username=?",
+                         (hash_pw("dex123"), "admin@dexxora360"))
+            conn.commit()
+
+
+# ── Data versions ─────────────────────────────────────────────────
+#
+# data_versions holds one opaque token per "assessment:<id>" and
+# "tenant:<id>" scope. Triggers replace the token with random() whenever
+# a row in that scope changes — local writes, delta-sync changesets and
+# restores alike — so anything derived from a scope can be cached under
+# its token. Tokens are random rather than counters so a snapshot pulled
+# from another replica can never reuse a key this process has seen.
+
+def _bump_version_sql(scope: str) -> str:
+    return (f"INSERT INTO data_versions (scope, version) VALUES ({scope}, random()) "
+            f"ON CONFLICT (scope) DO UPDATE SET version=excluded.version;")
+
+
+def _bump_area_tenant_sql(ref: str, key: str) -> str:
+    return ("INSERT INTO data_versions (scope, version) "
+            f"SELECT 'tenant:' || {key}, random() FROM assessments WHERE id={ref} "
+            "ON CONFLICT (scope) DO UPDATE SET version=excluded.version;")
+
+
+def _version_triggers(key: str) -> dict:
+    """Version triggers; *key* is the assessments column naming the tenant."""
+    return {
+        "_ver_assessment_insert": f"""
+            AFTER INSERT ON assessments BEGIN
+                {_bump_version_sql("'assessment:' || NEW.id")}
+                {_bump_version_sql(f"'tenant:' || NEW.{key}")}
+            END""",
+        "_ver_assessment_update": f"""
+            AFTER UPDATE ON assessments BEGIN
+                {_bump_version_sql("'assessment:' || NEW.id")}
+                {_bump_version_sql(f"'tenant:' || OLD.{key}")}
+                {_bump_version_sql(f"'tenant:' || NEW.{key}")}
+            END""",
+        "_ver_assessment_delete": f"""
+            AFTER DELETE ON assessments BEGIN
+                {_bump_version_sql("'assessment:' || OLD.id")}
+                {_bump_version_sql(f"'tenant:' || OLD.{key}")}
+            END""",
+        "_ver_area_insert": f"""
+            AFTER INSERT ON assessment_areas BEGIN
+                {_bump_version_sql("'assessment:' || NEW.assessment_id")}
+                {_bump_area_tenant_sql("NEW.assessment_id", key)}
+            END""",
+        "_ver_area_update": f"""
+            AFTER UPDATE ON assessment_areas BEGIN
+                {_bump_version_sql("'assessment:' || OLD.assessment_id")}
+                {_bump_version_sql("'assessment:' || NEW.assessment_id")}
+                {_bump_area_tenant_sql("OLD.assessment_id", key)}
+                {_bump_area_tenant_sql("NEW.assessment_id", key)}
+            END""",
+        "_ver_area_delete": f"""
+            AFTER DELETE ON assessment_areas BEGIN
+                {_bump_version_sql("'assessment:' || OLD.assessment_id")}
+                {_bump_area_tenant_sql("OLD.assessment_id", key)}
+            END""",
+    }
+
 
+def _install_data_versions(conn, key: str = "tenant_id"):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS data_versions (
+            scope TEXT PRIMARY KEY, version INTEGER NOT NULL)""")
+    for name, body in _version_triggers(key).items():
+        conn.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
 
-def gh_pull_db():
-    """Download DB from GitHub → local path. Called once on startup."""
-    token, repo, gh_path = _gh_cfg()
-    if not token:
-        return  # GitHub not configured — use local SQLite as-is
-    try:
-        url  = f"https://api.github.com/repos/{repo}/contents/{gh_path}"
-        data = _gh_api("GET", url, token)
-        raw  = base64.b64decode(data["content"])
-        with open(DB_PATH, "wb") as f:
-            f.write(raw)
-        # Cache the SHA so we can update the file (not create a new one)
-        st.session_state["_gh_sha"] = data["sha"]
-    except RuntimeError as e:
-        if "404" in str(e):
-            pass  # File doesn't exist yet — will be created on first write
-        # else silently ignore — app still works with local SQLite
 
+@_profiled("db")
+def data_versions(scopes: list) -> tuple:
+    """Version tokens for *scopes*, in order (0 = unchanged since tracking began)."""
+    scopes = list(scopes)
+    if not scopes:
+        return ()
+    with get_db() as conn:
+        found = dict(conn.execute(
+            f"SELECT scope, version FROM data_versions "
+            f"WHERE scope IN ({','.join('?' * len(scopes))})", scopes).fetchall())
+    return tuple(found.get(s, 0) for s in scopes)
 
-def gh_push_db():
-    """Upload current DB to GitHub. Called after every write operation."""
-    token, repo, gh_path = _gh_cfg()
-    if not token:
-        return
-    try:
-        with open(DB_PATH, "rb") as f:
-            content = base64.b64encode(f.read()).decode()
 
-        # Get current SHA if we don't have it cached
-        sha = st.session_state.get("_gh_sha")
-        if not sha:
+# ── Read cache ────────────────────────────────────────────────────
+#
+# The load_* helpers are memoized process-wide, keyed by their arguments
+# plus a "table:<name>" token (in data_versions, bumped by a trigger on
+# every row change) for each table they read. Checking those tokens on
+# every call would cost a query, so a dedicated watch connection polls
+# PRAGMA data_version instead: it only moves when some other connection —
+# the pool, a restore, another process — commits, and only then are the
+# tokens re-read. Capped at READ_CACHE_MAX entries, least recently used
+# first out.
+_VERSIONED_TABLES = ("users", "tenants", "tenant_types", "assessments", "assessment_areas")
+
+
+def _install_table_versions(conn, tables: tuple = _VERSIONED_TABLES):
+    for tbl in tables:
+        for op in ("INSERT", "UPDATE", "DELETE"):
+            conn.execute(
+                f"CREATE TRIGGER IF NOT EXISTS _ver_table_{tbl}_{op.lower()} "
+                f"AFTER {op} ON {tbl} BEGIN {_bump_version_sql(repr('table:' + tbl))} END")
+
+
+def _memo_key_part(v):
+    if isinstance(v, (list, set, frozenset)):
+        return tuple(sorted(v)) if isinstance(v, (set, frozenset)) else tuple(v)
+    return v
+
+
+def _memo_copy(value):
+    """Copy deep enough that callers can mutate rows without touching the cache."""
+    if isinstance(value, pd.DataFrame):
+        return value.copy()
+    if isinstance(value, tuple):
+        return tuple(_memo_copy(v) for v in value)
+    if isinstance(value, list):
+        return [dict(v) if isinstance(v, dict) else v for v in value]
+    if isinstance(value, dict):
+        return {k: dict(v) if isinstance(v, dict) else v for k, v in value.items()}
+    return value
+
+
+class _ReadCache:
+    def __init__(self, path: str, max_entries: int):
+        from collections import OrderedDict
+        self.path         = path
+        self.max_entries  = max_entries
+        self._items       = OrderedDict()  # key -> (table tokens, value)
+        self._lock        = threading.Lock()
+        self._watch       = None
+        self._watch_id    = None
+        self._data_version = None
+        self._tokens      = {}
+        self.hits = self.misses = 0
+
+    def _table_tokens(self, tables: tuple) -> tuple:
+        file_id = _db_file_id(self.path)
+        if self._watch is None or file_id != self._watch_id:
+            if self._watch is not None:
+                self._watch.close()
+            self._watch    = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self._watch_id = file_id
+            self._data_version = None
+        dv = self._watch.execute("PRAGMA data_version").fetchone()[0]
+        if dv != self._data_version:
             try:
-                url  = f"https://api.github.com/repos/{repo}/contents/{gh_path}"
-                data = _gh_api("GET", url, token)
-                sha  = data.get("sha")
-            except RuntimeError:
-                sha = None  # File doesn't exist yet — first push
-
-        body = {
-            "message": f"chore: sync db {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-            "content": content,
-        }
-        if sha:
-            body["sha"] = sha
+                self._tokens = dict(self._watch.execute(
+                    "SELECT scope, version FROM data_versions WHERE scope GLOB 'table:*'"
+                ).fetchall())
+            except sqlite3.OperationalError:  # pre-migration DB just pulled in
+                return None
+            self._data_version = dv
+        return tuple(self._tokens.get(f"table:{t}", 0) for t in tables)
+
+    def call(self, fn, tables: tuple, args: tuple, kwargs: dict):
+        key = (fn.__name__, tuple(_memo_key_part(a) for a in args),
+               tuple(sorted((k, _memo_key_part(v)) for k, v in kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return fn(*args, **kwargs)
+        with self._lock:
+            tokens = self._table_tokens(tables)
+            if tokens is None:
+                return fn(*args, **kwargs)
+            hit = self._items.get(key)
+            if hit is not None and hit[0] == tokens:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return _memo_copy(hit[1])
+            self.misses += 1
+        value = fn(*args, **kwargs)
+        with self._lock:
+            self._items[key] = (tokens, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+        return _memo_copy(value)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._items), "hits": self.hits, "misses": self.misses}
+
+
+@st.cache_resource
+def _read_cache() -> _ReadCache:
+    return _ReadCache(DB_PATH, int(_db_setting("READ_CACHE_MAX", 256)))
+
+
+def _memoized(*tables):
+    """Cache a load_* helper in _read_cache, invalidated by writes to *tables*."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if in_unit_of_work():     # may see the unit's uncommitted writes
+                return fn(*args, **kwargs)
+            return _read_cache().call(fn, tables, args, kwargs)
+        wrapper.uncached = fn
+        return wrapper
+    return decorate
+
+
+# ── Rollups ───────────────────────────────────────────────────────
+#
+# assessment_rollups (per assessment) and tenant_rollups (per tenant and
+# category) hold area counts and SQFT totals. Triggers on assessment_areas
+# and assessments keep them current inside the writing transaction, so
+# summaries are primary-key lookups instead of aggregates.
 
-        url  = f"https://api.github.com/repos/{repo}/contents/{gh_path}"
-        data = _gh_api("PUT", url, token, body)
-        st.session_state["_gh_sha"] = data["content"]["sha"]
-    except Exception:
-        pass  # Never crash the app because of a sync failure
+def _rollup_triggers(key: str) -> dict:
+    """Rollup triggers; *key* is the assessments column naming the tenant."""
+    return {
+        "_rollup_assessment_insert": """
+            AFTER INSERT ON assessments BEGIN
+                INSERT OR IGNORE INTO assessment_rollups (assessment_id) VALUES (NEW.id);
+            END""",
+        "_rollup_assessment_delete": """
+            AFTER DELETE ON assessments BEGIN
+                DELETE FROM assessment_rollups WHERE assessment_id=OLD.id;
+            END""",
+        "_rollup_assessment_retenant": f"""
+            AFTER UPDATE OF {key} ON assessments
+            WHEN OLD.{key} IS NOT NEW.{key} BEGIN
+                UPDATE tenant_rollups SET
+                    area_count = area_count - (SELECT COUNT(*) FROM assessment_areas
+                        WHERE assessment_id=NEW.id AND category=tenant_rollups.category),
+                    total_sqft = total_sqft - (SELECT COALESCE(SUM(sqft),0) FROM assessment_areas
+                        WHERE assessment_id=NEW.id AND category=tenant_rollups.category)
+                WHERE {key}=OLD.{key};
+                DELETE FROM tenant_rollups WHERE {key}=OLD.{key} AND area_count<=0;
+                INSERT INTO tenant_rollups ({key}, category, area_count, total_sqft)
+                    SELECT NEW.{key}, category, COUNT(*), SUM(sqft) FROM assessment_areas
+                    WHERE assessment_id=NEW.id GROUP BY category
+                ON CONFLICT ({key}, category) DO UPDATE SET
+                    area_count = area_count + excluded.area_count,
+                    total_sqft = total_sqft + excluded.total_sqft;
+            END""",
+        "_rollup_area_insert": f"""
+            AFTER INSERT ON assessment_areas BEGIN
+                UPDATE assessment_rollups SET area_count = area_count + 1,
+                                              total_sqft = total_sqft + NEW.sqft
+                WHERE assessment_id=NEW.assessment_id;
+                INSERT INTO tenant_rollups ({key}, category, area_count, total_sqft)
+                    SELECT {key}, NEW.category, 1, NEW.sqft FROM assessments
+                    WHERE id=NEW.assessment_id
+                ON CONFLICT ({key}, category) DO UPDATE SET
+                    area_count = area_count + 1, total_sqft = total_sqft + NEW.sqft;
+            END""",
+        "_rollup_area_delete": f"""
+            AFTER DELETE ON assessment_areas BEGIN
+                UPDATE assessment_rollups SET area_count = area_count - 1,
+                                              total_sqft = total_sqft - OLD.sqft
+                WHERE assessment_id=OLD.assessment_id;
+                UPDATE tenant_rollups SET area_count = area_count - 1,
+                                          total_sqft = total_sqft - OLD.sqft
+                WHERE category=OLD.category AND {key}=
+                    (SELECT {key} FROM assessments WHERE id=OLD.assessment_id);
+                DELETE FROM tenant_rollups WHERE area_count<=0 AND category=OLD.category;
+            END""",
+        "_rollup_area_update": f"""
+            AFTER UPDATE OF assessment_id, category, sqft ON assessment_areas BEGIN
+                UPDATE assessment_rollups SET area_count = area_count - 1,
+                                              total_sqft = total_sqft - OLD.sqft
+                WHERE assessment_id=OLD.assessment_id;
+                UPDATE assessment_rollups SET area_count = area_count + 1,
+                                              total_sqft = total_sqft + NEW.sqft
+                WHERE assessment_id=NEW.assessment_id;
+                UPDATE tenant_rollups SET area_count = area_count - 1,
+                                          total_sqft = total_sqft - OLD.sqft
+                WHERE category=OLD.category AND {key}=
+                    (SELECT {key} FROM assessments WHERE id=OLD.assessment_id);
+                DELETE FROM tenant_rollups WHERE area_count<=0 AND category=OLD.category;
+                INSERT INTO tenant_rollups ({key}, category, area_count, total_sqft)
+                    SELECT {key}, NEW.category, 1, NEW.sqft FROM assessments
+                    WHERE id=NEW.assessment_id
+                ON CONFLICT ({key}, category) DO UPDATE SET
+                    area_count = area_count + 1, total_sqft = total_sqft + NEW.sqft;
+            END""",
+    }
 
 
-# ── Connection ────────────────────────────────────────────────────
-def get_db():
-    conn = sqlite3.connect(DB_PATH, timeout=30, check_same_thread=False)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA synchronous=NORMAL")
-    conn.execute("PRAGMA foreign_keys=ON")
-    return conn
+_TENANT_KEY_COLUMNS = {
+    # assessments column naming the tenant -> its tenant_rollups definition
+    "tenant_name": "tenant_name TEXT NOT NULL",                          # schema 3-6
+    "tenant_id":   "tenant_id INTEGER NOT NULL "
+                   "REFERENCES tenants(id) ON UPDATE CASCADE ON DELETE CASCADE",
+}
 
 
-# ── Schema ────────────────────────────────────────────────────────
-def init_db():
+def _install_rollups(conn, key: str = "tenant_id"):
+    """Create rollup tables and triggers; a fresh table is filled from live data."""
+    existing = {r[0] for r in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type='table' "
+        "AND name IN ('assessment_rollups','tenant_rollups')")}
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS assessment_rollups (
+            assessment_id INTEGER PRIMARY KEY,
+            area_count INTEGER NOT NULL DEFAULT 0, total_sqft REAL NOT NULL DEFAULT 0)""")
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS tenant_rollups (
+            {_TENANT_KEY_COLUMNS[key]}, category TEXT NOT NULL,
+            area_count INTEGER NOT NULL DEFAULT 0, total_sqft REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY ({key}, category))""")
+    for name, body in _rollup_triggers(key).items():
+        conn.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+    if len(existing) < 2:
+        _rebuild_rollups(conn, key)
+
+
+def _rebuild_rollups(conn, key: str = "tenant_id"):
+    conn.execute("DELETE FROM assessment_rollups")
+    conn.execute("DELETE FROM tenant_rollups")
+    conn.execute("""
+        INSERT INTO assessment_rollups (assessment_id, area_count, total_sqft)
+        SELECT a.id, COUNT(ar.id), COALESCE(SUM(ar.sqft),0)
+        FROM assessments a LEFT JOIN assessment_areas ar ON ar.assessment_id=a.id
+        GROUP BY a.id""")
+    conn.execute(f"""
+        INSERT INTO tenant_rollups ({key}, category, area_count, total_sqft)
+        SELECT a.{key}, ar.category, COUNT(*), SUM(ar.sqft)
+        FROM assessment_areas ar JOIN assessments a ON a.id=ar.assessment_id
+        GROUP BY a.{key}, ar.category""")
+
+
+@_profiled("db")
+def rebuild_rollups():
+    """Recompute every rollup from assessment_areas in one transaction."""
     with get_db() as conn:
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS users (
-                username TEXT PRIMARY KEY, display_name TEXT NOT NULL,
-                role TEXT NOT NULL, tenant_access TEXT NOT NULL,
-                password_hash TEXT NOT NULL)""")
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS tenants (
-                tenant_name TEXT PRIMARY KEY,
-                tenant_type TEXT NOT NULL DEFAULT 'Commercial')""")
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS tenant_types (type_name TEXT PRIMARY KEY)""")
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS assessments (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                assessment_name TEXT NOT NULL, tenant_name TEXT NOT NULL,
-                date_added TEXT NOT NULL, created_by TEXT NOT NULL DEFAULT '')""")
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS assessment_areas (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                assessment_id INTEGER NOT NULL REFERENCES assessments(id),
-                area_name TEXT NOT NULL, category TEXT NOT NULL, sqft REAL NOT NULL)""")
+        _rebuild_rollups(conn)
         conn.commit()
+    _read_cache().clear()  # rollup readers are keyed on their source tables
+    gh_push_db()
 
-        # ── Seed tenant types ────────────────────────────────────────
-        if conn.execute("SELECT COUNT(*) FROM tenant_types").fetchone()[0] == 0:
-            for t in ["Commercial","Residential","Retail","Industrial","Hospitality","Mixed-Use","Other"]:
-                conn.execute("INSERT OR IGNORE INTO tenant_types VALUES (?)", (t,))
-            conn.commit()
 
-        # ── Seed tenants ─────────────────────────────────────────────
-        if conn.execute("SELECT COUNT(*) FROM tenants").fetchone()[0] == 0:
-            for name, ttype in [("EDEN Tenant","Residential"),("Thaala Tenant","Commercial")]:
-                conn.execute("INSERT OR IGNORE INTO tenants VALUES (?,?)", (name, ttype))
-            conn.commit()
+@_profiled("db")
+def verify_rollups() -> list:
+    """Rollup rows that disagree with a fresh aggregate (empty list = consistent)."""
+    with get_db() as conn:
+        live_a = {r[0]: (r[1], r[2]) for r in conn.execute(
+            "SELECT a.id, COUNT(ar.id), COALESCE(SUM(ar.sqft),0) FROM assessments a "
+            "LEFT JOIN assessment_areas ar ON ar.assessment_id=a.id GROUP BY a.id")}
+        roll_a = {r[0]: (r[1], r[2]) for r in conn.execute(
+            "SELECT assessment_id, area_count, total_sqft FROM assessment_rollups")}
+        live_t = {(r[0], r[1]): (r[2], r[3]) for r in conn.execute(
+            "SELECT a.tenant_id, ar.category, COUNT(*), SUM(ar.sqft) FROM assessment_areas ar "
+            "JOIN assessments a ON a.id=ar.assessment_id GROUP BY a.tenant_id, ar.category")}
+        roll_t = {(r[0], r[1]): (r[2], r[3]) for r in conn.execute(
+            "SELECT tenant_id, category, area_count, total_sqft FROM tenant_rollups")}
+
+    bad = []
+    for scope, live, roll in (("assessment", live_a, roll_a), ("tenant", live_t, roll_t)):
+        for key in sorted(set(live) | set(roll), key=str):
+            lc, ls = live.get(key, (None, None))
+            rc, rs = roll.get(key, (None, None))
+            if lc != rc or ls is None or rs is None or abs(ls - rs) > 0.001:
+                bad.append({"scope": scope, "key": " / ".join(map(str, key)) if scope == "tenant" else str(key),
+                            "live_count": lc, "rollup_count": rc, "live_sqft": ls, "rollup_sqft": rs})
+    return bad
+
+
+_TENANT_ROLLUPS_SQL = ("SELECT t.tenant_name, r.category, r.area_count, r.total_sqft "
+                       "FROM tenant_rollups r JOIN tenants t ON t.id=r.tenant_id ")
+
+
+@_memoized("tenants", "assessments", "assessment_areas")
+@_profiled("db")
+def load_tenant_rollups(tenants: list = None) -> list:
+    """Per tenant/category area counts and SQFT, optionally limited to some tenants."""
+    with get_db() as conn:
+        if tenants is None:
+            rows = conn.execute(
+                _TENANT_ROLLUPS_SQL + "ORDER BY t.tenant_name, r.category").fetchall()
+        else:
+            rows = conn.execute(
+                _TENANT_ROLLUPS_SQL
+                + f"WHERE t.tenant_name IN ({','.join('?' * len(tenants))}) "
+                "ORDER BY t.tenant_name, r.category", list(tenants)).fetchall()
+    return [dict(r) for r in rows]
 
-        # ── Seed / ensure admin ──────────────────────────────────────
-        if conn.execute("SELECT COUNT(*) FROM users").fetchone()[0] == 0:
-            for uname, ud in _get_seed_users().items():
-                conn.execute(
-                    "INSERT OR IGNORE INTO users VALUES (?,?,?,?,?)",
-                    (uname, ud["display_name"], ud["role"],
-                     json.dumps(ud["tenant_access"]), ud["password_hash"]))
-            conn.commit()
 
-        # Always keep admin password current
-        conn.execute("UPDATE users SET password_hash=? WHERE username=?",
-                     (hash_pw("dex123"), "admin@dexxora360"))
-        conn.commit()
+@_profiled("db")
+def tenant_data_metrics(tenants: list) -> dict:
+    """Assessments with areas, area count and total SQFT for the given tenants."""
+    if not tenants:
+        return {"assessments": 0, "areas": 0, "total_sqft": 0.0}
+    marks = ",".join("?" * len(tenants))
+    with get_db() as conn:
+        areas, sqft = conn.execute(
+            f"SELECT COALESCE(SUM(r.area_count),0), COALESCE(SUM(r.total_sqft),0) "
+            f"FROM tenant_rollups r JOIN tenants t ON t.id=r.tenant_id "
+            f"WHERE t.tenant_name IN ({marks})", list(tenants)).fetchone()
+        n_assess = conn.execute(
+            f"SELECT COUNT(*) FROM assessments a JOIN assessment_rollups r "
+            f"ON r.assessment_id=a.id JOIN tenants t ON t.id=a.tenant_id "
+            f"WHERE r.area_count>0 AND t.tenant_name IN ({marks})",
+            list(tenants)).fetchone()[0]
+    return {"assessments": int(n_assess), "areas": int(areas), "total_sqft": float(sqft)}
 
 
 # ── Write-through helper ──────────────────────────────────────────
@@ -273,71 +3008,176 @@ def _write(fn, *args, **kwargs):
 
 
 # ── User functions ────────────────────────────────────────────────
-def load_users_from_db() -> dict:
-    with get_db() as conn:
-        rows = conn.execute("SELECT * FROM users").fetchall()
-    return {r["username"]: {
+def _user_record(r, tenant_access: list) -> dict:
+    return {
         "display_name":  r["display_name"],
         "role":          r["role"],
-        "tenant_access": json.loads(r["tenant_access"]),
+        "tenant_access": tenant_access,
         "password_hash": r["password_hash"],
-    } for r in rows}
+    }
 
 
-def save_user_to_db(username: str, ud: dict):
+_USER_ACCESS_SQL = ("SELECT ut.username, t.tenant_name FROM user_tenants ut "
+                    "JOIN tenants t ON t.id=ut.tenant_id ")
+
+
+@_memoized("users", "user_tenants", "tenants")
+@_profiled("db")
+def load_users_from_db() -> dict:
+    """Every user, keyed by username — for the admin user list only."""
+    access = {}
     with get_db() as conn:
-        conn.execute(
-            "INSERT OR REPLACE INTO users VALUES (?,?,?,?,?)",
-            (username, ud["display_name"], ud["role"],
-             json.dumps(ud["tenant_access"]), ud["password_hash"]))
-        conn.commit()
-    gh_push_db()
+        rows = conn.execute("SELECT * FROM users ORDER BY username").fetchall()
+        for r in conn.execute(_USER_ACCESS_SQL + "ORDER BY t.tenant_name"):
+            access.setdefault(r["username"], []).append(r["tenant_name"])
+    return {r["username"]: _user_record(r, access.get(r["username"], [])) for r in rows}
+
+
+def _set_user_access(conn, username: str, tenant_names: list):
+    """Make user_tenants match *tenant_names* for one user (unknown names are ignored)."""
+    names = list(tenant_names)
+    marks = ",".join("?" * len(names))
+    conn.execute(
+        f"DELETE FROM user_tenants WHERE username=? AND tenant_id NOT IN "
+        f"(SELECT id FROM tenants WHERE tenant_name IN ({marks}))", [username] + names)
+    conn.execute(
+        f"INSERT OR IGNORE INTO user_tenants (username, tenant_id) "
+        f"SELECT ?, id FROM tenants WHERE tenant_name IN ({marks})", [username] + names)
+
+
+def _save_user(conn, username: str, ud: dict):
+    conn.execute(
+        "INSERT INTO users (username, display_name, role, password_hash) VALUES (?,?,?,?) "
+        "ON CONFLICT(username) DO UPDATE SET display_name=excluded.display_name, "
+        "role=excluded.role, password_hash=excluded.password_hash",
+        (username, ud["display_name"], ud["role"], ud["password_hash"]))
+    _set_user_access(conn, username, ud["tenant_access"])
+
+
+class _UserDirectory:
+    """Process-wide cache of user records, filled by primary-key lookups.
+
+    Entries expire after USER_CACHE_TTL seconds and are dropped by the user
+    write helpers and after a GitHub pull; at most USER_CACHE_MAX are kept.
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        from collections import OrderedDict
+        self.ttl         = ttl
+        self.max_entries = max_entries
+        self._items      = OrderedDict()  # username -> (record, fetched_at)
+        self._lock       = threading.Lock()
+
+    def get(self, username: str, fresh: bool = False):
+        """The user's record (a copy), or None if there is no such user."""
+        if not username:
+            return None
+        now = time.monotonic()
+        if in_unit_of_work():
+            return self._fetch(username)  # uncommitted rows must not be cached
+        if not fresh:
+            with self._lock:
+                hit = self._items.get(username)
+                if hit and now - hit[1] < self.ttl:
+                    self._items.move_to_end(username)
+                    return dict(hit[0])
+        record = self._fetch(username)
+        with self._lock:
+            if record is None:
+                self._items.pop(username, None)
+                return None
+            self._items[username] = (record, now)
+            self._items.move_to_end(username)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+        return dict(record)
+
+    @staticmethod
+    @_profiled("db")
+    def _fetch(username: str):
+        with get_db() as conn:
+            row = conn.execute("SELECT * FROM users WHERE username=?", (username,)).fetchone()
+            if row is None:
+                return None
+            access = [r["tenant_name"] for r in conn.execute(
+                _USER_ACCESS_SQL + "WHERE ut.username=? ORDER BY t.tenant_name", (username,))]
+        return _user_record(row, access)
+
+    def invalidate(self, username: str = None):
+        with self._lock:
+            if username is None:
+                self._items.clear()
+            else:
+                self._items.pop(username, None)
+
+
+@st.cache_resource
+def user_directory() -> _UserDirectory:
+    return _UserDirectory(float(_db_setting("USER_CACHE_TTL", 60)),
+                          int(_db_setting("USER_CACHE_MAX", 1000)))
 
 
+@_profiled("db")
+def save_user_to_db(username: str, ud: dict):
+    with unit_of_work() as conn:
+        _save_user(conn, username, ud)
+        _after_commit(lambda: user_directory().invalidate(username))
+        gh_push_db()
+
+
+@_profiled("db")
 def delete_user_from_db(username: str):
     with get_db() as conn:
         conn.execute("DELETE FROM users WHERE username=?", (username,))
         conn.commit()
+    _after_commit(lambda: user_directory().invalidate(username))
     gh_push_db()
 
 
+@_profiled("db")
 def save_users_to_secrets(users: dict):
-    for uname, ud in users.items():
-        with get_db() as conn:
-            conn.execute(
-                "INSERT OR REPLACE INTO users VALUES (?,?,?,?,?)",
-                (uname, ud["display_name"], ud["role"],
-                 json.dumps(ud["tenant_access"]), ud["password_hash"]))
-            conn.commit()
-    gh_push_db()
-    st.session_state.users = load_users_from_db()
+    with unit_of_work() as conn:
+        for uname, ud in users.items():
+            _save_user(conn, uname, ud)
+        _after_commit(user_directory().invalidate)
+        gh_push_db()
 
 
 # ── Tenant functions ──────────────────────────────────────────────
+@_memoized("tenants")
+@_profiled("db")
 def load_tenants_from_db() -> list:
     with get_db() as conn:
-        rows = conn.execute("SELECT tenant_name, tenant_type FROM tenants ORDER BY tenant_name").fetchall()
-    return [{"name": r["tenant_name"], "type": r["tenant_type"]} for r in rows]
+        rows = conn.execute(
+            "SELECT id, tenant_name, tenant_type FROM tenants ORDER BY tenant_name").fetchall()
+    return [{"id": r["id"], "name": r["tenant_name"], "type": r["tenant_type"]} for r in rows]
 
 
 def get_tenant_names() -> list:
     return [t["name"] for t in load_tenants_from_db()]
 
 
+@_profiled("db")
 def add_tenant_to_db(name: str, ttype: str):
     with get_db() as conn:
-        conn.execute("INSERT OR IGNORE INTO tenants VALUES (?,?)", (name, ttype))
+        conn.execute("INSERT OR IGNORE INTO tenants (tenant_name, tenant_type) VALUES (?,?)",
+                     (name, ttype))
         conn.commit()
     gh_push_db()
 
 
+@_profiled("db")
 def delete_tenant_from_db(name: str):
+    """Delete a tenant with its assessments, their areas and user access to it
+    (all ON DELETE CASCADE)."""
     with get_db() as conn:
         conn.execute("DELETE FROM tenants WHERE tenant_name=?", (name,))
         conn.commit()
+    _after_commit(user_directory().invalidate)
     gh_push_db()
 
 
+@_profiled("db")
 def update_tenant_type_in_db(name: str, new_type: str):
     with get_db() as conn:
         conn.execute("UPDATE tenants SET tenant_type=? WHERE tenant_name=?", (new_type, name))
@@ -345,31 +3185,26 @@ def update_tenant_type_in_db(name: str, new_type: str):
     gh_push_db()
 
 
+@_profiled("db")
 def rename_tenant_in_db(old_name: str, new_name: str, new_type: str):
+    """Rename a tenant; user access and assessments follow its id."""
     with get_db() as conn:
         conn.execute("UPDATE tenants SET tenant_name=?, tenant_type=? WHERE tenant_name=?",
                      (new_name, new_type, old_name))
-        conn.execute("UPDATE assessments SET tenant_name=? WHERE tenant_name=?",
-                     (new_name, old_name))
-        conn.commit()
-    with get_db() as conn:
-        rows = conn.execute("SELECT username, tenant_access FROM users").fetchall()
-        for u in rows:
-            access = json.loads(u["tenant_access"])
-            if old_name in access:
-                access = [new_name if t == old_name else t for t in access]
-                conn.execute("UPDATE users SET tenant_access=? WHERE username=?",
-                             (json.dumps(access), u["username"]))
         conn.commit()
+    _after_commit(user_directory().invalidate)
     gh_push_db()
 
 
+@_memoized("tenant_types")
+@_profiled("db")
 def load_tenant_types_from_db() -> list:
     with get_db() as conn:
         rows = conn.execute("SELECT type_name FROM tenant_types ORDER BY type_name").fetchall()
     return [r["type_name"] for r in rows]
 
 
+@_profiled("db")
 def add_tenant_type_to_db(type_name: str):
     with get_db() as conn:
         conn.execute("INSERT OR IGNORE INTO tenant_types VALUES (?)", (type_name,))
@@ -377,6 +3212,7 @@ def add_tenant_type_to_db(type_name: str):
     gh_push_db()
 
 
+@_profiled("db")
 def delete_tenant_type_from_db(type_name: str):
     with get_db() as conn:
         conn.execute("DELETE FROM tenant_types WHERE type_name=?", (type_name,))
@@ -385,11 +3221,13 @@ def delete_tenant_type_from_db(type_name: str):
 
 
 # ── Assessment functions ──────────────────────────────────────────
+@_profiled("db")
 def create_assessment(assessment_name: str, tenant_name: str, created_by: str) -> int:
     date_str = datetime.now().strftime("%Y-%m-%d")
     with get_db() as conn:
         conn.execute(
-            "INSERT INTO assessments (assessment_name,tenant_name,date_added,created_by) VALUES (?,?,?,?)",
+            "INSERT INTO assessments (assessment_name,tenant_id,date_added,created_by) "
+            "VALUES (?,(SELECT id FROM tenants WHERE tenant_name=?),?,?)",
             (assessment_name, tenant_name, date_str, created_by))
         conn.commit()
         row = conn.execute("SELECT last_insert_rowid()").fetchone()
@@ -397,37 +3235,107 @@ def create_assessment(assessment_name: str, tenant_name: str, created_by: str) -
     return row[0]
 
 
+@_profiled("db")
 def update_assessment_header(assessment_id: int, assessment_name: str, tenant_name: str):
     with get_db() as conn:
-        conn.execute("UPDATE assessments SET assessment_name=?,tenant_name=? WHERE id=?",
+        conn.execute("UPDATE assessments SET assessment_name=?, "
+                     "tenant_id=(SELECT id FROM tenants WHERE tenant_name=?) WHERE id=?",
                      (assessment_name, tenant_name, assessment_id))
         conn.commit()
     gh_push_db()
 
 
+@_profiled("db")
 def delete_assessment(assessment_id: int):
-    with get_db() as conn:
+    with unit_of_work() as conn:
         conn.execute("DELETE FROM assessment_areas WHERE assessment_id=?", (assessment_id,))
         conn.execute("DELETE FROM assessments WHERE id=?", (assessment_id,))
-        conn.commit()
-    gh_push_db()
+        gh_push_db()
+
 
+_ASSESSMENT_HEADER_SQL = (
+    "SELECT a.id, a.assessment_name, t.tenant_name, a.date_added, a.created_by "
+    "FROM assessments a JOIN tenants t ON t.id=a.tenant_id ")
 
+
+@_memoized("tenants", "assessments")
+@_profiled("db")
 def load_assessments(created_by: str = None) -> list:
     with get_db() as conn:
         if created_by:
             rows = conn.execute(
-                "SELECT id,assessment_name,tenant_name,date_added,created_by "
-                "FROM assessments WHERE created_by=? ORDER BY id DESC", (created_by,)
+                _ASSESSMENT_HEADER_SQL + "WHERE a.created_by=? ORDER BY a.id DESC", (created_by,)
             ).fetchall()
         else:
             rows = conn.execute(
-                "SELECT id,assessment_name,tenant_name,date_added,created_by "
-                "FROM assessments ORDER BY id DESC"
+                _ASSESSMENT_HEADER_SQL + "ORDER BY a.id DESC"
             ).fetchall()
     return [dict(r) for r in rows]
 
 
+def _assessment_filter_sql(created_by: str = None, search: str = "",
+                           date_from: str = None, date_to: str = None) -> tuple:
+    """WHERE clause (possibly empty) and params for the assessment list filters.
+
+    Expects assessments as ``a`` joined to their tenant as ``t``.
+    """
+    clauses, params = [], []
+    if created_by:
+        clauses.append("a.created_by=?")
+        params.append(created_by)
+    if search:
+        like = "%" + search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        clauses.append("(a.assessment_name LIKE ? ESCAPE '\\' OR t.tenant_name LIKE ? ESCAPE '\\')")
+        params += [like, like]
+    if date_from:
+        clauses.append("a.date_added>=?")
+        params.append(date_from)
+    if date_to:
+        clauses.append("a.date_added<=?")
+        params.append(date_to)
+    return ("WHERE " + " AND ".join(clauses) + " " if clauses else ""), params
+
+
+@_memoized("tenants", "assessments", "assessment_areas")
+@_profiled("db")
+def load_assessments_page(created_by: str = None, search: str = "", date_from: str = None,
+                          date_to: str = None, before_id: int = None, limit: int = 25) -> tuple:
+    """One page of assessments, newest first, with their rollup counts.
+
+    Keyset pagination: pass the last id of the previous page as ``before_id``.
+    Returns (rows, has_more).
+    """
+    where, params = _assessment_filter_sql(created_by, search, date_from, date_to)
+    if before_id is not None:
+        where  = (where + "AND " if where else "WHERE ") + "a.id<? "
+        params = params + [before_id]
+    with get_db() as conn:
+        rows = conn.execute(
+            "SELECT a.id, a.assessment_name, t.tenant_name, a.date_added, a.created_by, "
+            "COALESCE(r.area_count,0) AS area_count, COALESCE(r.total_sqft,0) AS total_sqft "
+            "FROM assessments a JOIN tenants t ON t.id=a.tenant_id "
+            "LEFT JOIN assessment_rollups r ON r.assessment_id=a.id "
+            f"{where}ORDER BY a.id DESC LIMIT ?", params + [limit + 1]
+        ).fetchall()
+    return [dict(r) for r in rows[:limit]], len(rows) > limit
+
+
+@_profiled("db")
+def assessment_list_totals(created_by: str = None, search: str = "",
+                           date_from: str = None, date_to: str = None) -> dict:
+    """Assessment count, area count and SQFT over everything matching the filters."""
+    where, params = _assessment_filter_sql(created_by, search, date_from, date_to)
+    with get_db() as conn:
+        row = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(r.area_count),0), COALESCE(SUM(r.total_sqft),0) "
+            "FROM assessments a JOIN tenants t ON t.id=a.tenant_id "
+            "LEFT JOIN assessment_rollups r ON r.assessment_id=a.id "
+            f"{where}", params
+        ).fetchone()
+    return {"assessments": int(row[0]), "areas": int(row[1]), "total_sqft": float(row[2])}
+
+
+@_profiled("db")
 def add_area_to_assessment(assessment_id: int, area_name: str, category: str, sqft: float) -> int:
     with get_db() as conn:
         conn.execute(
@@ -439,6 +3347,7 @@ def add_area_to_assessment(assessment_id: int, area_name: str, category: str, sq
     return row[0]
 
 
+@_profiled("db")
 def update_area(area_id: int, area_name: str, category: str, sqft: float):
     with get_db() as conn:
         conn.execute("UPDATE assessment_areas SET area_name=?,category=?,sqft=? WHERE id=?",
@@ -447,6 +3356,7 @@ def update_area(area_id: int, area_name: str, category: str, sqft: float):
     gh_push_db()
 
 
+@_profiled("db")
 def delete_area(area_id: int):
     with get_db() as conn:
         conn.execute("DELETE FROM assessment_areas WHERE id=?", (area_id,))
@@ -454,6 +3364,21 @@ def delete_area(area_id: int):
     gh_push_db()
 
 
+@_profiled("db")
+def add_areas_to_assessment(assessment_id: int, areas: list) -> int:
+    """Insert (area_name, category, sqft) tuples in one transaction and one sync."""
+    if not areas:
+        return 0
+    with unit_of_work() as conn:
+        conn.executemany(
+            "INSERT INTO assessment_areas (assessment_id,area_name,category,sqft) VALUES (?,?,?,?)",
+            [(assessment_id, n, c, float(s)) for n, c, s in areas])
+        gh_push_db()
+    return len(areas)
+
+
+@_memoized("assessment_areas")
+@_profiled("db")
 def load_areas(assessment_id: int) -> list:
     with get_db() as conn:
         rows = conn.execute(
@@ -463,30 +3388,38 @@ def load_areas(assessment_id: int) -> list:
     return [dict(r) for r in rows]
 
 
+@_profiled("db")
 def get_assessment_summary(assessment_id: int) -> dict:
     with get_db() as conn:
         row = conn.execute(
-            "SELECT COUNT(*) as cnt, COALESCE(SUM(sqft),0) as total "
-            "FROM assessment_areas WHERE assessment_id=?", (assessment_id,)
+            "SELECT area_count, total_sqft FROM assessment_rollups WHERE assessment_id=?",
+            (assessment_id,)
         ).fetchone()
-    return {"count": int(row["cnt"]), "total_sqft": float(row["total"])}
+    if not row:
+        return {"count": 0, "total_sqft": 0.0}
+    return {"count": int(row["area_count"]), "total_sqft": float(row["total_sqft"])}
+
+
+_AREA_RECORD_COLUMNS = (
+    "a.id AS assessment_id, a.assessment_name, t.tenant_name, a.date_added, a.created_by, "
+    "ar.id AS area_id, ar.area_name, ar.category, ar.sqft")
+_AREA_RECORD_FROM = (
+    "FROM assessments a JOIN tenants t ON t.id=a.tenant_id "
+    "JOIN assessment_areas ar ON ar.assessment_id=a.id ")
 
 
+@_memoized("tenants", "assessments", "assessment_areas")
+@_profiled("db")
 def load_assessment_from_db(created_by: str = None) -> pd.DataFrame:
     with get_db() as conn:
         if created_by:
             rows = conn.execute(
-                "SELECT a.id as assessment_id, a.assessment_name, a.tenant_name, "
-                "a.date_added, a.created_by, ar.id as area_id, ar.area_name, ar.category, ar.sqft "
-                "FROM assessments a JOIN assessment_areas ar ON ar.assessment_id=a.id "
+                f"SELECT {_AREA_RECORD_COLUMNS} {_AREA_RECORD_FROM}"
                 "WHERE a.created_by=? ORDER BY a.id, ar.id", (created_by,)
             ).fetchall()
         else:
             rows = conn.execute(
-                "SELECT a.id as assessment_id, a.assessment_name, a.tenant_name, "
-                "a.date_added, a.created_by, ar.id as area_id, ar.area_name, ar.category, ar.sqft "
-                "FROM assessments a JOIN assessment_areas ar ON ar.assessment_id=a.id "
-                "ORDER BY a.id, ar.id"
+                f"SELECT {_AREA_RECORD_COLUMNS} {_AREA_RECORD_FROM}ORDER BY a.id, ar.id"
             ).fetchall()
     if rows:
         return pd.DataFrame([dict(r) for r in rows])
@@ -494,12 +3427,82 @@ def load_assessment_from_db(created_by: str = None) -> pd.DataFrame:
                                   "created_by","area_id","area_name","category","sqft"])
 
 
-def delete_all_assessment_data():
+def _area_record_filter_sql(tenants: list = None, categories: list = None,
+                            date_from: str = None, date_to: str = None,
+                            created_by: str = None) -> tuple:
+    """WHERE clause and params over _AREA_RECORD_FROM.
+
+    ``None`` means "no filter"; an empty list matches nothing.
+    """
+    clauses, params = [], []
+    for col, values in (("t.tenant_name", tenants), ("ar.category", categories)):
+        if values is not None:
+            clauses.append(f"{col} IN ({','.join('?' * len(values))})" if values else "0")
+            params += list(values)
+    if created_by:
+        clauses.append("a.created_by=?")
+        params.append(created_by)
+    if date_from:
+        clauses.append("a.date_added>=?")
+        params.append(date_from)
+    if date_to:
+        clauses.append("a.date_added<=?")
+        params.append(date_to)
+    return ("WHERE " + " AND ".join(clauses) + " " if clauses else ""), params
+
+
+@_profiled("db")
+def query_area_records(tenants: list = None, categories: list = None, date_from: str = None,
+                       date_to: str = None, limit: int = 100, offset: int = 0) -> pd.DataFrame:
+    """One page of the assessments × areas join, filtered in SQLite."""
+    where, params = _area_record_filter_sql(tenants, categories, date_from, date_to)
+    with get_db() as conn:
+        rows = conn.execute(
+            f"SELECT {_AREA_RECORD_COLUMNS} {_AREA_RECORD_FROM}"
+            f"{where}ORDER BY a.id, ar.id LIMIT ? OFFSET ?", params + [limit, offset]
+        ).fetchall()
+    if rows:
+        return pd.DataFrame([dict(r) for r in rows])
+    return pd.DataFrame(columns=["assessment_id","assessment_name","tenant_name","date_added",
+                                  "created_by","area_id","area_name","category","sqft"])
+
+
+@_profiled("db")
+def area_record_metrics(tenants: list = None, categories: list = None,
+                        date_from: str = None, date_to: str = None) -> dict:
+    """Assessments, area count and total SQFT over the filtered area records.
+
+    Tenant-only filters are answered from the rollup tables; category or
+    date filters fall back to one aggregate over the join.
+    """
+    if tenants is not None and not tenants:
+        return {"assessments": 0, "areas": 0, "total_sqft": 0.0}
+    if categories is None and not date_from and not date_to:
+        if tenants is not None:
+            return tenant_data_metrics(tenants)
+        with get_db() as conn:
+            areas, sqft = conn.execute(
+                "SELECT COALESCE(SUM(area_count),0), COALESCE(SUM(total_sqft),0) "
+                "FROM tenant_rollups").fetchone()
+            n_assess = conn.execute(
+                "SELECT COUNT(*) FROM assessment_rollups WHERE area_count>0").fetchone()[0]
+        return {"assessments": int(n_assess), "areas": int(areas), "total_sqft": float(sqft)}
+
+    where, params = _area_record_filter_sql(tenants, categories, date_from, date_to)
     with get_db() as conn:
+        row = conn.execute(
+            "SELECT COUNT(DISTINCT a.id), COUNT(*), COALESCE(SUM(ar.sqft),0) "
+            f"{_AREA_RECORD_FROM}{where}", params
+        ).fetchone()
+    return {"assessments": int(row[0]), "areas": int(row[1]), "total_sqft": float(row[2])}
+
+
+@_profiled("db")
+def delete_all_assessment_data():
+    with unit_of_work() as conn:
         conn.execute("DELETE FROM assessment_areas")
         conn.execute("DELETE FROM assessments")
-        conn.commit()
-    gh_push_db()
+        gh_push_db()
 
 
 def db_to_display_df(db_df: pd.DataFrame) -> pd.DataFrame:
@@ -526,9 +3529,133 @@ def delete_assessment_rows_for_tenants(tenant_names): pass
 def save_full_assessment_to_db(df): pass
 
 
-# ── Startup: pull DB from GitHub, then init schema ────────────────
-gh_pull_db()
-init_db()
+# ── Area import ───────────────────────────────────────────────────
+#
+# Bulk upload of areas from CSV/XLSX. Rows are parsed and validated as
+# whole columns, previewed with per-row errors, and the valid ones go in
+# through add_areas_to_assessment — one transaction, one sync. Headers
+# are matched loosely so a sheet exported from this app imports as-is.
+# XLSX needs openpyxl, listed in requirements.txt; without it only CSV imports.
+_IMPORT_HEADERS = {
+    "area_name": ("area_name", "area name", "name of area", "area", "name"),
+    "category":  ("category",),
+    "sqft":      ("sqft", "coverage (sqft)", "coverage", "area (sqft)"),
+}
+_IMPORT_LABELS   = {"area_name": "Area Name", "category": "Category", "sqft": "SQFT"}
+_IMPORT_TEMPLATE = "Area Name,Category,SQFT\nMain Lobby,Lobby,1250\nRoom 101,Suite/Room,320\n"
+
+
+def read_area_upload(filename: str, data: bytes) -> pd.DataFrame:
+    """Parse an uploaded file into row / area_name / category / sqft columns.
+
+    ``row`` is the spreadsheet row number (header = row 1). Raises
+    ValueError for unreadable files or missing columns.
+    """
+    buf = io.BytesIO(data)
+    try:
+        if filename.lower().endswith((".xlsx", ".xlsm")):
+            df = pd.read_excel(buf, dtype=str)
+        else:
+            df = pd.read_csv(buf, dtype=str, encoding="utf-8-sig", skip_blank_lines=False)
+    except ImportError:
+        raise ValueError("Excel import needs openpyxl — install it or upload a CSV.")
+    except Exception as e:
+        raise ValueError(f"Could not read {filename}: {e}")
+    lookup = {alias: col for col, aliases in _IMPORT_HEADERS.items() for alias in aliases}
+    df = df.rename(columns=lambda c: lookup.get(" ".join(str(c).lower().split()), c))
+    df = df.loc[:, ~df.columns.duplicated()]
+    missing = [_IMPORT_LABELS[c] for c in _IMPORT_HEADERS if c not in df.columns]
+    if missing:
+        raise ValueError("Missing column(s): " + ", ".join(missing) + ".")
+    df = df[list(_IMPORT_HEADERS)]
+    df.insert(0, "row", df.index + 2)
+    return df.dropna(how="all", subset=list(_IMPORT_HEADERS)).reset_index(drop=True)
+
+
+def validate_area_import(df: pd.DataFrame) -> pd.DataFrame:
+    """Normalise parsed rows and add an ``error`` column ('' for valid rows)."""
+    out = pd.DataFrame({"row": df["row"]})
+    out["area_name"] = df["area_name"].fillna("").str.strip()
+    raw_cat   = df["category"].fillna("").str.strip()
+    canonical = raw_cat.str.lower().map({c.lower(): c for c in _CATS})
+    out["category"] = canonical.fillna(raw_cat)
+    out["sqft"] = pd.to_numeric(
+        df["sqft"].fillna("").str.replace(",", "").str.strip(), errors="coerce")
+    problems = pd.DataFrame({
+        "Area Name is required; ":     out["area_name"].eq(""),
+        "unknown category; ":          canonical.isna(),
+        "SQFT must be a number > 0; ": ~((out["sqft"] > 0) & (out["sqft"] < float("inf"))),
+    })
+    out["error"] = problems.dot(problems.columns).str.rstrip("; ")
+    return out
+
+
+# ── Startup ───────────────────────────────────────────────────────
+#
+# Streamlit re-executes this file on every interaction, so startup work
+# lives in a cache_resource object and runs once per process. The local
+# schema is brought up synchronously (no network, milliseconds) so the
+# first page renders from the local copy; the remote pull runs on a
+# background thread and re-checks the schema in case it replaced the DB.
+# refresh() repeats the pull on demand. Phase timings go to the log.
+_log = get_logger(__name__)
+
+
+class _Startup:
+    def __init__(self):
+        self.timings = {}
+        self.error   = None
+        self.done    = threading.Event()
+        self._lock   = threading.Lock()
+        self._thread = None
+        self._timed("init_db", init_db)
+        if _storage() is not None:
+            self._timed("sync_worker", _sync_worker)  # resume pushes left in the outbox
+        self.refresh(force=False)
+
+    def _timed(self, phase: str, fn, *args):
+        t0 = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            self.timings[phase] = time.perf_counter() - t0
+
+    def refresh(self, force: bool = True):
+        """Pull from the remote store in the background; no-op while a pull is running."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self.done.clear()
+            self._thread = threading.Thread(target=self._pull, args=(force,),
+                                            name="v360-startup", daemon=True)
+            self._thread.start()
+
+    def _pull(self, force: bool):
+        try:
+            if _storage() is not None:
+                self._timed("pull", gh_pull_db, force)
+                self._timed("init_db_after_pull", init_db)
+                user_directory().invalidate()
+            self.error = None
+        except Exception as e:
+            self.error = str(e)
+            _log.warning("startup pull failed: %s", e)
+        finally:
+            self.done.set()
+            _log.info("startup timings: %s", ", ".join(
+                f"{k}={v * 1000:.0f}ms" for k, v in dict(self.timings).items()))
+
+    def wait(self, timeout: float = None) -> bool:
+        """Block until the current pull finishes; False on timeout."""
+        return self.done.wait(timeout)
+
+
+@st.cache_resource
+def _startup() -> _Startup:
+    return _Startup()
+
+
+_startup()
 
 
 
@@ -547,9 +3674,6 @@ def init_state():
         if k not in st.session_state:
             st.session_state[k] = v
 
-    if "users" not in st.session_state:
-        st.session_state.users = load_users_from_db()
-
     if "tenants" not in st.session_state:
         st.session_state.tenants = load_tenants_from_db()
 
@@ -560,36 +3684,90 @@ def init_state():
         st.session_state.last_category = "Suite/Room"
 
 
+_profiler().begin()
 init_state()
 
 # ─────────────────────────────────────────────
 # PDF GENERATOR
 # ─────────────────────────────────────────────
+_PDF_TABLE_STYLE = [
+    ("BACKGROUND",    (0, 0), (-1,  0), colors.HexColor("#1a2535")),
+    ("TEXTCOLOR",     (0, 0), (-1,  0), colors.white),
+    ("FONTNAME",      (0, 0), (-1,  0), "Helvetica-Bold"),
+    ("FONTSIZE",      (0, 0), (-1,  0), 9),
+    ("BOTTOMPADDING", (0, 0), (-1,  0), 8),
+    ("TOPPADDING",    (0, 0), (-1,  0), 8),
+    ("FONTSIZE",      (0, 1), (-1, -1), 8),
+    ("TOPPADDING",    (0, 1), (-1, -1), 5),
+    ("BOTTOMPADDING", (0, 1), (-1, -1), 5),
+    ("GRID",          (0, 0), (-1, -1), 0.4, colors.HexColor("#d0d8e4")),
+    ("VALIGN",        (0, 0), (-1, -1), "MIDDLE"),
+    ("ROWBACKGROUNDS",(0, 1), (-1, -1), [colors.white, colors.HexColor("#f4f7fb")]),
+]
+
+
+def _pdf_cell(v) -> str:
+    if v is None:
+        return ""
+    if isinstance(v, float):
+        return "" if v != v else f"{v:,.2f}"
+    return str(v)
+
+
+def _pdf_doc(fp, pagesize) -> SimpleDocTemplate:
+    from reportlab.lib.units import inch
+    return SimpleDocTemplate(
+        fp, pagesize=pagesize, pageCompression=1,
+        leftMargin=0.6*inch, rightMargin=0.6*inch,
+        topMargin=0.7*inch,  bottomMargin=0.6*inch,
+    )
+
+
+def _pdf_masthead(title: str, styl) -> list:
+    from reportlab.lib.units import inch
+    from reportlab.platypus import Image as RLImage
+
+    elements = []
+    # Logo image, read from the in-process asset cache
+    try:
+        elements.append(RLImage(io.BytesIO(asset_bytes(LOGO_FULL)),
+                                width=2.2*inch, height=0.55*inch))
+        elements.append(Spacer(1, 6))
+    except Exception:
+        elements.append(Paragraph("Dexxora Pvt Ltd", styl["Title"]))
+
+    return elements + [
+        Paragraph(title, styl["Heading2"]),
+        Paragraph(f"Generated: {datetime.now():%Y-%m-%d %H:%M}", styl["Normal"]),
+        Spacer(1, 14),
+    ]
+
+
+def _pdf_footer(styl) -> list:
+    return [
+        Spacer(1, 12),
+        Paragraph(f"© {datetime.now().year} Dexxora Pvt Ltd. All rights reserved.", styl["Normal"]),
+    ]
+
+
+def _pdf_error(fp, e: Exception):
+    doc = SimpleDocTemplate(fp)
+    doc.build([Paragraph(f"PDF error: {e}", getSampleStyleSheet()["Normal"])])
+
+
+@_profiled("pdf")
 def generate_pdf(df: pd.DataFrame, title: str = "Virtual360 Area Assessment Report") -> bytes:
     from reportlab.lib.units import inch
     from reportlab.lib.pagesizes import A4, landscape
-    from reportlab.platypus import Image as RLImage
-    import base64 as _b64, tempfile as _tmp
 
     try:
         buf      = io.BytesIO()
         pagesize = landscape(A4) if len(df.columns) > 5 else A4
-        doc      = SimpleDocTemplate(
-            buf, pagesize=pagesize,
-            leftMargin=0.6*inch, rightMargin=0.6*inch,
-            topMargin=0.7*inch,  bottomMargin=0.6*inch,
-        )
+        doc      = _pdf_doc(buf, pagesize)
         styl = getSampleStyleSheet()
 
-        def clean(v):
-            if v is None:
-                return ""
-            if isinstance(v, float):
-                return "" if v != v else f"{v:,.2f}"
-            return str(v)
-
         header    = list(df.columns)
-        data_rows = [[clean(v) for v in row] for row in df.values.tolist()]
+        data_rows = [[_pdf_cell(v) for v in row] for row in df.values.tolist()]
         rows      = [header] + data_rows
 
         page_w = pagesize[0] - 1.2*inch
@@ -597,53 +3775,405 @@ def generate_pdf(df: pd.DataFrame, title: str = "Virtual360 Area Assessment Repo
         col_w  = page_w / n_cols
 
         table = Table(rows, colWidths=[col_w]*n_cols, repeatRows=1)
-        table.setStyle(TableStyle([
-            ("BACKGROUND",    (0, 0), (-1,  0), colors.HexColor("#1a2535")),
-            ("TEXTCOLOR",     (0, 0), (-1,  0), colors.white),
-            ("FONTNAME",      (0, 0), (-1,  0), "Helvetica-Bold"),
-            ("FONTSIZE",      (0, 0), (-1,  0), 9),
-            ("BOTTOMPADDING", (0, 0), (-1,  0), 8),
-            ("TOPPADDING",    (0, 0), (-1,  0), 8),
-            ("FONTSIZE",      (0, 1), (-1, -1), 8),
-            ("TOPPADDING",    (0, 1), (-1, -1), 5),
-            ("BOTTOMPADDING", (0, 1), (-1, -1), 5),
-            ("GRID",          (0, 0), (-1, -1), 0.4, colors.HexColor("#d0d8e4")),
-            ("VALIGN",        (0, 0), (-1, -1), "MIDDLE"),
-            ("ROWBACKGROUNDS",(0, 1), (-1, -1), [colors.white, colors.HexColor("#f4f7fb")]),
-        ]))
-
-        elements = []
-
-        # Logo image
-        try:
-            logo_bytes = _b64.b64decode(LOGO_FULL_B64)
-            with _tmp.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-                tmp.write(logo_bytes)
-                tmp_path = tmp.name
-            elements.append(RLImage(tmp_path, width=2.2*inch, height=0.55*inch))
-            elements.append(Spacer(1, 6))
-        except Exception:
-            elements.append(Paragraph("Dexxora Pvt Ltd", styl["Title"]))
-
-        elements += [
-            Paragraph(title, styl["Heading2"]),
-            Paragraph(f"Generated: {datetime.now():%Y-%m-%d %H:%M}", styl["Normal"]),
-            Spacer(1, 14),
-            table,
-            Spacer(1, 12),
-            Paragraph(f"© {datetime.now().year} Dexxora Pvt Ltd. All rights reserved.", styl["Normal"]),
-        ]
-
-        doc.build(elements)
+        table.setStyle(TableStyle(_PDF_TABLE_STYLE))
+
+        doc.build(_pdf_masthead(title, styl) + [table] + _pdf_footer(styl))
         return buf.getvalue()
 
     except Exception as e:
         buf  = io.BytesIO()
-        doc  = SimpleDocTemplate(buf)
-        doc.build([Paragraph(f"PDF error: {e}", getSampleStyleSheet()["Normal"])])
+        _pdf_error(buf, e)
         return buf.getvalue()
 
 
+# ── Streaming area report ─────────────────────────────────────────
+# generate_pdf lays out one Table over an in-memory DataFrame, which is
+# fine for a single assessment but not for "every area of every tenant".
+# The streaming report pulls rows from SQLite in chunks, emits page-sized
+# tables (header repeated, grouped by tenant and assessment with
+# subtotals) through a lazily refilled flowable list, and writes to a
+# spooled temp file — so memory stays flat however many rows are exported.
+_PDF_FETCH_ROWS     = 500
+_PDF_ROWS_PER_TABLE = 40
+_PDF_SPOOL_MAX      = 8 * 1024 * 1024
+_PDF_REPORT_COLUMNS = ["Assessment Name", "Tenant Name", "Date Added",
+                       "Name of Area", "Category", "Coverage (SQFT)"]
+
+
+class _FlowableStream(list):
+    """List facade over a flowable generator, topped up as reportlab consumes it.
+
+    ``doc.build`` only ever looks at the head of its list, so a short buffer
+    is enough to lay out an arbitrarily long report.
+    """
+
+    def __init__(self, source, low_water: int = 4):
+        super().__init__()
+        self._source    = iter(source)
+        self._low_water = low_water
+
+    def _fill(self):
+        while self._source is not None and list.__len__(self) < self._low_water:
+            try:
+                self.append(next(self._source))
+            except StopIteration:
+                self._source = None
+
+    def __len__(self):
+        self._fill()
+        return list.__len__(self)
+
+    def __getitem__(self, i):
+        self._fill()
+        return list.__getitem__(self, i)
+
+
+def _iter_area_records(tenants=None, categories=None, date_from=None, date_to=None,
+                       created_by=None):
+    """Filtered area records in tenant/assessment order, fetched in chunks."""
+    where, params = _area_record_filter_sql(tenants, categories, date_from, date_to, created_by)
+    with get_db() as conn:
+        cur = conn.execute(
+            f"SELECT {_AREA_RECORD_COLUMNS} {_AREA_RECORD_FROM}"
+            f"{where}ORDER BY t.tenant_name, a.id, ar.id", params)
+        try:
+            while True:
+                batch = cur.fetchmany(_PDF_FETCH_ROWS)
+                if not batch:
+                    break
+                yield from batch
+        finally:
+            cur.close()
+
+
+def _area_report_flowables(records, col_w: list, styl):
+    from xml.sax.saxutils import escape
+
+    rows, totals = [], []                      # totals: (row index, is_tenant)
+    tenant = assessment = None
+    a_name = ""
+    a_n = a_sqft = t_n = t_sqft = 0
+    g_tenants = g_assess = g_n = 0
+    g_sqft = 0.0
+
+    def table():
+        style = list(_PDF_TABLE_STYLE)
+        for i, is_tenant in totals:
+            style += [
+                ("SPAN",       (0, i), (-2, i)),
+                ("FONTNAME",   (0, i), (-1, i), "Helvetica-Bold"),
+                ("BACKGROUND", (0, i), (-1, i),
+                 colors.HexColor("#dfe7f1" if is_tenant else "#eef2f7")),
+            ]
+        t = Table([_PDF_REPORT_COLUMNS] + rows, colWidths=col_w, repeatRows=1)
+        t.setStyle(TableStyle(style))
+        rows.clear()
+        totals.clear()
+        return t
+
+    def subtotal(label, n, sqft, is_tenant):
+        rows.append([f"{label} ({n:,} areas)", "", "", "", "", f"{sqft:,.2f}"])
+        totals.append((len(rows), is_tenant))
+
+    for r in records:
+        if r["assessment_id"] != assessment and assessment is not None:
+            subtotal(f"Subtotal · {a_name}", a_n, a_sqft, False)
+        if r["tenant_name"] != tenant:
+            if tenant is not None:
+                subtotal(f"Tenant total · {tenant}", t_n, t_sqft, True)
+                yield table()
+                yield Spacer(1, 10)
+            tenant, t_n, t_sqft = r["tenant_name"], 0, 0
+            g_tenants += 1
+            yield Paragraph(f"Tenant: {escape(str(tenant))}", styl["Heading3"])
+        if r["assessment_id"] != assessment:
+            assessment, a_name, a_n, a_sqft = r["assessment_id"], r["assessment_name"], 0, 0
+            g_assess += 1
+        sqft = r["sqft"] or 0
+        a_n, t_n, g_n = a_n + 1, t_n + 1, g_n + 1
+        a_sqft, t_sqft, g_sqft = a_sqft + sqft, t_sqft + sqft, g_sqft + sqft
+        rows.append([_pdf_cell(r[k]) for k in ("assessment_name", "tenant_name", "date_added",
+                                                "area_name", "category")]
+                    + [_pdf_cell(float(sqft))])
+        if len(rows) >= _PDF_ROWS_PER_TABLE:
+            yield table()
+
+    if tenant is None:
+        yield Paragraph("No area records match the selected filters.", styl["Normal"])
+        return
+    subtotal(f"Subtotal · {a_name}", a_n, a_sqft, False)
+    subtotal(f"Tenant total · {tenant}", t_n, t_sqft, True)
+    yield table()
+    yield Spacer(1, 14)
+    summary = Table(
+        [["Tenants", "Assessments", "Areas", "Total SQFT"],
+         [f"{g_tenants:,}", f"{g_assess:,}", f"{g_n:,}", f"{g_sqft:,.2f}"]],
+        colWidths=[sum(col_w) / 4] * 4)
+    summary.setStyle(TableStyle(_PDF_TABLE_STYLE))
+    yield summary
+
+
+def stream_area_report_pdf(tenants: list = None, categories: list = None,
+                           date_from: str = None, date_to: str = None,
+                           created_by: str = None,
+                           title: str = "Virtual360 Area Assessment Report"):
+    """Render the filtered area records to a PDF with bounded memory.
+
+    Returns a rewound ``SpooledTemporaryFile``; the caller closes it.
+    """
+    from reportlab.lib.units import inch
+    from reportlab.lib.pagesizes import A4, landscape
+
+    out = tempfile.SpooledTemporaryFile(max_size=_PDF_SPOOL_MAX)
+    records = _iter_area_records(tenants, categories, date_from, date_to, created_by)
+    try:
+        pagesize = landscape(A4)
+        styl     = getSampleStyleSheet()
+        n_cols   = len(_PDF_REPORT_COLUMNS)
+        col_w    = [(pagesize[0] - 1.2*inch) / n_cols] * n_cols
+
+        def flowables():
+            yield from _pdf_masthead(title, styl)
+            yield from _area_report_flowables(records, col_w, styl)
+            yield from _pdf_footer(styl)
+
+        _pdf_doc(out, pagesize).build(_FlowableStream(flowables()))
+    except Exception as e:
+        out.close()
+        out = tempfile.SpooledTemporaryFile(max_size=_PDF_SPOOL_MAX)
+        _pdf_error(out, e)
+    finally:
+        records.close()
+    out.seek(0)
+    return out
+
+
+# ── On-demand PDF cache ───────────────────────────────────────────
+# Download buttons take a callable, so a PDF is only rendered when someone
+# clicks. Rendered bytes are kept in a process-wide LRU keyed by the report
+# arguments plus the data_versions tokens of the scopes it covers; any
+# write to those rows changes the key. Capped by PDF_CACHE_ENTRIES and
+# PDF_CACHE_MB in secrets.
+class _PdfCache:
+    """Thread-safe LRU of rendered PDFs, bounded by entry count and bytes."""
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        from collections import OrderedDict
+        self.max_entries = max_entries
+        self.max_bytes   = max_bytes
+        self._items      = OrderedDict()
+        self._bytes      = 0
+        self._lock       = threading.Lock()
+        self.hits = self.misses = 0
+
+    def get_or_render(self, key, render) -> bytes:
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return self._items[key]
+            self.misses += 1
+        data = render()
+        if len(data) > self.max_bytes:
+            return data
+        with self._lock:
+            if key not in self._items:
+                self._items[key] = data
+                self._bytes += len(data)
+            while len(self._items) > self.max_entries or self._bytes > self.max_bytes:
+                _, old = self._items.popitem(last=False)
+                self._bytes -= len(old)
+        return data
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._items), "bytes": self._bytes,
+                    "hits": self.hits, "misses": self.misses}
+
+
+@st.cache_resource
+def _pdf_cache() -> _PdfCache:
+    return _PdfCache(int(_db_setting("PDF_CACHE_ENTRIES", 16)),
+                     int(float(_db_setting("PDF_CACHE_MB", 64)) * 1024 * 1024))
+
+
+@_profiled("pdf")
+def assessment_pdf(assessment_id: int) -> bytes:
+    """PDF of one assessment's areas, rendered once per data version."""
+    key = ("assessment", assessment_id,
+           data_versions([f"assessment:{assessment_id}", "table:tenants"]))  # title names the tenant
+
+    def render():
+        with get_db() as conn:
+            hdr = conn.execute(_ASSESSMENT_HEADER_SQL + "WHERE a.id=?",
+                               (assessment_id,)).fetchone()
+        areas = load_areas(assessment_id)
+        pdf_df = pd.DataFrame(areas, columns=["area_name", "category", "sqft"]).rename(columns={
+            "area_name": "Area Name", "category": "Category", "sqft": "Coverage (SQFT)"
+        })
+        title = f"{hdr['assessment_name']} — {hdr['tenant_name']}" if hdr else "Assessment"
+        return generate_pdf(pdf_df, title=title)
+
+    return _pdf_cache().get_or_render(key, render)
+
+
+@_profiled("pdf")
+def area_report_pdf(tenants: list, title: str = "All Tenant Assessment Report",
+                    date_from: str = None, date_to: str = None) -> bytes:
+    """Streaming area report for *tenants*, rendered once per data version."""
+    tenants = sorted(tenants)
+    ids = {t["name"]: t["id"] for t in load_tenants_from_db()}
+    key = ("area_report", tuple(tenants), title, date_from, date_to,
+           data_versions([f"tenant:{ids[t]}" for t in tenants if t in ids]))
+
+    def render():
+        with stream_area_report_pdf(tenants=tenants, date_from=date_from, date_to=date_to,
+                                    title=title) as pdf:
+            return pdf.read()
+
+    return _pdf_cache().get_or_render(key, render)
+
+
+# ── Data export ───────────────────────────────────────────────────
+# Raw area records for downstream analytics, with the same filters as the
+# reports. Every format is written from _iter_area_records chunk by chunk
+# into a spooled temp file, so memory stays flat however many rows match.
+# CSV and JSON Lines need only the standard library; XLSX uses openpyxl in
+# write-only mode and Parquet uses pyarrow. Both are in requirements.txt;
+# without them those formats are left out of the menu.
+try:
+    import pyarrow as _pa
+    import pyarrow.parquet as _pq
+except ImportError:
+    _pa = _pq = None
+try:
+    from openpyxl import Workbook as _XlsxWorkbook
+except ImportError:
+    _XlsxWorkbook = None
+
+_EXPORT_COLUMNS = ["assessment_id", "assessment_name", "tenant_name", "date_added",
+                   "created_by", "area_id", "area_name", "category", "sqft"]
+_EXPORT_FORMATS = {                   # fmt: (label, mime type)
+    "csv":     ("CSV",        "text/csv"),
+    "xlsx":    ("Excel",      "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    "parquet": ("Parquet",    "application/vnd.apache.parquet"),
+    "jsonl":   ("JSON Lines", "application/x-ndjson"),
+}
+_XLSX_MAX_ROWS = 1_048_575            # per sheet, after the header row
+
+
+def export_formats() -> list:
+    """Export formats usable in this environment."""
+    return [f for f in _EXPORT_FORMATS
+            if (f != "xlsx" or _XlsxWorkbook) and (f != "parquet" or _pa)]
+
+
+def _record_batches(records):
+    batch = []
+    for r in records:
+        batch.append(tuple(r))
+        if len(batch) >= _PDF_FETCH_ROWS:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _export_csv(batches, fp):
+    text = io.TextIOWrapper(fp, encoding="utf-8", newline="")
+    w = csv.writer(text)
+    w.writerow(_EXPORT_COLUMNS)
+    for batch in batches:
+        w.writerows(batch)
+    text.flush()
+    text.detach()                     # leave fp open for the caller
+
+
+def _export_jsonl(batches, fp):
+    for batch in batches:
+        fp.write("".join(json.dumps(dict(zip(_EXPORT_COLUMNS, r)), ensure_ascii=False) + "\n"
+                         for r in batch).encode())
+
+
+def _export_xlsx(batches, fp):
+    wb, ws, n = _XlsxWorkbook(write_only=True), None, _XLSX_MAX_ROWS
+    for batch in batches:
+        for r in batch:
+            if n == _XLSX_MAX_ROWS:   # start a new sheet when one fills up
+                ws = wb.create_sheet(f"Areas {len(wb.worksheets) + 1}" if ws else "Areas")
+                ws.append(_EXPORT_COLUMNS)
+                n = 0
+            ws.append(r)
+            n += 1
+    if ws is None:
+        wb.create_sheet("Areas").append(_EXPORT_COLUMNS)
+    wb.save(fp)
+
+
+def _export_parquet(batches, fp):
+    schema = _pa.schema([
+        ("assessment_id", _pa.int64()), ("assessment_name", _pa.string()),
+        ("tenant_name", _pa.string()), ("date_added", _pa.string()),
+        ("created_by", _pa.string()), ("area_id", _pa.int64()),
+        ("area_name", _pa.string()), ("category", _pa.string()), ("sqft", _pa.float64()),
+    ])
+    with _pq.ParquetWriter(fp, schema, compression="zstd") as w:
+        for batch in batches:   # one row group per fetched chunk
+            w.write_table(_pa.Table.from_arrays(
+                [_pa.array(col, type=f.type) for col, f in zip(zip(*batch), schema)],
+                schema=schema))
+
+
+_EXPORT_WRITERS = {"csv": _export_csv, "jsonl": _export_jsonl,
+                   "xlsx": _export_xlsx, "parquet": _export_parquet}
+
+
+def export_area_records(fmt: str, fp, tenants: list = None, categories: list = None,
+                        date_from: str = None, date_to: str = None,
+                        created_by: str = None) -> int:
+    """Write the filtered area records to binary file *fp* as *fmt*; returns the row count.
+
+    Filters behave as in area_record_metrics. Raises ValueError for a
+    format that is unknown or whose optional dependency is missing.
+    """
+    if fmt not in export_formats():
+        raise ValueError(f"Export format {fmt!r} is not available "
+                         f"(choose from {', '.join(export_formats())}).")
+    records = _iter_area_records(tenants, categories, date_from, date_to, created_by)
+    count = 0
+
+    def counted():
+        nonlocal count
+        for batch in _record_batches(records):
+            count += len(batch)
+            yield batch
+
+    try:
+        _EXPORT_WRITERS[fmt](counted(), fp)
+    finally:
+        records.close()
+    return count
+
+
+def stream_area_export(fmt: str, **filters):
+    """export_area_records into a rewound SpooledTemporaryFile; the caller closes it."""
+    out = tempfile.SpooledTemporaryFile(max_size=_PDF_SPOOL_MAX)
+    try:
+        export_area_records(fmt, out, **filters)
+    except Exception:
+        out.close()
+        raise
+    out.seek(0)
+    return out
+
+
+@_profiled("export")
+def area_export_bytes(fmt: str, **filters) -> bytes:
+    """Finished export file as bytes, for st.download_button."""
+    with stream_area_export(fmt, **filters) as f:
+        return f.read()
+
+
 # ─────────────────────────────────────────────
 # LOGIN PAGE
 # ─────────────────────────────────────────────
@@ -653,6 +4183,7 @@ def generate_temp_password(length=10):
     return "".join(secrets.choice(chars) for _ in range(length))
 
 
+@_profiled("mail")
 def send_reset_email(to_email: str, username: str, temp_password: str) -> bool:
     """Send temp password email via SMTP. Reads credentials from st.secrets."""
     try:
@@ -665,7 +4196,7 @@ def send_reset_email(to_email: str, username: str, temp_password: str) -> bool:
         if not smtp_user or not smtp_pass:
             return False
 
-        msg = MIMEMultipart("alternative")
+        msg = MIMEMultipart("related")
         msg["Subject"] = "Virtual360 — Password Reset"
         msg["From"]    = f"Dexxora Virtual360 <{from_email}>"
         msg["To"]      = to_email
@@ -674,7 +4205,7 @@ def send_reset_email(to_email: str, username: str, temp_password: str) -> bool:
         <div style="font-family:Arial,sans-serif;max-width:480px;margin:auto;
                     background:#f7f9fc;border-radius:10px;padding:32px;">
           <div style="text-align:center;margin-bottom:16px;">
-            <img src="data:image/png;base64,{LOGO_FULL_B64}"
+            <img src="cid:dexxora-logo"
                  style="max-width:200px;height:auto;">
           </div>
           <p style="color:#666;text-align:center;margin-top:0;">Password Reset Request</p>
@@ -693,12 +4224,18 @@ def send_reset_email(to_email: str, username: str, temp_password: str) -> bool:
         </div>
         """
         msg.attach(MIMEText(html, "html"))
+        logo = MIMEImage(asset_bytes(LOGO_FULL), "png")
+        logo.add_header("Content-ID", "<dexxora-logo>")
+        logo.add_header("Content-Disposition", "inline", filename=LOGO_FULL)
+        msg.attach(logo)
 
         with smtplib.SMTP(smtp_host, smtp_port) as server:
             server.ehlo()
             server.starttls()
             server.login(smtp_user, smtp_pass)
-            server.sendmail(from_email, to_email, msg.as_string())
+            payload = msg.as_string()
+            _profile_bytes(len(payload))
+            server.sendmail(from_email, to_email, payload)
         return True
     except Exception as e:
         st.session_state["_smtp_error"] = str(e)
@@ -753,21 +4290,19 @@ def dlg_add_user():
         nu = (nu_prefix.strip() + _DOMAIN) if nu_prefix.strip() else ""
         if not nu_prefix.strip() or not np1:
             st.error("Username and password are required.")
-        elif nu in st.session_state.users:
+        elif user_directory().get(nu, fresh=True) is not None:
             st.error(f"Username **{nu}** already exists.")
         elif np1 != np2:
             st.error("Passwords do not match.")
         elif not nh:
             st.error("Select at least one tenant.")
         else:
-            st.session_state.users[nu] = {
+            save_user_to_db(nu, {
                 "password_hash": hash_pw(np1),
                 "role":          nr,
                 "tenant_access": nh,
                 "display_name":  nd or nu_prefix.strip(),
-            }
-            save_users_to_secrets(st.session_state.users)
-            st.session_state.users       = load_users_from_db()
+            })
             st.session_state._dlg_action = None
             st.session_state._dlg_target = None
             st.rerun()
@@ -775,7 +4310,7 @@ def dlg_add_user():
 
 @st.dialog("✏️ Edit User", width="large")
 def dlg_edit_user(username):
-    ud            = st.session_state.users.get(username, {})
+    ud            = user_directory().get(username) or {}
     valid_tenants = get_tenant_names()
     safe_acc      = [a for a in ud.get("tenant_access", []) if a in valid_tenants]
     with st.form("dlg_edit_form", clear_on_submit=False):
@@ -793,12 +4328,11 @@ def dlg_edit_user(username):
         if not eu_access:
             st.error("Select at least one tenant.")
         else:
-            updated = dict(st.session_state.users[username])
+            updated = user_directory().get(username, fresh=True) or dict(ud)
             updated["display_name"]  = eu_dname.strip() or username
             updated["role"]          = eu_role
             updated["tenant_access"] = eu_access
             save_user_to_db(username, updated)
-            st.session_state.users       = load_users_from_db()
             st.session_state._dlg_action = None
             st.session_state._dlg_target = None
             st.rerun()
@@ -821,10 +4355,12 @@ def dlg_change_pw(username):
         elif p1 != p2:
             st.error("Passwords do not match.")
         else:
-            updated = dict(st.session_state.users[username])
+            updated = user_directory().get(username, fresh=True)
+            if updated is None:
+                st.error(f"User **{username}** no longer exists.")
+                return
             updated["password_hash"] = hash_pw(p1)
             save_user_to_db(username, updated)
-            st.session_state.users       = load_users_from_db()
             st.session_state._dlg_action = None
             st.session_state._dlg_target = None
             st.rerun()
@@ -835,10 +4371,7 @@ def dlg_delete_user(username):
     st.warning(f"Delete **{username}**? This cannot be undone.", icon="⚠️")
     c1, c2 = st.columns(2)
     if c1.button("🗑️ Yes, Delete", use_container_width=True, type="primary"):
-        if username in st.session_state.users:
-            del st.session_state.users[username]
         delete_user_from_db(username)
-        st.session_state.users       = load_users_from_db()
         st.session_state._dlg_action = None
         st.session_state._dlg_target = None
         st.rerun()
@@ -905,7 +4438,6 @@ def dlg_edit_tenant(tenant_name):
         else:
             rename_tenant_in_db(tenant_name, new_name, new_type)
             st.session_state.tenants      = load_tenants_from_db()
-            st.session_state.users        = load_users_from_db()
             st.session_state._tdlg_action = None
             st.session_state._tdlg_target = None
             st.rerun()
@@ -913,17 +4445,13 @@ def dlg_edit_tenant(tenant_name):
 
 @st.dialog("🗑️ Delete Tenant", width="medium")
 def dlg_delete_tenant(tenant_name):
-    st.warning(f"Delete **{tenant_name}**? This cannot be undone.", icon="⚠️")
+    st.warning(f"Delete **{tenant_name}** and all of its assessments? This cannot be undone.",
+               icon="⚠️")
     st.caption("Users assigned to this tenant will have it removed from their access.")
     c1, c2 = st.columns(2)
     if c1.button("🗑️ Yes, Delete", use_container_width=True, type="primary"):
         delete_tenant_from_db(tenant_name)
-        for uname, ud in st.session_state.users.items():
-            if tenant_name in ud["tenant_access"]:
-                ud["tenant_access"] = [t for t in ud["tenant_access"] if t != tenant_name]
-                save_user_to_db(uname, ud)
         st.session_state.tenants      = load_tenants_from_db()
-        st.session_state.users        = load_users_from_db()
         st.session_state._tdlg_action = None
         st.session_state._tdlg_target = None
         st.rerun()
@@ -979,7 +4507,7 @@ def dlg_manage_types():
 def dlg_new_assessment():
     current_user     = st.session_state.current_user
     is_admin         = st.session_state.current_role == "admin"
-    tenant_access    = st.session_state.users[current_user]["tenant_access"]
+    tenant_access    = st.session_state.user_record["tenant_access"]
     tenants_for_form = get_tenant_names() if is_admin else tenant_access
     with st.form("frm_new_assessment", clear_on_submit=True):
         aname = st.text_input("Assessment Name", placeholder="e.g. Q1 Floor Survey 2025")
@@ -1004,7 +4532,7 @@ def dlg_new_assessment():
 def dlg_edit_assessment(a):
     current_user     = st.session_state.current_user
     is_admin         = st.session_state.current_role == "admin"
-    tenant_access    = st.session_state.users[current_user]["tenant_access"]
+    tenant_access    = st.session_state.user_record["tenant_access"]
     tenants_for_form = get_tenant_names() if is_admin else tenant_access
     cur_t  = a["tenant_name"]
     t_idx  = tenants_for_form.index(cur_t) if cur_t in tenants_for_form else 0
@@ -1067,6 +4595,43 @@ def dlg_add_area():
             st.rerun()
 
 
+@st.dialog("📤 Import Areas", width="large")
+def dlg_import_areas():
+    aid = st.session_state._open_assessment
+    st.caption(f"CSV or Excel with **Area Name**, **Category** and **SQFT** columns. "
+               f"Categories: {', '.join(_CATS)}.")
+    st.download_button("📄 Download template", data=_IMPORT_TEMPLATE,
+                       file_name="areas_template.csv", mime="text/csv")
+    up = st.file_uploader("Areas file", type=["csv", "xlsx"], key="dlg_import_file")
+    rows = None
+    if up is not None:
+        try:
+            rows = validate_area_import(read_area_upload(up.name, up.getvalue()))
+        except ValueError as e:
+            st.error(str(e))
+    if rows is not None:
+        bad = rows["error"] != ""
+        valid = rows[~bad]
+        m1, m2, m3 = st.columns(3)
+        m1.metric("Rows",   len(rows))
+        m2.metric("Valid",  len(valid))
+        m3.metric("Errors", int(bad.sum()))
+        st.dataframe(
+            pd.concat([rows[bad], valid]).rename(
+                columns={"row": "Row", **_IMPORT_LABELS, "error": "Error"}),
+            hide_index=True, use_container_width=True, height=260)
+        skip = bad.any() and st.checkbox(f"Skip the {int(bad.sum())} row(s) with errors")
+        if st.button(f"✅ Import {len(valid)} area(s)", type="primary", use_container_width=True,
+                     disabled=valid.empty or (bad.any() and not skip)):
+            add_areas_to_assessment(
+                aid, list(valid[["area_name", "category", "sqft"]].itertuples(index=False, name=None)))
+            st.session_state._adlg_action = None
+            st.rerun()
+    if st.button("✖ Cancel", key="dlg_import_areas_cancel", use_container_width=True):
+        st.session_state._adlg_action = None
+        st.rerun()
+
+
 @st.dialog("✏️ Edit Area", width="large")
 def dlg_edit_area(area):
     cur_idx = _CATS.index(area["category"]) if area["category"] in _CATS else 0
@@ -1111,7 +4676,7 @@ def show_login():
     with col:
         st.markdown(f"""
         <div style='text-align:center;padding:32px 0 8px 0;'>
-            <img src='data:image/png;base64,{LOGO_FULL_B64}'
+            <img src='{asset_url(LOGO_FULL)}'
                  style='max-width:220px;width:80%;height:auto;margin-bottom:6px;'>
             <p style='color:#888;font-size:.88rem;margin-top:4px;letter-spacing:.3px;'>Virtual360 Cost Assessment</p>
         </div>""", unsafe_allow_html=True)
@@ -1143,13 +4708,21 @@ def show_login():
         password = st.text_input("Password", type="password", placeholder="Enter password")
 
         if st.button("🔐 Login", use_container_width=True, type="primary"):
-            gh_pull_db()  # always fetch latest DB before authenticating
-            st.session_state.users = load_users_from_db()
-            users = st.session_state.users
-            if username in users and users[username]["password_hash"] == hash_pw(password):
+            if _sync_setting("GH_PULL_SWR", 0):
+                gh_pull_db_async()  # log in on the local copy, refresh in the background
+            else:
+                # Fetch the latest DB before authenticating (no-op if unchanged). The pull
+                # runs on the startup thread, so one already in flight is joined, not doubled;
+                # if it outlasts the timeout we log in on the local copy.
+                startup = _startup()
+                startup.refresh(force=False)
+                startup.wait(timeout=15)
+            ud = user_directory().get(username, fresh=True)
+            if ud is not None and ud["password_hash"] == hash_pw(password):
                 st.session_state.logged_in    = True
                 st.session_state.current_user = username
-                st.session_state.current_role = users[username]["role"]
+                st.session_state.current_role = ud["role"]
+                st.session_state.user_record  = ud
                 st.rerun()
             else:
                 st.error("Invalid username or password.")
@@ -1179,16 +4752,14 @@ def show_login():
 
             if send_btn:
                 fp_username = (fp_prefix.strip() + DOMAIN) if fp_prefix.strip() else ""
-                fresh_users = load_users_from_db()
                 if not fp_prefix.strip():
                     st.error("Please enter your username.")
                 else:
-                    if fp_username in fresh_users:
+                    ud = user_directory().get(fp_username, fresh=True)
+                    if ud is not None:
                         temp_pw = generate_temp_password()
-                        ud = dict(fresh_users[fp_username])
                         ud["password_hash"] = hash_pw(temp_pw)
                         save_user_to_db(fp_username, ud)
-                        st.session_state.users = load_users_from_db()
                         ok = send_reset_email(ADMIN_RESET_EMAIL, fp_username, temp_pw)
                         if ok:
                             st.success(f"✅ Reset email sent to **{ADMIN_RESET_EMAIL}**")
@@ -1212,8 +4783,11 @@ def show_login():
             st.markdown("Default credentials: `admin` / `dex123`")
             st.markdown("The domain `@dexxora360` is added automatically.")
             if st.button("🔄 Reset database to defaults", type="secondary"):
+                _db_pool().close_all()
                 if os.path.exists(DB_PATH):
                     os.remove(DB_PATH)
+                _startup.clear()  # rebuild schema (and re-pull) on the rerun
+                user_directory().invalidate()
                 for k in list(st.session_state.keys()):
                     del st.session_state[k]
                 st.rerun()
@@ -1223,7 +4797,129 @@ def show_login():
 # ─────────────────────────────────────────────
 def show_admin_panel():
     st.markdown("## ⚙️ Admin Panel")
-    st.caption(f"Database: `{DB_PATH}`")
+    rc = _read_cache().stats()
+    st.caption(f"Database: `{DB_PATH}` · read cache {rc['hits']:,} hits / "
+               f"{rc['misses']:,} misses, {rc['entries']} entries")
+    sync = sync_status()
+    if sync["configured"]:
+        s1, s2, s3, s4 = st.columns([1, 1.4, 3, 1])
+        s1.metric("Pending Pushes", sync["depth"])
+        s2.metric("Last Sync", f"{sync['last_sync']:%H:%M:%S}" if sync["last_sync"] else "—")
+        s3.caption(f"{sync['backend']}: `{sync['target']}`")
+        if sync["last_error"]:
+            s3.caption(f"⚠️ Last error ({sync['failures']} in a row): {sync['last_error']}")
+        if sync["last_pull_error"]:
+            s3.caption(f"⚠️ Last pull error: {sync['last_pull_error']}")
+        if s4.button("☁️ Sync Now", use_container_width=True, disabled=not sync["depth"]):
+            if _sync_worker().flush():
+                st.toast(f"Database pushed to {sync['backend']}.")
+            st.rerun()
+        startup = _startup()
+        if s4.button("⬇️ Refresh", use_container_width=True, disabled=not startup.done.is_set(),
+                     help="Pull the latest database from remote storage"):
+            startup.refresh()
+            startup.wait(timeout=30)
+            st.rerun()
+        s3.caption("Startup: " + ", ".join(f"{k} {v * 1000:.0f} ms"
+                                           for k, v in dict(startup.timings).items()))
+        if startup.error:
+            s3.caption(f"⚠️ Pull error: {startup.error}")
+        if sync["conflicts"]:
+            with st.expander(f"⚠️ Sync conflicts ({sync['conflicts']})"):
+                st.caption("Rows changed on this replica and another one before they synced. "
+                           "The later change won; the other is listed here.")
+                st.dataframe(sync_conflicts(), hide_index=True, use_container_width=True)
+                k1, k2, k3 = st.columns(3)
+                if k1.button("🧹 Clear list", use_container_width=True):
+                    clear_sync_conflicts()
+                    st.rerun()
+                if sync["mode"] == "snapshot" and sync["depth"]:
+                    # Snapshots cannot be merged — someone has to pick a side
+                    if k2.button("⬆️ Keep local", use_container_width=True,
+                                 help="Overwrite remote storage with this replica's database"):
+                        gh_force_push()
+                        st.rerun()
+                    if k3.button("⬇️ Keep remote", use_container_width=True,
+                                 help="Discard writes not pushed yet and pull from remote storage"):
+                        gh_discard_local()
+                        st.rerun()
+    prof = _profiler()
+    if prof.keep:
+        with st.expander("⏱️ Rerun profiler"):
+            # A snapshot, so picking a rerun does not shift the list under the selectbox
+            if "_prof_view" not in st.session_state:
+                st.session_state._prof_view = prof.snapshot()
+            reruns, background = st.session_state._prof_view
+            st.caption(f"Last {prof.keep} reruns across all sessions. Category columns count "
+                       "time outside other profiled calls; Other is rendering and the rest.")
+            if reruns:
+                st.dataframe(_profile_reruns_frame(reruns), hide_index=True,
+                             use_container_width=True,
+                             column_config={"At": st.column_config.TimeColumn(format="HH:mm:ss")})
+                by_id = {r["id"]: r for r in reruns}
+                pick  = st.selectbox("Rerun breakdown", list(by_id), key="prof_pick",
+                                     format_func=lambda i: f"#{i} · {by_id[i]['label']} · "
+                                                           f"{by_id[i]['seconds'] * 1000:.0f} ms")
+                calls = _profile_calls_frame(by_id[pick]["calls"])
+                st.dataframe(calls, hide_index=True, use_container_width=True)
+                repeated = calls[(calls["Category"] == "db") & (calls["Calls"] >= 10)]
+                if not repeated.empty:
+                    st.caption("⚠️ Called 10+ times in one rerun (possible N+1): "
+                               + ", ".join(repeated["Function"]))
+            else:
+                st.caption("No reruns recorded yet.")
+            if background:
+                st.markdown(f"**Background threads** since {prof.since:%H:%M:%S}")
+                st.dataframe(_profile_calls_frame(background), hide_index=True,
+                             use_container_width=True)
+            p1, p2, _ = st.columns([1, 1, 3])
+            if p1.button("🔄 Refresh", use_container_width=True, key="prof_refresh"):
+                del st.session_state._prof_view
+                st.rerun()
+            if p2.button("🧹 Reset", use_container_width=True, key="prof_reset"):
+                prof.reset()
+                del st.session_state._prof_view
+                st.rerun()
+    qlog = _query_log()
+    with st.expander(f"🐢 Slow queries ({len(qlog.statements)})" if qlog.enabled
+                     else "🐢 Slow queries (off)"):
+        def apply_qlog():
+            qlog.enabled      = st.session_state.qlog_on
+            qlog.threshold_ms = st.session_state.qlog_ms
+
+        # The log is server-wide: show its current state, not this session's last input
+        st.session_state.qlog_on = qlog.enabled
+        st.session_state.qlog_ms = float(qlog.threshold_ms)
+        q1, q2, _ = st.columns([1, 1, 3], vertical_alignment="bottom")
+        q1.toggle("Log slow queries", key="qlog_on", on_change=apply_qlog,
+                  help="Applies to the whole server; connections switch as they are reused")
+        q2.number_input("Threshold (ms)", min_value=0.1, step=10.0, key="qlog_ms",
+                        on_change=apply_qlog)
+        summary = qlog.summary()
+        if summary.empty:
+            st.caption(f"No statements over {qlog.threshold_ms:g} ms recorded."
+                       if qlog.enabled else "Off. Turn on to record statements over the threshold.")
+        else:
+            st.caption("Grouped by statement with literals folded; parameters are shown as "
+                       "types only. Full scan means the plan reads a whole table or index.")
+            st.dataframe(summary.drop(columns=["Plan"]), hide_index=True,
+                         use_container_width=True,
+                         column_config={"Last": st.column_config.TimeColumn(format="HH:mm:ss")})
+            pick = st.selectbox("Query plan", range(len(summary)), key="qlog_pick",
+                                format_func=lambda i: summary["Statement"][i][:120])
+            st.code(summary["Plan"][pick] or "(no plan for this statement)", language=None)
+            with st.popover("Recent slow statements"):
+                st.dataframe(qlog.recent_frame(), hide_index=True, use_container_width=True)
+            e1, e2, e3, _ = st.columns([1, 1, 1, 2])
+            e1.download_button("📥 CSV", data=summary.to_csv(index=False).encode(),
+                               file_name=f"slow_queries_{datetime.now():%Y%m%d_%H%M}.csv",
+                               mime="text/csv", use_container_width=True)
+            e2.download_button("📥 JSON", data=qlog.export_json,
+                               file_name=f"slow_queries_{datetime.now():%Y%m%d_%H%M}.json",
+                               mime="application/json", use_container_width=True)
+            if e3.button("🧹 Clear", use_container_width=True, key="qlog_clear"):
+                qlog.clear()
+                st.rerun()
     st.markdown("---")
 
     tab_users, tab_tenants, tab_data, tab_export = st.tabs([
@@ -1244,7 +4940,7 @@ def show_admin_panel():
 
         st.markdown("---")
 
-        users_list = list(st.session_state.users.items())
+        users_list = list(load_users_from_db().items())
         if not users_list:
             st.info("No users found.")
         else:
@@ -1353,21 +5049,61 @@ def show_admin_panel():
     # ── TAB 3 : All Tenant Data ───────────────────────────────────────
     with tab_data:
         st.subheader("All Assessment Records")
-        flat_df = load_assessment_from_db()
-        if flat_df.empty:
+        if area_record_metrics()["areas"] == 0:
             st.info("No assessment data recorded yet.")
         else:
-            disp = db_to_display_df(flat_df)
-            hf = st.multiselect("Filter by Tenant", get_tenant_names(),
-                                default=get_tenant_names(), key="adm_hf")
-            vdf = disp[disp["Tenant Name"].isin(hf)]
+            tenant_names = get_tenant_names()
+            hf = st.multiselect("Filter by Tenant", tenant_names,
+                                default=tenant_names, key="adm_hf")
+            f1, f2, f3, f4 = st.columns([2.4, 1.2, 1.2, 1])
+            cf    = f1.multiselect("Filter by Category", _CATS, key="adm_cf",
+                                   placeholder="All categories")
+            dfrom = f2.date_input("From", value=None, key="adm_from")
+            dto   = f3.date_input("To",   value=None, key="adm_to")
+            page_size = f4.selectbox("Rows per page", [50, 100, 250, 500], index=1,
+                                     key="adm_page_size")
+            filters = {
+                "tenants":    hf,
+                "categories": cf or None,
+                "date_from":  dfrom.isoformat() if dfrom else None,
+                "date_to":    dto.isoformat() if dto else None,
+            }
+            metrics = area_record_metrics(**filters)
+
+            filter_key = (tuple(hf), tuple(cf), filters["date_from"], filters["date_to"], page_size)
+            if st.session_state.get("_adm_filter_key") != filter_key:
+                st.session_state._adm_filter_key = filter_key
+                st.session_state.adm_page        = 1
+            n_pages = max(1, -(-metrics["areas"] // page_size))
+            page    = min(st.session_state.get("adm_page", 1), n_pages)
+            offset  = (page - 1) * page_size
+
+            vdf = db_to_display_df(query_area_records(**filters, limit=page_size, offset=offset))
             st.dataframe(vdf, use_container_width=True, hide_index=True)
+            p1, p2 = st.columns([1, 5])
+            st.session_state.adm_page = page
+            p1.number_input("Page", min_value=1, max_value=n_pages, step=1, key="adm_page")
+            p2.caption(f"Rows {offset + 1 if len(vdf) else 0:,}–{offset + len(vdf):,} "
+                       f"of {metrics['areas']:,} · page {page} of {n_pages}")
             c1, c2, c3 = st.columns(3)
-            c1.metric("Assessments", vdf["Assessment ID"].nunique() if "Assessment ID" in vdf.columns else 0)
-            c2.metric("Total Areas", len(vdf))
-            c3.metric("Total SQFT",  f"{vdf['Coverage (SQFT)'].sum():,.1f}" if "Coverage (SQFT)" in vdf.columns else "0")
+            c1.metric("Assessments", metrics["assessments"])
+            c2.metric("Total Areas", metrics["areas"])
+            c3.metric("Total SQFT",  f"{metrics['total_sqft']:,.1f}")
 
         st.markdown("---")
+        with st.expander("🧮 Summary rollups"):
+            st.caption("Area counts and SQFT totals are kept in rollup tables by database triggers.")
+            rv1, rv2, _ = st.columns([1, 1, 3])
+            if rv1.button("🔍 Verify", use_container_width=True, key="rollup_verify"):
+                bad = verify_rollups()
+                if bad:
+                    st.warning(f"{len(bad)} rollup rows out of date.")
+                    st.dataframe(pd.DataFrame(bad), use_container_width=True, hide_index=True)
+                else:
+                    st.success("Rollups match the area records.")
+            if rv2.button("🔁 Rebuild", use_container_width=True, key="rollup_rebuild"):
+                rebuild_rollups()
+                st.success("Rollups rebuilt.")
         if st.button("🗑️ Clear ALL Data", type="primary"):
             delete_all_assessment_data()
             st.success("All assessment data cleared.")
@@ -1376,23 +5112,45 @@ def show_admin_panel():
     # ── TAB 4 : Export Reports ────────────────────────────────────────
     with tab_export:
         st.subheader("Export Assessment Report")
-        flat_df = load_assessment_from_db()
-        if flat_df.empty:
+        if not area_record_metrics()["areas"]:
             st.info("No data to export yet.")
         else:
-            disp = db_to_display_df(flat_df)
             eh = st.multiselect("Include Tenants", get_tenant_names(),
                                 default=get_tenant_names(), key="adm_eh")
-            edf = disp[disp["Tenant Name"].isin(eh)]
-            if not edf.empty:
-                pdf_cols = ["Assessment Name","Tenant Name","Date Added","Name of Area","Category","Coverage (SQFT)"]
-                export_df = edf[[c for c in pdf_cols if c in edf.columns]]
+            d1, d2, _ = st.columns([1.2, 1.2, 3])
+            efrom = d1.date_input("From", value=None, key="adm_efrom")
+            eto   = d2.date_input("To",   value=None, key="adm_eto")
+            efilters = {
+                "tenants":   list(eh),
+                "date_from": efrom.isoformat() if efrom else None,
+                "date_to":   eto.isoformat() if eto else None,
+            }
+            em = area_record_metrics(**efilters)
+            if em["areas"]:
+                st.caption(f"{em['areas']:,} areas across {em['assessments']:,} assessments")
                 st.download_button(
                     label="📥 Download PDF Report",
-                    data=generate_pdf(export_df, title="All Tenant Assessment Report"),
+                    data=lambda f=efilters: area_report_pdf(**f),
                     file_name=f"Dexxora_Assessment_{datetime.now():%Y%m%d}.pdf",
                     mime="application/pdf",
                 )
+
+                st.markdown("#### Raw data")
+                x1, x2, _ = st.columns([1.2, 1.6, 2.6], vertical_alignment="bottom")
+                fmt = x1.selectbox("Format", export_formats(), key="adm_export_fmt",
+                                   format_func=lambda f: _EXPORT_FORMATS[f][0])
+                x2.download_button(
+                    label=f"📥 Download {_EXPORT_FORMATS[fmt][0]}",
+                    data=lambda fmt=fmt, f=efilters: area_export_bytes(fmt, **f),
+                    file_name=f"Dexxora_Areas_{datetime.now():%Y%m%d}.{fmt}",
+                    mime=_EXPORT_FORMATS[fmt][1],
+                    use_container_width=True,
+                )
+                missing = [n for f, n in (("xlsx", "Excel needs openpyxl"),
+                                          ("parquet", "Parquet needs pyarrow"))
+                           if f not in export_formats()]
+                if missing:
+                    st.caption("; ".join(missing) + " on the server.")
             else:
                 st.warning("No data for selected tenants.")
 
@@ -1401,11 +5159,11 @@ def show_admin_panel():
 def show_assessment():
     is_admin      = st.session_state.current_role == "admin"
     current_user  = st.session_state.current_user
-    user_data     = st.session_state.users[current_user]
+    user_data     = st.session_state.user_record
     tenant_access = user_data["tenant_access"]
 
     st.markdown(
-        f"<img src='data:image/png;base64,{LOGO_FULL_B64}' "
+        f"<img src='{asset_url(LOGO_FULL)}' "
         f"style='height:30px;width:auto;margin-bottom:2px;'>",
         unsafe_allow_html=True,
     )
@@ -1421,10 +5179,7 @@ def show_assessment():
     if st.session_state._open_assessment is not None:
         aid = st.session_state._open_assessment
         with get_db() as conn:
-            hdr = conn.execute(
-                "SELECT id, assessment_name, tenant_name, date_added, created_by "
-                "FROM assessments WHERE id=?", (aid,)
-            ).fetchone()
+            hdr = conn.execute(_ASSESSMENT_HEADER_SQL + "WHERE a.id=?", (aid,)).fetchone()
         if not hdr:
             st.session_state._open_assessment = None
             st.rerun()
@@ -1447,19 +5202,20 @@ def show_assessment():
             st.caption(f"Created by: **{str(hdr.get('created_by','')).split('@')[0]}**")
         st.markdown("---")
 
-        ab1, ab2, _ = st.columns([1.2, 1.2, 4])
+        ab1, ab2, ab3, _ = st.columns([1.2, 1.2, 1.2, 2.8])
         if ab1.button("➕ Add Area", type="primary", use_container_width=True):
             st.session_state._adlg_action = "add_area"
             st.session_state._adlg_target = None
             st.rerun()
+        if ab2.button("📤 Import Areas", use_container_width=True):
+            st.session_state._adlg_action = "import_areas"
+            st.session_state._adlg_target = None
+            st.rerun()
 
         if areas:
-            pdf_df = pd.DataFrame(areas).rename(columns={
-                "area_name": "Area Name", "category": "Category", "sqft": "Coverage (SQFT)"
-            })[["Area Name", "Category", "Coverage (SQFT)"]]
-            ab2.download_button(
+            ab3.download_button(
                 label="📥 Export PDF",
-                data=generate_pdf(pdf_df, title=f"{hdr['assessment_name']} — {hdr['tenant_name']}"),
+                data=lambda aid=aid: assessment_pdf(aid),
                 file_name=f"{hdr['assessment_name'].replace(' ','_')}_{datetime.now():%Y%m%d}.pdf",
                 mime="application/pdf",
                 use_container_width=True,
@@ -1468,7 +5224,7 @@ def show_assessment():
         st.markdown("")
 
         if not areas:
-            st.info("No areas yet — click **➕ Add Area** to start.")
+            st.info("No areas yet — click **➕ Add Area** or **📤 Import Areas** to start.")
         else:
             AREA_W = [0.4, 3.2, 2.4, 1.4, 0.5, 0.5]
             h_cols = st.columns(AREA_W)
@@ -1513,6 +5269,8 @@ def show_assessment():
         atgt = st.session_state._adlg_target
         if aact == "add_area":
             dlg_add_area()
+        elif aact == "import_areas":
+            dlg_import_areas()
         elif aact == "edit_area" and atgt:
             tgt = next((a for a in areas if a["id"] == atgt), None)
             if tgt: dlg_edit_area(tgt)
@@ -1528,22 +5286,43 @@ def show_assessment():
         st.session_state._adlg_target = None
         st.rerun()
 
-    if is_admin:
-        assessments = load_assessments()
-    else:
-        assessments = load_assessments(created_by=current_user)
+    f1, f2, f3, f4 = st.columns([3, 1.3, 1.3, 1])
+    search    = f1.text_input("Search", placeholder="Assessment or tenant name", key="alist_search")
+    date_from = f2.date_input("From", value=None, key="alist_from")
+    date_to   = f3.date_input("To",   value=None, key="alist_to")
+    page_size = f4.selectbox("Per page", [10, 25, 50, 100], index=1, key="alist_page_size")
+    filters = {
+        "created_by": None if is_admin else current_user,
+        "search":     search.strip(),
+        "date_from":  date_from.isoformat() if date_from else None,
+        "date_to":    date_to.isoformat() if date_to else None,
+    }
+
+    # Keyset cursors: one "before id" per page visited; reset when the filters change
+    filter_key = (tuple(filters.values()), page_size)
+    if st.session_state.get("_alist_filter_key") != filter_key:
+        st.session_state._alist_filter_key = filter_key
+        st.session_state._alist_cursors    = [None]
+    cursors = st.session_state._alist_cursors
+
+    assessments, has_more = load_assessments_page(before_id=cursors[-1], limit=page_size, **filters)
+    if not assessments and len(cursors) > 1:
+        cursors.pop()  # page emptied by a delete — step back
+        st.rerun()
+    totals = assessment_list_totals(**filters)
 
     st.markdown("---")
 
     if not assessments:
-        st.info("No assessments yet — click **➕ New Assessment** to create one.")
+        if any(filters[k] for k in ("search", "date_from", "date_to")):
+            st.info("No assessments match the current search.")
+        else:
+            st.info("No assessments yet — click **➕ New Assessment** to create one.")
     else:
-        total_areas = sum(get_assessment_summary(a["id"])["count"] for a in assessments)
-        total_sqft  = sum(get_assessment_summary(a["id"])["total_sqft"] for a in assessments)
         sm1, sm2, sm3 = st.columns(3)
-        sm1.metric("Assessments", len(assessments))
-        sm2.metric("Total Areas", total_areas)
-        sm3.metric("Total SQFT",  f"{total_sqft:,.1f}")
+        sm1.metric("Assessments", totals["assessments"])
+        sm2.metric("Total Areas", totals["areas"])
+        sm3.metric("Total SQFT",  f"{totals['total_sqft']:,.1f}")
         st.markdown("")
 
         if is_admin:
@@ -1561,7 +5340,6 @@ def show_assessment():
         st.markdown("<hr style='margin:3px 0 4px;border-color:#e0e7ef;'>", unsafe_allow_html=True)
 
         for a in assessments:
-            summary = get_assessment_summary(a["id"])
             rc = st.columns(COL_W)
 
             if rc[0].button("👁", key=f"open_{a['id']}", help="Open", use_container_width=True):
@@ -1573,7 +5351,7 @@ def show_assessment():
             rc[2].markdown(f"<span style='font-weight:600;font-size:.88rem;'>{a['assessment_name']}</span>", unsafe_allow_html=True)
             rc[3].markdown(f"<span style='font-size:.85rem;'>{a['tenant_name']}</span>", unsafe_allow_html=True)
             rc[4].markdown(f"<span style='font-size:.82rem;color:#666;'>{a['date_added']}</span>", unsafe_allow_html=True)
-            cnt = summary["count"]
+            cnt = a["area_count"]
             rc[5].markdown(
                 f"<span style='background:#e8f0fe;color:#1a56db;font-size:.78rem;"
                 f"font-weight:700;padding:2px 7px;border-radius:10px;'>{cnt}</span>",
@@ -1597,6 +5375,20 @@ def show_assessment():
 
             st.markdown("<div style='height:2px;'></div>", unsafe_allow_html=True)
 
+        n_pages = max(1, -(-totals["assessments"] // page_size))
+        pg1, pg2, pg3 = st.columns([1, 3, 1])
+        if pg1.button("← Newer", key="alist_prev", disabled=len(cursors) == 1,
+                      use_container_width=True):
+            cursors.pop()
+            st.rerun()
+        pg2.markdown(
+            f"<div style='text-align:center;color:#888;font-size:.82rem;padding-top:8px;'>"
+            f"Page {len(cursors)} of {n_pages}</div>", unsafe_allow_html=True)
+        if pg3.button("Older →", key="alist_next", disabled=not has_more,
+                      use_container_width=True):
+            cursors.append(assessments[-1]["id"])
+            st.rerun()
+
     aact = st.session_state._adlg_action
     atgt = st.session_state._adlg_target
     if aact == "new_assessment":
@@ -1648,7 +5440,7 @@ def render_topbar(display_name, role):
         topbar_css +
         f'''<div class="dex-topbar">
           <div class="dex-topbar-logo">
-            <img src="data:image/png;base64,{LOGO_FULL_B64}" style="height:28px;width:auto;object-fit:contain;">
+            <img src="{asset_url(LOGO_FULL)}" style="height:28px;width:auto;object-fit:contain;">
           </div>
           <div class="dex-topbar-user">
             <div class="dex-avatar">{avatar}</div>
@@ -1665,7 +5457,7 @@ def render_sidebar(active_tab, is_admin):
         # Company icon logo
         st.markdown(
             f"<div style='text-align:center;padding:12px 6px 4px;'>"
-            f"<img src='data:image/png;base64,{LOGO_ICON_B64}' "
+            f"<img src='{asset_url(LOGO_ICON)}' "
             f"style='width:48px;height:48px;object-fit:contain;'>"
             f"</div>"
             f"<div style='text-align:center;color:#7ec8e3;font-size:.6rem;font-weight:700;"
@@ -1714,23 +5506,32 @@ def _do_logout():
 # ─────────────────────────────────────────────
 # MAIN SHELL
 # ─────────────────────────────────────────────
-if not st.session_state.logged_in:
-    show_login()
-else:
-    ud       = st.session_state.users[st.session_state.current_user]
-    is_admin = st.session_state.current_role == "admin"
+try:
+    if not st.session_state.logged_in:
+        show_login()
+    else:
+        ud = user_directory().get(st.session_state.current_user)
+        if ud is None:  # account deleted since login
+            st.session_state.logged_in = False
+            st.rerun()
+        st.session_state.user_record  = ud
+        st.session_state.current_role = ud["role"]
+        is_admin = st.session_state.current_role == "admin"
 
-    render_topbar(ud["display_name"], st.session_state.current_role)
-    render_sidebar(st.session_state.active_tab, is_admin)
+        render_topbar(ud["display_name"], st.session_state.current_role)
+        render_sidebar(st.session_state.active_tab, is_admin)
 
-    if is_admin and st.session_state.active_tab == "admin":
-        show_admin_panel()
-    else:
-        show_assessment()
+        if is_admin and st.session_state.active_tab == "admin":
+            show_admin_panel()
+        else:
+            show_assessment()
 
-    st.markdown("---")
-    st.markdown(
-        f"<div style='text-align:center;color:#888;font-size:.8rem;padding:20px;'>"
-        f"© {datetime.now().year} Dexxora Pvt Ltd. All rights reserved.</div>",
-        unsafe_allow_html=True,
-    )
+        st.markdown("---")
+        st.markdown(
+            f"<div style='text-align:center;color:#888;font-size:.8rem;padding:20px;'>"
+            f"© {datetime.now().year} Dexxora Pvt Ltd. All rights reserved.</div>",
+            unsafe_allow_html=True,
+        )
+finally:
+    _profiler().end(f"{st.session_state.current_user} · {st.session_state.active_tab}"
+                    if st.session_state.get("logged_in") else "login")
@@ -0,0 +1,364 @@
+"""Benchmarks for the DATABASE LAYER helpers in Virtual360.py.
+
+Each scale is seeded from a deterministic generator (N tenants, M users,
+K assessments with L areas each) into a scratch SQLite DB, then every
+helper is timed over --repeat calls. Read helpers are timed cold (read
+cache cleared before each call) unless marked "(cached)". Results give
+p50/p95/mean in ms plus the Python heap peak of one extra traced call;
+the whole run is written as JSON so later runs can be compared:
+
+    python bench_db.py                              # small + medium
+    python bench_db.py --scales small,medium,large --out base.json
+    python bench_db.py --scale huge=100,500,20000,25 --compare base.json
+
+Every scale runs in its own subprocess with HOME pointed at a temporary
+directory, so the real ~/.virtual360 DB and any secrets are never touched
+and nothing is pushed anywhere. --sync delta (or snapshot) instead points
+the app at a local-directory store in the same scratch dir, to include
+the changelog triggers and outbox in write timings.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import pandas as pd
+
+# name -> (tenants, users, assessments, areas per assessment)
+SCALES = {
+    "small":  (5,   10,   100,   10),
+    "medium": (20,  50,   1000,  20),
+    "large":  (50,  200,  10000, 20),
+}
+
+CATEGORIES = ["Office", "Lobby", "Retail", "Storage", "Restroom", "Corridor",
+              "Conference", "Kitchen", "Parking", "Utility"]
+
+
+# ── Synthetic data ────────────────────────────────────────────────
+def generate(tenants: int, users: int, assessments: int, areas: int, seed: int = 360) -> dict:
+    """The same seed always yields the same tenants, users, assessments and areas."""
+    rng = random.Random(seed)
+    tenant_names = [f"Bench Tenant {i:04d}" for i in range(tenants)]
+    user_rows = {}
+    for i in range(users):
+        access = sorted(rng.sample(tenant_names, min(len(tenant_names), rng.randint(1, 3))))
+        user_rows[f"user{i:04d}@bench"] = {
+            "display_name":  f"Bench User {i:04d}",
+            "role":          "user",
+            "tenant_access": access,
+            "password_hash": "0" * 64,
+        }
+    usernames = sorted(user_rows)
+    assessment_rows = []
+    for i in range(assessments):
+        user = rng.choice(usernames)
+        assessment_rows.append({
+            "name":       f"Assessment {i:06d}",
+            "tenant":     rng.choice(user_rows[user]["tenant_access"]),
+            "created_by": user,
+            "areas":      [(f"Area {j:03d}", rng.choice(CATEGORIES),
+                            round(rng.uniform(20, 5000), 1)) for j in range(areas)],
+        })
+    return {"tenants": tenant_names, "users": user_rows, "assessments": assessment_rows}
+
+
+def seed_db(V, data: dict) -> list:
+    """Load *data* through the app's own helpers, in one unit of work; returns assessment ids."""
+    types = V.load_tenant_types_from_db() or ["Commercial"]
+    ids = []
+    with V.unit_of_work():
+        for i, name in enumerate(data["tenants"]):
+            V.add_tenant_to_db(name, types[i % len(types)])
+        V.save_users_to_secrets(data["users"])
+        for a in data["assessments"]:
+            aid = V.create_assessment(a["name"], a["tenant"], a["created_by"])
+            V.add_areas_to_assessment(aid, a["areas"])
+            ids.append(aid)
+    return ids
+
+
+# ── Timing ────────────────────────────────────────────────────────
+def percentile(samples: list, q: float) -> float:
+    """Nearest-rank percentile of *samples* (q in 0..1)."""
+    s = sorted(samples)
+    return s[max(0, math.ceil(q * len(s)) - 1)]
+
+
+def _ops(V, rng, tenants: list, users: list, ids: list) -> list:
+    """(name, args factory, callable, cold) in run order — mutating helpers last."""
+    def pdf_frame(aid):
+        return pd.DataFrame(V.load_areas.uncached(aid),
+                            columns=["area_name", "category", "sqft"])
+
+    def area_report(tenant):
+        with V.stream_area_report_pdf(tenants=[tenant]) as pdf:
+            return pdf.read()
+
+    def rename_args():
+        i = rng.randrange(len(tenants))
+        old = tenants[i]
+        tenants[i] = old[:-1] if old.endswith("~") else old + "~"
+        return old, tenants[i], "Commercial"
+
+    def one_of(seq):
+        return lambda: (rng.choice(seq),)
+
+    return [
+        ("load_assessments",               lambda: (),  V.load_assessments,              True),
+        ("load_assessments (cached)",      lambda: (),  V.load_assessments,              False),
+        ("load_assessments[user]",         one_of(users), V.load_assessments,            True),
+        ("load_assessments_page",          lambda: (),  V.load_assessments_page,         True),
+        ("assessment_list_totals",         lambda: (),  V.assessment_list_totals,        True),
+        ("get_assessment_summary",         one_of(ids), V.get_assessment_summary,        True),
+        ("load_areas",                     one_of(ids), V.load_areas,                    True),
+        ("load_assessment_from_db",        lambda: (),  V.load_assessment_from_db,       True),
+        ("load_assessment_from_db[user]",  one_of(users), V.load_assessment_from_db,     True),
+        ("query_area_records",             lambda: ([rng.choice(tenants)],),
+                                           V.query_area_records,                         True),
+        ("area_record_metrics",            lambda: ([rng.choice(tenants)],),
+                                           V.area_record_metrics,                        True),
+        ("load_tenant_rollups",            lambda: (),  V.load_tenant_rollups,           True),
+        ("generate_pdf",                   lambda: (pdf_frame(rng.choice(ids)),),
+                                           V.generate_pdf,                               True),
+        ("stream_area_report_pdf",         one_of(tenants), area_report,                 True),
+        ("rename_tenant_in_db",            rename_args, V.rename_tenant_in_db,           True),
+        ("delete_assessment",              lambda: (ids.pop(rng.randrange(len(ids))),),
+                                           V.delete_assessment,                          True),
+    ]
+
+
+def time_op(V, make_args, fn, cold: bool, repeat: int, warmup: int) -> dict:
+    """Time *repeat* calls (after *warmup*), then trace one more for the heap peak."""
+    samples = []
+    for i in range(warmup + repeat + 1):
+        args = make_args()
+        if cold:
+            V._read_cache().clear()
+        if i == warmup + repeat:
+            tracemalloc.start()
+            try:
+                fn(*args)
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+            break
+        t0 = time.perf_counter()
+        fn(*args)
+        if i >= warmup:
+            samples.append((time.perf_counter() - t0) * 1000)
+    return {
+        "n":        len(samples),
+        "p50_ms":   round(percentile(samples, 0.50), 4),
+        "p95_ms":   round(percentile(samples, 0.95), 4),
+        "mean_ms":  round(sum(samples) / len(samples), 4),
+        "min_ms":   round(min(samples), 4),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def run_scale(cfg: dict) -> dict:
+    """Worker body: seed a scratch DB at one scale and time every helper on it."""
+    import Virtual360 as V
+    V._startup().wait(60)
+    tenants, users, assessments, areas = cfg["params"]
+    data = generate(tenants, users, assessments, areas, cfg["seed"])
+    t0 = time.perf_counter()
+    ids = seed_db(V, data)
+    seed_s = time.perf_counter() - t0
+    with V.get_db() as conn:
+        rows = {t: conn.execute(f"SELECT COUNT(*) FROM {t}").fetchone()[0]
+                for t in ("tenants", "users", "user_tenants", "assessments", "assessment_areas")}
+
+    rng = random.Random(cfg["seed"] + 1)
+    tenant_names = list(data["tenants"])
+    ops = {}
+    for name, make_args, fn, cold in _ops(V, rng, tenant_names, sorted(data["users"]), ids):
+        if name == "delete_assessment" and len(ids) <= cfg["warmup"] + cfg["repeat"] + 1:
+            continue                    # not enough assessments left to delete
+        ops[name] = time_op(V, make_args, fn, cold, cfg["repeat"], cfg["warmup"])
+        if cfg["verbose"]:
+            print(f"  {name:32} p50 {ops[name]['p50_ms']:9.3f} ms", file=sys.stderr)
+    if V._storage() is not None:
+        V._sync_worker().flush(60)
+    try:
+        import resource
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # KiB on Linux
+    except ImportError:                 # Windows
+        max_rss = None
+    return {"params": dict(zip(("tenants", "users", "assessments", "areas"), cfg["params"])),
+            "rows": rows, "seed_s": round(seed_s, 3), "max_rss_kib": max_rss, "ops": ops}
+
+
+def spawn_scale(name: str, params: tuple, args) -> dict:
+    """Run one scale in a child process with HOME (and cwd) in a fresh temp dir."""
+    scratch = tempfile.mkdtemp(prefix=f"v360-bench-{name}-")
+    try:
+        if args.sync != "off":
+            os.makedirs(os.path.join(scratch, ".streamlit"))
+            with open(os.path.join(scratch, ".streamlit", "secrets.toml"), "w") as f:
+                f.write(f'STORAGE_BACKEND = "local"\n'
+                        f'STORAGE_DIR = {json.dumps(os.path.join(scratch, "store"))}\n'
+                        f'GH_SYNC_MODE = "{args.sync}"\n')
+        out = os.path.join(scratch, "result.json")
+        cfg = {"params": params, "seed": args.seed, "repeat": args.repeat,
+               "warmup": args.warmup, "verbose": args.verbose, "out": out}
+        env = dict(os.environ, HOME=scratch, USERPROFILE=scratch,
+                   STREAMLIT_LOGGER_LEVEL="error")
+        proc = subprocess.run([sys.executable, os.path.abspath(__file__), "--worker",
+                               json.dumps(cfg)],
+                              cwd=scratch, env=env, stdout=subprocess.PIPE,
+                              stderr=None if args.verbose else subprocess.PIPE, text=True)
+        if proc.returncode != 0:
+            raise RuntimeError(f"scale {name!r} failed:\n{proc.stderr or ''}")
+        with open(out) as f:
+            return json.load(f)
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+# ── Reporting ─────────────────────────────────────────────────────
+def _git_revision() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                              cwd=os.path.dirname(os.path.abspath(__file__)),
+                              capture_output=True, text=True, timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def print_scale(name: str, res: dict):
+    rows = res["rows"]
+    print(f"\n== {name}: {rows['tenants']} tenants, {rows['users']} users, "
+          f"{rows['assessments']} assessments, {rows['assessment_areas']} areas "
+          f"(seeded in {res['seed_s']:.1f}s)")
+    print(f"  {'helper':32} {'p50 ms':>10} {'p95 ms':>10} {'mean ms':>10} {'peak KiB':>10}")
+    for op, r in res["ops"].items():
+        print(f"  {op:32} {r['p50_ms']:10.3f} {r['p95_ms']:10.3f} {r['mean_ms']:10.3f} "
+              f"{r['peak_kib']:10.1f}")
+
+
+def compare(base: dict, current: dict, threshold: float, floor_ms: float) -> list:
+    """Ops whose p50 or p95 grew by more than *threshold* (and *floor_ms*) over *base*."""
+    regressions = []
+    for scale, res in current["scales"].items():
+        old = base.get("scales", {}).get(scale)
+        if old is None:
+            continue
+        print(f"\n== {scale} vs {base['meta'].get('commit') or 'baseline'}")
+        for op, r in res["ops"].items():
+            o = old["ops"].get(op)
+            if o is None:
+                continue
+            flags = []
+            for stat in ("p50_ms", "p95_ms"):
+                if (r[stat] > o[stat] * (1 + threshold)
+                        and r[stat] - o[stat] > floor_ms):
+                    flags.append(stat[:3])
+            ratio = r["p50_ms"] / o["p50_ms"] if o["p50_ms"] else float("inf")
+            mark = "  REGRESSION " + "/".join(flags) if flags else ""
+            print(f"  {op:32} {o['p50_ms']:10.3f} -> {r['p50_ms']:10.3f} ms  x{ratio:5.2f}{mark}")
+            if flags:
+                regressions.append((scale, op))
+    return regressions
+
+
+def _parse_scale(text: str) -> tuple:
+    name, _, spec = text.partition("=")
+    try:
+        params = tuple(int(v) for v in spec.split(","))
+    except ValueError:
+        params = ()
+    if len(params) != 4 or min(params) < 1:
+        raise argparse.ArgumentTypeError(
+            f"expected NAME=TENANTS,USERS,ASSESSMENTS,AREAS, got {text!r}")
+    return name, params
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    p.add_argument("--scales", default="small,medium",
+                   help=f"comma-separated presets: {', '.join(SCALES)} (default: small,medium)")
+    p.add_argument("--scale", action="append", type=_parse_scale, default=[],
+                   metavar="NAME=N,M,K,L", help="custom scale; may be repeated")
+    p.add_argument("--repeat", type=int, default=20, help="timed calls per helper (default 20)")
+    p.add_argument("--warmup", type=int, default=1, help="untimed calls first (default 1)")
+    p.add_argument("--seed", type=int, default=360, help="data generator seed (default 360)")
+    p.add_argument("--sync", choices=("off", "snapshot", "delta"), default="off",
+                   help="run with sync to a local-directory store (default off)")
+    p.add_argument("--out", help="JSON results file "
+                                 "(default bench_results/db-<timestamp>.json)")
+    p.add_argument("--compare", metavar="BASELINE.json",
+                   help="compare with an earlier run; exit 1 on regression")
+    p.add_argument("--threshold", type=float, default=0.25,
+                   help="relative slowdown counted as a regression (default 0.25)")
+    p.add_argument("--floor-ms", type=float, default=0.5,
+                   help="ignore slowdowns smaller than this many ms (default 0.5)")
+    p.add_argument("-v", "--verbose", action="store_true", help="progress and app log on stderr")
+    p.add_argument("--worker", help=argparse.SUPPRESS)
+    args = p.parse_args(argv)
+
+    if args.worker:
+        cfg = json.loads(args.worker)
+        res = run_scale(cfg)
+        with open(cfg["out"], "w") as f:
+            json.dump(res, f)
+        return 0
+    if args.repeat < 1:
+        p.error("--repeat must be at least 1")
+
+    scales = []
+    for name in filter(None, (s.strip() for s in args.scales.split(","))):
+        if name not in SCALES:
+            p.error(f"unknown scale {name!r} (choose from {', '.join(SCALES)})")
+        scales.append((name, SCALES[name]))
+    scales += args.scale
+
+    results = {
+        "meta": {
+            "created":  datetime.now().isoformat(timespec="seconds"),
+            "commit":   _git_revision(),
+            "python":   platform.python_version(),
+            "sqlite":   sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "seed":     args.seed,
+            "repeat":   args.repeat,
+            "warmup":   args.warmup,
+            "sync":     args.sync,
+        },
+        "scales": {},
+    }
+    for name, params in scales:
+        if args.verbose:
+            print(f"{name}: seeding {params}", file=sys.stderr)
+        results["scales"][name] = spawn_scale(name, params, args)
+        print_scale(name, results["scales"][name])
+
+    out = args.out or os.path.join("bench_results", f"db-{datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(out) or ".", exist_ok=True)
+    with open(out, "w") as f:
+        json.dump(results, f, indent=1)
+    print(f"\nResults written to {out}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(json.load(f), results, args.threshold, args.floor_ms)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): "
+                  + ", ".join(f"{s}/{o}" for s, o in regressions))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
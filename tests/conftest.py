@@ -0,0 +1,85 @@
+"""Fixtures that run Virtual360 replicas side by side.
+
+Virtual360 is a Streamlit script: importing it runs the app in bare mode,
+and DB_PATH and the cache_resource singletons are fixed per process. So
+every replica is a child process with its own HOME. All of them sync in
+delta mode through one store, a _LocalStorage directory unless a test
+module overrides ``store_secrets``. Pushes happen only when a test flushes
+the sync worker.
+"""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+_WORKER = os.path.join(os.path.dirname(__file__), "replica_worker.py")
+
+_SYNC_SECRETS = """\
+GH_SYNC_MODE = "delta"
+GH_SYNC_DEBOUNCE = 1000
+GH_SYNC_MAX_DELAY = 1000
+GH_PULL_MIN_INTERVAL = 0
+GH_DELTA_COMPACT_EVERY = 50
+"""
+
+
+class Replica:
+    """One app process; ``run`` executes code in it and returns its ``result``."""
+
+    def __init__(self, home: str, secrets: str):
+        os.makedirs(os.path.join(home, ".streamlit"))
+        with open(os.path.join(home, ".streamlit", "secrets.toml"), "w") as f:
+            f.write(secrets)
+        env = {**os.environ, "HOME": home}
+        self._proc = subprocess.Popen(
+            [sys.executable, _WORKER], cwd=home, env=env, text=True,
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        self.run("pass")  # wait for the app to start
+
+    def run(self, code: str):
+        self._proc.stdin.write(json.dumps(code) + "\n")
+        self._proc.stdin.flush()
+        line = self._proc.stdout.readline()
+        if not line:
+            raise RuntimeError("replica exited")
+        reply = json.loads(line)
+        if "error" in reply:
+            raise AssertionError("in replica:\n" + reply["error"])
+        return reply["result"]
+
+    def push(self):
+        assert self.run("result = V._sync_worker().flush(60)"), self.run(
+            "result = V._sync_worker().last_error")
+
+    def pull(self):
+        self.run("V.gh_pull_db(force=True); V.init_db()")
+        assert self.run("result = V.sync_status()['last_pull_error']") is None
+
+    def dump(self) -> dict:
+        return self.run("result = dump()")
+
+    def close(self):
+        self._proc.stdin.close()
+        self._proc.wait(30)
+
+
+@pytest.fixture
+def store_secrets(tmp_path) -> str:
+    """secrets.toml lines that configure the shared store."""
+    return f'STORAGE_BACKEND = "local"\nSTORAGE_DIR = "{tmp_path / "store"}"\n'
+
+
+@pytest.fixture
+def replicas(tmp_path, store_secrets):
+    """Factory for replicas sharing one store; all are stopped at teardown."""
+    secrets, started = _SYNC_SECRETS + store_secrets, []
+
+    def start(name: str) -> Replica:
+        started.append(Replica(str(tmp_path / name), secrets))
+        return started[-1]
+
+    yield start
+    for r in started:
+        r.close()
@@ -0,0 +1,33 @@
+"""Child process behind conftest.Replica: one JSON-encoded code string per
+line on stdin, one JSON reply per line on the original stdout."""
+import json
+import os
+import sys
+import traceback
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_reply = os.fdopen(os.dup(1), "w")
+os.dup2(2, 1)  # keep the app's own output off the reply channel
+
+import Virtual360 as V  # noqa: E402  (runs the app once in bare mode)
+
+V._startup().wait(30)
+
+
+def dump() -> dict:
+    """Every synced table, ordered by primary key."""
+    with V.get_db() as conn:
+        return {tbl: [list(r) for r in conn.execute(
+                    f"SELECT {','.join(cols)} FROM {tbl} ORDER BY {pk}")]
+                for tbl, (pk, cols) in V._SYNC_TABLES.items()}
+
+
+for line in sys.stdin:
+    scope = {"V": V, "dump": dump, "result": None}
+    try:
+        exec(json.loads(line), scope)
+        out = {"result": scope["result"]}
+    except Exception:
+        out = {"error": traceback.format_exc()}
+    _reply.write(json.dumps(out, default=str) + "\n")
+    _reply.flush()
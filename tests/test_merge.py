@@ -0,0 +1,130 @@
+"""Merging replicas in delta sync (see "Merging replicas" in Virtual360.py)."""
+
+
+def _seed(a, b):
+    """An assessment with two areas, pushed by *a* and pulled by *b*."""
+    aid = a.run("result = V.create_assessment('Seed', 'EDEN Tenant', 'a')")
+    a.run(f"V.add_areas_to_assessment({aid}, [('Lobby', 'Office', 10.0), ('Hall', 'Gym', 20.0)])")
+    a.push()
+    b.pull()
+    return aid
+
+
+def test_rebased_merge_of_a_remote_delete_keeps_rollups(replicas):
+    a, b = replicas("a"), replicas("b")
+    aid = _seed(a, b)
+    a.run(f"V.delete_assessment({aid})")
+    a.push()
+    a.run("V.gh_force_push()")  # compacts: b now merges against a new base
+    b.run("V.add_tenant_to_db('Local', 'Retail')")
+    b.push()
+
+    assert b.dump()["assessments"] == []
+    assert b.run("result = V.verify_rollups()") == []
+    assert b.run("result = V.load_tenant_rollups()") == []
+
+
+def test_overlapping_syncs_in_one_process(replicas):
+    a, b = replicas("a"), replicas("b")
+    _seed(a, b)
+    a.run("V.add_tenant_to_db('From A', 'Retail')")
+    a.push()
+    a.run("V.gh_force_push()")  # every merge on b below is a rebased one
+    b.run("V.add_tenant_to_db('From B', 'Retail')")
+    errors = b.run("""
+import threading
+result = []
+def sync(fn):
+    try:
+        fn()
+    except Exception as e:
+        result.append(repr(e))
+threads = [threading.Thread(target=sync, args=(fn,))
+           for fn in [V._gh_upload_db, lambda: V.gh_pull_db(force=True)] * 3]
+for t in threads:
+    t.start()
+for t in threads:
+    t.join()
+""")
+    assert errors == []
+    assert b.run("import glob; result = glob.glob(V.DB_PATH + '.*.remote')") == []
+    b.push()
+    a.pull()
+    assert a.dump() == b.dump()
+    assert {"From A", "From B"} <= {t[1] for t in a.dump()["tenants"]}
+
+
+def _converge(a, b) -> dict:
+    """Push *a* then *b*, pull both; returns the state they agree on."""
+    a.push()
+    b.push()
+    a.pull()
+    b.pull()
+    assert a.dump() == b.dump()
+    for r in (a, b):
+        assert r.run("result = V.verify_rollups()") == []
+    return a.dump()
+
+
+def _resolutions(r) -> list:
+    return r.run("result = V.sync_conflicts()[['tbl', 'resolution']].values.tolist()")
+
+
+def test_both_replicas_insert_the_same_id(replicas):
+    a, b = replicas("a"), replicas("b")
+    _seed(a, b)
+    ida = a.run("result = V.create_assessment('From A', 'EDEN Tenant', 'a')")
+    a.run(f"V.add_areas_to_assessment({ida}, [('a-room', 'Office', 1.0)])")
+    idb = b.run("result = V.create_assessment('From B', 'EDEN Tenant', 'b')")
+    b.run(f"V.add_areas_to_assessment({idb}, [('b-room', 'Office', 2.0)])")
+    assert ida == idb
+
+    state = _converge(a, b)
+    names = {r[0]: r[1] for r in state["assessments"]}
+    assert names[ida] == "From A"  # pushed first, keeps its id
+    renumbered = next(i for i, n in names.items() if n == "From B")
+    assert renumbered != ida
+    assert [r[1:3] for r in state["assessment_areas"] if r[2] == "b-room"] == [[renumbered, "b-room"]]
+    assert ["assessments", "renumbered local row to %d" % renumbered] in _resolutions(b)
+
+
+def test_update_on_both_replicas_keeps_the_later_one(replicas):
+    a, b = replicas("a"), replicas("b")
+    aid = _seed(a, b)
+    area = a.run(f"result = V.load_areas({aid})[0]['id']")
+    a.run(f"V.update_area({area}, 'Lobby', 'Office', 111.0)")
+    b.run(f"V.update_area({area}, 'Lobby', 'Office', 222.0)")  # later
+
+    state = _converge(a, b)
+    assert [r[4] for r in state["assessment_areas"] if r[0] == area] == [222.0]
+    assert ["assessment_areas", "kept local"] in _resolutions(b)
+
+
+def test_delete_on_one_replica_update_on_the_other(replicas):
+    a, b = replicas("a"), replicas("b")
+    aid = _seed(a, b)
+    area = b.run(f"result = V.load_areas({aid})[0]['id']")
+    a.run(f"V.delete_assessment({aid})")
+    b.run(f"V.update_area({area}, 'Lobby', 'Office', 99.0)")  # later than the delete
+
+    state = _converge(a, b)
+    assert state["assessments"] == []
+    assert state["assessment_areas"] == []  # the edited area went with its assessment
+    assert ["assessment_areas", "dropped orphan"] in _resolutions(b)
+
+
+def test_tenant_added_on_both_replicas(replicas):
+    a, b = replicas("a"), replicas("b")
+    _seed(a, b)
+    for r, name in ((a, "a"), (b, "b")):
+        r.run("V.add_tenant_to_db('Dup', 'Retail')")
+        r.run(f"V.create_assessment('In Dup', 'Dup', '{name}')")
+    b.run("u = V.load_users_from_db()['user@dexxora360']; "
+          "V.save_user_to_db('user@dexxora360', {**u, 'tenant_access': ['Dup']})")
+
+    state = _converge(a, b)
+    dup = [t[0] for t in state["tenants"] if t[1] == "Dup"]
+    assert len(dup) == 1
+    assert sorted(r[4] for r in state["assessments"] if r[2] == dup[0]) == ["a", "b"]
+    assert b.run("result = V.load_users_from_db()['user@dexxora360']['tenant_access']") == ["Dup"]
+    assert ["tenants", "merged duplicate tenant"] in _resolutions(b)
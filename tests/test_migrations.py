@@ -0,0 +1,81 @@
+"""Schema migrations run by init_db() on an existing database."""
+import json
+import os
+import sqlite3
+
+
+def _seed_baseline(home: str):
+    """A database as the app created it before schema versions (user_version 0)."""
+    os.makedirs(os.path.join(home, ".virtual360"))
+    conn = sqlite3.connect(os.path.join(home, ".virtual360", "virtual360_data.db"))
+    conn.executescript("""
+        CREATE TABLE users (
+            username TEXT PRIMARY KEY, display_name TEXT NOT NULL,
+            role TEXT NOT NULL, tenant_access TEXT NOT NULL,
+            password_hash TEXT NOT NULL);
+        CREATE TABLE tenants (
+            tenant_name TEXT PRIMARY KEY,
+            tenant_type TEXT NOT NULL DEFAULT 'Commercial');
+        CREATE TABLE tenant_types (type_name TEXT PRIMARY KEY);
+        CREATE TABLE assessments (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            assessment_name TEXT NOT NULL, tenant_name TEXT NOT NULL,
+            date_added TEXT NOT NULL, created_by TEXT NOT NULL DEFAULT '');
+        CREATE TABLE assessment_areas (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            assessment_id INTEGER NOT NULL REFERENCES assessments(id),
+            area_name TEXT NOT NULL, category TEXT NOT NULL, sqft REAL NOT NULL);
+        INSERT INTO tenant_types VALUES ('Commercial'), ('Residential');
+        INSERT INTO tenants VALUES ('Thaala Tenant', 'Commercial'), ('EDEN Tenant', 'Residential');
+        INSERT INTO assessments VALUES
+            (1, 'Eden Q1',   'EDEN Tenant',   '2024-01-10', 'alice'),
+            (2, 'Old site',  'Gone Ltd',      '2024-02-11', 'bob'),
+            (3, 'Thaala Q1', 'Thaala Tenant', '2024-03-12', 'bob'),
+            (9, 'Deleted',   'EDEN Tenant',   '2024-04-13', 'alice');
+        DELETE FROM assessments WHERE id=9;
+        INSERT INTO assessment_areas (assessment_id, area_name, category, sqft) VALUES
+            (1, 'Lobby', 'Office', 10.0), (1, 'Hall', 'Gym', 20.0),
+            (2, 'Yard', 'Office', 5.0), (3, 'Shop', 'Retail', 7.5);
+    """)
+    conn.executemany("INSERT INTO users VALUES (?,?,?,?,?)", [
+        ("alice", "Alice", "user", json.dumps(["EDEN Tenant", "Gone Ltd", "Nowhere"]), "x"),
+        ("bob", "Bob", "admin", json.dumps(["Thaala Tenant", "EDEN Tenant"]), "x"),
+        ("carol", "Carol", "user", "[]", "x"),
+    ])
+    conn.commit()
+    conn.close()
+
+
+def test_baseline_database_migrates_to_tenant_ids(tmp_path, replicas):
+    _seed_baseline(str(tmp_path / "old"))
+    app = replicas("old")  # startup migrates the database
+    app.run("V.init_db()")  # and a second run is a no-op
+
+    assert app.run("""
+with V.get_db() as conn:
+    result = conn.execute("PRAGMA user_version").fetchone()[0]
+""") == 8
+    access = app.run("""
+with V.get_db() as conn:
+    result = [list(r) for r in conn.execute(
+        "SELECT ut.username, t.tenant_name FROM user_tenants ut "
+        "JOIN tenants t ON t.id=ut.tenant_id ORDER BY ut.username, t.tenant_name")]
+""")
+    # Access to names that were never tenants is dropped; Gone Ltd is
+    # added back as a tenant by a later migration, after user_tenants
+    assert access == [["alice", "EDEN Tenant"],
+                      ["bob", "EDEN Tenant"], ["bob", "Thaala Tenant"]]
+    assessments = app.run("""
+with V.get_db() as conn:
+    result = [list(r) for r in conn.execute(
+        "SELECT a.id, t.tenant_name FROM assessments a "
+        "JOIN tenants t ON t.id=a.tenant_id ORDER BY a.id")]
+""")
+    assert assessments == [[1, "EDEN Tenant"], [2, "Gone Ltd"], [3, "Thaala Tenant"]]
+    assert app.run("""
+with V.get_db() as conn:
+    result = conn.execute(
+        "SELECT seq FROM sqlite_sequence WHERE name='assessments'").fetchone()[0]
+""") == 9
+    assert app.run("result = V.verify_rollups()") == []
+    assert app.run("result = V.load_tenant_rollups()") != []
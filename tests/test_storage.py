@@ -0,0 +1,192 @@
+"""The S3 storage backend against a stub server, and sync through it."""
+import hashlib
+import hmac
+import http.server
+import threading
+import urllib.parse
+
+import pytest
+
+BUCKET, REGION, ACCESS_KEY, SECRET_KEY = "v360", "eu-west-1", "AKTEST", "s3cr3t"
+
+
+class _StubS3(http.server.ThreadingHTTPServer):
+    """Objects in a dict, with ETags, conditional requests and SigV4 checks."""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _StubS3Handler)
+        self.objects  = {}  # key: (etag, body)
+        self.requests = []  # (method, key, headers, status)
+        self.lock     = threading.Lock()
+
+    @property
+    def endpoint(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+def _signature_ok(headers, method: str, uri: str, body: bytes) -> bool:
+    auth = headers.get("Authorization", "")
+    if not auth.startswith(f"AWS4-HMAC-SHA256 Credential={ACCESS_KEY}/"):
+        return False
+    fields = dict(f.strip().split("=", 1) for f in auth[len("AWS4-HMAC-SHA256 "):].split(","))
+    scope  = fields["Credential"].split("/", 1)[1]
+    if headers["x-amz-content-sha256"] != hashlib.sha256(body).hexdigest():
+        return False
+    signed    = fields["SignedHeaders"]
+    canonical = "\n".join([method, uri, "",
+                           "".join(f"{h}:{headers[h]}\n" for h in signed.split(";")),
+                           signed, headers["x-amz-content-sha256"]])
+    to_sign = "\n".join(["AWS4-HMAC-SHA256", headers["x-amz-date"], scope,
+                         hashlib.sha256(canonical.encode()).hexdigest()])
+    key = f"AWS4{SECRET_KEY}".encode()
+    for part in scope.split("/"):
+        key = hmac.new(key, part.encode(), hashlib.sha256).digest()
+    return hmac.compare_digest(
+        hmac.new(key, to_sign.encode(), hashlib.sha256).hexdigest(), fields["Signature"])
+
+
+class _StubS3Handler(http.server.BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def _handle(self, method: str):
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        key  = urllib.parse.unquote(self.path)
+        s3   = self.server
+        with s3.lock:
+            if not _signature_ok(self.headers, method, self.path, body):
+                status, etag, out = 403, None, b"SignatureDoesNotMatch"
+            else:
+                status, etag, out = self._respond(method, key, body, s3.objects.get(key))
+            s3.requests.append((method, key, dict(self.headers), status))
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(out)))
+        self.end_headers()
+        self.wfile.write(out)
+
+    def _respond(self, method, key, body, current):
+        objects = self.server.objects
+        if method == "GET":
+            if current is None:
+                return 404, None, b""
+            if self.headers.get("If-None-Match") == current[0]:
+                return 304, None, b""
+            return 200, current[0], current[1]
+        if method == "PUT":
+            if_match = self.headers.get("If-Match")
+            if if_match and current is None:
+                return 404, None, b""
+            if ((if_match and if_match != current[0])
+                    or (self.headers.get("If-None-Match") == "*" and current is not None)):
+                return 412, None, b""
+            etag = '"%s"' % hashlib.md5(body).hexdigest()
+            objects[key] = (etag, body)
+            return 200, etag, b""
+        objects.pop(key, None)
+        return 204, None, b""
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_PUT(self):
+        self._handle("PUT")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+
+@pytest.fixture
+def s3():
+    server = _StubS3()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def store_secrets(s3) -> str:
+    return (f'STORAGE_BACKEND = "s3"\nS3_ENDPOINT = "{s3.endpoint}"\nS3_BUCKET = "{BUCKET}"\n'
+            f'S3_REGION = "{REGION}"\nS3_ACCESS_KEY = "{ACCESS_KEY}"\n'
+            f'S3_SECRET_KEY = "{SECRET_KEY}"\n')
+
+
+def _outcome(replica, code: str) -> str:
+    """Run *code* in the replica; the exception class name it raised, or "ok"."""
+    return replica.run(f"""
+try:
+    {code}
+    result = "ok"
+except Exception as e:
+    result = type(e).__name__
+""")
+
+
+def test_storage_is_abstract(replicas):
+    app = replicas("app")
+    assert _outcome(app, "V._Storage('db')") == "TypeError"
+    assert _outcome(app, "type('Partial', (V._Storage,), {'target': lambda self: ''})('db')") \
+        == "TypeError"
+
+
+def test_requests_are_signed(replicas, s3):
+    app = replicas("app")
+    assert _outcome(app, "V._storage().put('probe', b'1', 'm')") == "ok"
+    assert s3.requests[-1][3] == 200
+    assert _outcome(app, f"V._S3Storage({s3.endpoint!r}, {BUCKET!r}, {REGION!r}, "
+                         f"{ACCESS_KEY!r}, 'wrong', 'db').put('probe', b'2', 'm')") == "RuntimeError"
+    assert s3.requests[-1][3] == 403
+    assert s3.objects[f"/{BUCKET}/probe"][1] == b"1"
+
+
+def test_fetch_with_current_etag_is_not_modified(replicas, s3):
+    app = replicas("app")
+    app.run("V._storage().put('f', b'data', 'm')")
+    etag = app.run("result = V._storage().fetch('f')[2]")
+    assert etag == s3.objects[f"/{BUCKET}/f"][0]
+    assert _outcome(app, f"V._storage().fetch('f', {etag!r})") == "_NotModified"
+    assert s3.requests[-1][2]["If-None-Match"] == etag
+    assert app.run("result = V._storage().fetch('missing')") == [None, None, None]
+
+
+def test_compare_and_swap_put(replicas, s3):
+    app = replicas("app")
+    assert _outcome(app, "V._storage().put('m', b'1', 'm', cas=True)") == "ok"
+    assert s3.requests[-1][2]["If-None-Match"] == "*"  # create only
+    first = s3.objects[f"/{BUCKET}/m"][0]
+    assert _outcome(app, "V._storage().put('m', b'2', 'm', cas=True)") == "ok"
+    assert s3.requests[-1][2]["If-Match"] == first
+
+    s3.objects[f"/{BUCKET}/m"] = ('"other"', b"written elsewhere")
+    assert _outcome(app, "V._storage().put('m', b'3', 'm', cas=True)") == "_SyncConflict"
+    assert s3.requests[-1][3] == 412
+    assert s3.objects[f"/{BUCKET}/m"][1] == b"written elsewhere"
+
+    s3.objects[f"/{BUCKET}/n"] = ('"other"', b"x")  # never read here: cas may only create
+    assert _outcome(app, "V._storage().put('n', b'1', 'm', cas=True)") == "_SyncConflict"
+
+
+def test_compare_and_swap_put_on_deleted_object(replicas, s3):
+    app = replicas("app")
+    app.run("V._storage().put('m', b'1', 'm', cas=True)")
+    del s3.objects[f"/{BUCKET}/m"]
+    assert _outcome(app, "V._storage().put('m', b'2', 'm', cas=True)") == "_SyncConflict"
+    assert s3.requests[-1][3] == 404
+    app.run("V._storage().delete('m', 'm')")  # already gone: not an error
+
+
+def test_replicas_sync_through_s3(replicas):
+    a, b = replicas("a"), replicas("b")
+    aid = a.run("result = V.create_assessment('Via S3', 'EDEN Tenant', 'a')")
+    a.run(f"V.add_areas_to_assessment({aid}, [('Lobby', 'Office', 12.5)])")
+    a.push()
+    b.pull()
+    assert b.dump() == a.dump()
+    b.run(f"V.add_areas_to_assessment({aid}, [('Hall', 'Office', 7.5)])")
+    b.push()
+    a.pull()
+    assert a.dump() == b.dump()
+    assert a.run(f"result = V.get_assessment_summary({aid})") == {"count": 2, "total_sqft": 20.0}